@@ -1,4 +1,4 @@
-// version 4.1 - updated 2025/10/19
+// version 4.2 - updated 2026/10/18
 
 #include "seracc.h"
 #include "seracc_bsp.h"
@@ -25,17 +25,39 @@ static inline uint32_t access32(const uint8_t* ptr)
 }
 
 static void receive_start();
-static void receive_stop();
+static size_t receive_head();
+static int dispatch(uint8_t* begin, uint8_t* end);
 static void reg_handler(uint8_t* data, size_t size);
-
-static uint8_t rx_buf[1040];
-static uint8_t* handle_ptr = rx_buf;
+static void multi_handler(uint8_t* data, size_t size);
+static void seq_handler(uint8_t* data, size_t size);
+static void ack_handler(uint8_t* data, size_t size);
+static void wait_handler(uint8_t* data, size_t size);
+static void mem_read_handler(uint8_t* data, size_t size);
+static void mem_write_handler(uint8_t* data, size_t size);
+static void sampler_handler(uint8_t* data, size_t size);
+
+#define RX_LEN 1040
+// circular DMA buffer, followed by room to unwrap a frame crossing its end
+static uint8_t rx_buf[RX_LEN * 2];
+static size_t rx_tail = 0;     // index of the first unprocessed byte
+static uint16_t rx_freed = 0;  // bytes processed since the last sync, reported to the host as credit
+static uint16_t rx_credit = 0; // rx_freed last reported
 static int rx_error = 0;
-static int tx_synced = 0;
+static uint8_t rx_seq = 0;     // sequence number expected in the next tagged frame
+static uint8_t rx_dropped = 0; // frames lost since the last status query
+static volatile int rx_busy = 0;     // the idle handler or the sampler is transmitting
+static volatile int rx_deferred = 0; // the idle interrupt came meanwhile, handled when rx_busy is cleared
 
 void seracc_init()
 {
     seracc_register_handler("_", reg_handler);
+    seracc_register_handler("_M", multi_handler);
+    seracc_register_handler("_S", seq_handler);
+    seracc_register_handler("_A", ack_handler);
+    seracc_register_handler("_W", wait_handler);
+    seracc_register_handler("_MR", mem_read_handler);
+    seracc_register_handler("_MW", mem_write_handler);
+    seracc_register_handler("_P", sampler_handler);
 
     seracc_init_bsp();
 
@@ -44,10 +66,6 @@ void seracc_init()
 
 void seracc_transmit(const uint8_t* data, size_t size)
 {
-    receive_stop();
-    receive_start();
-    tx_synced = 1;
-
     uint16_t tx_buf = size; // little-endian
     seracc_transmit_bsp((uint8_t*)&tx_buf, 2);
     uint16_t crc = seracc_crc_bsp(data, size);
@@ -56,14 +74,28 @@ void seracc_transmit(const uint8_t* data, size_t size)
     seracc_transmit_bsp((uint8_t*)&tx_buf, 2);
 }
 
+// drops all received bytes and resets the credit
 static void seracc_sync()
 {
-    receive_stop();
-    receive_start();
+    rx_tail = receive_head();
+    rx_freed = 0;
+    rx_credit = 0;
+    rx_error = 0;
     uint8_t tx_buf[2] = {'O', 'K'};
     seracc_transmit_bsp(tx_buf, 2);
 }
 
+// credit frame: 0x55 0xCC <bytes processed since the last sync> <CRC>
+static void seracc_credit()
+{
+    uint8_t tx_buf[6] = {0x55, 0xCC, rx_freed & 0xFF, rx_freed >> 8};
+    uint16_t crc = seracc_crc_bsp(tx_buf+2, 2);
+    tx_buf[4] = crc & 0xFF;
+    tx_buf[5] = crc >> 8;
+    seracc_transmit_bsp(tx_buf, 6);
+    rx_credit = rx_freed;
+}
+
 static int handler_count = 0;
 static char keys[16][8];
 static void (*handlers[16])(uint8_t*, size_t);
@@ -97,9 +129,9 @@ static SerAccHandlerType find_handler(const char* cmd)
 // return value:
 // sync                 - -1
 // transmission  error  - -2
-// format error         - -3
 // for incomplete error - -size
 // no error             -  size
+// a frame with format error is skipped
 static int seracc_manager(uint8_t* begin, uint8_t* end)
 {
     if (end - begin < 2)
@@ -124,8 +156,15 @@ static int seracc_manager(uint8_t* begin, uint8_t* end)
     if (calc != crc)
         return UART_TR_ERROR; // CRC error
 
-    begin += 2;
-    end = begin + size;
+    dispatch(begin+2, begin+2+size);
+
+    return size + 4;
+}
+
+// content of a frame: <key>:<content>
+// return value: 0, or UART_FMT_ERROR
+static int dispatch(uint8_t* begin, uint8_t* end)
+{
     uint8_t* p = begin;
     for (; p != end; ++p)
     {
@@ -149,24 +188,47 @@ static int seracc_manager(uint8_t* begin, uint8_t* end)
     ++p;
     handler(p, end-p);
 
-    if (tx_synced)
+    return 0;
+}
+
+static void idle_handler();
+
+// the sampler transmits from the main loop, so the idle interrupt may come in the middle of a frame
+// it is deferred until the frame is complete, and so is an interrupt nested in a deferred handler
+void seracc_idle_handler()
+{
+    if (rx_busy)
     {
-        tx_synced = 0;
-        return UART_SYNC;
+        receive_head(); // clears the interrupt
+        rx_deferred = 1;
+        return;
     }
 
-    return size + 4;
+    rx_busy = 1;
+    idle_handler();
+    while (rx_deferred)
+    {
+        rx_deferred = 0;
+        idle_handler();
+    }
+    rx_busy = 0;
 }
 
-void seracc_idle_handler()
+static void idle_handler()
 {
-    size_t dma_remain = seracc_dma_remain_bsp();
-    size_t size = sizeof(rx_buf) - dma_remain;
-    uint8_t* end = rx_buf + size;
+    size_t size = (receive_head() + RX_LEN - rx_tail) % RX_LEN;
+
+    // unwrap the bytes crossing the end of the buffer
+    if (rx_tail + size > RX_LEN)
+        memcpy(rx_buf + RX_LEN, rx_buf, rx_tail + size - RX_LEN);
+
+    uint8_t* begin = rx_buf + rx_tail;
+    uint8_t* end = begin + size;
+    uint8_t* handle_ptr = begin;
 
     if (rx_error)
     {
-        if (access32(end-4) == 0xAA55AA55)
+        if (size >= 4 && access32(end-4) == 0xAA55AA55)
             seracc_sync();
         return;
     }
@@ -181,16 +243,18 @@ void seracc_idle_handler()
         else if (res == UART_TR_ERROR)
         {
             rx_error = 1;
+            if (rx_dropped < 255)
+                ++rx_dropped;
             break;
         }
-        else if (res == UART_FMT_ERROR)
-        {
-            handle_ptr += res;
-        }
         else if (res < 0)
         {
-            if (end - rx_buf >= -size)
-                rx_error = 1;
+            if (-res >= RX_LEN)
+            {
+                rx_error = 1; // corrupted size, the frame never completes
+                if (rx_dropped < 255)
+                    ++rx_dropped;
+            }
             break;
         }
         else
@@ -198,18 +262,29 @@ void seracc_idle_handler()
             handle_ptr += res;
         }
     }
+
+    rx_tail = (rx_tail + (handle_ptr - begin)) % RX_LEN;
+    rx_freed += handle_ptr - begin;
+
+    // the host gives up the pending frame, e.g., its size is corrupted
+    if (handle_ptr < end && size >= 4 && access32(end-4) == 0xAA55AA55)
+        seracc_sync();
+    else if (rx_freed != rx_credit)
+        seracc_credit();
 }
 
+// the DMA must be in circular mode
 static void receive_start()
 {
-    handle_ptr = rx_buf;
+    rx_tail = 0;
     rx_error = 0;
-    seracc_dma_start_bsp(rx_buf, sizeof(rx_buf));
+    seracc_dma_start_bsp(rx_buf, RX_LEN);
 }
 
-static void receive_stop()
+// index of the next byte to be received
+static size_t receive_head()
 {
-    seracc_dma_stop_bsp();
+    return (RX_LEN - seracc_dma_remain_bsp()) % RX_LEN;
 }
 
 typedef struct
@@ -217,7 +292,9 @@ typedef struct
     uint32_t value;
 } __attribute__((packed)) uint32_unaligned;
 
-static void reg_handler(uint8_t* data, size_t size)
+// executes one register command, writes the read result (if any) to out
+// return value: number of bytes written to out
+static size_t reg_access(uint8_t* data, size_t size, uint8_t* out)
 {
     uint_fast8_t id = data[0] & 0b11;
     uint32_t addr = access32(data);
@@ -310,10 +387,312 @@ static void reg_handler(uint8_t* data, size_t size)
         break;
     }
     default:
-        return;
+        return 0;
     }
 
+    memcpy(out, &result, len); // little-endian
+    return len;
+}
+
+static void reg_handler(uint8_t* data, size_t size)
+{
+    uint32_t result;
+    size_t len = reg_access(data, size, (uint8_t*)&result);
+
     if (len > 0)
         seracc_transmit((uint8_t*)&result, len);
 }
 
+// read results of all sub-commands in a multi-op frame are concatenated
+// and returned in a single response frame
+static uint8_t multi_buf[256];
+
+// multi-op frame: a sequence of <size> <register command> pairs,
+// executed in order
+static void multi_handler(uint8_t* data, size_t size)
+{
+    uint8_t* end = data + size;
+    size_t len = 0;
+
+    while (data < end)
+    {
+        size_t n = *data++;
+        if (n > (size_t)(end - data))
+            break; // truncated sub-command, format error
+        if (len + 4 > sizeof(multi_buf))
+            break; // response too long
+        len += reg_access(data, n, multi_buf + len);
+        data += n;
+    }
+
+    if (len > 0)
+        seracc_transmit(multi_buf, len);
+}
+
+// tagged frame: <seq> <key>:<content>
+// executed only if seq is the expected one, so retransmitted frames are executed once
+static void seq_handler(uint8_t* data, size_t size)
+{
+    if (size < 1)
+        return;
+
+    if (data[0] != rx_seq) // duplicate or out-of-order
+    {
+        if (rx_dropped < 255)
+            ++rx_dropped;
+        return;
+    }
+
+    ++rx_seq;
+    dispatch(data+1, data+size);
+}
+
+// status query, response: <expected seq> <dropped frames>
+// all tagged frames before the expected seq have been executed
+// dropped frames > 0 means some frames were lost and should be retransmitted
+static void ack_handler(uint8_t* data, size_t size)
+{
+    uint8_t status[2] = {rx_seq, rx_dropped};
+    rx_dropped = 0;
+    seracc_transmit(status, 2);
+}
+
+// wait command: _W:<addr> <mask> <value> <timeout in us>, 4 bytes each
+// polls until (*addr & mask) == value or the timeout elapses
+// response: <0 if equal, 1 if timeout> <elapsed time in us, 4 bytes>
+static void wait_handler(uint8_t* data, size_t size)
+{
+    if (size != 16)
+        return;
+
+    volatile uint32_t* reg = (volatile uint32_t*)access32(data);
+    uint32_t mask = access32(data+4);
+    uint32_t value = access32(data+8);
+    uint32_t timeout = access32(data+12);
+
+    uint8_t status = 0;
+    uint32_t elapsed;
+    seracc_timer_start_bsp();
+    for (;;)
+    {
+        elapsed = seracc_timer_us_bsp();
+        if ((*reg & mask) == value)
+            break;
+        if (elapsed >= timeout)
+        {
+            status = 1;
+            break;
+        }
+    }
+
+    uint8_t tx_buf[5] = {status};
+    memcpy(tx_buf+1, &elapsed, 4); // little-endian
+    seracc_transmit(tx_buf, 5);
+}
+
+// memory read: _MR:<addr> <size, 2 bytes>
+// response: <size bytes from addr>, sent directly from the memory
+static void mem_read_handler(uint8_t* data, size_t size)
+{
+    if (size != 6)
+        return;
+
+    seracc_transmit((uint8_t*)access32(data), access16(data+4));
+}
+
+// memory write: _MW:<addr> <bytes>
+// the bytes are copied with memcpy, for memory rather than registers
+static void mem_write_handler(uint8_t* data, size_t size)
+{
+    if (size < 4)
+        return;
+
+    memcpy((void*)access32(data), data+4, size-4);
+}
+
+// periodic sampling: the timer interrupt of the BSP calls seracc_sampler_tick every period,
+// which reads the addresses into a ring buffer of samples
+// seracc_sampler_poll, called in the main loop, sends them in frames of 0x55 0xDD <frame>,
+// each <frame> containing <index of the first sample, 4 bytes> <samples>
+// the samples are not dropped: if the ring buffer overflows, sampling stops
+// when sampling stops, 0x55 0xEE <frame> is sent with <samples taken, 4 bytes> <0 or 1 if overflow>
+// compiled only if SERACC_SAMPLER is defined for the whole project, e.g., -DSERACC_SAMPLER,
+// as the buffers take SERACC_SAMPLE_LEN (4 KB) + 0.3 KB of RAM
+#ifdef SERACC_SAMPLER
+#ifndef SERACC_SAMPLE_LEN
+#define SERACC_SAMPLE_LEN 4096
+#endif
+#if SERACC_SAMPLE_LEN < 64
+#error "SERACC_SAMPLE_LEN must hold a sample of 16 32-bit registers"
+#endif
+#define SAMPLE_ADDRS 16
+#define SAMPLE_LEN SERACC_SAMPLE_LEN
+#define SAMPLE_FRAME 252
+static uint32_t sample_addr[SAMPLE_ADDRS]; // as in register reads, addr|1 for 8 bits, addr|2 for 16 bits
+static size_t sample_addrs = 0;
+static size_t sample_size = 0;             // bytes per sample, 0 if the sampler is idle
+static uint32_t sample_capacity;           // samples in the ring buffer
+static uint32_t sample_period;             // us
+static uint32_t sample_limit;              // samples to take, 0 if continuous
+static volatile uint32_t sample_index;     // samples taken
+static uint32_t sample_sent;               // samples sent
+static volatile int sample_running = 0;
+static volatile int sample_overflow = 0;
+static uint8_t sample_buf[SAMPLE_LEN];
+static uint8_t sample_frame[4 + SAMPLE_FRAME];
+
+static void sampler_stop()
+{
+    sample_running = 0;
+    seracc_sampler_stop_bsp();
+}
+
+void seracc_sampler_tick()
+{
+    if (!sample_running)
+        return;
+
+    if (sample_index - sample_sent >= sample_capacity)
+    {
+        sample_overflow = 1;
+        sampler_stop();
+        return;
+    }
+
+    uint8_t* p = sample_buf + (sample_index % sample_capacity) * sample_size;
+    for (size_t i = 0; i != sample_addrs; ++i)
+    {
+        uint32_t addr = sample_addr[i] & ~0b11u;
+        switch (sample_addr[i] & 0b11)
+        {
+        case 1:
+            *p++ = *(volatile uint8_t*)addr;
+            break;
+        case 2:
+        {
+            uint16_t value = *(volatile uint16_t*)addr;
+            memcpy(p, &value, 2); // little-endian
+            p += 2;
+            break;
+        }
+        default:
+        {
+            uint32_t value = *(volatile uint32_t*)addr;
+            memcpy(p, &value, 4); // little-endian
+            p += 4;
+            break;
+        }
+        }
+    }
+
+    ++sample_index;
+    if (sample_limit != 0 && sample_index == sample_limit)
+        sampler_stop();
+}
+
+static void sampler_transmit(uint8_t marker, size_t size)
+{
+    uint8_t tx_buf[2] = {0x55, marker};
+    rx_busy = 1;
+    seracc_transmit_bsp(tx_buf, 2);
+    seracc_transmit(sample_frame, size);
+    rx_busy = 0;
+
+    if (rx_deferred)
+        seracc_idle_handler();
+}
+
+void seracc_sampler_poll()
+{
+    if (sample_size == 0)
+        return;
+
+    int running = sample_running;
+    uint32_t count = sample_index - sample_sent;
+    uint32_t per_frame = SAMPLE_FRAME / sample_size;
+
+    // full frames, and at least every 10 ms
+    while (count >= per_frame || (count > 0 && (!running || count * sample_period >= 10000)))
+    {
+        uint32_t n = count < per_frame ? count : per_frame;
+        memcpy(sample_frame, &sample_sent, 4); // little-endian
+        for (uint32_t i = 0; i != n; ++i)
+            memcpy(sample_frame + 4 + i * sample_size,
+                   sample_buf + ((sample_sent + i) % sample_capacity) * sample_size, sample_size);
+        sampler_transmit(0xDD, 4 + n * sample_size);
+        sample_sent += n;
+        count -= n;
+    }
+
+    if (!running)
+    {
+        memcpy(sample_frame, &sample_sent, 4); // little-endian
+        sample_frame[4] = sample_overflow;
+        sample_size = 0;
+        sampler_transmit(0xEE, 5);
+    }
+}
+
+// sampler command: _P:<period in us> <number of samples, 0 if continuous> <addr> <addr> ...
+// response: <0 if started, 1 if invalid, 2 if not supported by the BSP>
+// stop command: _P: with no content, no response
+static void sampler_handler(uint8_t* data, size_t size)
+{
+    if (size == 0)
+    {
+        if (sample_running)
+            sampler_stop();
+        return;
+    }
+
+    uint8_t status = 1;
+    size_t addrs = (size - 8) / 4;
+    if (size >= 12 && size % 4 == 0 && addrs <= SAMPLE_ADDRS && sample_size == 0)
+    {
+        sample_addrs = addrs;
+        size_t bytes = 0;
+        for (size_t i = 0; i != addrs; ++i)
+        {
+            sample_addr[i] = access32(data + 8 + i * 4);
+            bytes += (sample_addr[i] & 0b11) == 0 ? 4 : sample_addr[i] & 0b11;
+        }
+        sample_period = access32(data);
+        sample_limit = access32(data + 4);
+        sample_capacity = SAMPLE_LEN / bytes;
+        sample_index = 0;
+        sample_sent = 0;
+        sample_overflow = 0;
+        if (sample_period > 0)
+        {
+            sample_size = bytes;
+            sample_running = 1;
+            status = 0;
+            if (!seracc_sampler_start_bsp(sample_period))
+            {
+                sample_running = 0;
+                sample_size = 0;
+                status = 2;
+            }
+        }
+    }
+
+    seracc_transmit(&status, 1);
+}
+#else
+void seracc_sampler_tick()
+{
+}
+
+void seracc_sampler_poll()
+{
+}
+
+static void sampler_handler(uint8_t* data, size_t size)
+{
+    if (size == 0)
+        return;
+
+    uint8_t status = 2; // not supported
+    seracc_transmit(&status, 1);
+}
+#endif
@@ -1,4 +1,4 @@
-// version 4.1 - updated 2025/10/19
+// version 4.2 - updated 2026/10/18
 
 #ifndef INC_SERACC_H_
 #define INC_SERACC_H_
@@ -20,6 +20,10 @@ void seracc_register_handler(const char*, SerAccHandlerType);
 
 void seracc_idle_handler();
 
+// periodic sampling, see seracc_sampler_start_bsp
+void seracc_sampler_tick(); // call in the timer interrupt
+void seracc_sampler_poll(); // call in the main loop
+
 #ifdef __cplusplus
 }
 #endif
@@ -1,4 +1,4 @@
-// version 4.1 - updated 2025/10/19
+// version 4.2 - updated 2026/10/18
 
 #ifdef __cplusplus
 extern "C" {
@@ -17,6 +17,15 @@ size_t seracc_dma_remain_bsp();
 void seracc_dma_start_bsp(uint8_t* buf, size_t size);
 void seracc_dma_stop_bsp();
 
+// time measurement for the wait command
+void seracc_timer_start_bsp();
+uint32_t seracc_timer_us_bsp(); // microseconds since seracc_timer_start_bsp
+
+// periodic timer of the sampler, whose interrupt calls seracc_sampler_tick
+// return value: 0 if not supported
+int seracc_sampler_start_bsp(uint32_t period_us);
+void seracc_sampler_stop_bsp();
+
 #ifdef __cplusplus
 }
 #endif
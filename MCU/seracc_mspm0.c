@@ -1,4 +1,4 @@
-// version 4.0 - updated 2025/6/19
+// version 4.2 - updated 2026/10/18
 
 #include "ti_msp_dl_config.h"
 
@@ -59,6 +59,65 @@ void seracc_dma_stop_bsp()
     DL_DMA_disableChannel(DMA, DMA_UART_RX_CHAN_ID);
 }
 
+// no cycle counter on Cortex-M0+, and SysTick may be used by the application
+// each call delays 1 us, thus the time is slightly underestimated by the polling itself
+static uint32_t timer_us;
+
+void seracc_timer_start_bsp()
+{
+    timer_us = 0;
+}
+
+uint32_t seracc_timer_us_bsp()
+{
+    delay_cycles(CPUCLK_FREQ / 1000000);
+    return timer_us++;
+}
+
+#ifdef TIMER_SERACC_INST
+#ifndef SERACC_SAMPLER
+#error "You should also #define SERACC_SAMPLER for the whole project, e.g., in the preprocessor settings, so that seracc.c compiles the sampler"
+#endif
+// a periodic timer named TIMER_SERACC, counting at 1 MHz with the zero event interrupt
+int seracc_sampler_start_bsp(uint32_t period_us)
+{
+    DL_Timer_setLoadValue(TIMER_SERACC_INST, period_us - 1);
+    DL_Timer_enableInterrupt(TIMER_SERACC_INST, DL_TIMER_INTERRUPT_ZERO_EVENT);
+    NVIC_EnableIRQ(TIMER_SERACC_INST_INT_IRQN);
+    DL_Timer_startCounter(TIMER_SERACC_INST);
+    return 1;
+}
+
+void seracc_sampler_stop_bsp()
+{
+    DL_Timer_stopCounter(TIMER_SERACC_INST);
+}
+
+void TIMER_SERACC_INST_IRQHandler(void)
+{
+    switch (DL_Timer_getPendingInterrupt(TIMER_SERACC_INST))
+    {
+        case DL_TIMER_IIDX_ZERO:
+            seracc_sampler_tick();
+            break;
+
+        default:
+            break;
+    }
+}
+#else
+// add a timer named TIMER_SERACC to enable the sampler
+int seracc_sampler_start_bsp(uint32_t period_us)
+{
+    return 0;
+}
+
+void seracc_sampler_stop_bsp()
+{
+    ;
+}
+#endif
+
 void UART_SERACC_INST_IRQHandler(void)
 {
     switch (DL_UART_Main_getPendingInterrupt(UART_SERACC_INST))
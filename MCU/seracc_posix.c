@@ -0,0 +1,239 @@
+// version 4.2 - updated 2026/10/18
+
+// POSIX simulator: runs seracc.c in a Linux process, talking over a pseudo-terminal
+// build: gcc -O2 -DSERACC_SAMPLER -o seracc_sim seracc_posix.c seracc.c
+//        without -DSERACC_SAMPLER, the sampler is not supported
+// run:   ./seracc_sim [link]
+//        prints the pty name, e.g. /dev/pts/3, and optionally creates a symbolic link to it
+//        then call serial_init("/dev/pts/3") on the PC
+// the MCU address space is simulated by anonymous memory at the same addresses (zero-filled):
+//        0x08000000 -   1 MB flash
+//        0x20000000 -   1 MB SRAM
+//        0x40000000 - 512 MB peripherals
+//        0x60000000 - 512 MB external memory (FMC, Octo-SPI)
+//        0xE0000000 -   1 MB system
+// environment variable SERACC_BER: bit error rate injected in both directions, e.g. 1e-5
+// the sampler timer is a timerfd, so the ticks are only as regular as the scheduler
+
+#define _GNU_SOURCE
+
+#include "seracc.h"
+#include "seracc_bsp.h"
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <fcntl.h>
+#include <unistd.h>
+#include <termios.h>
+#include <poll.h>
+#include <time.h>
+#include <sys/mman.h>
+#include <sys/timerfd.h>
+
+static int pty_fd = -1;
+static int timer_fd = -1;
+static double ber = 0;
+
+static uint8_t* dma_buf = NULL;
+static size_t dma_size = 0;
+static size_t dma_pos = 0;
+
+static void inject_noise(uint8_t* data, size_t size)
+{
+    if (ber <= 0)
+        return;
+    for (size_t i = 0; i != size * 8; ++i)
+        if (drand48() < ber)
+            data[i/8] ^= 1 << (i%8);
+}
+
+void seracc_init_bsp()
+{
+    ;
+}
+
+void seracc_transmit_bsp(const uint8_t* data, size_t size)
+{
+    uint8_t buf[2048];
+    while (size > 0)
+    {
+        size_t n = size < sizeof(buf) ? size : sizeof(buf);
+        memcpy(buf, data, n);
+        inject_noise(buf, n);
+        for (size_t done = 0; done != n; )
+        {
+            ssize_t res = write(pty_fd, buf + done, n - done);
+            if (res <= 0)
+                return;
+            done += res;
+        }
+        data += n;
+        size -= n;
+    }
+}
+
+// CRC-16/XMODEM, the same as the CRC peripheral configured in README
+uint16_t seracc_crc_bsp(const uint8_t* data, size_t size)
+{
+    uint16_t crc = 0;
+    for (size_t i = 0; i != size; ++i)
+    {
+        crc ^= data[i] << 8;
+        for (int j = 0; j != 8; ++j)
+            crc = crc & 0x8000 ? (crc << 1) ^ 0x1021 : crc << 1;
+    }
+    return crc;
+}
+
+size_t seracc_dma_remain_bsp()
+{
+    return dma_size - dma_pos;
+}
+
+void seracc_dma_start_bsp(uint8_t* buf, size_t size)
+{
+    dma_buf = buf;
+    dma_size = size;
+    dma_pos = 0;
+}
+
+void seracc_dma_stop_bsp()
+{
+    dma_buf = NULL;
+}
+
+static struct timespec timer_start;
+
+void seracc_timer_start_bsp()
+{
+    clock_gettime(CLOCK_MONOTONIC, &timer_start);
+}
+
+uint32_t seracc_timer_us_bsp()
+{
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (now.tv_sec - timer_start.tv_sec) * 1000000 + (now.tv_nsec - timer_start.tv_nsec) / 1000;
+}
+
+int seracc_sampler_start_bsp(uint32_t period_us)
+{
+    struct itimerspec spec;
+    spec.it_interval.tv_sec = period_us / 1000000;
+    spec.it_interval.tv_nsec = period_us % 1000000 * 1000;
+    spec.it_value = spec.it_interval;
+    return timerfd_settime(timer_fd, 0, &spec, NULL) == 0;
+}
+
+void seracc_sampler_stop_bsp()
+{
+    struct itimerspec spec;
+    memset(&spec, 0, sizeof(spec));
+    timerfd_settime(timer_fd, 0, &spec, NULL);
+}
+
+// circular DMA, then the idle interrupt
+static void receive()
+{
+    if (dma_buf == NULL)
+    {
+        uint8_t discard[256];
+        read(pty_fd, discard, sizeof(discard));
+        return;
+    }
+
+    ssize_t n = read(pty_fd, dma_buf + dma_pos, dma_size - dma_pos);
+    if (n <= 0)
+        return;
+    inject_noise(dma_buf + dma_pos, n);
+    dma_pos = (dma_pos + n) % dma_size;
+    seracc_idle_handler();
+}
+
+static int map_memory(uintptr_t addr, size_t size)
+{
+    void* res = mmap((void*)addr, size, PROT_READ | PROT_WRITE,
+                     MAP_PRIVATE | MAP_ANONYMOUS | MAP_FIXED_NOREPLACE | MAP_NORESERVE, -1, 0);
+    if (res == MAP_FAILED || res != (void*)addr)
+    {
+        fprintf(stderr, "Cannot map 0x%08lX\n", (unsigned long)addr);
+        return -1;
+    }
+    return 0;
+}
+
+static int open_pty()
+{
+    pty_fd = posix_openpt(O_RDWR | O_NOCTTY);
+    if (pty_fd < 0 || grantpt(pty_fd) < 0 || unlockpt(pty_fd) < 0)
+        return -1;
+
+    // raw mode, kept open so that the pty survives the PC reconnecting
+    int fd = open(ptsname(pty_fd), O_RDWR | O_NOCTTY);
+    if (fd < 0)
+        return -1;
+    struct termios tio;
+    tcgetattr(fd, &tio);
+    cfmakeraw(&tio);
+    tcsetattr(fd, TCSANOW, &tio);
+    return 0;
+}
+
+int main(int argc, char* argv[])
+{
+    if (map_memory(0x08000000, 0x100000) < 0 ||
+        map_memory(0x20000000, 0x100000) < 0 ||
+        map_memory(0x40000000, 0x20000000) < 0 ||
+        map_memory(0x60000000, 0x20000000) < 0 ||
+        map_memory(0xE0000000, 0x100000) < 0)
+        return 1;
+
+    if (getenv("SERACC_BER"))
+        ber = atof(getenv("SERACC_BER"));
+    srand48(getpid());
+
+    if (open_pty() < 0)
+    {
+        perror("pty");
+        return 1;
+    }
+
+    const char* name = ptsname(pty_fd);
+    if (argc > 1)
+    {
+        unlink(argv[1]);
+        if (symlink(name, argv[1]) < 0)
+            perror("symlink");
+    }
+    printf("%s\n", name);
+    fflush(stdout);
+
+    timer_fd = timerfd_create(CLOCK_MONOTONIC, 0);
+    if (timer_fd < 0)
+    {
+        perror("timerfd");
+        return 1;
+    }
+
+    seracc_init();
+
+    for (;;)
+    {
+        struct pollfd pfd[2] = {{pty_fd, POLLIN, 0}, {timer_fd, POLLIN, 0}};
+        if (poll(pfd, 2, -1) < 0)
+            continue;
+
+        // timer interrupt, once per period elapsed
+        uint64_t ticks;
+        if ((pfd[1].revents & POLLIN) && read(timer_fd, &ticks, sizeof(ticks)) == sizeof(ticks))
+            while (ticks-- > 0)
+                seracc_sampler_tick();
+
+        if (pfd[0].revents & POLLIN)
+            receive();
+
+        // main loop
+        seracc_sampler_poll();
+    }
+}
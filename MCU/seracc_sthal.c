@@ -1,4 +1,4 @@
-// version 4.1 - updated 2025/10/19
+// version 4.2 - updated 2026/10/18
 
 #include "main.h"
 
@@ -49,3 +49,92 @@ void seracc_dma_stop_bsp()
     HAL_UART_DMAStop(&SERACC_HUART);
 }
 
+#if defined(DWT) && (__CORTEX_M >= 3)
+// cycle counter, wraps after 2^32 cycles (25 s at 170 MHz),
+// thus the time is accumulated from call to call, so that timeouts up to 2^32 us expire
+// the counter must be polled more often than it wraps
+static uint32_t timer_last;   // DWT->CYCCNT at the last call
+static uint32_t timer_cycles; // cycles not yet counted in timer_us
+static uint32_t timer_us;
+
+void seracc_timer_start_bsp()
+{
+    CoreDebug->DEMCR |= CoreDebug_DEMCR_TRCENA_Msk;
+    DWT->CTRL |= DWT_CTRL_CYCCNTENA_Msk;
+    timer_last = DWT->CYCCNT;
+    timer_cycles = 0;
+    timer_us = 0;
+}
+
+uint32_t seracc_timer_us_bsp()
+{
+    uint32_t now = DWT->CYCCNT;
+    uint32_t cycles_per_us = SystemCoreClock / 1000000;
+    timer_cycles += now - timer_last;
+    timer_last = now;
+    timer_us += timer_cycles / cycles_per_us;
+    timer_cycles %= cycles_per_us;
+    return timer_us;
+}
+#else
+// no cycle counter on Cortex-M0/M0+, the SysTick counter instead of the HAL tick:
+// the wait runs in the UART interrupt, where the HAL tick does not advance
+// unless SysTick has a higher priority, while the counter reloads whatever the priorities are
+// the counter must be polled more often than it reloads, every 1 ms with HAL_Init
+static uint32_t timer_last;   // SysTick->VAL at the last call
+static uint32_t timer_cycles; // cycles not yet counted in timer_us
+static uint32_t timer_us;
+
+void seracc_timer_start_bsp()
+{
+    timer_last = SysTick->VAL;
+    timer_cycles = 0;
+    timer_us = 0;
+}
+
+uint32_t seracc_timer_us_bsp()
+{
+    uint32_t now = SysTick->VAL;
+    uint32_t reload = SysTick->LOAD + 1;
+    uint32_t cycles_per_us = SystemCoreClock / 1000000;
+    timer_cycles += (timer_last + reload - now) % reload; // counts down
+    timer_last = now;
+    timer_us += timer_cycles / cycles_per_us;
+    timer_cycles %= cycles_per_us;
+    return timer_us;
+}
+#endif
+
+
+#ifdef SERACC_HTIM
+#ifndef SERACC_SAMPLER
+#error "You should also #define SERACC_SAMPLER for the whole project, e.g., in the preprocessor settings, so that seracc.c compiles the sampler"
+#endif
+// a timer counting at 1 MHz, e.g., prescaler = SystemCoreClock / 1000000 - 1
+// in its IRQ in stm32xxxx_it.c, call seracc_sampler_tick() before the HAL handler
+extern TIM_HandleTypeDef SERACC_HTIM;
+
+int seracc_sampler_start_bsp(uint32_t period_us)
+{
+    __HAL_TIM_SET_AUTORELOAD(&SERACC_HTIM, period_us - 1);
+    __HAL_TIM_SET_COUNTER(&SERACC_HTIM, 0);
+    HAL_TIM_Base_Start_IT(&SERACC_HTIM);
+    return 1;
+}
+
+void seracc_sampler_stop_bsp()
+{
+    HAL_TIM_Base_Stop_IT(&SERACC_HTIM);
+}
+#else
+// #define SERACC_HTIM htimX in main.h to enable the sampler
+int seracc_sampler_start_bsp(uint32_t period_us)
+{
+    return 0;
+}
+
+void seracc_sampler_stop_bsp()
+{
+    ;
+}
+#endif
@@ -1,8677 +1,9503 @@
-from seracc import BitField, RegisterBase, PeripheralBase, Subscriptor
-from seracc import logging, wait_until_equal
-
-class SA_CRC_DR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFFFFFF, "DR", "Data register")
-        self.DR = BitField(self, 0xFFFFFFFF, "DR", "Data register bits")
-
-class SA_CRC_IDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IDR", "Independent data register")
-        self.IDR = BitField(self, 0xFFFFFFFF, "IDR", "General-purpose 8-bit data register bits")
-
-class SA_CRC_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR", "Control register")
-        self.REV_OUT = BitField(self, 0x00000080, "REV_OUT", "Reverse output data")
-        self.REV_IN = BitField(self, 0x00000060, "REV_IN", "Reverse input data")
-        self.POLYSIZE = BitField(self, 0x00000018, "POLYSIZE", "Polynomial size")
-        self.RESET = BitField(self, 0x00000001, "RESET", "RESET bit")
-
-class SA_CRC_INIT(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFFFFFF, "INIT", "Initial CRC value")
-        self.CRC_INIT = BitField(self, 0xFFFFFFFF, "CRC_INIT", "Programmable initial CRC value")
-
-class SA_CRC_POL(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x4C11DB7, "POL", "polynomial")
-        self.POL = BitField(self, 0xFFFFFFFF, "POL", "Programmable polynomial")
-
-class SA_CRC(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Cyclic redundancy check calculation unit")
-        self.DR = SA_CRC_DR(self, 0x0)
-        self.IDR = SA_CRC_IDR(self, 0x4)
-        self.CR = SA_CRC_CR(self, 0x8)
-        self.INIT = SA_CRC_INIT(self, 0x10)
-        self.POL = SA_CRC_POL(self, 0x14)
-
-CRC = SA_CRC(0x40023000, "CRC")
-
-class SA_IWDG_KR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "KR", "Key register")
-        self.KEY = BitField(self, 0x0000FFFF, "KEY", "Key value (write only, read 0x0000)")
-
-class SA_IWDG_PR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PR", "Prescaler register")
-        self.PR = BitField(self, 0x00000007, "PR", "Prescaler divider")
-
-class SA_IWDG_RLR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFF, "RLR", "Reload register")
-        self.RL = BitField(self, 0x00000FFF, "RL", "Watchdog counter reload value")
-
-class SA_IWDG_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "Status register")
-        self.WVU = BitField(self, 0x00000004, "WVU", "Watchdog counter window value update")
-        self.RVU = BitField(self, 0x00000002, "RVU", "Watchdog counter reload value update")
-        self.PVU = BitField(self, 0x00000001, "PVU", "Watchdog prescaler value update")
-
-class SA_IWDG_WINR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFF, "WINR", "Window register")
-        self.WIN = BitField(self, 0x00000FFF, "WIN", "Watchdog counter window value")
-
-class SA_IWDG(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "WinWATCHDOG")
-        self.KR = SA_IWDG_KR(self, 0x0)
-        self.PR = SA_IWDG_PR(self, 0x4)
-        self.RLR = SA_IWDG_RLR(self, 0x8)
-        self.SR = SA_IWDG_SR(self, 0xC)
-        self.WINR = SA_IWDG_WINR(self, 0x10)
-
-IWDG = SA_IWDG(0x40003000, "IWDG")
-
-class SA_WWDG_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x7F, "CR", "Control register")
-        self.WDGA = BitField(self, 0x00000080, "WDGA", "Activation bit")
-        self.T = BitField(self, 0x0000007F, "T", "7-bit counter (MSB to LSB)")
-
-class SA_WWDG_CFR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x7F, "CFR", "Configuration register")
-        self.WDGTB = BitField(self, 0x00003800, "WDGTB", "Timer base")
-        self.EWI = BitField(self, 0x00000200, "EWI", "Early wakeup interrupt")
-        self.W = BitField(self, 0x0000007F, "W", "7-bit window value")
-
-class SA_WWDG_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "Status register")
-        self.EWIF = BitField(self, 0x00000001, "EWIF", "Early wakeup interrupt flag")
-
-class SA_WWDG(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "System window watchdog")
-        self.CR = SA_WWDG_CR(self, 0x0)
-        self.CFR = SA_WWDG_CFR(self, 0x4)
-        self.SR = SA_WWDG_SR(self, 0x8)
-
-WWDG = SA_WWDG(0x40002C00, "WWDG")
-
-class SA_I2C1_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR1", "Control register 1")
-        self.PE = BitField(self, 0x00000001, "PE", "Peripheral enable")
-        self.TXIE = BitField(self, 0x00000002, "TXIE", "TX Interrupt enable")
-        self.RXIE = BitField(self, 0x00000004, "RXIE", "RX Interrupt enable")
-        self.ADDRIE = BitField(self, 0x00000008, "ADDRIE", "Address match interrupt enable (slave only)")
-        self.NACKIE = BitField(self, 0x00000010, "NACKIE", "Not acknowledge received interrupt enable")
-        self.STOPIE = BitField(self, 0x00000020, "STOPIE", "STOP detection Interrupt enable")
-        self.TCIE = BitField(self, 0x00000040, "TCIE", "Transfer Complete interrupt enable")
-        self.ERRIE = BitField(self, 0x00000080, "ERRIE", "Error interrupts enable")
-        self.DNF = BitField(self, 0x00000F00, "DNF", "Digital noise filter")
-        self.ANFOFF = BitField(self, 0x00001000, "ANFOFF", "Analog noise filter OFF")
-        self.TXDMAEN = BitField(self, 0x00004000, "TXDMAEN", "DMA transmission requests enable")
-        self.RXDMAEN = BitField(self, 0x00008000, "RXDMAEN", "DMA reception requests enable")
-        self.SBC = BitField(self, 0x00010000, "SBC", "Slave byte control")
-        self.NOSTRETCH = BitField(self, 0x00020000, "NOSTRETCH", "Clock stretching disable")
-        self.WUPEN = BitField(self, 0x00040000, "WUPEN", "Wakeup from STOP enable")
-        self.GCEN = BitField(self, 0x00080000, "GCEN", "General call enable")
-        self.SMBHEN = BitField(self, 0x00100000, "SMBHEN", "SMBus Host address enable")
-        self.SMBDEN = BitField(self, 0x00200000, "SMBDEN", "SMBus Device Default address enable")
-        self.ALERTEN = BitField(self, 0x00400000, "ALERTEN", "SMBUS alert enable")
-        self.PECEN = BitField(self, 0x00800000, "PECEN", "PEC enable")
-
-class SA_I2C1_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR2", "Control register 2")
-        self.PECBYTE = BitField(self, 0x04000000, "PECBYTE", "Packet error checking byte")
-        self.AUTOEND = BitField(self, 0x02000000, "AUTOEND", "Automatic end mode (master mode)")
-        self.RELOAD = BitField(self, 0x01000000, "RELOAD", "NBYTES reload mode")
-        self.NBYTES = BitField(self, 0x00FF0000, "NBYTES", "Number of bytes")
-        self.NACK = BitField(self, 0x00008000, "NACK", "NACK generation (slave mode)")
-        self.STOP = BitField(self, 0x00004000, "STOP", "Stop generation (master mode)")
-        self.START = BitField(self, 0x00002000, "START", "Start generation")
-        self.HEAD10R = BitField(self, 0x00001000, "HEAD10R", "10-bit address header only read direction (master receiver mode)")
-        self.ADD10 = BitField(self, 0x00000800, "ADD10", "10-bit addressing mode (master mode)")
-        self.RD_WRN = BitField(self, 0x00000400, "RD_WRN", "Transfer direction (master mode)")
-        self.SADD = BitField(self, 0x000003FF, "SADD", "Slave address bit (master mode)")
-
-class SA_I2C1_OAR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OAR1", "Own address register 1")
-        self.OA1 = BitField(self, 0x000003FF, "OA1", "Interface address")
-        self.OA1MODE = BitField(self, 0x00000400, "OA1MODE", "Own Address 1 10-bit mode")
-        self.OA1EN = BitField(self, 0x00008000, "OA1EN", "Own Address 1 enable")
-
-class SA_I2C1_OAR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OAR2", "Own address register 2")
-        self.OA2 = BitField(self, 0x000000FE, "OA2", "Interface address")
-        self.OA2MSK = BitField(self, 0x00000700, "OA2MSK", "Own Address 2 masks")
-        self.OA2EN = BitField(self, 0x00008000, "OA2EN", "Own Address 2 enable")
-
-class SA_I2C1_TIMINGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TIMINGR", "Timing register")
-        self.SCLL = BitField(self, 0x000000FF, "SCLL", "SCL low period (master mode)")
-        self.SCLH = BitField(self, 0x0000FF00, "SCLH", "SCL high period (master mode)")
-        self.SDADEL = BitField(self, 0x000F0000, "SDADEL", "Data hold time")
-        self.SCLDEL = BitField(self, 0x00F00000, "SCLDEL", "Data setup time")
-        self.PRESC = BitField(self, 0xF0000000, "PRESC", "Timing prescaler")
-
-class SA_I2C1_TIMEOUTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TIMEOUTR", "Status register 1")
-        self.TIMEOUTA = BitField(self, 0x00000FFF, "TIMEOUTA", "Bus timeout A")
-        self.TIDLE = BitField(self, 0x00001000, "TIDLE", "Idle clock timeout detection")
-        self.TIMOUTEN = BitField(self, 0x00008000, "TIMOUTEN", "Clock timeout enable")
-        self.TIMEOUTB = BitField(self, 0x0FFF0000, "TIMEOUTB", "Bus timeout B")
-        self.TEXTEN = BitField(self, 0x80000000, "TEXTEN", "Extended clock timeout enable")
-
-class SA_I2C1_ISR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x1, "ISR", "Interrupt and Status register")
-        self.ADDCODE = BitField(self, 0x00FE0000, "ADDCODE", "Address match code (Slave mode)")
-        self.DIR = BitField(self, 0x00010000, "DIR", "Transfer direction (Slave mode)")
-        self.BUSY = BitField(self, 0x00008000, "BUSY", "Bus busy")
-        self.ALERT = BitField(self, 0x00002000, "ALERT", "SMBus alert")
-        self.TIMEOUT = BitField(self, 0x00001000, "TIMEOUT", "Timeout or t_low detection flag")
-        self.PECERR = BitField(self, 0x00000800, "PECERR", "PEC Error in reception")
-        self.OVR = BitField(self, 0x00000400, "OVR", "Overrun/Underrun (slave mode)")
-        self.ARLO = BitField(self, 0x00000200, "ARLO", "Arbitration lost")
-        self.BERR = BitField(self, 0x00000100, "BERR", "Bus error")
-        self.TCR = BitField(self, 0x00000080, "TCR", "Transfer Complete Reload")
-        self.TC = BitField(self, 0x00000040, "TC", "Transfer Complete (master mode)")
-        self.STOPF = BitField(self, 0x00000020, "STOPF", "Stop detection flag")
-        self.NACKF = BitField(self, 0x00000010, "NACKF", "Not acknowledge received flag")
-        self.ADDR = BitField(self, 0x00000008, "ADDR", "Address matched (slave mode)")
-        self.RXNE = BitField(self, 0x00000004, "RXNE", "Receive data register not empty (receivers)")
-        self.TXIS = BitField(self, 0x00000002, "TXIS", "Transmit interrupt status (transmitters)")
-        self.TXE = BitField(self, 0x00000001, "TXE", "Transmit data register empty (transmitters)")
-
-class SA_I2C1_ICR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ICR", "Interrupt clear register")
-        self.ALERTCF = BitField(self, 0x00002000, "ALERTCF", "Alert flag clear")
-        self.TIMOUTCF = BitField(self, 0x00001000, "TIMOUTCF", "Timeout detection flag clear")
-        self.PECCF = BitField(self, 0x00000800, "PECCF", "PEC Error flag clear")
-        self.OVRCF = BitField(self, 0x00000400, "OVRCF", "Overrun/Underrun flag clear")
-        self.ARLOCF = BitField(self, 0x00000200, "ARLOCF", "Arbitration lost flag clear")
-        self.BERRCF = BitField(self, 0x00000100, "BERRCF", "Bus error flag clear")
-        self.STOPCF = BitField(self, 0x00000020, "STOPCF", "Stop detection flag clear")
-        self.NACKCF = BitField(self, 0x00000010, "NACKCF", "Not Acknowledge flag clear")
-        self.ADDRCF = BitField(self, 0x00000008, "ADDRCF", "Address Matched flag clear")
-
-class SA_I2C1_PECR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PECR", "PEC register")
-        self.PEC = BitField(self, 0x000000FF, "PEC", "Packet error checking register")
-
-class SA_I2C1_RXDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RXDR", "Receive data register")
-        self.RXDATA = BitField(self, 0x000000FF, "RXDATA", "8-bit receive data")
-
-class SA_I2C1_TXDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXDR", "Transmit data register")
-        self.TXDATA = BitField(self, 0x000000FF, "TXDATA", "8-bit transmit data")
-
-class SA_I2C1(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Inter-integrated circuit")
-        self.CR1 = SA_I2C1_CR1(self, 0x0)
-        self.CR2 = SA_I2C1_CR2(self, 0x4)
-        self.OAR1 = SA_I2C1_OAR1(self, 0x8)
-        self.OAR2 = SA_I2C1_OAR2(self, 0xC)
-        self.TIMINGR = SA_I2C1_TIMINGR(self, 0x10)
-        self.TIMEOUTR = SA_I2C1_TIMEOUTR(self, 0x14)
-        self.ISR = SA_I2C1_ISR(self, 0x18)
-        self.ICR = SA_I2C1_ICR(self, 0x1C)
-        self.PECR = SA_I2C1_PECR(self, 0x20)
-        self.RXDR = SA_I2C1_RXDR(self, 0x24)
-        self.TXDR = SA_I2C1_TXDR(self, 0x28)
-        self.OAR = Subscriptor(self, "OAR{}")
-
-I2C1 = SA_I2C1(0x40005400, "I2C1")
-I2C2 = SA_I2C1(0x40005800, "I2C2")
-I2C3 = SA_I2C1(0x40007800, "I2C3")
-
-class SA_FLASH_ACR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x600, "ACR", "Access control register")
-        self.LATENCY = BitField(self, 0x0000000F, "LATENCY", "Latency")
-        self.PRFTEN = BitField(self, 0x00000100, "PRFTEN", "Prefetch enable")
-        self.ICEN = BitField(self, 0x00000200, "ICEN", "Instruction cache enable")
-        self.DCEN = BitField(self, 0x00000400, "DCEN", "Data cache enable")
-        self.ICRST = BitField(self, 0x00000800, "ICRST", "Instruction cache reset")
-        self.DCRST = BitField(self, 0x00001000, "DCRST", "Data cache reset")
-        self.RUN_PD = BitField(self, 0x00002000, "RUN_PD", "Flash Power-down mode during Low-power run mode")
-        self.SLEEP_PD = BitField(self, 0x00004000, "SLEEP_PD", "Flash Power-down mode during Low-power sleep mode")
-        self.DBG_SWEN = BitField(self, 0x00040000, "DBG_SWEN", "Debug software enable")
-
-class SA_FLASH_PDKEYR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PDKEYR", "Power down key register")
-        self.PDKEYR = BitField(self, 0xFFFFFFFF, "PDKEYR", "RUN_PD in FLASH_ACR key")
-
-class SA_FLASH_KEYR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "KEYR", "Flash key register")
-        self.KEYR = BitField(self, 0xFFFFFFFF, "KEYR", "KEYR")
-
-class SA_FLASH_OPTKEYR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OPTKEYR", "Option byte key register")
-        self.OPTKEYR = BitField(self, 0xFFFFFFFF, "OPTKEYR", "Option byte key")
-
-class SA_FLASH_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "Status register")
-        self.EOP = BitField(self, 0x00000001, "EOP", "End of operation")
-        self.OPERR = BitField(self, 0x00000002, "OPERR", "Operation error")
-        self.PROGERR = BitField(self, 0x00000008, "PROGERR", "Programming error")
-        self.WRPERR = BitField(self, 0x00000010, "WRPERR", "Write protected error")
-        self.PGAERR = BitField(self, 0x00000020, "PGAERR", "Programming alignment error")
-        self.SIZERR = BitField(self, 0x00000040, "SIZERR", "Size error")
-        self.PGSERR = BitField(self, 0x00000080, "PGSERR", "Programming sequence error")
-        self.MISERR = BitField(self, 0x00000100, "MISERR", "Fast programming data miss error")
-        self.FASTERR = BitField(self, 0x00000200, "FASTERR", "Fast programming error")
-        self.RDERR = BitField(self, 0x00004000, "RDERR", "PCROP read error")
-        self.OPTVERR = BitField(self, 0x00008000, "OPTVERR", "Option validity error")
-        self.BSY = BitField(self, 0x00010000, "BSY", "Busy")
-
-class SA_FLASH_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xC0000000, "CR", "Flash control register")
-        self.PG = BitField(self, 0x00000001, "PG", "Programming")
-        self.PER = BitField(self, 0x00000002, "PER", "Page erase")
-        self.MER1 = BitField(self, 0x00000004, "MER1", "Bank 1 Mass erase")
-        self.PNB = BitField(self, 0x000003F8, "PNB", "Page number")
-        self.STRT = BitField(self, 0x00010000, "STRT", "Start")
-        self.OPTSTRT = BitField(self, 0x00020000, "OPTSTRT", "Options modification start")
-        self.FSTPG = BitField(self, 0x00040000, "FSTPG", "Fast programming")
-        self.EOPIE = BitField(self, 0x01000000, "EOPIE", "End of operation interrupt enable")
-        self.ERRIE = BitField(self, 0x02000000, "ERRIE", "Error interrupt enable")
-        self.RDERRIE = BitField(self, 0x04000000, "RDERRIE", "PCROP read error interrupt enable")
-        self.OBL_LAUNCH = BitField(self, 0x08000000, "OBL_LAUNCH", "Force the option byte loading")
-        self.SEC_PROT1 = BitField(self, 0x10000000, "SEC_PROT1", "SEC_PROT1")
-        self.OPTLOCK = BitField(self, 0x40000000, "OPTLOCK", "Options Lock")
-        self.LOCK = BitField(self, 0x80000000, "LOCK", "FLASH_CR Lock")
-
-class SA_FLASH_ECCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ECCR", "Flash ECC register")
-        self.ADDR_ECC = BitField(self, 0x0007FFFF, "ADDR_ECC", "ECC fail address")
-        self.BK_ECC = BitField(self, 0x00200000, "BK_ECC", "BK_ECC")
-        self.SYSF_ECC = BitField(self, 0x00400000, "SYSF_ECC", "SYSF_ECC")
-        self.ECCIE = BitField(self, 0x01000000, "ECCIE", "ECCIE")
-        self.ECCC2 = BitField(self, 0x10000000, "ECCC2", "ECC correction")
-        self.ECCD2 = BitField(self, 0x20000000, "ECCD2", "ECC2 detection")
-        self.ECCC = BitField(self, 0x40000000, "ECCC", "ECC correction")
-        self.ECCD = BitField(self, 0x80000000, "ECCD", "ECC detection")
-
-class SA_FLASH_OPTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xF0000000, "OPTR", "Flash option register")
-        self.RDP = BitField(self, 0x000000FF, "RDP", "Read protection level")
-        self.BOR_LEV = BitField(self, 0x00000700, "BOR_LEV", "BOR reset Level")
-        self.nRST_STOP = BitField(self, 0x00001000, "nRST_STOP", "nRST_STOP")
-        self.nRST_STDBY = BitField(self, 0x00002000, "nRST_STDBY", "nRST_STDBY")
-        self.nRST_SHDW = BitField(self, 0x00004000, "nRST_SHDW", "nRST_SHDW")
-        self.IDWG_SW = BitField(self, 0x00010000, "IDWG_SW", "Independent watchdog selection")
-        self.IWDG_STOP = BitField(self, 0x00020000, "IWDG_STOP", "Independent watchdog counter freeze in Stop mode")
-        self.IWDG_STDBY = BitField(self, 0x00040000, "IWDG_STDBY", "Independent watchdog counter freeze in Standby mode")
-        self.WWDG_SW = BitField(self, 0x00080000, "WWDG_SW", "Window watchdog selection")
-        self.nBOOT1 = BitField(self, 0x00800000, "nBOOT1", "Boot configuration")
-        self.SRAM2_PE = BitField(self, 0x01000000, "SRAM2_PE", "SRAM2 parity check enable")
-        self.SRAM2_RST = BitField(self, 0x02000000, "SRAM2_RST", "SRAM2 Erase when system reset")
-        self.nSWBOOT0 = BitField(self, 0x04000000, "nSWBOOT0", "nSWBOOT0")
-        self.nBOOT0 = BitField(self, 0x08000000, "nBOOT0", "nBOOT0")
-        self.NRST_MODE = BitField(self, 0x30000000, "NRST_MODE", "NRST_MODE")
-        self.IRHEN = BitField(self, 0x40000000, "IRHEN", "IRHEN")
-        self.nBOOT = Subscriptor(self, "nBOOT{}")
-
-class SA_FLASH_PCROP1SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFF0000, "PCROP1SR", "Flash Bank 1 PCROP Start address register")
-        self.PCROP1_STRT = BitField(self, 0x00007FFF, "PCROP1_STRT", "Bank 1 PCROP area start offset")
-
-class SA_FLASH_PCROP1ER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFF0000, "PCROP1ER", "Flash Bank 1 PCROP End address register")
-        self.PCROP1_END = BitField(self, 0x00007FFF, "PCROP1_END", "Bank 1 PCROP area end offset")
-        self.PCROP_RDP = BitField(self, 0x80000000, "PCROP_RDP", "PCROP area preserved when RDP level decreased")
-
-class SA_FLASH_WRP1AR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "WRP1AR", "Flash Bank 1 WRP area A address register")
-        self.WRP1A_STRT = BitField(self, 0x0000007F, "WRP1A_STRT", "Bank 1 WRP first area start offset")
-        self.WRP1A_END = BitField(self, 0x007F0000, "WRP1A_END", "Bank 1 WRP first area A end offset")
-
-class SA_FLASH_WRP1BR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "WRP1BR", "Flash Bank 1 WRP area B address register")
-        self.WRP1B_STRT = BitField(self, 0x0000007F, "WRP1B_STRT", "Bank 1 WRP second area B end offset")
-        self.WRP1B_END = BitField(self, 0x007F0000, "WRP1B_END", "Bank 1 WRP second area B start offset")
-
-class SA_FLASH_SEC1R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFF00FF00, "SEC1R", "securable area bank1 register")
-        self.BOOT_LOCK = BitField(self, 0x00010000, "BOOT_LOCK", "BOOT_LOCK")
-        self.SEC_SIZE1 = BitField(self, 0x0000007F, "SEC_SIZE1", "SEC_SIZE1")
-
-class SA_FLASH(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Flash")
-        self.ACR = SA_FLASH_ACR(self, 0x0)
-        self.PDKEYR = SA_FLASH_PDKEYR(self, 0x4)
-        self.KEYR = SA_FLASH_KEYR(self, 0x8)
-        self.OPTKEYR = SA_FLASH_OPTKEYR(self, 0xC)
-        self.SR = SA_FLASH_SR(self, 0x10)
-        self.CR = SA_FLASH_CR(self, 0x14)
-        self.ECCR = SA_FLASH_ECCR(self, 0x18)
-        self.OPTR = SA_FLASH_OPTR(self, 0x20)
-        self.PCROP1SR = SA_FLASH_PCROP1SR(self, 0x24)
-        self.PCROP1ER = SA_FLASH_PCROP1ER(self, 0x28)
-        self.WRP1AR = SA_FLASH_WRP1AR(self, 0x2C)
-        self.WRP1BR = SA_FLASH_WRP1BR(self, 0x30)
-        self.SEC1R = SA_FLASH_SEC1R(self, 0x70)
-
-FLASH = SA_FLASH(0x40022000, "FLASH")
-
-class SA_DBGMCU_IDCODE(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IDCODE", "MCU Device ID Code Register")
-        self.DEV_ID = BitField(self, 0x0000FFFF, "DEV_ID", "Device Identifier")
-        self.REV_ID = BitField(self, 0xFFFF0000, "REV_ID", "Revision Identifier")
-
-class SA_DBGMCU_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR", "Debug MCU Configuration Register")
-        self.DBG_SLEEP = BitField(self, 0x00000001, "DBG_SLEEP", "Debug Sleep Mode")
-        self.DBG_STOP = BitField(self, 0x00000002, "DBG_STOP", "Debug Stop Mode")
-        self.DBG_STANDBY = BitField(self, 0x00000004, "DBG_STANDBY", "Debug Standby Mode")
-        self.TRACE_IOEN = BitField(self, 0x00000020, "TRACE_IOEN", "Trace pin assignment control")
-        self.TRACE_MODE = BitField(self, 0x000000C0, "TRACE_MODE", "Trace pin assignment control")
-
-class SA_DBGMCU_APB1L_FZ(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "APB1L_FZ", "APB Low Freeze Register 1")
-        self.DBG_TIMER2_STOP = BitField(self, 0x00000001, "DBG_TIMER2_STOP", "Debug Timer 2 stopped when Core is halted")
-        self.DBG_TIM3_STOP = BitField(self, 0x00000002, "DBG_TIM3_STOP", "TIM3 counter stopped when core is halted")
-        self.DBG_TIM4_STOP = BitField(self, 0x00000004, "DBG_TIM4_STOP", "TIM4 counter stopped when core is halted")
-        self.DBG_TIM5_STOP = BitField(self, 0x00000008, "DBG_TIM5_STOP", "TIM5 counter stopped when core is halted")
-        self.DBG_TIMER6_STOP = BitField(self, 0x00000010, "DBG_TIMER6_STOP", "Debug Timer 6 stopped when Core is halted")
-        self.DBG_TIM7_STOP = BitField(self, 0x00000020, "DBG_TIM7_STOP", "TIM7 counter stopped when core is halted")
-        self.DBG_RTC_STOP = BitField(self, 0x00000400, "DBG_RTC_STOP", "Debug RTC stopped when Core is halted")
-        self.DBG_WWDG_STOP = BitField(self, 0x00000800, "DBG_WWDG_STOP", "Debug Window Wachdog stopped when Core is halted")
-        self.DBG_IWDG_STOP = BitField(self, 0x00001000, "DBG_IWDG_STOP", "Debug Independent Wachdog stopped when Core is halted")
-        self.DBG_I2C1_STOP = BitField(self, 0x00200000, "DBG_I2C1_STOP", "I2C1 SMBUS timeout mode stopped when core is halted")
-        self.DBG_I2C2_STOP = BitField(self, 0x00400000, "DBG_I2C2_STOP", "I2C2 SMBUS timeout mode stopped when core is halted")
-        self.DBG_I2C3_STOP = BitField(self, 0x40000000, "DBG_I2C3_STOP", "I2C3 SMBUS timeout mode stopped when core is halted")
-        self.DBG_LPTIMER_STOP = BitField(self, 0x80000000, "DBG_LPTIMER_STOP", "LPTIM1 counter stopped when core is halted")
-        self.DBG_I2C_STOP = Subscriptor(self, "DBG_I2C{}_STOP")
-        self.DBG_TIM_STOP = Subscriptor(self, "DBG_TIM{}_STOP")
-
-class SA_DBGMCU_APB1H_FZ(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "APB1H_FZ", "APB Low Freeze Register 2")
-        self.DBG_I2C4_STOP = BitField(self, 0x00000002, "DBG_I2C4_STOP", "DBG_I2C4_STOP")
-
-class SA_DBGMCU_APB2_FZ(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "APB2_FZ", "APB High Freeze Register")
-        self.DBG_TIM1_STOP = BitField(self, 0x00000800, "DBG_TIM1_STOP", "TIM1 counter stopped when core is halted")
-        self.DBG_TIM8_STOP = BitField(self, 0x00002000, "DBG_TIM8_STOP", "TIM8 counter stopped when core is halted")
-        self.DBG_TIM15_STOP = BitField(self, 0x00010000, "DBG_TIM15_STOP", "TIM15 counter stopped when core is halted")
-        self.DBG_TIM16_STOP = BitField(self, 0x00020000, "DBG_TIM16_STOP", "TIM16 counter stopped when core is halted")
-        self.DBG_TIM17_STOP = BitField(self, 0x00040000, "DBG_TIM17_STOP", "TIM17 counter stopped when core is halted")
-        self.DBG_TIM20_STOP = BitField(self, 0x00100000, "DBG_TIM20_STOP", "TIM20counter stopped when core is halted")
-        self.DBG_HRTIM0_STOP = BitField(self, 0x04000000, "DBG_HRTIM0_STOP", "DBG_HRTIM0_STOP")
-        self.DBG_HRTIM1_STOP = BitField(self, 0x08000000, "DBG_HRTIM1_STOP", "DBG_HRTIM0_STOP")
-        self.DBG_HRTIM2_STOP = BitField(self, 0x10000000, "DBG_HRTIM2_STOP", "DBG_HRTIM0_STOP")
-        self.DBG_HRTIM3_STOP = BitField(self, 0x20000000, "DBG_HRTIM3_STOP", "DBG_HRTIM0_STOP")
-        self.DBG_HRTIM_STOP = Subscriptor(self, "DBG_HRTIM{}_STOP")
-        self.DBG_TIM_STOP = Subscriptor(self, "DBG_TIM{}_STOP")
-
-class SA_DBGMCU(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Debug support")
-        self.IDCODE = SA_DBGMCU_IDCODE(self, 0x0)
-        self.CR = SA_DBGMCU_CR(self, 0x4)
-        self.APB1L_FZ = SA_DBGMCU_APB1L_FZ(self, 0x8)
-        self.APB1H_FZ = SA_DBGMCU_APB1H_FZ(self, 0xC)
-        self.APB2_FZ = SA_DBGMCU_APB2_FZ(self, 0x10)
-
-DBGMCU = SA_DBGMCU(0xE0042000, "DBGMCU")
-
-class SA_RCC_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x63, "CR", "Clock control register")
-        self.HSION = BitField(self, 0x00000100, "HSION", "HSI16 clock enable. Set and cleared by software. Cleared by hardware to stop the HSI16 oscillator when entering Stop, Standby or Shutdown mode. Set by hardware to force the HSI16 oscillator ON when STOPWUCK=1 or HSIASFS = 1 when leaving Stop modes, or in case of failure of the HSE crystal oscillator. This bit is set by hardware if the HSI16 is used directly or indirectly as system clock.")
-        self.HSIKERON = BitField(self, 0x00000200, "HSIKERON", "HSI16 always enable for peripheral kernels.. Set and cleared by software to force HSI16 ON even in Stop modes. The HSI16 can only feed USARTs and I<sup>2</sup>Cs peripherals configured with HSI16 as kernel clock. Keeping the HSI16 ON in Stop mode allows to avoid slowing down the communication speed because of the HSI16 startup time. This bit has no effect on HSION value.")
-        self.HSIRDY = BitField(self, 0x00000400, "HSIRDY", "HSI16 clock ready flag. Set by hardware to indicate that HSI16 oscillator is stable. This bit is set only when HSI16 is enabled by software by setting HSION. Note: Once the HSION bit is cleared, HSIRDY goes low after 6 HSI16 clock cycles.")
-        self.HSEON = BitField(self, 0x00010000, "HSEON", "HSE clock enable. Set and cleared by software. Cleared by hardware to stop the HSE oscillator when entering Stop, Standby or Shutdown mode. This bit cannot be reset if the HSE oscillator is used directly or indirectly as the system clock.")
-        self.HSERDY = BitField(self, 0x00020000, "HSERDY", "HSE clock ready flag. Set by hardware to indicate that the HSE oscillator is stable. Note: Once the HSEON bit is cleared, HSERDY goes low after 6 HSE clock cycles.")
-        self.HSEBYP = BitField(self, 0x00040000, "HSEBYP", "HSE crystal oscillator bypass. Set and cleared by software to bypass the oscillator with an external clock. The external clock must be enabled with the HSEON bit set, to be used by the device. The HSEBYP bit can be written only if the HSE oscillator is disabled.")
-        self.CSSON = BitField(self, 0x00080000, "CSSON", "Clock security system enable. Set by software to enable the clock security system. When CSSON is set, the clock detector is enabled by hardware when the HSE oscillator is ready, and disabled by hardware if a HSE clock failure is detected. This bit is set only and is cleared by reset.")
-        self.PLLON = BitField(self, 0x01000000, "PLLON", "Main PLL enable. Set and cleared by software to enable the main PLL. Cleared by hardware when entering Stop, Standby or Shutdown mode. This bit cannot be reset if the PLL clock is used as the system clock.")
-        self.PLLRDY = BitField(self, 0x02000000, "PLLRDY", "Main PLL clock ready flag. Set by hardware to indicate that the main PLL is locked.")
-
-class SA_RCC_ICSCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x40000000, "ICSCR", "Internal clock sources calibration register")
-        self.HSICAL = BitField(self, 0x00FF0000, "HSICAL", "HSI16 clock calibration. These bits are initialized at startup with the factory-programmed HSI16 calibration trim value. When HSITRIM is written, HSICAL is updated with the sum of HSITRIM and the factory trim value.")
-        self.HSITRIM = BitField(self, 0x7F000000, "HSITRIM", "HSI16 clock trimming. These bits provide an additional user-programmable trimming value that is added to the HSICAL[7:0] bits. It can be programmed to adjust to variations in voltage and temperature that influence the frequency of the HSI16. The default value is 16, which, when added to the HSICAL value, should trim the HSI16 to 16 MHz 1 %.")
-
-class SA_RCC_CFGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x5, "CFGR", "Clock configuration register")
-        self.SW = BitField(self, 0x00000003, "SW", "System clock switch. Set and cleared by software to select system clock source (SYSCLK). Configured by hardware to force HSI16 oscillator selection when exiting stop and standby modes or in case of failure of the HSE oscillator.")
-        self.SWS = BitField(self, 0x0000000C, "SWS", "System clock switch status. Set and cleared by hardware to indicate which clock source is used as system clock.")
-        self.HPRE = BitField(self, 0x000000F0, "HPRE", "AHB prescaler. Set and cleared by software to control the division factor of the AHB clock. Note: Depending on the device voltage range, the software has to set correctly these bits to ensure that the system frequency does not exceed the maximum allowed frequency (for more details please refer to Section 6.1.5: Dynamic voltage scaling management). After a write operation to these bits and before decreasing the voltage range, this register must be read to be sure that the new value has been taken into account. 0xxx: SYSCLK not divided")
-        self.PPRE1 = BitField(self, 0x00000700, "PPRE1", "APB1 prescaler. Set and cleared by software to control the division factor of the APB1 clock (PCLK1). 0xx: HCLK not divided")
-        self.PPRE2 = BitField(self, 0x00003800, "PPRE2", "APB2 prescaler. Set and cleared by software to control the division factor of the APB2 clock (PCLK2). 0xx: HCLK not divided")
-        self.MCOSEL = BitField(self, 0x0F000000, "MCOSEL", "Microcontroller clock output . Set and cleared by software. Others: Reserved Note: This clock output may have some truncated cycles at startup or during MCO clock source switching.")
-        self.MCOPRE = BitField(self, 0x70000000, "MCOPRE", "Microcontroller clock output prescaler. These bits are set and cleared by software. It is highly recommended to change this prescaler before MCO output is enabled. Others: not allowed")
-        self.PPRE = Subscriptor(self, "PPRE{}")
-
-class SA_RCC_PLLCFGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x1000, "PLLCFGR", "PLL configuration register")
-        self.PLLSRC = BitField(self, 0x00000003, "PLLSRC", "Main PLL entry clock source. Set and cleared by software to select PLL clock source. These bits can be written only when PLL is disabled. In order to save power, when no PLL is used, the value of PLLSRC should be 00.")
-        self.PLLM = BitField(self, 0x000000F0, "PLLM", "Division factor for the main PLL input clock. Set and cleared by software to divide the PLL input clock before the VCO. These bits can be written only when all PLLs are disabled. VCO input frequency = PLL input clock frequency / PLLM with 1 <= PLLM <= 16 ... Note: The software has to set these bits correctly to ensure that the VCO input frequency is within the range defined in the device datasheet.")
-        self.PLLN = BitField(self, 0x00007F00, "PLLN", "Main PLL multiplication factor for VCO. Set and cleared by software to control the multiplication factor of the VCO. These bits can be written only when the PLL is disabled. VCO output frequency = VCO input frequency x PLLN with 8 =< PLLN =< 127 ... ... Note: The software has to set correctly these bits to assure that the VCO output frequency is within the range defined in the device datasheet.")
-        self.PLLPEN = BitField(self, 0x00010000, "PLLPEN", "Main PLL PLL P clock output enable. Set and reset by software to enable the PLL P clock output of the PLL. In order to save power, when the PLL P clock output of the PLL is not used, the value of PLLPEN should be 0.")
-        self.PLLP = BitField(self, 0x00020000, "PLLP", "Main PLL division factor for PLL P clock.. Set and cleared by software to control the frequency of the main PLL output clock PLL P clock. These bits can be written only if PLL is disabled. When the PLLPDIV[4:0] is set to 00000PLL P output clock frequency = VCO frequency / PLLP with PLLP =7, or 17 Note: The software has to set these bits correctly not to exceed 170 MHz on this domain.")
-        self.PLLQEN = BitField(self, 0x00100000, "PLLQEN", "Main PLL Q clock output enable. Set and reset by software to enable the PLL Q clock output of the PLL. In order to save power, when the PLL Q clock output of the PLL is not used, the value of PLLQEN should be 0.")
-        self.PLLQ = BitField(self, 0x00600000, "PLLQ", "Main PLL division factor for PLL Q clock.. Set and cleared by software to control the frequency of the main PLL output clock PLL Q clock. This output can be selected for USB, RNG, SAI (48 MHz clock). These bits can be written only if PLL is disabled. PLL Q output clock frequency = VCO frequency / PLLQ with PLLQ = 2, 4, 6, or 8 Note: The software has to set these bits correctly not to exceed 170 MHz on this domain.")
-        self.PLLREN = BitField(self, 0x01000000, "PLLREN", "PLL R clock output enable. Set and reset by software to enable the PLL R clock output of the PLL (used as system clock). This bit cannot be written when PLL R clock output of the PLL is used as System Clock. In order to save power, when the PLL R clock output of the PLL is not used, the value of PLLREN should be 0.")
-        self.PLLR = BitField(self, 0x06000000, "PLLR", "Main PLL division factor for PLL R clock (system clock). Set and cleared by software to control the frequency of the main PLL output clock PLLCLK. This output can be selected as system clock. These bits can be written only if PLL is disabled. PLL R output clock frequency = VCO frequency / PLLR with PLLR = 2, 4, 6, or 8 Note: The software has to set these bits correctly not to exceed 170 MHz on this domain.")
-        self.PLLPDIV = BitField(self, 0xF8000000, "PLLPDIV", "Main PLLP division factor. Set and cleared by software to control the PLL P frequency. PLL P output clock frequency = VCO frequency / PLLPDIV. ....")
-
-class SA_RCC_CIER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CIER", "Clock interrupt enable register")
-        self.LSIRDYIE = BitField(self, 0x00000001, "LSIRDYIE", "LSI ready interrupt enable. Set and cleared by software to enable/disable interrupt caused by the LSI oscillator stabilization.")
-        self.LSERDYIE = BitField(self, 0x00000002, "LSERDYIE", "LSE ready interrupt enable. Set and cleared by software to enable/disable interrupt caused by the LSE oscillator stabilization.")
-        self.HSIRDYIE = BitField(self, 0x00000008, "HSIRDYIE", "HSI16 ready interrupt enable. Set and cleared by software to enable/disable interrupt caused by the HSI16 oscillator stabilization.")
-        self.HSERDYIE = BitField(self, 0x00000010, "HSERDYIE", "HSE ready interrupt enable. Set and cleared by software to enable/disable interrupt caused by the HSE oscillator stabilization.")
-        self.PLLRDYIE = BitField(self, 0x00000020, "PLLRDYIE", "PLL ready interrupt enable. Set and cleared by software to enable/disable interrupt caused by PLL lock.")
-        self.LSECSSIE = BitField(self, 0x00000200, "LSECSSIE", "LSE clock security system interrupt enable. Set and cleared by software to enable/disable interrupt caused by the clock security system on LSE.")
-        self.HSI48RDYIE = BitField(self, 0x00000400, "HSI48RDYIE", "HSI48 ready interrupt enable . Set and cleared by software to enable/disable interrupt caused by the internal HSI48 oscillator.")
-
-class SA_RCC_CIFR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CIFR", "Clock interrupt flag register")
-        self.LSIRDYF = BitField(self, 0x00000001, "LSIRDYF", "LSI ready interrupt flag. Set by hardware when the LSI clock becomes stable and LSIRDYDIE is set. Cleared by software setting the LSIRDYC bit.")
-        self.LSERDYF = BitField(self, 0x00000002, "LSERDYF", "LSE ready interrupt flag. Set by hardware when the LSE clock becomes stable and LSERDYDIE is set. Cleared by software setting the LSERDYC bit.")
-        self.HSIRDYF = BitField(self, 0x00000008, "HSIRDYF", "HSI16 ready interrupt flag. Set by hardware when the HSI16 clock becomes stable and HSIRDYDIE is set in a response to setting the HSION (refer to Clock control register (RCC_CR)). When HSION is not set but the HSI16 oscillator is enabled by the peripheral through a clock request, this bit is not set and no interrupt is generated. Cleared by software setting the HSIRDYC bit.")
-        self.HSERDYF = BitField(self, 0x00000010, "HSERDYF", "HSE ready interrupt flag. Set by hardware when the HSE clock becomes stable and HSERDYDIE is set. Cleared by software setting the HSERDYC bit.")
-        self.PLLRDYF = BitField(self, 0x00000020, "PLLRDYF", "PLL ready interrupt flag. Set by hardware when the PLL locks and PLLRDYDIE is set. Cleared by software setting the PLLRDYC bit.")
-        self.CSSF = BitField(self, 0x00000100, "CSSF", "Clock security system interrupt flag. Set by hardware when a failure is detected in the HSE oscillator. Cleared by software setting the CSSC bit.")
-        self.LSECSSF = BitField(self, 0x00000200, "LSECSSF", "LSE Clock security system interrupt flag. Set by hardware when a failure is detected in the LSE oscillator. Cleared by software setting the LSECSSC bit.")
-        self.HSI48RDYF = BitField(self, 0x00000400, "HSI48RDYF", "HSI48 ready interrupt flag . Set by hardware when the HSI48 clock becomes stable and HSI48RDYIE is set in a response to setting the HSI48ON (refer to Clock recovery RC register (RCC_CRRCR)). Cleared by software setting the HSI48RDYC bit.")
-
-class SA_RCC_CICR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CICR", "Clock interrupt clear register")
-        self.LSIRDYC = BitField(self, 0x00000001, "LSIRDYC", "LSI ready interrupt clear. This bit is set by software to clear the LSIRDYF flag.")
-        self.LSERDYC = BitField(self, 0x00000002, "LSERDYC", "LSE ready interrupt clear. This bit is set by software to clear the LSERDYF flag.")
-        self.HSIRDYC = BitField(self, 0x00000008, "HSIRDYC", "HSI16 ready interrupt clear. This bit is set software to clear the HSIRDYF flag.")
-        self.HSERDYC = BitField(self, 0x00000010, "HSERDYC", "HSE ready interrupt clear. This bit is set by software to clear the HSERDYF flag.")
-        self.PLLRDYC = BitField(self, 0x00000020, "PLLRDYC", "PLL ready interrupt clear. This bit is set by software to clear the PLLRDYF flag.")
-        self.CSSC = BitField(self, 0x00000100, "CSSC", "Clock security system interrupt clear. This bit is set by software to clear the CSSF flag.")
-        self.LSECSSC = BitField(self, 0x00000200, "LSECSSC", "LSE Clock security system interrupt clear. This bit is set by software to clear the LSECSSF flag.")
-        self.HSI48RDYC = BitField(self, 0x00000400, "HSI48RDYC", "HSI48 oscillator ready interrupt clear . This bit is set by software to clear the HSI48RDYF flag.")
-
-class SA_RCC_AHB1RSTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AHB1RSTR", "AHB1 peripheral reset register")
-        self.DMA1RST = BitField(self, 0x00000001, "DMA1RST", "DMA1 reset. Set and cleared by software.")
-        self.DMA2RST = BitField(self, 0x00000002, "DMA2RST", "DMA2 reset. Set and cleared by software.")
-        self.DMAMUX1RST = BitField(self, 0x00000004, "DMAMUX1RST", "Set and cleared by software.")
-        self.CORDICRST = BitField(self, 0x00000008, "CORDICRST", "Set and cleared by software")
-        self.FMACRST = BitField(self, 0x00000010, "FMACRST", "Set and cleared by software")
-        self.FLASHRST = BitField(self, 0x00000100, "FLASHRST", "Flash memory interface reset. Set and cleared by software. This bit can be activated only when the Flash memory is in power down mode.")
-        self.CRCRST = BitField(self, 0x00001000, "CRCRST", "CRC reset. Set and cleared by software.")
-        self.DMARST = Subscriptor(self, "DMA{}RST")
-
-class SA_RCC_AHB2RSTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AHB2RSTR", "AHB2 peripheral reset register")
-        self.GPIOARST = BitField(self, 0x00000001, "GPIOARST", "IO port A reset. Set and cleared by software.")
-        self.GPIOBRST = BitField(self, 0x00000002, "GPIOBRST", "IO port B reset. Set and cleared by software.")
-        self.GPIOCRST = BitField(self, 0x00000004, "GPIOCRST", "IO port C reset. Set and cleared by software.")
-        self.GPIODRST = BitField(self, 0x00000008, "GPIODRST", "IO port D reset. Set and cleared by software.")
-        self.GPIOERST = BitField(self, 0x00000010, "GPIOERST", "IO port E reset. Set and cleared by software.")
-        self.GPIOFRST = BitField(self, 0x00000020, "GPIOFRST", "IO port F reset. Set and cleared by software.")
-        self.GPIOGRST = BitField(self, 0x00000040, "GPIOGRST", "IO port G reset. Set and cleared by software.")
-        self.ADC12RST = BitField(self, 0x00002000, "ADC12RST", "ADC12 reset. Set and cleared by software.")
-        self.ADC345RST = BitField(self, 0x00004000, "ADC345RST", "ADC345 reset. Set and cleared by software.")
-        self.DAC1RST = BitField(self, 0x00010000, "DAC1RST", "DAC1 reset. Set and cleared by software.")
-        self.DAC2RST = BitField(self, 0x00020000, "DAC2RST", "DAC2 reset. Set and cleared by software.")
-        self.DAC3RST = BitField(self, 0x00040000, "DAC3RST", "DAC3 reset. Set and cleared by software.")
-        self.DAC4RST = BitField(self, 0x00080000, "DAC4RST", "DAC4 reset. Set and cleared by software.")
-        self.AESRST = BitField(self, 0x01000000, "AESRST", "AESRST reset . Set and cleared by software.")
-        self.RNGRST = BitField(self, 0x04000000, "RNGRST", "RNG reset. Set and cleared by software.")
-        self.DACRST = Subscriptor(self, "DAC{}RST")
-
-class SA_RCC_AHB3RSTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AHB3RSTR", "AHB3 peripheral reset register")
-        self.FMCRST = BitField(self, 0x00000001, "FMCRST", "Flexible static memory controller reset. Set and cleared by software.")
-        self.QSPIRST = BitField(self, 0x00000100, "QSPIRST", "QUADSPI reset. Set and cleared by software.")
-
-class SA_RCC_APB1RSTR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "APB1RSTR1", "APB1 peripheral reset register 1")
-        self.TIM2RST = BitField(self, 0x00000001, "TIM2RST", "TIM2 timer reset. Set and cleared by software.")
-        self.TIM3RST = BitField(self, 0x00000002, "TIM3RST", "TIM3 timer reset. Set and cleared by software.")
-        self.TIM4RST = BitField(self, 0x00000004, "TIM4RST", "TIM3 timer reset. Set and cleared by software.")
-        self.TIM5RST = BitField(self, 0x00000008, "TIM5RST", "TIM5 timer reset. Set and cleared by software.")
-        self.TIM6RST = BitField(self, 0x00000010, "TIM6RST", "TIM6 timer reset. Set and cleared by software.")
-        self.TIM7RST = BitField(self, 0x00000020, "TIM7RST", "TIM7 timer reset. Set and cleared by software.")
-        self.CRSRST = BitField(self, 0x00000100, "CRSRST", "CRS reset. Set and cleared by software.")
-        self.SPI2RST = BitField(self, 0x00004000, "SPI2RST", "SPI2 reset. Set and cleared by software.")
-        self.SPI3RST = BitField(self, 0x00008000, "SPI3RST", "SPI3 reset. Set and cleared by software.")
-        self.USART2RST = BitField(self, 0x00020000, "USART2RST", "USART2 reset. Set and cleared by software.")
-        self.USART3RST = BitField(self, 0x00040000, "USART3RST", "USART3 reset. Set and cleared by software.")
-        self.UART4RST = BitField(self, 0x00080000, "UART4RST", "UART4 reset. Set and cleared by software.")
-        self.UART5RST = BitField(self, 0x00100000, "UART5RST", "UART5 reset. Set and cleared by software.")
-        self.I2C1RST = BitField(self, 0x00200000, "I2C1RST", "I2C1 reset. Set and cleared by software.")
-        self.I2C2RST = BitField(self, 0x00400000, "I2C2RST", "I2C2 reset. Set and cleared by software.")
-        self.USBRST = BitField(self, 0x00800000, "USBRST", "USB device reset. Set and reset by software.")
-        self.FDCANRST = BitField(self, 0x02000000, "FDCANRST", "FDCAN reset. Set and reset by software.")
-        self.PWRRST = BitField(self, 0x10000000, "PWRRST", "Power interface reset. Set and cleared by software.")
-        self.I2C3RST = BitField(self, 0x40000000, "I2C3RST", "I2C3 reset. Set and cleared by software.")
-        self.LPTIM1RST = BitField(self, 0x80000000, "LPTIM1RST", "Low Power Timer 1 reset. Set and cleared by software.")
-        self.TIMRST = Subscriptor(self, "TIM{}RST")
-        self.UARTRST = Subscriptor(self, "UART{}RST")
-        self.I2CRST = Subscriptor(self, "I2C{}RST")
-        self.SPIRST = Subscriptor(self, "SPI{}RST")
-        self.USARTRST = Subscriptor(self, "USART{}RST")
-
-class SA_RCC_APB1RSTR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "APB1RSTR2", "APB1 peripheral reset register 2")
-        self.LPUART1RST = BitField(self, 0x00000001, "LPUART1RST", "Low-power UART 1 reset. Set and cleared by software.")
-        self.I2C4RST = BitField(self, 0x00000002, "I2C4RST", "I2C4 reset. Set and cleared by software")
-        self.UCPD1RST = BitField(self, 0x00000100, "UCPD1RST", "UCPD1 reset. Set and cleared by software.")
-
-class SA_RCC_APB2RSTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "APB2RSTR", "APB2 peripheral reset register")
-        self.SYSCFGRST = BitField(self, 0x00000001, "SYSCFGRST", "SYSCFG + COMP + OPAMP + VREFBUF reset")
-        self.TIM1RST = BitField(self, 0x00000800, "TIM1RST", "TIM1 timer reset. Set and cleared by software.")
-        self.SPI1RST = BitField(self, 0x00001000, "SPI1RST", "SPI1 reset. Set and cleared by software.")
-        self.TIM8RST = BitField(self, 0x00002000, "TIM8RST", "TIM8 timer reset. Set and cleared by software.")
-        self.USART1RST = BitField(self, 0x00004000, "USART1RST", "USART1 reset. Set and cleared by software.")
-        self.SPI4RST = BitField(self, 0x00008000, "SPI4RST", "SPI4 reset. Set and cleared by software.")
-        self.TIM15RST = BitField(self, 0x00010000, "TIM15RST", "TIM15 timer reset. Set and cleared by software.")
-        self.TIM16RST = BitField(self, 0x00020000, "TIM16RST", "TIM16 timer reset. Set and cleared by software.")
-        self.TIM17RST = BitField(self, 0x00040000, "TIM17RST", "TIM17 timer reset. Set and cleared by software.")
-        self.TIM20RST = BitField(self, 0x00100000, "TIM20RST", "TIM20 reset. Set and cleared by software.")
-        self.SAI1RST = BitField(self, 0x00200000, "SAI1RST", "Serial audio interface 1 (SAI1) reset. Set and cleared by software.")
-        self.HRTIM1RST = BitField(self, 0x04000000, "HRTIM1RST", "HRTIM1 reset. Set and cleared by software.")
-        self.TIMRST = Subscriptor(self, "TIM{}RST")
-
-class SA_RCC_AHB1ENR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x100, "AHB1ENR", "AHB1 peripheral clock enable register")
-        self.DMA1EN = BitField(self, 0x00000001, "DMA1EN", "DMA1 clock enable. Set and cleared by software.")
-        self.DMA2EN = BitField(self, 0x00000002, "DMA2EN", "DMA2 clock enable. Set and cleared by software.")
-        self.DMAMUX1EN = BitField(self, 0x00000004, "DMAMUX1EN", "DMAMUX1 clock enable. Set and reset by software.")
-        self.CORDICEN = BitField(self, 0x00000008, "CORDICEN", "CORDIC clock enable. Set and reset by software.")
-        self.FMACEN = BitField(self, 0x00000010, "FMACEN", "FMAC enable. Set and reset by software.")
-        self.FLASHEN = BitField(self, 0x00000100, "FLASHEN", "Flash memory interface clock enable. Set and cleared by software. This bit can be disabled only when the Flash is in power down mode.")
-        self.CRCEN = BitField(self, 0x00001000, "CRCEN", "CRC clock enable. Set and cleared by software.")
-        self.DMAEN = Subscriptor(self, "DMA{}EN")
-
-class SA_RCC_AHB2ENR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AHB2ENR", "AHB2 peripheral clock enable register")
-        self.GPIOAEN = BitField(self, 0x00000001, "GPIOAEN", "IO port A clock enable. Set and cleared by software.")
-        self.GPIOBEN = BitField(self, 0x00000002, "GPIOBEN", "IO port B clock enable. Set and cleared by software.")
-        self.GPIOCEN = BitField(self, 0x00000004, "GPIOCEN", "IO port C clock enable. Set and cleared by software.")
-        self.GPIODEN = BitField(self, 0x00000008, "GPIODEN", "IO port D clock enable. Set and cleared by software.")
-        self.GPIOEEN = BitField(self, 0x00000010, "GPIOEEN", "IO port E clock enable. Set and cleared by software.")
-        self.GPIOFEN = BitField(self, 0x00000020, "GPIOFEN", "IO port F clock enable. Set and cleared by software.")
-        self.GPIOGEN = BitField(self, 0x00000040, "GPIOGEN", "IO port G clock enable. Set and cleared by software.")
-        self.ADC12EN = BitField(self, 0x00002000, "ADC12EN", "ADC12 clock enable. Set and cleared by software.")
-        self.ADC345EN = BitField(self, 0x00004000, "ADC345EN", "ADC345 clock enable . Set and cleared by software")
-        self.DAC1EN = BitField(self, 0x00010000, "DAC1EN", "DAC1 clock enable. Set and cleared by software.")
-        self.DAC2EN = BitField(self, 0x00020000, "DAC2EN", "DAC2 clock enable. Set and cleared by software.")
-        self.DAC3EN = BitField(self, 0x00040000, "DAC3EN", "DAC3 clock enable. Set and cleared by software.")
-        self.DAC4EN = BitField(self, 0x00080000, "DAC4EN", "DAC4 clock enable. Set and cleared by software.")
-        self.AESEN = BitField(self, 0x01000000, "AESEN", "AES clock enable. Set and cleared by software.")
-        self.RNGEN = BitField(self, 0x04000000, "RNGEN", "RNG enable. Set and cleared by software.")
-        self.DACEN = Subscriptor(self, "DAC{}EN")
-
-class SA_RCC_AHB3ENR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AHB3ENR", "AHB3 peripheral clock enable register")
-        self.FMCEN = BitField(self, 0x00000001, "FMCEN", "Flexible static memory controller clock enable. Set and cleared by software.")
-        self.QSPIEN = BitField(self, 0x00000100, "QSPIEN", "QUADSPI memory interface clock enable. Set and cleared by software.")
-
-class SA_RCC_APB1ENR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x400, "APB1ENR1", "APB1 peripheral clock enable register 1")
-        self.TIM2EN = BitField(self, 0x00000001, "TIM2EN", "TIM2 timer clock enable. Set and cleared by software.")
-        self.TIM3EN = BitField(self, 0x00000002, "TIM3EN", "TIM3 timer clock enable. Set and cleared by software.")
-        self.TIM4EN = BitField(self, 0x00000004, "TIM4EN", "TIM4 timer clock enable. Set and cleared by software.")
-        self.TIM5EN = BitField(self, 0x00000008, "TIM5EN", "TIM5 timer clock enable. Set and cleared by software.")
-        self.TIM6EN = BitField(self, 0x00000010, "TIM6EN", "TIM6 timer clock enable. Set and cleared by software.")
-        self.TIM7EN = BitField(self, 0x00000020, "TIM7EN", "TIM7 timer clock enable. Set and cleared by software.")
-        self.CRSEN = BitField(self, 0x00000100, "CRSEN", "CRS Recovery System clock enable. Set and cleared by software.")
-        self.RTCAPBEN = BitField(self, 0x00000400, "RTCAPBEN", "RTC APB clock enable . Set and cleared by software")
-        self.WWDGEN = BitField(self, 0x00000800, "WWDGEN", "Window watchdog clock enable. Set by software to enable the window watchdog clock. Reset by hardware system reset. This bit can also be set by hardware if the WWDG_SW option bit is reset.")
-        self.SPI2EN = BitField(self, 0x00004000, "SPI2EN", "SPI2 clock enable. Set and cleared by software.")
-        self.SPI3EN = BitField(self, 0x00008000, "SPI3EN", "SPI3 clock enable. Set and cleared by software.")
-        self.USART2EN = BitField(self, 0x00020000, "USART2EN", "USART2 clock enable. Set and cleared by software.")
-        self.USART3EN = BitField(self, 0x00040000, "USART3EN", "USART3 clock enable. Set and cleared by software.")
-        self.UART4EN = BitField(self, 0x00080000, "UART4EN", "UART4 clock enable. Set and cleared by software.")
-        self.UART5EN = BitField(self, 0x00100000, "UART5EN", "UART5 clock enable. Set and cleared by software.")
-        self.I2C1EN = BitField(self, 0x00200000, "I2C1EN", "I2C1 clock enable. Set and cleared by software.")
-        self.I2C2EN = BitField(self, 0x00400000, "I2C2EN", "I2C2 clock enable. Set and cleared by software.")
-        self.USBEN = BitField(self, 0x00800000, "USBEN", "USB device clock enable. Set and cleared by software.")
-        self.FDCANEN = BitField(self, 0x02000000, "FDCANEN", "FDCAN clock enable. Set and cleared by software.")
-        self.PWREN = BitField(self, 0x10000000, "PWREN", "Power interface clock enable. Set and cleared by software.")
-        self.I2C3EN = BitField(self, 0x40000000, "I2C3EN", "I2C3 clock enable. Set and cleared by software.")
-        self.LPTIM1EN = BitField(self, 0x80000000, "LPTIM1EN", "Low power timer 1 clock enable. Set and cleared by software.")
-        self.SPIEN = Subscriptor(self, "SPI{}EN")
-        self.UARTEN = Subscriptor(self, "UART{}EN")
-        self.TIMEN = Subscriptor(self, "TIM{}EN")
-        self.I2CEN = Subscriptor(self, "I2C{}EN")
-        self.USARTEN = Subscriptor(self, "USART{}EN")
-
-class SA_RCC_APB1ENR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "APB1ENR2", "APB1 peripheral clock enable register 2")
-        self.LPUART1EN = BitField(self, 0x00000001, "LPUART1EN", "Low power UART 1 clock enable. Set and cleared by software.")
-        self.I2C4EN = BitField(self, 0x00000002, "I2C4EN", "I2C4 clock enable . Set and cleared by software")
-        self.UCPD1EN = BitField(self, 0x00000100, "UCPD1EN", "UCPD1 clock enable. Set and cleared by software.")
-
-class SA_RCC_APB2ENR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "APB2ENR", "APB2 peripheral clock enable register")
-        self.SYSCFGEN = BitField(self, 0x00000001, "SYSCFGEN", "SYSCFG + COMP + VREFBUF + OPAMP clock enable. Set and cleared by software.")
-        self.TIM1EN = BitField(self, 0x00000800, "TIM1EN", "TIM1 timer clock enable. Set and cleared by software.")
-        self.SPI1EN = BitField(self, 0x00001000, "SPI1EN", "SPI1 clock enable. Set and cleared by software.")
-        self.TIM8EN = BitField(self, 0x00002000, "TIM8EN", "TIM8 timer clock enable. Set and cleared by software.")
-        self.USART1EN = BitField(self, 0x00004000, "USART1EN", "USART1clock enable. Set and cleared by software.")
-        self.SPI4EN = BitField(self, 0x00008000, "SPI4EN", "SPI4 clock enable. Set and cleared by software.")
-        self.TIM15EN = BitField(self, 0x00010000, "TIM15EN", "TIM15 timer clock enable. Set and cleared by software.")
-        self.TIM16EN = BitField(self, 0x00020000, "TIM16EN", "TIM16 timer clock enable. Set and cleared by software.")
-        self.TIM17EN = BitField(self, 0x00040000, "TIM17EN", "TIM17 timer clock enable. Set and cleared by software.")
-        self.TIM20EN = BitField(self, 0x00100000, "TIM20EN", "TIM20 timer clock enable. Set and cleared by software.")
-        self.SAI1EN = BitField(self, 0x00200000, "SAI1EN", "SAI1 clock enable. Set and cleared by software.")
-        self.HRTIM1EN = BitField(self, 0x04000000, "HRTIM1EN", "HRTIM1 clock enable. Set and cleared by software.")
-        self.TIMEN = Subscriptor(self, "TIM{}EN")
-
-class SA_RCC_AHB1SMENR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x130F, "AHB1SMENR", "AHB1 peripheral clocks enable in Sleep and Stop modes register")
-        self.DMA1SMEN = BitField(self, 0x00000001, "DMA1SMEN", "DMA1 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.DMA2SMEN = BitField(self, 0x00000002, "DMA2SMEN", "DMA2 clocks enable during Sleep and Stop modes. Set and cleared by software during Sleep mode.")
-        self.DMAMUX1SMEN = BitField(self, 0x00000004, "DMAMUX1SMEN", "DMAMUX1 clock enable during Sleep and Stop modes.. Set and cleared by software.")
-        self.CORDICSMEN = BitField(self, 0x00000008, "CORDICSMEN", "CORDICSM clock enable.. Set and cleared by software.")
-        self.FMACSMEN = BitField(self, 0x00000010, "FMACSMEN", "FMACSM clock enable.. Set and cleared by software.")
-        self.FLASHSMEN = BitField(self, 0x00000100, "FLASHSMEN", "Flash memory interface clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.SRAM1SMEN = BitField(self, 0x00000200, "SRAM1SMEN", "SRAM1 interface clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.CRCSMEN = BitField(self, 0x00001000, "CRCSMEN", "CRC clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.DMASMEN = Subscriptor(self, "DMA{}SMEN")
-
-class SA_RCC_AHB2SMENR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x50F667F, "AHB2SMENR", "AHB2 peripheral clocks enable in Sleep and Stop modes register")
-        self.GPIOASMEN = BitField(self, 0x00000001, "GPIOASMEN", "IO port A clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.GPIOBSMEN = BitField(self, 0x00000002, "GPIOBSMEN", "IO port B clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.GPIOCSMEN = BitField(self, 0x00000004, "GPIOCSMEN", "IO port C clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.GPIODSMEN = BitField(self, 0x00000008, "GPIODSMEN", "IO port D clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.GPIOESMEN = BitField(self, 0x00000010, "GPIOESMEN", "IO port E clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.GPIOFSMEN = BitField(self, 0x00000020, "GPIOFSMEN", "IO port F clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.GPIOGSMEN = BitField(self, 0x00000040, "GPIOGSMEN", "IO port G clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.CCMSRAMSMEN = BitField(self, 0x00000200, "CCMSRAMSMEN", "CCM SRAM interface clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.SRAM2SMEN = BitField(self, 0x00000400, "SRAM2SMEN", "SRAM2 interface clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.ADC12SMEN = BitField(self, 0x00002000, "ADC12SMEN", "ADC12 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.ADC345SMEN = BitField(self, 0x00004000, "ADC345SMEN", "ADC345 clock enable. Set and cleared by software.")
-        self.DAC1SMEN = BitField(self, 0x00010000, "DAC1SMEN", "DAC1 clock enable. Set and cleared by software.")
-        self.DAC2SMEN = BitField(self, 0x00020000, "DAC2SMEN", "DAC2 clock enable. Set and cleared by software.")
-        self.DAC3SMEN = BitField(self, 0x00040000, "DAC3SMEN", "DAC3 clock enable. Set and cleared by software.")
-        self.DAC4SMEN = BitField(self, 0x00080000, "DAC4SMEN", "DAC4 clock enable. Set and cleared by software.")
-        self.AESSMEN = BitField(self, 0x01000000, "AESSMEN", "AESM clocks enable. Set and cleared by software.")
-        self.RNGEN = BitField(self, 0x04000000, "RNGEN", "RNG enable. Set and cleared by software.")
-        self.DACSMEN = Subscriptor(self, "DAC{}SMEN")
-
-class SA_RCC_AHB3SMENR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x101, "AHB3SMENR", "AHB3 peripheral clocks enable in Sleep and Stop modes register")
-        self.FMCSMEN = BitField(self, 0x00000001, "FMCSMEN", "Flexible static memory controller clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.QSPISMEN = BitField(self, 0x00000100, "QSPISMEN", "QUADSPI memory interface clock enable during Sleep and Stop modes. Set and cleared by software.")
-
-class SA_RCC_APB1SMENR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xD2FECD3F, "APB1SMENR1", "APB1 peripheral clocks enable in Sleep and Stop modes register 1")
-        self.TIM2SMEN = BitField(self, 0x00000001, "TIM2SMEN", "TIM2 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIM3SMEN = BitField(self, 0x00000002, "TIM3SMEN", "TIM3 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIM4SMEN = BitField(self, 0x00000004, "TIM4SMEN", "TIM4 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIM5SMEN = BitField(self, 0x00000008, "TIM5SMEN", "TIM5 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIM6SMEN = BitField(self, 0x00000010, "TIM6SMEN", "TIM6 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIM7SMEN = BitField(self, 0x00000020, "TIM7SMEN", "TIM7 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.CRSSMEN = BitField(self, 0x00000100, "CRSSMEN", "CRS timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.RTCAPBSMEN = BitField(self, 0x00000400, "RTCAPBSMEN", "RTC APB clock enable during Sleep and Stop modes. Set and cleared by software")
-        self.WWDGSMEN = BitField(self, 0x00000800, "WWDGSMEN", "Window watchdog clocks enable during Sleep and Stop modes. Set and cleared by software. This bit is forced to 1 by hardware when the hardware WWDG option is activated.")
-        self.SPI2SMEN = BitField(self, 0x00004000, "SPI2SMEN", "SPI2 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.SPI3SMEN = BitField(self, 0x00008000, "SPI3SMEN", "SPI3 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.USART2SMEN = BitField(self, 0x00020000, "USART2SMEN", "USART2 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.USART3SMEN = BitField(self, 0x00040000, "USART3SMEN", "USART3 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.UART4SMEN = BitField(self, 0x00080000, "UART4SMEN", "UART4 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.UART5SMEN = BitField(self, 0x00100000, "UART5SMEN", "UART5 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.I2C1SMEN = BitField(self, 0x00200000, "I2C1SMEN", "I2C1 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.I2C2SMEN = BitField(self, 0x00400000, "I2C2SMEN", "I2C2 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.USBSMEN = BitField(self, 0x00800000, "USBSMEN", "USB device clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.FDCANSMEN = BitField(self, 0x02000000, "FDCANSMEN", "FDCAN clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.PWRSMEN = BitField(self, 0x10000000, "PWRSMEN", "Power interface clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.I2C3SMEN = BitField(self, 0x40000000, "I2C3SMEN", "I2C3 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.LPTIM1SMEN = BitField(self, 0x80000000, "LPTIM1SMEN", "Low power timer 1 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.I2CSMEN = Subscriptor(self, "I2C{}SMEN")
-        self.TIMSMEN = Subscriptor(self, "TIM{}SMEN")
-        self.UARTSMEN = Subscriptor(self, "UART{}SMEN")
-        self.SPISMEN = Subscriptor(self, "SPI{}SMEN")
-        self.USARTSMEN = Subscriptor(self, "USART{}SMEN")
-
-class SA_RCC_APB1SMENR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x103, "APB1SMENR2", "APB1 peripheral clocks enable in Sleep and Stop modes register 2")
-        self.LPUART1SMEN = BitField(self, 0x00000001, "LPUART1SMEN", "Low power UART 1 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.I2C4SMEN = BitField(self, 0x00000002, "I2C4SMEN", "I2C4 clocks enable during Sleep and Stop modes . Set and cleared by software")
-        self.UCPD1SMEN = BitField(self, 0x00000100, "UCPD1SMEN", "UCPD1 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-
-class SA_RCC_APB2SMENR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x437F801, "APB2SMENR", "APB2 peripheral clocks enable in Sleep and Stop modes register")
-        self.SYSCFGSMEN = BitField(self, 0x00000001, "SYSCFGSMEN", "SYSCFG + COMP + VREFBUF + OPAMP clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIM1SMEN = BitField(self, 0x00000800, "TIM1SMEN", "TIM1 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.SPI1SMEN = BitField(self, 0x00001000, "SPI1SMEN", "SPI1 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIM8SMEN = BitField(self, 0x00002000, "TIM8SMEN", "TIM8 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.USART1SMEN = BitField(self, 0x00004000, "USART1SMEN", "USART1clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.SPI4SMEN = BitField(self, 0x00008000, "SPI4SMEN", "SPI4 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIM15SMEN = BitField(self, 0x00010000, "TIM15SMEN", "TIM15 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIM16SMEN = BitField(self, 0x00020000, "TIM16SMEN", "TIM16 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIM17SMEN = BitField(self, 0x00040000, "TIM17SMEN", "TIM17 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIM20SMEN = BitField(self, 0x00100000, "TIM20SMEN", "TIM20 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.SAI1SMEN = BitField(self, 0x00200000, "SAI1SMEN", "SAI1 clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.HRTIM1SMEN = BitField(self, 0x04000000, "HRTIM1SMEN", "HRTIM1 timer clocks enable during Sleep and Stop modes. Set and cleared by software.")
-        self.TIMSMEN = Subscriptor(self, "TIM{}SMEN")
-
-class SA_RCC_CCIPR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCIPR", "Peripherals independent clock configuration register")
-        self.USART1SEL = BitField(self, 0x00000003, "USART1SEL", "USART1 clock source selection. This bit is set and cleared by software to select the USART1 clock source.")
-        self.USART2SEL = BitField(self, 0x0000000C, "USART2SEL", "USART2 clock source selection. This bit is set and cleared by software to select the USART2 clock source.")
-        self.USART3SEL = BitField(self, 0x00000030, "USART3SEL", "USART3 clock source selection. This bit is set and cleared by software to select the USART3 clock source.")
-        self.UART4SEL = BitField(self, 0x000000C0, "UART4SEL", "UART4 clock source selection. This bit is set and cleared by software to select the UART4 clock source.")
-        self.UART5SEL = BitField(self, 0x00000300, "UART5SEL", "UART5 clock source selection. These bits are set and cleared by software to select the UART5 clock source.")
-        self.LPUART1SEL = BitField(self, 0x00000C00, "LPUART1SEL", "LPUART1 clock source selection. These bits are set and cleared by software to select the LPUART1 clock source.")
-        self.I2C1SEL = BitField(self, 0x00003000, "I2C1SEL", "I2C1 clock source selection. These bits are set and cleared by software to select the I2C1 clock source.")
-        self.I2C2SEL = BitField(self, 0x0000C000, "I2C2SEL", "I2C2 clock source selection. These bits are set and cleared by software to select the I2C2 clock source.")
-        self.I2C3SEL = BitField(self, 0x00030000, "I2C3SEL", "I2C3 clock source selection. These bits are set and cleared by software to select the I2C3 clock source.")
-        self.LPTIM1SEL = BitField(self, 0x000C0000, "LPTIM1SEL", "Low power timer 1 clock source selection. These bits are set and cleared by software to select the LPTIM1 clock source.")
-        self.SAI1SEL = BitField(self, 0x00300000, "SAI1SEL", "clock source selection. These bits are set and cleared by software to select the SAI clock source.")
-        self.I2S23SEL = BitField(self, 0x00C00000, "I2S23SEL", "clock source selection. These bits are set and cleared by software to select the I2S23 clock source.")
-        self.FDCANSEL = BitField(self, 0x03000000, "FDCANSEL", "None")
-        self.CLK48SEL = BitField(self, 0x0C000000, "CLK48SEL", "48 MHz clock source selection. These bits are set and cleared by software to select the 48 MHz clock source used by USB device FS and RNG.")
-        self.ADC12SEL = BitField(self, 0x30000000, "ADC12SEL", "ADC1/2 clock source selection. These bits are set and cleared by software to select the clock source used by the ADC interface.")
-        self.ADC345SEL = BitField(self, 0xC0000000, "ADC345SEL", "ADC3/4/5 clock source selection. These bits are set and cleared by software to select the clock source used by the ADC345 interface.")
-        self.I2CSEL = Subscriptor(self, "I2C{}SEL")
-        self.USARTSEL = Subscriptor(self, "USART{}SEL")
-        self.UARTSEL = Subscriptor(self, "UART{}SEL")
-
-class SA_RCC_BDCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BDCR", "RTC domain control register")
-        self.LSEON = BitField(self, 0x00000001, "LSEON", "LSE oscillator enable. Set and cleared by software.")
-        self.LSERDY = BitField(self, 0x00000002, "LSERDY", "LSE oscillator ready. Set and cleared by hardware to indicate when the external 32 kHz oscillator is stable. After the LSEON bit is cleared, LSERDY goes low after 6 external low-speed oscillator clock cycles.")
-        self.LSEBYP = BitField(self, 0x00000004, "LSEBYP", "LSE oscillator bypass. Set and cleared by software to bypass oscillator in debug mode. This bit can be written only when the external 32 kHz oscillator is disabled (LSEON=0 and LSERDY=0).")
-        self.LSEDRV = BitField(self, 0x00000018, "LSEDRV", "LSE oscillator drive capability. Set by software to modulate the LSE oscillators drive capability. The oscillator is in Xtal mode when it is not in bypass mode.")
-        self.LSECSSON = BitField(self, 0x00000020, "LSECSSON", "CSS on LSE enable. Set by software to enable the Clock Security System on LSE (32 kHz oscillator). LSECSSON must be enabled after the LSE oscillator is enabled (LSEON bit enabled) and ready (LSERDY flag set by hardware), and after the RTCSEL bit is selected. Once enabled this bit cannot be disabled, except after a LSE failure detection (LSECSSD =1). In that case the software MUST disable the LSECSSON bit.")
-        self.LSECSSD = BitField(self, 0x00000040, "LSECSSD", "CSS on LSE failure Detection. Set by hardware to indicate when a failure has been detected by the Clock Security System on the external 32 kHz oscillator (LSE).")
-        self.RTCSEL = BitField(self, 0x00000300, "RTCSEL", "RTC clock source selection. Set by software to select the clock source for the RTC. Once the RTC clock source has been selected, it cannot be changed anymore unless the RTC domain is reset, or unless a failure is detected on LSE (LSECSSD is set). The BDRST bit can be used to reset them.")
-        self.RTCEN = BitField(self, 0x00008000, "RTCEN", "RTC clock enable. Set and cleared by software.")
-        self.BDRST = BitField(self, 0x00010000, "BDRST", "RTC domain software reset. Set and cleared by software.")
-        self.LSCOEN = BitField(self, 0x01000000, "LSCOEN", "Low speed clock output enable. Set and cleared by software.")
-        self.LSCOSEL = BitField(self, 0x02000000, "LSCOSEL", "Low speed clock output selection. Set and cleared by software.")
-
-class SA_RCC_CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xC000000, "CSR", "Control/status register")
-        self.LSION = BitField(self, 0x00000001, "LSION", "LSI oscillator enable. Set and cleared by software.")
-        self.LSIRDY = BitField(self, 0x00000002, "LSIRDY", "LSI oscillator ready. Set and cleared by hardware to indicate when the LSI oscillator is stable. After the LSION bit is cleared, LSIRDY goes low after 3 LSI oscillator clock cycles. This bit can be set even if LSION = 0 if the LSI is requested by the Clock Security System on LSE, by the Independent Watchdog or by the RTC.")
-        self.RMVF = BitField(self, 0x00800000, "RMVF", "Remove reset flag. Set by software to clear the reset flags.")
-        self.OBLRSTF = BitField(self, 0x02000000, "OBLRSTF", "Option byte loader reset flag. Set by hardware when a reset from the Option Byte loading occurs. Cleared by writing to the RMVF bit.")
-        self.PINRSTF = BitField(self, 0x04000000, "PINRSTF", "Pin reset flag. Set by hardware when a reset from the NRST pin occurs. Cleared by writing to the RMVF bit.")
-        self.BORRSTF = BitField(self, 0x08000000, "BORRSTF", "BOR flag. Set by hardware when a BOR occurs. Cleared by writing to the RMVF bit.")
-        self.SFTRSTF = BitField(self, 0x10000000, "SFTRSTF", "Software reset flag. Set by hardware when a software reset occurs. Cleared by writing to the RMVF bit.")
-        self.IWDGRSTF = BitField(self, 0x20000000, "IWDGRSTF", "Independent window watchdog reset flag. Set by hardware when an independent watchdog reset domain occurs. Cleared by writing to the RMVF bit.")
-        self.WWDGRSTF = BitField(self, 0x40000000, "WWDGRSTF", "Window watchdog reset flag. Set by hardware when a window watchdog reset occurs. Cleared by writing to the RMVF bit.")
-        self.LPWRRSTF = BitField(self, 0x80000000, "LPWRRSTF", "Low-power reset flag. Set by hardware when a reset occurs due to illegal Stop, Standby or Shutdown mode entry. Cleared by writing to the RMVF bit.")
-
-class SA_RCC_CRRCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CRRCR", "Clock recovery RC register")
-        self.HSI48ON = BitField(self, 0x00000001, "HSI48ON", "HSI48 clock enable. Set and cleared by software. Cleared by hardware to stop the HSI48 when entering in Stop, Standby or Shutdown modes.")
-        self.HSI48RDY = BitField(self, 0x00000002, "HSI48RDY", "HSI48 clock ready flag. Set by hardware to indicate that HSI48 oscillator is stable. This bit is set only when HSI48 is enabled by software by setting HSI48ON.")
-        self.HSI48CAL = BitField(self, 0x0000FF80, "HSI48CAL", "HSI48 clock calibration. These bits are initialized at startup with the factory-programmed HSI48 calibration trim value. They are ready only.")
-
-class SA_RCC_CCIPR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCIPR2", "Peripherals independent clock configuration register")
-        self.I2C4SEL = BitField(self, 0x00000003, "I2C4SEL", "I2C4 clock source selection. These bits are set and cleared by software to select the I2C4 clock source.")
-        self.QSPISEL = BitField(self, 0x00300000, "QSPISEL", "QUADSPI clock source selection. Set and reset by software.")
-
-class SA_RCC(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Reset and clock control")
-        self.CR = SA_RCC_CR(self, 0x0)
-        self.ICSCR = SA_RCC_ICSCR(self, 0x4)
-        self.CFGR = SA_RCC_CFGR(self, 0x8)
-        self.PLLCFGR = SA_RCC_PLLCFGR(self, 0xC)
-        self.CIER = SA_RCC_CIER(self, 0x18)
-        self.CIFR = SA_RCC_CIFR(self, 0x1C)
-        self.CICR = SA_RCC_CICR(self, 0x20)
-        self.AHB1RSTR = SA_RCC_AHB1RSTR(self, 0x28)
-        self.AHB2RSTR = SA_RCC_AHB2RSTR(self, 0x2C)
-        self.AHB3RSTR = SA_RCC_AHB3RSTR(self, 0x30)
-        self.APB1RSTR1 = SA_RCC_APB1RSTR1(self, 0x38)
-        self.APB1RSTR2 = SA_RCC_APB1RSTR2(self, 0x3C)
-        self.APB2RSTR = SA_RCC_APB2RSTR(self, 0x40)
-        self.AHB1ENR = SA_RCC_AHB1ENR(self, 0x48)
-        self.AHB2ENR = SA_RCC_AHB2ENR(self, 0x4C)
-        self.AHB3ENR = SA_RCC_AHB3ENR(self, 0x50)
-        self.APB1ENR1 = SA_RCC_APB1ENR1(self, 0x58)
-        self.APB1ENR2 = SA_RCC_APB1ENR2(self, 0x5C)
-        self.APB2ENR = SA_RCC_APB2ENR(self, 0x60)
-        self.AHB1SMENR = SA_RCC_AHB1SMENR(self, 0x68)
-        self.AHB2SMENR = SA_RCC_AHB2SMENR(self, 0x6C)
-        self.AHB3SMENR = SA_RCC_AHB3SMENR(self, 0x70)
-        self.APB1SMENR1 = SA_RCC_APB1SMENR1(self, 0x78)
-        self.APB1SMENR2 = SA_RCC_APB1SMENR2(self, 0x7C)
-        self.APB2SMENR = SA_RCC_APB2SMENR(self, 0x80)
-        self.CCIPR = SA_RCC_CCIPR(self, 0x88)
-        self.BDCR = SA_RCC_BDCR(self, 0x90)
-        self.CSR = SA_RCC_CSR(self, 0x94)
-        self.CRRCR = SA_RCC_CRRCR(self, 0x98)
-        self.CCIPR2 = SA_RCC_CCIPR2(self, 0x9C)
-        self.AHBRSTR = Subscriptor(self, "AHB{}RSTR")
-        self.APB1RSTR = Subscriptor(self, "APB1RSTR{}")
-        self.APB1ENR = Subscriptor(self, "APB1ENR{}")
-        self.AHBENR = Subscriptor(self, "AHB{}ENR")
-        self.APB1SMENR = Subscriptor(self, "APB1SMENR{}")
-        self.AHBSMENR = Subscriptor(self, "AHB{}SMENR")
-
-RCC = SA_RCC(0x40021000, "RCC")
-
-class SA_PWR_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x200, "CR1", "Power control register 1")
-        self.LPMS = BitField(self, 0x00000007, "LPMS", "Low-power mode selection. These bits select the low-power mode entered when CPU enters the deepsleep mode. 1xx: Shutdown mode Note: In Standby mode, SRAM2 can be preserved or not, depending on RRS bit configuration in PWR_CR3.")
-        self.FPD_STOP = BitField(self, 0x00000008, "FPD_STOP", "FPD_STOP")
-        self.DBP = BitField(self, 0x00000100, "DBP", "Disable backup domain write protection. In reset state, the RTC and backup registers are protected against parasitic write access. This bit must be set to enable write access to these registers.")
-        self.VOS = BitField(self, 0x00000600, "VOS", "Voltage scaling range selection")
-        self.LPR = BitField(self, 0x00004000, "LPR", "Low-power run. When this bit is set, the regulator is switched from main mode (MR) to low-power mode (LPR).")
-
-class SA_PWR_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR2", "Power control register 2")
-        self.PVDE = BitField(self, 0x00000001, "PVDE", "Programmable voltage detector enable. Note: This bit is write-protected when the PVDL bit is set in the SYSCFG_CFGR2 register. The protection can be reset only by a system reset.")
-        self.PVDLS = BitField(self, 0x0000000E, "PVDLS", "Programmable voltage detector level selection.. These bits select the PVD falling threshold: Note: These bits are write-protected when the PVDL bit is set in the SYSCFG_CFGR2 register. The protection can be reset only by a system reset.")
-        self.PVMEN1 = BitField(self, 0x00000040, "PVMEN1", "Peripheral voltage monitoring 3 enable: V<sub>DDA</sub> vs. ADC/COMP min voltage 1.62V")
-        self.PVMEN2 = BitField(self, 0x00000080, "PVMEN2", "Peripheral voltage monitoring 4 enable: V<sub>DDA</sub> vs. DAC 1MSPS /DAC 15MSPS min voltage.")
-        self.PVMEN = Subscriptor(self, "PVMEN{}")
-
-class SA_PWR_CR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x8000, "CR3", "Power control register 3")
-        self.EWUP1 = BitField(self, 0x00000001, "EWUP1", "Enable Wakeup pin WKUP1. When this bit is set, the external wakeup pin WKUP1 is enabled and triggers a wakeup from Standby or Shutdown event when a rising or a falling edge occurs. The active edge is configured via the WP1 bit in the PWR_CR4 register.")
-        self.EWUP2 = BitField(self, 0x00000002, "EWUP2", "Enable Wakeup pin WKUP2. When this bit is set, the external wakeup pin WKUP2 is enabled and triggers a wakeup from Standby or Shutdown event when a rising or a falling edge occurs. The active edge is configured via the WP2 bit in the PWR_CR4 register.")
-        self.EWUP3 = BitField(self, 0x00000004, "EWUP3", "Enable Wakeup pin WKUP3. When this bit is set, the external wakeup pin WKUP3 is enabled and triggers a wakeup from Standby or Shutdown event when a rising or a falling edge occurs. The active edge is configured via the WP3 bit in the PWR_CR4 register.")
-        self.EWUP4 = BitField(self, 0x00000008, "EWUP4", "Enable Wakeup pin WKUP4. When this bit is set, the external wakeup pin WKUP4 is enabled and triggers a wakeup from Standby or Shutdown event when a rising or a falling edge occurs. The active edge is configured via the WP4 bit in the PWR_CR4 register.")
-        self.EWUP5 = BitField(self, 0x00000010, "EWUP5", "Enable Wakeup pin WKUP5. When this bit is set, the external wakeup pin WKUP5 is enabled and triggers a wakeup from Standby or Shutdown event when a rising or a falling edge occurs.The active edge is configured via the WP5 bit in the PWR_CR4 register.")
-        self.RRS = BitField(self, 0x00000100, "RRS", "SRAM2 retention in Standby mode")
-        self.APC = BitField(self, 0x00000400, "APC", "Apply pull-up and pull-down configuration. When this bit is set, the I/O pull-up and pull-down configurations defined in the PWR_PUCRx and PWR_PDCRx registers are applied. When this bit is cleared, the PWR_PUCRx and PWR_PDCRx registers are not applied to the I/Os.")
-        self.UCPD1_STDBY = BitField(self, 0x00002000, "UCPD1_STDBY", "UCPD1_STDBY USB Type-C and Power Delivery standby mode.")
-        self.UCPD1_DBDIS = BitField(self, 0x00004000, "UCPD1_DBDIS", "USB Type-C and Power Delivery Dead Battery disable.. After exiting reset, the USB Type-C dead battery behavior is enabled, which may have a pull-down effect on CC1 and CC2 pins. It is recommended to disable it in all cases, either to stop this pull-down or to hand over control to the UCPD1 (which should therefore be initialized before doing the disable).")
-        self.EIWUL = BitField(self, 0x00008000, "EIWUL", "Enable internal wakeup line")
-        self.EWUP = Subscriptor(self, "EWUP{}")
-
-class SA_PWR_CR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR4", "Power control register 4")
-        self.WP1 = BitField(self, 0x00000001, "WP1", "Wakeup pin WKUP1 polarity. This bit defines the polarity used for an event detection on external wake-up pin, WKUP1")
-        self.WP2 = BitField(self, 0x00000002, "WP2", "Wakeup pin WKUP2 polarity. This bit defines the polarity used for an event detection on external wake-up pin, WKUP2")
-        self.WP3 = BitField(self, 0x00000004, "WP3", "Wakeup pin WKUP3 polarity. This bit defines the polarity used for an event detection on external wake-up pin, WKUP3")
-        self.WP4 = BitField(self, 0x00000008, "WP4", "Wakeup pin WKUP4 polarity. This bit defines the polarity used for an event detection on external wake-up pin, WKUP4")
-        self.WP5 = BitField(self, 0x00000010, "WP5", "Wakeup pin WKUP5 polarity. This bit defines the polarity used for an event detection on external wake-up pin, WKUP5")
-        self.VBE = BitField(self, 0x00000100, "VBE", "V<sub>BAT</sub> battery charging enable")
-        self.VBRS = BitField(self, 0x00000200, "VBRS", "V<sub>BAT</sub> battery charging resistor selection")
-        self.WP = Subscriptor(self, "WP{}")
-
-class SA_PWR_SR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR1", "Power status register 1")
-        self.WUF1 = BitField(self, 0x00000001, "WUF1", "Wakeup flag 1. This bit is set when a wakeup event is detected on wakeup pin, WKUP1. It is cleared by writing 1 in the CWUF1 bit of the PWR_SCR register.")
-        self.WUF2 = BitField(self, 0x00000002, "WUF2", "Wakeup flag 2. This bit is set when a wakeup event is detected on wakeup pin, WKUP2. It is cleared by writing 1 in the CWUF2 bit of the PWR_SCR register.")
-        self.WUF3 = BitField(self, 0x00000004, "WUF3", "Wakeup flag 3. This bit is set when a wakeup event is detected on wakeup pin, WKUP3. It is cleared by writing 1 in the CWUF3 bit of the PWR_SCR register.")
-        self.WUF4 = BitField(self, 0x00000008, "WUF4", "Wakeup flag 4. This bit is set when a wakeup event is detected on wakeup pin,WKUP4. It is cleared by writing 1 in the CWUF4 bit of the PWR_SCR register.")
-        self.WUF5 = BitField(self, 0x00000010, "WUF5", "Wakeup flag 5. This bit is set when a wakeup event is detected on wakeup pin, WKUP5. It is cleared by writing 1 in the CWUF5 bit of the PWR_SCR register.")
-        self.SBF = BitField(self, 0x00000100, "SBF", "Standby flag. This bit is set by hardware when the device enters the Standby mode and is cleared by setting the CSBF bit in the PWR_SCR register, or by a power-on reset. It is not cleared by the system reset.")
-        self.WUFI = BitField(self, 0x00008000, "WUFI", "Wakeup flag internal. This bit is set when a wakeup is detected on the internal wakeup line. It is cleared when all internal wakeup sources are cleared.")
-        self.WUF = Subscriptor(self, "WUF{}")
-
-class SA_PWR_SR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR2", "Power status register 2")
-        self.REGLPS = BitField(self, 0x00000100, "REGLPS", "Low-power regulator started. This bit provides the information whether the low-power regulator is ready after a power-on reset or a Standby/Shutdown. If the Standby mode is entered while REGLPS bit is still cleared, the wakeup from Standby mode time may be increased.")
-        self.REGLPF = BitField(self, 0x00000200, "REGLPF", "Low-power regulator flag. This bit is set by hardware when the MCU is in Low-power run mode. When the MCU exits the Low-power run mode, this bit remains at 1 until the regulator is ready in main mode. A polling on this bit must be done before increasing the product frequency. This bit is cleared by hardware when the regulator is ready.")
-        self.VOSF = BitField(self, 0x00000400, "VOSF", "Voltage scaling flag. A delay is required for the internal regulator to be ready after the voltage scaling has been changed. VOSF indicates that the regulator reached the voltage level defined with VOS bits of the PWR_CR1 register.")
-        self.PVDO = BitField(self, 0x00000800, "PVDO", "Programmable voltage detector output")
-        self.PVMO1 = BitField(self, 0x00004000, "PVMO1", "Peripheral voltage monitoring output: V<sub>DDA</sub> vs. 1.62 V. Note: PVMO1 is cleared when PVM1 is disabled (PVME = 0). After enabling PVM1, the PVM1 output is valid after the PVM1 wakeup time.")
-        self.PVMO2 = BitField(self, 0x00008000, "PVMO2", "Peripheral voltage monitoring output: V<sub>DDA</sub> vs. 1.8 V. Note: PVMO2 is cleared when PVM2 is disabled (PVME = 0). After enabling PVM2, the PVM2 output is valid after the PVM2 wakeup time.")
-        self.PVMO = Subscriptor(self, "PVMO{}")
-
-class SA_PWR_SCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SCR", "Power status clear register")
-        self.CWUF1 = BitField(self, 0x00000001, "CWUF1", "Clear wakeup flag 1. Setting this bit clears the WUF1 flag in the PWR_SR1 register.")
-        self.CWUF2 = BitField(self, 0x00000002, "CWUF2", "Clear wakeup flag 2. Setting this bit clears the WUF2 flag in the PWR_SR1 register.")
-        self.CWUF3 = BitField(self, 0x00000004, "CWUF3", "Clear wakeup flag 3. Setting this bit clears the WUF3 flag in the PWR_SR1 register.")
-        self.CWUF4 = BitField(self, 0x00000008, "CWUF4", "Clear wakeup flag 4. Setting this bit clears the WUF4 flag in the PWR_SR1 register.")
-        self.CWUF5 = BitField(self, 0x00000010, "CWUF5", "Clear wakeup flag 5. Setting this bit clears the WUF5 flag in the PWR_SR1 register.")
-        self.CSBF = BitField(self, 0x00000100, "CSBF", "Clear standby flag. Setting this bit clears the SBF flag in the PWR_SR1 register.")
-        self.CWUF = Subscriptor(self, "CWUF{}")
-
-class SA_PWR_PUCRA(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PUCRA", "Power Port A pull-up control register")
-        self.PU0 = BitField(self, 0x00000001, "PU0", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU1 = BitField(self, 0x00000002, "PU1", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU2 = BitField(self, 0x00000004, "PU2", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU3 = BitField(self, 0x00000008, "PU3", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU4 = BitField(self, 0x00000010, "PU4", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU5 = BitField(self, 0x00000020, "PU5", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU6 = BitField(self, 0x00000040, "PU6", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU7 = BitField(self, 0x00000080, "PU7", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU8 = BitField(self, 0x00000100, "PU8", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU9 = BitField(self, 0x00000200, "PU9", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU10 = BitField(self, 0x00000400, "PU10", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU11 = BitField(self, 0x00000800, "PU11", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU12 = BitField(self, 0x00001000, "PU12", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU13 = BitField(self, 0x00002000, "PU13", "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU15 = BitField(self, 0x00008000, "PU15", "Port A pull-up bit 15. When set, this bit activates the pull-up on PA[15] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PD15 bit is also set.")
-        self.PU = Subscriptor(self, "PU{}")
-
-class SA_PWR_PDCRA(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PDCRA", "Power Port A pull-down control register")
-        self.PD0 = BitField(self, 0x00000001, "PD0", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD1 = BitField(self, 0x00000002, "PD1", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD2 = BitField(self, 0x00000004, "PD2", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD3 = BitField(self, 0x00000008, "PD3", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD4 = BitField(self, 0x00000010, "PD4", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD5 = BitField(self, 0x00000020, "PD5", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD6 = BitField(self, 0x00000040, "PD6", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD7 = BitField(self, 0x00000080, "PD7", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD8 = BitField(self, 0x00000100, "PD8", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD9 = BitField(self, 0x00000200, "PD9", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD10 = BitField(self, 0x00000400, "PD10", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD11 = BitField(self, 0x00000800, "PD11", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD12 = BitField(self, 0x00001000, "PD12", "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.")
-        self.PD14 = BitField(self, 0x00004000, "PD14", "Port A pull-down bit 14. When set, this bit activates the pull-down on PA[14] when APC bit is set in PWR_CR3 register.")
-        self.PD = Subscriptor(self, "PD{}")
-
-class SA_PWR_PUCRB(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PUCRB", "Power Port B pull-up control register")
-        self.PU0 = BitField(self, 0x00000001, "PU0", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU1 = BitField(self, 0x00000002, "PU1", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU2 = BitField(self, 0x00000004, "PU2", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU3 = BitField(self, 0x00000008, "PU3", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU4 = BitField(self, 0x00000010, "PU4", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU5 = BitField(self, 0x00000020, "PU5", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU6 = BitField(self, 0x00000040, "PU6", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU7 = BitField(self, 0x00000080, "PU7", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU8 = BitField(self, 0x00000100, "PU8", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU9 = BitField(self, 0x00000200, "PU9", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU10 = BitField(self, 0x00000400, "PU10", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU11 = BitField(self, 0x00000800, "PU11", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU12 = BitField(self, 0x00001000, "PU12", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU13 = BitField(self, 0x00002000, "PU13", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU14 = BitField(self, 0x00004000, "PU14", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU15 = BitField(self, 0x00008000, "PU15", "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU = Subscriptor(self, "PU{}")
-
-class SA_PWR_PDCRB(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PDCRB", "Power Port B pull-down control register")
-        self.PD0 = BitField(self, 0x00000001, "PD0", "Port B pull-down bit y (y=0..3). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD1 = BitField(self, 0x00000002, "PD1", "Port B pull-down bit y (y=0..3). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD2 = BitField(self, 0x00000004, "PD2", "Port B pull-down bit y (y=0..3). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD3 = BitField(self, 0x00000008, "PD3", "Port B pull-down bit y (y=0..3). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD5 = BitField(self, 0x00000020, "PD5", "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD6 = BitField(self, 0x00000040, "PD6", "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD7 = BitField(self, 0x00000080, "PD7", "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD8 = BitField(self, 0x00000100, "PD8", "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD9 = BitField(self, 0x00000200, "PD9", "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD10 = BitField(self, 0x00000400, "PD10", "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD11 = BitField(self, 0x00000800, "PD11", "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD12 = BitField(self, 0x00001000, "PD12", "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD13 = BitField(self, 0x00002000, "PD13", "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD14 = BitField(self, 0x00004000, "PD14", "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD15 = BitField(self, 0x00008000, "PD15", "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.")
-        self.PD = Subscriptor(self, "PD{}")
-
-class SA_PWR_PUCRC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PUCRC", "Power Port C pull-up control register")
-        self.PU0 = BitField(self, 0x00000001, "PU0", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU1 = BitField(self, 0x00000002, "PU1", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU2 = BitField(self, 0x00000004, "PU2", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU3 = BitField(self, 0x00000008, "PU3", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU4 = BitField(self, 0x00000010, "PU4", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU5 = BitField(self, 0x00000020, "PU5", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU6 = BitField(self, 0x00000040, "PU6", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU7 = BitField(self, 0x00000080, "PU7", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU8 = BitField(self, 0x00000100, "PU8", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU9 = BitField(self, 0x00000200, "PU9", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU10 = BitField(self, 0x00000400, "PU10", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU11 = BitField(self, 0x00000800, "PU11", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU12 = BitField(self, 0x00001000, "PU12", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU13 = BitField(self, 0x00002000, "PU13", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU14 = BitField(self, 0x00004000, "PU14", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU15 = BitField(self, 0x00008000, "PU15", "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU = Subscriptor(self, "PU{}")
-
-class SA_PWR_PDCRC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PDCRC", "Power Port C pull-down control register")
-        self.PD0 = BitField(self, 0x00000001, "PD0", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD1 = BitField(self, 0x00000002, "PD1", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD2 = BitField(self, 0x00000004, "PD2", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD3 = BitField(self, 0x00000008, "PD3", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD4 = BitField(self, 0x00000010, "PD4", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD5 = BitField(self, 0x00000020, "PD5", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD6 = BitField(self, 0x00000040, "PD6", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD7 = BitField(self, 0x00000080, "PD7", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD8 = BitField(self, 0x00000100, "PD8", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD9 = BitField(self, 0x00000200, "PD9", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD10 = BitField(self, 0x00000400, "PD10", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD11 = BitField(self, 0x00000800, "PD11", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD12 = BitField(self, 0x00001000, "PD12", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD13 = BitField(self, 0x00002000, "PD13", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD14 = BitField(self, 0x00004000, "PD14", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD15 = BitField(self, 0x00008000, "PD15", "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.")
-        self.PD = Subscriptor(self, "PD{}")
-
-class SA_PWR_PUCRD(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PUCRD", "Power Port D pull-up control register")
-        self.PU0 = BitField(self, 0x00000001, "PU0", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU1 = BitField(self, 0x00000002, "PU1", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU2 = BitField(self, 0x00000004, "PU2", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU3 = BitField(self, 0x00000008, "PU3", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU4 = BitField(self, 0x00000010, "PU4", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU5 = BitField(self, 0x00000020, "PU5", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU6 = BitField(self, 0x00000040, "PU6", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU7 = BitField(self, 0x00000080, "PU7", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU8 = BitField(self, 0x00000100, "PU8", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU9 = BitField(self, 0x00000200, "PU9", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU10 = BitField(self, 0x00000400, "PU10", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU11 = BitField(self, 0x00000800, "PU11", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU12 = BitField(self, 0x00001000, "PU12", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU13 = BitField(self, 0x00002000, "PU13", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU14 = BitField(self, 0x00004000, "PU14", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU15 = BitField(self, 0x00008000, "PU15", "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU = Subscriptor(self, "PU{}")
-
-class SA_PWR_PDCRD(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PDCRD", "Power Port D pull-down control register")
-        self.PD0 = BitField(self, 0x00000001, "PD0", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD1 = BitField(self, 0x00000002, "PD1", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD2 = BitField(self, 0x00000004, "PD2", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD3 = BitField(self, 0x00000008, "PD3", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD4 = BitField(self, 0x00000010, "PD4", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD5 = BitField(self, 0x00000020, "PD5", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD6 = BitField(self, 0x00000040, "PD6", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD7 = BitField(self, 0x00000080, "PD7", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD8 = BitField(self, 0x00000100, "PD8", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD9 = BitField(self, 0x00000200, "PD9", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD10 = BitField(self, 0x00000400, "PD10", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD11 = BitField(self, 0x00000800, "PD11", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD12 = BitField(self, 0x00001000, "PD12", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD13 = BitField(self, 0x00002000, "PD13", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD14 = BitField(self, 0x00004000, "PD14", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD15 = BitField(self, 0x00008000, "PD15", "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.")
-        self.PD = Subscriptor(self, "PD{}")
-
-class SA_PWR_PUCRE(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PUCRE", "Power Port E pull-up control register")
-        self.PU0 = BitField(self, 0x00000001, "PU0", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU1 = BitField(self, 0x00000002, "PU1", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU2 = BitField(self, 0x00000004, "PU2", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU3 = BitField(self, 0x00000008, "PU3", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU4 = BitField(self, 0x00000010, "PU4", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU5 = BitField(self, 0x00000020, "PU5", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU6 = BitField(self, 0x00000040, "PU6", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU7 = BitField(self, 0x00000080, "PU7", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU8 = BitField(self, 0x00000100, "PU8", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU9 = BitField(self, 0x00000200, "PU9", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU10 = BitField(self, 0x00000400, "PU10", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU11 = BitField(self, 0x00000800, "PU11", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU12 = BitField(self, 0x00001000, "PU12", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU13 = BitField(self, 0x00002000, "PU13", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU14 = BitField(self, 0x00004000, "PU14", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU15 = BitField(self, 0x00008000, "PU15", "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU = Subscriptor(self, "PU{}")
-
-class SA_PWR_PDCRE(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PDCRE", "Power Port E pull-down control register")
-        self.PD0 = BitField(self, 0x00000001, "PD0", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD1 = BitField(self, 0x00000002, "PD1", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD2 = BitField(self, 0x00000004, "PD2", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD3 = BitField(self, 0x00000008, "PD3", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD4 = BitField(self, 0x00000010, "PD4", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD5 = BitField(self, 0x00000020, "PD5", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD6 = BitField(self, 0x00000040, "PD6", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD7 = BitField(self, 0x00000080, "PD7", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD8 = BitField(self, 0x00000100, "PD8", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD9 = BitField(self, 0x00000200, "PD9", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD10 = BitField(self, 0x00000400, "PD10", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD11 = BitField(self, 0x00000800, "PD11", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD12 = BitField(self, 0x00001000, "PD12", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD13 = BitField(self, 0x00002000, "PD13", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD14 = BitField(self, 0x00004000, "PD14", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD15 = BitField(self, 0x00008000, "PD15", "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.")
-        self.PD = Subscriptor(self, "PD{}")
-
-class SA_PWR_PUCRF(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PUCRF", "Power Port F pull-up control register")
-        self.PU0 = BitField(self, 0x00000001, "PU0", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU1 = BitField(self, 0x00000002, "PU1", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU2 = BitField(self, 0x00000004, "PU2", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU3 = BitField(self, 0x00000008, "PU3", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU4 = BitField(self, 0x00000010, "PU4", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU5 = BitField(self, 0x00000020, "PU5", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU6 = BitField(self, 0x00000040, "PU6", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU7 = BitField(self, 0x00000080, "PU7", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU8 = BitField(self, 0x00000100, "PU8", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU9 = BitField(self, 0x00000200, "PU9", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU10 = BitField(self, 0x00000400, "PU10", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU11 = BitField(self, 0x00000800, "PU11", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU12 = BitField(self, 0x00001000, "PU12", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU13 = BitField(self, 0x00002000, "PU13", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU14 = BitField(self, 0x00004000, "PU14", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU15 = BitField(self, 0x00008000, "PU15", "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU = Subscriptor(self, "PU{}")
-
-class SA_PWR_PDCRF(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PDCRF", "Power Port F pull-down control register")
-        self.PD0 = BitField(self, 0x00000001, "PD0", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD1 = BitField(self, 0x00000002, "PD1", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD2 = BitField(self, 0x00000004, "PD2", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD3 = BitField(self, 0x00000008, "PD3", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD4 = BitField(self, 0x00000010, "PD4", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD5 = BitField(self, 0x00000020, "PD5", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD6 = BitField(self, 0x00000040, "PD6", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD7 = BitField(self, 0x00000080, "PD7", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD8 = BitField(self, 0x00000100, "PD8", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD9 = BitField(self, 0x00000200, "PD9", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD10 = BitField(self, 0x00000400, "PD10", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD11 = BitField(self, 0x00000800, "PD11", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD12 = BitField(self, 0x00001000, "PD12", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD13 = BitField(self, 0x00002000, "PD13", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD14 = BitField(self, 0x00004000, "PD14", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD15 = BitField(self, 0x00008000, "PD15", "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.")
-        self.PD = Subscriptor(self, "PD{}")
-
-class SA_PWR_PUCRG(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PUCRG", "Power Port G pull-up control register")
-        self.PU0 = BitField(self, 0x00000001, "PU0", "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU1 = BitField(self, 0x00000002, "PU1", "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU2 = BitField(self, 0x00000004, "PU2", "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU3 = BitField(self, 0x00000008, "PU3", "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU4 = BitField(self, 0x00000010, "PU4", "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU5 = BitField(self, 0x00000020, "PU5", "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU6 = BitField(self, 0x00000040, "PU6", "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU7 = BitField(self, 0x00000080, "PU7", "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU8 = BitField(self, 0x00000100, "PU8", "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU9 = BitField(self, 0x00000200, "PU9", "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU10 = BitField(self, 0x00000400, "PU10", "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.")
-        self.PU = Subscriptor(self, "PU{}")
-
-class SA_PWR_PDCRG(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PDCRG", "Power Port G pull-down control register")
-        self.PD0 = BitField(self, 0x00000001, "PD0", "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.")
-        self.PD1 = BitField(self, 0x00000002, "PD1", "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.")
-        self.PD2 = BitField(self, 0x00000004, "PD2", "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.")
-        self.PD3 = BitField(self, 0x00000008, "PD3", "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.")
-        self.PD4 = BitField(self, 0x00000010, "PD4", "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.")
-        self.PD5 = BitField(self, 0x00000020, "PD5", "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.")
-        self.PD6 = BitField(self, 0x00000040, "PD6", "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.")
-        self.PD7 = BitField(self, 0x00000080, "PD7", "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.")
-        self.PD8 = BitField(self, 0x00000100, "PD8", "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.")
-        self.PD9 = BitField(self, 0x00000200, "PD9", "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.")
-        self.PD10 = BitField(self, 0x00000400, "PD10", "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.")
-        self.PD = Subscriptor(self, "PD{}")
-
-class SA_PWR_CR5(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x100, "CR5", "Power control register")
-        self.R1MODE = BitField(self, 0x00000100, "R1MODE", "Main regular range 1 mode. This bit is only valid for the main regulator in range 1 and has no effect on range 2. It is recommended to reset this bit when the system frequency is greater than 150 MHz. Refer to")
-
-class SA_PWR(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Power control")
-        self.CR1 = SA_PWR_CR1(self, 0x0)
-        self.CR2 = SA_PWR_CR2(self, 0x4)
-        self.CR3 = SA_PWR_CR3(self, 0x8)
-        self.CR4 = SA_PWR_CR4(self, 0xC)
-        self.SR1 = SA_PWR_SR1(self, 0x10)
-        self.SR2 = SA_PWR_SR2(self, 0x14)
-        self.SCR = SA_PWR_SCR(self, 0x18)
-        self.PUCRA = SA_PWR_PUCRA(self, 0x20)
-        self.PDCRA = SA_PWR_PDCRA(self, 0x24)
-        self.PUCRB = SA_PWR_PUCRB(self, 0x28)
-        self.PDCRB = SA_PWR_PDCRB(self, 0x2C)
-        self.PUCRC = SA_PWR_PUCRC(self, 0x30)
-        self.PDCRC = SA_PWR_PDCRC(self, 0x34)
-        self.PUCRD = SA_PWR_PUCRD(self, 0x38)
-        self.PDCRD = SA_PWR_PDCRD(self, 0x3C)
-        self.PUCRE = SA_PWR_PUCRE(self, 0x40)
-        self.PDCRE = SA_PWR_PDCRE(self, 0x44)
-        self.PUCRF = SA_PWR_PUCRF(self, 0x48)
-        self.PDCRF = SA_PWR_PDCRF(self, 0x4C)
-        self.PUCRG = SA_PWR_PUCRG(self, 0x50)
-        self.PDCRG = SA_PWR_PDCRG(self, 0x54)
-        self.CR5 = SA_PWR_CR5(self, 0x80)
-        self.SR = Subscriptor(self, "SR{}")
-
-PWR = SA_PWR(0x40007000, "PWR")
-
-class SA_RNG_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR", "control register")
-        self.CED = BitField(self, 0x00000020, "CED", "Clock error detection")
-        self.IE = BitField(self, 0x00000008, "IE", "Interrupt enable")
-        self.RNGEN = BitField(self, 0x00000004, "RNGEN", "Random number generator enable")
-
-class SA_RNG_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "status register")
-        self.SEIS = BitField(self, 0x00000040, "SEIS", "Seed error interrupt status")
-        self.CEIS = BitField(self, 0x00000020, "CEIS", "Clock error interrupt status")
-        self.SECS = BitField(self, 0x00000004, "SECS", "Seed error current status")
-        self.CECS = BitField(self, 0x00000002, "CECS", "Clock error current status")
-        self.DRDY = BitField(self, 0x00000001, "DRDY", "Data ready")
-
-class SA_RNG_DR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DR", "data register")
-        self.RNDATA = BitField(self, 0xFFFFFFFF, "RNDATA", "Random data")
-
-class SA_RNG(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Random number generator")
-        self.CR = SA_RNG_CR(self, 0x0)
-        self.SR = SA_RNG_SR(self, 0x4)
-        self.DR = SA_RNG_DR(self, 0x8)
-
-RNG = SA_RNG(0x50060800, "RNG")
-
-class SA_AES_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR", "control register")
-        self.NPBLB = BitField(self, 0x00F00000, "NPBLB", "NPBLB")
-        self.KEYSIZE = BitField(self, 0x00040000, "KEYSIZE", "KEYSIZE")
-        self.GCMPH = BitField(self, 0x00006000, "GCMPH", "GCMPH")
-        self.DMAOUTEN = BitField(self, 0x00001000, "DMAOUTEN", "Enable DMA management of data output phase")
-        self.DMAINEN = BitField(self, 0x00000800, "DMAINEN", "Enable DMA management of data input phase")
-        self.ERRIE = BitField(self, 0x00000400, "ERRIE", "Error interrupt enable")
-        self.CCFIE = BitField(self, 0x00000200, "CCFIE", "CCF flag interrupt enable")
-        self.ERRC = BitField(self, 0x00000100, "ERRC", "Error clear")
-        self.CCFC = BitField(self, 0x00000080, "CCFC", "Computation Complete Flag Clear")
-        self.CHMOD = BitField(self, 0x00010060, "CHMOD", "AES chaining mode")
-        self.MODE = BitField(self, 0x00000018, "MODE", "AES operating mode")
-        self.DATATYPE = BitField(self, 0x00000006, "DATATYPE", "Data type selection (for data in and data out to/from the cryptographic block)")
-        self.EN = BitField(self, 0x00000001, "EN", "AES enable")
-
-class SA_AES_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "status register")
-        self.BUSY = BitField(self, 0x00000008, "BUSY", "BUSY")
-        self.WRERR = BitField(self, 0x00000004, "WRERR", "Write error flag")
-        self.RDERR = BitField(self, 0x00000002, "RDERR", "Read error flag")
-        self.CCF = BitField(self, 0x00000001, "CCF", "Computation complete flag")
-
-class SA_AES_DINR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DINR", "data input register")
-        self.AES_DINR = BitField(self, 0xFFFFFFFF, "AES_DINR", "Data Input Register")
-
-class SA_AES_DOUTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DOUTR", "data output register")
-        self.AES_DOUTR = BitField(self, 0xFFFFFFFF, "AES_DOUTR", "Data output register")
-
-class SA_AES_KEYR0(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "KEYR0", "key register 0")
-        self.AES_KEYR0 = BitField(self, 0xFFFFFFFF, "AES_KEYR0", "Data Output Register (LSB key [31:0])")
-
-class SA_AES_KEYR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "KEYR1", "key register 1")
-        self.AES_KEYR1 = BitField(self, 0xFFFFFFFF, "AES_KEYR1", "AES key register (key [63:32])")
-
-class SA_AES_KEYR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "KEYR2", "key register 2")
-        self.AES_KEYR2 = BitField(self, 0xFFFFFFFF, "AES_KEYR2", "AES key register (key [95:64])")
-
-class SA_AES_KEYR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "KEYR3", "key register 3")
-        self.AES_KEYR3 = BitField(self, 0xFFFFFFFF, "AES_KEYR3", "AES key register (MSB key [127:96])")
-
-class SA_AES_IVR0(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IVR0", "initialization vector register 0")
-        self.AES_IVR0 = BitField(self, 0xFFFFFFFF, "AES_IVR0", "initialization vector register (LSB IVR [31:0])")
-
-class SA_AES_IVR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IVR1", "initialization vector register 1")
-        self.AES_IVR1 = BitField(self, 0xFFFFFFFF, "AES_IVR1", "Initialization Vector Register (IVR [63:32])")
-
-class SA_AES_IVR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IVR2", "initialization vector register 2")
-        self.AES_IVR2 = BitField(self, 0xFFFFFFFF, "AES_IVR2", "Initialization Vector Register (IVR [95:64])")
-
-class SA_AES_IVR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IVR3", "initialization vector register 3")
-        self.AES_IVR3 = BitField(self, 0xFFFFFFFF, "AES_IVR3", "Initialization Vector Register (MSB IVR [127:96])")
-
-class SA_AES_KEYR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "KEYR4", "key register 4")
-        self.KEY = BitField(self, 0xFFFFFFFF, "KEY", "AES key")
-
-class SA_AES_KEYR5(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "KEYR5", "key register 5")
-        self.KEY = BitField(self, 0xFFFFFFFF, "KEY", "AES key")
-
-class SA_AES_KEYR6(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "KEYR6", "key register 6")
-        self.KEY = BitField(self, 0xFFFFFFFF, "KEY", "AES key")
-
-class SA_AES_KEYR7(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "KEYR7", "key register 7")
-        self.KEY = BitField(self, 0xFFFFFFFF, "KEY", "AES key")
-
-class SA_AES_SUSP0R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SUSP0R", "suspend registers")
-        self.SUSP = BitField(self, 0xFFFFFFFF, "SUSP", "AES suspend")
-
-class SA_AES_SUSP1R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SUSP1R", "suspend registers")
-        self.SUSP = BitField(self, 0xFFFFFFFF, "SUSP", "AES suspend")
-
-class SA_AES_SUSP2R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SUSP2R", "suspend registers")
-        self.SUSP = BitField(self, 0xFFFFFFFF, "SUSP", "AES suspend")
-
-class SA_AES_SUSP3R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SUSP3R", "suspend registers")
-        self.SUSP = BitField(self, 0xFFFFFFFF, "SUSP", "AES suspend")
-
-class SA_AES_SUSP4R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SUSP4R", "suspend registers")
-        self.SUSP = BitField(self, 0xFFFFFFFF, "SUSP", "AES suspend")
-
-class SA_AES_SUSP5R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SUSP5R", "suspend registers")
-        self.SUSP = BitField(self, 0xFFFFFFFF, "SUSP", "AES suspend")
-
-class SA_AES_SUSP6R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SUSP6R", "suspend registers")
-        self.SUSP = BitField(self, 0xFFFFFFFF, "SUSP", "AES suspend")
-
-class SA_AES_SUSP7R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SUSP7R", "suspend registers")
-        self.SUSP = BitField(self, 0xFFFFFFFF, "SUSP", "AES suspend")
-
-class SA_AES(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Advanced encryption standard hardware accelerator")
-        self.CR = SA_AES_CR(self, 0x0)
-        self.SR = SA_AES_SR(self, 0x4)
-        self.DINR = SA_AES_DINR(self, 0x8)
-        self.DOUTR = SA_AES_DOUTR(self, 0xC)
-        self.KEYR0 = SA_AES_KEYR0(self, 0x10)
-        self.KEYR1 = SA_AES_KEYR1(self, 0x14)
-        self.KEYR2 = SA_AES_KEYR2(self, 0x18)
-        self.KEYR3 = SA_AES_KEYR3(self, 0x1C)
-        self.IVR0 = SA_AES_IVR0(self, 0x20)
-        self.IVR1 = SA_AES_IVR1(self, 0x24)
-        self.IVR2 = SA_AES_IVR2(self, 0x28)
-        self.IVR3 = SA_AES_IVR3(self, 0x2C)
-        self.KEYR4 = SA_AES_KEYR4(self, 0x30)
-        self.KEYR5 = SA_AES_KEYR5(self, 0x34)
-        self.KEYR6 = SA_AES_KEYR6(self, 0x38)
-        self.KEYR7 = SA_AES_KEYR7(self, 0x3C)
-        self.SUSP0R = SA_AES_SUSP0R(self, 0x40)
-        self.SUSP1R = SA_AES_SUSP1R(self, 0x44)
-        self.SUSP2R = SA_AES_SUSP2R(self, 0x48)
-        self.SUSP3R = SA_AES_SUSP3R(self, 0x4C)
-        self.SUSP4R = SA_AES_SUSP4R(self, 0x50)
-        self.SUSP5R = SA_AES_SUSP5R(self, 0x54)
-        self.SUSP6R = SA_AES_SUSP6R(self, 0x58)
-        self.SUSP7R = SA_AES_SUSP7R(self, 0x5C)
-        self.IVR = Subscriptor(self, "IVR{}")
-        self.KEYR = Subscriptor(self, "KEYR{}")
-        self.SUSPR = Subscriptor(self, "SUSP{}R")
-
-AES = SA_AES(0x50060000, "AES")
-
-class SA_GPIOA_MODER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xABFFFFFF, "MODER", "GPIO port mode register")
-        self.MODER15 = BitField(self, 0xC0000000, "MODER15", "Port x configuration bits (y = 0..15)")
-        self.MODER14 = BitField(self, 0x30000000, "MODER14", "Port x configuration bits (y = 0..15)")
-        self.MODER13 = BitField(self, 0x0C000000, "MODER13", "Port x configuration bits (y = 0..15)")
-        self.MODER12 = BitField(self, 0x03000000, "MODER12", "Port x configuration bits (y = 0..15)")
-        self.MODER11 = BitField(self, 0x00C00000, "MODER11", "Port x configuration bits (y = 0..15)")
-        self.MODER10 = BitField(self, 0x00300000, "MODER10", "Port x configuration bits (y = 0..15)")
-        self.MODER9 = BitField(self, 0x000C0000, "MODER9", "Port x configuration bits (y = 0..15)")
-        self.MODER8 = BitField(self, 0x00030000, "MODER8", "Port x configuration bits (y = 0..15)")
-        self.MODER7 = BitField(self, 0x0000C000, "MODER7", "Port x configuration bits (y = 0..15)")
-        self.MODER6 = BitField(self, 0x00003000, "MODER6", "Port x configuration bits (y = 0..15)")
-        self.MODER5 = BitField(self, 0x00000C00, "MODER5", "Port x configuration bits (y = 0..15)")
-        self.MODER4 = BitField(self, 0x00000300, "MODER4", "Port x configuration bits (y = 0..15)")
-        self.MODER3 = BitField(self, 0x000000C0, "MODER3", "Port x configuration bits (y = 0..15)")
-        self.MODER2 = BitField(self, 0x00000030, "MODER2", "Port x configuration bits (y = 0..15)")
-        self.MODER1 = BitField(self, 0x0000000C, "MODER1", "Port x configuration bits (y = 0..15)")
-        self.MODER0 = BitField(self, 0x00000003, "MODER0", "Port x configuration bits (y = 0..15)")
-        self.MODER = Subscriptor(self, "MODER{}")
-
-class SA_GPIOA_OTYPER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OTYPER", "GPIO port output type register")
-        self.OT15 = BitField(self, 0x00008000, "OT15", "Port x configuration bits (y = 0..15)")
-        self.OT14 = BitField(self, 0x00004000, "OT14", "Port x configuration bits (y = 0..15)")
-        self.OT13 = BitField(self, 0x00002000, "OT13", "Port x configuration bits (y = 0..15)")
-        self.OT12 = BitField(self, 0x00001000, "OT12", "Port x configuration bits (y = 0..15)")
-        self.OT11 = BitField(self, 0x00000800, "OT11", "Port x configuration bits (y = 0..15)")
-        self.OT10 = BitField(self, 0x00000400, "OT10", "Port x configuration bits (y = 0..15)")
-        self.OT9 = BitField(self, 0x00000200, "OT9", "Port x configuration bits (y = 0..15)")
-        self.OT8 = BitField(self, 0x00000100, "OT8", "Port x configuration bits (y = 0..15)")
-        self.OT7 = BitField(self, 0x00000080, "OT7", "Port x configuration bits (y = 0..15)")
-        self.OT6 = BitField(self, 0x00000040, "OT6", "Port x configuration bits (y = 0..15)")
-        self.OT5 = BitField(self, 0x00000020, "OT5", "Port x configuration bits (y = 0..15)")
-        self.OT4 = BitField(self, 0x00000010, "OT4", "Port x configuration bits (y = 0..15)")
-        self.OT3 = BitField(self, 0x00000008, "OT3", "Port x configuration bits (y = 0..15)")
-        self.OT2 = BitField(self, 0x00000004, "OT2", "Port x configuration bits (y = 0..15)")
-        self.OT1 = BitField(self, 0x00000002, "OT1", "Port x configuration bits (y = 0..15)")
-        self.OT0 = BitField(self, 0x00000001, "OT0", "Port x configuration bits (y = 0..15)")
-        self.OT = Subscriptor(self, "OT{}")
-
-class SA_GPIOA_OSPEEDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xC000000, "OSPEEDR", "GPIO port output speed register")
-        self.OSPEEDR15 = BitField(self, 0xC0000000, "OSPEEDR15", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR14 = BitField(self, 0x30000000, "OSPEEDR14", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR13 = BitField(self, 0x0C000000, "OSPEEDR13", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR12 = BitField(self, 0x03000000, "OSPEEDR12", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR11 = BitField(self, 0x00C00000, "OSPEEDR11", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR10 = BitField(self, 0x00300000, "OSPEEDR10", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR9 = BitField(self, 0x000C0000, "OSPEEDR9", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR8 = BitField(self, 0x00030000, "OSPEEDR8", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR7 = BitField(self, 0x0000C000, "OSPEEDR7", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR6 = BitField(self, 0x00003000, "OSPEEDR6", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR5 = BitField(self, 0x00000C00, "OSPEEDR5", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR4 = BitField(self, 0x00000300, "OSPEEDR4", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR3 = BitField(self, 0x000000C0, "OSPEEDR3", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR2 = BitField(self, 0x00000030, "OSPEEDR2", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR1 = BitField(self, 0x0000000C, "OSPEEDR1", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR0 = BitField(self, 0x00000003, "OSPEEDR0", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR = Subscriptor(self, "OSPEEDR{}")
-
-class SA_GPIOA_PUPDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x64000000, "PUPDR", "GPIO port pull-up/pull-down register")
-        self.PUPDR15 = BitField(self, 0xC0000000, "PUPDR15", "Port x configuration bits (y = 0..15)")
-        self.PUPDR14 = BitField(self, 0x30000000, "PUPDR14", "Port x configuration bits (y = 0..15)")
-        self.PUPDR13 = BitField(self, 0x0C000000, "PUPDR13", "Port x configuration bits (y = 0..15)")
-        self.PUPDR12 = BitField(self, 0x03000000, "PUPDR12", "Port x configuration bits (y = 0..15)")
-        self.PUPDR11 = BitField(self, 0x00C00000, "PUPDR11", "Port x configuration bits (y = 0..15)")
-        self.PUPDR10 = BitField(self, 0x00300000, "PUPDR10", "Port x configuration bits (y = 0..15)")
-        self.PUPDR9 = BitField(self, 0x000C0000, "PUPDR9", "Port x configuration bits (y = 0..15)")
-        self.PUPDR8 = BitField(self, 0x00030000, "PUPDR8", "Port x configuration bits (y = 0..15)")
-        self.PUPDR7 = BitField(self, 0x0000C000, "PUPDR7", "Port x configuration bits (y = 0..15)")
-        self.PUPDR6 = BitField(self, 0x00003000, "PUPDR6", "Port x configuration bits (y = 0..15)")
-        self.PUPDR5 = BitField(self, 0x00000C00, "PUPDR5", "Port x configuration bits (y = 0..15)")
-        self.PUPDR4 = BitField(self, 0x00000300, "PUPDR4", "Port x configuration bits (y = 0..15)")
-        self.PUPDR3 = BitField(self, 0x000000C0, "PUPDR3", "Port x configuration bits (y = 0..15)")
-        self.PUPDR2 = BitField(self, 0x00000030, "PUPDR2", "Port x configuration bits (y = 0..15)")
-        self.PUPDR1 = BitField(self, 0x0000000C, "PUPDR1", "Port x configuration bits (y = 0..15)")
-        self.PUPDR0 = BitField(self, 0x00000003, "PUPDR0", "Port x configuration bits (y = 0..15)")
-        self.PUPDR = Subscriptor(self, "PUPDR{}")
-
-class SA_GPIOA_IDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IDR", "GPIO port input data register")
-        self.IDR15 = BitField(self, 0x00008000, "IDR15", "Port input data (y = 0..15)")
-        self.IDR14 = BitField(self, 0x00004000, "IDR14", "Port input data (y = 0..15)")
-        self.IDR13 = BitField(self, 0x00002000, "IDR13", "Port input data (y = 0..15)")
-        self.IDR12 = BitField(self, 0x00001000, "IDR12", "Port input data (y = 0..15)")
-        self.IDR11 = BitField(self, 0x00000800, "IDR11", "Port input data (y = 0..15)")
-        self.IDR10 = BitField(self, 0x00000400, "IDR10", "Port input data (y = 0..15)")
-        self.IDR9 = BitField(self, 0x00000200, "IDR9", "Port input data (y = 0..15)")
-        self.IDR8 = BitField(self, 0x00000100, "IDR8", "Port input data (y = 0..15)")
-        self.IDR7 = BitField(self, 0x00000080, "IDR7", "Port input data (y = 0..15)")
-        self.IDR6 = BitField(self, 0x00000040, "IDR6", "Port input data (y = 0..15)")
-        self.IDR5 = BitField(self, 0x00000020, "IDR5", "Port input data (y = 0..15)")
-        self.IDR4 = BitField(self, 0x00000010, "IDR4", "Port input data (y = 0..15)")
-        self.IDR3 = BitField(self, 0x00000008, "IDR3", "Port input data (y = 0..15)")
-        self.IDR2 = BitField(self, 0x00000004, "IDR2", "Port input data (y = 0..15)")
-        self.IDR1 = BitField(self, 0x00000002, "IDR1", "Port input data (y = 0..15)")
-        self.IDR0 = BitField(self, 0x00000001, "IDR0", "Port input data (y = 0..15)")
-        self.IDR = Subscriptor(self, "IDR{}")
-
-class SA_GPIOA_ODR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ODR", "GPIO port output data register")
-        self.ODR15 = BitField(self, 0x00008000, "ODR15", "Port output data (y = 0..15)")
-        self.ODR14 = BitField(self, 0x00004000, "ODR14", "Port output data (y = 0..15)")
-        self.ODR13 = BitField(self, 0x00002000, "ODR13", "Port output data (y = 0..15)")
-        self.ODR12 = BitField(self, 0x00001000, "ODR12", "Port output data (y = 0..15)")
-        self.ODR11 = BitField(self, 0x00000800, "ODR11", "Port output data (y = 0..15)")
-        self.ODR10 = BitField(self, 0x00000400, "ODR10", "Port output data (y = 0..15)")
-        self.ODR9 = BitField(self, 0x00000200, "ODR9", "Port output data (y = 0..15)")
-        self.ODR8 = BitField(self, 0x00000100, "ODR8", "Port output data (y = 0..15)")
-        self.ODR7 = BitField(self, 0x00000080, "ODR7", "Port output data (y = 0..15)")
-        self.ODR6 = BitField(self, 0x00000040, "ODR6", "Port output data (y = 0..15)")
-        self.ODR5 = BitField(self, 0x00000020, "ODR5", "Port output data (y = 0..15)")
-        self.ODR4 = BitField(self, 0x00000010, "ODR4", "Port output data (y = 0..15)")
-        self.ODR3 = BitField(self, 0x00000008, "ODR3", "Port output data (y = 0..15)")
-        self.ODR2 = BitField(self, 0x00000004, "ODR2", "Port output data (y = 0..15)")
-        self.ODR1 = BitField(self, 0x00000002, "ODR1", "Port output data (y = 0..15)")
-        self.ODR0 = BitField(self, 0x00000001, "ODR0", "Port output data (y = 0..15)")
-        self.ODR = Subscriptor(self, "ODR{}")
-
-class SA_GPIOA_BSRR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BSRR", "GPIO port bit set/reset register")
-        self.BR15 = BitField(self, 0x80000000, "BR15", "Port x reset bit y (y = 0..15)")
-        self.BR14 = BitField(self, 0x40000000, "BR14", "Port x reset bit y (y = 0..15)")
-        self.BR13 = BitField(self, 0x20000000, "BR13", "Port x reset bit y (y = 0..15)")
-        self.BR12 = BitField(self, 0x10000000, "BR12", "Port x reset bit y (y = 0..15)")
-        self.BR11 = BitField(self, 0x08000000, "BR11", "Port x reset bit y (y = 0..15)")
-        self.BR10 = BitField(self, 0x04000000, "BR10", "Port x reset bit y (y = 0..15)")
-        self.BR9 = BitField(self, 0x02000000, "BR9", "Port x reset bit y (y = 0..15)")
-        self.BR8 = BitField(self, 0x01000000, "BR8", "Port x reset bit y (y = 0..15)")
-        self.BR7 = BitField(self, 0x00800000, "BR7", "Port x reset bit y (y = 0..15)")
-        self.BR6 = BitField(self, 0x00400000, "BR6", "Port x reset bit y (y = 0..15)")
-        self.BR5 = BitField(self, 0x00200000, "BR5", "Port x reset bit y (y = 0..15)")
-        self.BR4 = BitField(self, 0x00100000, "BR4", "Port x reset bit y (y = 0..15)")
-        self.BR3 = BitField(self, 0x00080000, "BR3", "Port x reset bit y (y = 0..15)")
-        self.BR2 = BitField(self, 0x00040000, "BR2", "Port x reset bit y (y = 0..15)")
-        self.BR1 = BitField(self, 0x00020000, "BR1", "Port x reset bit y (y = 0..15)")
-        self.BR0 = BitField(self, 0x00010000, "BR0", "Port x set bit y (y= 0..15)")
-        self.BS15 = BitField(self, 0x00008000, "BS15", "Port x set bit y (y= 0..15)")
-        self.BS14 = BitField(self, 0x00004000, "BS14", "Port x set bit y (y= 0..15)")
-        self.BS13 = BitField(self, 0x00002000, "BS13", "Port x set bit y (y= 0..15)")
-        self.BS12 = BitField(self, 0x00001000, "BS12", "Port x set bit y (y= 0..15)")
-        self.BS11 = BitField(self, 0x00000800, "BS11", "Port x set bit y (y= 0..15)")
-        self.BS10 = BitField(self, 0x00000400, "BS10", "Port x set bit y (y= 0..15)")
-        self.BS9 = BitField(self, 0x00000200, "BS9", "Port x set bit y (y= 0..15)")
-        self.BS8 = BitField(self, 0x00000100, "BS8", "Port x set bit y (y= 0..15)")
-        self.BS7 = BitField(self, 0x00000080, "BS7", "Port x set bit y (y= 0..15)")
-        self.BS6 = BitField(self, 0x00000040, "BS6", "Port x set bit y (y= 0..15)")
-        self.BS5 = BitField(self, 0x00000020, "BS5", "Port x set bit y (y= 0..15)")
-        self.BS4 = BitField(self, 0x00000010, "BS4", "Port x set bit y (y= 0..15)")
-        self.BS3 = BitField(self, 0x00000008, "BS3", "Port x set bit y (y= 0..15)")
-        self.BS2 = BitField(self, 0x00000004, "BS2", "Port x set bit y (y= 0..15)")
-        self.BS1 = BitField(self, 0x00000002, "BS1", "Port x set bit y (y= 0..15)")
-        self.BS0 = BitField(self, 0x00000001, "BS0", "Port x set bit y (y= 0..15)")
-        self.BS = Subscriptor(self, "BS{}")
-        self.BR = Subscriptor(self, "BR{}")
-
-class SA_GPIOA_LCKR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "LCKR", "GPIO port configuration lock register")
-        self.LCKK = BitField(self, 0x00010000, "LCKK", "Port x lock bit y (y= 0..15)")
-        self.LCK15 = BitField(self, 0x00008000, "LCK15", "Port x lock bit y (y= 0..15)")
-        self.LCK14 = BitField(self, 0x00004000, "LCK14", "Port x lock bit y (y= 0..15)")
-        self.LCK13 = BitField(self, 0x00002000, "LCK13", "Port x lock bit y (y= 0..15)")
-        self.LCK12 = BitField(self, 0x00001000, "LCK12", "Port x lock bit y (y= 0..15)")
-        self.LCK11 = BitField(self, 0x00000800, "LCK11", "Port x lock bit y (y= 0..15)")
-        self.LCK10 = BitField(self, 0x00000400, "LCK10", "Port x lock bit y (y= 0..15)")
-        self.LCK9 = BitField(self, 0x00000200, "LCK9", "Port x lock bit y (y= 0..15)")
-        self.LCK8 = BitField(self, 0x00000100, "LCK8", "Port x lock bit y (y= 0..15)")
-        self.LCK7 = BitField(self, 0x00000080, "LCK7", "Port x lock bit y (y= 0..15)")
-        self.LCK6 = BitField(self, 0x00000040, "LCK6", "Port x lock bit y (y= 0..15)")
-        self.LCK5 = BitField(self, 0x00000020, "LCK5", "Port x lock bit y (y= 0..15)")
-        self.LCK4 = BitField(self, 0x00000010, "LCK4", "Port x lock bit y (y= 0..15)")
-        self.LCK3 = BitField(self, 0x00000008, "LCK3", "Port x lock bit y (y= 0..15)")
-        self.LCK2 = BitField(self, 0x00000004, "LCK2", "Port x lock bit y (y= 0..15)")
-        self.LCK1 = BitField(self, 0x00000002, "LCK1", "Port x lock bit y (y= 0..15)")
-        self.LCK0 = BitField(self, 0x00000001, "LCK0", "Port x lock bit y (y= 0..15)")
-        self.LCK = Subscriptor(self, "LCK{}")
-
-class SA_GPIOA_AFRL(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AFRL", "GPIO alternate function low register")
-        self.AFRL7 = BitField(self, 0xF0000000, "AFRL7", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL6 = BitField(self, 0x0F000000, "AFRL6", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL5 = BitField(self, 0x00F00000, "AFRL5", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL4 = BitField(self, 0x000F0000, "AFRL4", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL3 = BitField(self, 0x0000F000, "AFRL3", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL2 = BitField(self, 0x00000F00, "AFRL2", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL1 = BitField(self, 0x000000F0, "AFRL1", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL0 = BitField(self, 0x0000000F, "AFRL0", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL = Subscriptor(self, "AFRL{}")
-
-class SA_GPIOA_AFRH(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AFRH", "GPIO alternate function high register")
-        self.AFRH15 = BitField(self, 0xF0000000, "AFRH15", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH14 = BitField(self, 0x0F000000, "AFRH14", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH13 = BitField(self, 0x00F00000, "AFRH13", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH12 = BitField(self, 0x000F0000, "AFRH12", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH11 = BitField(self, 0x0000F000, "AFRH11", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH10 = BitField(self, 0x00000F00, "AFRH10", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH9 = BitField(self, 0x000000F0, "AFRH9", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH8 = BitField(self, 0x0000000F, "AFRH8", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH = Subscriptor(self, "AFRH{}")
-
-class SA_GPIOA_BRR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BRR", "GPIO port bit reset register")
-        self.BR0 = BitField(self, 0x00000001, "BR0", "Port Reset bit")
-        self.BR1 = BitField(self, 0x00000002, "BR1", "Port Reset bit")
-        self.BR2 = BitField(self, 0x00000004, "BR2", "Port Reset bit")
-        self.BR3 = BitField(self, 0x00000008, "BR3", "Port Reset bit")
-        self.BR4 = BitField(self, 0x00000010, "BR4", "Port Reset bit")
-        self.BR5 = BitField(self, 0x00000020, "BR5", "Port Reset bit")
-        self.BR6 = BitField(self, 0x00000040, "BR6", "Port Reset bit")
-        self.BR7 = BitField(self, 0x00000080, "BR7", "Port Reset bit")
-        self.BR8 = BitField(self, 0x00000100, "BR8", "Port Reset bit")
-        self.BR9 = BitField(self, 0x00000200, "BR9", "Port Reset bit")
-        self.BR10 = BitField(self, 0x00000400, "BR10", "Port Reset bit")
-        self.BR11 = BitField(self, 0x00000800, "BR11", "Port Reset bit")
-        self.BR12 = BitField(self, 0x00001000, "BR12", "Port Reset bit")
-        self.BR13 = BitField(self, 0x00002000, "BR13", "Port Reset bit")
-        self.BR14 = BitField(self, 0x00004000, "BR14", "Port Reset bit")
-        self.BR15 = BitField(self, 0x00008000, "BR15", "Port Reset bit")
-        self.BR = Subscriptor(self, "BR{}")
-
-class SA_GPIOA(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "General-purpose I/Os")
-        self.MODER = SA_GPIOA_MODER(self, 0x0)
-        self.OTYPER = SA_GPIOA_OTYPER(self, 0x4)
-        self.OSPEEDR = SA_GPIOA_OSPEEDR(self, 0x8)
-        self.PUPDR = SA_GPIOA_PUPDR(self, 0xC)
-        self.IDR = SA_GPIOA_IDR(self, 0x10)
-        self.ODR = SA_GPIOA_ODR(self, 0x14)
-        self.BSRR = SA_GPIOA_BSRR(self, 0x18)
-        self.LCKR = SA_GPIOA_LCKR(self, 0x1C)
-        self.AFRL = SA_GPIOA_AFRL(self, 0x20)
-        self.AFRH = SA_GPIOA_AFRH(self, 0x24)
-        self.BRR = SA_GPIOA_BRR(self, 0x28)
-
-GPIOA = SA_GPIOA(0x48000000, "GPIOA")
-
-class SA_GPIOB_MODER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFFFEBF, "MODER", "GPIO port mode register")
-        self.MODER15 = BitField(self, 0xC0000000, "MODER15", "Port x configuration bits (y = 0..15)")
-        self.MODER14 = BitField(self, 0x30000000, "MODER14", "Port x configuration bits (y = 0..15)")
-        self.MODER13 = BitField(self, 0x0C000000, "MODER13", "Port x configuration bits (y = 0..15)")
-        self.MODER12 = BitField(self, 0x03000000, "MODER12", "Port x configuration bits (y = 0..15)")
-        self.MODER11 = BitField(self, 0x00C00000, "MODER11", "Port x configuration bits (y = 0..15)")
-        self.MODER10 = BitField(self, 0x00300000, "MODER10", "Port x configuration bits (y = 0..15)")
-        self.MODER9 = BitField(self, 0x000C0000, "MODER9", "Port x configuration bits (y = 0..15)")
-        self.MODER8 = BitField(self, 0x00030000, "MODER8", "Port x configuration bits (y = 0..15)")
-        self.MODER7 = BitField(self, 0x0000C000, "MODER7", "Port x configuration bits (y = 0..15)")
-        self.MODER6 = BitField(self, 0x00003000, "MODER6", "Port x configuration bits (y = 0..15)")
-        self.MODER5 = BitField(self, 0x00000C00, "MODER5", "Port x configuration bits (y = 0..15)")
-        self.MODER4 = BitField(self, 0x00000300, "MODER4", "Port x configuration bits (y = 0..15)")
-        self.MODER3 = BitField(self, 0x000000C0, "MODER3", "Port x configuration bits (y = 0..15)")
-        self.MODER2 = BitField(self, 0x00000030, "MODER2", "Port x configuration bits (y = 0..15)")
-        self.MODER1 = BitField(self, 0x0000000C, "MODER1", "Port x configuration bits (y = 0..15)")
-        self.MODER0 = BitField(self, 0x00000003, "MODER0", "Port x configuration bits (y = 0..15)")
-        self.MODER = Subscriptor(self, "MODER{}")
-
-class SA_GPIOB_OTYPER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OTYPER", "GPIO port output type register")
-        self.OT15 = BitField(self, 0x00008000, "OT15", "Port x configuration bits (y = 0..15)")
-        self.OT14 = BitField(self, 0x00004000, "OT14", "Port x configuration bits (y = 0..15)")
-        self.OT13 = BitField(self, 0x00002000, "OT13", "Port x configuration bits (y = 0..15)")
-        self.OT12 = BitField(self, 0x00001000, "OT12", "Port x configuration bits (y = 0..15)")
-        self.OT11 = BitField(self, 0x00000800, "OT11", "Port x configuration bits (y = 0..15)")
-        self.OT10 = BitField(self, 0x00000400, "OT10", "Port x configuration bits (y = 0..15)")
-        self.OT9 = BitField(self, 0x00000200, "OT9", "Port x configuration bits (y = 0..15)")
-        self.OT8 = BitField(self, 0x00000100, "OT8", "Port x configuration bits (y = 0..15)")
-        self.OT7 = BitField(self, 0x00000080, "OT7", "Port x configuration bits (y = 0..15)")
-        self.OT6 = BitField(self, 0x00000040, "OT6", "Port x configuration bits (y = 0..15)")
-        self.OT5 = BitField(self, 0x00000020, "OT5", "Port x configuration bits (y = 0..15)")
-        self.OT4 = BitField(self, 0x00000010, "OT4", "Port x configuration bits (y = 0..15)")
-        self.OT3 = BitField(self, 0x00000008, "OT3", "Port x configuration bits (y = 0..15)")
-        self.OT2 = BitField(self, 0x00000004, "OT2", "Port x configuration bits (y = 0..15)")
-        self.OT1 = BitField(self, 0x00000002, "OT1", "Port x configuration bits (y = 0..15)")
-        self.OT0 = BitField(self, 0x00000001, "OT0", "Port x configuration bits (y = 0..15)")
-        self.OT = Subscriptor(self, "OT{}")
-
-class SA_GPIOB_OSPEEDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xC0, "OSPEEDR", "GPIO port output speed register")
-        self.OSPEEDR15 = BitField(self, 0xC0000000, "OSPEEDR15", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR14 = BitField(self, 0x30000000, "OSPEEDR14", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR13 = BitField(self, 0x0C000000, "OSPEEDR13", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR12 = BitField(self, 0x03000000, "OSPEEDR12", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR11 = BitField(self, 0x00C00000, "OSPEEDR11", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR10 = BitField(self, 0x00300000, "OSPEEDR10", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR9 = BitField(self, 0x000C0000, "OSPEEDR9", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR8 = BitField(self, 0x00030000, "OSPEEDR8", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR7 = BitField(self, 0x0000C000, "OSPEEDR7", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR6 = BitField(self, 0x00003000, "OSPEEDR6", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR5 = BitField(self, 0x00000C00, "OSPEEDR5", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR4 = BitField(self, 0x00000300, "OSPEEDR4", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR3 = BitField(self, 0x000000C0, "OSPEEDR3", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR2 = BitField(self, 0x00000030, "OSPEEDR2", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR1 = BitField(self, 0x0000000C, "OSPEEDR1", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR0 = BitField(self, 0x00000003, "OSPEEDR0", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR = Subscriptor(self, "OSPEEDR{}")
-
-class SA_GPIOB_PUPDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x100, "PUPDR", "GPIO port pull-up/pull-down register")
-        self.PUPDR15 = BitField(self, 0xC0000000, "PUPDR15", "Port x configuration bits (y = 0..15)")
-        self.PUPDR14 = BitField(self, 0x30000000, "PUPDR14", "Port x configuration bits (y = 0..15)")
-        self.PUPDR13 = BitField(self, 0x0C000000, "PUPDR13", "Port x configuration bits (y = 0..15)")
-        self.PUPDR12 = BitField(self, 0x03000000, "PUPDR12", "Port x configuration bits (y = 0..15)")
-        self.PUPDR11 = BitField(self, 0x00C00000, "PUPDR11", "Port x configuration bits (y = 0..15)")
-        self.PUPDR10 = BitField(self, 0x00300000, "PUPDR10", "Port x configuration bits (y = 0..15)")
-        self.PUPDR9 = BitField(self, 0x000C0000, "PUPDR9", "Port x configuration bits (y = 0..15)")
-        self.PUPDR8 = BitField(self, 0x00030000, "PUPDR8", "Port x configuration bits (y = 0..15)")
-        self.PUPDR7 = BitField(self, 0x0000C000, "PUPDR7", "Port x configuration bits (y = 0..15)")
-        self.PUPDR6 = BitField(self, 0x00003000, "PUPDR6", "Port x configuration bits (y = 0..15)")
-        self.PUPDR5 = BitField(self, 0x00000C00, "PUPDR5", "Port x configuration bits (y = 0..15)")
-        self.PUPDR4 = BitField(self, 0x00000300, "PUPDR4", "Port x configuration bits (y = 0..15)")
-        self.PUPDR3 = BitField(self, 0x000000C0, "PUPDR3", "Port x configuration bits (y = 0..15)")
-        self.PUPDR2 = BitField(self, 0x00000030, "PUPDR2", "Port x configuration bits (y = 0..15)")
-        self.PUPDR1 = BitField(self, 0x0000000C, "PUPDR1", "Port x configuration bits (y = 0..15)")
-        self.PUPDR0 = BitField(self, 0x00000003, "PUPDR0", "Port x configuration bits (y = 0..15)")
-        self.PUPDR = Subscriptor(self, "PUPDR{}")
-
-class SA_GPIOB_IDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IDR", "GPIO port input data register")
-        self.IDR15 = BitField(self, 0x00008000, "IDR15", "Port input data (y = 0..15)")
-        self.IDR14 = BitField(self, 0x00004000, "IDR14", "Port input data (y = 0..15)")
-        self.IDR13 = BitField(self, 0x00002000, "IDR13", "Port input data (y = 0..15)")
-        self.IDR12 = BitField(self, 0x00001000, "IDR12", "Port input data (y = 0..15)")
-        self.IDR11 = BitField(self, 0x00000800, "IDR11", "Port input data (y = 0..15)")
-        self.IDR10 = BitField(self, 0x00000400, "IDR10", "Port input data (y = 0..15)")
-        self.IDR9 = BitField(self, 0x00000200, "IDR9", "Port input data (y = 0..15)")
-        self.IDR8 = BitField(self, 0x00000100, "IDR8", "Port input data (y = 0..15)")
-        self.IDR7 = BitField(self, 0x00000080, "IDR7", "Port input data (y = 0..15)")
-        self.IDR6 = BitField(self, 0x00000040, "IDR6", "Port input data (y = 0..15)")
-        self.IDR5 = BitField(self, 0x00000020, "IDR5", "Port input data (y = 0..15)")
-        self.IDR4 = BitField(self, 0x00000010, "IDR4", "Port input data (y = 0..15)")
-        self.IDR3 = BitField(self, 0x00000008, "IDR3", "Port input data (y = 0..15)")
-        self.IDR2 = BitField(self, 0x00000004, "IDR2", "Port input data (y = 0..15)")
-        self.IDR1 = BitField(self, 0x00000002, "IDR1", "Port input data (y = 0..15)")
-        self.IDR0 = BitField(self, 0x00000001, "IDR0", "Port input data (y = 0..15)")
-        self.IDR = Subscriptor(self, "IDR{}")
-
-class SA_GPIOB_ODR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ODR", "GPIO port output data register")
-        self.ODR15 = BitField(self, 0x00008000, "ODR15", "Port output data (y = 0..15)")
-        self.ODR14 = BitField(self, 0x00004000, "ODR14", "Port output data (y = 0..15)")
-        self.ODR13 = BitField(self, 0x00002000, "ODR13", "Port output data (y = 0..15)")
-        self.ODR12 = BitField(self, 0x00001000, "ODR12", "Port output data (y = 0..15)")
-        self.ODR11 = BitField(self, 0x00000800, "ODR11", "Port output data (y = 0..15)")
-        self.ODR10 = BitField(self, 0x00000400, "ODR10", "Port output data (y = 0..15)")
-        self.ODR9 = BitField(self, 0x00000200, "ODR9", "Port output data (y = 0..15)")
-        self.ODR8 = BitField(self, 0x00000100, "ODR8", "Port output data (y = 0..15)")
-        self.ODR7 = BitField(self, 0x00000080, "ODR7", "Port output data (y = 0..15)")
-        self.ODR6 = BitField(self, 0x00000040, "ODR6", "Port output data (y = 0..15)")
-        self.ODR5 = BitField(self, 0x00000020, "ODR5", "Port output data (y = 0..15)")
-        self.ODR4 = BitField(self, 0x00000010, "ODR4", "Port output data (y = 0..15)")
-        self.ODR3 = BitField(self, 0x00000008, "ODR3", "Port output data (y = 0..15)")
-        self.ODR2 = BitField(self, 0x00000004, "ODR2", "Port output data (y = 0..15)")
-        self.ODR1 = BitField(self, 0x00000002, "ODR1", "Port output data (y = 0..15)")
-        self.ODR0 = BitField(self, 0x00000001, "ODR0", "Port output data (y = 0..15)")
-        self.ODR = Subscriptor(self, "ODR{}")
-
-class SA_GPIOB_BSRR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BSRR", "GPIO port bit set/reset register")
-        self.BR15 = BitField(self, 0x80000000, "BR15", "Port x reset bit y (y = 0..15)")
-        self.BR14 = BitField(self, 0x40000000, "BR14", "Port x reset bit y (y = 0..15)")
-        self.BR13 = BitField(self, 0x20000000, "BR13", "Port x reset bit y (y = 0..15)")
-        self.BR12 = BitField(self, 0x10000000, "BR12", "Port x reset bit y (y = 0..15)")
-        self.BR11 = BitField(self, 0x08000000, "BR11", "Port x reset bit y (y = 0..15)")
-        self.BR10 = BitField(self, 0x04000000, "BR10", "Port x reset bit y (y = 0..15)")
-        self.BR9 = BitField(self, 0x02000000, "BR9", "Port x reset bit y (y = 0..15)")
-        self.BR8 = BitField(self, 0x01000000, "BR8", "Port x reset bit y (y = 0..15)")
-        self.BR7 = BitField(self, 0x00800000, "BR7", "Port x reset bit y (y = 0..15)")
-        self.BR6 = BitField(self, 0x00400000, "BR6", "Port x reset bit y (y = 0..15)")
-        self.BR5 = BitField(self, 0x00200000, "BR5", "Port x reset bit y (y = 0..15)")
-        self.BR4 = BitField(self, 0x00100000, "BR4", "Port x reset bit y (y = 0..15)")
-        self.BR3 = BitField(self, 0x00080000, "BR3", "Port x reset bit y (y = 0..15)")
-        self.BR2 = BitField(self, 0x00040000, "BR2", "Port x reset bit y (y = 0..15)")
-        self.BR1 = BitField(self, 0x00020000, "BR1", "Port x reset bit y (y = 0..15)")
-        self.BR0 = BitField(self, 0x00010000, "BR0", "Port x set bit y (y= 0..15)")
-        self.BS15 = BitField(self, 0x00008000, "BS15", "Port x set bit y (y= 0..15)")
-        self.BS14 = BitField(self, 0x00004000, "BS14", "Port x set bit y (y= 0..15)")
-        self.BS13 = BitField(self, 0x00002000, "BS13", "Port x set bit y (y= 0..15)")
-        self.BS12 = BitField(self, 0x00001000, "BS12", "Port x set bit y (y= 0..15)")
-        self.BS11 = BitField(self, 0x00000800, "BS11", "Port x set bit y (y= 0..15)")
-        self.BS10 = BitField(self, 0x00000400, "BS10", "Port x set bit y (y= 0..15)")
-        self.BS9 = BitField(self, 0x00000200, "BS9", "Port x set bit y (y= 0..15)")
-        self.BS8 = BitField(self, 0x00000100, "BS8", "Port x set bit y (y= 0..15)")
-        self.BS7 = BitField(self, 0x00000080, "BS7", "Port x set bit y (y= 0..15)")
-        self.BS6 = BitField(self, 0x00000040, "BS6", "Port x set bit y (y= 0..15)")
-        self.BS5 = BitField(self, 0x00000020, "BS5", "Port x set bit y (y= 0..15)")
-        self.BS4 = BitField(self, 0x00000010, "BS4", "Port x set bit y (y= 0..15)")
-        self.BS3 = BitField(self, 0x00000008, "BS3", "Port x set bit y (y= 0..15)")
-        self.BS2 = BitField(self, 0x00000004, "BS2", "Port x set bit y (y= 0..15)")
-        self.BS1 = BitField(self, 0x00000002, "BS1", "Port x set bit y (y= 0..15)")
-        self.BS0 = BitField(self, 0x00000001, "BS0", "Port x set bit y (y= 0..15)")
-        self.BS = Subscriptor(self, "BS{}")
-        self.BR = Subscriptor(self, "BR{}")
-
-class SA_GPIOB_LCKR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "LCKR", "GPIO port configuration lock register")
-        self.LCKK = BitField(self, 0x00010000, "LCKK", "Port x lock bit y (y= 0..15)")
-        self.LCK15 = BitField(self, 0x00008000, "LCK15", "Port x lock bit y (y= 0..15)")
-        self.LCK14 = BitField(self, 0x00004000, "LCK14", "Port x lock bit y (y= 0..15)")
-        self.LCK13 = BitField(self, 0x00002000, "LCK13", "Port x lock bit y (y= 0..15)")
-        self.LCK12 = BitField(self, 0x00001000, "LCK12", "Port x lock bit y (y= 0..15)")
-        self.LCK11 = BitField(self, 0x00000800, "LCK11", "Port x lock bit y (y= 0..15)")
-        self.LCK10 = BitField(self, 0x00000400, "LCK10", "Port x lock bit y (y= 0..15)")
-        self.LCK9 = BitField(self, 0x00000200, "LCK9", "Port x lock bit y (y= 0..15)")
-        self.LCK8 = BitField(self, 0x00000100, "LCK8", "Port x lock bit y (y= 0..15)")
-        self.LCK7 = BitField(self, 0x00000080, "LCK7", "Port x lock bit y (y= 0..15)")
-        self.LCK6 = BitField(self, 0x00000040, "LCK6", "Port x lock bit y (y= 0..15)")
-        self.LCK5 = BitField(self, 0x00000020, "LCK5", "Port x lock bit y (y= 0..15)")
-        self.LCK4 = BitField(self, 0x00000010, "LCK4", "Port x lock bit y (y= 0..15)")
-        self.LCK3 = BitField(self, 0x00000008, "LCK3", "Port x lock bit y (y= 0..15)")
-        self.LCK2 = BitField(self, 0x00000004, "LCK2", "Port x lock bit y (y= 0..15)")
-        self.LCK1 = BitField(self, 0x00000002, "LCK1", "Port x lock bit y (y= 0..15)")
-        self.LCK0 = BitField(self, 0x00000001, "LCK0", "Port x lock bit y (y= 0..15)")
-        self.LCK = Subscriptor(self, "LCK{}")
-
-class SA_GPIOB_AFRL(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AFRL", "GPIO alternate function low register")
-        self.AFRL7 = BitField(self, 0xF0000000, "AFRL7", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL6 = BitField(self, 0x0F000000, "AFRL6", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL5 = BitField(self, 0x00F00000, "AFRL5", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL4 = BitField(self, 0x000F0000, "AFRL4", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL3 = BitField(self, 0x0000F000, "AFRL3", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL2 = BitField(self, 0x00000F00, "AFRL2", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL1 = BitField(self, 0x000000F0, "AFRL1", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL0 = BitField(self, 0x0000000F, "AFRL0", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL = Subscriptor(self, "AFRL{}")
-
-class SA_GPIOB_AFRH(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AFRH", "GPIO alternate function high register")
-        self.AFRH15 = BitField(self, 0xF0000000, "AFRH15", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH14 = BitField(self, 0x0F000000, "AFRH14", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH13 = BitField(self, 0x00F00000, "AFRH13", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH12 = BitField(self, 0x000F0000, "AFRH12", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH11 = BitField(self, 0x0000F000, "AFRH11", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH10 = BitField(self, 0x00000F00, "AFRH10", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH9 = BitField(self, 0x000000F0, "AFRH9", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH8 = BitField(self, 0x0000000F, "AFRH8", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH = Subscriptor(self, "AFRH{}")
-
-class SA_GPIOB_BRR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BRR", "GPIO port bit reset register")
-        self.BR0 = BitField(self, 0x00000001, "BR0", "Port Reset bit")
-        self.BR1 = BitField(self, 0x00000002, "BR1", "Port Reset bit")
-        self.BR2 = BitField(self, 0x00000004, "BR2", "Port Reset bit")
-        self.BR3 = BitField(self, 0x00000008, "BR3", "Port Reset bit")
-        self.BR4 = BitField(self, 0x00000010, "BR4", "Port Reset bit")
-        self.BR5 = BitField(self, 0x00000020, "BR5", "Port Reset bit")
-        self.BR6 = BitField(self, 0x00000040, "BR6", "Port Reset bit")
-        self.BR7 = BitField(self, 0x00000080, "BR7", "Port Reset bit")
-        self.BR8 = BitField(self, 0x00000100, "BR8", "Port Reset bit")
-        self.BR9 = BitField(self, 0x00000200, "BR9", "Port Reset bit")
-        self.BR10 = BitField(self, 0x00000400, "BR10", "Port Reset bit")
-        self.BR11 = BitField(self, 0x00000800, "BR11", "Port Reset bit")
-        self.BR12 = BitField(self, 0x00001000, "BR12", "Port Reset bit")
-        self.BR13 = BitField(self, 0x00002000, "BR13", "Port Reset bit")
-        self.BR14 = BitField(self, 0x00004000, "BR14", "Port Reset bit")
-        self.BR15 = BitField(self, 0x00008000, "BR15", "Port Reset bit")
-        self.BR = Subscriptor(self, "BR{}")
-
-class SA_GPIOB(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "General-purpose I/Os")
-        self.MODER = SA_GPIOB_MODER(self, 0x0)
-        self.OTYPER = SA_GPIOB_OTYPER(self, 0x4)
-        self.OSPEEDR = SA_GPIOB_OSPEEDR(self, 0x8)
-        self.PUPDR = SA_GPIOB_PUPDR(self, 0xC)
-        self.IDR = SA_GPIOB_IDR(self, 0x10)
-        self.ODR = SA_GPIOB_ODR(self, 0x14)
-        self.BSRR = SA_GPIOB_BSRR(self, 0x18)
-        self.LCKR = SA_GPIOB_LCKR(self, 0x1C)
-        self.AFRL = SA_GPIOB_AFRL(self, 0x20)
-        self.AFRH = SA_GPIOB_AFRH(self, 0x24)
-        self.BRR = SA_GPIOB_BRR(self, 0x28)
-
-GPIOB = SA_GPIOB(0x48000400, "GPIOB")
-
-class SA_GPIOC_MODER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFFFFFF, "MODER", "GPIO port mode register")
-        self.MODER15 = BitField(self, 0xC0000000, "MODER15", "Port x configuration bits (y = 0..15)")
-        self.MODER14 = BitField(self, 0x30000000, "MODER14", "Port x configuration bits (y = 0..15)")
-        self.MODER13 = BitField(self, 0x0C000000, "MODER13", "Port x configuration bits (y = 0..15)")
-        self.MODER12 = BitField(self, 0x03000000, "MODER12", "Port x configuration bits (y = 0..15)")
-        self.MODER11 = BitField(self, 0x00C00000, "MODER11", "Port x configuration bits (y = 0..15)")
-        self.MODER10 = BitField(self, 0x00300000, "MODER10", "Port x configuration bits (y = 0..15)")
-        self.MODER9 = BitField(self, 0x000C0000, "MODER9", "Port x configuration bits (y = 0..15)")
-        self.MODER8 = BitField(self, 0x00030000, "MODER8", "Port x configuration bits (y = 0..15)")
-        self.MODER7 = BitField(self, 0x0000C000, "MODER7", "Port x configuration bits (y = 0..15)")
-        self.MODER6 = BitField(self, 0x00003000, "MODER6", "Port x configuration bits (y = 0..15)")
-        self.MODER5 = BitField(self, 0x00000C00, "MODER5", "Port x configuration bits (y = 0..15)")
-        self.MODER4 = BitField(self, 0x00000300, "MODER4", "Port x configuration bits (y = 0..15)")
-        self.MODER3 = BitField(self, 0x000000C0, "MODER3", "Port x configuration bits (y = 0..15)")
-        self.MODER2 = BitField(self, 0x00000030, "MODER2", "Port x configuration bits (y = 0..15)")
-        self.MODER1 = BitField(self, 0x0000000C, "MODER1", "Port x configuration bits (y = 0..15)")
-        self.MODER0 = BitField(self, 0x00000003, "MODER0", "Port x configuration bits (y = 0..15)")
-        self.MODER = Subscriptor(self, "MODER{}")
-
-class SA_GPIOC_OTYPER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OTYPER", "GPIO port output type register")
-        self.OT15 = BitField(self, 0x00008000, "OT15", "Port x configuration bits (y = 0..15)")
-        self.OT14 = BitField(self, 0x00004000, "OT14", "Port x configuration bits (y = 0..15)")
-        self.OT13 = BitField(self, 0x00002000, "OT13", "Port x configuration bits (y = 0..15)")
-        self.OT12 = BitField(self, 0x00001000, "OT12", "Port x configuration bits (y = 0..15)")
-        self.OT11 = BitField(self, 0x00000800, "OT11", "Port x configuration bits (y = 0..15)")
-        self.OT10 = BitField(self, 0x00000400, "OT10", "Port x configuration bits (y = 0..15)")
-        self.OT9 = BitField(self, 0x00000200, "OT9", "Port x configuration bits (y = 0..15)")
-        self.OT8 = BitField(self, 0x00000100, "OT8", "Port x configuration bits (y = 0..15)")
-        self.OT7 = BitField(self, 0x00000080, "OT7", "Port x configuration bits (y = 0..15)")
-        self.OT6 = BitField(self, 0x00000040, "OT6", "Port x configuration bits (y = 0..15)")
-        self.OT5 = BitField(self, 0x00000020, "OT5", "Port x configuration bits (y = 0..15)")
-        self.OT4 = BitField(self, 0x00000010, "OT4", "Port x configuration bits (y = 0..15)")
-        self.OT3 = BitField(self, 0x00000008, "OT3", "Port x configuration bits (y = 0..15)")
-        self.OT2 = BitField(self, 0x00000004, "OT2", "Port x configuration bits (y = 0..15)")
-        self.OT1 = BitField(self, 0x00000002, "OT1", "Port x configuration bits (y = 0..15)")
-        self.OT0 = BitField(self, 0x00000001, "OT0", "Port x configuration bits (y = 0..15)")
-        self.OT = Subscriptor(self, "OT{}")
-
-class SA_GPIOC_OSPEEDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OSPEEDR", "GPIO port output speed register")
-        self.OSPEEDR15 = BitField(self, 0xC0000000, "OSPEEDR15", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR14 = BitField(self, 0x30000000, "OSPEEDR14", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR13 = BitField(self, 0x0C000000, "OSPEEDR13", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR12 = BitField(self, 0x03000000, "OSPEEDR12", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR11 = BitField(self, 0x00C00000, "OSPEEDR11", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR10 = BitField(self, 0x00300000, "OSPEEDR10", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR9 = BitField(self, 0x000C0000, "OSPEEDR9", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR8 = BitField(self, 0x00030000, "OSPEEDR8", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR7 = BitField(self, 0x0000C000, "OSPEEDR7", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR6 = BitField(self, 0x00003000, "OSPEEDR6", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR5 = BitField(self, 0x00000C00, "OSPEEDR5", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR4 = BitField(self, 0x00000300, "OSPEEDR4", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR3 = BitField(self, 0x000000C0, "OSPEEDR3", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR2 = BitField(self, 0x00000030, "OSPEEDR2", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR1 = BitField(self, 0x0000000C, "OSPEEDR1", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR0 = BitField(self, 0x00000003, "OSPEEDR0", "Port x configuration bits (y = 0..15)")
-        self.OSPEEDR = Subscriptor(self, "OSPEEDR{}")
-
-class SA_GPIOC_PUPDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PUPDR", "GPIO port pull-up/pull-down register")
-        self.PUPDR15 = BitField(self, 0xC0000000, "PUPDR15", "Port x configuration bits (y = 0..15)")
-        self.PUPDR14 = BitField(self, 0x30000000, "PUPDR14", "Port x configuration bits (y = 0..15)")
-        self.PUPDR13 = BitField(self, 0x0C000000, "PUPDR13", "Port x configuration bits (y = 0..15)")
-        self.PUPDR12 = BitField(self, 0x03000000, "PUPDR12", "Port x configuration bits (y = 0..15)")
-        self.PUPDR11 = BitField(self, 0x00C00000, "PUPDR11", "Port x configuration bits (y = 0..15)")
-        self.PUPDR10 = BitField(self, 0x00300000, "PUPDR10", "Port x configuration bits (y = 0..15)")
-        self.PUPDR9 = BitField(self, 0x000C0000, "PUPDR9", "Port x configuration bits (y = 0..15)")
-        self.PUPDR8 = BitField(self, 0x00030000, "PUPDR8", "Port x configuration bits (y = 0..15)")
-        self.PUPDR7 = BitField(self, 0x0000C000, "PUPDR7", "Port x configuration bits (y = 0..15)")
-        self.PUPDR6 = BitField(self, 0x00003000, "PUPDR6", "Port x configuration bits (y = 0..15)")
-        self.PUPDR5 = BitField(self, 0x00000C00, "PUPDR5", "Port x configuration bits (y = 0..15)")
-        self.PUPDR4 = BitField(self, 0x00000300, "PUPDR4", "Port x configuration bits (y = 0..15)")
-        self.PUPDR3 = BitField(self, 0x000000C0, "PUPDR3", "Port x configuration bits (y = 0..15)")
-        self.PUPDR2 = BitField(self, 0x00000030, "PUPDR2", "Port x configuration bits (y = 0..15)")
-        self.PUPDR1 = BitField(self, 0x0000000C, "PUPDR1", "Port x configuration bits (y = 0..15)")
-        self.PUPDR0 = BitField(self, 0x00000003, "PUPDR0", "Port x configuration bits (y = 0..15)")
-        self.PUPDR = Subscriptor(self, "PUPDR{}")
-
-class SA_GPIOC_IDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IDR", "GPIO port input data register")
-        self.IDR15 = BitField(self, 0x00008000, "IDR15", "Port input data (y = 0..15)")
-        self.IDR14 = BitField(self, 0x00004000, "IDR14", "Port input data (y = 0..15)")
-        self.IDR13 = BitField(self, 0x00002000, "IDR13", "Port input data (y = 0..15)")
-        self.IDR12 = BitField(self, 0x00001000, "IDR12", "Port input data (y = 0..15)")
-        self.IDR11 = BitField(self, 0x00000800, "IDR11", "Port input data (y = 0..15)")
-        self.IDR10 = BitField(self, 0x00000400, "IDR10", "Port input data (y = 0..15)")
-        self.IDR9 = BitField(self, 0x00000200, "IDR9", "Port input data (y = 0..15)")
-        self.IDR8 = BitField(self, 0x00000100, "IDR8", "Port input data (y = 0..15)")
-        self.IDR7 = BitField(self, 0x00000080, "IDR7", "Port input data (y = 0..15)")
-        self.IDR6 = BitField(self, 0x00000040, "IDR6", "Port input data (y = 0..15)")
-        self.IDR5 = BitField(self, 0x00000020, "IDR5", "Port input data (y = 0..15)")
-        self.IDR4 = BitField(self, 0x00000010, "IDR4", "Port input data (y = 0..15)")
-        self.IDR3 = BitField(self, 0x00000008, "IDR3", "Port input data (y = 0..15)")
-        self.IDR2 = BitField(self, 0x00000004, "IDR2", "Port input data (y = 0..15)")
-        self.IDR1 = BitField(self, 0x00000002, "IDR1", "Port input data (y = 0..15)")
-        self.IDR0 = BitField(self, 0x00000001, "IDR0", "Port input data (y = 0..15)")
-        self.IDR = Subscriptor(self, "IDR{}")
-
-class SA_GPIOC_ODR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ODR", "GPIO port output data register")
-        self.ODR15 = BitField(self, 0x00008000, "ODR15", "Port output data (y = 0..15)")
-        self.ODR14 = BitField(self, 0x00004000, "ODR14", "Port output data (y = 0..15)")
-        self.ODR13 = BitField(self, 0x00002000, "ODR13", "Port output data (y = 0..15)")
-        self.ODR12 = BitField(self, 0x00001000, "ODR12", "Port output data (y = 0..15)")
-        self.ODR11 = BitField(self, 0x00000800, "ODR11", "Port output data (y = 0..15)")
-        self.ODR10 = BitField(self, 0x00000400, "ODR10", "Port output data (y = 0..15)")
-        self.ODR9 = BitField(self, 0x00000200, "ODR9", "Port output data (y = 0..15)")
-        self.ODR8 = BitField(self, 0x00000100, "ODR8", "Port output data (y = 0..15)")
-        self.ODR7 = BitField(self, 0x00000080, "ODR7", "Port output data (y = 0..15)")
-        self.ODR6 = BitField(self, 0x00000040, "ODR6", "Port output data (y = 0..15)")
-        self.ODR5 = BitField(self, 0x00000020, "ODR5", "Port output data (y = 0..15)")
-        self.ODR4 = BitField(self, 0x00000010, "ODR4", "Port output data (y = 0..15)")
-        self.ODR3 = BitField(self, 0x00000008, "ODR3", "Port output data (y = 0..15)")
-        self.ODR2 = BitField(self, 0x00000004, "ODR2", "Port output data (y = 0..15)")
-        self.ODR1 = BitField(self, 0x00000002, "ODR1", "Port output data (y = 0..15)")
-        self.ODR0 = BitField(self, 0x00000001, "ODR0", "Port output data (y = 0..15)")
-        self.ODR = Subscriptor(self, "ODR{}")
-
-class SA_GPIOC_BSRR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BSRR", "GPIO port bit set/reset register")
-        self.BR15 = BitField(self, 0x80000000, "BR15", "Port x reset bit y (y = 0..15)")
-        self.BR14 = BitField(self, 0x40000000, "BR14", "Port x reset bit y (y = 0..15)")
-        self.BR13 = BitField(self, 0x20000000, "BR13", "Port x reset bit y (y = 0..15)")
-        self.BR12 = BitField(self, 0x10000000, "BR12", "Port x reset bit y (y = 0..15)")
-        self.BR11 = BitField(self, 0x08000000, "BR11", "Port x reset bit y (y = 0..15)")
-        self.BR10 = BitField(self, 0x04000000, "BR10", "Port x reset bit y (y = 0..15)")
-        self.BR9 = BitField(self, 0x02000000, "BR9", "Port x reset bit y (y = 0..15)")
-        self.BR8 = BitField(self, 0x01000000, "BR8", "Port x reset bit y (y = 0..15)")
-        self.BR7 = BitField(self, 0x00800000, "BR7", "Port x reset bit y (y = 0..15)")
-        self.BR6 = BitField(self, 0x00400000, "BR6", "Port x reset bit y (y = 0..15)")
-        self.BR5 = BitField(self, 0x00200000, "BR5", "Port x reset bit y (y = 0..15)")
-        self.BR4 = BitField(self, 0x00100000, "BR4", "Port x reset bit y (y = 0..15)")
-        self.BR3 = BitField(self, 0x00080000, "BR3", "Port x reset bit y (y = 0..15)")
-        self.BR2 = BitField(self, 0x00040000, "BR2", "Port x reset bit y (y = 0..15)")
-        self.BR1 = BitField(self, 0x00020000, "BR1", "Port x reset bit y (y = 0..15)")
-        self.BR0 = BitField(self, 0x00010000, "BR0", "Port x set bit y (y= 0..15)")
-        self.BS15 = BitField(self, 0x00008000, "BS15", "Port x set bit y (y= 0..15)")
-        self.BS14 = BitField(self, 0x00004000, "BS14", "Port x set bit y (y= 0..15)")
-        self.BS13 = BitField(self, 0x00002000, "BS13", "Port x set bit y (y= 0..15)")
-        self.BS12 = BitField(self, 0x00001000, "BS12", "Port x set bit y (y= 0..15)")
-        self.BS11 = BitField(self, 0x00000800, "BS11", "Port x set bit y (y= 0..15)")
-        self.BS10 = BitField(self, 0x00000400, "BS10", "Port x set bit y (y= 0..15)")
-        self.BS9 = BitField(self, 0x00000200, "BS9", "Port x set bit y (y= 0..15)")
-        self.BS8 = BitField(self, 0x00000100, "BS8", "Port x set bit y (y= 0..15)")
-        self.BS7 = BitField(self, 0x00000080, "BS7", "Port x set bit y (y= 0..15)")
-        self.BS6 = BitField(self, 0x00000040, "BS6", "Port x set bit y (y= 0..15)")
-        self.BS5 = BitField(self, 0x00000020, "BS5", "Port x set bit y (y= 0..15)")
-        self.BS4 = BitField(self, 0x00000010, "BS4", "Port x set bit y (y= 0..15)")
-        self.BS3 = BitField(self, 0x00000008, "BS3", "Port x set bit y (y= 0..15)")
-        self.BS2 = BitField(self, 0x00000004, "BS2", "Port x set bit y (y= 0..15)")
-        self.BS1 = BitField(self, 0x00000002, "BS1", "Port x set bit y (y= 0..15)")
-        self.BS0 = BitField(self, 0x00000001, "BS0", "Port x set bit y (y= 0..15)")
-        self.BS = Subscriptor(self, "BS{}")
-        self.BR = Subscriptor(self, "BR{}")
-
-class SA_GPIOC_LCKR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "LCKR", "GPIO port configuration lock register")
-        self.LCKK = BitField(self, 0x00010000, "LCKK", "Port x lock bit y (y= 0..15)")
-        self.LCK15 = BitField(self, 0x00008000, "LCK15", "Port x lock bit y (y= 0..15)")
-        self.LCK14 = BitField(self, 0x00004000, "LCK14", "Port x lock bit y (y= 0..15)")
-        self.LCK13 = BitField(self, 0x00002000, "LCK13", "Port x lock bit y (y= 0..15)")
-        self.LCK12 = BitField(self, 0x00001000, "LCK12", "Port x lock bit y (y= 0..15)")
-        self.LCK11 = BitField(self, 0x00000800, "LCK11", "Port x lock bit y (y= 0..15)")
-        self.LCK10 = BitField(self, 0x00000400, "LCK10", "Port x lock bit y (y= 0..15)")
-        self.LCK9 = BitField(self, 0x00000200, "LCK9", "Port x lock bit y (y= 0..15)")
-        self.LCK8 = BitField(self, 0x00000100, "LCK8", "Port x lock bit y (y= 0..15)")
-        self.LCK7 = BitField(self, 0x00000080, "LCK7", "Port x lock bit y (y= 0..15)")
-        self.LCK6 = BitField(self, 0x00000040, "LCK6", "Port x lock bit y (y= 0..15)")
-        self.LCK5 = BitField(self, 0x00000020, "LCK5", "Port x lock bit y (y= 0..15)")
-        self.LCK4 = BitField(self, 0x00000010, "LCK4", "Port x lock bit y (y= 0..15)")
-        self.LCK3 = BitField(self, 0x00000008, "LCK3", "Port x lock bit y (y= 0..15)")
-        self.LCK2 = BitField(self, 0x00000004, "LCK2", "Port x lock bit y (y= 0..15)")
-        self.LCK1 = BitField(self, 0x00000002, "LCK1", "Port x lock bit y (y= 0..15)")
-        self.LCK0 = BitField(self, 0x00000001, "LCK0", "Port x lock bit y (y= 0..15)")
-        self.LCK = Subscriptor(self, "LCK{}")
-
-class SA_GPIOC_AFRL(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AFRL", "GPIO alternate function low register")
-        self.AFRL7 = BitField(self, 0xF0000000, "AFRL7", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL6 = BitField(self, 0x0F000000, "AFRL6", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL5 = BitField(self, 0x00F00000, "AFRL5", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL4 = BitField(self, 0x000F0000, "AFRL4", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL3 = BitField(self, 0x0000F000, "AFRL3", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL2 = BitField(self, 0x00000F00, "AFRL2", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL1 = BitField(self, 0x000000F0, "AFRL1", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL0 = BitField(self, 0x0000000F, "AFRL0", "Alternate function selection for port x bit y (y = 0..7)")
-        self.AFRL = Subscriptor(self, "AFRL{}")
-
-class SA_GPIOC_AFRH(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AFRH", "GPIO alternate function high register")
-        self.AFRH15 = BitField(self, 0xF0000000, "AFRH15", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH14 = BitField(self, 0x0F000000, "AFRH14", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH13 = BitField(self, 0x00F00000, "AFRH13", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH12 = BitField(self, 0x000F0000, "AFRH12", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH11 = BitField(self, 0x0000F000, "AFRH11", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH10 = BitField(self, 0x00000F00, "AFRH10", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH9 = BitField(self, 0x000000F0, "AFRH9", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH8 = BitField(self, 0x0000000F, "AFRH8", "Alternate function selection for port x bit y (y = 8..15)")
-        self.AFRH = Subscriptor(self, "AFRH{}")
-
-class SA_GPIOC_BRR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BRR", "GPIO port bit reset register")
-        self.BR0 = BitField(self, 0x00000001, "BR0", "Port Reset bit")
-        self.BR1 = BitField(self, 0x00000002, "BR1", "Port Reset bit")
-        self.BR2 = BitField(self, 0x00000004, "BR2", "Port Reset bit")
-        self.BR3 = BitField(self, 0x00000008, "BR3", "Port Reset bit")
-        self.BR4 = BitField(self, 0x00000010, "BR4", "Port Reset bit")
-        self.BR5 = BitField(self, 0x00000020, "BR5", "Port Reset bit")
-        self.BR6 = BitField(self, 0x00000040, "BR6", "Port Reset bit")
-        self.BR7 = BitField(self, 0x00000080, "BR7", "Port Reset bit")
-        self.BR8 = BitField(self, 0x00000100, "BR8", "Port Reset bit")
-        self.BR9 = BitField(self, 0x00000200, "BR9", "Port Reset bit")
-        self.BR10 = BitField(self, 0x00000400, "BR10", "Port Reset bit")
-        self.BR11 = BitField(self, 0x00000800, "BR11", "Port Reset bit")
-        self.BR12 = BitField(self, 0x00001000, "BR12", "Port Reset bit")
-        self.BR13 = BitField(self, 0x00002000, "BR13", "Port Reset bit")
-        self.BR14 = BitField(self, 0x00004000, "BR14", "Port Reset bit")
-        self.BR15 = BitField(self, 0x00008000, "BR15", "Port Reset bit")
-        self.BR = Subscriptor(self, "BR{}")
-
-class SA_GPIOC(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "General-purpose I/Os")
-        self.MODER = SA_GPIOC_MODER(self, 0x0)
-        self.OTYPER = SA_GPIOC_OTYPER(self, 0x4)
-        self.OSPEEDR = SA_GPIOC_OSPEEDR(self, 0x8)
-        self.PUPDR = SA_GPIOC_PUPDR(self, 0xC)
-        self.IDR = SA_GPIOC_IDR(self, 0x10)
-        self.ODR = SA_GPIOC_ODR(self, 0x14)
-        self.BSRR = SA_GPIOC_BSRR(self, 0x18)
-        self.LCKR = SA_GPIOC_LCKR(self, 0x1C)
-        self.AFRL = SA_GPIOC_AFRL(self, 0x20)
-        self.AFRH = SA_GPIOC_AFRH(self, 0x24)
-        self.BRR = SA_GPIOC_BRR(self, 0x28)
-
-GPIOC = SA_GPIOC(0x48000800, "GPIOC")
-GPIOD = SA_GPIOC(0x48000C00, "GPIOD")
-GPIOE = SA_GPIOC(0x48001000, "GPIOE")
-GPIOF = SA_GPIOC(0x48001400, "GPIOF")
-GPIOG = SA_GPIOC(0x48001800, "GPIOG")
-
-class SA_TIM15_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR1", "control register 1")
-        self.CEN = BitField(self, 0x00000001, "CEN", "Counter enable")
-        self.UDIS = BitField(self, 0x00000002, "UDIS", "Update disable")
-        self.URS = BitField(self, 0x00000004, "URS", "Update request source")
-        self.OPM = BitField(self, 0x00000008, "OPM", "One-pulse mode")
-        self.ARPE = BitField(self, 0x00000080, "ARPE", "Auto-reload preload enable")
-        self.CKD = BitField(self, 0x00000300, "CKD", "Clock division")
-        self.UIFREMAP = BitField(self, 0x00000800, "UIFREMAP", "UIF status bit remapping")
-        self.DITHEN = BitField(self, 0x00001000, "DITHEN", "Dithering Enable")
-
-class SA_TIM15_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR2", "control register 2")
-        self.OIS2 = BitField(self, 0x00000400, "OIS2", "Output idle state 2 (OC2 output)")
-        self.OIS1N = BitField(self, 0x00000200, "OIS1N", "Output Idle state 1")
-        self.OIS1 = BitField(self, 0x00000100, "OIS1", "Output Idle state 1")
-        self.TI1S = BitField(self, 0x00000080, "TI1S", "TI1 selection")
-        self.MMS = BitField(self, 0x00000070, "MMS", "Master mode selection")
-        self.CCDS = BitField(self, 0x00000008, "CCDS", "Capture/compare DMA selection")
-        self.CCUS = BitField(self, 0x00000004, "CCUS", "Capture/compare control update selection")
-        self.CCPC = BitField(self, 0x00000001, "CCPC", "Capture/compare preloaded control")
-        self.OIS = Subscriptor(self, "OIS{}")
-
-class SA_TIM15_SMCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SMCR", "slave mode control register")
-        self.MSM = BitField(self, 0x00000080, "MSM", "Master/Slave mode")
-        self.TS = BitField(self, 0x00300070, "TS", "Trigger selection")
-        self.SMS = BitField(self, 0x00010007, "SMS", "Slave mode selection")
-
-class SA_TIM15_DIER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DIER", "DMA/Interrupt enable register")
-        self.TDE = BitField(self, 0x00004000, "TDE", "Trigger DMA request enable")
-        self.COMDE = BitField(self, 0x00002000, "COMDE", "COM DMA request enable")
-        self.CC2DE = BitField(self, 0x00000400, "CC2DE", "Capture/Compare 2 DMA request enable")
-        self.CC1DE = BitField(self, 0x00000200, "CC1DE", "Capture/Compare 1 DMA request enable")
-        self.UDE = BitField(self, 0x00000100, "UDE", "Update DMA request enable")
-        self.BIE = BitField(self, 0x00000080, "BIE", "Break interrupt enable")
-        self.TIE = BitField(self, 0x00000040, "TIE", "Trigger interrupt enable")
-        self.COMIE = BitField(self, 0x00000020, "COMIE", "COM interrupt enable")
-        self.CC2IE = BitField(self, 0x00000004, "CC2IE", "Capture/Compare 2 interrupt enable")
-        self.CC1IE = BitField(self, 0x00000002, "CC1IE", "Capture/Compare 1 interrupt enable")
-        self.UIE = BitField(self, 0x00000001, "UIE", "Update interrupt enable")
-        self.CCDE = Subscriptor(self, "CC{}DE")
-        self.CCIE = Subscriptor(self, "CC{}IE")
-
-class SA_TIM15_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "status register")
-        self.CC2OF = BitField(self, 0x00000400, "CC2OF", "Capture/Compare 2 overcapture flag")
-        self.CC1OF = BitField(self, 0x00000200, "CC1OF", "Capture/Compare 1 overcapture flag")
-        self.BIF = BitField(self, 0x00000080, "BIF", "Break interrupt flag")
-        self.TIF = BitField(self, 0x00000040, "TIF", "Trigger interrupt flag")
-        self.COMIF = BitField(self, 0x00000020, "COMIF", "COM interrupt flag")
-        self.CC2IF = BitField(self, 0x00000004, "CC2IF", "Capture/compare 2 interrupt flag")
-        self.CC1IF = BitField(self, 0x00000002, "CC1IF", "Capture/compare 1 interrupt flag")
-        self.UIF = BitField(self, 0x00000001, "UIF", "Update interrupt flag")
-        self.CCIF = Subscriptor(self, "CC{}IF")
-        self.CCOF = Subscriptor(self, "CC{}OF")
-
-class SA_TIM15_EGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EGR", "event generation register")
-        self.BG = BitField(self, 0x00000080, "BG", "Break generation")
-        self.TG = BitField(self, 0x00000040, "TG", "Trigger generation")
-        self.COMG = BitField(self, 0x00000020, "COMG", "Capture/Compare control update generation")
-        self.CC2G = BitField(self, 0x00000004, "CC2G", "Capture/compare 2 generation")
-        self.CC1G = BitField(self, 0x00000002, "CC1G", "Capture/compare 1 generation")
-        self.UG = BitField(self, 0x00000001, "UG", "Update generation")
-        self.CCG = Subscriptor(self, "CC{}G")
-
-class SA_TIM15_CCMR1_Output(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1_Output", "capture/compare mode register (output mode)")
-        self.OC2M = BitField(self, 0x01007000, "OC2M", "OC2M")
-        self.OC2PE = BitField(self, 0x00000800, "OC2PE", "OC2PE")
-        self.OC2FE = BitField(self, 0x00000400, "OC2FE", "OC2FE")
-        self.CC2S = BitField(self, 0x00000300, "CC2S", "CC2S")
-        self.OC1CE = BitField(self, 0x00000080, "OC1CE", "OC1CE")
-        self.OC1M = BitField(self, 0x00010070, "OC1M", "Output Compare 1 mode")
-        self.OC1PE = BitField(self, 0x00000008, "OC1PE", "Output Compare 1 preload enable")
-        self.OC1FE = BitField(self, 0x00000004, "OC1FE", "Output Compare 1 fast enable")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.CCS = Subscriptor(self, "CC{}S")
-
-class SA_TIM15_CCMR1_Input(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1_Input", "capture/compare mode register 1 (input mode)")
-        self.IC2F = BitField(self, 0x0000F000, "IC2F", "IC2F")
-        self.IC2PSC = BitField(self, 0x00000C00, "IC2PSC", "IC2PSC")
-        self.CC2S = BitField(self, 0x00000300, "CC2S", "CC2S")
-        self.IC1F = BitField(self, 0x000000F0, "IC1F", "Input capture 1 filter")
-        self.IC1PSC = BitField(self, 0x0000000C, "IC1PSC", "Input capture 1 prescaler")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-        self.CCS = Subscriptor(self, "CC{}S")
-        self.ICF = Subscriptor(self, "IC{}F")
-        self.ICPSC = Subscriptor(self, "IC{}PSC")
-
-class SA_TIM15_CCER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCER", "capture/compare enable register")
-        self.CC2NP = BitField(self, 0x00000080, "CC2NP", "Capture/Compare 2 complementary output polarity")
-        self.CC2P = BitField(self, 0x00000020, "CC2P", "Capture/Compare 2 output polarity")
-        self.CC2E = BitField(self, 0x00000010, "CC2E", "Capture/Compare 2 output enable")
-        self.CC1NP = BitField(self, 0x00000008, "CC1NP", "Capture/Compare 1 output Polarity")
-        self.CC1NE = BitField(self, 0x00000004, "CC1NE", "Capture/Compare 1 complementary output enable")
-        self.CC1P = BitField(self, 0x00000002, "CC1P", "Capture/Compare 1 output Polarity")
-        self.CC1E = BitField(self, 0x00000001, "CC1E", "Capture/Compare 1 output enable")
-        self.CCP = Subscriptor(self, "CC{}P")
-        self.CCE = Subscriptor(self, "CC{}E")
-        self.CCNP = Subscriptor(self, "CC{}NP")
-
-class SA_TIM15_CNT(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNT", "counter")
-        self.CNT = BitField(self, 0x0000FFFF, "CNT", "counter value")
-        self.UIFCPY = BitField(self, 0x80000000, "UIFCPY", "UIF Copy")
-
-class SA_TIM15_PSC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PSC", "prescaler")
-        self.PSC = BitField(self, 0x0000FFFF, "PSC", "Prescaler value")
-
-class SA_TIM15_ARR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFF, "ARR", "auto-reload register")
-        self.ARR = BitField(self, 0x0000FFFF, "ARR", "Auto-reload value")
-
-class SA_TIM15_RCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RCR", "repetition counter register")
-        self.REP = BitField(self, 0x000000FF, "REP", "Repetition counter value")
-
-class SA_TIM15_CCR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR1", "capture/compare register 1")
-        self.CCR1 = BitField(self, 0x0000FFFF, "CCR1", "Capture/Compare 1 value")
-
-class SA_TIM15_CCR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR2", "capture/compare register 2")
-        self.CCR2 = BitField(self, 0x0000FFFF, "CCR2", "Capture/Compare 1 value")
-
-class SA_TIM15_BDTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BDTR", "break and dead-time register")
-        self.DTG = BitField(self, 0x000000FF, "DTG", "Dead-time generator setup")
-        self.LOCK = BitField(self, 0x00000300, "LOCK", "Lock configuration")
-        self.OSSI = BitField(self, 0x00000400, "OSSI", "Off-state selection for Idle mode")
-        self.OSSR = BitField(self, 0x00000800, "OSSR", "Off-state selection for Run mode")
-        self.BKE = BitField(self, 0x00001000, "BKE", "Break enable")
-        self.BKP = BitField(self, 0x00002000, "BKP", "Break polarity")
-        self.AOE = BitField(self, 0x00004000, "AOE", "Automatic output enable")
-        self.MOE = BitField(self, 0x00008000, "MOE", "Main output enable")
-        self.BKF = BitField(self, 0x000F0000, "BKF", "Break filter")
-        self.BKDSRM = BitField(self, 0x04000000, "BKDSRM", "BKDSRM")
-        self.BKBID = BitField(self, 0x10000000, "BKBID", "BKBID")
-
-class SA_TIM15_DTR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DTR2", "timer Deadtime Register 2")
-        self.DTGF = BitField(self, 0x000000FF, "DTGF", "Dead-time generator setup")
-        self.DTAE = BitField(self, 0x00010000, "DTAE", "Deadtime Asymmetric Enable")
-        self.DTPE = BitField(self, 0x00020000, "DTPE", "Deadtime Preload Enable")
-
-class SA_TIM15_TISEL(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TISEL", "TIM timer input selection register")
-        self.TI1SEL = BitField(self, 0x0000000F, "TI1SEL", "TI1[0] to TI1[15] input selection")
-        self.TI2SEL = BitField(self, 0x00000F00, "TI2SEL", "TI2[0] to TI2[15] input selection")
-        self.TISEL = Subscriptor(self, "TI{}SEL")
-
-class SA_TIM15_AF1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AF1", "TIM alternate function option register 1")
-        self.BKCMP4P = BitField(self, 0x00002000, "BKCMP4P", "BRK COMP4 input polarity")
-        self.BKCMP3P = BitField(self, 0x00001000, "BKCMP3P", "BRK COMP3 input polarity")
-        self.BKCMP2P = BitField(self, 0x00000800, "BKCMP2P", "BRK COMP2 input polarity")
-        self.BKCMP1P = BitField(self, 0x00000400, "BKCMP1P", "BRK COMP1 input polarity")
-        self.BKINP = BitField(self, 0x00000200, "BKINP", "BRK BKIN input polarity")
-        self.BKCMP7E = BitField(self, 0x00000080, "BKCMP7E", "BRK COMP7 enable")
-        self.BKCMP6E = BitField(self, 0x00000040, "BKCMP6E", "BRK COMP6 enable")
-        self.BKCMP5E = BitField(self, 0x00000020, "BKCMP5E", "BRK COMP5 enable")
-        self.BKCMP4E = BitField(self, 0x00000010, "BKCMP4E", "BRK COMP4 enable")
-        self.BKCMP3E = BitField(self, 0x00000008, "BKCMP3E", "BRK COMP3 enable")
-        self.BKCMP2E = BitField(self, 0x00000004, "BKCMP2E", "BRK COMP2 enable")
-        self.BKCMP1E = BitField(self, 0x00000002, "BKCMP1E", "BRK COMP1 enable")
-        self.BKINE = BitField(self, 0x00000001, "BKINE", "BRK BKIN input enable")
-        self.BKCMPP = Subscriptor(self, "BKCMP{}P")
-        self.BKCMPE = Subscriptor(self, "BKCMP{}E")
-
-class SA_TIM15_AF2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AF2", "TIM alternate function option register 2")
-        self.OCRSEL = BitField(self, 0x00070000, "OCRSEL", "OCREF_CLR source selection")
-
-class SA_TIM15_DCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DCR", "DMA control register")
-        self.DBL = BitField(self, 0x00001F00, "DBL", "DMA burst length")
-        self.DBA = BitField(self, 0x0000001F, "DBA", "DMA base address")
-
-class SA_TIM15_DMAR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DMAR", "DMA address for full transfer")
-        self.DMAB = BitField(self, 0xFFFFFFFF, "DMAB", "DMA register for burst accesses")
-
-class SA_TIM15_CCMR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1", "capture/compare mode register")
-        self.OC2M = BitField(self, 0x01007000, "OC2M", "OC2M")
-        self.OC2PE = BitField(self, 0x00000800, "OC2PE", "OC2PE")
-        self.OC2FE = BitField(self, 0x00000400, "OC2FE", "OC2FE")
-        self.CC2S = BitField(self, 0x00000300, "CC2S", "CC2S")
-        self.OC1CE = BitField(self, 0x00000080, "OC1CE", "OC1CE")
-        self.OC1M = BitField(self, 0x00010070, "OC1M", "Output Compare 1 mode")
-        self.OC1PE = BitField(self, 0x00000008, "OC1PE", "Output Compare 1 preload enable")
-        self.OC1FE = BitField(self, 0x00000004, "OC1FE", "Output Compare 1 fast enable")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-        self.IC2F = BitField(self, 0x0000F000, "IC2F", "IC2F")
-        self.IC2PSC = BitField(self, 0x00000C00, "IC2PSC", "IC2PSC")
-        self.IC1F = BitField(self, 0x000000F0, "IC1F", "Input capture 1 filter")
-        self.IC1PSC = BitField(self, 0x0000000C, "IC1PSC", "Input capture 1 prescaler")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.ICF = Subscriptor(self, "IC{}F")
-        self.ICPSC = Subscriptor(self, "IC{}PSC")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.CCS = Subscriptor(self, "CC{}S")
-
-class SA_TIM15(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "General purpose timers")
-        self.CR1 = SA_TIM15_CR1(self, 0x0)
-        self.CR2 = SA_TIM15_CR2(self, 0x4)
-        self.SMCR = SA_TIM15_SMCR(self, 0x8)
-        self.DIER = SA_TIM15_DIER(self, 0xC)
-        self.SR = SA_TIM15_SR(self, 0x10)
-        self.EGR = SA_TIM15_EGR(self, 0x14)
-        self.CCMR1_Output = SA_TIM15_CCMR1_Output(self, 0x18)
-        self.CCMR1_Input = SA_TIM15_CCMR1_Input(self, 0x18)
-        self.CCER = SA_TIM15_CCER(self, 0x20)
-        self.CNT = SA_TIM15_CNT(self, 0x24)
-        self.PSC = SA_TIM15_PSC(self, 0x28)
-        self.ARR = SA_TIM15_ARR(self, 0x2C)
-        self.RCR = SA_TIM15_RCR(self, 0x30)
-        self.CCR1 = SA_TIM15_CCR1(self, 0x34)
-        self.CCR2 = SA_TIM15_CCR2(self, 0x38)
-        self.BDTR = SA_TIM15_BDTR(self, 0x44)
-        self.DTR2 = SA_TIM15_DTR2(self, 0x54)
-        self.TISEL = SA_TIM15_TISEL(self, 0x5C)
-        self.AF1 = SA_TIM15_AF1(self, 0x60)
-        self.AF2 = SA_TIM15_AF2(self, 0x64)
-        self.DCR = SA_TIM15_DCR(self, 0x3DC)
-        self.DMAR = SA_TIM15_DMAR(self, 0x3E0)
-        self.CCMR1 = SA_TIM15_CCMR1(self, 0x18)
-        self.AF = Subscriptor(self, "AF{}")
-        self.CCR = Subscriptor(self, "CCR{}")
-
-TIM15 = SA_TIM15(0x40014000, "TIM15")
-
-class SA_TIM16_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR1", "control register 1")
-        self.CEN = BitField(self, 0x00000001, "CEN", "Counter enable")
-        self.UDIS = BitField(self, 0x00000002, "UDIS", "Update disable")
-        self.URS = BitField(self, 0x00000004, "URS", "Update request source")
-        self.OPM = BitField(self, 0x00000008, "OPM", "One-pulse mode")
-        self.ARPE = BitField(self, 0x00000080, "ARPE", "Auto-reload preload enable")
-        self.CKD = BitField(self, 0x00000300, "CKD", "Clock division")
-        self.UIFREMAP = BitField(self, 0x00000800, "UIFREMAP", "UIF status bit remapping")
-        self.DITHEN = BitField(self, 0x00001000, "DITHEN", "Dithering Enable")
-
-class SA_TIM16_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR2", "control register 2")
-        self.OIS1N = BitField(self, 0x00000200, "OIS1N", "Output Idle state 1")
-        self.OIS1 = BitField(self, 0x00000100, "OIS1", "Output Idle state 1")
-        self.CCDS = BitField(self, 0x00000008, "CCDS", "Capture/compare DMA selection")
-        self.CCUS = BitField(self, 0x00000004, "CCUS", "Capture/compare control update selection")
-        self.CCPC = BitField(self, 0x00000001, "CCPC", "Capture/compare preloaded control")
-
-class SA_TIM16_DIER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DIER", "DMA/Interrupt enable register")
-        self.COMDE = BitField(self, 0x00002000, "COMDE", "COM DMA request enable")
-        self.CC1DE = BitField(self, 0x00000200, "CC1DE", "Capture/Compare 1 DMA request enable")
-        self.UDE = BitField(self, 0x00000100, "UDE", "Update DMA request enable")
-        self.BIE = BitField(self, 0x00000080, "BIE", "Break interrupt enable")
-        self.COMIE = BitField(self, 0x00000020, "COMIE", "COM interrupt enable")
-        self.CC1IE = BitField(self, 0x00000002, "CC1IE", "Capture/Compare 1 interrupt enable")
-        self.UIE = BitField(self, 0x00000001, "UIE", "Update interrupt enable")
-
-class SA_TIM16_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "status register")
-        self.CC1OF = BitField(self, 0x00000200, "CC1OF", "Capture/Compare 1 overcapture flag")
-        self.BIF = BitField(self, 0x00000080, "BIF", "Break interrupt flag")
-        self.COMIF = BitField(self, 0x00000020, "COMIF", "COM interrupt flag")
-        self.CC1IF = BitField(self, 0x00000002, "CC1IF", "Capture/compare 1 interrupt flag")
-        self.UIF = BitField(self, 0x00000001, "UIF", "Update interrupt flag")
-
-class SA_TIM16_EGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EGR", "event generation register")
-        self.BG = BitField(self, 0x00000080, "BG", "Break generation")
-        self.COMG = BitField(self, 0x00000020, "COMG", "Capture/Compare control update generation")
-        self.CC1G = BitField(self, 0x00000002, "CC1G", "Capture/compare 1 generation")
-        self.UG = BitField(self, 0x00000001, "UG", "Update generation")
-
-class SA_TIM16_CCMR1_Output(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1_Output", "capture/compare mode register (output mode)")
-        self.OC1M = BitField(self, 0x00010070, "OC1M", "Output Compare 1 mode")
-        self.OC1PE = BitField(self, 0x00000008, "OC1PE", "Output Compare 1 preload enable")
-        self.OC1FE = BitField(self, 0x00000004, "OC1FE", "Output Compare 1 fast enable")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-
-class SA_TIM16_CCMR1_Input(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1_Input", "capture/compare mode register 1 (input mode)")
-        self.IC1F = BitField(self, 0x000000F0, "IC1F", "Input capture 1 filter")
-        self.IC1PSC = BitField(self, 0x0000000C, "IC1PSC", "Input capture 1 prescaler")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-
-class SA_TIM16_CCER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCER", "capture/compare enable register")
-        self.CC1NP = BitField(self, 0x00000008, "CC1NP", "Capture/Compare 1 output Polarity")
-        self.CC1NE = BitField(self, 0x00000004, "CC1NE", "Capture/Compare 1 complementary output enable")
-        self.CC1P = BitField(self, 0x00000002, "CC1P", "Capture/Compare 1 output Polarity")
-        self.CC1E = BitField(self, 0x00000001, "CC1E", "Capture/Compare 1 output enable")
-
-class SA_TIM16_CNT(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNT", "counter")
-        self.CNT = BitField(self, 0x0000FFFF, "CNT", "counter value")
-        self.UIFCPY = BitField(self, 0x80000000, "UIFCPY", "UIF Copy")
-
-class SA_TIM16_PSC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PSC", "prescaler")
-        self.PSC = BitField(self, 0x0000FFFF, "PSC", "Prescaler value")
-
-class SA_TIM16_ARR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFF, "ARR", "auto-reload register")
-        self.ARR = BitField(self, 0x0000FFFF, "ARR", "Auto-reload value")
-
-class SA_TIM16_RCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RCR", "repetition counter register")
-        self.REP = BitField(self, 0x000000FF, "REP", "Repetition counter value")
-
-class SA_TIM16_CCR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR1", "capture/compare register 1")
-        self.CCR1 = BitField(self, 0x0000FFFF, "CCR1", "Capture/Compare 1 value")
-
-class SA_TIM16_BDTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BDTR", "break and dead-time register")
-        self.DTG = BitField(self, 0x000000FF, "DTG", "Dead-time generator setup")
-        self.LOCK = BitField(self, 0x00000300, "LOCK", "Lock configuration")
-        self.OSSI = BitField(self, 0x00000400, "OSSI", "Off-state selection for Idle mode")
-        self.OSSR = BitField(self, 0x00000800, "OSSR", "Off-state selection for Run mode")
-        self.BKE = BitField(self, 0x00001000, "BKE", "Break enable")
-        self.BKP = BitField(self, 0x00002000, "BKP", "Break polarity")
-        self.AOE = BitField(self, 0x00004000, "AOE", "Automatic output enable")
-        self.MOE = BitField(self, 0x00008000, "MOE", "Main output enable")
-        self.BKF = BitField(self, 0x000F0000, "BKF", "Break filter")
-        self.BKDSRM = BitField(self, 0x04000000, "BKDSRM", "BKDSRM")
-        self.BKBID = BitField(self, 0x10000000, "BKBID", "BKBID")
-
-class SA_TIM16_DTR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DTR2", "timer Deadtime Register 2")
-        self.DTGF = BitField(self, 0x000000FF, "DTGF", "Dead-time generator setup")
-        self.DTAE = BitField(self, 0x00010000, "DTAE", "Deadtime Asymmetric Enable")
-        self.DTPE = BitField(self, 0x00020000, "DTPE", "Deadtime Preload Enable")
-
-class SA_TIM16_TISEL(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TISEL", "TIM timer input selection register")
-        self.TI1SEL = BitField(self, 0x0000000F, "TI1SEL", "TI1[0] to TI1[15] input selection")
-
-class SA_TIM16_AF1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AF1", "TIM alternate function option register 1")
-        self.BKCMP4P = BitField(self, 0x00002000, "BKCMP4P", "BRK COMP4 input polarity")
-        self.BKCMP3P = BitField(self, 0x00001000, "BKCMP3P", "BRK COMP3 input polarity")
-        self.BKCMP2P = BitField(self, 0x00000800, "BKCMP2P", "BRK COMP2 input polarity")
-        self.BKCMP1P = BitField(self, 0x00000400, "BKCMP1P", "BRK COMP1 input polarity")
-        self.BKINP = BitField(self, 0x00000200, "BKINP", "BRK BKIN input polarity")
-        self.BKCMP7E = BitField(self, 0x00000080, "BKCMP7E", "BRK COMP7 enable")
-        self.BKCMP6E = BitField(self, 0x00000040, "BKCMP6E", "BRK COMP6 enable")
-        self.BKCMP5E = BitField(self, 0x00000020, "BKCMP5E", "BRK COMP5 enable")
-        self.BKCMP4E = BitField(self, 0x00000010, "BKCMP4E", "BRK COMP4 enable")
-        self.BKCMP3E = BitField(self, 0x00000008, "BKCMP3E", "BRK COMP3 enable")
-        self.BKCMP2E = BitField(self, 0x00000004, "BKCMP2E", "BRK COMP2 enable")
-        self.BKCMP1E = BitField(self, 0x00000002, "BKCMP1E", "BRK COMP1 enable")
-        self.BKINE = BitField(self, 0x00000001, "BKINE", "BRK BKIN input enable")
-        self.BKCMPP = Subscriptor(self, "BKCMP{}P")
-        self.BKCMPE = Subscriptor(self, "BKCMP{}E")
-
-class SA_TIM16_AF2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AF2", "TIM alternate function option register 2")
-        self.OCRSEL = BitField(self, 0x00070000, "OCRSEL", "OCREF_CLR source selection")
-
-class SA_TIM16_OR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OR1", "TIM option register 1")
-        self.HSE32EN = BitField(self, 0x00000001, "HSE32EN", "HSE Divided by 32 enable")
-
-class SA_TIM16_DCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DCR", "DMA control register")
-        self.DBL = BitField(self, 0x00001F00, "DBL", "DMA burst length")
-        self.DBA = BitField(self, 0x0000001F, "DBA", "DMA base address")
-
-class SA_TIM16_DMAR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DMAR", "DMA address for full transfer")
-        self.DMAB = BitField(self, 0xFFFFFFFF, "DMAB", "DMA register for burst accesses")
-
-class SA_TIM16_CCMR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1", "capture/compare mode register")
-        self.OC1M = BitField(self, 0x00010070, "OC1M", "Output Compare 1 mode")
-        self.OC1PE = BitField(self, 0x00000008, "OC1PE", "Output Compare 1 preload enable")
-        self.OC1FE = BitField(self, 0x00000004, "OC1FE", "Output Compare 1 fast enable")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-        self.IC1F = BitField(self, 0x000000F0, "IC1F", "Input capture 1 filter")
-        self.IC1PSC = BitField(self, 0x0000000C, "IC1PSC", "Input capture 1 prescaler")
-
-class SA_TIM16(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "General purpose timers")
-        self.CR1 = SA_TIM16_CR1(self, 0x0)
-        self.CR2 = SA_TIM16_CR2(self, 0x4)
-        self.DIER = SA_TIM16_DIER(self, 0xC)
-        self.SR = SA_TIM16_SR(self, 0x10)
-        self.EGR = SA_TIM16_EGR(self, 0x14)
-        self.CCMR1_Output = SA_TIM16_CCMR1_Output(self, 0x18)
-        self.CCMR1_Input = SA_TIM16_CCMR1_Input(self, 0x18)
-        self.CCER = SA_TIM16_CCER(self, 0x20)
-        self.CNT = SA_TIM16_CNT(self, 0x24)
-        self.PSC = SA_TIM16_PSC(self, 0x28)
-        self.ARR = SA_TIM16_ARR(self, 0x2C)
-        self.RCR = SA_TIM16_RCR(self, 0x30)
-        self.CCR1 = SA_TIM16_CCR1(self, 0x34)
-        self.BDTR = SA_TIM16_BDTR(self, 0x44)
-        self.DTR2 = SA_TIM16_DTR2(self, 0x54)
-        self.TISEL = SA_TIM16_TISEL(self, 0x5C)
-        self.AF1 = SA_TIM16_AF1(self, 0x60)
-        self.AF2 = SA_TIM16_AF2(self, 0x64)
-        self.OR1 = SA_TIM16_OR1(self, 0x68)
-        self.DCR = SA_TIM16_DCR(self, 0x3DC)
-        self.DMAR = SA_TIM16_DMAR(self, 0x3E0)
-        self.CCMR1 = SA_TIM16_CCMR1(self, 0x18)
-        self.AF = Subscriptor(self, "AF{}")
-
-TIM16 = SA_TIM16(0x40014400, "TIM16")
-TIM17 = SA_TIM16(0x40014800, "TIM17")
-
-class SA_TIM1_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR1", "control register 1")
-        self.DITHEN = BitField(self, 0x00001000, "DITHEN", "Dithering Enable")
-        self.UIFREMAP = BitField(self, 0x00000800, "UIFREMAP", "UIF status bit remapping")
-        self.CKD = BitField(self, 0x00000300, "CKD", "Clock division")
-        self.ARPE = BitField(self, 0x00000080, "ARPE", "Auto-reload preload enable")
-        self.CMS = BitField(self, 0x00000060, "CMS", "Center-aligned mode selection")
-        self.DIR = BitField(self, 0x00000010, "DIR", "Direction")
-        self.OPM = BitField(self, 0x00000008, "OPM", "One-pulse mode")
-        self.URS = BitField(self, 0x00000004, "URS", "Update request source")
-        self.UDIS = BitField(self, 0x00000002, "UDIS", "Update disable")
-        self.CEN = BitField(self, 0x00000001, "CEN", "Counter enable")
-
-class SA_TIM1_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR2", "control register 2")
-        self.MMS2 = BitField(self, 0x00F00000, "MMS2", "Master mode selection 2")
-        self.OIS6 = BitField(self, 0x00040000, "OIS6", "Output Idle state 6 (OC6 output)")
-        self.OIS5 = BitField(self, 0x00010000, "OIS5", "Output Idle state 5 (OC5 output)")
-        self.OIS4N = BitField(self, 0x00008000, "OIS4N", "Output Idle state 4 (OC4N output)")
-        self.OIS4 = BitField(self, 0x00004000, "OIS4", "Output Idle state 4")
-        self.OIS3N = BitField(self, 0x00002000, "OIS3N", "Output Idle state 3")
-        self.OIS3 = BitField(self, 0x00001000, "OIS3", "Output Idle state 3")
-        self.OIS2N = BitField(self, 0x00000800, "OIS2N", "Output Idle state 2")
-        self.OIS2 = BitField(self, 0x00000400, "OIS2", "Output Idle state 2")
-        self.OIS1N = BitField(self, 0x00000200, "OIS1N", "Output Idle state 1")
-        self.OIS1 = BitField(self, 0x00000100, "OIS1", "Output Idle state 1")
-        self.TI1S = BitField(self, 0x00000080, "TI1S", "TI1 selection")
-        self.MMS = BitField(self, 0x02000070, "MMS", "Master mode selection")
-        self.CCDS = BitField(self, 0x00000008, "CCDS", "Capture/compare DMA selection")
-        self.CCUS = BitField(self, 0x00000004, "CCUS", "Capture/compare control update selection")
-        self.CCPC = BitField(self, 0x00000001, "CCPC", "Capture/compare preloaded control")
-        self.OISN = Subscriptor(self, "OIS{}N")
-        self.OIS = Subscriptor(self, "OIS{}")
-
-class SA_TIM1_SMCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SMCR", "slave mode control register")
-        self.SMSPS = BitField(self, 0x02000000, "SMSPS", "SMS Preload Source")
-        self.SMSPE = BitField(self, 0x01000000, "SMSPE", "SMS Preload Enable")
-        self.ETP = BitField(self, 0x00008000, "ETP", "External trigger polarity")
-        self.ECE = BitField(self, 0x00004000, "ECE", "External clock enable")
-        self.ETPS = BitField(self, 0x00003000, "ETPS", "External trigger prescaler")
-        self.ETF = BitField(self, 0x00000F00, "ETF", "External trigger filter")
-        self.MSM = BitField(self, 0x00000080, "MSM", "Master/Slave mode")
-        self.TS = BitField(self, 0x00300070, "TS", "Trigger selection")
-        self.OCCS = BitField(self, 0x00000008, "OCCS", "OCREF clear selection")
-        self.SMS = BitField(self, 0x00010007, "SMS", "Slave mode selection")
-
-class SA_TIM1_DIER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DIER", "DMA/Interrupt enable register")
-        self.TERRIE = BitField(self, 0x00800000, "TERRIE", "Transition Error interrupt enable")
-        self.IERRIE = BitField(self, 0x00400000, "IERRIE", "Index Error interrupt enable")
-        self.DIRIE = BitField(self, 0x00200000, "DIRIE", "Direction Change interrupt enable")
-        self.IDXIE = BitField(self, 0x00100000, "IDXIE", "Index interrupt enable")
-        self.TDE = BitField(self, 0x00004000, "TDE", "Trigger DMA request enable")
-        self.COMDE = BitField(self, 0x00002000, "COMDE", "COM DMA request enable")
-        self.CC4DE = BitField(self, 0x00001000, "CC4DE", "Capture/Compare 4 DMA request enable")
-        self.CC3DE = BitField(self, 0x00000800, "CC3DE", "Capture/Compare 3 DMA request enable")
-        self.CC2DE = BitField(self, 0x00000400, "CC2DE", "Capture/Compare 2 DMA request enable")
-        self.CC1DE = BitField(self, 0x00000200, "CC1DE", "Capture/Compare 1 DMA request enable")
-        self.UDE = BitField(self, 0x00000100, "UDE", "Update DMA request enable")
-        self.TIE = BitField(self, 0x00000040, "TIE", "Trigger interrupt enable")
-        self.CC4IE = BitField(self, 0x00000010, "CC4IE", "Capture/Compare 4 interrupt enable")
-        self.CC3IE = BitField(self, 0x00000008, "CC3IE", "Capture/Compare 3 interrupt enable")
-        self.CC2IE = BitField(self, 0x00000004, "CC2IE", "Capture/Compare 2 interrupt enable")
-        self.CC1IE = BitField(self, 0x00000002, "CC1IE", "Capture/Compare 1 interrupt enable")
-        self.UIE = BitField(self, 0x00000001, "UIE", "Update interrupt enable")
-        self.BIE = BitField(self, 0x00000080, "BIE", "Break interrupt enable")
-        self.COMIE = BitField(self, 0x00000020, "COMIE", "COM interrupt enable")
-        self.CCDE = Subscriptor(self, "CC{}DE")
-        self.CCIE = Subscriptor(self, "CC{}IE")
-
-class SA_TIM1_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "status register")
-        self.TERRF = BitField(self, 0x00800000, "TERRF", "Transition Error interrupt flag")
-        self.IERRF = BitField(self, 0x00400000, "IERRF", "Index Error interrupt flag")
-        self.DIRF = BitField(self, 0x00200000, "DIRF", "Direction Change interrupt flag")
-        self.IDXF = BitField(self, 0x00100000, "IDXF", "Index interrupt flag")
-        self.CC6IF = BitField(self, 0x00020000, "CC6IF", "Compare 6 interrupt flag")
-        self.CC5IF = BitField(self, 0x00010000, "CC5IF", "Compare 5 interrupt flag")
-        self.SBIF = BitField(self, 0x00002000, "SBIF", "System Break interrupt flag")
-        self.CC4OF = BitField(self, 0x00001000, "CC4OF", "Capture/Compare 4 overcapture flag")
-        self.CC3OF = BitField(self, 0x00000800, "CC3OF", "Capture/Compare 3 overcapture flag")
-        self.CC2OF = BitField(self, 0x00000400, "CC2OF", "Capture/compare 2 overcapture flag")
-        self.CC1OF = BitField(self, 0x00000200, "CC1OF", "Capture/Compare 1 overcapture flag")
-        self.B2IF = BitField(self, 0x00000100, "B2IF", "Break 2 interrupt flag")
-        self.BIF = BitField(self, 0x00000080, "BIF", "Break interrupt flag")
-        self.TIF = BitField(self, 0x00000040, "TIF", "Trigger interrupt flag")
-        self.COMIF = BitField(self, 0x00000020, "COMIF", "COM interrupt flag")
-        self.CC4IF = BitField(self, 0x00000010, "CC4IF", "Capture/Compare 4 interrupt flag")
-        self.CC3IF = BitField(self, 0x00000008, "CC3IF", "Capture/Compare 3 interrupt flag")
-        self.CC2IF = BitField(self, 0x00000004, "CC2IF", "Capture/Compare 2 interrupt flag")
-        self.CC1IF = BitField(self, 0x00000002, "CC1IF", "Capture/compare 1 interrupt flag")
-        self.UIF = BitField(self, 0x00000001, "UIF", "Update interrupt flag")
-        self.CCIF = Subscriptor(self, "CC{}IF")
-        self.CCOF = Subscriptor(self, "CC{}OF")
-
-class SA_TIM1_EGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EGR", "event generation register")
-        self.B2G = BitField(self, 0x00000100, "B2G", "Break 2 generation")
-        self.BG = BitField(self, 0x00000080, "BG", "Break generation")
-        self.TG = BitField(self, 0x00000040, "TG", "Trigger generation")
-        self.COMG = BitField(self, 0x00000020, "COMG", "Capture/Compare control update generation")
-        self.CC4G = BitField(self, 0x00000010, "CC4G", "Capture/compare 4 generation")
-        self.CC3G = BitField(self, 0x00000008, "CC3G", "Capture/compare 3 generation")
-        self.CC2G = BitField(self, 0x00000004, "CC2G", "Capture/compare 2 generation")
-        self.CC1G = BitField(self, 0x00000002, "CC1G", "Capture/compare 1 generation")
-        self.UG = BitField(self, 0x00000001, "UG", "Update generation")
-        self.CCG = Subscriptor(self, "CC{}G")
-
-class SA_TIM1_CCMR1_Output(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1_Output", "capture/compare mode register 1 (output mode)")
-        self.OC2CE = BitField(self, 0x00008000, "OC2CE", "Output Compare 2 clear enable")
-        self.OC2M = BitField(self, 0x01007000, "OC2M", "Output Compare 2 mode")
-        self.OC2PE = BitField(self, 0x00000800, "OC2PE", "Output Compare 2 preload enable")
-        self.OC2FE = BitField(self, 0x00000400, "OC2FE", "Output Compare 2 fast enable")
-        self.CC2S = BitField(self, 0x00000300, "CC2S", "Capture/Compare 2 selection")
-        self.OC1CE = BitField(self, 0x00000080, "OC1CE", "Output Compare 1 clear enable")
-        self.OC1M = BitField(self, 0x00010070, "OC1M", "Output Compare 1 mode")
-        self.OC1PE = BitField(self, 0x00000008, "OC1PE", "Output Compare 1 preload enable")
-        self.OC1FE = BitField(self, 0x00000004, "OC1FE", "Output Compare 1 fast enable")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.CCS = Subscriptor(self, "CC{}S")
-
-class SA_TIM1_CCMR1_Input(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1_Input", "capture/compare mode register 1 (input mode)")
-        self.IC2F = BitField(self, 0x0000F000, "IC2F", "Input capture 2 filter")
-        self.IC2PSC = BitField(self, 0x00000C00, "IC2PSC", "Input capture 2 prescaler")
-        self.CC2S = BitField(self, 0x00000300, "CC2S", "Capture/Compare 2 selection")
-        self.IC1F = BitField(self, 0x000000F0, "IC1F", "Input capture 1 filter")
-        self.ICPCS = BitField(self, 0x0000000C, "ICPCS", "Input capture 1 prescaler")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-        self.CCS = Subscriptor(self, "CC{}S")
-        self.ICF = Subscriptor(self, "IC{}F")
-
-class SA_TIM1_CCMR2_Output(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR2_Output", "capture/compare mode register 2 (output mode)")
-        self.OC4CE = BitField(self, 0x00008000, "OC4CE", "Output compare 4 clear enable")
-        self.OC4M = BitField(self, 0x01007000, "OC4M", "Output compare 4 mode")
-        self.OC4PE = BitField(self, 0x00000800, "OC4PE", "Output compare 4 preload enable")
-        self.OC4FE = BitField(self, 0x00000400, "OC4FE", "Output compare 4 fast enable")
-        self.CC4S = BitField(self, 0x00000300, "CC4S", "Capture/Compare 4 selection")
-        self.OC3CE = BitField(self, 0x00000080, "OC3CE", "Output compare 3 clear enable")
-        self.OC3M = BitField(self, 0x00010070, "OC3M", "Output compare 3 mode")
-        self.OC3PE = BitField(self, 0x00000008, "OC3PE", "Output compare 3 preload enable")
-        self.OC3FE = BitField(self, 0x00000004, "OC3FE", "Output compare 3 fast enable")
-        self.CC3S = BitField(self, 0x00000003, "CC3S", "Capture/Compare 3 selection")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.CCS = Subscriptor(self, "CC{}S")
-
-class SA_TIM1_CCMR2_Input(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR2_Input", "capture/compare mode register 2 (input mode)")
-        self.IC4F = BitField(self, 0x0000F000, "IC4F", "Input capture 4 filter")
-        self.IC4PSC = BitField(self, 0x00000C00, "IC4PSC", "Input capture 4 prescaler")
-        self.CC4S = BitField(self, 0x00000300, "CC4S", "Capture/Compare 4 selection")
-        self.IC3F = BitField(self, 0x000000F0, "IC3F", "Input capture 3 filter")
-        self.IC3PSC = BitField(self, 0x0000000C, "IC3PSC", "Input capture 3 prescaler")
-        self.CC3S = BitField(self, 0x00000003, "CC3S", "Capture/compare 3 selection")
-        self.CCS = Subscriptor(self, "CC{}S")
-        self.ICF = Subscriptor(self, "IC{}F")
-        self.ICPSC = Subscriptor(self, "IC{}PSC")
-
-class SA_TIM1_CCER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCER", "capture/compare enable register")
-        self.CC6P = BitField(self, 0x00200000, "CC6P", "Capture/Compare 6 output polarity")
-        self.CC6E = BitField(self, 0x00100000, "CC6E", "Capture/Compare 6 output enable")
-        self.CC5P = BitField(self, 0x00020000, "CC5P", "Capture/Compare 5 output polarity")
-        self.CC5E = BitField(self, 0x00010000, "CC5E", "Capture/Compare 5 output enable")
-        self.CC4NP = BitField(self, 0x00008000, "CC4NP", "Capture/Compare 4 complementary output polarity")
-        self.CC4NE = BitField(self, 0x00004000, "CC4NE", "Capture/Compare 4 complementary output enable")
-        self.CC4P = BitField(self, 0x00002000, "CC4P", "Capture/Compare 3 output Polarity")
-        self.CC4E = BitField(self, 0x00001000, "CC4E", "Capture/Compare 4 output enable")
-        self.CC3NP = BitField(self, 0x00000800, "CC3NP", "Capture/Compare 3 output Polarity")
-        self.CC3NE = BitField(self, 0x00000400, "CC3NE", "Capture/Compare 3 complementary output enable")
-        self.CC3P = BitField(self, 0x00000200, "CC3P", "Capture/Compare 3 output Polarity")
-        self.CC3E = BitField(self, 0x00000100, "CC3E", "Capture/Compare 3 output enable")
-        self.CC2NP = BitField(self, 0x00000080, "CC2NP", "Capture/Compare 2 output Polarity")
-        self.CC2NE = BitField(self, 0x00000040, "CC2NE", "Capture/Compare 2 complementary output enable")
-        self.CC2P = BitField(self, 0x00000020, "CC2P", "Capture/Compare 2 output Polarity")
-        self.CC2E = BitField(self, 0x00000010, "CC2E", "Capture/Compare 2 output enable")
-        self.CC1NP = BitField(self, 0x00000008, "CC1NP", "Capture/Compare 1 output Polarity")
-        self.CC1NE = BitField(self, 0x00000004, "CC1NE", "Capture/Compare 1 complementary output enable")
-        self.CC1P = BitField(self, 0x00000002, "CC1P", "Capture/Compare 1 output Polarity")
-        self.CC1E = BitField(self, 0x00000001, "CC1E", "Capture/Compare 1 output enable")
-        self.CCP = Subscriptor(self, "CC{}P")
-        self.CCE = Subscriptor(self, "CC{}E")
-        self.CCNE = Subscriptor(self, "CC{}NE")
-        self.CCNP = Subscriptor(self, "CC{}NP")
-
-class SA_TIM1_CNT(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNT", "counter")
-        self.UIFCPY = BitField(self, 0x80000000, "UIFCPY", "UIFCPY")
-        self.CNT = BitField(self, 0x0000FFFF, "CNT", "counter value")
-
-class SA_TIM1_PSC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PSC", "prescaler")
-        self.PSC = BitField(self, 0x0000FFFF, "PSC", "Prescaler value")
-
-class SA_TIM1_ARR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFF, "ARR", "auto-reload register")
-        self.ARR = BitField(self, 0x0000FFFF, "ARR", "Auto-reload value")
-
-class SA_TIM1_RCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RCR", "repetition counter register")
-        self.REP = BitField(self, 0x0000FFFF, "REP", "Repetition counter value")
-
-class SA_TIM1_CCR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR1", "capture/compare register 1")
-        self.CCR1 = BitField(self, 0x0000FFFF, "CCR1", "Capture/Compare 1 value")
-
-class SA_TIM1_CCR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR2", "capture/compare register 2")
-        self.CCR2 = BitField(self, 0x0000FFFF, "CCR2", "Capture/Compare 2 value")
-
-class SA_TIM1_CCR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR3", "capture/compare register 3")
-        self.CCR3 = BitField(self, 0x0000FFFF, "CCR3", "Capture/Compare value")
-
-class SA_TIM1_CCR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR4", "capture/compare register 4")
-        self.CCR4 = BitField(self, 0x0000FFFF, "CCR4", "Capture/Compare value")
-
-class SA_TIM1_BDTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BDTR", "break and dead-time register")
-        self.BK2ID = BitField(self, 0x20000000, "BK2ID", "BK2ID")
-        self.BKBID = BitField(self, 0x10000000, "BKBID", "BKBID")
-        self.BK2DSRM = BitField(self, 0x08000000, "BK2DSRM", "BK2DSRM")
-        self.BKDSRM = BitField(self, 0x04000000, "BKDSRM", "BKDSRM")
-        self.BK2P = BitField(self, 0x02000000, "BK2P", "Break 2 polarity")
-        self.BK2E = BitField(self, 0x01000000, "BK2E", "Break 2 Enable")
-        self.BK2F = BitField(self, 0x00F00000, "BK2F", "Break 2 filter")
-        self.BKF = BitField(self, 0x000F0000, "BKF", "Break filter")
-        self.MOE = BitField(self, 0x00008000, "MOE", "Main output enable")
-        self.AOE = BitField(self, 0x00004000, "AOE", "Automatic output enable")
-        self.BKP = BitField(self, 0x00002000, "BKP", "Break polarity")
-        self.BKE = BitField(self, 0x00001000, "BKE", "Break enable")
-        self.OSSR = BitField(self, 0x00000800, "OSSR", "Off-state selection for Run mode")
-        self.OSSI = BitField(self, 0x00000400, "OSSI", "Off-state selection for Idle mode")
-        self.LOCK = BitField(self, 0x00000300, "LOCK", "Lock configuration")
-        self.DTG = BitField(self, 0x000000FF, "DTG", "Dead-time generator setup")
-
-class SA_TIM1_CCR5(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR5", "capture/compare register 4")
-        self.CCR5 = BitField(self, 0x0000FFFF, "CCR5", "Capture/Compare value")
-        self.GC5C1 = BitField(self, 0x20000000, "GC5C1", "Group Channel 5 and Channel 1")
-        self.GC5C2 = BitField(self, 0x40000000, "GC5C2", "Group Channel 5 and Channel 2")
-        self.GC5C3 = BitField(self, 0x80000000, "GC5C3", "Group Channel 5 and Channel 3")
-        self.GC5C = Subscriptor(self, "GC5C{}")
-
-class SA_TIM1_CCR6(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR6", "capture/compare register 4")
-        self.CCR6 = BitField(self, 0x0000FFFF, "CCR6", "Capture/Compare value")
-
-class SA_TIM1_CCMR3_Output(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR3_Output", "capture/compare mode register 2 (output mode)")
-        self.OC6M_bit3 = BitField(self, 0x01000000, "OC6M_bit3", "Output Compare 6 mode bit 3")
-        self.OC5M_bit3 = BitField(self, 0x00070000, "OC5M_bit3", "Output Compare 5 mode bit 3")
-        self.OC6CE = BitField(self, 0x00008000, "OC6CE", "Output compare 6 clear enable")
-        self.OC6M = BitField(self, 0x00007000, "OC6M", "Output compare 6 mode")
-        self.OC6PE = BitField(self, 0x00000800, "OC6PE", "Output compare 6 preload enable")
-        self.OC6FE = BitField(self, 0x00000400, "OC6FE", "Output compare 6 fast enable")
-        self.OC5CE = BitField(self, 0x00000080, "OC5CE", "Output compare 5 clear enable")
-        self.OC5M = BitField(self, 0x00000070, "OC5M", "Output compare 5 mode")
-        self.OC5PE = BitField(self, 0x00000008, "OC5PE", "Output compare 5 preload enable")
-        self.OC5FE = BitField(self, 0x00000004, "OC5FE", "Output compare 5 fast enable")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-
-class SA_TIM1_DTR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DTR2", "timer Deadtime Register 2")
-        self.DTPE = BitField(self, 0x00020000, "DTPE", "Deadtime Preload Enable")
-        self.DTAE = BitField(self, 0x00010000, "DTAE", "Deadtime Asymmetric Enable")
-        self.DTGF = BitField(self, 0x000000FF, "DTGF", "Dead-time falling edge generator setup")
-
-class SA_TIM1_ECR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ECR", "DMA control register")
-        self.IE = BitField(self, 0x00000001, "IE", "Index Enable")
-        self.IDIR = BitField(self, 0x00000006, "IDIR", "Index Direction")
-        self.IBLK = BitField(self, 0x00000018, "IBLK", "Index Blanking")
-        self.FIDX = BitField(self, 0x00000020, "FIDX", "First Index")
-        self.IPOS = BitField(self, 0x000000C0, "IPOS", "Index Positioning")
-        self.PW = BitField(self, 0x00FF0000, "PW", "Pulse width")
-        self.PWPRSC = BitField(self, 0x07000000, "PWPRSC", "Pulse Width prescaler")
-
-class SA_TIM1_TISEL(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TISEL", "TIM timer input selection register")
-        self.TI1SEL = BitField(self, 0x0000000F, "TI1SEL", "TI1[0] to TI1[15] input selection")
-        self.TI2SEL = BitField(self, 0x00000F00, "TI2SEL", "TI2[0] to TI2[15] input selection")
-        self.TI3SEL = BitField(self, 0x000F0000, "TI3SEL", "TI3[0] to TI3[15] input selection")
-        self.TI4SEL = BitField(self, 0x0F000000, "TI4SEL", "TI4[0] to TI4[15] input selection")
-        self.TISEL = Subscriptor(self, "TI{}SEL")
-
-class SA_TIM1_AF1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AF1", "TIM alternate function option register 1")
-        self.ETRSEL = BitField(self, 0x0003C000, "ETRSEL", "ETR source selection")
-        self.BKCMP4P = BitField(self, 0x00002000, "BKCMP4P", "BRK COMP4 input polarity")
-        self.BKCMP3P = BitField(self, 0x00001000, "BKCMP3P", "BRK COMP3 input polarity")
-        self.BKCMP2P = BitField(self, 0x00000800, "BKCMP2P", "BRK COMP2 input polarity")
-        self.BKCMP1P = BitField(self, 0x00000400, "BKCMP1P", "BRK COMP1 input polarity")
-        self.BKINP = BitField(self, 0x00000200, "BKINP", "BRK BKIN input polarity")
-        self.BKCMP7E = BitField(self, 0x00000080, "BKCMP7E", "BRK COMP7 enable")
-        self.BKCMP6E = BitField(self, 0x00000040, "BKCMP6E", "BRK COMP6 enable")
-        self.BKCMP5E = BitField(self, 0x00000020, "BKCMP5E", "BRK COMP5 enable")
-        self.BKCMP4E = BitField(self, 0x00000010, "BKCMP4E", "BRK COMP4 enable")
-        self.BKCMP3E = BitField(self, 0x00000008, "BKCMP3E", "BRK COMP3 enable")
-        self.BKCMP2E = BitField(self, 0x00000004, "BKCMP2E", "BRK COMP2 enable")
-        self.BKCMP1E = BitField(self, 0x00000002, "BKCMP1E", "BRK COMP1 enable")
-        self.BKINE = BitField(self, 0x00000001, "BKINE", "BRK BKIN input enable")
-        self.BKCMPP = Subscriptor(self, "BKCMP{}P")
-        self.BKCMPE = Subscriptor(self, "BKCMP{}E")
-
-class SA_TIM1_AF2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AF2", "TIM alternate function option register 2")
-        self.OCRSEL = BitField(self, 0x00070000, "OCRSEL", "OCREF_CLR source selection")
-        self.BK2CMP4P = BitField(self, 0x00002000, "BK2CMP4P", "BRK2 COMP4 input polarity")
-        self.BK2CMP3P = BitField(self, 0x00001000, "BK2CMP3P", "BRK2 COMP3 input polarity")
-        self.BK2CMP2P = BitField(self, 0x00000800, "BK2CMP2P", "BRK2 COMP2 input polarity")
-        self.BK2CMP1P = BitField(self, 0x00000400, "BK2CMP1P", "BRK2 COMP1 input polarity")
-        self.BK2INP = BitField(self, 0x00000200, "BK2INP", "BRK2 BKIN input polarity")
-        self.BK2CMP7E = BitField(self, 0x00000080, "BK2CMP7E", "BRK2 COMP7 enable")
-        self.BK2CMP6E = BitField(self, 0x00000040, "BK2CMP6E", "BRK2 COMP6 enable")
-        self.BK2CMP5E = BitField(self, 0x00000020, "BK2CMP5E", "BRK2 COMP5 enable")
-        self.BK2CMP4E = BitField(self, 0x00000010, "BK2CMP4E", "BRK2 COMP4 enable")
-        self.BK2CMP3E = BitField(self, 0x00000008, "BK2CMP3E", "BRK2 COMP3 enable")
-        self.BK2CMP2E = BitField(self, 0x00000004, "BK2CMP2E", "BRK2 COMP2 enable")
-        self.BK2CMP1E = BitField(self, 0x00000002, "BK2CMP1E", "BRK2 COMP1 enable")
-        self.BKINE = BitField(self, 0x00000001, "BKINE", "BRK BKIN input enable")
-        self.BK2CMPP = Subscriptor(self, "BK2CMP{}P")
-        self.BK2CMPE = Subscriptor(self, "BK2CMP{}E")
-
-class SA_TIM1_DCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DCR", "control register")
-        self.DBL = BitField(self, 0x00001F00, "DBL", "DMA burst length")
-        self.DBA = BitField(self, 0x0000001F, "DBA", "DMA base address")
-
-class SA_TIM1_DMAR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DMAR", "DMA address for full transfer")
-        self.DMAB = BitField(self, 0xFFFFFFFF, "DMAB", "DMA register for burst accesses")
-
-class SA_TIM1_CCMR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1", "capture/compare mode register 1")
-        self.OC2CE = BitField(self, 0x00008000, "OC2CE", "Output Compare 2 clear enable")
-        self.OC2M = BitField(self, 0x01007000, "OC2M", "Output Compare 2 mode")
-        self.OC2PE = BitField(self, 0x00000800, "OC2PE", "Output Compare 2 preload enable")
-        self.OC2FE = BitField(self, 0x00000400, "OC2FE", "Output Compare 2 fast enable")
-        self.CC2S = BitField(self, 0x00000300, "CC2S", "Capture/Compare 2 selection")
-        self.OC1CE = BitField(self, 0x00000080, "OC1CE", "Output Compare 1 clear enable")
-        self.OC1M = BitField(self, 0x00010070, "OC1M", "Output Compare 1 mode")
-        self.OC1PE = BitField(self, 0x00000008, "OC1PE", "Output Compare 1 preload enable")
-        self.OC1FE = BitField(self, 0x00000004, "OC1FE", "Output Compare 1 fast enable")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-        self.IC2F = BitField(self, 0x0000F000, "IC2F", "Input capture 2 filter")
-        self.IC2PSC = BitField(self, 0x00000C00, "IC2PSC", "Input capture 2 prescaler")
-        self.IC1F = BitField(self, 0x000000F0, "IC1F", "Input capture 1 filter")
-        self.ICPCS = BitField(self, 0x0000000C, "ICPCS", "Input capture 1 prescaler")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.ICF = Subscriptor(self, "IC{}F")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.CCS = Subscriptor(self, "CC{}S")
-
-class SA_TIM1_CCMR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR2", "capture/compare mode register 2")
-        self.OC4CE = BitField(self, 0x00008000, "OC4CE", "Output compare 4 clear enable")
-        self.OC4M = BitField(self, 0x01007000, "OC4M", "Output compare 4 mode")
-        self.OC4PE = BitField(self, 0x00000800, "OC4PE", "Output compare 4 preload enable")
-        self.OC4FE = BitField(self, 0x00000400, "OC4FE", "Output compare 4 fast enable")
-        self.CC4S = BitField(self, 0x00000300, "CC4S", "Capture/Compare 4 selection")
-        self.OC3CE = BitField(self, 0x00000080, "OC3CE", "Output compare 3 clear enable")
-        self.OC3M = BitField(self, 0x00010070, "OC3M", "Output compare 3 mode")
-        self.OC3PE = BitField(self, 0x00000008, "OC3PE", "Output compare 3 preload enable")
-        self.OC3FE = BitField(self, 0x00000004, "OC3FE", "Output compare 3 fast enable")
-        self.CC3S = BitField(self, 0x00000003, "CC3S", "Capture/compare 3 selection")
-        self.IC4F = BitField(self, 0x0000F000, "IC4F", "Input capture 4 filter")
-        self.IC4PSC = BitField(self, 0x00000C00, "IC4PSC", "Input capture 4 prescaler")
-        self.IC3F = BitField(self, 0x000000F0, "IC3F", "Input capture 3 filter")
-        self.IC3PSC = BitField(self, 0x0000000C, "IC3PSC", "Input capture 3 prescaler")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.ICF = Subscriptor(self, "IC{}F")
-        self.ICPSC = Subscriptor(self, "IC{}PSC")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.CCS = Subscriptor(self, "CC{}S")
-
-class SA_TIM1_CCMR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR3", "capture/compare mode register 2")
-        self.OC6M_bit3 = BitField(self, 0x01000000, "OC6M_bit3", "Output Compare 6 mode bit 3")
-        self.OC5M_bit3 = BitField(self, 0x00070000, "OC5M_bit3", "Output Compare 5 mode bit 3")
-        self.OC6CE = BitField(self, 0x00008000, "OC6CE", "Output compare 6 clear enable")
-        self.OC6M = BitField(self, 0x00007000, "OC6M", "Output compare 6 mode")
-        self.OC6PE = BitField(self, 0x00000800, "OC6PE", "Output compare 6 preload enable")
-        self.OC6FE = BitField(self, 0x00000400, "OC6FE", "Output compare 6 fast enable")
-        self.OC5CE = BitField(self, 0x00000080, "OC5CE", "Output compare 5 clear enable")
-        self.OC5M = BitField(self, 0x00000070, "OC5M", "Output compare 5 mode")
-        self.OC5PE = BitField(self, 0x00000008, "OC5PE", "Output compare 5 preload enable")
-        self.OC5FE = BitField(self, 0x00000004, "OC5FE", "Output compare 5 fast enable")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-
-class SA_TIM1(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Advanced-timers")
-        self.CR1 = SA_TIM1_CR1(self, 0x0)
-        self.CR2 = SA_TIM1_CR2(self, 0x4)
-        self.SMCR = SA_TIM1_SMCR(self, 0x8)
-        self.DIER = SA_TIM1_DIER(self, 0xC)
-        self.SR = SA_TIM1_SR(self, 0x10)
-        self.EGR = SA_TIM1_EGR(self, 0x14)
-        self.CCMR1_Output = SA_TIM1_CCMR1_Output(self, 0x18)
-        self.CCMR1_Input = SA_TIM1_CCMR1_Input(self, 0x18)
-        self.CCMR2_Output = SA_TIM1_CCMR2_Output(self, 0x1C)
-        self.CCMR2_Input = SA_TIM1_CCMR2_Input(self, 0x1C)
-        self.CCER = SA_TIM1_CCER(self, 0x20)
-        self.CNT = SA_TIM1_CNT(self, 0x24)
-        self.PSC = SA_TIM1_PSC(self, 0x28)
-        self.ARR = SA_TIM1_ARR(self, 0x2C)
-        self.RCR = SA_TIM1_RCR(self, 0x30)
-        self.CCR1 = SA_TIM1_CCR1(self, 0x34)
-        self.CCR2 = SA_TIM1_CCR2(self, 0x38)
-        self.CCR3 = SA_TIM1_CCR3(self, 0x3C)
-        self.CCR4 = SA_TIM1_CCR4(self, 0x40)
-        self.BDTR = SA_TIM1_BDTR(self, 0x44)
-        self.CCR5 = SA_TIM1_CCR5(self, 0x48)
-        self.CCR6 = SA_TIM1_CCR6(self, 0x4C)
-        self.CCMR3_Output = SA_TIM1_CCMR3_Output(self, 0x50)
-        self.DTR2 = SA_TIM1_DTR2(self, 0x54)
-        self.ECR = SA_TIM1_ECR(self, 0x58)
-        self.TISEL = SA_TIM1_TISEL(self, 0x5C)
-        self.AF1 = SA_TIM1_AF1(self, 0x60)
-        self.AF2 = SA_TIM1_AF2(self, 0x64)
-        self.DCR = SA_TIM1_DCR(self, 0x3DC)
-        self.DMAR = SA_TIM1_DMAR(self, 0x3E0)
-        self.CCMR1 = SA_TIM1_CCMR1(self, 0x18)
-        self.CCMR2 = SA_TIM1_CCMR2(self, 0x1C)
-        self.CCMR3 = SA_TIM1_CCMR3(self, 0x50)
-        self.AF = Subscriptor(self, "AF{}")
-        self.CCR = Subscriptor(self, "CCR{}")
-        self.CCMR_Input = Subscriptor(self, "CCMR{}_Input")
-        self.CCMR_Output = Subscriptor(self, "CCMR{}_Output")
-        self.CCMR = Subscriptor(self, "CCMR{}")
-
-TIM1 = SA_TIM1(0x40012C00, "TIM1")
-TIM8 = SA_TIM1(0x40013400, "TIM8")
-TIM20 = SA_TIM1(0x40015000, "TIM20")
-
-class SA_TIM2_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR1", "control register 1")
-        self.DITHEN = BitField(self, 0x00001000, "DITHEN", "Dithering Enable")
-        self.UIFREMAP = BitField(self, 0x00000800, "UIFREMAP", "UIF status bit remapping")
-        self.CKD = BitField(self, 0x00000300, "CKD", "Clock division")
-        self.ARPE = BitField(self, 0x00000080, "ARPE", "Auto-reload preload enable")
-        self.CMS = BitField(self, 0x00000060, "CMS", "Center-aligned mode selection")
-        self.DIR = BitField(self, 0x00000010, "DIR", "Direction")
-        self.OPM = BitField(self, 0x00000008, "OPM", "One-pulse mode")
-        self.URS = BitField(self, 0x00000004, "URS", "Update request source")
-        self.UDIS = BitField(self, 0x00000002, "UDIS", "Update disable")
-        self.CEN = BitField(self, 0x00000001, "CEN", "Counter enable")
-
-class SA_TIM2_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR2", "control register 2")
-        self.MMS2 = BitField(self, 0x00F00000, "MMS2", "Master mode selection 2")
-        self.OIS6 = BitField(self, 0x00040000, "OIS6", "Output Idle state 6 (OC6 output)")
-        self.OIS5 = BitField(self, 0x00010000, "OIS5", "Output Idle state 5 (OC5 output)")
-        self.OIS4N = BitField(self, 0x00008000, "OIS4N", "Output Idle state 4 (OC4N output)")
-        self.OIS4 = BitField(self, 0x00004000, "OIS4", "Output Idle state 4")
-        self.OIS3N = BitField(self, 0x00002000, "OIS3N", "Output Idle state 3")
-        self.OIS3 = BitField(self, 0x00001000, "OIS3", "Output Idle state 3")
-        self.OIS2N = BitField(self, 0x00000800, "OIS2N", "Output Idle state 2")
-        self.OIS2 = BitField(self, 0x00000400, "OIS2", "Output Idle state 2")
-        self.OIS1N = BitField(self, 0x00000200, "OIS1N", "Output Idle state 1")
-        self.OIS1 = BitField(self, 0x00000100, "OIS1", "Output Idle state 1")
-        self.TI1S = BitField(self, 0x00000080, "TI1S", "TI1 selection")
-        self.MMS = BitField(self, 0x02000070, "MMS", "Master mode selection")
-        self.CCDS = BitField(self, 0x00000008, "CCDS", "Capture/compare DMA selection")
-        self.CCUS = BitField(self, 0x00000004, "CCUS", "Capture/compare control update selection")
-        self.CCPC = BitField(self, 0x00000001, "CCPC", "Capture/compare preloaded control")
-        self.OISN = Subscriptor(self, "OIS{}N")
-        self.OIS = Subscriptor(self, "OIS{}")
-
-class SA_TIM2_SMCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SMCR", "slave mode control register")
-        self.SMSPS = BitField(self, 0x02000000, "SMSPS", "SMS Preload Source")
-        self.SMSPE = BitField(self, 0x01000000, "SMSPE", "SMS Preload Enable")
-        self.ETP = BitField(self, 0x00008000, "ETP", "External trigger polarity")
-        self.ECE = BitField(self, 0x00004000, "ECE", "External clock enable")
-        self.ETPS = BitField(self, 0x00003000, "ETPS", "External trigger prescaler")
-        self.ETF = BitField(self, 0x00000F00, "ETF", "External trigger filter")
-        self.MSM = BitField(self, 0x00000080, "MSM", "Master/Slave mode")
-        self.TS = BitField(self, 0x00300070, "TS", "Trigger selection")
-        self.OCCS = BitField(self, 0x00000008, "OCCS", "OCREF clear selection")
-        self.SMS = BitField(self, 0x00010007, "SMS", "Slave mode selection")
-
-class SA_TIM2_DIER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DIER", "DMA/Interrupt enable register")
-        self.TERRIE = BitField(self, 0x00800000, "TERRIE", "Transition Error interrupt enable")
-        self.IERRIE = BitField(self, 0x00400000, "IERRIE", "Index Error interrupt enable")
-        self.DIRIE = BitField(self, 0x00200000, "DIRIE", "Direction Change interrupt enable")
-        self.IDXIE = BitField(self, 0x00100000, "IDXIE", "Index interrupt enable")
-        self.TDE = BitField(self, 0x00004000, "TDE", "Trigger DMA request enable")
-        self.COMDE = BitField(self, 0x00002000, "COMDE", "COM DMA request enable")
-        self.CC4DE = BitField(self, 0x00001000, "CC4DE", "Capture/Compare 4 DMA request enable")
-        self.CC3DE = BitField(self, 0x00000800, "CC3DE", "Capture/Compare 3 DMA request enable")
-        self.CC2DE = BitField(self, 0x00000400, "CC2DE", "Capture/Compare 2 DMA request enable")
-        self.CC1DE = BitField(self, 0x00000200, "CC1DE", "Capture/Compare 1 DMA request enable")
-        self.UDE = BitField(self, 0x00000100, "UDE", "Update DMA request enable")
-        self.TIE = BitField(self, 0x00000040, "TIE", "Trigger interrupt enable")
-        self.CC4IE = BitField(self, 0x00000010, "CC4IE", "Capture/Compare 4 interrupt enable")
-        self.CC3IE = BitField(self, 0x00000008, "CC3IE", "Capture/Compare 3 interrupt enable")
-        self.CC2IE = BitField(self, 0x00000004, "CC2IE", "Capture/Compare 2 interrupt enable")
-        self.CC1IE = BitField(self, 0x00000002, "CC1IE", "Capture/Compare 1 interrupt enable")
-        self.UIE = BitField(self, 0x00000001, "UIE", "Update interrupt enable")
-        self.BIE = BitField(self, 0x00000080, "BIE", "Break interrupt enable")
-        self.COMIE = BitField(self, 0x00000020, "COMIE", "COM interrupt enable")
-        self.CCDE = Subscriptor(self, "CC{}DE")
-        self.CCIE = Subscriptor(self, "CC{}IE")
-
-class SA_TIM2_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "status register")
-        self.TERRF = BitField(self, 0x00800000, "TERRF", "Transition Error interrupt flag")
-        self.IERRF = BitField(self, 0x00400000, "IERRF", "Index Error interrupt flag")
-        self.DIRF = BitField(self, 0x00200000, "DIRF", "Direction Change interrupt flag")
-        self.IDXF = BitField(self, 0x00100000, "IDXF", "Index interrupt flag")
-        self.CC6IF = BitField(self, 0x00020000, "CC6IF", "Compare 6 interrupt flag")
-        self.CC5IF = BitField(self, 0x00010000, "CC5IF", "Compare 5 interrupt flag")
-        self.SBIF = BitField(self, 0x00002000, "SBIF", "System Break interrupt flag")
-        self.CC4OF = BitField(self, 0x00001000, "CC4OF", "Capture/Compare 4 overcapture flag")
-        self.CC3OF = BitField(self, 0x00000800, "CC3OF", "Capture/Compare 3 overcapture flag")
-        self.CC2OF = BitField(self, 0x00000400, "CC2OF", "Capture/compare 2 overcapture flag")
-        self.CC1OF = BitField(self, 0x00000200, "CC1OF", "Capture/Compare 1 overcapture flag")
-        self.B2IF = BitField(self, 0x00000100, "B2IF", "Break 2 interrupt flag")
-        self.BIF = BitField(self, 0x00000080, "BIF", "Break interrupt flag")
-        self.TIF = BitField(self, 0x00000040, "TIF", "Trigger interrupt flag")
-        self.COMIF = BitField(self, 0x00000020, "COMIF", "COM interrupt flag")
-        self.CC4IF = BitField(self, 0x00000010, "CC4IF", "Capture/Compare 4 interrupt flag")
-        self.CC3IF = BitField(self, 0x00000008, "CC3IF", "Capture/Compare 3 interrupt flag")
-        self.CC2IF = BitField(self, 0x00000004, "CC2IF", "Capture/Compare 2 interrupt flag")
-        self.CC1IF = BitField(self, 0x00000002, "CC1IF", "Capture/compare 1 interrupt flag")
-        self.UIF = BitField(self, 0x00000001, "UIF", "Update interrupt flag")
-        self.CCIF = Subscriptor(self, "CC{}IF")
-        self.CCOF = Subscriptor(self, "CC{}OF")
-
-class SA_TIM2_EGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EGR", "event generation register")
-        self.B2G = BitField(self, 0x00000100, "B2G", "Break 2 generation")
-        self.BG = BitField(self, 0x00000080, "BG", "Break generation")
-        self.TG = BitField(self, 0x00000040, "TG", "Trigger generation")
-        self.COMG = BitField(self, 0x00000020, "COMG", "Capture/Compare control update generation")
-        self.CC4G = BitField(self, 0x00000010, "CC4G", "Capture/compare 4 generation")
-        self.CC3G = BitField(self, 0x00000008, "CC3G", "Capture/compare 3 generation")
-        self.CC2G = BitField(self, 0x00000004, "CC2G", "Capture/compare 2 generation")
-        self.CC1G = BitField(self, 0x00000002, "CC1G", "Capture/compare 1 generation")
-        self.UG = BitField(self, 0x00000001, "UG", "Update generation")
-        self.CCG = Subscriptor(self, "CC{}G")
-
-class SA_TIM2_CCMR1_Output(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1_Output", "capture/compare mode register 1 (output mode)")
-        self.OC2CE = BitField(self, 0x00008000, "OC2CE", "Output Compare 2 clear enable")
-        self.OC2M = BitField(self, 0x01007000, "OC2M", "Output Compare 2 mode")
-        self.OC2PE = BitField(self, 0x00000800, "OC2PE", "Output Compare 2 preload enable")
-        self.OC2FE = BitField(self, 0x00000400, "OC2FE", "Output Compare 2 fast enable")
-        self.CC2S = BitField(self, 0x00000300, "CC2S", "Capture/Compare 2 selection")
-        self.OC1CE = BitField(self, 0x00000080, "OC1CE", "Output Compare 1 clear enable")
-        self.OC1M = BitField(self, 0x00010070, "OC1M", "Output Compare 1 mode")
-        self.OC1PE = BitField(self, 0x00000008, "OC1PE", "Output Compare 1 preload enable")
-        self.OC1FE = BitField(self, 0x00000004, "OC1FE", "Output Compare 1 fast enable")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.CCS = Subscriptor(self, "CC{}S")
-
-class SA_TIM2_CCMR1_Input(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1_Input", "capture/compare mode register 1 (input mode)")
-        self.IC2F = BitField(self, 0x0000F000, "IC2F", "Input capture 2 filter")
-        self.IC2PSC = BitField(self, 0x00000C00, "IC2PSC", "Input capture 2 prescaler")
-        self.CC2S = BitField(self, 0x00000300, "CC2S", "Capture/Compare 2 selection")
-        self.IC1F = BitField(self, 0x000000F0, "IC1F", "Input capture 1 filter")
-        self.ICPCS = BitField(self, 0x0000000C, "ICPCS", "Input capture 1 prescaler")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-        self.CCS = Subscriptor(self, "CC{}S")
-        self.ICF = Subscriptor(self, "IC{}F")
-
-class SA_TIM2_CCMR2_Output(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR2_Output", "capture/compare mode register 2 (output mode)")
-        self.OC4CE = BitField(self, 0x00008000, "OC4CE", "Output compare 4 clear enable")
-        self.OC4M = BitField(self, 0x01007000, "OC4M", "Output compare 4 mode")
-        self.OC4PE = BitField(self, 0x00000800, "OC4PE", "Output compare 4 preload enable")
-        self.OC4FE = BitField(self, 0x00000400, "OC4FE", "Output compare 4 fast enable")
-        self.CC4S = BitField(self, 0x00000300, "CC4S", "Capture/Compare 4 selection")
-        self.OC3CE = BitField(self, 0x00000080, "OC3CE", "Output compare 3 clear enable")
-        self.OC3M = BitField(self, 0x00010070, "OC3M", "Output compare 3 mode")
-        self.OC3PE = BitField(self, 0x00000008, "OC3PE", "Output compare 3 preload enable")
-        self.OC3FE = BitField(self, 0x00000004, "OC3FE", "Output compare 3 fast enable")
-        self.CC3S = BitField(self, 0x00000003, "CC3S", "Capture/Compare 3 selection")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.CCS = Subscriptor(self, "CC{}S")
-
-class SA_TIM2_CCMR2_Input(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR2_Input", "capture/compare mode register 2 (input mode)")
-        self.IC4F = BitField(self, 0x0000F000, "IC4F", "Input capture 4 filter")
-        self.IC4PSC = BitField(self, 0x00000C00, "IC4PSC", "Input capture 4 prescaler")
-        self.CC4S = BitField(self, 0x00000300, "CC4S", "Capture/Compare 4 selection")
-        self.IC3F = BitField(self, 0x000000F0, "IC3F", "Input capture 3 filter")
-        self.IC3PSC = BitField(self, 0x0000000C, "IC3PSC", "Input capture 3 prescaler")
-        self.CC3S = BitField(self, 0x00000003, "CC3S", "Capture/compare 3 selection")
-        self.CCS = Subscriptor(self, "CC{}S")
-        self.ICF = Subscriptor(self, "IC{}F")
-        self.ICPSC = Subscriptor(self, "IC{}PSC")
-
-class SA_TIM2_CCER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCER", "capture/compare enable register")
-        self.CC6P = BitField(self, 0x00200000, "CC6P", "Capture/Compare 6 output polarity")
-        self.CC6E = BitField(self, 0x00100000, "CC6E", "Capture/Compare 6 output enable")
-        self.CC5P = BitField(self, 0x00020000, "CC5P", "Capture/Compare 5 output polarity")
-        self.CC5E = BitField(self, 0x00010000, "CC5E", "Capture/Compare 5 output enable")
-        self.CC4NP = BitField(self, 0x00008000, "CC4NP", "Capture/Compare 4 complementary output polarity")
-        self.CC4NE = BitField(self, 0x00004000, "CC4NE", "Capture/Compare 4 complementary output enable")
-        self.CC4P = BitField(self, 0x00002000, "CC4P", "Capture/Compare 3 output Polarity")
-        self.CC4E = BitField(self, 0x00001000, "CC4E", "Capture/Compare 4 output enable")
-        self.CC3NP = BitField(self, 0x00000800, "CC3NP", "Capture/Compare 3 output Polarity")
-        self.CC3NE = BitField(self, 0x00000400, "CC3NE", "Capture/Compare 3 complementary output enable")
-        self.CC3P = BitField(self, 0x00000200, "CC3P", "Capture/Compare 3 output Polarity")
-        self.CC3E = BitField(self, 0x00000100, "CC3E", "Capture/Compare 3 output enable")
-        self.CC2NP = BitField(self, 0x00000080, "CC2NP", "Capture/Compare 2 output Polarity")
-        self.CC2NE = BitField(self, 0x00000040, "CC2NE", "Capture/Compare 2 complementary output enable")
-        self.CC2P = BitField(self, 0x00000020, "CC2P", "Capture/Compare 2 output Polarity")
-        self.CC2E = BitField(self, 0x00000010, "CC2E", "Capture/Compare 2 output enable")
-        self.CC1NP = BitField(self, 0x00000008, "CC1NP", "Capture/Compare 1 output Polarity")
-        self.CC1NE = BitField(self, 0x00000004, "CC1NE", "Capture/Compare 1 complementary output enable")
-        self.CC1P = BitField(self, 0x00000002, "CC1P", "Capture/Compare 1 output Polarity")
-        self.CC1E = BitField(self, 0x00000001, "CC1E", "Capture/Compare 1 output enable")
-        self.CCP = Subscriptor(self, "CC{}P")
-        self.CCE = Subscriptor(self, "CC{}E")
-        self.CCNE = Subscriptor(self, "CC{}NE")
-        self.CCNP = Subscriptor(self, "CC{}NP")
-
-class SA_TIM2_CNT(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNT", "counter")
-        self.UIFCPY = BitField(self, 0x80000000, "UIFCPY", "UIFCPY")
-        self.CNT = BitField(self, 0x0000FFFF, "CNT", "counter value")
-
-class SA_TIM2_PSC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PSC", "prescaler")
-        self.PSC = BitField(self, 0x0000FFFF, "PSC", "Prescaler value")
-
-class SA_TIM2_ARR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFFFFFF, "ARR", "auto-reload register")
-        self.ARR = BitField(self, 0x0000FFFF, "ARR", "Auto-reload value")
-
-class SA_TIM2_RCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RCR", "repetition counter register")
-        self.REP = BitField(self, 0x0000FFFF, "REP", "Repetition counter value")
-
-class SA_TIM2_CCR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR1", "capture/compare register 1")
-        self.CCR1 = BitField(self, 0x0000FFFF, "CCR1", "Capture/Compare 1 value")
-
-class SA_TIM2_CCR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR2", "capture/compare register 2")
-        self.CCR2 = BitField(self, 0x0000FFFF, "CCR2", "Capture/Compare 2 value")
-
-class SA_TIM2_CCR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR3", "capture/compare register 3")
-        self.CCR3 = BitField(self, 0x0000FFFF, "CCR3", "Capture/Compare value")
-
-class SA_TIM2_CCR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR4", "capture/compare register 4")
-        self.CCR4 = BitField(self, 0x0000FFFF, "CCR4", "Capture/Compare value")
-
-class SA_TIM2_BDTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BDTR", "break and dead-time register")
-        self.BK2ID = BitField(self, 0x20000000, "BK2ID", "BK2ID")
-        self.BKBID = BitField(self, 0x10000000, "BKBID", "BKBID")
-        self.BK2DSRM = BitField(self, 0x08000000, "BK2DSRM", "BK2DSRM")
-        self.BKDSRM = BitField(self, 0x04000000, "BKDSRM", "BKDSRM")
-        self.BK2P = BitField(self, 0x02000000, "BK2P", "Break 2 polarity")
-        self.BK2E = BitField(self, 0x01000000, "BK2E", "Break 2 Enable")
-        self.BK2F = BitField(self, 0x00F00000, "BK2F", "Break 2 filter")
-        self.BKF = BitField(self, 0x000F0000, "BKF", "Break filter")
-        self.MOE = BitField(self, 0x00008000, "MOE", "Main output enable")
-        self.AOE = BitField(self, 0x00004000, "AOE", "Automatic output enable")
-        self.BKP = BitField(self, 0x00002000, "BKP", "Break polarity")
-        self.BKE = BitField(self, 0x00001000, "BKE", "Break enable")
-        self.OSSR = BitField(self, 0x00000800, "OSSR", "Off-state selection for Run mode")
-        self.OSSI = BitField(self, 0x00000400, "OSSI", "Off-state selection for Idle mode")
-        self.LOCK = BitField(self, 0x00000300, "LOCK", "Lock configuration")
-        self.DTG = BitField(self, 0x000000FF, "DTG", "Dead-time generator setup")
-
-class SA_TIM2_CCR5(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR5", "capture/compare register 4")
-        self.CCR5 = BitField(self, 0x0000FFFF, "CCR5", "Capture/Compare value")
-        self.GC5C1 = BitField(self, 0x20000000, "GC5C1", "Group Channel 5 and Channel 1")
-        self.GC5C2 = BitField(self, 0x40000000, "GC5C2", "Group Channel 5 and Channel 2")
-        self.GC5C3 = BitField(self, 0x80000000, "GC5C3", "Group Channel 5 and Channel 3")
-        self.GC5C = Subscriptor(self, "GC5C{}")
-
-class SA_TIM2_CCR6(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR6", "capture/compare register 4")
-        self.CCR6 = BitField(self, 0x0000FFFF, "CCR6", "Capture/Compare value")
-
-class SA_TIM2_CCMR3_Output(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR3_Output", "capture/compare mode register 2 (output mode)")
-        self.OC6M_bit3 = BitField(self, 0x01000000, "OC6M_bit3", "Output Compare 6 mode bit 3")
-        self.OC5M_bit3 = BitField(self, 0x00070000, "OC5M_bit3", "Output Compare 5 mode bit 3")
-        self.OC6CE = BitField(self, 0x00008000, "OC6CE", "Output compare 6 clear enable")
-        self.OC6M = BitField(self, 0x00007000, "OC6M", "Output compare 6 mode")
-        self.OC6PE = BitField(self, 0x00000800, "OC6PE", "Output compare 6 preload enable")
-        self.OC6FE = BitField(self, 0x00000400, "OC6FE", "Output compare 6 fast enable")
-        self.OC5CE = BitField(self, 0x00000080, "OC5CE", "Output compare 5 clear enable")
-        self.OC5M = BitField(self, 0x00000070, "OC5M", "Output compare 5 mode")
-        self.OC5PE = BitField(self, 0x00000008, "OC5PE", "Output compare 5 preload enable")
-        self.OC5FE = BitField(self, 0x00000004, "OC5FE", "Output compare 5 fast enable")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-
-class SA_TIM2_DTR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DTR2", "timer Deadtime Register 2")
-        self.DTPE = BitField(self, 0x00020000, "DTPE", "Deadtime Preload Enable")
-        self.DTAE = BitField(self, 0x00010000, "DTAE", "Deadtime Asymmetric Enable")
-        self.DTGF = BitField(self, 0x000000FF, "DTGF", "Dead-time falling edge generator setup")
-
-class SA_TIM2_ECR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ECR", "DMA control register")
-        self.IE = BitField(self, 0x00000001, "IE", "Index Enable")
-        self.IDIR = BitField(self, 0x00000006, "IDIR", "Index Direction")
-        self.IBLK = BitField(self, 0x00000018, "IBLK", "Index Blanking")
-        self.FIDX = BitField(self, 0x00000020, "FIDX", "First Index")
-        self.IPOS = BitField(self, 0x000000C0, "IPOS", "Index Positioning")
-        self.PW = BitField(self, 0x00FF0000, "PW", "Pulse width")
-        self.PWPRSC = BitField(self, 0x07000000, "PWPRSC", "Pulse Width prescaler")
-
-class SA_TIM2_TISEL(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TISEL", "TIM timer input selection register")
-        self.TI1SEL = BitField(self, 0x0000000F, "TI1SEL", "TI1[0] to TI1[15] input selection")
-        self.TI2SEL = BitField(self, 0x00000F00, "TI2SEL", "TI2[0] to TI2[15] input selection")
-        self.TI3SEL = BitField(self, 0x000F0000, "TI3SEL", "TI3[0] to TI3[15] input selection")
-        self.TI4SEL = BitField(self, 0x0F000000, "TI4SEL", "TI4[0] to TI4[15] input selection")
-        self.TISEL = Subscriptor(self, "TI{}SEL")
-
-class SA_TIM2_AF1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AF1", "TIM alternate function option register 1")
-        self.ETRSEL = BitField(self, 0x0003C000, "ETRSEL", "ETR source selection")
-        self.BKCMP4P = BitField(self, 0x00002000, "BKCMP4P", "BRK COMP4 input polarity")
-        self.BKCMP3P = BitField(self, 0x00001000, "BKCMP3P", "BRK COMP3 input polarity")
-        self.BKCMP2P = BitField(self, 0x00000800, "BKCMP2P", "BRK COMP2 input polarity")
-        self.BKCMP1P = BitField(self, 0x00000400, "BKCMP1P", "BRK COMP1 input polarity")
-        self.BKINP = BitField(self, 0x00000200, "BKINP", "BRK BKIN input polarity")
-        self.BKCMP7E = BitField(self, 0x00000080, "BKCMP7E", "BRK COMP7 enable")
-        self.BKCMP6E = BitField(self, 0x00000040, "BKCMP6E", "BRK COMP6 enable")
-        self.BKCMP5E = BitField(self, 0x00000020, "BKCMP5E", "BRK COMP5 enable")
-        self.BKCMP4E = BitField(self, 0x00000010, "BKCMP4E", "BRK COMP4 enable")
-        self.BKCMP3E = BitField(self, 0x00000008, "BKCMP3E", "BRK COMP3 enable")
-        self.BKCMP2E = BitField(self, 0x00000004, "BKCMP2E", "BRK COMP2 enable")
-        self.BKCMP1E = BitField(self, 0x00000002, "BKCMP1E", "BRK COMP1 enable")
-        self.BKINE = BitField(self, 0x00000001, "BKINE", "BRK BKIN input enable")
-        self.BKCMPP = Subscriptor(self, "BKCMP{}P")
-        self.BKCMPE = Subscriptor(self, "BKCMP{}E")
-
-class SA_TIM2_AF2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AF2", "TIM alternate function option register 2")
-        self.OCRSEL = BitField(self, 0x00070000, "OCRSEL", "OCREF_CLR source selection")
-        self.BK2CMP4P = BitField(self, 0x00002000, "BK2CMP4P", "BRK2 COMP4 input polarity")
-        self.BK2CMP3P = BitField(self, 0x00001000, "BK2CMP3P", "BRK2 COMP3 input polarity")
-        self.BK2CMP2P = BitField(self, 0x00000800, "BK2CMP2P", "BRK2 COMP2 input polarity")
-        self.BK2CMP1P = BitField(self, 0x00000400, "BK2CMP1P", "BRK2 COMP1 input polarity")
-        self.BK2INP = BitField(self, 0x00000200, "BK2INP", "BRK2 BKIN input polarity")
-        self.BK2CMP7E = BitField(self, 0x00000080, "BK2CMP7E", "BRK2 COMP7 enable")
-        self.BK2CMP6E = BitField(self, 0x00000040, "BK2CMP6E", "BRK2 COMP6 enable")
-        self.BK2CMP5E = BitField(self, 0x00000020, "BK2CMP5E", "BRK2 COMP5 enable")
-        self.BK2CMP4E = BitField(self, 0x00000010, "BK2CMP4E", "BRK2 COMP4 enable")
-        self.BK2CMP3E = BitField(self, 0x00000008, "BK2CMP3E", "BRK2 COMP3 enable")
-        self.BK2CMP2E = BitField(self, 0x00000004, "BK2CMP2E", "BRK2 COMP2 enable")
-        self.BK2CMP1E = BitField(self, 0x00000002, "BK2CMP1E", "BRK2 COMP1 enable")
-        self.BKINE = BitField(self, 0x00000001, "BKINE", "BRK BKIN input enable")
-        self.BK2CMPP = Subscriptor(self, "BK2CMP{}P")
-        self.BK2CMPE = Subscriptor(self, "BK2CMP{}E")
-
-class SA_TIM2_DCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DCR", "control register")
-        self.DBL = BitField(self, 0x00001F00, "DBL", "DMA burst length")
-        self.DBA = BitField(self, 0x0000001F, "DBA", "DMA base address")
-
-class SA_TIM2_DMAR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DMAR", "DMA address for full transfer")
-        self.DMAB = BitField(self, 0xFFFFFFFF, "DMAB", "DMA register for burst accesses")
-
-class SA_TIM2_CCMR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR1", "capture/compare mode register 1")
-        self.OC2CE = BitField(self, 0x00008000, "OC2CE", "Output Compare 2 clear enable")
-        self.OC2M = BitField(self, 0x01007000, "OC2M", "Output Compare 2 mode")
-        self.OC2PE = BitField(self, 0x00000800, "OC2PE", "Output Compare 2 preload enable")
-        self.OC2FE = BitField(self, 0x00000400, "OC2FE", "Output Compare 2 fast enable")
-        self.CC2S = BitField(self, 0x00000300, "CC2S", "Capture/Compare 2 selection")
-        self.OC1CE = BitField(self, 0x00000080, "OC1CE", "Output Compare 1 clear enable")
-        self.OC1M = BitField(self, 0x00010070, "OC1M", "Output Compare 1 mode")
-        self.OC1PE = BitField(self, 0x00000008, "OC1PE", "Output Compare 1 preload enable")
-        self.OC1FE = BitField(self, 0x00000004, "OC1FE", "Output Compare 1 fast enable")
-        self.CC1S = BitField(self, 0x00000003, "CC1S", "Capture/Compare 1 selection")
-        self.IC2F = BitField(self, 0x0000F000, "IC2F", "Input capture 2 filter")
-        self.IC2PSC = BitField(self, 0x00000C00, "IC2PSC", "Input capture 2 prescaler")
-        self.IC1F = BitField(self, 0x000000F0, "IC1F", "Input capture 1 filter")
-        self.ICPCS = BitField(self, 0x0000000C, "ICPCS", "Input capture 1 prescaler")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.ICF = Subscriptor(self, "IC{}F")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.CCS = Subscriptor(self, "CC{}S")
-
-class SA_TIM2_CCMR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR2", "capture/compare mode register 2")
-        self.OC4CE = BitField(self, 0x00008000, "OC4CE", "Output compare 4 clear enable")
-        self.OC4M = BitField(self, 0x01007000, "OC4M", "Output compare 4 mode")
-        self.OC4PE = BitField(self, 0x00000800, "OC4PE", "Output compare 4 preload enable")
-        self.OC4FE = BitField(self, 0x00000400, "OC4FE", "Output compare 4 fast enable")
-        self.CC4S = BitField(self, 0x00000300, "CC4S", "Capture/Compare 4 selection")
-        self.OC3CE = BitField(self, 0x00000080, "OC3CE", "Output compare 3 clear enable")
-        self.OC3M = BitField(self, 0x00010070, "OC3M", "Output compare 3 mode")
-        self.OC3PE = BitField(self, 0x00000008, "OC3PE", "Output compare 3 preload enable")
-        self.OC3FE = BitField(self, 0x00000004, "OC3FE", "Output compare 3 fast enable")
-        self.CC3S = BitField(self, 0x00000003, "CC3S", "Capture/compare 3 selection")
-        self.IC4F = BitField(self, 0x0000F000, "IC4F", "Input capture 4 filter")
-        self.IC4PSC = BitField(self, 0x00000C00, "IC4PSC", "Input capture 4 prescaler")
-        self.IC3F = BitField(self, 0x000000F0, "IC3F", "Input capture 3 filter")
-        self.IC3PSC = BitField(self, 0x0000000C, "IC3PSC", "Input capture 3 prescaler")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.ICF = Subscriptor(self, "IC{}F")
-        self.ICPSC = Subscriptor(self, "IC{}PSC")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.CCS = Subscriptor(self, "CC{}S")
-
-class SA_TIM2_CCMR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCMR3", "capture/compare mode register 2")
-        self.OC6M_bit3 = BitField(self, 0x01000000, "OC6M_bit3", "Output Compare 6 mode bit 3")
-        self.OC5M_bit3 = BitField(self, 0x00070000, "OC5M_bit3", "Output Compare 5 mode bit 3")
-        self.OC6CE = BitField(self, 0x00008000, "OC6CE", "Output compare 6 clear enable")
-        self.OC6M = BitField(self, 0x00007000, "OC6M", "Output compare 6 mode")
-        self.OC6PE = BitField(self, 0x00000800, "OC6PE", "Output compare 6 preload enable")
-        self.OC6FE = BitField(self, 0x00000400, "OC6FE", "Output compare 6 fast enable")
-        self.OC5CE = BitField(self, 0x00000080, "OC5CE", "Output compare 5 clear enable")
-        self.OC5M = BitField(self, 0x00000070, "OC5M", "Output compare 5 mode")
-        self.OC5PE = BitField(self, 0x00000008, "OC5PE", "Output compare 5 preload enable")
-        self.OC5FE = BitField(self, 0x00000004, "OC5FE", "Output compare 5 fast enable")
-        self.OCM = Subscriptor(self, "OC{}M")
-        self.OCFE = Subscriptor(self, "OC{}FE")
-        self.OCPE = Subscriptor(self, "OC{}PE")
-        self.OCCE = Subscriptor(self, "OC{}CE")
-
-class SA_TIM2(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Advanced-timers")
-        self.CR1 = SA_TIM2_CR1(self, 0x0)
-        self.CR2 = SA_TIM2_CR2(self, 0x4)
-        self.SMCR = SA_TIM2_SMCR(self, 0x8)
-        self.DIER = SA_TIM2_DIER(self, 0xC)
-        self.SR = SA_TIM2_SR(self, 0x10)
-        self.EGR = SA_TIM2_EGR(self, 0x14)
-        self.CCMR1_Output = SA_TIM2_CCMR1_Output(self, 0x18)
-        self.CCMR1_Input = SA_TIM2_CCMR1_Input(self, 0x18)
-        self.CCMR2_Output = SA_TIM2_CCMR2_Output(self, 0x1C)
-        self.CCMR2_Input = SA_TIM2_CCMR2_Input(self, 0x1C)
-        self.CCER = SA_TIM2_CCER(self, 0x20)
-        self.CNT = SA_TIM2_CNT(self, 0x24)
-        self.PSC = SA_TIM2_PSC(self, 0x28)
-        self.ARR = SA_TIM2_ARR(self, 0x2C)
-        self.RCR = SA_TIM2_RCR(self, 0x30)
-        self.CCR1 = SA_TIM2_CCR1(self, 0x34)
-        self.CCR2 = SA_TIM2_CCR2(self, 0x38)
-        self.CCR3 = SA_TIM2_CCR3(self, 0x3C)
-        self.CCR4 = SA_TIM2_CCR4(self, 0x40)
-        self.BDTR = SA_TIM2_BDTR(self, 0x44)
-        self.CCR5 = SA_TIM2_CCR5(self, 0x48)
-        self.CCR6 = SA_TIM2_CCR6(self, 0x4C)
-        self.CCMR3_Output = SA_TIM2_CCMR3_Output(self, 0x50)
-        self.DTR2 = SA_TIM2_DTR2(self, 0x54)
-        self.ECR = SA_TIM2_ECR(self, 0x58)
-        self.TISEL = SA_TIM2_TISEL(self, 0x5C)
-        self.AF1 = SA_TIM2_AF1(self, 0x60)
-        self.AF2 = SA_TIM2_AF2(self, 0x64)
-        self.DCR = SA_TIM2_DCR(self, 0x3DC)
-        self.DMAR = SA_TIM2_DMAR(self, 0x3E0)
-        self.CCMR1 = SA_TIM2_CCMR1(self, 0x18)
-        self.CCMR2 = SA_TIM2_CCMR2(self, 0x1C)
-        self.CCMR3 = SA_TIM2_CCMR3(self, 0x50)
-        self.AF = Subscriptor(self, "AF{}")
-        self.CCR = Subscriptor(self, "CCR{}")
-        self.CCMR_Input = Subscriptor(self, "CCMR{}_Input")
-        self.CCMR_Output = Subscriptor(self, "CCMR{}_Output")
-        self.CCMR = Subscriptor(self, "CCMR{}")
-
-TIM2 = SA_TIM2(0x40000000, "TIM2")
-TIM3 = SA_TIM2(0x40000400, "TIM3")
-TIM4 = SA_TIM2(0x40000800, "TIM4")
-
-class SA_TIM6_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR1", "control register 1")
-        self.DITHEN = BitField(self, 0x00001000, "DITHEN", "Dithering Enable")
-        self.UIFREMAP = BitField(self, 0x00000800, "UIFREMAP", "UIF status bit remapping")
-        self.ARPE = BitField(self, 0x00000080, "ARPE", "Auto-reload preload enable")
-        self.OPM = BitField(self, 0x00000008, "OPM", "One-pulse mode")
-        self.URS = BitField(self, 0x00000004, "URS", "Update request source")
-        self.UDIS = BitField(self, 0x00000002, "UDIS", "Update disable")
-        self.CEN = BitField(self, 0x00000001, "CEN", "Counter enable")
-
-class SA_TIM6_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR2", "control register 2")
-        self.MMS = BitField(self, 0x00000070, "MMS", "Master mode selection")
-
-class SA_TIM6_DIER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DIER", "DMA/Interrupt enable register")
-        self.UDE = BitField(self, 0x00000100, "UDE", "Update DMA request enable")
-        self.UIE = BitField(self, 0x00000001, "UIE", "Update interrupt enable")
-
-class SA_TIM6_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "status register")
-        self.UIF = BitField(self, 0x00000001, "UIF", "Update interrupt flag")
-
-class SA_TIM6_EGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EGR", "event generation register")
-        self.UG = BitField(self, 0x00000001, "UG", "Update generation")
-
-class SA_TIM6_CNT(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNT", "counter")
-        self.UIFCPY = BitField(self, 0x80000000, "UIFCPY", "UIF Copy")
-        self.CNT = BitField(self, 0x0000FFFF, "CNT", "Low counter value")
-
-class SA_TIM6_PSC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PSC", "prescaler")
-        self.PSC = BitField(self, 0x0000FFFF, "PSC", "Prescaler value")
-
-class SA_TIM6_ARR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFF, "ARR", "auto-reload register")
-        self.ARR = BitField(self, 0x0000FFFF, "ARR", "Low Auto-reload value")
-
-class SA_TIM6(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Basic-timers")
-        self.CR1 = SA_TIM6_CR1(self, 0x0)
-        self.CR2 = SA_TIM6_CR2(self, 0x4)
-        self.DIER = SA_TIM6_DIER(self, 0xC)
-        self.SR = SA_TIM6_SR(self, 0x10)
-        self.EGR = SA_TIM6_EGR(self, 0x14)
-        self.CNT = SA_TIM6_CNT(self, 0x24)
-        self.PSC = SA_TIM6_PSC(self, 0x28)
-        self.ARR = SA_TIM6_ARR(self, 0x2C)
-
-TIM6 = SA_TIM6(0x40001000, "TIM6")
-TIM7 = SA_TIM6(0x40001400, "TIM7")
-
-class SA_LPTIMER1_ISR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ISR", "Interrupt and Status Register")
-        self.DOWN = BitField(self, 0x00000040, "DOWN", "Counter direction change up to down")
-        self.UP = BitField(self, 0x00000020, "UP", "Counter direction change down to up")
-        self.ARROK = BitField(self, 0x00000010, "ARROK", "Autoreload register update OK")
-        self.CMPOK = BitField(self, 0x00000008, "CMPOK", "Compare register update OK")
-        self.EXTTRIG = BitField(self, 0x00000004, "EXTTRIG", "External trigger edge event")
-        self.ARRM = BitField(self, 0x00000002, "ARRM", "Autoreload match")
-        self.CMPM = BitField(self, 0x00000001, "CMPM", "Compare match")
-
-class SA_LPTIMER1_ICR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ICR", "Interrupt Clear Register")
-        self.DOWNCF = BitField(self, 0x00000040, "DOWNCF", "Direction change to down Clear Flag")
-        self.UPCF = BitField(self, 0x00000020, "UPCF", "Direction change to UP Clear Flag")
-        self.ARROKCF = BitField(self, 0x00000010, "ARROKCF", "Autoreload register update OK Clear Flag")
-        self.CMPOKCF = BitField(self, 0x00000008, "CMPOKCF", "Compare register update OK Clear Flag")
-        self.EXTTRIGCF = BitField(self, 0x00000004, "EXTTRIGCF", "External trigger valid edge Clear Flag")
-        self.ARRMCF = BitField(self, 0x00000002, "ARRMCF", "Autoreload match Clear Flag")
-        self.CMPMCF = BitField(self, 0x00000001, "CMPMCF", "compare match Clear Flag")
-
-class SA_LPTIMER1_IER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IER", "Interrupt Enable Register")
-        self.DOWNIE = BitField(self, 0x00000040, "DOWNIE", "Direction change to down Interrupt Enable")
-        self.UPIE = BitField(self, 0x00000020, "UPIE", "Direction change to UP Interrupt Enable")
-        self.ARROKIE = BitField(self, 0x00000010, "ARROKIE", "Autoreload register update OK Interrupt Enable")
-        self.CMPOKIE = BitField(self, 0x00000008, "CMPOKIE", "Compare register update OK Interrupt Enable")
-        self.EXTTRIGIE = BitField(self, 0x00000004, "EXTTRIGIE", "External trigger valid edge Interrupt Enable")
-        self.ARRMIE = BitField(self, 0x00000002, "ARRMIE", "Autoreload match Interrupt Enable")
-        self.CMPMIE = BitField(self, 0x00000001, "CMPMIE", "Compare match Interrupt Enable")
-
-class SA_LPTIMER1_CFGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CFGR", "Configuration Register")
-        self.ENC = BitField(self, 0x01000000, "ENC", "Encoder mode enable")
-        self.COUNTMODE = BitField(self, 0x00800000, "COUNTMODE", "counter mode enabled")
-        self.PRELOAD = BitField(self, 0x00400000, "PRELOAD", "Registers update mode")
-        self.WAVPOL = BitField(self, 0x00200000, "WAVPOL", "Waveform shape polarity")
-        self.WAVE = BitField(self, 0x00100000, "WAVE", "Waveform shape")
-        self.TIMOUT = BitField(self, 0x00080000, "TIMOUT", "Timeout enable")
-        self.TRIGEN = BitField(self, 0x00060000, "TRIGEN", "Trigger enable and polarity")
-        self.TRIGSEL = BitField(self, 0x0001E000, "TRIGSEL", "Trigger selector")
-        self.PRESC = BitField(self, 0x00000E00, "PRESC", "Clock prescaler")
-        self.TRGFLT = BitField(self, 0x000000C0, "TRGFLT", "Configurable digital filter for trigger")
-        self.CKFLT = BitField(self, 0x00000018, "CKFLT", "Configurable digital filter for external clock")
-        self.CKPOL = BitField(self, 0x00000006, "CKPOL", "Clock Polarity")
-        self.CKSEL = BitField(self, 0x00000001, "CKSEL", "Clock selector")
-
-class SA_LPTIMER1_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR", "Control Register")
-        self.RSTARE = BitField(self, 0x00000010, "RSTARE", "RSTARE")
-        self.COUNTRST = BitField(self, 0x00000008, "COUNTRST", "COUNTRST")
-        self.CNTSTRT = BitField(self, 0x00000004, "CNTSTRT", "Timer start in continuous mode")
-        self.SNGSTRT = BitField(self, 0x00000002, "SNGSTRT", "LPTIM start in single mode")
-        self.ENABLE = BitField(self, 0x00000001, "ENABLE", "LPTIM Enable")
-
-class SA_LPTIMER1_CMP(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CMP", "Compare Register")
-        self.CMP = BitField(self, 0x0000FFFF, "CMP", "Compare value")
-
-class SA_LPTIMER1_ARR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x1, "ARR", "Autoreload Register")
-        self.ARR = BitField(self, 0x0000FFFF, "ARR", "Auto reload value")
-
-class SA_LPTIMER1_CNT(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNT", "Counter Register")
-        self.CNT = BitField(self, 0x0000FFFF, "CNT", "Counter value")
-
-class SA_LPTIMER1_OR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OR", "option register")
-        self.IN1 = BitField(self, 0x0000000D, "IN1", "IN1")
-        self.IN2 = BitField(self, 0x00000032, "IN2", "IN2")
-        self.IN = Subscriptor(self, "IN{}")
-
-class SA_LPTIMER1(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Low power timer")
-        self.ISR = SA_LPTIMER1_ISR(self, 0x0)
-        self.ICR = SA_LPTIMER1_ICR(self, 0x4)
-        self.IER = SA_LPTIMER1_IER(self, 0x8)
-        self.CFGR = SA_LPTIMER1_CFGR(self, 0xC)
-        self.CR = SA_LPTIMER1_CR(self, 0x10)
-        self.CMP = SA_LPTIMER1_CMP(self, 0x14)
-        self.ARR = SA_LPTIMER1_ARR(self, 0x18)
-        self.CNT = SA_LPTIMER1_CNT(self, 0x1C)
-        self.OR = SA_LPTIMER1_OR(self, 0x20)
-
-LPTIMER1 = SA_LPTIMER1(0x40007C00, "LPTIMER1")
-
-class SA_USART1_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR1", "Control register 1")
-        self.RXFFIE = BitField(self, 0x80000000, "RXFFIE", "RXFFIE")
-        self.TXFEIE = BitField(self, 0x40000000, "TXFEIE", "TXFEIE")
-        self.FIFOEN = BitField(self, 0x20000000, "FIFOEN", "FIFOEN")
-        self.M1 = BitField(self, 0x10000000, "M1", "M1")
-        self.EOBIE = BitField(self, 0x08000000, "EOBIE", "End of Block interrupt enable")
-        self.RTOIE = BitField(self, 0x04000000, "RTOIE", "Receiver timeout interrupt enable")
-        self.DEAT4 = BitField(self, 0x02000000, "DEAT4", "Driver Enable assertion time")
-        self.DEAT3 = BitField(self, 0x01000000, "DEAT3", "DEAT3")
-        self.DEAT2 = BitField(self, 0x00800000, "DEAT2", "DEAT2")
-        self.DEAT1 = BitField(self, 0x00400000, "DEAT1", "DEAT1")
-        self.DEAT0 = BitField(self, 0x00200000, "DEAT0", "DEAT0")
-        self.DEDT4 = BitField(self, 0x00100000, "DEDT4", "Driver Enable de-assertion time")
-        self.DEDT3 = BitField(self, 0x00080000, "DEDT3", "DEDT3")
-        self.DEDT2 = BitField(self, 0x00040000, "DEDT2", "DEDT2")
-        self.DEDT1 = BitField(self, 0x00020000, "DEDT1", "DEDT1")
-        self.DEDT0 = BitField(self, 0x00010000, "DEDT0", "DEDT0")
-        self.OVER8 = BitField(self, 0x00008000, "OVER8", "Oversampling mode")
-        self.CMIE = BitField(self, 0x00004000, "CMIE", "Character match interrupt enable")
-        self.MME = BitField(self, 0x00002000, "MME", "Mute mode enable")
-        self.M0 = BitField(self, 0x00001000, "M0", "Word length")
-        self.WAKE = BitField(self, 0x00000800, "WAKE", "Receiver wakeup method")
-        self.PCE = BitField(self, 0x00000400, "PCE", "Parity control enable")
-        self.PS = BitField(self, 0x00000200, "PS", "Parity selection")
-        self.PEIE = BitField(self, 0x00000100, "PEIE", "PE interrupt enable")
-        self.TXEIE = BitField(self, 0x00000080, "TXEIE", "interrupt enable")
-        self.TCIE = BitField(self, 0x00000040, "TCIE", "Transmission complete interrupt enable")
-        self.RXNEIE = BitField(self, 0x00000020, "RXNEIE", "RXNE interrupt enable")
-        self.IDLEIE = BitField(self, 0x00000010, "IDLEIE", "IDLE interrupt enable")
-        self.TE = BitField(self, 0x00000008, "TE", "Transmitter enable")
-        self.RE = BitField(self, 0x00000004, "RE", "Receiver enable")
-        self.UESM = BitField(self, 0x00000002, "UESM", "USART enable in Stop mode")
-        self.UE = BitField(self, 0x00000001, "UE", "USART enable")
-        self.M = Subscriptor(self, "M{}")
-        self.DEAT = Subscriptor(self, "DEAT{}")
-        self.DEDT = Subscriptor(self, "DEDT{}")
-
-class SA_USART1_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR2", "Control register 2")
-        self.ADD4_7 = BitField(self, 0xF0000000, "ADD4_7", "Address of the USART node")
-        self.ADD0_3 = BitField(self, 0x0F000000, "ADD0_3", "Address of the USART node")
-        self.RTOEN = BitField(self, 0x00800000, "RTOEN", "Receiver timeout enable")
-        self.ABRMOD1 = BitField(self, 0x00400000, "ABRMOD1", "Auto baud rate mode")
-        self.ABRMOD0 = BitField(self, 0x00200000, "ABRMOD0", "ABRMOD0")
-        self.ABREN = BitField(self, 0x00100000, "ABREN", "Auto baud rate enable")
-        self.MSBFIRST = BitField(self, 0x00080000, "MSBFIRST", "Most significant bit first")
-        self.TAINV = BitField(self, 0x00040000, "TAINV", "Binary data inversion")
-        self.TXINV = BitField(self, 0x00020000, "TXINV", "TX pin active level inversion")
-        self.RXINV = BitField(self, 0x00010000, "RXINV", "RX pin active level inversion")
-        self.SWAP = BitField(self, 0x00008000, "SWAP", "Swap TX/RX pins")
-        self.LINEN = BitField(self, 0x00004000, "LINEN", "LIN mode enable")
-        self.STOP = BitField(self, 0x00003000, "STOP", "STOP bits")
-        self.CLKEN = BitField(self, 0x00000800, "CLKEN", "Clock enable")
-        self.CPOL = BitField(self, 0x00000400, "CPOL", "Clock polarity")
-        self.CPHA = BitField(self, 0x00000200, "CPHA", "Clock phase")
-        self.LBCL = BitField(self, 0x00000100, "LBCL", "Last bit clock pulse")
-        self.LBDIE = BitField(self, 0x00000040, "LBDIE", "LIN break detection interrupt enable")
-        self.LBDL = BitField(self, 0x00000020, "LBDL", "LIN break detection length")
-        self.ADDM7 = BitField(self, 0x00000010, "ADDM7", "7-bit Address Detection/4-bit Address Detection")
-        self.DIS_NSS = BitField(self, 0x00000008, "DIS_NSS", "DIS_NSS")
-        self.SLVEN = BitField(self, 0x00000001, "SLVEN", "SLVEN")
-        self.ABRMOD = Subscriptor(self, "ABRMOD{}")
-
-class SA_USART1_CR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR3", "Control register 3")
-        self.TXFTCFG = BitField(self, 0xE0000000, "TXFTCFG", "TXFTCFG")
-        self.RXFTIE = BitField(self, 0x10000000, "RXFTIE", "RXFTIE")
-        self.RXFTCFG = BitField(self, 0x0E000000, "RXFTCFG", "RXFTCFG")
-        self.TCBGTIE = BitField(self, 0x01000000, "TCBGTIE", "TCBGTIE")
-        self.TXFTIE = BitField(self, 0x00800000, "TXFTIE", "TXFTIE")
-        self.WUFIE = BitField(self, 0x00400000, "WUFIE", "Wakeup from Stop mode interrupt enable")
-        self.WUS = BitField(self, 0x00300000, "WUS", "Wakeup from Stop mode interrupt flag selection")
-        self.SCARCNT = BitField(self, 0x000E0000, "SCARCNT", "Smartcard auto-retry count")
-        self.DEP = BitField(self, 0x00008000, "DEP", "Driver enable polarity selection")
-        self.DEM = BitField(self, 0x00004000, "DEM", "Driver enable mode")
-        self.DDRE = BitField(self, 0x00002000, "DDRE", "DMA Disable on Reception Error")
-        self.OVRDIS = BitField(self, 0x00001000, "OVRDIS", "Overrun Disable")
-        self.ONEBIT = BitField(self, 0x00000800, "ONEBIT", "One sample bit method enable")
-        self.CTSIE = BitField(self, 0x00000400, "CTSIE", "CTS interrupt enable")
-        self.CTSE = BitField(self, 0x00000200, "CTSE", "CTS enable")
-        self.RTSE = BitField(self, 0x00000100, "RTSE", "RTS enable")
-        self.DMAT = BitField(self, 0x00000080, "DMAT", "DMA enable transmitter")
-        self.DMAR = BitField(self, 0x00000040, "DMAR", "DMA enable receiver")
-        self.SCEN = BitField(self, 0x00000020, "SCEN", "Smartcard mode enable")
-        self.NACK = BitField(self, 0x00000010, "NACK", "Smartcard NACK enable")
-        self.HDSEL = BitField(self, 0x00000008, "HDSEL", "Half-duplex selection")
-        self.IRLP = BitField(self, 0x00000004, "IRLP", "Ir low-power")
-        self.IREN = BitField(self, 0x00000002, "IREN", "Ir mode enable")
-        self.EIE = BitField(self, 0x00000001, "EIE", "Error interrupt enable")
-
-class SA_USART1_BRR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BRR", "Baud rate register")
-        self.DIV_Mantissa = BitField(self, 0x0000FFF0, "DIV_Mantissa", "DIV_Mantissa")
-        self.DIV_Fraction = BitField(self, 0x0000000F, "DIV_Fraction", "DIV_Fraction")
-
-class SA_USART1_GTPR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "GTPR", "Guard time and prescaler register")
-        self.GT = BitField(self, 0x0000FF00, "GT", "Guard time value")
-        self.PSC = BitField(self, 0x000000FF, "PSC", "Prescaler value")
-
-class SA_USART1_RTOR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RTOR", "Receiver timeout register")
-        self.BLEN = BitField(self, 0xFF000000, "BLEN", "Block Length")
-        self.RTO = BitField(self, 0x00FFFFFF, "RTO", "Receiver timeout value")
-
-class SA_USART1_RQR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RQR", "Request register")
-        self.TXFRQ = BitField(self, 0x00000010, "TXFRQ", "Transmit data flush request")
-        self.RXFRQ = BitField(self, 0x00000008, "RXFRQ", "Receive data flush request")
-        self.MMRQ = BitField(self, 0x00000004, "MMRQ", "Mute mode request")
-        self.SBKRQ = BitField(self, 0x00000002, "SBKRQ", "Send break request")
-        self.ABRRQ = BitField(self, 0x00000001, "ABRRQ", "Auto baud rate request")
-
-class SA_USART1_ISR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ISR", "Interrupt & status register")
-        self.TXFT = BitField(self, 0x08000000, "TXFT", "TXFT")
-        self.RXFT = BitField(self, 0x04000000, "RXFT", "RXFT")
-        self.TCBGT = BitField(self, 0x02000000, "TCBGT", "TCBGT")
-        self.RXFF = BitField(self, 0x01000000, "RXFF", "RXFF")
-        self.TXFE = BitField(self, 0x00800000, "TXFE", "TXFE")
-        self.REACK = BitField(self, 0x00400000, "REACK", "REACK")
-        self.TEACK = BitField(self, 0x00200000, "TEACK", "TEACK")
-        self.WUF = BitField(self, 0x00100000, "WUF", "WUF")
-        self.RWU = BitField(self, 0x00080000, "RWU", "RWU")
-        self.SBKF = BitField(self, 0x00040000, "SBKF", "SBKF")
-        self.CMF = BitField(self, 0x00020000, "CMF", "CMF")
-        self.BUSY = BitField(self, 0x00010000, "BUSY", "BUSY")
-        self.ABRF = BitField(self, 0x00008000, "ABRF", "ABRF")
-        self.ABRE = BitField(self, 0x00004000, "ABRE", "ABRE")
-        self.UDR = BitField(self, 0x00002000, "UDR", "UDR")
-        self.EOBF = BitField(self, 0x00001000, "EOBF", "EOBF")
-        self.RTOF = BitField(self, 0x00000800, "RTOF", "RTOF")
-        self.CTS = BitField(self, 0x00000400, "CTS", "CTS")
-        self.CTSIF = BitField(self, 0x00000200, "CTSIF", "CTSIF")
-        self.LBDF = BitField(self, 0x00000100, "LBDF", "LBDF")
-        self.TXE = BitField(self, 0x00000080, "TXE", "TXE")
-        self.TC = BitField(self, 0x00000040, "TC", "TC")
-        self.RXNE = BitField(self, 0x00000020, "RXNE", "RXNE")
-        self.IDLE = BitField(self, 0x00000010, "IDLE", "IDLE")
-        self.ORE = BitField(self, 0x00000008, "ORE", "ORE")
-        self.NF = BitField(self, 0x00000004, "NF", "NF")
-        self.FE = BitField(self, 0x00000002, "FE", "FE")
-        self.PE = BitField(self, 0x00000001, "PE", "PE")
-
-class SA_USART1_ICR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ICR", "Interrupt flag clear register")
-        self.WUCF = BitField(self, 0x00100000, "WUCF", "Wakeup from Stop mode clear flag")
-        self.CMCF = BitField(self, 0x00020000, "CMCF", "Character match clear flag")
-        self.UDRCF = BitField(self, 0x00002000, "UDRCF", "UDRCF")
-        self.EOBCF = BitField(self, 0x00001000, "EOBCF", "End of block clear flag")
-        self.RTOCF = BitField(self, 0x00000800, "RTOCF", "Receiver timeout clear flag")
-        self.CTSCF = BitField(self, 0x00000200, "CTSCF", "CTS clear flag")
-        self.LBDCF = BitField(self, 0x00000100, "LBDCF", "LIN break detection clear flag")
-        self.TCBGTCF = BitField(self, 0x00000080, "TCBGTCF", "TCBGTCF")
-        self.TCCF = BitField(self, 0x00000040, "TCCF", "Transmission complete clear flag")
-        self.TXFECF = BitField(self, 0x00000020, "TXFECF", "TXFECF")
-        self.IDLECF = BitField(self, 0x00000010, "IDLECF", "Idle line detected clear flag")
-        self.ORECF = BitField(self, 0x00000008, "ORECF", "Overrun error clear flag")
-        self.NCF = BitField(self, 0x00000004, "NCF", "Noise detected clear flag")
-        self.FECF = BitField(self, 0x00000002, "FECF", "Framing error clear flag")
-        self.PECF = BitField(self, 0x00000001, "PECF", "Parity error clear flag")
-
-class SA_USART1_RDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RDR", "Receive data register")
-        self.RDR = BitField(self, 0x000001FF, "RDR", "Receive data value")
-
-class SA_USART1_TDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TDR", "Transmit data register")
-        self.TDR = BitField(self, 0x000001FF, "TDR", "Transmit data value")
-
-class SA_USART1_PRESC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PRESC", "USART prescaler register")
-        self.PRESCALER = BitField(self, 0x0000000F, "PRESCALER", "PRESCALER")
-
-class SA_USART1(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Universal synchronous asynchronous receiver transmitter")
-        self.CR1 = SA_USART1_CR1(self, 0x0)
-        self.CR2 = SA_USART1_CR2(self, 0x4)
-        self.CR3 = SA_USART1_CR3(self, 0x8)
-        self.BRR = SA_USART1_BRR(self, 0xC)
-        self.GTPR = SA_USART1_GTPR(self, 0x10)
-        self.RTOR = SA_USART1_RTOR(self, 0x14)
-        self.RQR = SA_USART1_RQR(self, 0x18)
-        self.ISR = SA_USART1_ISR(self, 0x1C)
-        self.ICR = SA_USART1_ICR(self, 0x20)
-        self.RDR = SA_USART1_RDR(self, 0x24)
-        self.TDR = SA_USART1_TDR(self, 0x28)
-        self.PRESC = SA_USART1_PRESC(self, 0x2C)
-
-USART1 = SA_USART1(0x40013800, "USART1")
-USART2 = SA_USART1(0x40004400, "USART2")
-USART3 = SA_USART1(0x40004800, "USART3")
-
-class SA_UART4_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR1", "Control register 1")
-        self.RXFFIE = BitField(self, 0x80000000, "RXFFIE", "RXFFIE")
-        self.TXFEIE = BitField(self, 0x40000000, "TXFEIE", "TXFEIE")
-        self.FIFOEN = BitField(self, 0x20000000, "FIFOEN", "FIFOEN")
-        self.M1 = BitField(self, 0x10000000, "M1", "M1")
-        self.EOBIE = BitField(self, 0x08000000, "EOBIE", "End of Block interrupt enable")
-        self.RTOIE = BitField(self, 0x04000000, "RTOIE", "Receiver timeout interrupt enable")
-        self.DEAT4 = BitField(self, 0x02000000, "DEAT4", "Driver Enable assertion time")
-        self.DEAT3 = BitField(self, 0x01000000, "DEAT3", "DEAT3")
-        self.DEAT2 = BitField(self, 0x00800000, "DEAT2", "DEAT2")
-        self.DEAT1 = BitField(self, 0x00400000, "DEAT1", "DEAT1")
-        self.DEAT0 = BitField(self, 0x00200000, "DEAT0", "DEAT0")
-        self.DEDT4 = BitField(self, 0x00100000, "DEDT4", "Driver Enable de-assertion time")
-        self.DEDT3 = BitField(self, 0x00080000, "DEDT3", "DEDT3")
-        self.DEDT2 = BitField(self, 0x00040000, "DEDT2", "DEDT2")
-        self.DEDT1 = BitField(self, 0x00020000, "DEDT1", "DEDT1")
-        self.DEDT0 = BitField(self, 0x00010000, "DEDT0", "DEDT0")
-        self.OVER8 = BitField(self, 0x00008000, "OVER8", "Oversampling mode")
-        self.CMIE = BitField(self, 0x00004000, "CMIE", "Character match interrupt enable")
-        self.MME = BitField(self, 0x00002000, "MME", "Mute mode enable")
-        self.M0 = BitField(self, 0x00001000, "M0", "Word length")
-        self.WAKE = BitField(self, 0x00000800, "WAKE", "Receiver wakeup method")
-        self.PCE = BitField(self, 0x00000400, "PCE", "Parity control enable")
-        self.PS = BitField(self, 0x00000200, "PS", "Parity selection")
-        self.PEIE = BitField(self, 0x00000100, "PEIE", "PE interrupt enable")
-        self.TXEIE = BitField(self, 0x00000080, "TXEIE", "interrupt enable")
-        self.TCIE = BitField(self, 0x00000040, "TCIE", "Transmission complete interrupt enable")
-        self.RXNEIE = BitField(self, 0x00000020, "RXNEIE", "RXNE interrupt enable")
-        self.IDLEIE = BitField(self, 0x00000010, "IDLEIE", "IDLE interrupt enable")
-        self.TE = BitField(self, 0x00000008, "TE", "Transmitter enable")
-        self.RE = BitField(self, 0x00000004, "RE", "Receiver enable")
-        self.UESM = BitField(self, 0x00000002, "UESM", "USART enable in Stop mode")
-        self.UE = BitField(self, 0x00000001, "UE", "USART enable")
-        self.M = Subscriptor(self, "M{}")
-        self.DEAT = Subscriptor(self, "DEAT{}")
-        self.DEDT = Subscriptor(self, "DEDT{}")
-
-class SA_UART4_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR2", "Control register 2")
-        self.ADD4_7 = BitField(self, 0xF0000000, "ADD4_7", "Address of the USART node")
-        self.ADD0_3 = BitField(self, 0x0F000000, "ADD0_3", "Address of the USART node")
-        self.RTOEN = BitField(self, 0x00800000, "RTOEN", "Receiver timeout enable")
-        self.ABRMOD1 = BitField(self, 0x00400000, "ABRMOD1", "Auto baud rate mode")
-        self.ABRMOD0 = BitField(self, 0x00200000, "ABRMOD0", "ABRMOD0")
-        self.ABREN = BitField(self, 0x00100000, "ABREN", "Auto baud rate enable")
-        self.MSBFIRST = BitField(self, 0x00080000, "MSBFIRST", "Most significant bit first")
-        self.TAINV = BitField(self, 0x00040000, "TAINV", "Binary data inversion")
-        self.TXINV = BitField(self, 0x00020000, "TXINV", "TX pin active level inversion")
-        self.RXINV = BitField(self, 0x00010000, "RXINV", "RX pin active level inversion")
-        self.SWAP = BitField(self, 0x00008000, "SWAP", "Swap TX/RX pins")
-        self.LINEN = BitField(self, 0x00004000, "LINEN", "LIN mode enable")
-        self.STOP = BitField(self, 0x00003000, "STOP", "STOP bits")
-        self.CLKEN = BitField(self, 0x00000800, "CLKEN", "Clock enable")
-        self.CPOL = BitField(self, 0x00000400, "CPOL", "Clock polarity")
-        self.CPHA = BitField(self, 0x00000200, "CPHA", "Clock phase")
-        self.LBCL = BitField(self, 0x00000100, "LBCL", "Last bit clock pulse")
-        self.LBDIE = BitField(self, 0x00000040, "LBDIE", "LIN break detection interrupt enable")
-        self.LBDL = BitField(self, 0x00000020, "LBDL", "LIN break detection length")
-        self.ADDM7 = BitField(self, 0x00000010, "ADDM7", "7-bit Address Detection/4-bit Address Detection")
-        self.DIS_NSS = BitField(self, 0x00000008, "DIS_NSS", "DIS_NSS")
-        self.SLVEN = BitField(self, 0x00000001, "SLVEN", "SLVEN")
-        self.ABRMOD = Subscriptor(self, "ABRMOD{}")
-
-class SA_UART4_CR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR3", "Control register 3")
-        self.TXFTCFG = BitField(self, 0xE0000000, "TXFTCFG", "TXFTCFG")
-        self.RXFTIE = BitField(self, 0x10000000, "RXFTIE", "RXFTIE")
-        self.RXFTCFG = BitField(self, 0x0E000000, "RXFTCFG", "RXFTCFG")
-        self.TCBGTIE = BitField(self, 0x01000000, "TCBGTIE", "TCBGTIE")
-        self.TXFTIE = BitField(self, 0x00800000, "TXFTIE", "TXFTIE")
-        self.WUFIE = BitField(self, 0x00400000, "WUFIE", "Wakeup from Stop mode interrupt enable")
-        self.WUS = BitField(self, 0x00300000, "WUS", "Wakeup from Stop mode interrupt flag selection")
-        self.SCARCNT = BitField(self, 0x000E0000, "SCARCNT", "Smartcard auto-retry count")
-        self.DEP = BitField(self, 0x00008000, "DEP", "Driver enable polarity selection")
-        self.DEM = BitField(self, 0x00004000, "DEM", "Driver enable mode")
-        self.DDRE = BitField(self, 0x00002000, "DDRE", "DMA Disable on Reception Error")
-        self.OVRDIS = BitField(self, 0x00001000, "OVRDIS", "Overrun Disable")
-        self.ONEBIT = BitField(self, 0x00000800, "ONEBIT", "One sample bit method enable")
-        self.CTSIE = BitField(self, 0x00000400, "CTSIE", "CTS interrupt enable")
-        self.CTSE = BitField(self, 0x00000200, "CTSE", "CTS enable")
-        self.RTSE = BitField(self, 0x00000100, "RTSE", "RTS enable")
-        self.DMAT = BitField(self, 0x00000080, "DMAT", "DMA enable transmitter")
-        self.DMAR = BitField(self, 0x00000040, "DMAR", "DMA enable receiver")
-        self.SCEN = BitField(self, 0x00000020, "SCEN", "Smartcard mode enable")
-        self.NACK = BitField(self, 0x00000010, "NACK", "Smartcard NACK enable")
-        self.HDSEL = BitField(self, 0x00000008, "HDSEL", "Half-duplex selection")
-        self.IRLP = BitField(self, 0x00000004, "IRLP", "Ir low-power")
-        self.IREN = BitField(self, 0x00000002, "IREN", "Ir mode enable")
-        self.EIE = BitField(self, 0x00000001, "EIE", "Error interrupt enable")
-
-class SA_UART4_BRR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BRR", "Baud rate register")
-        self.DIV_Mantissa = BitField(self, 0x0000FFF0, "DIV_Mantissa", "DIV_Mantissa")
-        self.DIV_Fraction = BitField(self, 0x0000000F, "DIV_Fraction", "DIV_Fraction")
-
-class SA_UART4_GTPR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "GTPR", "Guard time and prescaler register")
-        self.GT = BitField(self, 0x0000FF00, "GT", "Guard time value")
-        self.PSC = BitField(self, 0x000000FF, "PSC", "Prescaler value")
-
-class SA_UART4_RTOR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RTOR", "Receiver timeout register")
-        self.BLEN = BitField(self, 0xFF000000, "BLEN", "Block Length")
-        self.RTO = BitField(self, 0x00FFFFFF, "RTO", "Receiver timeout value")
-
-class SA_UART4_RQR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RQR", "Request register")
-        self.TXFRQ = BitField(self, 0x00000010, "TXFRQ", "Transmit data flush request")
-        self.RXFRQ = BitField(self, 0x00000008, "RXFRQ", "Receive data flush request")
-        self.MMRQ = BitField(self, 0x00000004, "MMRQ", "Mute mode request")
-        self.SBKRQ = BitField(self, 0x00000002, "SBKRQ", "Send break request")
-        self.ABRRQ = BitField(self, 0x00000001, "ABRRQ", "Auto baud rate request")
-
-class SA_UART4_ISR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xC0, "ISR", "Interrupt & status register")
-        self.TXFT = BitField(self, 0x08000000, "TXFT", "TXFT")
-        self.RXFT = BitField(self, 0x04000000, "RXFT", "RXFT")
-        self.TCBGT = BitField(self, 0x02000000, "TCBGT", "TCBGT")
-        self.RXFF = BitField(self, 0x01000000, "RXFF", "RXFF")
-        self.TXFE = BitField(self, 0x00800000, "TXFE", "TXFE")
-        self.REACK = BitField(self, 0x00400000, "REACK", "REACK")
-        self.TEACK = BitField(self, 0x00200000, "TEACK", "TEACK")
-        self.WUF = BitField(self, 0x00100000, "WUF", "WUF")
-        self.RWU = BitField(self, 0x00080000, "RWU", "RWU")
-        self.SBKF = BitField(self, 0x00040000, "SBKF", "SBKF")
-        self.CMF = BitField(self, 0x00020000, "CMF", "CMF")
-        self.BUSY = BitField(self, 0x00010000, "BUSY", "BUSY")
-        self.ABRF = BitField(self, 0x00008000, "ABRF", "ABRF")
-        self.ABRE = BitField(self, 0x00004000, "ABRE", "ABRE")
-        self.UDR = BitField(self, 0x00002000, "UDR", "UDR")
-        self.EOBF = BitField(self, 0x00001000, "EOBF", "EOBF")
-        self.RTOF = BitField(self, 0x00000800, "RTOF", "RTOF")
-        self.CTS = BitField(self, 0x00000400, "CTS", "CTS")
-        self.CTSIF = BitField(self, 0x00000200, "CTSIF", "CTSIF")
-        self.LBDF = BitField(self, 0x00000100, "LBDF", "LBDF")
-        self.TXE = BitField(self, 0x00000080, "TXE", "TXE")
-        self.TC = BitField(self, 0x00000040, "TC", "TC")
-        self.RXNE = BitField(self, 0x00000020, "RXNE", "RXNE")
-        self.IDLE = BitField(self, 0x00000010, "IDLE", "IDLE")
-        self.ORE = BitField(self, 0x00000008, "ORE", "ORE")
-        self.NF = BitField(self, 0x00000004, "NF", "NF")
-        self.FE = BitField(self, 0x00000002, "FE", "FE")
-        self.PE = BitField(self, 0x00000001, "PE", "PE")
-
-class SA_UART4_ICR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ICR", "Interrupt flag clear register")
-        self.WUCF = BitField(self, 0x00100000, "WUCF", "Wakeup from Stop mode clear flag")
-        self.CMCF = BitField(self, 0x00020000, "CMCF", "Character match clear flag")
-        self.UDRCF = BitField(self, 0x00002000, "UDRCF", "UDRCF")
-        self.EOBCF = BitField(self, 0x00001000, "EOBCF", "End of block clear flag")
-        self.RTOCF = BitField(self, 0x00000800, "RTOCF", "Receiver timeout clear flag")
-        self.CTSCF = BitField(self, 0x00000200, "CTSCF", "CTS clear flag")
-        self.LBDCF = BitField(self, 0x00000100, "LBDCF", "LIN break detection clear flag")
-        self.TCBGTCF = BitField(self, 0x00000080, "TCBGTCF", "TCBGTCF")
-        self.TCCF = BitField(self, 0x00000040, "TCCF", "Transmission complete clear flag")
-        self.TXFECF = BitField(self, 0x00000020, "TXFECF", "TXFECF")
-        self.IDLECF = BitField(self, 0x00000010, "IDLECF", "Idle line detected clear flag")
-        self.ORECF = BitField(self, 0x00000008, "ORECF", "Overrun error clear flag")
-        self.NCF = BitField(self, 0x00000004, "NCF", "Noise detected clear flag")
-        self.FECF = BitField(self, 0x00000002, "FECF", "Framing error clear flag")
-        self.PECF = BitField(self, 0x00000001, "PECF", "Parity error clear flag")
-
-class SA_UART4_RDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RDR", "Receive data register")
-        self.RDR = BitField(self, 0x000001FF, "RDR", "Receive data value")
-
-class SA_UART4_TDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TDR", "Transmit data register")
-        self.TDR = BitField(self, 0x000001FF, "TDR", "Transmit data value")
-
-class SA_UART4_PRESC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PRESC", "USART prescaler register")
-        self.PRESCALER = BitField(self, 0x0000000F, "PRESCALER", "PRESCALER")
-
-class SA_UART4(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Universal synchronous asynchronous receiver transmitter")
-        self.CR1 = SA_UART4_CR1(self, 0x0)
-        self.CR2 = SA_UART4_CR2(self, 0x4)
-        self.CR3 = SA_UART4_CR3(self, 0x8)
-        self.BRR = SA_UART4_BRR(self, 0xC)
-        self.GTPR = SA_UART4_GTPR(self, 0x10)
-        self.RTOR = SA_UART4_RTOR(self, 0x14)
-        self.RQR = SA_UART4_RQR(self, 0x18)
-        self.ISR = SA_UART4_ISR(self, 0x1C)
-        self.ICR = SA_UART4_ICR(self, 0x20)
-        self.RDR = SA_UART4_RDR(self, 0x24)
-        self.TDR = SA_UART4_TDR(self, 0x28)
-        self.PRESC = SA_UART4_PRESC(self, 0x2C)
-
-UART4 = SA_UART4(0x40004C00, "UART4")
-
-class SA_LPUART1_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR1", "Control register 1")
-        self.RXFFIE = BitField(self, 0x80000000, "RXFFIE", "RXFFIE")
-        self.TXFEIE = BitField(self, 0x40000000, "TXFEIE", "TXFEIE")
-        self.FIFOEN = BitField(self, 0x20000000, "FIFOEN", "FIFOEN")
-        self.M1 = BitField(self, 0x10000000, "M1", "Word length")
-        self.DEAT4 = BitField(self, 0x02000000, "DEAT4", "Driver Enable assertion time")
-        self.DEAT3 = BitField(self, 0x01000000, "DEAT3", "DEAT3")
-        self.DEAT2 = BitField(self, 0x00800000, "DEAT2", "DEAT2")
-        self.DEAT1 = BitField(self, 0x00400000, "DEAT1", "DEAT1")
-        self.DEAT0 = BitField(self, 0x00200000, "DEAT0", "DEAT0")
-        self.DEDT4 = BitField(self, 0x00100000, "DEDT4", "Driver Enable de-assertion time")
-        self.DEDT3 = BitField(self, 0x00080000, "DEDT3", "DEDT3")
-        self.DEDT2 = BitField(self, 0x00040000, "DEDT2", "DEDT2")
-        self.DEDT1 = BitField(self, 0x00020000, "DEDT1", "DEDT1")
-        self.DEDT0 = BitField(self, 0x00010000, "DEDT0", "DEDT0")
-        self.CMIE = BitField(self, 0x00004000, "CMIE", "Character match interrupt enable")
-        self.MME = BitField(self, 0x00002000, "MME", "Mute mode enable")
-        self.M0 = BitField(self, 0x00001000, "M0", "Word length")
-        self.WAKE = BitField(self, 0x00000800, "WAKE", "Receiver wakeup method")
-        self.PCE = BitField(self, 0x00000400, "PCE", "Parity control enable")
-        self.PS = BitField(self, 0x00000200, "PS", "Parity selection")
-        self.PEIE = BitField(self, 0x00000100, "PEIE", "PE interrupt enable")
-        self.TXEIE = BitField(self, 0x00000080, "TXEIE", "interrupt enable")
-        self.TCIE = BitField(self, 0x00000040, "TCIE", "Transmission complete interrupt enable")
-        self.RXNEIE = BitField(self, 0x00000020, "RXNEIE", "RXNE interrupt enable")
-        self.IDLEIE = BitField(self, 0x00000010, "IDLEIE", "IDLE interrupt enable")
-        self.TE = BitField(self, 0x00000008, "TE", "Transmitter enable")
-        self.RE = BitField(self, 0x00000004, "RE", "Receiver enable")
-        self.UESM = BitField(self, 0x00000002, "UESM", "USART enable in Stop mode")
-        self.UE = BitField(self, 0x00000001, "UE", "USART enable")
-        self.M = Subscriptor(self, "M{}")
-        self.DEAT = Subscriptor(self, "DEAT{}")
-        self.DEDT = Subscriptor(self, "DEDT{}")
-
-class SA_LPUART1_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR2", "Control register 2")
-        self.ADD4_7 = BitField(self, 0xF0000000, "ADD4_7", "Address of the USART node")
-        self.ADD0_3 = BitField(self, 0x0F000000, "ADD0_3", "Address of the USART node")
-        self.MSBFIRST = BitField(self, 0x00080000, "MSBFIRST", "Most significant bit first")
-        self.TAINV = BitField(self, 0x00040000, "TAINV", "Binary data inversion")
-        self.TXINV = BitField(self, 0x00020000, "TXINV", "TX pin active level inversion")
-        self.RXINV = BitField(self, 0x00010000, "RXINV", "RX pin active level inversion")
-        self.SWAP = BitField(self, 0x00008000, "SWAP", "Swap TX/RX pins")
-        self.STOP = BitField(self, 0x00003000, "STOP", "STOP bits")
-        self.ADDM7 = BitField(self, 0x00000010, "ADDM7", "7-bit Address Detection/4-bit Address Detection")
-
-class SA_LPUART1_CR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR3", "Control register 3")
-        self.TXFTCFG = BitField(self, 0xE0000000, "TXFTCFG", "TXFTCFG")
-        self.RXFTIE = BitField(self, 0x10000000, "RXFTIE", "RXFTIE")
-        self.RXFTCFG = BitField(self, 0x0E000000, "RXFTCFG", "RXFTCFG")
-        self.TXFTIE = BitField(self, 0x00800000, "TXFTIE", "TXFTIE")
-        self.WUFIE = BitField(self, 0x00400000, "WUFIE", "Wakeup from Stop mode interrupt enable")
-        self.WUS = BitField(self, 0x00300000, "WUS", "Wakeup from Stop mode interrupt flag selection")
-        self.DEP = BitField(self, 0x00008000, "DEP", "Driver enable polarity selection")
-        self.DEM = BitField(self, 0x00004000, "DEM", "Driver enable mode")
-        self.DDRE = BitField(self, 0x00002000, "DDRE", "DMA Disable on Reception Error")
-        self.OVRDIS = BitField(self, 0x00001000, "OVRDIS", "Overrun Disable")
-        self.CTSIE = BitField(self, 0x00000400, "CTSIE", "CTS interrupt enable")
-        self.CTSE = BitField(self, 0x00000200, "CTSE", "CTS enable")
-        self.RTSE = BitField(self, 0x00000100, "RTSE", "RTS enable")
-        self.DMAT = BitField(self, 0x00000080, "DMAT", "DMA enable transmitter")
-        self.DMAR = BitField(self, 0x00000040, "DMAR", "DMA enable receiver")
-        self.HDSEL = BitField(self, 0x00000008, "HDSEL", "Half-duplex selection")
-        self.EIE = BitField(self, 0x00000001, "EIE", "Error interrupt enable")
-
-class SA_LPUART1_BRR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BRR", "Baud rate register")
-        self.BRR = BitField(self, 0x000FFFFF, "BRR", "BRR")
-
-class SA_LPUART1_RQR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RQR", "Request register")
-        self.TXFRQ = BitField(self, 0x00000010, "TXFRQ", "TXFRQ")
-        self.RXFRQ = BitField(self, 0x00000008, "RXFRQ", "Receive data flush request")
-        self.MMRQ = BitField(self, 0x00000004, "MMRQ", "Mute mode request")
-        self.SBKRQ = BitField(self, 0x00000002, "SBKRQ", "Send break request")
-
-class SA_LPUART1_ISR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xC0, "ISR", "Interrupt & status register")
-        self.TXFT = BitField(self, 0x08000000, "TXFT", "TXFT")
-        self.RXFT = BitField(self, 0x04000000, "RXFT", "RXFT")
-        self.RXFF = BitField(self, 0x01000000, "RXFF", "RXFF")
-        self.TXFE = BitField(self, 0x00800000, "TXFE", "TXFE")
-        self.REACK = BitField(self, 0x00400000, "REACK", "REACK")
-        self.TEACK = BitField(self, 0x00200000, "TEACK", "TEACK")
-        self.WUF = BitField(self, 0x00100000, "WUF", "WUF")
-        self.RWU = BitField(self, 0x00080000, "RWU", "RWU")
-        self.SBKF = BitField(self, 0x00040000, "SBKF", "SBKF")
-        self.CMF = BitField(self, 0x00020000, "CMF", "CMF")
-        self.BUSY = BitField(self, 0x00010000, "BUSY", "BUSY")
-        self.CTS = BitField(self, 0x00000400, "CTS", "CTS")
-        self.CTSIF = BitField(self, 0x00000200, "CTSIF", "CTSIF")
-        self.TXE = BitField(self, 0x00000080, "TXE", "TXE")
-        self.TC = BitField(self, 0x00000040, "TC", "TC")
-        self.RXNE = BitField(self, 0x00000020, "RXNE", "RXNE")
-        self.IDLE = BitField(self, 0x00000010, "IDLE", "IDLE")
-        self.ORE = BitField(self, 0x00000008, "ORE", "ORE")
-        self.NF = BitField(self, 0x00000004, "NF", "NF")
-        self.FE = BitField(self, 0x00000002, "FE", "FE")
-        self.PE = BitField(self, 0x00000001, "PE", "PE")
-
-class SA_LPUART1_ICR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ICR", "Interrupt flag clear register")
-        self.WUCF = BitField(self, 0x00100000, "WUCF", "Wakeup from Stop mode clear flag")
-        self.CMCF = BitField(self, 0x00020000, "CMCF", "Character match clear flag")
-        self.CTSCF = BitField(self, 0x00000200, "CTSCF", "CTS clear flag")
-        self.TCCF = BitField(self, 0x00000040, "TCCF", "Transmission complete clear flag")
-        self.IDLECF = BitField(self, 0x00000010, "IDLECF", "Idle line detected clear flag")
-        self.ORECF = BitField(self, 0x00000008, "ORECF", "Overrun error clear flag")
-        self.NCF = BitField(self, 0x00000004, "NCF", "Noise detected clear flag")
-        self.FECF = BitField(self, 0x00000002, "FECF", "Framing error clear flag")
-        self.PECF = BitField(self, 0x00000001, "PECF", "Parity error clear flag")
-
-class SA_LPUART1_RDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RDR", "Receive data register")
-        self.RDR = BitField(self, 0x000001FF, "RDR", "Receive data value")
-
-class SA_LPUART1_TDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TDR", "Transmit data register")
-        self.TDR = BitField(self, 0x000001FF, "TDR", "Transmit data value")
-
-class SA_LPUART1_PRESC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PRESC", "Prescaler register")
-        self.PRESCALER = BitField(self, 0x0000000F, "PRESCALER", "PRESCALER")
-
-class SA_LPUART1(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Universal synchronous asynchronous receiver transmitter")
-        self.CR1 = SA_LPUART1_CR1(self, 0x0)
-        self.CR2 = SA_LPUART1_CR2(self, 0x4)
-        self.CR3 = SA_LPUART1_CR3(self, 0x8)
-        self.BRR = SA_LPUART1_BRR(self, 0xC)
-        self.RQR = SA_LPUART1_RQR(self, 0x18)
-        self.ISR = SA_LPUART1_ISR(self, 0x1C)
-        self.ICR = SA_LPUART1_ICR(self, 0x20)
-        self.RDR = SA_LPUART1_RDR(self, 0x24)
-        self.TDR = SA_LPUART1_TDR(self, 0x28)
-        self.PRESC = SA_LPUART1_PRESC(self, 0x2C)
-
-LPUART1 = SA_LPUART1(0x40008000, "LPUART1")
-
-class SA_SPI1_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR1", "control register 1")
-        self.BIDIMODE = BitField(self, 0x00008000, "BIDIMODE", "Bidirectional data mode enable")
-        self.BIDIOE = BitField(self, 0x00004000, "BIDIOE", "Output enable in bidirectional mode")
-        self.CRCEN = BitField(self, 0x00002000, "CRCEN", "Hardware CRC calculation enable")
-        self.CRCNEXT = BitField(self, 0x00001000, "CRCNEXT", "CRC transfer next")
-        self.DFF = BitField(self, 0x00000800, "DFF", "Data frame format")
-        self.RXONLY = BitField(self, 0x00000400, "RXONLY", "Receive only")
-        self.SSM = BitField(self, 0x00000200, "SSM", "Software slave management")
-        self.SSI = BitField(self, 0x00000100, "SSI", "Internal slave select")
-        self.LSBFIRST = BitField(self, 0x00000080, "LSBFIRST", "Frame format")
-        self.SPE = BitField(self, 0x00000040, "SPE", "SPI enable")
-        self.BR = BitField(self, 0x00000038, "BR", "Baud rate control")
-        self.MSTR = BitField(self, 0x00000004, "MSTR", "Master selection")
-        self.CPOL = BitField(self, 0x00000002, "CPOL", "Clock polarity")
-        self.CPHA = BitField(self, 0x00000001, "CPHA", "Clock phase")
-
-class SA_SPI1_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x700, "CR2", "control register 2")
-        self.RXDMAEN = BitField(self, 0x00000001, "RXDMAEN", "Rx buffer DMA enable")
-        self.TXDMAEN = BitField(self, 0x00000002, "TXDMAEN", "Tx buffer DMA enable")
-        self.SSOE = BitField(self, 0x00000004, "SSOE", "SS output enable")
-        self.NSSP = BitField(self, 0x00000008, "NSSP", "NSS pulse management")
-        self.FRF = BitField(self, 0x00000010, "FRF", "Frame format")
-        self.ERRIE = BitField(self, 0x00000020, "ERRIE", "Error interrupt enable")
-        self.RXNEIE = BitField(self, 0x00000040, "RXNEIE", "RX buffer not empty interrupt enable")
-        self.TXEIE = BitField(self, 0x00000080, "TXEIE", "Tx buffer empty interrupt enable")
-        self.DS = BitField(self, 0x00000F00, "DS", "Data size")
-        self.FRXTH = BitField(self, 0x00001000, "FRXTH", "FIFO reception threshold")
-        self.LDMA_RX = BitField(self, 0x00002000, "LDMA_RX", "Last DMA transfer for reception")
-        self.LDMA_TX = BitField(self, 0x00004000, "LDMA_TX", "Last DMA transfer for transmission")
-
-class SA_SPI1_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x2, "SR", "status register")
-        self.RXNE = BitField(self, 0x00000001, "RXNE", "Receive buffer not empty")
-        self.TXE = BitField(self, 0x00000002, "TXE", "Transmit buffer empty")
-        self.CRCERR = BitField(self, 0x00000010, "CRCERR", "CRC error flag")
-        self.MODF = BitField(self, 0x00000020, "MODF", "Mode fault")
-        self.OVR = BitField(self, 0x00000040, "OVR", "Overrun flag")
-        self.BSY = BitField(self, 0x00000080, "BSY", "Busy flag")
-        self.TIFRFE = BitField(self, 0x00000100, "TIFRFE", "TI frame format error")
-        self.FRLVL = BitField(self, 0x00000600, "FRLVL", "FIFO reception level")
-        self.FTLVL = BitField(self, 0x00001800, "FTLVL", "FIFO transmission level")
-
-class SA_SPI1_DR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DR", "data register")
-        self.DR = BitField(self, 0x0000FFFF, "DR", "Data register")
-
-class SA_SPI1_CRCPR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x7, "CRCPR", "CRC polynomial register")
-        self.CRCPOLY = BitField(self, 0x0000FFFF, "CRCPOLY", "CRC polynomial register")
-
-class SA_SPI1_RXCRCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RXCRCR", "RX CRC register")
-        self.RxCRC = BitField(self, 0x0000FFFF, "RxCRC", "Rx CRC register")
-
-class SA_SPI1_TXCRCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXCRCR", "TX CRC register")
-        self.TxCRC = BitField(self, 0x0000FFFF, "TxCRC", "Tx CRC register")
-
-class SA_SPI1_I2SCFGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "I2SCFGR", "configuration register")
-        self.CHLEN = BitField(self, 0x00000001, "CHLEN", "CHLEN")
-        self.DATLEN = BitField(self, 0x00000006, "DATLEN", "DATLEN")
-        self.CKPOL = BitField(self, 0x00000008, "CKPOL", "CKPOL")
-        self.I2SSTD = BitField(self, 0x00000030, "I2SSTD", "I2SSTD")
-        self.PCMSYNC = BitField(self, 0x00000080, "PCMSYNC", "PCMSYNC")
-        self.I2SCFG = BitField(self, 0x00000300, "I2SCFG", "I2SCFG")
-        self.I2SE = BitField(self, 0x00000400, "I2SE", "I2SE")
-        self.I2SMOD = BitField(self, 0x00000800, "I2SMOD", "I2SMOD")
-
-class SA_SPI1_I2SPR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x2, "I2SPR", "prescaler register")
-        self.I2SDIV = BitField(self, 0x000000FF, "I2SDIV", "I2SDIV")
-        self.ODD = BitField(self, 0x00000100, "ODD", "ODD")
-        self.MCKOE = BitField(self, 0x00000200, "MCKOE", "MCKOE")
-
-class SA_SPI1(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Serial peripheral interface/Inter-IC sound")
-        self.CR1 = SA_SPI1_CR1(self, 0x0)
-        self.CR2 = SA_SPI1_CR2(self, 0x4)
-        self.SR = SA_SPI1_SR(self, 0x8)
-        self.DR = SA_SPI1_DR(self, 0xC)
-        self.CRCPR = SA_SPI1_CRCPR(self, 0x10)
-        self.RXCRCR = SA_SPI1_RXCRCR(self, 0x14)
-        self.TXCRCR = SA_SPI1_TXCRCR(self, 0x18)
-        self.I2SCFGR = SA_SPI1_I2SCFGR(self, 0x1C)
-        self.I2SPR = SA_SPI1_I2SPR(self, 0x20)
-
-SPI1 = SA_SPI1(0x40013000, "SPI1")
-SPI3 = SA_SPI1(0x40003C00, "SPI3")
-SPI2 = SA_SPI1(0x40003800, "SPI2")
-
-class SA_EXTI_IMR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFF820000, "IMR1", "Interrupt mask register")
-        self.IM0 = BitField(self, 0x00000001, "IM0", "Interrupt Mask on line 0")
-        self.IM1 = BitField(self, 0x00000002, "IM1", "Interrupt Mask on line 1")
-        self.IM2 = BitField(self, 0x00000004, "IM2", "Interrupt Mask on line 2")
-        self.IM3 = BitField(self, 0x00000008, "IM3", "Interrupt Mask on line 3")
-        self.IM4 = BitField(self, 0x00000010, "IM4", "Interrupt Mask on line 4")
-        self.IM5 = BitField(self, 0x00000020, "IM5", "Interrupt Mask on line 5")
-        self.IM6 = BitField(self, 0x00000040, "IM6", "Interrupt Mask on line 6")
-        self.IM7 = BitField(self, 0x00000080, "IM7", "Interrupt Mask on line 7")
-        self.IM8 = BitField(self, 0x00000100, "IM8", "Interrupt Mask on line 8")
-        self.IM9 = BitField(self, 0x00000200, "IM9", "Interrupt Mask on line 9")
-        self.IM10 = BitField(self, 0x00000400, "IM10", "Interrupt Mask on line 10")
-        self.IM11 = BitField(self, 0x00000800, "IM11", "Interrupt Mask on line 11")
-        self.IM12 = BitField(self, 0x00001000, "IM12", "Interrupt Mask on line 12")
-        self.IM13 = BitField(self, 0x00002000, "IM13", "Interrupt Mask on line 13")
-        self.IM14 = BitField(self, 0x00004000, "IM14", "Interrupt Mask on line 14")
-        self.IM15 = BitField(self, 0x00008000, "IM15", "Interrupt Mask on line 15")
-        self.IM16 = BitField(self, 0x00010000, "IM16", "Interrupt Mask on line 16")
-        self.IM17 = BitField(self, 0x00020000, "IM17", "Interrupt Mask on line 17")
-        self.IM18 = BitField(self, 0x00040000, "IM18", "Interrupt Mask on line 18")
-        self.IM19 = BitField(self, 0x00080000, "IM19", "Interrupt Mask on line 19")
-        self.IM20 = BitField(self, 0x00100000, "IM20", "Interrupt Mask on line 20")
-        self.IM21 = BitField(self, 0x00200000, "IM21", "Interrupt Mask on line 21")
-        self.IM22 = BitField(self, 0x00400000, "IM22", "Interrupt Mask on line 22")
-        self.IM23 = BitField(self, 0x00800000, "IM23", "Interrupt Mask on line 23")
-        self.IM24 = BitField(self, 0x01000000, "IM24", "Interrupt Mask on line 24")
-        self.IM25 = BitField(self, 0x02000000, "IM25", "Interrupt Mask on line 25")
-        self.IM26 = BitField(self, 0x04000000, "IM26", "Interrupt Mask on line 26")
-        self.IM27 = BitField(self, 0x08000000, "IM27", "Interrupt Mask on line 27")
-        self.IM28 = BitField(self, 0x10000000, "IM28", "Interrupt Mask on line 28")
-        self.IM29 = BitField(self, 0x20000000, "IM29", "Interrupt Mask on line 29")
-        self.IM30 = BitField(self, 0x40000000, "IM30", "Interrupt Mask on line 30")
-        self.IM31 = BitField(self, 0x80000000, "IM31", "Interrupt Mask on line 31")
-        self.IM = Subscriptor(self, "IM{}")
-
-class SA_EXTI_EMR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EMR1", "Event mask register")
-        self.EM0 = BitField(self, 0x00000001, "EM0", "Event Mask on line 0")
-        self.EM1 = BitField(self, 0x00000002, "EM1", "Event Mask on line 1")
-        self.EM2 = BitField(self, 0x00000004, "EM2", "Event Mask on line 2")
-        self.EM3 = BitField(self, 0x00000008, "EM3", "Event Mask on line 3")
-        self.EM4 = BitField(self, 0x00000010, "EM4", "Event Mask on line 4")
-        self.EM5 = BitField(self, 0x00000020, "EM5", "Event Mask on line 5")
-        self.EM6 = BitField(self, 0x00000040, "EM6", "Event Mask on line 6")
-        self.EM7 = BitField(self, 0x00000080, "EM7", "Event Mask on line 7")
-        self.EM8 = BitField(self, 0x00000100, "EM8", "Event Mask on line 8")
-        self.EM9 = BitField(self, 0x00000200, "EM9", "Event Mask on line 9")
-        self.EM10 = BitField(self, 0x00000400, "EM10", "Event Mask on line 10")
-        self.EM11 = BitField(self, 0x00000800, "EM11", "Event Mask on line 11")
-        self.EM12 = BitField(self, 0x00001000, "EM12", "Event Mask on line 12")
-        self.EM13 = BitField(self, 0x00002000, "EM13", "Event Mask on line 13")
-        self.EM14 = BitField(self, 0x00004000, "EM14", "Event Mask on line 14")
-        self.EM15 = BitField(self, 0x00008000, "EM15", "Event Mask on line 15")
-        self.EM16 = BitField(self, 0x00010000, "EM16", "Event Mask on line 16")
-        self.EM17 = BitField(self, 0x00020000, "EM17", "Event Mask on line 17")
-        self.EM18 = BitField(self, 0x00040000, "EM18", "Event Mask on line 18")
-        self.EM19 = BitField(self, 0x00080000, "EM19", "Event Mask on line 19")
-        self.EM20 = BitField(self, 0x00100000, "EM20", "Event Mask on line 20")
-        self.EM21 = BitField(self, 0x00200000, "EM21", "Event Mask on line 21")
-        self.EM22 = BitField(self, 0x00400000, "EM22", "Event Mask on line 22")
-        self.EM23 = BitField(self, 0x00800000, "EM23", "Event Mask on line 23")
-        self.EM24 = BitField(self, 0x01000000, "EM24", "Event Mask on line 24")
-        self.EM25 = BitField(self, 0x02000000, "EM25", "Event Mask on line 25")
-        self.EM26 = BitField(self, 0x04000000, "EM26", "Event Mask on line 26")
-        self.EM27 = BitField(self, 0x08000000, "EM27", "Event Mask on line 27")
-        self.EM28 = BitField(self, 0x10000000, "EM28", "Event Mask on line 28")
-        self.EM29 = BitField(self, 0x20000000, "EM29", "Event Mask on line 29")
-        self.EM30 = BitField(self, 0x40000000, "EM30", "Event Mask on line 30")
-        self.EM31 = BitField(self, 0x80000000, "EM31", "Event Mask on line 31")
-        self.EM = Subscriptor(self, "EM{}")
-
-class SA_EXTI_RTSR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RTSR1", "Rising Trigger selection register")
-        self.RT0 = BitField(self, 0x00000001, "RT0", "Rising trigger event configuration of line 0")
-        self.RT1 = BitField(self, 0x00000002, "RT1", "Rising trigger event configuration of line 1")
-        self.RT2 = BitField(self, 0x00000004, "RT2", "Rising trigger event configuration of line 2")
-        self.RT3 = BitField(self, 0x00000008, "RT3", "Rising trigger event configuration of line 3")
-        self.RT4 = BitField(self, 0x00000010, "RT4", "Rising trigger event configuration of line 4")
-        self.RT5 = BitField(self, 0x00000020, "RT5", "Rising trigger event configuration of line 5")
-        self.RT6 = BitField(self, 0x00000040, "RT6", "Rising trigger event configuration of line 6")
-        self.RT7 = BitField(self, 0x00000080, "RT7", "Rising trigger event configuration of line 7")
-        self.RT8 = BitField(self, 0x00000100, "RT8", "Rising trigger event configuration of line 8")
-        self.RT9 = BitField(self, 0x00000200, "RT9", "Rising trigger event configuration of line 9")
-        self.RT10 = BitField(self, 0x00000400, "RT10", "Rising trigger event configuration of line 10")
-        self.RT11 = BitField(self, 0x00000800, "RT11", "Rising trigger event configuration of line 11")
-        self.RT12 = BitField(self, 0x00001000, "RT12", "Rising trigger event configuration of line 12")
-        self.RT13 = BitField(self, 0x00002000, "RT13", "Rising trigger event configuration of line 13")
-        self.RT14 = BitField(self, 0x00004000, "RT14", "Rising trigger event configuration of line 14")
-        self.RT15 = BitField(self, 0x00008000, "RT15", "Rising trigger event configuration of line 15")
-        self.RT16 = BitField(self, 0x00010000, "RT16", "Rising trigger event configuration of line 16")
-        self.RT18 = BitField(self, 0x00040000, "RT18", "Rising trigger event configuration of line 18")
-        self.RT19 = BitField(self, 0x00080000, "RT19", "Rising trigger event configuration of line 19")
-        self.RT20 = BitField(self, 0x00100000, "RT20", "Rising trigger event configuration of line 20")
-        self.RT21 = BitField(self, 0x00200000, "RT21", "Rising trigger event configuration of line 21")
-        self.RT22 = BitField(self, 0x00400000, "RT22", "Rising trigger event configuration of line 22")
-        self.RT = BitField(self, 0xE0000000, "RT", "RT")
-
-class SA_EXTI_FTSR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "FTSR1", "Falling Trigger selection register")
-        self.FT0 = BitField(self, 0x00000001, "FT0", "Falling trigger event configuration of line 0")
-        self.FT1 = BitField(self, 0x00000002, "FT1", "Falling trigger event configuration of line 1")
-        self.FT2 = BitField(self, 0x00000004, "FT2", "Falling trigger event configuration of line 2")
-        self.FT3 = BitField(self, 0x00000008, "FT3", "Falling trigger event configuration of line 3")
-        self.FT4 = BitField(self, 0x00000010, "FT4", "Falling trigger event configuration of line 4")
-        self.FT5 = BitField(self, 0x00000020, "FT5", "Falling trigger event configuration of line 5")
-        self.FT6 = BitField(self, 0x00000040, "FT6", "Falling trigger event configuration of line 6")
-        self.FT7 = BitField(self, 0x00000080, "FT7", "Falling trigger event configuration of line 7")
-        self.FT8 = BitField(self, 0x00000100, "FT8", "Falling trigger event configuration of line 8")
-        self.FT9 = BitField(self, 0x00000200, "FT9", "Falling trigger event configuration of line 9")
-        self.FT10 = BitField(self, 0x00000400, "FT10", "Falling trigger event configuration of line 10")
-        self.FT11 = BitField(self, 0x00000800, "FT11", "Falling trigger event configuration of line 11")
-        self.FT12 = BitField(self, 0x00001000, "FT12", "Falling trigger event configuration of line 12")
-        self.FT13 = BitField(self, 0x00002000, "FT13", "Falling trigger event configuration of line 13")
-        self.FT14 = BitField(self, 0x00004000, "FT14", "Falling trigger event configuration of line 14")
-        self.FT15 = BitField(self, 0x00008000, "FT15", "Falling trigger event configuration of line 15")
-        self.FT16 = BitField(self, 0x00010000, "FT16", "Falling trigger event configuration of line 16")
-        self.FT18 = BitField(self, 0x00040000, "FT18", "Falling trigger event configuration of line 18")
-        self.FT19 = BitField(self, 0x00080000, "FT19", "Falling trigger event configuration of line 19")
-        self.FT20 = BitField(self, 0x00100000, "FT20", "Falling trigger event configuration of line 20")
-        self.FT21 = BitField(self, 0x00200000, "FT21", "Falling trigger event configuration of line 21")
-        self.FT22 = BitField(self, 0x00400000, "FT22", "Falling trigger event configuration of line 22")
-        self.FT = Subscriptor(self, "FT{}")
-
-class SA_EXTI_SWIER1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SWIER1", "Software interrupt event register")
-        self.SWI0 = BitField(self, 0x00000001, "SWI0", "Software Interrupt on line 0")
-        self.SWI1 = BitField(self, 0x00000002, "SWI1", "Software Interrupt on line 1")
-        self.SWI2 = BitField(self, 0x00000004, "SWI2", "Software Interrupt on line 2")
-        self.SWI3 = BitField(self, 0x00000008, "SWI3", "Software Interrupt on line 3")
-        self.SWI4 = BitField(self, 0x00000010, "SWI4", "Software Interrupt on line 4")
-        self.SWI5 = BitField(self, 0x00000020, "SWI5", "Software Interrupt on line 5")
-        self.SWI6 = BitField(self, 0x00000040, "SWI6", "Software Interrupt on line 6")
-        self.SWI7 = BitField(self, 0x00000080, "SWI7", "Software Interrupt on line 7")
-        self.SWI8 = BitField(self, 0x00000100, "SWI8", "Software Interrupt on line 8")
-        self.SWI9 = BitField(self, 0x00000200, "SWI9", "Software Interrupt on line 9")
-        self.SWI10 = BitField(self, 0x00000400, "SWI10", "Software Interrupt on line 10")
-        self.SWI11 = BitField(self, 0x00000800, "SWI11", "Software Interrupt on line 11")
-        self.SWI12 = BitField(self, 0x00001000, "SWI12", "Software Interrupt on line 12")
-        self.SWI13 = BitField(self, 0x00002000, "SWI13", "Software Interrupt on line 13")
-        self.SWI14 = BitField(self, 0x00004000, "SWI14", "Software Interrupt on line 14")
-        self.SWI15 = BitField(self, 0x00008000, "SWI15", "Software Interrupt on line 15")
-        self.SWI16 = BitField(self, 0x00010000, "SWI16", "Software Interrupt on line 16")
-        self.SWI18 = BitField(self, 0x00040000, "SWI18", "Software Interrupt on line 18")
-        self.SWI19 = BitField(self, 0x00080000, "SWI19", "Software Interrupt on line 19")
-        self.SWI20 = BitField(self, 0x00100000, "SWI20", "Software Interrupt on line 20")
-        self.SWI21 = BitField(self, 0x00200000, "SWI21", "Software Interrupt on line 21")
-        self.SWI22 = BitField(self, 0x00400000, "SWI22", "Software Interrupt on line 22")
-        self.SWI = Subscriptor(self, "SWI{}")
-
-class SA_EXTI_PR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PR1", "Pending register")
-        self.PIF0 = BitField(self, 0x00000001, "PIF0", "Pending bit 0")
-        self.PIF1 = BitField(self, 0x00000002, "PIF1", "Pending bit 1")
-        self.PIF2 = BitField(self, 0x00000004, "PIF2", "Pending bit 2")
-        self.PIF3 = BitField(self, 0x00000008, "PIF3", "Pending bit 3")
-        self.PIF4 = BitField(self, 0x00000010, "PIF4", "Pending bit 4")
-        self.PIF5 = BitField(self, 0x00000020, "PIF5", "Pending bit 5")
-        self.PIF6 = BitField(self, 0x00000040, "PIF6", "Pending bit 6")
-        self.PIF7 = BitField(self, 0x00000080, "PIF7", "Pending bit 7")
-        self.PIF8 = BitField(self, 0x00000100, "PIF8", "Pending bit 8")
-        self.PIF9 = BitField(self, 0x00000200, "PIF9", "Pending bit 9")
-        self.PIF10 = BitField(self, 0x00000400, "PIF10", "Pending bit 10")
-        self.PIF11 = BitField(self, 0x00000800, "PIF11", "Pending bit 11")
-        self.PIF12 = BitField(self, 0x00001000, "PIF12", "Pending bit 12")
-        self.PIF13 = BitField(self, 0x00002000, "PIF13", "Pending bit 13")
-        self.PIF14 = BitField(self, 0x00004000, "PIF14", "Pending bit 14")
-        self.PIF15 = BitField(self, 0x00008000, "PIF15", "Pending bit 15")
-        self.PIF16 = BitField(self, 0x00010000, "PIF16", "Pending bit 16")
-        self.PIF17 = BitField(self, 0x00020000, "PIF17", "Pending bit 17")
-        self.PIF18 = BitField(self, 0x00040000, "PIF18", "Pending bit 18")
-        self.PIF19 = BitField(self, 0x00080000, "PIF19", "Pending bit 19")
-        self.PIF20 = BitField(self, 0x00100000, "PIF20", "Pending bit 20")
-        self.PIF21 = BitField(self, 0x00200000, "PIF21", "Pending bit 21")
-        self.PIF22 = BitField(self, 0x00400000, "PIF22", "Pending bit 22")
-        self.PIF29 = BitField(self, 0x20000000, "PIF29", "Pending bit 29")
-        self.PIF30 = BitField(self, 0x40000000, "PIF30", "Pending bit 30")
-        self.PIF31 = BitField(self, 0x80000000, "PIF31", "Pending bit 31")
-        self.PIF = Subscriptor(self, "PIF{}")
-
-class SA_EXTI_IMR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFFFF87, "IMR2", "Interrupt mask register")
-        self.IM32 = BitField(self, 0x00000001, "IM32", "Interrupt Mask on external/internal line 32")
-        self.IM33 = BitField(self, 0x00000002, "IM33", "Interrupt Mask on external/internal line 33")
-        self.IM34 = BitField(self, 0x00000004, "IM34", "Interrupt Mask on external/internal line 34")
-        self.IM35 = BitField(self, 0x00000008, "IM35", "Interrupt Mask on external/internal line 35")
-        self.IM36 = BitField(self, 0x00000010, "IM36", "Interrupt Mask on external/internal line 36")
-        self.IM37 = BitField(self, 0x00000020, "IM37", "Interrupt Mask on external/internal line 37")
-        self.IM38 = BitField(self, 0x00000040, "IM38", "Interrupt Mask on external/internal line 38")
-        self.IM39 = BitField(self, 0x00000080, "IM39", "Interrupt Mask on external/internal line 39")
-        self.IM40 = BitField(self, 0x00000100, "IM40", "Interrupt Mask on external/internal line 40")
-        self.IM41 = BitField(self, 0x00000200, "IM41", "Interrupt Mask on external/internal line 41")
-        self.IM42 = BitField(self, 0x00000400, "IM42", "Interrupt Mask on external/internal line 42")
-        self.IM43 = BitField(self, 0x00000800, "IM43", "Interrupt Mask on external/internal line 43")
-        self.IM = Subscriptor(self, "IM{}")
-
-class SA_EXTI_EMR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EMR2", "Event mask register")
-        self.EM32 = BitField(self, 0x00000001, "EM32", "Event mask on external/internal line 32")
-        self.EM33 = BitField(self, 0x00000002, "EM33", "Event mask on external/internal line 33")
-        self.EM34 = BitField(self, 0x00000004, "EM34", "Event mask on external/internal line 34")
-        self.EM35 = BitField(self, 0x00000008, "EM35", "Event mask on external/internal line 35")
-        self.EM36 = BitField(self, 0x00000010, "EM36", "Event mask on external/internal line 36")
-        self.EM37 = BitField(self, 0x00000020, "EM37", "Event mask on external/internal line 37")
-        self.EM38 = BitField(self, 0x00000040, "EM38", "Event mask on external/internal line 38")
-        self.EM39 = BitField(self, 0x00000080, "EM39", "Event mask on external/internal line 39")
-        self.EM40 = BitField(self, 0x00000100, "EM40", "Event mask on external/internal line 40")
-        self.EM = Subscriptor(self, "EM{}")
-
-class SA_EXTI_RTSR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RTSR2", "Rising Trigger selection register")
-        self.RT32 = BitField(self, 0x00000001, "RT32", "Rising trigger event configuration bit of line 32")
-        self.RT33 = BitField(self, 0x00000002, "RT33", "Rising trigger event configuration bit of line 32")
-        self.RT38 = BitField(self, 0x00000040, "RT38", "Rising trigger event configuration bit of line 38")
-        self.RT39 = BitField(self, 0x00000080, "RT39", "Rising trigger event configuration bit of line 39")
-        self.RT40 = BitField(self, 0x00000100, "RT40", "Rising trigger event configuration bit of line 40")
-        self.RT41 = BitField(self, 0x00000200, "RT41", "Rising trigger event configuration bit of line 41")
-        self.RT = Subscriptor(self, "RT{}")
-
-class SA_EXTI_FTSR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "FTSR2", "Falling Trigger selection register")
-        self.FT35 = BitField(self, 0x00000008, "FT35", "Falling trigger event configuration bit of line 35")
-        self.FT36 = BitField(self, 0x00000010, "FT36", "Falling trigger event configuration bit of line 36")
-        self.FT37 = BitField(self, 0x00000020, "FT37", "Falling trigger event configuration bit of line 37")
-        self.FT38 = BitField(self, 0x00000040, "FT38", "Falling trigger event configuration bit of line 38")
-        self.FT = Subscriptor(self, "FT{}")
-
-class SA_EXTI_SWIER2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SWIER2", "Software interrupt event register")
-        self.SWI35 = BitField(self, 0x00000008, "SWI35", "Software interrupt on line 35")
-        self.SWI36 = BitField(self, 0x00000010, "SWI36", "Software interrupt on line 36")
-        self.SWI37 = BitField(self, 0x00000020, "SWI37", "Software interrupt on line 37")
-        self.SWI38 = BitField(self, 0x00000040, "SWI38", "Software interrupt on line 38")
-        self.SWI = Subscriptor(self, "SWI{}")
-
-class SA_EXTI_PR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PR2", "Pending register")
-        self.PIF35 = BitField(self, 0x00000008, "PIF35", "Pending interrupt flag on line 35")
-        self.PIF36 = BitField(self, 0x00000010, "PIF36", "Pending interrupt flag on line 36")
-        self.PIF37 = BitField(self, 0x00000020, "PIF37", "Pending interrupt flag on line 37")
-        self.PIF38 = BitField(self, 0x00000040, "PIF38", "Pending interrupt flag on line 38")
-        self.PIF = Subscriptor(self, "PIF{}")
-
-class SA_EXTI(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "External interrupt/event controller")
-        self.IMR1 = SA_EXTI_IMR1(self, 0x0)
-        self.EMR1 = SA_EXTI_EMR1(self, 0x4)
-        self.RTSR1 = SA_EXTI_RTSR1(self, 0x8)
-        self.FTSR1 = SA_EXTI_FTSR1(self, 0xC)
-        self.SWIER1 = SA_EXTI_SWIER1(self, 0x10)
-        self.PR1 = SA_EXTI_PR1(self, 0x14)
-        self.IMR2 = SA_EXTI_IMR2(self, 0x20)
-        self.EMR2 = SA_EXTI_EMR2(self, 0x24)
-        self.RTSR2 = SA_EXTI_RTSR2(self, 0x28)
-        self.FTSR2 = SA_EXTI_FTSR2(self, 0x2C)
-        self.SWIER2 = SA_EXTI_SWIER2(self, 0x30)
-        self.PR2 = SA_EXTI_PR2(self, 0x34)
-        self.RTSR = Subscriptor(self, "RTSR{}")
-        self.SWIER = Subscriptor(self, "SWIER{}")
-        self.PR = Subscriptor(self, "PR{}")
-        self.FTSR = Subscriptor(self, "FTSR{}")
-        self.IMR = Subscriptor(self, "IMR{}")
-        self.EMR = Subscriptor(self, "EMR{}")
-
-EXTI = SA_EXTI(0x40010400, "EXTI")
-
-class SA_RTC_TR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TR", "time register")
-        self.PM = BitField(self, 0x00400000, "PM", "AM/PM notation")
-        self.HT = BitField(self, 0x00300000, "HT", "Hour tens in BCD format")
-        self.HU = BitField(self, 0x000F0000, "HU", "Hour units in BCD format")
-        self.MNT = BitField(self, 0x00007000, "MNT", "Minute tens in BCD format")
-        self.MNU = BitField(self, 0x00000F00, "MNU", "Minute units in BCD format")
-        self.ST = BitField(self, 0x00000070, "ST", "Second tens in BCD format")
-        self.SU = BitField(self, 0x0000000F, "SU", "Second units in BCD format")
-
-class SA_RTC_DR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x2101, "DR", "date register")
-        self.YT = BitField(self, 0x00F00000, "YT", "Year tens in BCD format")
-        self.YU = BitField(self, 0x000F0000, "YU", "Year units in BCD format")
-        self.WDU = BitField(self, 0x0000E000, "WDU", "Week day units")
-        self.MT = BitField(self, 0x00001000, "MT", "Month tens in BCD format")
-        self.MU = BitField(self, 0x00000F00, "MU", "Month units in BCD format")
-        self.DT = BitField(self, 0x00000030, "DT", "Date tens in BCD format")
-        self.DU = BitField(self, 0x0000000F, "DU", "Date units in BCD format")
-
-class SA_RTC_SSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SSR", "sub second register")
-        self.SS = BitField(self, 0x0000FFFF, "SS", "Sub second value")
-
-class SA_RTC_ICSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x7, "ICSR", "initialization and status register")
-        self.ALRAWF = BitField(self, 0x00000001, "ALRAWF", "Alarm A write flag")
-        self.ALRBWF = BitField(self, 0x00000002, "ALRBWF", "Alarm B write flag")
-        self.WUTWF = BitField(self, 0x00000004, "WUTWF", "Wakeup timer write flag")
-        self.SHPF = BitField(self, 0x00000008, "SHPF", "Shift operation pending")
-        self.INITS = BitField(self, 0x00000010, "INITS", "Initialization status flag")
-        self.RSF = BitField(self, 0x00000020, "RSF", "Registers synchronization flag")
-        self.INITF = BitField(self, 0x00000040, "INITF", "Initialization flag")
-        self.INIT = BitField(self, 0x00000080, "INIT", "Initialization mode")
-        self.RECALPF = BitField(self, 0x00010000, "RECALPF", "Recalibration pending Flag")
-
-class SA_RTC_PRER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x7F00FF, "PRER", "prescaler register")
-        self.PREDIV_A = BitField(self, 0x007F0000, "PREDIV_A", "Asynchronous prescaler factor")
-        self.PREDIV_S = BitField(self, 0x00007FFF, "PREDIV_S", "Synchronous prescaler factor")
-
-class SA_RTC_WUTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFF, "WUTR", "wakeup timer register")
-        self.WUT = BitField(self, 0x0000FFFF, "WUT", "Wakeup auto-reload value bits")
-
-class SA_RTC_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR", "control register")
-        self.WCKSEL = BitField(self, 0x00000007, "WCKSEL", "Wakeup clock selection")
-        self.TSEDGE = BitField(self, 0x00000008, "TSEDGE", "Time-stamp event active edge")
-        self.REFCKON = BitField(self, 0x00000010, "REFCKON", "Reference clock detection enable (50 or 60 Hz)")
-        self.BYPSHAD = BitField(self, 0x00000020, "BYPSHAD", "Bypass the shadow registers")
-        self.FMT = BitField(self, 0x00000040, "FMT", "Hour format")
-        self.ALRAE = BitField(self, 0x00000100, "ALRAE", "Alarm A enable")
-        self.ALRBE = BitField(self, 0x00000200, "ALRBE", "Alarm B enable")
-        self.WUTE = BitField(self, 0x00000400, "WUTE", "Wakeup timer enable")
-        self.TSE = BitField(self, 0x00000800, "TSE", "Time stamp enable")
-        self.ALRAIE = BitField(self, 0x00001000, "ALRAIE", "Alarm A interrupt enable")
-        self.ALRBIE = BitField(self, 0x00002000, "ALRBIE", "Alarm B interrupt enable")
-        self.WUTIE = BitField(self, 0x00004000, "WUTIE", "Wakeup timer interrupt enable")
-        self.TSIE = BitField(self, 0x00008000, "TSIE", "Time-stamp interrupt enable")
-        self.ADD1H = BitField(self, 0x00010000, "ADD1H", "Add 1 hour (summer time change)")
-        self.SUB1H = BitField(self, 0x00020000, "SUB1H", "Subtract 1 hour (winter time change)")
-        self.BKP = BitField(self, 0x00040000, "BKP", "Backup")
-        self.COSEL = BitField(self, 0x00080000, "COSEL", "Calibration output selection")
-        self.POL = BitField(self, 0x00100000, "POL", "Output polarity")
-        self.OSEL = BitField(self, 0x00600000, "OSEL", "Output selection")
-        self.COE = BitField(self, 0x00800000, "COE", "Calibration output enable")
-        self.ITSE = BitField(self, 0x01000000, "ITSE", "timestamp on internal event enable")
-        self.TAMPTS = BitField(self, 0x02000000, "TAMPTS", "TAMPTS")
-        self.TAMPOE = BitField(self, 0x04000000, "TAMPOE", "TAMPOE")
-        self.TAMPALRM_PU = BitField(self, 0x20000000, "TAMPALRM_PU", "TAMPALRM_PU")
-        self.TAMPALRM_TYPE = BitField(self, 0x40000000, "TAMPALRM_TYPE", "TAMPALRM_TYPE")
-        self.OUT2EN = BitField(self, 0x80000000, "OUT2EN", "OUT2EN")
-
-class SA_RTC_WPR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "WPR", "write protection register")
-        self.KEY = BitField(self, 0x000000FF, "KEY", "Write protection key")
-
-class SA_RTC_CALR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CALR", "calibration register")
-        self.CALP = BitField(self, 0x00008000, "CALP", "Increase frequency of RTC by 488.5 ppm")
-        self.CALW8 = BitField(self, 0x00004000, "CALW8", "Use an 8-second calibration cycle period")
-        self.CALW16 = BitField(self, 0x00002000, "CALW16", "Use a 16-second calibration cycle period")
-        self.CALM = BitField(self, 0x000001FF, "CALM", "Calibration minus")
-
-class SA_RTC_SHIFTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SHIFTR", "shift control register")
-        self.ADD1S = BitField(self, 0x80000000, "ADD1S", "Add one second")
-        self.SUBFS = BitField(self, 0x00007FFF, "SUBFS", "Subtract a fraction of a second")
-
-class SA_RTC_TSTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TSTR", "time stamp time register")
-        self.SU = BitField(self, 0x0000000F, "SU", "Second units in BCD format")
-        self.ST = BitField(self, 0x00000070, "ST", "Second tens in BCD format")
-        self.MNU = BitField(self, 0x00000F00, "MNU", "Minute units in BCD format")
-        self.MNT = BitField(self, 0x00007000, "MNT", "Minute tens in BCD format")
-        self.HU = BitField(self, 0x000F0000, "HU", "Hour units in BCD format")
-        self.HT = BitField(self, 0x00300000, "HT", "Hour tens in BCD format")
-        self.PM = BitField(self, 0x00400000, "PM", "AM/PM notation")
-
-class SA_RTC_TSDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TSDR", "time stamp date register")
-        self.WDU = BitField(self, 0x0000E000, "WDU", "Week day units")
-        self.MT = BitField(self, 0x00001000, "MT", "Month tens in BCD format")
-        self.MU = BitField(self, 0x00000F00, "MU", "Month units in BCD format")
-        self.DT = BitField(self, 0x00000030, "DT", "Date tens in BCD format")
-        self.DU = BitField(self, 0x0000000F, "DU", "Date units in BCD format")
-
-class SA_RTC_TSSSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TSSSR", "timestamp sub second register")
-        self.SS = BitField(self, 0x0000FFFF, "SS", "Sub second value")
-
-class SA_RTC_ALRMAR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ALRMAR", "alarm A register")
-        self.MSK4 = BitField(self, 0x80000000, "MSK4", "Alarm A date mask")
-        self.WDSEL = BitField(self, 0x40000000, "WDSEL", "Week day selection")
-        self.DT = BitField(self, 0x30000000, "DT", "Date tens in BCD format")
-        self.DU = BitField(self, 0x0F000000, "DU", "Date units or day in BCD format")
-        self.MSK3 = BitField(self, 0x00800000, "MSK3", "Alarm A hours mask")
-        self.PM = BitField(self, 0x00400000, "PM", "AM/PM notation")
-        self.HT = BitField(self, 0x00300000, "HT", "Hour tens in BCD format")
-        self.HU = BitField(self, 0x000F0000, "HU", "Hour units in BCD format")
-        self.MSK2 = BitField(self, 0x00008000, "MSK2", "Alarm A minutes mask")
-        self.MNT = BitField(self, 0x00007000, "MNT", "Minute tens in BCD format")
-        self.MNU = BitField(self, 0x00000F00, "MNU", "Minute units in BCD format")
-        self.MSK1 = BitField(self, 0x00000080, "MSK1", "Alarm A seconds mask")
-        self.ST = BitField(self, 0x00000070, "ST", "Second tens in BCD format")
-        self.SU = BitField(self, 0x0000000F, "SU", "Second units in BCD format")
-        self.MSK = Subscriptor(self, "MSK{}")
-
-class SA_RTC_ALRMASSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ALRMASSR", "alarm A sub second register")
-        self.MASKSS = BitField(self, 0x0F000000, "MASKSS", "Mask the most-significant bits starting at this bit")
-        self.SS = BitField(self, 0x00007FFF, "SS", "Sub seconds value")
-
-class SA_RTC_ALRMBR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ALRMBR", "alarm B register")
-        self.MSK4 = BitField(self, 0x80000000, "MSK4", "Alarm B date mask")
-        self.WDSEL = BitField(self, 0x40000000, "WDSEL", "Week day selection")
-        self.DT = BitField(self, 0x30000000, "DT", "Date tens in BCD format")
-        self.DU = BitField(self, 0x0F000000, "DU", "Date units or day in BCD format")
-        self.MSK3 = BitField(self, 0x00800000, "MSK3", "Alarm B hours mask")
-        self.PM = BitField(self, 0x00400000, "PM", "AM/PM notation")
-        self.HT = BitField(self, 0x00300000, "HT", "Hour tens in BCD format")
-        self.HU = BitField(self, 0x000F0000, "HU", "Hour units in BCD format")
-        self.MSK2 = BitField(self, 0x00008000, "MSK2", "Alarm B minutes mask")
-        self.MNT = BitField(self, 0x00007000, "MNT", "Minute tens in BCD format")
-        self.MNU = BitField(self, 0x00000F00, "MNU", "Minute units in BCD format")
-        self.MSK1 = BitField(self, 0x00000080, "MSK1", "Alarm B seconds mask")
-        self.ST = BitField(self, 0x00000070, "ST", "Second tens in BCD format")
-        self.SU = BitField(self, 0x0000000F, "SU", "Second units in BCD format")
-        self.MSK = Subscriptor(self, "MSK{}")
-
-class SA_RTC_ALRMBSSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ALRMBSSR", "alarm B sub second register")
-        self.MASKSS = BitField(self, 0x0F000000, "MASKSS", "Mask the most-significant bits starting at this bit")
-        self.SS = BitField(self, 0x00007FFF, "SS", "Sub seconds value")
-
-class SA_RTC_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "status register")
-        self.ALRAF = BitField(self, 0x00000001, "ALRAF", "ALRAF")
-        self.ALRBF = BitField(self, 0x00000002, "ALRBF", "ALRBF")
-        self.WUTF = BitField(self, 0x00000004, "WUTF", "WUTF")
-        self.TSF = BitField(self, 0x00000008, "TSF", "TSF")
-        self.TSOVF = BitField(self, 0x00000010, "TSOVF", "TSOVF")
-        self.ITSF = BitField(self, 0x00000020, "ITSF", "ITSF")
-
-class SA_RTC_MISR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "MISR", "status register")
-        self.ALRAMF = BitField(self, 0x00000001, "ALRAMF", "ALRAMF")
-        self.ALRBMF = BitField(self, 0x00000002, "ALRBMF", "ALRBMF")
-        self.WUTMF = BitField(self, 0x00000004, "WUTMF", "WUTMF")
-        self.TSMF = BitField(self, 0x00000008, "TSMF", "TSMF")
-        self.TSOVMF = BitField(self, 0x00000010, "TSOVMF", "TSOVMF")
-        self.ITSMF = BitField(self, 0x00000020, "ITSMF", "ITSMF")
-
-class SA_RTC_SCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SCR", "status register")
-        self.CALRAF = BitField(self, 0x00000001, "CALRAF", "CALRAF")
-        self.CALRBF = BitField(self, 0x00000002, "CALRBF", "CALRBF")
-        self.CWUTF = BitField(self, 0x00000004, "CWUTF", "CWUTF")
-        self.CTSF = BitField(self, 0x00000008, "CTSF", "CTSF")
-        self.CTSOVF = BitField(self, 0x00000010, "CTSOVF", "CTSOVF")
-        self.CITSF = BitField(self, 0x00000020, "CITSF", "CITSF")
-
-class SA_RTC(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Real-time clock")
-        self.TR = SA_RTC_TR(self, 0x0)
-        self.DR = SA_RTC_DR(self, 0x4)
-        self.SSR = SA_RTC_SSR(self, 0x8)
-        self.ICSR = SA_RTC_ICSR(self, 0xC)
-        self.PRER = SA_RTC_PRER(self, 0x10)
-        self.WUTR = SA_RTC_WUTR(self, 0x14)
-        self.CR = SA_RTC_CR(self, 0x18)
-        self.WPR = SA_RTC_WPR(self, 0x24)
-        self.CALR = SA_RTC_CALR(self, 0x28)
-        self.SHIFTR = SA_RTC_SHIFTR(self, 0x2C)
-        self.TSTR = SA_RTC_TSTR(self, 0x30)
-        self.TSDR = SA_RTC_TSDR(self, 0x34)
-        self.TSSSR = SA_RTC_TSSSR(self, 0x38)
-        self.ALRMAR = SA_RTC_ALRMAR(self, 0x40)
-        self.ALRMASSR = SA_RTC_ALRMASSR(self, 0x44)
-        self.ALRMBR = SA_RTC_ALRMBR(self, 0x48)
-        self.ALRMBSSR = SA_RTC_ALRMBSSR(self, 0x4C)
-        self.SR = SA_RTC_SR(self, 0x50)
-        self.MISR = SA_RTC_MISR(self, 0x54)
-        self.SCR = SA_RTC_SCR(self, 0x5C)
-
-RTC = SA_RTC(0x40002800, "RTC")
-
-class SA_DMA1_ISR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ISR", "interrupt status register")
-        self.TEIF8 = BitField(self, 0x80000000, "TEIF8", "TEIF8")
-        self.HTIF8 = BitField(self, 0x40000000, "HTIF8", "HTIF8")
-        self.TCIF8 = BitField(self, 0x20000000, "TCIF8", "TCIF8")
-        self.GIF8 = BitField(self, 0x10000000, "GIF8", "GIF8")
-        self.TEIF7 = BitField(self, 0x08000000, "TEIF7", "TEIF7")
-        self.HTIF7 = BitField(self, 0x04000000, "HTIF7", "HTIF7")
-        self.TCIF7 = BitField(self, 0x02000000, "TCIF7", "TCIF7")
-        self.GIF7 = BitField(self, 0x01000000, "GIF7", "GIF7")
-        self.TEIF6 = BitField(self, 0x00800000, "TEIF6", "TEIF6")
-        self.HTIF6 = BitField(self, 0x00400000, "HTIF6", "HTIF6")
-        self.TCIF6 = BitField(self, 0x00200000, "TCIF6", "TCIF6")
-        self.GIF6 = BitField(self, 0x00100000, "GIF6", "GIF6")
-        self.TEIF5 = BitField(self, 0x00080000, "TEIF5", "TEIF5")
-        self.HTIF5 = BitField(self, 0x00040000, "HTIF5", "HTIF5")
-        self.TCIF5 = BitField(self, 0x00020000, "TCIF5", "TCIF5")
-        self.GIF5 = BitField(self, 0x00010000, "GIF5", "GIF5")
-        self.TEIF4 = BitField(self, 0x00008000, "TEIF4", "TEIF4")
-        self.HTIF4 = BitField(self, 0x00004000, "HTIF4", "HTIF4")
-        self.TCIF4 = BitField(self, 0x00002000, "TCIF4", "TCIF4")
-        self.GIF4 = BitField(self, 0x00001000, "GIF4", "GIF4")
-        self.TEIF3 = BitField(self, 0x00000800, "TEIF3", "TEIF3")
-        self.HTIF3 = BitField(self, 0x00000400, "HTIF3", "HTIF3")
-        self.TCIF3 = BitField(self, 0x00000200, "TCIF3", "TCIF3")
-        self.GIF3 = BitField(self, 0x00000100, "GIF3", "GIF3")
-        self.TEIF2 = BitField(self, 0x00000080, "TEIF2", "TEIF2")
-        self.HTIF2 = BitField(self, 0x00000040, "HTIF2", "HTIF2")
-        self.TCIF2 = BitField(self, 0x00000020, "TCIF2", "TCIF2")
-        self.GIF2 = BitField(self, 0x00000010, "GIF2", "GIF2")
-        self.TEIF1 = BitField(self, 0x00000008, "TEIF1", "TEIF1")
-        self.HTIF1 = BitField(self, 0x00000004, "HTIF1", "HTIF1")
-        self.TCIF1 = BitField(self, 0x00000002, "TCIF1", "TCIF1")
-        self.GIF1 = BitField(self, 0x00000001, "GIF1", "GIF1")
-        self.TEIF = Subscriptor(self, "TEIF{}")
-        self.TCIF = Subscriptor(self, "TCIF{}")
-        self.HTIF = Subscriptor(self, "HTIF{}")
-        self.GIF = Subscriptor(self, "GIF{}")
-
-class SA_DMA1_IFCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IFCR", "DMA interrupt flag clear register")
-        self.TEIF8 = BitField(self, 0x80000000, "TEIF8", "TEIF8")
-        self.HTIF8 = BitField(self, 0x40000000, "HTIF8", "HTIF8")
-        self.TCIF8 = BitField(self, 0x20000000, "TCIF8", "TCIF8")
-        self.GIF8 = BitField(self, 0x10000000, "GIF8", "GIF8")
-        self.TEIF7 = BitField(self, 0x08000000, "TEIF7", "TEIF7")
-        self.HTIF7 = BitField(self, 0x04000000, "HTIF7", "HTIF7")
-        self.TCIF7 = BitField(self, 0x02000000, "TCIF7", "TCIF7")
-        self.GIF7 = BitField(self, 0x01000000, "GIF7", "GIF7")
-        self.TEIF6 = BitField(self, 0x00800000, "TEIF6", "TEIF6")
-        self.HTIF6 = BitField(self, 0x00400000, "HTIF6", "HTIF6")
-        self.TCIF6 = BitField(self, 0x00200000, "TCIF6", "TCIF6")
-        self.GIF6 = BitField(self, 0x00100000, "GIF6", "GIF6")
-        self.TEIF5 = BitField(self, 0x00080000, "TEIF5", "TEIF5")
-        self.HTIF5 = BitField(self, 0x00040000, "HTIF5", "HTIF5")
-        self.TCIF5 = BitField(self, 0x00020000, "TCIF5", "TCIF5")
-        self.GIF5 = BitField(self, 0x00010000, "GIF5", "GIF5")
-        self.TEIF4 = BitField(self, 0x00008000, "TEIF4", "TEIF4")
-        self.HTIF4 = BitField(self, 0x00004000, "HTIF4", "HTIF4")
-        self.TCIF4 = BitField(self, 0x00002000, "TCIF4", "TCIF4")
-        self.GIF4 = BitField(self, 0x00001000, "GIF4", "GIF4")
-        self.TEIF3 = BitField(self, 0x00000800, "TEIF3", "TEIF3")
-        self.HTIF3 = BitField(self, 0x00000400, "HTIF3", "HTIF3")
-        self.TCIF3 = BitField(self, 0x00000200, "TCIF3", "TCIF3")
-        self.GIF3 = BitField(self, 0x00000100, "GIF3", "GIF3")
-        self.TEIF2 = BitField(self, 0x00000080, "TEIF2", "TEIF2")
-        self.HTIF2 = BitField(self, 0x00000040, "HTIF2", "HTIF2")
-        self.TCIF2 = BitField(self, 0x00000020, "TCIF2", "TCIF2")
-        self.GIF2 = BitField(self, 0x00000010, "GIF2", "GIF2")
-        self.TEIF1 = BitField(self, 0x00000008, "TEIF1", "TEIF1")
-        self.HTIF1 = BitField(self, 0x00000004, "HTIF1", "HTIF1")
-        self.TCIF1 = BitField(self, 0x00000002, "TCIF1", "TCIF1")
-        self.GIF1 = BitField(self, 0x00000001, "GIF1", "GIF1")
-        self.TEIF = Subscriptor(self, "TEIF{}")
-        self.TCIF = Subscriptor(self, "TCIF{}")
-        self.HTIF = Subscriptor(self, "HTIF{}")
-        self.GIF = Subscriptor(self, "GIF{}")
-
-class SA_DMA1_CCR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR1", "DMA channel 1 configuration register")
-        self.EN = BitField(self, 0x00000001, "EN", "channel enable")
-        self.TCIE = BitField(self, 0x00000002, "TCIE", "TCIE")
-        self.HTIE = BitField(self, 0x00000004, "HTIE", "HTIE")
-        self.TEIE = BitField(self, 0x00000008, "TEIE", "TEIE")
-        self.DIR = BitField(self, 0x00000010, "DIR", "DIR")
-        self.CIRC = BitField(self, 0x00000020, "CIRC", "CIRC")
-        self.PINC = BitField(self, 0x00000040, "PINC", "PINC")
-        self.MINC = BitField(self, 0x00000080, "MINC", "MINC")
-        self.PSIZE = BitField(self, 0x00000300, "PSIZE", "PSIZE")
-        self.MSIZE = BitField(self, 0x00000C00, "MSIZE", "MSIZE")
-        self.PL = BitField(self, 0x00003000, "PL", "PL")
-        self.MEM2MEM = BitField(self, 0x00004000, "MEM2MEM", "MEM2MEM")
-
-class SA_DMA1_CCR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR2", "DMA channel 2 configuration register")
-        self.EN = BitField(self, 0x00000001, "EN", "channel enable")
-        self.TCIE = BitField(self, 0x00000002, "TCIE", "TCIE")
-        self.HTIE = BitField(self, 0x00000004, "HTIE", "HTIE")
-        self.TEIE = BitField(self, 0x00000008, "TEIE", "TEIE")
-        self.DIR = BitField(self, 0x00000010, "DIR", "DIR")
-        self.CIRC = BitField(self, 0x00000020, "CIRC", "CIRC")
-        self.PINC = BitField(self, 0x00000040, "PINC", "PINC")
-        self.MINC = BitField(self, 0x00000080, "MINC", "MINC")
-        self.PSIZE = BitField(self, 0x00000300, "PSIZE", "PSIZE")
-        self.MSIZE = BitField(self, 0x00000C00, "MSIZE", "MSIZE")
-        self.PL = BitField(self, 0x00003000, "PL", "PL")
-        self.MEM2MEM = BitField(self, 0x00004000, "MEM2MEM", "MEM2MEM")
-
-class SA_DMA1_CCR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR3", "DMA channel 3 configuration register")
-        self.EN = BitField(self, 0x00000001, "EN", "channel enable")
-        self.TCIE = BitField(self, 0x00000002, "TCIE", "TCIE")
-        self.HTIE = BitField(self, 0x00000004, "HTIE", "HTIE")
-        self.TEIE = BitField(self, 0x00000008, "TEIE", "TEIE")
-        self.DIR = BitField(self, 0x00000010, "DIR", "DIR")
-        self.CIRC = BitField(self, 0x00000020, "CIRC", "CIRC")
-        self.PINC = BitField(self, 0x00000040, "PINC", "PINC")
-        self.MINC = BitField(self, 0x00000080, "MINC", "MINC")
-        self.PSIZE = BitField(self, 0x00000300, "PSIZE", "PSIZE")
-        self.MSIZE = BitField(self, 0x00000C00, "MSIZE", "MSIZE")
-        self.PL = BitField(self, 0x00003000, "PL", "PL")
-        self.MEM2MEM = BitField(self, 0x00004000, "MEM2MEM", "MEM2MEM")
-
-class SA_DMA1_CCR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR4", "DMA channel 3 configuration register")
-        self.EN = BitField(self, 0x00000001, "EN", "channel enable")
-        self.TCIE = BitField(self, 0x00000002, "TCIE", "TCIE")
-        self.HTIE = BitField(self, 0x00000004, "HTIE", "HTIE")
-        self.TEIE = BitField(self, 0x00000008, "TEIE", "TEIE")
-        self.DIR = BitField(self, 0x00000010, "DIR", "DIR")
-        self.CIRC = BitField(self, 0x00000020, "CIRC", "CIRC")
-        self.PINC = BitField(self, 0x00000040, "PINC", "PINC")
-        self.MINC = BitField(self, 0x00000080, "MINC", "MINC")
-        self.PSIZE = BitField(self, 0x00000300, "PSIZE", "PSIZE")
-        self.MSIZE = BitField(self, 0x00000C00, "MSIZE", "MSIZE")
-        self.PL = BitField(self, 0x00003000, "PL", "PL")
-        self.MEM2MEM = BitField(self, 0x00004000, "MEM2MEM", "MEM2MEM")
-
-class SA_DMA1_CCR5(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR5", "DMA channel 4 configuration register")
-        self.EN = BitField(self, 0x00000001, "EN", "channel enable")
-        self.TCIE = BitField(self, 0x00000002, "TCIE", "TCIE")
-        self.HTIE = BitField(self, 0x00000004, "HTIE", "HTIE")
-        self.TEIE = BitField(self, 0x00000008, "TEIE", "TEIE")
-        self.DIR = BitField(self, 0x00000010, "DIR", "DIR")
-        self.CIRC = BitField(self, 0x00000020, "CIRC", "CIRC")
-        self.PINC = BitField(self, 0x00000040, "PINC", "PINC")
-        self.MINC = BitField(self, 0x00000080, "MINC", "MINC")
-        self.PSIZE = BitField(self, 0x00000300, "PSIZE", "PSIZE")
-        self.MSIZE = BitField(self, 0x00000C00, "MSIZE", "MSIZE")
-        self.PL = BitField(self, 0x00003000, "PL", "PL")
-        self.MEM2MEM = BitField(self, 0x00004000, "MEM2MEM", "MEM2MEM")
-
-class SA_DMA1_CCR6(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR6", "DMA channel 5 configuration register")
-        self.EN = BitField(self, 0x00000001, "EN", "channel enable")
-        self.TCIE = BitField(self, 0x00000002, "TCIE", "TCIE")
-        self.HTIE = BitField(self, 0x00000004, "HTIE", "HTIE")
-        self.TEIE = BitField(self, 0x00000008, "TEIE", "TEIE")
-        self.DIR = BitField(self, 0x00000010, "DIR", "DIR")
-        self.CIRC = BitField(self, 0x00000020, "CIRC", "CIRC")
-        self.PINC = BitField(self, 0x00000040, "PINC", "PINC")
-        self.MINC = BitField(self, 0x00000080, "MINC", "MINC")
-        self.PSIZE = BitField(self, 0x00000300, "PSIZE", "PSIZE")
-        self.MSIZE = BitField(self, 0x00000C00, "MSIZE", "MSIZE")
-        self.PL = BitField(self, 0x00003000, "PL", "PL")
-        self.MEM2MEM = BitField(self, 0x00004000, "MEM2MEM", "MEM2MEM")
-
-class SA_DMA1_CCR7(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR7", "DMA channel 6 configuration register")
-        self.EN = BitField(self, 0x00000001, "EN", "channel enable")
-        self.TCIE = BitField(self, 0x00000002, "TCIE", "TCIE")
-        self.HTIE = BitField(self, 0x00000004, "HTIE", "HTIE")
-        self.TEIE = BitField(self, 0x00000008, "TEIE", "TEIE")
-        self.DIR = BitField(self, 0x00000010, "DIR", "DIR")
-        self.CIRC = BitField(self, 0x00000020, "CIRC", "CIRC")
-        self.PINC = BitField(self, 0x00000040, "PINC", "PINC")
-        self.MINC = BitField(self, 0x00000080, "MINC", "MINC")
-        self.PSIZE = BitField(self, 0x00000300, "PSIZE", "PSIZE")
-        self.MSIZE = BitField(self, 0x00000C00, "MSIZE", "MSIZE")
-        self.PL = BitField(self, 0x00003000, "PL", "PL")
-        self.MEM2MEM = BitField(self, 0x00004000, "MEM2MEM", "MEM2MEM")
-
-class SA_DMA1_CCR8(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR8", "DMA channel 7 configuration register")
-        self.EN = BitField(self, 0x00000001, "EN", "channel enable")
-        self.TCIE = BitField(self, 0x00000002, "TCIE", "TCIE")
-        self.HTIE = BitField(self, 0x00000004, "HTIE", "HTIE")
-        self.TEIE = BitField(self, 0x00000008, "TEIE", "TEIE")
-        self.DIR = BitField(self, 0x00000010, "DIR", "DIR")
-        self.CIRC = BitField(self, 0x00000020, "CIRC", "CIRC")
-        self.PINC = BitField(self, 0x00000040, "PINC", "PINC")
-        self.MINC = BitField(self, 0x00000080, "MINC", "MINC")
-        self.PSIZE = BitField(self, 0x00000300, "PSIZE", "PSIZE")
-        self.MSIZE = BitField(self, 0x00000C00, "MSIZE", "MSIZE")
-        self.PL = BitField(self, 0x00003000, "PL", "PL")
-        self.MEM2MEM = BitField(self, 0x00004000, "MEM2MEM", "MEM2MEM")
-
-class SA_DMA1_CNDTR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNDTR1", "channel x number of data to transfer register")
-        self.NDT = BitField(self, 0x0000FFFF, "NDT", "Number of data items to transfer")
-
-class SA_DMA1_CNDTR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNDTR2", "channel x number of data to transfer register")
-        self.NDT = BitField(self, 0x0000FFFF, "NDT", "Number of data items to transfer")
-
-class SA_DMA1_CNDTR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNDTR3", "channel x number of data to transfer register")
-        self.NDT = BitField(self, 0x0000FFFF, "NDT", "Number of data items to transfer")
-
-class SA_DMA1_CNDTR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNDTR4", "channel x number of data to transfer register")
-        self.NDT = BitField(self, 0x0000FFFF, "NDT", "Number of data items to transfer")
-
-class SA_DMA1_CNDTR5(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNDTR5", "channel x number of data to transfer register")
-        self.NDT = BitField(self, 0x0000FFFF, "NDT", "Number of data items to transfer")
-
-class SA_DMA1_CNDTR6(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNDTR6", "channel x number of data to transfer register")
-        self.NDT = BitField(self, 0x0000FFFF, "NDT", "Number of data items to transfer")
-
-class SA_DMA1_CNDTR7(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNDTR7", "channel x number of data to transfer register")
-        self.NDT = BitField(self, 0x0000FFFF, "NDT", "Number of data items to transfer")
-
-class SA_DMA1_CNDTR8(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNDTR8", "channel x number of data to transfer register")
-        self.NDT = BitField(self, 0x0000FFFF, "NDT", "Number of data items to transfer")
-
-class SA_DMA1_CPAR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CPAR1", "DMA channel x peripheral address register")
-        self.PA = BitField(self, 0xFFFFFFFF, "PA", "Peripheral address")
-
-class SA_DMA1_CPAR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CPAR2", "DMA channel x peripheral address register")
-        self.PA = BitField(self, 0xFFFFFFFF, "PA", "Peripheral address")
-
-class SA_DMA1_CPAR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CPAR3", "DMA channel x peripheral address register")
-        self.PA = BitField(self, 0xFFFFFFFF, "PA", "Peripheral address")
-
-class SA_DMA1_CPAR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CPAR4", "DMA channel x peripheral address register")
-        self.PA = BitField(self, 0xFFFFFFFF, "PA", "Peripheral address")
-
-class SA_DMA1_CPAR5(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CPAR5", "DMA channel x peripheral address register")
-        self.PA = BitField(self, 0xFFFFFFFF, "PA", "Peripheral address")
-
-class SA_DMA1_CPAR6(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CPAR6", "DMA channel x peripheral address register")
-        self.PA = BitField(self, 0xFFFFFFFF, "PA", "Peripheral address")
-
-class SA_DMA1_CPAR7(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CPAR7", "DMA channel x peripheral address register")
-        self.PA = BitField(self, 0xFFFFFFFF, "PA", "Peripheral address")
-
-class SA_DMA1_CPAR8(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CPAR8", "DMA channel x peripheral address register")
-        self.PA = BitField(self, 0xFFFFFFFF, "PA", "Peripheral address")
-
-class SA_DMA1_CMAR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CMAR1", "DMA channel x memory address register")
-        self.MA = BitField(self, 0xFFFFFFFF, "MA", "Memory 1 address (used in case of Double buffer mode)")
-
-class SA_DMA1_CMAR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CMAR2", "DMA channel x memory address register")
-        self.MA = BitField(self, 0xFFFFFFFF, "MA", "Memory 1 address (used in case of Double buffer mode)")
-
-class SA_DMA1_CMAR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CMAR3", "DMA channel x memory address register")
-        self.MA = BitField(self, 0xFFFFFFFF, "MA", "Memory 1 address (used in case of Double buffer mode)")
-
-class SA_DMA1_CMAR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CMAR4", "DMA channel x memory address register")
-        self.MA = BitField(self, 0xFFFFFFFF, "MA", "Memory 1 address (used in case of Double buffer mode)")
-
-class SA_DMA1_CMAR5(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CMAR5", "DMA channel x memory address register")
-        self.MA = BitField(self, 0xFFFFFFFF, "MA", "Memory 1 address (used in case of Double buffer mode)")
-
-class SA_DMA1_CMAR6(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CMAR6", "DMA channel x memory address register")
-        self.MA = BitField(self, 0xFFFFFFFF, "MA", "Memory 1 address (used in case of Double buffer mode)")
-
-class SA_DMA1_CMAR7(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CMAR7", "DMA channel x memory address register")
-        self.MA = BitField(self, 0xFFFFFFFF, "MA", "Memory 1 address (used in case of Double buffer mode)")
-
-class SA_DMA1_CMAR8(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CMAR8", "DMA channel x memory address register")
-        self.MA = BitField(self, 0xFFFFFFFF, "MA", "Memory 1 address (used in case of Double buffer mode)")
-
-class SA_DMA1(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "DMA controller")
-        self.ISR = SA_DMA1_ISR(self, 0x0)
-        self.IFCR = SA_DMA1_IFCR(self, 0x4)
-        self.CCR1 = SA_DMA1_CCR1(self, 0x8)
-        self.CCR2 = SA_DMA1_CCR2(self, 0x1C)
-        self.CCR3 = SA_DMA1_CCR3(self, 0x30)
-        self.CCR4 = SA_DMA1_CCR4(self, 0x44)
-        self.CCR5 = SA_DMA1_CCR5(self, 0x58)
-        self.CCR6 = SA_DMA1_CCR6(self, 0x6C)
-        self.CCR7 = SA_DMA1_CCR7(self, 0x80)
-        self.CCR8 = SA_DMA1_CCR8(self, 0x94)
-        self.CNDTR1 = SA_DMA1_CNDTR1(self, 0xC)
-        self.CNDTR2 = SA_DMA1_CNDTR2(self, 0x20)
-        self.CNDTR3 = SA_DMA1_CNDTR3(self, 0x34)
-        self.CNDTR4 = SA_DMA1_CNDTR4(self, 0x48)
-        self.CNDTR5 = SA_DMA1_CNDTR5(self, 0x5C)
-        self.CNDTR6 = SA_DMA1_CNDTR6(self, 0x70)
-        self.CNDTR7 = SA_DMA1_CNDTR7(self, 0x84)
-        self.CNDTR8 = SA_DMA1_CNDTR8(self, 0x98)
-        self.CPAR1 = SA_DMA1_CPAR1(self, 0x10)
-        self.CPAR2 = SA_DMA1_CPAR2(self, 0x24)
-        self.CPAR3 = SA_DMA1_CPAR3(self, 0x38)
-        self.CPAR4 = SA_DMA1_CPAR4(self, 0x4C)
-        self.CPAR5 = SA_DMA1_CPAR5(self, 0x60)
-        self.CPAR6 = SA_DMA1_CPAR6(self, 0x74)
-        self.CPAR7 = SA_DMA1_CPAR7(self, 0x88)
-        self.CPAR8 = SA_DMA1_CPAR8(self, 0x9C)
-        self.CMAR1 = SA_DMA1_CMAR1(self, 0x14)
-        self.CMAR2 = SA_DMA1_CMAR2(self, 0x28)
-        self.CMAR3 = SA_DMA1_CMAR3(self, 0x3C)
-        self.CMAR4 = SA_DMA1_CMAR4(self, 0x50)
-        self.CMAR5 = SA_DMA1_CMAR5(self, 0x64)
-        self.CMAR6 = SA_DMA1_CMAR6(self, 0x78)
-        self.CMAR7 = SA_DMA1_CMAR7(self, 0x8C)
-        self.CMAR8 = SA_DMA1_CMAR8(self, 0xA0)
-        self.CPAR = Subscriptor(self, "CPAR{}")
-        self.CMAR = Subscriptor(self, "CMAR{}")
-        self.CNDTR = Subscriptor(self, "CNDTR{}")
-        self.CCR = Subscriptor(self, "CCR{}")
-
-DMA1 = SA_DMA1(0x40020000, "DMA1")
-DMA2 = SA_DMA1(0x40020400, "DMA2")
-
-class SA_DMAMUX_C0CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C0CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C1CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C1CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C2CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C2CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C3CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C3CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C4CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C4CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C5CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C5CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C6CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C6CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C7CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C7CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C8CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C8CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C9CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C9CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C10CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C10CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C11CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C11CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C12CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C12CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C13CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C13CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C14CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C14CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_C15CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C15CR", "DMAMux - DMA request line multiplexer channel x control register")
-        self.DMAREQ_ID = BitField(self, 0x0000007F, "DMAREQ_ID", "Input DMA request line selected")
-        self.SOIE = BitField(self, 0x00000100, "SOIE", "Interrupt enable at synchronization event overrun")
-        self.EGE = BitField(self, 0x00000200, "EGE", "Event generation enable/disable")
-        self.SE = BitField(self, 0x00010000, "SE", "Synchronous operating mode enable/disable")
-        self.SPOL = BitField(self, 0x00060000, "SPOL", "Synchronization event type selector Defines the synchronization event on the selected synchronization input:")
-        self.NBREQ = BitField(self, 0x00F80000, "NBREQ", "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.")
-        self.SYNC_ID = BitField(self, 0x1F000000, "SYNC_ID", "Synchronization input selected")
-
-class SA_DMAMUX_RG0CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RG0CR", "DMAMux - DMA request generator channel x control register")
-        self.SIG_ID = BitField(self, 0x0000001F, "SIG_ID", "DMA request trigger input selected")
-        self.OIE = BitField(self, 0x00000100, "OIE", "Interrupt enable at trigger event overrun")
-        self.GE = BitField(self, 0x00010000, "GE", "DMA request generator channel enable/disable")
-        self.GPOL = BitField(self, 0x00060000, "GPOL", "DMA request generator trigger event type selection Defines the trigger event on the selected DMA request trigger input")
-        self.GNBREQ = BitField(self, 0x00F80000, "GNBREQ", "Number of DMA requests to generate Defines the number of DMA requests generated after a trigger event, then stop generating. The actual number of generated DMA requests is GNBREQ+1. Note: This field can only be written when GE bit is reset.")
-
-class SA_DMAMUX_RG1CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RG1CR", "DMAMux - DMA request generator channel x control register")
-        self.SIG_ID = BitField(self, 0x0000001F, "SIG_ID", "DMA request trigger input selected")
-        self.OIE = BitField(self, 0x00000100, "OIE", "Interrupt enable at trigger event overrun")
-        self.GE = BitField(self, 0x00010000, "GE", "DMA request generator channel enable/disable")
-        self.GPOL = BitField(self, 0x00060000, "GPOL", "DMA request generator trigger event type selection Defines the trigger event on the selected DMA request trigger input")
-        self.GNBREQ = BitField(self, 0x00F80000, "GNBREQ", "Number of DMA requests to generate Defines the number of DMA requests generated after a trigger event, then stop generating. The actual number of generated DMA requests is GNBREQ+1. Note: This field can only be written when GE bit is reset.")
-
-class SA_DMAMUX_RG2CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RG2CR", "DMAMux - DMA request generator channel x control register")
-        self.SIG_ID = BitField(self, 0x0000001F, "SIG_ID", "DMA request trigger input selected")
-        self.OIE = BitField(self, 0x00000100, "OIE", "Interrupt enable at trigger event overrun")
-        self.GE = BitField(self, 0x00010000, "GE", "DMA request generator channel enable/disable")
-        self.GPOL = BitField(self, 0x00060000, "GPOL", "DMA request generator trigger event type selection Defines the trigger event on the selected DMA request trigger input")
-        self.GNBREQ = BitField(self, 0x00F80000, "GNBREQ", "Number of DMA requests to generate Defines the number of DMA requests generated after a trigger event, then stop generating. The actual number of generated DMA requests is GNBREQ+1. Note: This field can only be written when GE bit is reset.")
-
-class SA_DMAMUX_RG3CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RG3CR", "DMAMux - DMA request generator channel x control register")
-        self.SIG_ID = BitField(self, 0x0000001F, "SIG_ID", "DMA request trigger input selected")
-        self.OIE = BitField(self, 0x00000100, "OIE", "Interrupt enable at trigger event overrun")
-        self.GE = BitField(self, 0x00010000, "GE", "DMA request generator channel enable/disable")
-        self.GPOL = BitField(self, 0x00060000, "GPOL", "DMA request generator trigger event type selection Defines the trigger event on the selected DMA request trigger input")
-        self.GNBREQ = BitField(self, 0x00F80000, "GNBREQ", "Number of DMA requests to generate Defines the number of DMA requests generated after a trigger event, then stop generating. The actual number of generated DMA requests is GNBREQ+1. Note: This field can only be written when GE bit is reset.")
-
-class SA_DMAMUX_RGSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RGSR", "DMAMux - DMA request generator status register")
-        self.OF = BitField(self, 0x0000000F, "OF", "Trigger event overrun flag The flag is set when a trigger event occurs on DMA request generator channel x, while the DMA request generator counter value is lower than GNBREQ. The flag is cleared by writing 1 to the corresponding COFx bit in DMAMUX_RGCFR register.")
-
-class SA_DMAMUX_RGCFR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RGCFR", "DMAMux - DMA request generator clear flag register")
-        self.COF = BitField(self, 0x0000000F, "COF", "Clear trigger event overrun flag Upon setting, this bit clears the corresponding overrun flag OFx in the DMAMUX_RGCSR register.")
-
-class SA_DMAMUX_CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CSR", "DMAMUX request line multiplexer interrupt channel status register")
-        self.SOF = BitField(self, 0x0000FFFF, "SOF", "Synchronization overrun event flag")
-
-class SA_DMAMUX_CFR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CFR", "DMAMUX request line multiplexer interrupt clear flag register")
-        self.CSOF = BitField(self, 0x0000FFFF, "CSOF", "Clear synchronization overrun event flag")
-
-class SA_DMAMUX(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "DMAMUX")
-        self.C0CR = SA_DMAMUX_C0CR(self, 0x0)
-        self.C1CR = SA_DMAMUX_C1CR(self, 0x4)
-        self.C2CR = SA_DMAMUX_C2CR(self, 0x8)
-        self.C3CR = SA_DMAMUX_C3CR(self, 0xC)
-        self.C4CR = SA_DMAMUX_C4CR(self, 0x10)
-        self.C5CR = SA_DMAMUX_C5CR(self, 0x14)
-        self.C6CR = SA_DMAMUX_C6CR(self, 0x18)
-        self.C7CR = SA_DMAMUX_C7CR(self, 0x1C)
-        self.C8CR = SA_DMAMUX_C8CR(self, 0x20)
-        self.C9CR = SA_DMAMUX_C9CR(self, 0x24)
-        self.C10CR = SA_DMAMUX_C10CR(self, 0x28)
-        self.C11CR = SA_DMAMUX_C11CR(self, 0x2C)
-        self.C12CR = SA_DMAMUX_C12CR(self, 0x30)
-        self.C13CR = SA_DMAMUX_C13CR(self, 0x34)
-        self.C14CR = SA_DMAMUX_C14CR(self, 0x38)
-        self.C15CR = SA_DMAMUX_C15CR(self, 0x3C)
-        self.RG0CR = SA_DMAMUX_RG0CR(self, 0x100)
-        self.RG1CR = SA_DMAMUX_RG1CR(self, 0x104)
-        self.RG2CR = SA_DMAMUX_RG2CR(self, 0x108)
-        self.RG3CR = SA_DMAMUX_RG3CR(self, 0x10C)
-        self.RGSR = SA_DMAMUX_RGSR(self, 0x140)
-        self.RGCFR = SA_DMAMUX_RGCFR(self, 0x144)
-        self.CSR = SA_DMAMUX_CSR(self, 0x80)
-        self.CFR = SA_DMAMUX_CFR(self, 0x84)
-        self.CCR = Subscriptor(self, "C{}CR")
-        self.RGCR = Subscriptor(self, "RG{}CR")
-
-DMAMUX = SA_DMAMUX(0x40020800, "DMAMUX")
-
-class SA_SYSCFG_MEMRMP(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "MEMRMP", "Remap Memory register")
-        self.MEM_MODE = BitField(self, 0x00000007, "MEM_MODE", "Memory mapping selection")
-        self.FB_mode = BitField(self, 0x00000100, "FB_mode", "User Flash Bank mode")
-
-class SA_SYSCFG_CFGR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x7C000001, "CFGR1", "peripheral mode configuration register")
-        self.BOOSTEN = BitField(self, 0x00000100, "BOOSTEN", "BOOSTEN")
-        self.ANASWVDD = BitField(self, 0x00000200, "ANASWVDD", "GPIO analog switch control voltage selection")
-        self.I2C_PB6_FMP = BitField(self, 0x00010000, "I2C_PB6_FMP", "FM+ drive capability on PB6")
-        self.I2C_PB7_FMP = BitField(self, 0x00020000, "I2C_PB7_FMP", "FM+ drive capability on PB6")
-        self.I2C_PB8_FMP = BitField(self, 0x00040000, "I2C_PB8_FMP", "FM+ drive capability on PB6")
-        self.I2C_PB9_FMP = BitField(self, 0x00080000, "I2C_PB9_FMP", "FM+ drive capability on PB6")
-        self.I2C1_FMP = BitField(self, 0x00100000, "I2C1_FMP", "I2C1 FM+ drive capability enable")
-        self.I2C2_FMP = BitField(self, 0x00200000, "I2C2_FMP", "I2C1 FM+ drive capability enable")
-        self.I2C3_FMP = BitField(self, 0x00400000, "I2C3_FMP", "I2C1 FM+ drive capability enable")
-        self.I2C4_FMP = BitField(self, 0x00800000, "I2C4_FMP", "I2C1 FM+ drive capability enable")
-        self.FPU_IE = BitField(self, 0xFC000000, "FPU_IE", "FPU Interrupts Enable")
-        self.I2C_PB_FMP = Subscriptor(self, "I2C_PB{}_FMP")
-        self.I2C_FMP = Subscriptor(self, "I2C{}_FMP")
-
-class SA_SYSCFG_EXTICR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EXTICR1", "external interrupt configuration register 1")
-        self.EXTI3 = BitField(self, 0x0000F000, "EXTI3", "EXTI x configuration (x = 0 to 3)")
-        self.EXTI2 = BitField(self, 0x00000F00, "EXTI2", "EXTI x configuration (x = 0 to 3)")
-        self.EXTI1 = BitField(self, 0x000000F0, "EXTI1", "EXTI x configuration (x = 0 to 3)")
-        self.EXTI0 = BitField(self, 0x0000000F, "EXTI0", "EXTI x configuration (x = 0 to 3)")
-        self.EXTI = Subscriptor(self, "EXTI{}")
-
-class SA_SYSCFG_EXTICR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EXTICR2", "external interrupt configuration register 2")
-        self.EXTI7 = BitField(self, 0x0000F000, "EXTI7", "EXTI x configuration (x = 4 to 7)")
-        self.EXTI6 = BitField(self, 0x00000F00, "EXTI6", "EXTI x configuration (x = 4 to 7)")
-        self.EXTI5 = BitField(self, 0x000000F0, "EXTI5", "EXTI x configuration (x = 4 to 7)")
-        self.EXTI4 = BitField(self, 0x0000000F, "EXTI4", "EXTI x configuration (x = 4 to 7)")
-        self.EXTI = Subscriptor(self, "EXTI{}")
-
-class SA_SYSCFG_EXTICR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EXTICR3", "external interrupt configuration register 3")
-        self.EXTI11 = BitField(self, 0x0000F000, "EXTI11", "EXTI x configuration (x = 8 to 11)")
-        self.EXTI10 = BitField(self, 0x00000F00, "EXTI10", "EXTI10")
-        self.EXTI9 = BitField(self, 0x000000F0, "EXTI9", "EXTI x configuration (x = 8 to 11)")
-        self.EXTI8 = BitField(self, 0x0000000F, "EXTI8", "EXTI x configuration (x = 8 to 11)")
-        self.EXTI = Subscriptor(self, "EXTI{}")
-
-class SA_SYSCFG_EXTICR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EXTICR4", "external interrupt configuration register 4")
-        self.EXTI15 = BitField(self, 0x0000F000, "EXTI15", "EXTI x configuration (x = 12 to 15)")
-        self.EXTI14 = BitField(self, 0x00000F00, "EXTI14", "EXTI x configuration (x = 12 to 15)")
-        self.EXTI13 = BitField(self, 0x000000F0, "EXTI13", "EXTI x configuration (x = 12 to 15)")
-        self.EXTI12 = BitField(self, 0x0000000F, "EXTI12", "EXTI x configuration (x = 12 to 15)")
-        self.EXTI = Subscriptor(self, "EXTI{}")
-
-class SA_SYSCFG_SCSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SCSR", "CCM SRAM control and status register")
-        self.CCMER = BitField(self, 0x00000001, "CCMER", "CCM SRAM Erase")
-        self.CCMBSY = BitField(self, 0x00000002, "CCMBSY", "CCM SRAM busy by erase operation")
-
-class SA_SYSCFG_CFGR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CFGR2", "configuration register 2")
-        self.CLL = BitField(self, 0x00000001, "CLL", "Core Lockup Lock")
-        self.SPL = BitField(self, 0x00000002, "SPL", "SRAM Parity Lock")
-        self.PVDL = BitField(self, 0x00000004, "PVDL", "PVD Lock")
-        self.ECCL = BitField(self, 0x00000008, "ECCL", "ECC Lock")
-        self.SPF = BitField(self, 0x00000100, "SPF", "SRAM Parity Flag")
-
-class SA_SYSCFG_SWPR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SWPR", "SRAM Write protection register 1")
-        self.Page0_WP = BitField(self, 0x00000001, "Page0_WP", "Write protection")
-        self.Page1_WP = BitField(self, 0x00000002, "Page1_WP", "Write protection")
-        self.Page2_WP = BitField(self, 0x00000004, "Page2_WP", "Write protection")
-        self.Page3_WP = BitField(self, 0x00000008, "Page3_WP", "Write protection")
-        self.Page4_WP = BitField(self, 0x00000010, "Page4_WP", "Write protection")
-        self.Page5_WP = BitField(self, 0x00000020, "Page5_WP", "Write protection")
-        self.Page6_WP = BitField(self, 0x00000040, "Page6_WP", "Write protection")
-        self.Page7_WP = BitField(self, 0x00000080, "Page7_WP", "Write protection")
-        self.Page8_WP = BitField(self, 0x00000100, "Page8_WP", "Write protection")
-        self.Page9_WP = BitField(self, 0x00000200, "Page9_WP", "Write protection")
-        self.Page10_WP = BitField(self, 0x00000400, "Page10_WP", "Write protection")
-        self.Page11_WP = BitField(self, 0x00000800, "Page11_WP", "Write protection")
-        self.Page12_WP = BitField(self, 0x00001000, "Page12_WP", "Write protection")
-        self.Page13_WP = BitField(self, 0x00002000, "Page13_WP", "Write protection")
-        self.Page14_WP = BitField(self, 0x00004000, "Page14_WP", "Write protection")
-        self.Page15_WP = BitField(self, 0x00008000, "Page15_WP", "Write protection")
-        self.Page16_WP = BitField(self, 0x00010000, "Page16_WP", "Write protection")
-        self.Page17_WP = BitField(self, 0x00020000, "Page17_WP", "Write protection")
-        self.Page18_WP = BitField(self, 0x00040000, "Page18_WP", "Write protection")
-        self.Page19_WP = BitField(self, 0x00080000, "Page19_WP", "Write protection")
-        self.Page20_WP = BitField(self, 0x00100000, "Page20_WP", "Write protection")
-        self.Page21_WP = BitField(self, 0x00200000, "Page21_WP", "Write protection")
-        self.Page22_WP = BitField(self, 0x00400000, "Page22_WP", "Write protection")
-        self.Page23_WP = BitField(self, 0x00800000, "Page23_WP", "Write protection")
-        self.Page24_WP = BitField(self, 0x01000000, "Page24_WP", "Write protection")
-        self.Page25_WP = BitField(self, 0x02000000, "Page25_WP", "Write protection")
-        self.Page26_WP = BitField(self, 0x04000000, "Page26_WP", "Write protection")
-        self.Page27_WP = BitField(self, 0x08000000, "Page27_WP", "Write protection")
-        self.Page28_WP = BitField(self, 0x10000000, "Page28_WP", "Write protection")
-        self.Page29_WP = BitField(self, 0x20000000, "Page29_WP", "Write protection")
-        self.Page30_WP = BitField(self, 0x40000000, "Page30_WP", "Write protection")
-        self.Page31_WP = BitField(self, 0x80000000, "Page31_WP", "Write protection")
-        self.Page_WP = Subscriptor(self, "Page{}_WP")
-
-class SA_SYSCFG_SKR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SKR", "SRAM2 Key Register")
-        self.KEY = BitField(self, 0x000000FF, "KEY", "SRAM2 Key for software erase")
-
-class SA_SYSCFG(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "System configuration controller")
-        self.MEMRMP = SA_SYSCFG_MEMRMP(self, 0x0)
-        self.CFGR1 = SA_SYSCFG_CFGR1(self, 0x4)
-        self.EXTICR1 = SA_SYSCFG_EXTICR1(self, 0x8)
-        self.EXTICR2 = SA_SYSCFG_EXTICR2(self, 0xC)
-        self.EXTICR3 = SA_SYSCFG_EXTICR3(self, 0x10)
-        self.EXTICR4 = SA_SYSCFG_EXTICR4(self, 0x14)
-        self.SCSR = SA_SYSCFG_SCSR(self, 0x18)
-        self.CFGR2 = SA_SYSCFG_CFGR2(self, 0x1C)
-        self.SWPR = SA_SYSCFG_SWPR(self, 0x20)
-        self.SKR = SA_SYSCFG_SKR(self, 0x24)
-        self.CFGR = Subscriptor(self, "CFGR{}")
-        self.EXTICR = Subscriptor(self, "EXTICR{}")
-
-SYSCFG = SA_SYSCFG(0x40010000, "SYSCFG")
-
-class SA_VREFBUF_CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x2, "CSR", "VREF_BUF Control and Status Register")
-        self.ENVR = BitField(self, 0x00000001, "ENVR", "Enable Voltage Reference")
-        self.HIZ = BitField(self, 0x00000002, "HIZ", "High impedence mode for the VREF_BUF")
-        self.VRR = BitField(self, 0x00000008, "VRR", "Voltage reference buffer ready")
-        self.VRS = BitField(self, 0x00000030, "VRS", "Voltage reference scale")
-
-class SA_VREFBUF_CCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR", "VREF_BUF Calibration Control Register")
-        self.TRIM = BitField(self, 0x0000003F, "TRIM", "Trimming code")
-
-class SA_VREFBUF(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Voltage reference buffer")
-        self.CSR = SA_VREFBUF_CSR(self, 0x0)
-        self.CCR = SA_VREFBUF_CCR(self, 0x4)
-
-VREFBUF = SA_VREFBUF(0x40010030, "VREFBUF")
-
-class SA_COMP_C1CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C1CSR", "Comparator control/status register")
-        self.EN = BitField(self, 0x00000001, "EN", "EN")
-        self.INMSEL = BitField(self, 0x00000070, "INMSEL", "INMSEL")
-        self.INPSEL = BitField(self, 0x00000100, "INPSEL", "INPSEL")
-        self.POL = BitField(self, 0x00008000, "POL", "POL")
-        self.HYST = BitField(self, 0x00070000, "HYST", "HYST")
-        self.BLANKSEL = BitField(self, 0x00380000, "BLANKSEL", "BLANKSEL")
-        self.BRGEN = BitField(self, 0x00400000, "BRGEN", "BRGEN")
-        self.SCALEN = BitField(self, 0x00800000, "SCALEN", "SCALEN")
-        self.VALUE = BitField(self, 0x40000000, "VALUE", "VALUE")
-        self.LOCK = BitField(self, 0x80000000, "LOCK", "LOCK")
-
-class SA_COMP_C2CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C2CSR", "Comparator control/status register")
-        self.EN = BitField(self, 0x00000001, "EN", "EN")
-        self.INMSEL = BitField(self, 0x00000070, "INMSEL", "INMSEL")
-        self.INPSEL = BitField(self, 0x00000100, "INPSEL", "INPSEL")
-        self.POL = BitField(self, 0x00008000, "POL", "POL")
-        self.HYST = BitField(self, 0x00070000, "HYST", "HYST")
-        self.BLANKSEL = BitField(self, 0x00380000, "BLANKSEL", "BLANKSEL")
-        self.BRGEN = BitField(self, 0x00400000, "BRGEN", "BRGEN")
-        self.SCALEN = BitField(self, 0x00800000, "SCALEN", "SCALEN")
-        self.VALUE = BitField(self, 0x40000000, "VALUE", "VALUE")
-        self.LOCK = BitField(self, 0x80000000, "LOCK", "LOCK")
-
-class SA_COMP_C3CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C3CSR", "Comparator control/status register")
-        self.EN = BitField(self, 0x00000001, "EN", "EN")
-        self.INMSEL = BitField(self, 0x00000070, "INMSEL", "INMSEL")
-        self.INPSEL = BitField(self, 0x00000100, "INPSEL", "INPSEL")
-        self.POL = BitField(self, 0x00008000, "POL", "POL")
-        self.HYST = BitField(self, 0x00070000, "HYST", "HYST")
-        self.BLANKSEL = BitField(self, 0x00380000, "BLANKSEL", "BLANKSEL")
-        self.BRGEN = BitField(self, 0x00400000, "BRGEN", "BRGEN")
-        self.SCALEN = BitField(self, 0x00800000, "SCALEN", "SCALEN")
-        self.VALUE = BitField(self, 0x40000000, "VALUE", "VALUE")
-        self.LOCK = BitField(self, 0x80000000, "LOCK", "LOCK")
-
-class SA_COMP_C4CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "C4CSR", "Comparator control/status register")
-        self.EN = BitField(self, 0x00000001, "EN", "EN")
-        self.INMSEL = BitField(self, 0x00000070, "INMSEL", "INMSEL")
-        self.INPSEL = BitField(self, 0x00000100, "INPSEL", "INPSEL")
-        self.POL = BitField(self, 0x00008000, "POL", "POL")
-        self.HYST = BitField(self, 0x00070000, "HYST", "HYST")
-        self.BLANKSEL = BitField(self, 0x00380000, "BLANKSEL", "BLANKSEL")
-        self.BRGEN = BitField(self, 0x00400000, "BRGEN", "BRGEN")
-        self.SCALEN = BitField(self, 0x00800000, "SCALEN", "SCALEN")
-        self.VALUE = BitField(self, 0x40000000, "VALUE", "VALUE")
-        self.LOCK = BitField(self, 0x80000000, "LOCK", "LOCK")
-
-class SA_COMP(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Comparator control and status register")
-        self.C1CSR = SA_COMP_C1CSR(self, 0x0)
-        self.C2CSR = SA_COMP_C2CSR(self, 0x4)
-        self.C3CSR = SA_COMP_C3CSR(self, 0x8)
-        self.C4CSR = SA_COMP_C4CSR(self, 0xC)
-        self.CCSR = Subscriptor(self, "C{}CSR")
-
-COMP = SA_COMP(0x40010200, "COMP")
-
-class SA_OPAMP_OPAMP1_CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OPAMP1_CSR", "OPAMP1 control/status register")
-        self.OPAEN = BitField(self, 0x00000001, "OPAEN", "Operational amplifier Enable")
-        self.FORCE_VP = BitField(self, 0x00000002, "FORCE_VP", "FORCE_VP")
-        self.VP_SEL = BitField(self, 0x0000000C, "VP_SEL", "VP_SEL")
-        self.USERTRIM = BitField(self, 0x00000010, "USERTRIM", "USERTRIM")
-        self.VM_SEL = BitField(self, 0x00000060, "VM_SEL", "VM_SEL")
-        self.OPAHSM = BitField(self, 0x00000080, "OPAHSM", "OPAHSM")
-        self.OPAINTOEN = BitField(self, 0x00000100, "OPAINTOEN", "OPAINTOEN")
-        self.CALON = BitField(self, 0x00000800, "CALON", "CALON")
-        self.CALSEL = BitField(self, 0x00003000, "CALSEL", "CALSEL")
-        self.PGA_GAIN = BitField(self, 0x0007C000, "PGA_GAIN", "PGA_GAIN")
-        self.TRIMOFFSETP = BitField(self, 0x00F80000, "TRIMOFFSETP", "TRIMOFFSETP")
-        self.TRIMOFFSETN = BitField(self, 0x1F000000, "TRIMOFFSETN", "TRIMOFFSETN")
-        self.CALOUT = BitField(self, 0x40000000, "CALOUT", "CALOUT")
-        self.LOCK = BitField(self, 0x80000000, "LOCK", "LOCK")
-
-class SA_OPAMP_OPAMP2_CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OPAMP2_CSR", "OPAMP2 control/status register")
-        self.OPAEN = BitField(self, 0x00000001, "OPAEN", "Operational amplifier Enable")
-        self.FORCE_VP = BitField(self, 0x00000002, "FORCE_VP", "FORCE_VP")
-        self.VP_SEL = BitField(self, 0x0000000C, "VP_SEL", "VP_SEL")
-        self.USERTRIM = BitField(self, 0x00000010, "USERTRIM", "USERTRIM")
-        self.VM_SEL = BitField(self, 0x00000060, "VM_SEL", "VM_SEL")
-        self.OPAHSM = BitField(self, 0x00000080, "OPAHSM", "OPAHSM")
-        self.OPAINTOEN = BitField(self, 0x00000100, "OPAINTOEN", "OPAINTOEN")
-        self.CALON = BitField(self, 0x00000800, "CALON", "CALON")
-        self.CALSEL = BitField(self, 0x00003000, "CALSEL", "CALSEL")
-        self.PGA_GAIN = BitField(self, 0x0007C000, "PGA_GAIN", "PGA_GAIN")
-        self.TRIMOFFSETP = BitField(self, 0x00F80000, "TRIMOFFSETP", "TRIMOFFSETP")
-        self.TRIMOFFSETN = BitField(self, 0x1F000000, "TRIMOFFSETN", "TRIMOFFSETN")
-        self.CALOUT = BitField(self, 0x40000000, "CALOUT", "CALOUT")
-        self.LOCK = BitField(self, 0x80000000, "LOCK", "LOCK")
-
-class SA_OPAMP_OPAMP3_CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OPAMP3_CSR", "OPAMP3 control/status register")
-        self.OPAEN = BitField(self, 0x00000001, "OPAEN", "Operational amplifier Enable")
-        self.FORCE_VP = BitField(self, 0x00000002, "FORCE_VP", "FORCE_VP")
-        self.VP_SEL = BitField(self, 0x0000000C, "VP_SEL", "VP_SEL")
-        self.USERTRIM = BitField(self, 0x00000010, "USERTRIM", "USERTRIM")
-        self.VM_SEL = BitField(self, 0x00000060, "VM_SEL", "VM_SEL")
-        self.OPAHSM = BitField(self, 0x00000080, "OPAHSM", "OPAHSM")
-        self.OPAINTOEN = BitField(self, 0x00000100, "OPAINTOEN", "OPAINTOEN")
-        self.CALON = BitField(self, 0x00000800, "CALON", "CALON")
-        self.CALSEL = BitField(self, 0x00003000, "CALSEL", "CALSEL")
-        self.PGA_GAIN = BitField(self, 0x0007C000, "PGA_GAIN", "PGA_GAIN")
-        self.TRIMOFFSETP = BitField(self, 0x00F80000, "TRIMOFFSETP", "TRIMOFFSETP")
-        self.TRIMOFFSETN = BitField(self, 0x1F000000, "TRIMOFFSETN", "TRIMOFFSETN")
-        self.CALOUT = BitField(self, 0x40000000, "CALOUT", "CALOUT")
-        self.LOCK = BitField(self, 0x80000000, "LOCK", "LOCK")
-
-class SA_OPAMP_OPAMP1_TCMR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OPAMP1_TCMR", "OPAMP1 control/status register")
-        self.VMS_SEL = BitField(self, 0x00000001, "VMS_SEL", "VMS_SEL")
-        self.VPS_SEL = BitField(self, 0x00000006, "VPS_SEL", "VPS_SEL")
-        self.T1CM_EN = BitField(self, 0x00000008, "T1CM_EN", "T1CM_EN")
-        self.T8CM_EN = BitField(self, 0x00000010, "T8CM_EN", "T8CM_EN")
-        self.T20CM_EN = BitField(self, 0x00000020, "T20CM_EN", "T20CM_EN")
-        self.LOCK = BitField(self, 0x80000000, "LOCK", "LOCK")
-
-class SA_OPAMP_OPAMP2_TCMR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OPAMP2_TCMR", "OPAMP2 control/status register")
-        self.VMS_SEL = BitField(self, 0x00000001, "VMS_SEL", "VMS_SEL")
-        self.VPS_SEL = BitField(self, 0x00000006, "VPS_SEL", "VPS_SEL")
-        self.T1CM_EN = BitField(self, 0x00000008, "T1CM_EN", "T1CM_EN")
-        self.T8CM_EN = BitField(self, 0x00000010, "T8CM_EN", "T8CM_EN")
-        self.T20CM_EN = BitField(self, 0x00000020, "T20CM_EN", "T20CM_EN")
-        self.LOCK = BitField(self, 0x80000000, "LOCK", "LOCK")
-
-class SA_OPAMP_OPAMP3_TCMR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OPAMP3_TCMR", "OPAMP3 control/status register")
-        self.VMS_SEL = BitField(self, 0x00000001, "VMS_SEL", "VMS_SEL")
-        self.VPS_SEL = BitField(self, 0x00000006, "VPS_SEL", "VPS_SEL")
-        self.T1CM_EN = BitField(self, 0x00000008, "T1CM_EN", "T1CM_EN")
-        self.T8CM_EN = BitField(self, 0x00000010, "T8CM_EN", "T8CM_EN")
-        self.T20CM_EN = BitField(self, 0x00000020, "T20CM_EN", "T20CM_EN")
-        self.LOCK = BitField(self, 0x80000000, "LOCK", "LOCK")
-
-class SA_OPAMP(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Operational amplifiers")
-        self.OPAMP1_CSR = SA_OPAMP_OPAMP1_CSR(self, 0x0)
-        self.OPAMP2_CSR = SA_OPAMP_OPAMP2_CSR(self, 0x4)
-        self.OPAMP3_CSR = SA_OPAMP_OPAMP3_CSR(self, 0x8)
-        self.OPAMP1_TCMR = SA_OPAMP_OPAMP1_TCMR(self, 0x18)
-        self.OPAMP2_TCMR = SA_OPAMP_OPAMP2_TCMR(self, 0x1C)
-        self.OPAMP3_TCMR = SA_OPAMP_OPAMP3_TCMR(self, 0x20)
-        self.OPAMP_CSR = Subscriptor(self, "OPAMP{}_CSR")
-        self.OPAMP_TCMR = Subscriptor(self, "OPAMP{}_TCMR")
-
-OPAMP = SA_OPAMP(0x40010300, "OPAMP")
-
-class SA_DAC1_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR", "DAC control register")
-        self.EN1 = BitField(self, 0x00000001, "EN1", "DAC channel1 enable This bit is set and cleared by software to enable/disable DAC channel1.")
-        self.TEN1 = BitField(self, 0x00000002, "TEN1", "DAC channel1 trigger enable")
-        self.TSEL1 = BitField(self, 0x0000003C, "TSEL1", "DAC channel1 trigger selection These bits select the external event used to trigger DAC channel1. Note: Only used if bit TEN1 = 1 (DAC channel1 trigger enabled).")
-        self.WAVE1 = BitField(self, 0x000000C0, "WAVE1", "DAC channel1 noise/triangle wave generation enable These bits are set and cleared by software. Note: Only used if bit TEN1 = 1 (DAC channel1 trigger enabled).")
-        self.MAMP1 = BitField(self, 0x00000F00, "MAMP1", "DAC channel1 mask/amplitude selector These bits are written by software to select mask in wave generation mode or amplitude in triangle generation mode. = 1011: Unmask bits[11:0] of LFSR/ triangle amplitude equal to 4095")
-        self.DMAEN1 = BitField(self, 0x00001000, "DMAEN1", "DAC channel1 DMA enable This bit is set and cleared by software.")
-        self.DMAUDRIE1 = BitField(self, 0x00002000, "DMAUDRIE1", "DAC channel1 DMA Underrun Interrupt enable This bit is set and cleared by software.")
-        self.CEN1 = BitField(self, 0x00004000, "CEN1", "DAC Channel 1 calibration enable This bit is set and cleared by software to enable/disable DAC channel 1 calibration, it can be written only if bit EN1=0 into DAC_CR (the calibration mode can be entered/exit only when the DAC channel is disabled) Otherwise, the write operation is ignored.")
-        self.EN2 = BitField(self, 0x00010000, "EN2", "DAC channel2 enable This bit is set and cleared by software to enable/disable DAC channel2.")
-        self.TEN2 = BitField(self, 0x00020000, "TEN2", "DAC channel2 trigger enable")
-        self.TSEL2 = BitField(self, 0x003C0000, "TSEL2", "DAC channel2 trigger selection These bits select the external event used to trigger DAC channel2 Note: Only used if bit TEN2 = 1 (DAC channel2 trigger enabled).")
-        self.WAVE2 = BitField(self, 0x00C00000, "WAVE2", "DAC channel2 noise/triangle wave generation enable These bits are set/reset by software. 1x: Triangle wave generation enabled Note: Only used if bit TEN2 = 1 (DAC channel2 trigger enabled)")
-        self.MAMP2 = BitField(self, 0x0F000000, "MAMP2", "DAC channel2 mask/amplitude selector These bits are written by software to select mask in wave generation mode or amplitude in triangle generation mode. = 1011: Unmask bits[11:0] of LFSR/ triangle amplitude equal to 4095")
-        self.DMAEN2 = BitField(self, 0x10000000, "DMAEN2", "DAC channel2 DMA enable This bit is set and cleared by software.")
-        self.DMAUDRIE2 = BitField(self, 0x20000000, "DMAUDRIE2", "DAC channel2 DMA underrun interrupt enable This bit is set and cleared by software.")
-        self.CEN2 = BitField(self, 0x40000000, "CEN2", "DAC Channel 2 calibration enable This bit is set and cleared by software to enable/disable DAC channel 2 calibration, it can be written only if bit EN2=0 into DAC_CR (the calibration mode can be entered/exit only when the DAC channel is disabled) Otherwise, the write operation is ignored.")
-        self.TSEL = Subscriptor(self, "TSEL{}")
-        self.TEN = Subscriptor(self, "TEN{}")
-        self.EN = Subscriptor(self, "EN{}")
-        self.DMAEN = Subscriptor(self, "DMAEN{}")
-        self.CEN = Subscriptor(self, "CEN{}")
-        self.WAVE = Subscriptor(self, "WAVE{}")
-        self.MAMP = Subscriptor(self, "MAMP{}")
-        self.DMAUDRIE = Subscriptor(self, "DMAUDRIE{}")
-
-class SA_DAC1_SWTRGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SWTRGR", "DAC software trigger register")
-        self.SWTRIG1 = BitField(self, 0x00000001, "SWTRIG1", "DAC channel1 software trigger This bit is set by software to trigger the DAC in software trigger mode. Note: This bit is cleared by hardware (one APB1 clock cycle later) once the DAC_DHR1 register value has been loaded into the DAC_DOR1 register.")
-        self.SWTRIG2 = BitField(self, 0x00000002, "SWTRIG2", "DAC channel2 software trigger This bit is set by software to trigger the DAC in software trigger mode. Note: This bit is cleared by hardware (one APB1 clock cycle later) once the DAC_DHR2 register value has been loaded into the DAC_DOR2 register.")
-        self.SWTRIGB1 = BitField(self, 0x00010000, "SWTRIGB1", "DAC channel1 software trigger B")
-        self.SWTRIGB2 = BitField(self, 0x00020000, "SWTRIGB2", "DAC channel2 software trigger B")
-        self.SWTRIG = Subscriptor(self, "SWTRIG{}")
-        self.SWTRIGB = Subscriptor(self, "SWTRIGB{}")
-
-class SA_DAC1_DHR12R1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DHR12R1", "DAC channel1 12-bit right-aligned data holding register")
-        self.DACC1DHR = BitField(self, 0x00000FFF, "DACC1DHR", "DAC channel1 12-bit right-aligned data These bits are written by software which specifies 12-bit data for DAC channel1.")
-        self.DACC1DHRB = BitField(self, 0x0FFF0000, "DACC1DHRB", "DAC channel1 12-bit right-aligned data B")
-
-class SA_DAC1_DHR12L1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DHR12L1", "DAC channel1 12-bit left aligned data holding register")
-        self.DACC1DHR = BitField(self, 0x0000FFF0, "DACC1DHR", "DAC channel1 12-bit left-aligned data These bits are written by software which specifies 12-bit data for DAC channel1.")
-        self.DACC1DHRB = BitField(self, 0xFFF00000, "DACC1DHRB", "DAC channel1 12-bit left-aligned data B")
-
-class SA_DAC1_DHR8R1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DHR8R1", "DAC channel1 8-bit right aligned data holding register")
-        self.DACC1DHR = BitField(self, 0x000000FF, "DACC1DHR", "DAC channel1 8-bit right-aligned data These bits are written by software which specifies 8-bit data for DAC channel1.")
-        self.DACC1DHRB = BitField(self, 0x0000FF00, "DACC1DHRB", "DAC channel1 8-bit right-aligned data")
-
-class SA_DAC1_DHR12R2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DHR12R2", "DAC channel2 12-bit right aligned data holding register")
-        self.DACC2DHR = BitField(self, 0x00000FFF, "DACC2DHR", "DAC channel2 12-bit right-aligned data These bits are written by software which specifies 12-bit data for DAC channel2.")
-        self.DACC2DHRB = BitField(self, 0x0FFF0000, "DACC2DHRB", "DAC channel2 12-bit right-aligned data")
-
-class SA_DAC1_DHR12L2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DHR12L2", "DAC channel2 12-bit left aligned data holding register")
-        self.DACC2DHR = BitField(self, 0x0000FFF0, "DACC2DHR", "DAC channel2 12-bit left-aligned data These bits are written by software which specify 12-bit data for DAC channel2.")
-        self.DACC2DHRB = BitField(self, 0xFFF00000, "DACC2DHRB", "DAC channel2 12-bit left-aligned data B")
-
-class SA_DAC1_DHR8R2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DHR8R2", "DAC channel2 8-bit right-aligned data holding register")
-        self.DACC2DHR = BitField(self, 0x000000FF, "DACC2DHR", "DAC channel2 8-bit right-aligned data These bits are written by software which specifies 8-bit data for DAC channel2.")
-        self.DACC2DHRB = BitField(self, 0x0000FF00, "DACC2DHRB", "DAC channel2 8-bit right-aligned data")
-
-class SA_DAC1_DHR12RD(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DHR12RD", "Dual DAC 12-bit right-aligned data holding register")
-        self.DACC1DHR = BitField(self, 0x00000FFF, "DACC1DHR", "DAC channel1 12-bit right-aligned data These bits are written by software which specifies 12-bit data for DAC channel1.")
-        self.DACC2DHR = BitField(self, 0x0FFF0000, "DACC2DHR", "DAC channel2 12-bit right-aligned data These bits are written by software which specifies 12-bit data for DAC channel2.")
-        self.DACCDHR = Subscriptor(self, "DACC{}DHR")
-
-class SA_DAC1_DHR12LD(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DHR12LD", "DUAL DAC 12-bit left aligned data holding register")
-        self.DACC1DHR = BitField(self, 0x0000FFF0, "DACC1DHR", "DAC channel1 12-bit left-aligned data These bits are written by software which specifies 12-bit data for DAC channel1.")
-        self.DACC2DHR = BitField(self, 0xFFF00000, "DACC2DHR", "DAC channel2 12-bit left-aligned data These bits are written by software which specifies 12-bit data for DAC channel2.")
-        self.DACCDHR = Subscriptor(self, "DACC{}DHR")
-
-class SA_DAC1_DHR8RD(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DHR8RD", "DUAL DAC 8-bit right aligned data holding register")
-        self.DACC1DHR = BitField(self, 0x000000FF, "DACC1DHR", "DAC channel1 8-bit right-aligned data These bits are written by software which specifies 8-bit data for DAC channel1.")
-        self.DACC2DHR = BitField(self, 0x0000FF00, "DACC2DHR", "DAC channel2 8-bit right-aligned data These bits are written by software which specifies 8-bit data for DAC channel2.")
-        self.DACCDHR = Subscriptor(self, "DACC{}DHR")
-
-class SA_DAC1_DOR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DOR1", "DAC channel1 data output register")
-        self.DACC1DOR = BitField(self, 0x00000FFF, "DACC1DOR", "DAC channel1 data output These bits are read-only, they contain data output for DAC channel1.")
-        self.DACC1DORB = BitField(self, 0x0FFF0000, "DACC1DORB", "DAC channel1 data output")
-
-class SA_DAC1_DOR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DOR2", "DAC channel2 data output register")
-        self.DACC2DOR = BitField(self, 0x00000FFF, "DACC2DOR", "DAC channel2 data output These bits are read-only, they contain data output for DAC channel2.")
-        self.DACC2DORB = BitField(self, 0x0FFF0000, "DACC2DORB", "DAC channel2 data output")
-
-class SA_DAC1_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "DAC status register")
-        self.DAC1RDY = BitField(self, 0x00000800, "DAC1RDY", "DAC channel1 ready status bit")
-        self.DORSTAT1 = BitField(self, 0x00001000, "DORSTAT1", "DAC channel1 output register status bit")
-        self.DMAUDR1 = BitField(self, 0x00002000, "DMAUDR1", "DAC channel1 DMA underrun flag This bit is set by hardware and cleared by software (by writing it to 1).")
-        self.CAL_FLAG1 = BitField(self, 0x00004000, "CAL_FLAG1", "DAC Channel 1 calibration offset status This bit is set and cleared by hardware")
-        self.BWST1 = BitField(self, 0x00008000, "BWST1", "DAC Channel 1 busy writing sample time flag This bit is systematically set just after Sample & Hold mode enable and is set each time the software writes the register DAC_SHSR1, It is cleared by hardware when the write operation of DAC_SHSR1 is complete. (It takes about 3LSI periods of synchronization).")
-        self.DAC2RDY = BitField(self, 0x08000000, "DAC2RDY", "DAC channel 2 ready status bit")
-        self.DORSTAT2 = BitField(self, 0x10000000, "DORSTAT2", "DAC channel 2 output register status bit")
-        self.DMAUDR2 = BitField(self, 0x20000000, "DMAUDR2", "DAC channel2 DMA underrun flag This bit is set by hardware and cleared by software (by writing it to 1).")
-        self.CAL_FLAG2 = BitField(self, 0x40000000, "CAL_FLAG2", "DAC Channel 2 calibration offset status This bit is set and cleared by hardware")
-        self.BWST2 = BitField(self, 0x80000000, "BWST2", "DAC Channel 2 busy writing sample time flag This bit is systematically set just after Sample & Hold mode enable and is set each time the software writes the register DAC_SHSR2, It is cleared by hardware when the write operation of DAC_SHSR2 is complete. (It takes about 3 LSI periods of synchronization).")
-        self.DORSTAT = Subscriptor(self, "DORSTAT{}")
-        self.DMAUDR = Subscriptor(self, "DMAUDR{}")
-        self.BWST = Subscriptor(self, "BWST{}")
-        self.CAL_FLAG = Subscriptor(self, "CAL_FLAG{}")
-        self.DACRDY = Subscriptor(self, "DAC{}RDY")
-
-class SA_DAC1_CCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR", "DAC calibration control register")
-        self.OTRIM1 = BitField(self, 0x0000001F, "OTRIM1", "DAC Channel 1 offset trimming value")
-        self.OTRIM2 = BitField(self, 0x001F0000, "OTRIM2", "DAC Channel 2 offset trimming value")
-        self.OTRIM = Subscriptor(self, "OTRIM{}")
-
-class SA_DAC1_MCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "MCR", "DAC mode control register")
-        self.MODE1 = BitField(self, 0x00000007, "MODE1", "DAC Channel 1 mode These bits can be written only when the DAC is disabled and not in the calibration mode (when bit EN1=0 and bit CEN1 =0 in the DAC_CR register). If EN1=1 or CEN1 =1 the write operation is ignored. They can be set and cleared by software to select the DAC Channel 1 mode: DAC Channel 1 in normal Mode DAC Channel 1 in sample &amp; hold mode")
-        self.DMADOUBLE1 = BitField(self, 0x00000100, "DMADOUBLE1", "DAC Channel1 DMA double data mode")
-        self.SINFORMAT1 = BitField(self, 0x00000200, "SINFORMAT1", "Enable signed format for DAC channel1")
-        self.HFSEL = BitField(self, 0x0000C000, "HFSEL", "High frequency interface mode selection")
-        self.MODE2 = BitField(self, 0x00070000, "MODE2", "DAC Channel 2 mode These bits can be written only when the DAC is disabled and not in the calibration mode (when bit EN2=0 and bit CEN2 =0 in the DAC_CR register). If EN2=1 or CEN2 =1 the write operation is ignored. They can be set and cleared by software to select the DAC Channel 2 mode: DAC Channel 2 in normal Mode DAC Channel 2 in sample &amp; hold mode")
-        self.DMADOUBLE2 = BitField(self, 0x01000000, "DMADOUBLE2", "DAC Channel2 DMA double data mode")
-        self.SINFORMAT2 = BitField(self, 0x02000000, "SINFORMAT2", "Enable signed format for DAC channel2")
-        self.DMADOUBLE = Subscriptor(self, "DMADOUBLE{}")
-        self.MODE = Subscriptor(self, "MODE{}")
-        self.SINFORMAT = Subscriptor(self, "SINFORMAT{}")
-
-class SA_DAC1_SHSR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SHSR1", "DAC Sample and Hold sample time register 1")
-        self.TSAMPLE1 = BitField(self, 0x000003FF, "TSAMPLE1", "DAC Channel 1 sample Time (only valid in sample &amp; hold mode) These bits can be written when the DAC channel1 is disabled or also during normal operation. in the latter case, the write can be done only when BWSTx of DAC_SR register is low, If BWSTx=1, the write operation is ignored.")
-
-class SA_DAC1_SHSR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SHSR2", "DAC Sample and Hold sample time register 2")
-        self.TSAMPLE2 = BitField(self, 0x000003FF, "TSAMPLE2", "DAC Channel 2 sample Time (only valid in sample &amp; hold mode) These bits can be written when the DAC channel2 is disabled or also during normal operation. in the latter case, the write can be done only when BWSTx of DAC_SR register is low, if BWSTx=1, the write operation is ignored.")
-
-class SA_DAC1_SHHR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x10001, "SHHR", "DAC Sample and Hold hold time register")
-        self.THOLD1 = BitField(self, 0x000003FF, "THOLD1", "DAC Channel 1 hold Time (only valid in sample &amp; hold mode) Hold time= (THOLD[9:0]) x T LSI")
-        self.THOLD2 = BitField(self, 0x03FF0000, "THOLD2", "DAC Channel 2 hold time (only valid in sample &amp; hold mode). Hold time= (THOLD[9:0]) x T LSI")
-        self.THOLD = Subscriptor(self, "THOLD{}")
-
-class SA_DAC1_SHRR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x10001, "SHRR", "DAC Sample and Hold refresh time register")
-        self.TREFRESH1 = BitField(self, 0x000000FF, "TREFRESH1", "DAC Channel 1 refresh Time (only valid in sample &amp; hold mode) Refresh time= (TREFRESH[7:0]) x T LSI")
-        self.TREFRESH2 = BitField(self, 0x00FF0000, "TREFRESH2", "DAC Channel 2 refresh Time (only valid in sample &amp; hold mode) Refresh time= (TREFRESH[7:0]) x T LSI")
-        self.TREFRESH = Subscriptor(self, "TREFRESH{}")
-
-class SA_DAC1_STR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "STR1", "Sawtooth register")
-        self.STRSTDATA1 = BitField(self, 0x00000FFF, "STRSTDATA1", "DAC Channel 1 Sawtooth reset value")
-        self.STDIR1 = BitField(self, 0x00001000, "STDIR1", "DAC Channel1 Sawtooth direction setting")
-        self.STINCDATA1 = BitField(self, 0xFFFF0000, "STINCDATA1", "DAC CH1 Sawtooth increment value (12.4 bit format)")
-
-class SA_DAC1_STR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "STR2", "Sawtooth register")
-        self.STRSTDATA2 = BitField(self, 0x00000FFF, "STRSTDATA2", "DAC Channel 2 Sawtooth reset value")
-        self.STDIR2 = BitField(self, 0x00001000, "STDIR2", "DAC Channel2 Sawtooth direction setting")
-        self.STINCDATA2 = BitField(self, 0xFFFF0000, "STINCDATA2", "DAC CH2 Sawtooth increment value (12.4 bit format)")
-
-class SA_DAC1_STMODR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "STMODR", "Sawtooth Mode register")
-        self.STRSTTRIGSEL1 = BitField(self, 0x0000000F, "STRSTTRIGSEL1", "DAC Channel 1 Sawtooth Reset trigger selection")
-        self.STINCTRIGSEL1 = BitField(self, 0x00000F00, "STINCTRIGSEL1", "DAC Channel 1 Sawtooth Increment trigger selection")
-        self.STRSTTRIGSEL2 = BitField(self, 0x000F0000, "STRSTTRIGSEL2", "DAC Channel 1 Sawtooth Reset trigger selection")
-        self.STINCTRIGSEL2 = BitField(self, 0x0F000000, "STINCTRIGSEL2", "DAC Channel 2 Sawtooth Increment trigger selection")
-        self.STRSTTRIGSEL = Subscriptor(self, "STRSTTRIGSEL{}")
-        self.STINCTRIGSEL = Subscriptor(self, "STINCTRIGSEL{}")
-
-class SA_DAC1(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Digital-to-analog converter")
-        self.CR = SA_DAC1_CR(self, 0x0)
-        self.SWTRGR = SA_DAC1_SWTRGR(self, 0x4)
-        self.DHR12R1 = SA_DAC1_DHR12R1(self, 0x8)
-        self.DHR12L1 = SA_DAC1_DHR12L1(self, 0xC)
-        self.DHR8R1 = SA_DAC1_DHR8R1(self, 0x10)
-        self.DHR12R2 = SA_DAC1_DHR12R2(self, 0x14)
-        self.DHR12L2 = SA_DAC1_DHR12L2(self, 0x18)
-        self.DHR8R2 = SA_DAC1_DHR8R2(self, 0x1C)
-        self.DHR12RD = SA_DAC1_DHR12RD(self, 0x20)
-        self.DHR12LD = SA_DAC1_DHR12LD(self, 0x24)
-        self.DHR8RD = SA_DAC1_DHR8RD(self, 0x28)
-        self.DOR1 = SA_DAC1_DOR1(self, 0x2C)
-        self.DOR2 = SA_DAC1_DOR2(self, 0x30)
-        self.SR = SA_DAC1_SR(self, 0x34)
-        self.CCR = SA_DAC1_CCR(self, 0x38)
-        self.MCR = SA_DAC1_MCR(self, 0x3C)
-        self.SHSR1 = SA_DAC1_SHSR1(self, 0x40)
-        self.SHSR2 = SA_DAC1_SHSR2(self, 0x44)
-        self.SHHR = SA_DAC1_SHHR(self, 0x48)
-        self.SHRR = SA_DAC1_SHRR(self, 0x4C)
-        self.STR1 = SA_DAC1_STR1(self, 0x58)
-        self.STR2 = SA_DAC1_STR2(self, 0x5C)
-        self.STMODR = SA_DAC1_STMODR(self, 0x60)
-        self.DHR12L = Subscriptor(self, "DHR12L{}")
-        self.DHR8R = Subscriptor(self, "DHR8R{}")
-        self.DOR = Subscriptor(self, "DOR{}")
-        self.SHSR = Subscriptor(self, "SHSR{}")
-        self.STR = Subscriptor(self, "STR{}")
-        self.DHR12R = Subscriptor(self, "DHR12R{}")
-
-DAC1 = SA_DAC1(0x50000800, "DAC1")
-DAC2 = SA_DAC1(0x50000C00, "DAC2")
-DAC3 = SA_DAC1(0x50001000, "DAC3")
-DAC4 = SA_DAC1(0x50001400, "DAC4")
-
-class SA_ADC1_ISR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ISR", "interrupt and status register")
-        self.JQOVF = BitField(self, 0x00000400, "JQOVF", "JQOVF")
-        self.AWD3 = BitField(self, 0x00000200, "AWD3", "AWD3")
-        self.AWD2 = BitField(self, 0x00000100, "AWD2", "AWD2")
-        self.AWD1 = BitField(self, 0x00000080, "AWD1", "AWD1")
-        self.JEOS = BitField(self, 0x00000040, "JEOS", "JEOS")
-        self.JEOC = BitField(self, 0x00000020, "JEOC", "JEOC")
-        self.OVR = BitField(self, 0x00000010, "OVR", "OVR")
-        self.EOS = BitField(self, 0x00000008, "EOS", "EOS")
-        self.EOC = BitField(self, 0x00000004, "EOC", "EOC")
-        self.EOSMP = BitField(self, 0x00000002, "EOSMP", "EOSMP")
-        self.ADRDY = BitField(self, 0x00000001, "ADRDY", "ADRDY")
-        self.AWD = Subscriptor(self, "AWD{}")
-
-class SA_ADC1_IER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IER", "interrupt enable register")
-        self.JQOVFIE = BitField(self, 0x00000400, "JQOVFIE", "JQOVFIE")
-        self.AWD3IE = BitField(self, 0x00000200, "AWD3IE", "AWD3IE")
-        self.AWD2IE = BitField(self, 0x00000100, "AWD2IE", "AWD2IE")
-        self.AWD1IE = BitField(self, 0x00000080, "AWD1IE", "AWD1IE")
-        self.JEOSIE = BitField(self, 0x00000040, "JEOSIE", "JEOSIE")
-        self.JEOCIE = BitField(self, 0x00000020, "JEOCIE", "JEOCIE")
-        self.OVRIE = BitField(self, 0x00000010, "OVRIE", "OVRIE")
-        self.EOSIE = BitField(self, 0x00000008, "EOSIE", "EOSIE")
-        self.EOCIE = BitField(self, 0x00000004, "EOCIE", "EOCIE")
-        self.EOSMPIE = BitField(self, 0x00000002, "EOSMPIE", "EOSMPIE")
-        self.ADRDYIE = BitField(self, 0x00000001, "ADRDYIE", "ADRDYIE")
-        self.AWDIE = Subscriptor(self, "AWD{}IE")
-
-class SA_ADC1_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x20000000, "CR", "control register")
-        self.ADCAL = BitField(self, 0x80000000, "ADCAL", "ADCAL")
-        self.ADCALDIF = BitField(self, 0x40000000, "ADCALDIF", "ADCALDIF")
-        self.DEEPPWD = BitField(self, 0x20000000, "DEEPPWD", "DEEPPWD")
-        self.ADVREGEN = BitField(self, 0x10000000, "ADVREGEN", "ADVREGEN")
-        self.JADSTP = BitField(self, 0x00000020, "JADSTP", "JADSTP")
-        self.ADSTP = BitField(self, 0x00000010, "ADSTP", "ADSTP")
-        self.JADSTART = BitField(self, 0x00000008, "JADSTART", "JADSTART")
-        self.ADSTART = BitField(self, 0x00000004, "ADSTART", "ADSTART")
-        self.ADDIS = BitField(self, 0x00000002, "ADDIS", "ADDIS")
-        self.ADEN = BitField(self, 0x00000001, "ADEN", "ADEN")
-
-class SA_ADC1_CFGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x80000000, "CFGR", "configuration register")
-        self.JQDIS = BitField(self, 0x80000000, "JQDIS", "Injected Queue disable")
-        self.AWD1CH = BitField(self, 0x7C000000, "AWD1CH", "Analog watchdog 1 channel selection")
-        self.JAUTO = BitField(self, 0x02000000, "JAUTO", "JAUTO")
-        self.JAWD1EN = BitField(self, 0x01000000, "JAWD1EN", "JAWD1EN")
-        self.AWD1EN = BitField(self, 0x00800000, "AWD1EN", "AWD1EN")
-        self.AWD1SGL = BitField(self, 0x00400000, "AWD1SGL", "AWD1SGL")
-        self.JQM = BitField(self, 0x00200000, "JQM", "JQM")
-        self.JDISCEN = BitField(self, 0x00100000, "JDISCEN", "JDISCEN")
-        self.DISCNUM = BitField(self, 0x000E0000, "DISCNUM", "DISCNUM")
-        self.DISCEN = BitField(self, 0x00010000, "DISCEN", "DISCEN")
-        self.ALIGN = BitField(self, 0x00008000, "ALIGN", "ALIGN")
-        self.AUTDLY = BitField(self, 0x00004000, "AUTDLY", "AUTDLY")
-        self.CONT = BitField(self, 0x00002000, "CONT", "CONT")
-        self.OVRMOD = BitField(self, 0x00001000, "OVRMOD", "OVRMOD")
-        self.EXTEN = BitField(self, 0x00000C00, "EXTEN", "EXTEN")
-        self.EXTSEL = BitField(self, 0x000003E0, "EXTSEL", "External trigger selection for regular group")
-        self.RES = BitField(self, 0x00000018, "RES", "RES")
-        self.DMACFG = BitField(self, 0x00000002, "DMACFG", "DMACFG")
-        self.DMAEN = BitField(self, 0x00000001, "DMAEN", "DMAEN")
-
-class SA_ADC1_CFGR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CFGR2", "configuration register")
-        self.SMPTRIG = BitField(self, 0x08000000, "SMPTRIG", "SMPTRIG")
-        self.BULB = BitField(self, 0x04000000, "BULB", "BULB")
-        self.SWTRIG = BitField(self, 0x02000000, "SWTRIG", "SWTRIG")
-        self.GCOMP = BitField(self, 0x00010000, "GCOMP", "GCOMP")
-        self.ROVSM = BitField(self, 0x00000400, "ROVSM", "EXTEN")
-        self.TROVS = BitField(self, 0x00000200, "TROVS", "Triggered Regular Oversampling")
-        self.OVSS = BitField(self, 0x000001E0, "OVSS", "ALIGN")
-        self.OVSR = BitField(self, 0x0000001C, "OVSR", "RES")
-        self.JOVSE = BitField(self, 0x00000002, "JOVSE", "DMACFG")
-        self.ROVSE = BitField(self, 0x00000001, "ROVSE", "DMAEN")
-
-class SA_ADC1_SMPR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SMPR1", "sample time register 1")
-        self.SMP9 = BitField(self, 0x38000000, "SMP9", "SMP9")
-        self.SMP8 = BitField(self, 0x07000000, "SMP8", "SMP8")
-        self.SMP7 = BitField(self, 0x00E00000, "SMP7", "SMP7")
-        self.SMP6 = BitField(self, 0x001C0000, "SMP6", "SMP6")
-        self.SMP5 = BitField(self, 0x00038000, "SMP5", "SMP5")
-        self.SMP4 = BitField(self, 0x00007000, "SMP4", "SMP4")
-        self.SMP3 = BitField(self, 0x00000E00, "SMP3", "SMP3")
-        self.SMP2 = BitField(self, 0x000001C0, "SMP2", "SMP2")
-        self.SMP1 = BitField(self, 0x00000038, "SMP1", "SMP1")
-        self.SMPPLUS = BitField(self, 0x80000000, "SMPPLUS", "Addition of one clock cycle to the sampling time")
-        self.SMP0 = BitField(self, 0x00000007, "SMP0", "SMP0")
-        self.SMP = Subscriptor(self, "SMP{}")
-
-class SA_ADC1_SMPR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SMPR2", "sample time register 2")
-        self.SMP18 = BitField(self, 0x07000000, "SMP18", "SMP18")
-        self.SMP17 = BitField(self, 0x00E00000, "SMP17", "SMP17")
-        self.SMP16 = BitField(self, 0x001C0000, "SMP16", "SMP16")
-        self.SMP15 = BitField(self, 0x00038000, "SMP15", "SMP15")
-        self.SMP14 = BitField(self, 0x00007000, "SMP14", "SMP14")
-        self.SMP13 = BitField(self, 0x00000E00, "SMP13", "SMP13")
-        self.SMP12 = BitField(self, 0x000001C0, "SMP12", "SMP12")
-        self.SMP11 = BitField(self, 0x00000038, "SMP11", "SMP11")
-        self.SMP10 = BitField(self, 0x00000007, "SMP10", "SMP10")
-        self.SMP = Subscriptor(self, "SMP{}")
-
-class SA_ADC1_TR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFF0000, "TR1", "watchdog threshold register 1")
-        self.HT1 = BitField(self, 0x0FFF0000, "HT1", "HT1")
-        self.AWDFILT = BitField(self, 0x00007000, "AWDFILT", "AWDFILT")
-        self.LT1 = BitField(self, 0x00000FFF, "LT1", "LT1")
-
-class SA_ADC1_TR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFF0000, "TR2", "watchdog threshold register")
-        self.HT2 = BitField(self, 0x00FF0000, "HT2", "HT2")
-        self.LT2 = BitField(self, 0x000000FF, "LT2", "LT2")
-
-class SA_ADC1_TR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFF0000, "TR3", "watchdog threshold register 3")
-        self.HT3 = BitField(self, 0x00FF0000, "HT3", "HT3")
-        self.LT3 = BitField(self, 0x000000FF, "LT3", "LT3")
-
-class SA_ADC1_SQR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SQR1", "regular sequence register 1")
-        self.SQ4 = BitField(self, 0x1F000000, "SQ4", "SQ4")
-        self.SQ3 = BitField(self, 0x007C0000, "SQ3", "SQ3")
-        self.SQ2 = BitField(self, 0x0001F000, "SQ2", "SQ2")
-        self.SQ1 = BitField(self, 0x000007C0, "SQ1", "SQ1")
-        self.L = BitField(self, 0x0000000F, "L", "Regular channel sequence length")
-        self.SQ = Subscriptor(self, "SQ{}")
-
-class SA_ADC1_SQR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SQR2", "regular sequence register 2")
-        self.SQ9 = BitField(self, 0x1F000000, "SQ9", "SQ9")
-        self.SQ8 = BitField(self, 0x007C0000, "SQ8", "SQ8")
-        self.SQ7 = BitField(self, 0x0001F000, "SQ7", "SQ7")
-        self.SQ6 = BitField(self, 0x000007C0, "SQ6", "SQ6")
-        self.SQ5 = BitField(self, 0x0000001F, "SQ5", "SQ5")
-        self.SQ = Subscriptor(self, "SQ{}")
-
-class SA_ADC1_SQR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SQR3", "regular sequence register 3")
-        self.SQ14 = BitField(self, 0x1F000000, "SQ14", "SQ14")
-        self.SQ13 = BitField(self, 0x007C0000, "SQ13", "SQ13")
-        self.SQ12 = BitField(self, 0x0001F000, "SQ12", "SQ12")
-        self.SQ11 = BitField(self, 0x000007C0, "SQ11", "SQ11")
-        self.SQ10 = BitField(self, 0x0000001F, "SQ10", "SQ10")
-        self.SQ = Subscriptor(self, "SQ{}")
-
-class SA_ADC1_SQR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SQR4", "regular sequence register 4")
-        self.SQ16 = BitField(self, 0x000007C0, "SQ16", "SQ16")
-        self.SQ15 = BitField(self, 0x0000001F, "SQ15", "SQ15")
-        self.SQ = Subscriptor(self, "SQ{}")
-
-class SA_ADC1_DR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DR", "regular Data Register")
-        self.RDATA = BitField(self, 0x0000FFFF, "RDATA", "Regular Data converted")
-
-class SA_ADC1_JSQR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "JSQR", "injected sequence register")
-        self.JSQ4 = BitField(self, 0xF8000000, "JSQ4", "JSQ4")
-        self.JSQ3 = BitField(self, 0x03E00000, "JSQ3", "JSQ3")
-        self.JSQ2 = BitField(self, 0x000F8000, "JSQ2", "JSQ2")
-        self.JSQ1 = BitField(self, 0x00003E00, "JSQ1", "JSQ1")
-        self.JEXTEN = BitField(self, 0x00000180, "JEXTEN", "JEXTEN")
-        self.JEXTSEL = BitField(self, 0x0000007C, "JEXTSEL", "JEXTSEL")
-        self.JL = BitField(self, 0x00000003, "JL", "JL")
-        self.JSQ = Subscriptor(self, "JSQ{}")
-
-class SA_ADC1_OFR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OFR1", "offset register 1")
-        self.OFFSET1_EN = BitField(self, 0x80000000, "OFFSET1_EN", "OFFSET1_EN")
-        self.OFFSET1_CH = BitField(self, 0x7C000000, "OFFSET1_CH", "OFFSET1_CH")
-        self.SATEN = BitField(self, 0x02000000, "SATEN", "SATEN")
-        self.OFFSETPOS = BitField(self, 0x01000000, "OFFSETPOS", "OFFSETPOS")
-        self.OFFSET1 = BitField(self, 0x00000FFF, "OFFSET1", "OFFSET1")
-
-class SA_ADC1_OFR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OFR2", "offset register 2")
-        self.OFFSET1_EN = BitField(self, 0x80000000, "OFFSET1_EN", "OFFSET1_EN")
-        self.OFFSET1_CH = BitField(self, 0x7C000000, "OFFSET1_CH", "OFFSET1_CH")
-        self.SATEN = BitField(self, 0x02000000, "SATEN", "SATEN")
-        self.OFFSETPOS = BitField(self, 0x01000000, "OFFSETPOS", "OFFSETPOS")
-        self.OFFSET1 = BitField(self, 0x00000FFF, "OFFSET1", "OFFSET1")
-
-class SA_ADC1_OFR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OFR3", "offset register 3")
-        self.OFFSET1_EN = BitField(self, 0x80000000, "OFFSET1_EN", "OFFSET1_EN")
-        self.OFFSET1_CH = BitField(self, 0x7C000000, "OFFSET1_CH", "OFFSET1_CH")
-        self.SATEN = BitField(self, 0x02000000, "SATEN", "SATEN")
-        self.OFFSETPOS = BitField(self, 0x01000000, "OFFSETPOS", "OFFSETPOS")
-        self.OFFSET1 = BitField(self, 0x00000FFF, "OFFSET1", "OFFSET1")
-
-class SA_ADC1_OFR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "OFR4", "offset register 4")
-        self.OFFSET1_EN = BitField(self, 0x80000000, "OFFSET1_EN", "OFFSET1_EN")
-        self.OFFSET1_CH = BitField(self, 0x7C000000, "OFFSET1_CH", "OFFSET1_CH")
-        self.SATEN = BitField(self, 0x02000000, "SATEN", "SATEN")
-        self.OFFSETPOS = BitField(self, 0x01000000, "OFFSETPOS", "OFFSETPOS")
-        self.OFFSET1 = BitField(self, 0x00000FFF, "OFFSET1", "OFFSET1")
-
-class SA_ADC1_JDR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "JDR1", "injected data register 1")
-        self.JDATA1 = BitField(self, 0x0000FFFF, "JDATA1", "JDATA1")
-
-class SA_ADC1_JDR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "JDR2", "injected data register 2")
-        self.JDATA2 = BitField(self, 0x0000FFFF, "JDATA2", "JDATA2")
-
-class SA_ADC1_JDR3(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "JDR3", "injected data register 3")
-        self.JDATA3 = BitField(self, 0x0000FFFF, "JDATA3", "JDATA3")
-
-class SA_ADC1_JDR4(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "JDR4", "injected data register 4")
-        self.JDATA4 = BitField(self, 0x0000FFFF, "JDATA4", "JDATA4")
-
-class SA_ADC1_AWD2CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AWD2CR", "Analog Watchdog 2 Configuration Register")
-        self.AWD2CH = BitField(self, 0x0007FFFF, "AWD2CH", "AWD2CH")
-
-class SA_ADC1_AWD3CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AWD3CR", "Analog Watchdog 3 Configuration Register")
-        self.AWD3CH = BitField(self, 0x0007FFFF, "AWD3CH", "AWD3CH")
-
-class SA_ADC1_DIFSEL(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DIFSEL", "Differential Mode Selection Register 2")
-        self.DIFSEL_0 = BitField(self, 0x00000001, "DIFSEL_0", "Differential mode for channels 0")
-        self.DIFSEL_1_18 = BitField(self, 0x0007FFFE, "DIFSEL_1_18", "Differential mode for channels 15 to 1")
-
-class SA_ADC1_CALFACT(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CALFACT", "Calibration Factors")
-        self.CALFACT_D = BitField(self, 0x007F0000, "CALFACT_D", "CALFACT_D")
-        self.CALFACT_S = BitField(self, 0x0000007F, "CALFACT_S", "CALFACT_S")
-
-class SA_ADC1_GCOMP(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "GCOMP", "Gain compensation Register")
-        self.GCOMPCOEFF = BitField(self, 0x00003FFF, "GCOMPCOEFF", "GCOMPCOEFF")
-
-class SA_ADC1(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Analog-to-Digital Converter")
-        self.ISR = SA_ADC1_ISR(self, 0x0)
-        self.IER = SA_ADC1_IER(self, 0x4)
-        self.CR = SA_ADC1_CR(self, 0x8)
-        self.CFGR = SA_ADC1_CFGR(self, 0xC)
-        self.CFGR2 = SA_ADC1_CFGR2(self, 0x10)
-        self.SMPR1 = SA_ADC1_SMPR1(self, 0x14)
-        self.SMPR2 = SA_ADC1_SMPR2(self, 0x18)
-        self.TR1 = SA_ADC1_TR1(self, 0x20)
-        self.TR2 = SA_ADC1_TR2(self, 0x24)
-        self.TR3 = SA_ADC1_TR3(self, 0x28)
-        self.SQR1 = SA_ADC1_SQR1(self, 0x30)
-        self.SQR2 = SA_ADC1_SQR2(self, 0x34)
-        self.SQR3 = SA_ADC1_SQR3(self, 0x38)
-        self.SQR4 = SA_ADC1_SQR4(self, 0x3C)
-        self.DR = SA_ADC1_DR(self, 0x40)
-        self.JSQR = SA_ADC1_JSQR(self, 0x4C)
-        self.OFR1 = SA_ADC1_OFR1(self, 0x60)
-        self.OFR2 = SA_ADC1_OFR2(self, 0x64)
-        self.OFR3 = SA_ADC1_OFR3(self, 0x68)
-        self.OFR4 = SA_ADC1_OFR4(self, 0x6C)
-        self.JDR1 = SA_ADC1_JDR1(self, 0x80)
-        self.JDR2 = SA_ADC1_JDR2(self, 0x84)
-        self.JDR3 = SA_ADC1_JDR3(self, 0x88)
-        self.JDR4 = SA_ADC1_JDR4(self, 0x8C)
-        self.AWD2CR = SA_ADC1_AWD2CR(self, 0xA0)
-        self.AWD3CR = SA_ADC1_AWD3CR(self, 0xA4)
-        self.DIFSEL = SA_ADC1_DIFSEL(self, 0xB0)
-        self.CALFACT = SA_ADC1_CALFACT(self, 0xB4)
-        self.GCOMP = SA_ADC1_GCOMP(self, 0xC0)
-        self.SQR = Subscriptor(self, "SQR{}")
-        self.SMPR = Subscriptor(self, "SMPR{}")
-        self.AWDCR = Subscriptor(self, "AWD{}CR")
-        self.OFR = Subscriptor(self, "OFR{}")
-        self.JDR = Subscriptor(self, "JDR{}")
-        self.TR = Subscriptor(self, "TR{}")
-
-ADC1 = SA_ADC1(0x50000000, "ADC1")
-ADC2 = SA_ADC1(0x50000100, "ADC2")
-
-class SA_ADC12_Common_CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CSR", "ADC Common status register")
-        self.ADDRDY_MST = BitField(self, 0x00000001, "ADDRDY_MST", "ADDRDY_MST")
-        self.EOSMP_MST = BitField(self, 0x00000002, "EOSMP_MST", "EOSMP_MST")
-        self.EOC_MST = BitField(self, 0x00000004, "EOC_MST", "EOC_MST")
-        self.EOS_MST = BitField(self, 0x00000008, "EOS_MST", "EOS_MST")
-        self.OVR_MST = BitField(self, 0x00000010, "OVR_MST", "OVR_MST")
-        self.JEOC_MST = BitField(self, 0x00000020, "JEOC_MST", "JEOC_MST")
-        self.JEOS_MST = BitField(self, 0x00000040, "JEOS_MST", "JEOS_MST")
-        self.AWD1_MST = BitField(self, 0x00000080, "AWD1_MST", "AWD1_MST")
-        self.AWD2_MST = BitField(self, 0x00000100, "AWD2_MST", "AWD2_MST")
-        self.AWD3_MST = BitField(self, 0x00000200, "AWD3_MST", "AWD3_MST")
-        self.JQOVF_MST = BitField(self, 0x00000400, "JQOVF_MST", "JQOVF_MST")
-        self.ADRDY_SLV = BitField(self, 0x00010000, "ADRDY_SLV", "ADRDY_SLV")
-        self.EOSMP_SLV = BitField(self, 0x00020000, "EOSMP_SLV", "EOSMP_SLV")
-        self.EOC_SLV = BitField(self, 0x00040000, "EOC_SLV", "End of regular conversion of the slave ADC")
-        self.EOS_SLV = BitField(self, 0x00080000, "EOS_SLV", "End of regular sequence flag of the slave ADC")
-        self.OVR_SLV = BitField(self, 0x00100000, "OVR_SLV", "Overrun flag of the slave ADC")
-        self.JEOC_SLV = BitField(self, 0x00200000, "JEOC_SLV", "End of injected conversion flag of the slave ADC")
-        self.JEOS_SLV = BitField(self, 0x00400000, "JEOS_SLV", "End of injected sequence flag of the slave ADC")
-        self.AWD1_SLV = BitField(self, 0x00800000, "AWD1_SLV", "Analog watchdog 1 flag of the slave ADC")
-        self.AWD2_SLV = BitField(self, 0x01000000, "AWD2_SLV", "Analog watchdog 2 flag of the slave ADC")
-        self.AWD3_SLV = BitField(self, 0x02000000, "AWD3_SLV", "Analog watchdog 3 flag of the slave ADC")
-        self.JQOVF_SLV = BitField(self, 0x04000000, "JQOVF_SLV", "Injected Context Queue Overflow flag of the slave ADC")
-        self.AWD_SLV = Subscriptor(self, "AWD{}_SLV")
-        self.AWD_MST = Subscriptor(self, "AWD{}_MST")
-
-class SA_ADC12_Common_CCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CCR", "ADC common control register")
-        self.DUAL = BitField(self, 0x0000001F, "DUAL", "Dual ADC mode selection")
-        self.DELAY = BitField(self, 0x00000F00, "DELAY", "Delay between 2 sampling phases")
-        self.DMACFG = BitField(self, 0x00002000, "DMACFG", "DMA configuration (for multi-ADC mode)")
-        self.MDMA = BitField(self, 0x0000C000, "MDMA", "Direct memory access mode for multi ADC mode")
-        self.CKMODE = BitField(self, 0x00030000, "CKMODE", "ADC clock mode")
-        self.VREFEN = BitField(self, 0x00400000, "VREFEN", "VREFINT enable")
-        self.VSENSESEL = BitField(self, 0x00800000, "VSENSESEL", "VTS selection")
-        self.VBATSEL = BitField(self, 0x01000000, "VBATSEL", "VBAT selection")
-        self.PRESC = BitField(self, 0x003C0000, "PRESC", "ADC prescaler")
-
-class SA_ADC12_Common_CDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CDR", "ADC common regular data register for dual and triple modes")
-        self.RDATA_SLV = BitField(self, 0xFFFF0000, "RDATA_SLV", "Regular data of the slave ADC")
-        self.RDATA_MST = BitField(self, 0x0000FFFF, "RDATA_MST", "Regular data of the master ADC")
-
-class SA_ADC12_Common(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Analog-to-Digital Converter")
-        self.CSR = SA_ADC12_Common_CSR(self, 0x0)
-        self.CCR = SA_ADC12_Common_CCR(self, 0x8)
-        self.CDR = SA_ADC12_Common_CDR(self, 0xC)
-
-ADC12_Common = SA_ADC12_Common(0x50000300, "ADC12_Common")
-ADC345_Common = SA_ADC12_Common(0x50000700, "ADC345_Common")
-
-class SA_FMAC_X1BUFCFG(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "X1BUFCFG", "FMAC X1 Buffer Configuration register")
-        self.X1_BASE = BitField(self, 0x000000FF, "X1_BASE", "X1_BASE")
-        self.X1_BUF_SIZE = BitField(self, 0x0000FF00, "X1_BUF_SIZE", "X1_BUF_SIZE")
-        self.FULL_WM = BitField(self, 0x03000000, "FULL_WM", "FULL_WM")
-
-class SA_FMAC_X2BUFCFG(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "X2BUFCFG", "FMAC X2 Buffer Configuration register")
-        self.X2_BASE = BitField(self, 0x000000FF, "X2_BASE", "X1_BASE")
-        self.X2_BUF_SIZE = BitField(self, 0x0000FF00, "X2_BUF_SIZE", "X1_BUF_SIZE")
-
-class SA_FMAC_YBUFCFG(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "YBUFCFG", "FMAC Y Buffer Configuration register")
-        self.Y_BASE = BitField(self, 0x000000FF, "Y_BASE", "X1_BASE")
-        self.Y_BUF_SIZE = BitField(self, 0x0000FF00, "Y_BUF_SIZE", "X1_BUF_SIZE")
-        self.EMPTY_WM = BitField(self, 0x03000000, "EMPTY_WM", "EMPTY_WM")
-
-class SA_FMAC_PARAM(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PARAM", "FMAC Parameter register")
-        self.START = BitField(self, 0x80000000, "START", "START")
-        self.FUNC = BitField(self, 0x7F000000, "FUNC", "FUNC")
-        self.R = BitField(self, 0x00FF0000, "R", "R")
-        self.Q = BitField(self, 0x0000FF00, "Q", "Q")
-        self.P = BitField(self, 0x000000FF, "P", "P")
-
-class SA_FMAC_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR", "FMAC Control register")
-        self.RESET = BitField(self, 0x00010000, "RESET", "RESET")
-        self.CLIPEN = BitField(self, 0x00008000, "CLIPEN", "CLIPEN")
-        self.DMAWEN = BitField(self, 0x00000200, "DMAWEN", "DMAWEN")
-        self.DMAREN = BitField(self, 0x00000100, "DMAREN", "DMAREN")
-        self.SATIEN = BitField(self, 0x00000010, "SATIEN", "SATIEN")
-        self.UNFLIEN = BitField(self, 0x00000008, "UNFLIEN", "UNFLIEN")
-        self.OVFLIEN = BitField(self, 0x00000004, "OVFLIEN", "OVFLIEN")
-        self.WIEN = BitField(self, 0x00000002, "WIEN", "WIEN")
-        self.RIEN = BitField(self, 0x00000001, "RIEN", "RIEN")
-
-class SA_FMAC_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "FMAC Status register")
-        self.YEMPTY = BitField(self, 0x00000001, "YEMPTY", "YEMPTY")
-        self.X1FULL = BitField(self, 0x00000002, "X1FULL", "X1FULL")
-        self.OVFL = BitField(self, 0x00000100, "OVFL", "OVFL")
-        self.UNFL = BitField(self, 0x00000200, "UNFL", "UNFL")
-        self.SAT = BitField(self, 0x00000400, "SAT", "SAT")
-
-class SA_FMAC_WDATA(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "WDATA", "FMAC Write Data register")
-        self.WDATA = BitField(self, 0x0000FFFF, "WDATA", "WDATA")
-
-class SA_FMAC_RDATA(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RDATA", "FMAC Read Data register")
-        self.RDATA = BitField(self, 0x0000FFFF, "RDATA", "RDATA")
-
-class SA_FMAC(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Filter Math Accelerator")
-        self.X1BUFCFG = SA_FMAC_X1BUFCFG(self, 0x0)
-        self.X2BUFCFG = SA_FMAC_X2BUFCFG(self, 0x4)
-        self.YBUFCFG = SA_FMAC_YBUFCFG(self, 0x8)
-        self.PARAM = SA_FMAC_PARAM(self, 0xC)
-        self.CR = SA_FMAC_CR(self, 0x10)
-        self.SR = SA_FMAC_SR(self, 0x14)
-        self.WDATA = SA_FMAC_WDATA(self, 0x18)
-        self.RDATA = SA_FMAC_RDATA(self, 0x1C)
-        self.XBUFCFG = Subscriptor(self, "X{}BUFCFG")
-
-FMAC = SA_FMAC(0x40021400, "FMAC")
-
-class SA_CORDIC_CSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CSR", "CORDIC Control Status register")
-        self.FUNC = BitField(self, 0x0000000F, "FUNC", "FUNC")
-        self.PRECISION = BitField(self, 0x000000F0, "PRECISION", "PRECISION")
-        self.SCALE = BitField(self, 0x00000700, "SCALE", "SCALE")
-        self.IEN = BitField(self, 0x00010000, "IEN", "IEN")
-        self.DMAREN = BitField(self, 0x00020000, "DMAREN", "DMAREN")
-        self.DMAWEN = BitField(self, 0x00040000, "DMAWEN", "DMAWEN")
-        self.NRES = BitField(self, 0x00080000, "NRES", "NRES")
-        self.NARGS = BitField(self, 0x00100000, "NARGS", "NARGS")
-        self.RESSIZE = BitField(self, 0x00200000, "RESSIZE", "RESSIZE")
-        self.ARGSIZE = BitField(self, 0x00400000, "ARGSIZE", "ARGSIZE")
-        self.RRDY = BitField(self, 0x80000000, "RRDY", "RRDY")
-
-class SA_CORDIC_WDATA(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "WDATA", "FMAC Write Data register")
-        self.ARG = BitField(self, 0xFFFFFFFF, "ARG", "ARG")
-
-class SA_CORDIC_RDATA(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RDATA", "FMAC Read Data register")
-        self.RES = BitField(self, 0xFFFFFFFF, "RES", "RES")
-
-class SA_CORDIC(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "CORDIC Co-processor")
-        self.CSR = SA_CORDIC_CSR(self, 0x0)
-        self.WDATA = SA_CORDIC_WDATA(self, 0x4)
-        self.RDATA = SA_CORDIC_RDATA(self, 0x8)
-
-CORDIC = SA_CORDIC(0x40020C00, "CORDIC")
-
-class SA_SAI_BCR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x40, "BCR1", "BConfiguration register 1")
-        self.MCKEN = BitField(self, 0x08000000, "MCKEN", "MCKEN")
-        self.OSR = BitField(self, 0x04000000, "OSR", "OSR")
-        self.MCJDIV = BitField(self, 0x03F00000, "MCJDIV", "Master clock divider")
-        self.NODIV = BitField(self, 0x00080000, "NODIV", "No divider")
-        self.DMAEN = BitField(self, 0x00020000, "DMAEN", "DMA enable")
-        self.SAIBEN = BitField(self, 0x00010000, "SAIBEN", "Audio block B enable")
-        self.OutDri = BitField(self, 0x00002000, "OutDri", "Output drive")
-        self.MONO = BitField(self, 0x00001000, "MONO", "Mono mode")
-        self.SYNCEN = BitField(self, 0x00000C00, "SYNCEN", "Synchronization enable")
-        self.CKSTR = BitField(self, 0x00000200, "CKSTR", "Clock strobing edge")
-        self.LSBFIRST = BitField(self, 0x00000100, "LSBFIRST", "Least significant bit first")
-        self.DS = BitField(self, 0x000000E0, "DS", "Data size")
-        self.PRTCFG = BitField(self, 0x0000000C, "PRTCFG", "Protocol configuration")
-        self.MODE = BitField(self, 0x00000003, "MODE", "Audio block mode")
-
-class SA_SAI_BCR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BCR2", "BConfiguration register 2")
-        self.COMP = BitField(self, 0x0000C000, "COMP", "Companding mode")
-        self.CPL = BitField(self, 0x00002000, "CPL", "Complement bit")
-        self.MUTECN = BitField(self, 0x00001F80, "MUTECN", "Mute counter")
-        self.MUTEVAL = BitField(self, 0x00000040, "MUTEVAL", "Mute value")
-        self.MUTE = BitField(self, 0x00000020, "MUTE", "Mute")
-        self.TRIS = BitField(self, 0x00000010, "TRIS", "Tristate management on data line")
-        self.FFLUS = BitField(self, 0x00000008, "FFLUS", "FIFO flush")
-        self.FTH = BitField(self, 0x00000007, "FTH", "FIFO threshold")
-
-class SA_SAI_BFRCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x7, "BFRCR", "BFRCR")
-        self.FSOFF = BitField(self, 0x00040000, "FSOFF", "Frame synchronization offset")
-        self.FSPOL = BitField(self, 0x00020000, "FSPOL", "Frame synchronization polarity")
-        self.FSDEF = BitField(self, 0x00010000, "FSDEF", "Frame synchronization definition")
-        self.FSALL = BitField(self, 0x00007F00, "FSALL", "Frame synchronization active level length")
-        self.FRL = BitField(self, 0x000000FF, "FRL", "Frame length")
-
-class SA_SAI_BSLOTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BSLOTR", "BSlot register")
-        self.SLOTEN = BitField(self, 0xFFFF0000, "SLOTEN", "Slot enable")
-        self.NBSLOT = BitField(self, 0x00000F00, "NBSLOT", "Number of slots in an audio frame")
-        self.SLOTSZ = BitField(self, 0x000000C0, "SLOTSZ", "Slot size")
-        self.FBOFF = BitField(self, 0x0000001F, "FBOFF", "First bit offset")
-
-class SA_SAI_BIM(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BIM", "BInterrupt mask register2")
-        self.LFSDETIE = BitField(self, 0x00000040, "LFSDETIE", "Late frame synchronization detection interrupt enable")
-        self.AFSDETIE = BitField(self, 0x00000020, "AFSDETIE", "Anticipated frame synchronization detection interrupt enable")
-        self.CNRDYIE = BitField(self, 0x00000010, "CNRDYIE", "Codec not ready interrupt enable")
-        self.FREQIE = BitField(self, 0x00000008, "FREQIE", "FIFO request interrupt enable")
-        self.WCKCFG = BitField(self, 0x00000004, "WCKCFG", "Wrong clock configuration interrupt enable")
-        self.MUTEDET = BitField(self, 0x00000002, "MUTEDET", "Mute detection interrupt enable")
-        self.OVRUDRIE = BitField(self, 0x00000001, "OVRUDRIE", "Overrun/underrun interrupt enable")
-
-class SA_SAI_BSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BSR", "BStatus register")
-        self.FLVL = BitField(self, 0x00070000, "FLVL", "FIFO level threshold")
-        self.LFSDET = BitField(self, 0x00000040, "LFSDET", "Late frame synchronization detection")
-        self.AFSDET = BitField(self, 0x00000020, "AFSDET", "Anticipated frame synchronization detection")
-        self.CNRDY = BitField(self, 0x00000010, "CNRDY", "Codec not ready")
-        self.FREQ = BitField(self, 0x00000008, "FREQ", "FIFO request")
-        self.WCKCFG = BitField(self, 0x00000004, "WCKCFG", "Wrong clock configuration flag")
-        self.MUTEDET = BitField(self, 0x00000002, "MUTEDET", "Mute detection")
-        self.OVRUDR = BitField(self, 0x00000001, "OVRUDR", "Overrun / underrun")
-
-class SA_SAI_BCLRFR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BCLRFR", "BClear flag register")
-        self.LFSDET = BitField(self, 0x00000040, "LFSDET", "Clear late frame synchronization detection flag")
-        self.CAFSDET = BitField(self, 0x00000020, "CAFSDET", "Clear anticipated frame synchronization detection flag")
-        self.CNRDY = BitField(self, 0x00000010, "CNRDY", "Clear codec not ready flag")
-        self.WCKCFG = BitField(self, 0x00000004, "WCKCFG", "Clear wrong clock configuration flag")
-        self.MUTEDET = BitField(self, 0x00000002, "MUTEDET", "Mute detection flag")
-        self.OVRUDR = BitField(self, 0x00000001, "OVRUDR", "Clear overrun / underrun")
-
-class SA_SAI_BDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BDR", "BData register")
-        self.DATA = BitField(self, 0xFFFFFFFF, "DATA", "Data")
-
-class SA_SAI_ACR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x40, "ACR1", "AConfiguration register 1")
-        self.MCKEN = BitField(self, 0x08000000, "MCKEN", "MCKEN")
-        self.OSR = BitField(self, 0x04000000, "OSR", "OSR")
-        self.MCJDIV = BitField(self, 0x03F00000, "MCJDIV", "Master clock divider")
-        self.NODIV = BitField(self, 0x00080000, "NODIV", "No divider")
-        self.DMAEN = BitField(self, 0x00020000, "DMAEN", "DMA enable")
-        self.SAIAEN = BitField(self, 0x00010000, "SAIAEN", "Audio block A enable")
-        self.OutDri = BitField(self, 0x00002000, "OutDri", "Output drive")
-        self.MONO = BitField(self, 0x00001000, "MONO", "Mono mode")
-        self.SYNCEN = BitField(self, 0x00000C00, "SYNCEN", "Synchronization enable")
-        self.CKSTR = BitField(self, 0x00000200, "CKSTR", "Clock strobing edge")
-        self.LSBFIRST = BitField(self, 0x00000100, "LSBFIRST", "Least significant bit first")
-        self.DS = BitField(self, 0x000000E0, "DS", "Data size")
-        self.PRTCFG = BitField(self, 0x0000000C, "PRTCFG", "Protocol configuration")
-        self.MODE = BitField(self, 0x00000003, "MODE", "Audio block mode")
-
-class SA_SAI_ACR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ACR2", "AConfiguration register 2")
-        self.COMP = BitField(self, 0x0000C000, "COMP", "Companding mode")
-        self.CPL = BitField(self, 0x00002000, "CPL", "Complement bit")
-        self.MUTECN = BitField(self, 0x00001F80, "MUTECN", "Mute counter")
-        self.MUTEVAL = BitField(self, 0x00000040, "MUTEVAL", "Mute value")
-        self.MUTE = BitField(self, 0x00000020, "MUTE", "Mute")
-        self.TRIS = BitField(self, 0x00000010, "TRIS", "Tristate management on data line")
-        self.FFLUS = BitField(self, 0x00000008, "FFLUS", "FIFO flush")
-        self.FTH = BitField(self, 0x00000007, "FTH", "FIFO threshold")
-
-class SA_SAI_AFRCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x7, "AFRCR", "AFRCR")
-        self.FSOFF = BitField(self, 0x00040000, "FSOFF", "Frame synchronization offset")
-        self.FSPOL = BitField(self, 0x00020000, "FSPOL", "Frame synchronization polarity")
-        self.FSDEF = BitField(self, 0x00010000, "FSDEF", "Frame synchronization definition")
-        self.FSALL = BitField(self, 0x00007F00, "FSALL", "Frame synchronization active level length")
-        self.FRL = BitField(self, 0x000000FF, "FRL", "Frame length")
-
-class SA_SAI_ASLOTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ASLOTR", "ASlot register")
-        self.SLOTEN = BitField(self, 0xFFFF0000, "SLOTEN", "Slot enable")
-        self.NBSLOT = BitField(self, 0x00000F00, "NBSLOT", "Number of slots in an audio frame")
-        self.SLOTSZ = BitField(self, 0x000000C0, "SLOTSZ", "Slot size")
-        self.FBOFF = BitField(self, 0x0000001F, "FBOFF", "First bit offset")
-
-class SA_SAI_AIM(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "AIM", "AInterrupt mask register2")
-        self.LFSDET = BitField(self, 0x00000040, "LFSDET", "Late frame synchronization detection interrupt enable")
-        self.AFSDETIE = BitField(self, 0x00000020, "AFSDETIE", "Anticipated frame synchronization detection interrupt enable")
-        self.CNRDYIE = BitField(self, 0x00000010, "CNRDYIE", "Codec not ready interrupt enable")
-        self.FREQIE = BitField(self, 0x00000008, "FREQIE", "FIFO request interrupt enable")
-        self.WCKCFG = BitField(self, 0x00000004, "WCKCFG", "Wrong clock configuration interrupt enable")
-        self.MUTEDET = BitField(self, 0x00000002, "MUTEDET", "Mute detection interrupt enable")
-        self.OVRUDRIE = BitField(self, 0x00000001, "OVRUDRIE", "Overrun/underrun interrupt enable")
-
-class SA_SAI_ASR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ASR", "AStatus register")
-        self.FLVL = BitField(self, 0x00070000, "FLVL", "FIFO level threshold")
-        self.LFSDET = BitField(self, 0x00000040, "LFSDET", "Late frame synchronization detection")
-        self.AFSDET = BitField(self, 0x00000020, "AFSDET", "Anticipated frame synchronization detection")
-        self.CNRDY = BitField(self, 0x00000010, "CNRDY", "Codec not ready")
-        self.FREQ = BitField(self, 0x00000008, "FREQ", "FIFO request")
-        self.WCKCFG = BitField(self, 0x00000004, "WCKCFG", "Wrong clock configuration flag. This bit is read only")
-        self.MUTEDET = BitField(self, 0x00000002, "MUTEDET", "Mute detection")
-        self.OVRUDR = BitField(self, 0x00000001, "OVRUDR", "Overrun / underrun")
-
-class SA_SAI_ACLRFR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ACLRFR", "AClear flag register")
-        self.LFSDET = BitField(self, 0x00000040, "LFSDET", "Clear late frame synchronization detection flag")
-        self.CAFSDET = BitField(self, 0x00000020, "CAFSDET", "Clear anticipated frame synchronization detection flag")
-        self.CNRDY = BitField(self, 0x00000010, "CNRDY", "Clear codec not ready flag")
-        self.WCKCFG = BitField(self, 0x00000004, "WCKCFG", "Clear wrong clock configuration flag")
-        self.MUTEDET = BitField(self, 0x00000002, "MUTEDET", "Mute detection flag")
-        self.OVRUDR = BitField(self, 0x00000001, "OVRUDR", "Clear overrun / underrun")
-
-class SA_SAI_ADR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ADR", "AData register")
-        self.DATA = BitField(self, 0xFFFFFFFF, "DATA", "Data")
-
-class SA_SAI_PDMCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PDMCR", "PDM control register")
-        self.PDMEN = BitField(self, 0x00000001, "PDMEN", "PDMEN")
-        self.MICNBR = BitField(self, 0x00000030, "MICNBR", "MICNBR")
-        self.CKEN1 = BitField(self, 0x00000100, "CKEN1", "CKEN1")
-        self.CKEN2 = BitField(self, 0x00000200, "CKEN2", "CKEN2")
-        self.CKEN3 = BitField(self, 0x00000400, "CKEN3", "CKEN3")
-        self.CKEN4 = BitField(self, 0x00000800, "CKEN4", "CKEN4")
-        self.CKEN = Subscriptor(self, "CKEN{}")
-
-class SA_SAI_PDMDLY(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "PDMDLY", "PDM delay register")
-        self.DLYM1L = BitField(self, 0x00000007, "DLYM1L", "DLYM1L")
-        self.DLYM1R = BitField(self, 0x00000070, "DLYM1R", "DLYM1R")
-        self.DLYM2L = BitField(self, 0x00000700, "DLYM2L", "DLYM2L")
-        self.DLYM2R = BitField(self, 0x00007000, "DLYM2R", "DLYM2R")
-        self.DLYM3L = BitField(self, 0x00070000, "DLYM3L", "DLYM3L")
-        self.DLYM3R = BitField(self, 0x00700000, "DLYM3R", "DLYM3R")
-        self.DLYM4L = BitField(self, 0x07000000, "DLYM4L", "DLYM4L")
-        self.DLYM4R = BitField(self, 0x70000000, "DLYM4R", "DLYM4R")
-        self.DLYMR = Subscriptor(self, "DLYM{}R")
-        self.DLYML = Subscriptor(self, "DLYM{}L")
-
-class SA_SAI(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Serial audio interface")
-        self.BCR1 = SA_SAI_BCR1(self, 0x24)
-        self.BCR2 = SA_SAI_BCR2(self, 0x28)
-        self.BFRCR = SA_SAI_BFRCR(self, 0x2C)
-        self.BSLOTR = SA_SAI_BSLOTR(self, 0x30)
-        self.BIM = SA_SAI_BIM(self, 0x34)
-        self.BSR = SA_SAI_BSR(self, 0x38)
-        self.BCLRFR = SA_SAI_BCLRFR(self, 0x3C)
-        self.BDR = SA_SAI_BDR(self, 0x40)
-        self.ACR1 = SA_SAI_ACR1(self, 0x4)
-        self.ACR2 = SA_SAI_ACR2(self, 0x8)
-        self.AFRCR = SA_SAI_AFRCR(self, 0xC)
-        self.ASLOTR = SA_SAI_ASLOTR(self, 0x10)
-        self.AIM = SA_SAI_AIM(self, 0x14)
-        self.ASR = SA_SAI_ASR(self, 0x18)
-        self.ACLRFR = SA_SAI_ACLRFR(self, 0x1C)
-        self.ADR = SA_SAI_ADR(self, 0x20)
-        self.PDMCR = SA_SAI_PDMCR(self, 0x44)
-        self.PDMDLY = SA_SAI_PDMDLY(self, 0x48)
-        self.ACR = Subscriptor(self, "ACR{}")
-        self.BCR = Subscriptor(self, "BCR{}")
-
-SAI = SA_SAI(0x40015400, "SAI")
-
-class SA_TAMP_CR1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFF0000, "CR1", "control register 1")
-        self.TAMP1E = BitField(self, 0x00000001, "TAMP1E", "TAMP1E")
-        self.TAMP2E = BitField(self, 0x00000002, "TAMP2E", "TAMP2E")
-        self.TAMP3E = BitField(self, 0x00000004, "TAMP3E", "TAMP2E")
-        self.ITAMP3E = BitField(self, 0x00040000, "ITAMP3E", "ITAMP3E")
-        self.ITAMP4E = BitField(self, 0x00080000, "ITAMP4E", "ITAMP4E")
-        self.ITAMP5E = BitField(self, 0x00100000, "ITAMP5E", "ITAMP5E")
-        self.ITAMP6E = BitField(self, 0x00200000, "ITAMP6E", "ITAMP6E")
-        self.TAMPE = Subscriptor(self, "TAMP{}E")
-        self.ITAMPE = Subscriptor(self, "ITAMP{}E")
-
-class SA_TAMP_CR2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR2", "control register 2")
-        self.TAMP1NOER = BitField(self, 0x00000001, "TAMP1NOER", "TAMP1NOER")
-        self.TAMP2NOER = BitField(self, 0x00000002, "TAMP2NOER", "TAMP2NOER")
-        self.TAMP3NOER = BitField(self, 0x00000004, "TAMP3NOER", "TAMP3NOER")
-        self.TAMP1MSK = BitField(self, 0x00010000, "TAMP1MSK", "TAMP1MSK")
-        self.TAMP2MSK = BitField(self, 0x00020000, "TAMP2MSK", "TAMP2MSK")
-        self.TAMP3MSK = BitField(self, 0x00040000, "TAMP3MSK", "TAMP3MSK")
-        self.TAMP1TRG = BitField(self, 0x01000000, "TAMP1TRG", "TAMP1TRG")
-        self.TAMP2TRG = BitField(self, 0x02000000, "TAMP2TRG", "TAMP2TRG")
-        self.TAMP3TRG = BitField(self, 0x04000000, "TAMP3TRG", "TAMP3TRG")
-        self.TAMPMSK = Subscriptor(self, "TAMP{}MSK")
-        self.TAMPNOER = Subscriptor(self, "TAMP{}NOER")
-        self.TAMPTRG = Subscriptor(self, "TAMP{}TRG")
-
-class SA_TAMP_FLTCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "FLTCR", "TAMP filter control register")
-        self.TAMPFREQ = BitField(self, 0x00000007, "TAMPFREQ", "TAMPFREQ")
-        self.TAMPFLT = BitField(self, 0x00000018, "TAMPFLT", "TAMPFLT")
-        self.TAMPPRCH = BitField(self, 0x00000060, "TAMPPRCH", "TAMPPRCH")
-        self.TAMPPUDIS = BitField(self, 0x00000080, "TAMPPUDIS", "TAMPPUDIS")
-
-class SA_TAMP_IER(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IER", "TAMP interrupt enable register")
-        self.TAMP1IE = BitField(self, 0x00000001, "TAMP1IE", "TAMP1IE")
-        self.TAMP2IE = BitField(self, 0x00000002, "TAMP2IE", "TAMP2IE")
-        self.TAMP3IE = BitField(self, 0x00000004, "TAMP3IE", "TAMP3IE")
-        self.ITAMP3IE = BitField(self, 0x00040000, "ITAMP3IE", "ITAMP3IE")
-        self.ITAMP4IE = BitField(self, 0x00080000, "ITAMP4IE", "ITAMP4IE")
-        self.ITAMP5IE = BitField(self, 0x00100000, "ITAMP5IE", "ITAMP5IE")
-        self.ITAMP6IE = BitField(self, 0x00200000, "ITAMP6IE", "ITAMP6IE")
-        self.TAMPIE = Subscriptor(self, "TAMP{}IE")
-        self.ITAMPIE = Subscriptor(self, "ITAMP{}IE")
-
-class SA_TAMP_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "TAMP status register")
-        self.TAMP1F = BitField(self, 0x00000001, "TAMP1F", "TAMP1F")
-        self.TAMP2F = BitField(self, 0x00000002, "TAMP2F", "TAMP2F")
-        self.TAMP3F = BitField(self, 0x00000004, "TAMP3F", "TAMP3F")
-        self.ITAMP3F = BitField(self, 0x00040000, "ITAMP3F", "ITAMP3F")
-        self.ITAMP4F = BitField(self, 0x00080000, "ITAMP4F", "ITAMP4F")
-        self.ITAMP5F = BitField(self, 0x00100000, "ITAMP5F", "ITAMP5F")
-        self.ITAMP6F = BitField(self, 0x00200000, "ITAMP6F", "ITAMP6F")
-        self.ITAMPF = Subscriptor(self, "ITAMP{}F")
-        self.TAMPF = Subscriptor(self, "TAMP{}F")
-
-class SA_TAMP_MISR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "MISR", "TAMP masked interrupt status register")
-        self.TAMP1MF = BitField(self, 0x00000001, "TAMP1MF", "TAMP1MF:")
-        self.TAMP2MF = BitField(self, 0x00000002, "TAMP2MF", "TAMP2MF")
-        self.TAMP3MF = BitField(self, 0x00000004, "TAMP3MF", "TAMP3MF")
-        self.ITAMP3MF = BitField(self, 0x00040000, "ITAMP3MF", "ITAMP3MF")
-        self.ITAMP4MF = BitField(self, 0x00080000, "ITAMP4MF", "ITAMP4MF")
-        self.ITAMP5MF = BitField(self, 0x00100000, "ITAMP5MF", "ITAMP5MF")
-        self.ITAMP6MF = BitField(self, 0x00200000, "ITAMP6MF", "ITAMP6MF")
-        self.ITAMPMF = Subscriptor(self, "ITAMP{}MF")
-        self.TAMPMF = Subscriptor(self, "TAMP{}MF")
-
-class SA_TAMP_SCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SCR", "TAMP status clear register")
-        self.CTAMP1F = BitField(self, 0x00000001, "CTAMP1F", "CTAMP1F")
-        self.CTAMP2F = BitField(self, 0x00000002, "CTAMP2F", "CTAMP2F")
-        self.CTAMP3F = BitField(self, 0x00000004, "CTAMP3F", "CTAMP3F")
-        self.CITAMP3F = BitField(self, 0x00040000, "CITAMP3F", "CITAMP3F")
-        self.CITAMP4F = BitField(self, 0x00080000, "CITAMP4F", "CITAMP4F")
-        self.CITAMP5F = BitField(self, 0x00100000, "CITAMP5F", "CITAMP5F")
-        self.CITAMP6F = BitField(self, 0x00200000, "CITAMP6F", "CITAMP6F")
-        self.CITAMPF = Subscriptor(self, "CITAMP{}F")
-        self.CTAMPF = Subscriptor(self, "CTAMP{}F")
-
-class SA_TAMP_BKP0R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP0R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP1R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP1R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP2R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP2R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP3R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP3R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP4R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP4R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP5R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP5R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP6R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP6R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP7R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP7R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP8R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP8R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP9R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP9R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP10R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP10R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP11R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP11R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP12R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP12R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP13R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP13R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP14R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP14R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP15R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP15R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP16R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP16R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP17R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP17R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP18R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP18R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP19R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP19R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP20R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP20R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP21R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP21R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP22R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP22R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP23R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP23R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP24R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP24R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP25R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP25R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP26R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP26R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP27R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP27R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP28R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP28R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP29R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP29R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP30R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP30R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP_BKP31R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BKP31R", "TAMP backup register")
-        self.BKP = BitField(self, 0xFFFFFFFF, "BKP", "BKP")
-
-class SA_TAMP(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "Tamper and backup registers")
-        self.CR1 = SA_TAMP_CR1(self, 0x0)
-        self.CR2 = SA_TAMP_CR2(self, 0x4)
-        self.FLTCR = SA_TAMP_FLTCR(self, 0xC)
-        self.IER = SA_TAMP_IER(self, 0x2C)
-        self.SR = SA_TAMP_SR(self, 0x30)
-        self.MISR = SA_TAMP_MISR(self, 0x34)
-        self.SCR = SA_TAMP_SCR(self, 0x3C)
-        self.BKP0R = SA_TAMP_BKP0R(self, 0x100)
-        self.BKP1R = SA_TAMP_BKP1R(self, 0x104)
-        self.BKP2R = SA_TAMP_BKP2R(self, 0x108)
-        self.BKP3R = SA_TAMP_BKP3R(self, 0x10C)
-        self.BKP4R = SA_TAMP_BKP4R(self, 0x110)
-        self.BKP5R = SA_TAMP_BKP5R(self, 0x114)
-        self.BKP6R = SA_TAMP_BKP6R(self, 0x118)
-        self.BKP7R = SA_TAMP_BKP7R(self, 0x11C)
-        self.BKP8R = SA_TAMP_BKP8R(self, 0x120)
-        self.BKP9R = SA_TAMP_BKP9R(self, 0x124)
-        self.BKP10R = SA_TAMP_BKP10R(self, 0x128)
-        self.BKP11R = SA_TAMP_BKP11R(self, 0x12C)
-        self.BKP12R = SA_TAMP_BKP12R(self, 0x130)
-        self.BKP13R = SA_TAMP_BKP13R(self, 0x134)
-        self.BKP14R = SA_TAMP_BKP14R(self, 0x138)
-        self.BKP15R = SA_TAMP_BKP15R(self, 0x13C)
-        self.BKP16R = SA_TAMP_BKP16R(self, 0x140)
-        self.BKP17R = SA_TAMP_BKP17R(self, 0x144)
-        self.BKP18R = SA_TAMP_BKP18R(self, 0x148)
-        self.BKP19R = SA_TAMP_BKP19R(self, 0x14C)
-        self.BKP20R = SA_TAMP_BKP20R(self, 0x150)
-        self.BKP21R = SA_TAMP_BKP21R(self, 0x154)
-        self.BKP22R = SA_TAMP_BKP22R(self, 0x158)
-        self.BKP23R = SA_TAMP_BKP23R(self, 0x15C)
-        self.BKP24R = SA_TAMP_BKP24R(self, 0x160)
-        self.BKP25R = SA_TAMP_BKP25R(self, 0x164)
-        self.BKP26R = SA_TAMP_BKP26R(self, 0x168)
-        self.BKP27R = SA_TAMP_BKP27R(self, 0x16C)
-        self.BKP28R = SA_TAMP_BKP28R(self, 0x170)
-        self.BKP29R = SA_TAMP_BKP29R(self, 0x174)
-        self.BKP30R = SA_TAMP_BKP30R(self, 0x178)
-        self.BKP31R = SA_TAMP_BKP31R(self, 0x17C)
-        self.BKPR = Subscriptor(self, "BKP{}R")
-
-TAMP = SA_TAMP(0x40002400, "TAMP")
-
-class SA_FDCAN_CREL(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x32141218, "CREL", "FDCAN core release register")
-        self.DAY = BitField(self, 0x000000FF, "DAY", "18")
-        self.MON = BitField(self, 0x0000FF00, "MON", "12")
-        self.YEAR = BitField(self, 0x000F0000, "YEAR", "4")
-        self.SUBSTEP = BitField(self, 0x00F00000, "SUBSTEP", "1")
-        self.STEP = BitField(self, 0x0F000000, "STEP", "2")
-        self.REL = BitField(self, 0xF0000000, "REL", "3")
-
-class SA_FDCAN_ENDN(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x87654321, "ENDN", "FDCAN endian register")
-        self.ETV = BitField(self, 0xFFFFFFFF, "ETV", "Endianness test value. The endianness test value is 0x8765 4321.")
-
-class SA_FDCAN_DBTP(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xA33, "DBTP", "FDCAN data bit timing and prescaler register")
-        self.DSJW = BitField(self, 0x0000000F, "DSJW", "Synchronization jump width. Must always be smaller than DTSEG2, valid values are 0 to 15. The value used by the hardware is the one programmed, incremented by 1: t<sub>SJW</sub> = (DSJW + 1) x tq.")
-        self.DTSEG2 = BitField(self, 0x000000F0, "DTSEG2", "Data time segment after sample point. Valid values are 0 to 15. The value used by the hardware is the one programmed, incremented by 1, i.e. t<sub>BS2</sub> = (DTSEG2 + 1) x tq.")
-        self.DTSEG1 = BitField(self, 0x00001F00, "DTSEG1", "Data time segment before sample point. Valid values are 0 to 31. The value used by the hardware is the one programmed, incremented by 1, i.e. t<sub>BS1</sub> = (DTSEG1 + 1) x tq.")
-        self.DBRP = BitField(self, 0x001F0000, "DBRP", "Data bit rate prescaler. The value by which the oscillator frequency is divided to generate the bit time quanta. The bit time is built up from a multiple of this quanta. Valid values for the Baud Rate Prescaler are 0 to 31. The hardware interpreters this value as the value programmed plus 1.")
-        self.TDC = BitField(self, 0x00800000, "TDC", "Transceiver delay compensation")
-        self.DTSEG = Subscriptor(self, "DTSEG{}")
-
-class SA_FDCAN_TEST(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TEST", "FDCAN test register")
-        self.LBCK = BitField(self, 0x00000010, "LBCK", "Loop back mode")
-        self.TX = BitField(self, 0x00000060, "TX", "Control of transmit pin")
-        self.RX = BitField(self, 0x00000080, "RX", "Receive pin. Monitors the actual value of pin FDCANx_RX")
-
-class SA_FDCAN_RWD(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RWD", "FDCAN RAM watchdog register")
-        self.WDC = BitField(self, 0x000000FF, "WDC", "Watchdog configuration. Start value of the message RAM watchdog counter. With the reset value of 00, the counter is disabled. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of FDCAN_CCCR register are set to 1.")
-        self.WDV = BitField(self, 0x0000FF00, "WDV", "Watchdog value. Actual message RAM watchdog counter value.")
-
-class SA_FDCAN_CCCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x1, "CCCR", "FDCAN CC control register")
-        self.INIT = BitField(self, 0x00000001, "INIT", "Initialization")
-        self.CCE = BitField(self, 0x00000002, "CCE", "Configuration change enable")
-        self.ASM = BitField(self, 0x00000004, "ASM", "ASM restricted operation mode. The restricted operation mode is intended for applications that adapt themselves to different CAN bit rates. The application tests different bit rates and leaves the Restricted operation Mode after it has received a valid frame. In the optional Restricted operation Mode the node is able to transmit and receive data and remote frames and it gives acknowledge to valid frames, but it does not send active error frames or overload frames. In case of an error condition or overload condition, it does not send dominant bits, instead it waits for the occurrence of bus idle condition to resynchronize itself to the CAN communication. The error counters are not incremented. Bit ASM can only be set by software when both CCE and INIT are set to 1. The bit can be reset by the software at any time.")
-        self.CSA = BitField(self, 0x00000008, "CSA", "Clock stop acknowledge")
-        self.CSR = BitField(self, 0x00000010, "CSR", "Clock stop request")
-        self.MON = BitField(self, 0x00000020, "MON", "Bus monitoring mode. Bit MON can only be set by software when both CCE and INIT are set to 1. The bit can be reset by the Host at any time.")
-        self.DAR = BitField(self, 0x00000040, "DAR", "Disable automatic retransmission")
-        self.TEST = BitField(self, 0x00000080, "TEST", "Test mode enable")
-        self.FDOE = BitField(self, 0x00000100, "FDOE", "FD operation enable")
-        self.BRSE = BitField(self, 0x00000200, "BRSE", "FDCAN bit rate switching")
-        self.PXHD = BitField(self, 0x00001000, "PXHD", "Protocol exception handling disable")
-        self.EFBI = BitField(self, 0x00002000, "EFBI", "Edge filtering during bus integration")
-        self.TXP = BitField(self, 0x00004000, "TXP", "If this bit is set, the FDCAN pauses for two CAN bit times before starting the next transmission after successfully transmitting a frame.")
-        self.NISO = BitField(self, 0x00008000, "NISO", "Non ISO operation. If this bit is set, the FDCAN uses the CAN FD frame format as specified by the Bosch CAN FD Specification V1.0.")
-
-class SA_FDCAN_NBTP(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x6000A03, "NBTP", "FDCAN nominal bit timing and prescaler register")
-        self.NTSEG2 = BitField(self, 0x0000007F, "NTSEG2", "Nominal time segment after sample point. Valid values are 0 to 127. The actual interpretation by the hardware of this value is such that one more than the programmed value is used.")
-        self.NTSEG1 = BitField(self, 0x0000FF00, "NTSEG1", "Nominal time segment before sample point. Valid values are 0 to 255. The actual interpretation by the hardware of this value is such that one more than the programmed value is used. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.NBRP = BitField(self, 0x01FF0000, "NBRP", "Bit rate prescaler. Value by which the oscillator frequency is divided for generating the bit time quanta. The bit time is built up from a multiple of this quanta. Valid values are 0 to 511. The actual interpretation by the hardware of this value is such that one more than the value programmed here is used. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.NSJW = BitField(self, 0xFE000000, "NSJW", "Nominal (re)synchronization jump width. Valid values are 0 to 127. The actual interpretation by the hardware of this value is such that the used value is the one programmed incremented by one. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.NTSEG = Subscriptor(self, "NTSEG{}")
-
-class SA_FDCAN_TSCC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TSCC", "FDCAN timestamp counter configuration register")
-        self.TSS = BitField(self, 0x00000003, "TSS", "Timestamp select. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.TCP = BitField(self, 0x000F0000, "TCP", "Timestamp counter prescaler")
-
-class SA_FDCAN_TSCV(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TSCV", "FDCAN timestamp counter value register")
-        self.TSC = BitField(self, 0x0000FFFF, "TSC", "Timestamp counter")
-
-class SA_FDCAN_TOCC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFF0000, "TOCC", "FDCAN timeout counter configuration register")
-        self.ETOC = BitField(self, 0x00000001, "ETOC", "Timeout counter enable. This is a protected write (P) bit, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.TOS = BitField(self, 0x00000006, "TOS", "Timeout select. When operating in Continuous mode, a write to TOCV presets the counter to the value configured by TOCC[TOP] and continues down-counting. When the timeout counter is controlled by one of the FIFOs, an empty FIFO presets the counter to the value configured by TOCC[TOP]. Down-counting is started when the first FIFO element is stored. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.TOP = BitField(self, 0xFFFF0000, "TOP", "Timeout period. Start value of the timeout counter (down-counter). Configures the timeout period.")
-
-class SA_FDCAN_TOCV(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0xFFFF, "TOCV", "FDCAN timeout counter value register")
-        self.TOC = BitField(self, 0x0000FFFF, "TOC", "Timeout counter")
-
-class SA_FDCAN_ECR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ECR", "FDCAN error counter register")
-        self.TEC = BitField(self, 0x000000FF, "TEC", "Transmit error counter. Actual state of the transmit error counter, values between 0 and 255. When CCCR.ASM is set, the CAN protocol controller does not increment TEC and REC when a CAN protocol error is detected, but CEL is still incremented.")
-        self.REC = BitField(self, 0x00007F00, "REC", "Receive error counter. Actual state of the receive error counter, values between 0 and 127.")
-        self.RP = BitField(self, 0x00008000, "RP", "Receive error passive")
-        self.CEL = BitField(self, 0x00FF0000, "CEL", "CAN error logging. The counter is incremented each time when a CAN protocol error causes the transmit error counter or the receive error counter to be incremented. It is reset by read access to CEL. The counter stops at 0xFF; the next increment of TEC or REC sets interrupt flag IR[ELO]. Access type is RX: reset on read.")
-
-class SA_FDCAN_PSR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x707, "PSR", "FDCAN protocol status register")
-        self.LEC = BitField(self, 0x00000007, "LEC", "Last error code. The LEC indicates the type of the last error to occur on the CAN bus. This field is cleared to 0 when a message has been transferred (reception or transmission) without error. Access type is RS: set on read.")
-        self.ACT = BitField(self, 0x00000018, "ACT", "Activity. Monitors the modules CAN communication state.")
-        self.EP = BitField(self, 0x00000020, "EP", "Error passive")
-        self.EW = BitField(self, 0x00000040, "EW", "Warning Sstatus")
-        self.BO = BitField(self, 0x00000080, "BO", "Bus_Off status")
-        self.DLEC = BitField(self, 0x00000700, "DLEC", "Data last error code. Type of last error that occurred in the data phase of a FDCAN format frame with its BRS flag set. Coding is the same as for LEC. This field is cleared to 0 when a FDCAN format frame with its BRS flag set has been transferred (reception or transmission) without error. Access type is RS: set on read.")
-        self.RESI = BitField(self, 0x00000800, "RESI", "ESI flag of last received FDCAN message. This bit is set together with REDL, independent of acceptance filtering. Access type is RX: reset on read.")
-        self.RBRS = BitField(self, 0x00001000, "RBRS", "BRS flag of last received FDCAN message. This bit is set together with REDL, independent of acceptance filtering. Access type is RX: reset on read.")
-        self.REDL = BitField(self, 0x00002000, "REDL", "Received FDCAN message. This bit is set independent of acceptance filtering. Access type is RX: reset on read.")
-        self.PXE = BitField(self, 0x00004000, "PXE", "Protocol exception event")
-        self.TDCV = BitField(self, 0x007F0000, "TDCV", "Transmitter delay compensation value. Position of the secondary sample point, defined by the sum of the measured delay from FDCAN_TX to FDCAN_RX and TDCR.TDCO. The SSP position is, in the data phase, the number of minimum time quanta (mtq) between the start of the transmitted bit and the secondary sample point. Valid values are 0 to 127 mtq.")
-
-class SA_FDCAN_TDCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TDCR", "FDCAN transmitter delay compensation register")
-        self.TDCF = BitField(self, 0x0000007F, "TDCF", "Transmitter delay compensation filter window length. Defines the minimum value for the SSP position, dominant edges on FDCAN_RX that would result in an earlier SSP position are ignored for transmitter delay measurements. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.TDCO = BitField(self, 0x00007F00, "TDCO", "Transmitter delay compensation offset. Offset value defining the distance between the measured delay from FDCAN_TX to FDCAN_RX and the secondary sample point. Valid values are 0 to 127 mtq. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-
-class SA_FDCAN_IR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IR", "FDCAN interrupt register")
-        self.RF0N = BitField(self, 0x00000001, "RF0N", "Rx FIFO 0 new message")
-        self.RF0F = BitField(self, 0x00000002, "RF0F", "Rx FIFO 0 full")
-        self.RF0L = BitField(self, 0x00000004, "RF0L", "Rx FIFO 0 message lost")
-        self.RF1N = BitField(self, 0x00000008, "RF1N", "Rx FIFO 1 new message")
-        self.RF1F = BitField(self, 0x00000010, "RF1F", "Rx FIFO 1 full")
-        self.RF1L = BitField(self, 0x00000020, "RF1L", "Rx FIFO 1 message lost")
-        self.HPM = BitField(self, 0x00000040, "HPM", "High-priority message")
-        self.TC = BitField(self, 0x00000080, "TC", "Transmission completed")
-        self.TCF = BitField(self, 0x00000100, "TCF", "Transmission cancellation finished")
-        self.TFE = BitField(self, 0x00000200, "TFE", "Tx FIFO empty")
-        self.TEFN = BitField(self, 0x00000400, "TEFN", "Tx event FIFO New Entry")
-        self.TEFF = BitField(self, 0x00000800, "TEFF", "Tx event FIFO full")
-        self.TEFL = BitField(self, 0x00001000, "TEFL", "Tx event FIFO element lost")
-        self.TSW = BitField(self, 0x00002000, "TSW", "Timestamp wraparound")
-        self.MRAF = BitField(self, 0x00004000, "MRAF", "Message RAM access failure. The flag is set when the Rx handler: has not completed acceptance filtering or storage of an accepted message until the arbitration field of the following message has been received. In this case acceptance filtering or message storage is aborted and the Rx handler starts processing of the following message. was unable to write a message to the message RAM. In this case message storage is aborted. In both cases the FIFO put index is not updated. The partly stored message is overwritten when the next message is stored to this location. The flag is also set when the Tx Handler was not able to read a message from the Message RAM in time. In this case message transmission is aborted. In case of a Tx Handler access failure the FDCAN is switched into Restricted operation Mode (see Restricted operation mode). To leave Restricted operation Mode, the Host CPU has to reset CCCR.ASM.")
-        self.TOO = BitField(self, 0x00008000, "TOO", "Timeout occurred")
-        self.ELO = BitField(self, 0x00010000, "ELO", "Error logging overflow")
-        self.EP = BitField(self, 0x00020000, "EP", "Error passive")
-        self.EW = BitField(self, 0x00040000, "EW", "Warning status")
-        self.BO = BitField(self, 0x00080000, "BO", "Bus_Off status")
-        self.WDI = BitField(self, 0x00100000, "WDI", "Watchdog interrupt")
-        self.PEA = BitField(self, 0x00200000, "PEA", "Protocol error in arbitration phase (nominal bit time is used)")
-        self.PED = BitField(self, 0x00400000, "PED", "Protocol error in data phase (data bit time is used)")
-        self.ARA = BitField(self, 0x00800000, "ARA", "Access to reserved address")
-        self.RFN = Subscriptor(self, "RF{}N")
-        self.RFF = Subscriptor(self, "RF{}F")
-        self.RFL = Subscriptor(self, "RF{}L")
-
-class SA_FDCAN_IE(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IE", "FDCAN interrupt enable register")
-        self.RF0NE = BitField(self, 0x00000001, "RF0NE", "Rx FIFO 0 new message interrupt enable")
-        self.RF0FE = BitField(self, 0x00000002, "RF0FE", "Rx FIFO 0 full interrupt enable")
-        self.RF0LE = BitField(self, 0x00000004, "RF0LE", "Rx FIFO 0 message lost interrupt enable")
-        self.RF1NE = BitField(self, 0x00000008, "RF1NE", "Rx FIFO 1 new message interrupt enable")
-        self.RF1FE = BitField(self, 0x00000010, "RF1FE", "Rx FIFO 1 full interrupt enable")
-        self.RF1LE = BitField(self, 0x00000020, "RF1LE", "Rx FIFO 1 message lost interrupt enable")
-        self.HPME = BitField(self, 0x00000040, "HPME", "High-priority message interrupt enable")
-        self.TCE = BitField(self, 0x00000080, "TCE", "Transmission completed interrupt enable")
-        self.TCFE = BitField(self, 0x00000100, "TCFE", "Transmission cancellation finished interrupt enable")
-        self.TFEE = BitField(self, 0x00000200, "TFEE", "Tx FIFO empty interrupt enable")
-        self.TEFNE = BitField(self, 0x00000400, "TEFNE", "Tx event FIFO new entry interrupt enable")
-        self.TEFFE = BitField(self, 0x00000800, "TEFFE", "Tx event FIFO full interrupt enable")
-        self.TEFLE = BitField(self, 0x00001000, "TEFLE", "Tx event FIFO element lost interrupt enable")
-        self.TSWE = BitField(self, 0x00002000, "TSWE", "Timestamp wraparound interrupt enable")
-        self.MRAFE = BitField(self, 0x00004000, "MRAFE", "Message RAM access failure interrupt enable")
-        self.TOOE = BitField(self, 0x00008000, "TOOE", "Timeout occurred interrupt enable")
-        self.ELOE = BitField(self, 0x00010000, "ELOE", "Error logging overflow interrupt enable")
-        self.EPE = BitField(self, 0x00020000, "EPE", "Error passive interrupt enable")
-        self.EWE = BitField(self, 0x00040000, "EWE", "Warning status interrupt enable")
-        self.BOE = BitField(self, 0x00080000, "BOE", "Bus_Off status")
-        self.WDIE = BitField(self, 0x00100000, "WDIE", "Watchdog interrupt enable")
-        self.PEAE = BitField(self, 0x00200000, "PEAE", "Protocol error in arbitration phase enable")
-        self.PEDE = BitField(self, 0x00400000, "PEDE", "Protocol error in data phase enable")
-        self.ARAE = BitField(self, 0x00800000, "ARAE", "Access to reserved address enable")
-        self.RFLE = Subscriptor(self, "RF{}LE")
-        self.RFNE = Subscriptor(self, "RF{}NE")
-        self.RFFE = Subscriptor(self, "RF{}FE")
-
-class SA_FDCAN_ILS(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ILS", "FDCAN interrupt line select register")
-        self.RXFIFO0 = BitField(self, 0x00000001, "RXFIFO0", "RX FIFO bit grouping the following interruption. RF0LL: Rx FIFO 0 message lost interrupt line RF0FL: Rx FIFO 0 full interrupt line RF0NL: Rx FIFO 0 new message interrupt line")
-        self.RXFIFO1 = BitField(self, 0x00000002, "RXFIFO1", "RX FIFO bit grouping the following interruption. RF1LL: Rx FIFO 1 message lost interrupt line RF1FL: Rx FIFO 1 full interrupt line RF1NL: Rx FIFO 1 new message interrupt line")
-        self.SMSG = BitField(self, 0x00000004, "SMSG", "Status message bit grouping the following interruption. TCFL: Transmission cancellation finished interrupt line TCL: Transmission completed interrupt line HPML: High-priority message interrupt line")
-        self.TFERR = BitField(self, 0x00000008, "TFERR", "Tx FIFO ERROR grouping the following interruption. TEFLL: Tx event FIFO element lost interrupt line TEFFL: Tx event FIFO full interrupt line TEFNL: Tx event FIFO new entry interrupt line TFEL: Tx FIFO empty interrupt line")
-        self.MISC = BitField(self, 0x00000010, "MISC", "Interrupt regrouping the following interruption. TOOL: Timeout occurred interrupt line MRAFL: Message RAM access failure interrupt line TSWL: Timestamp wraparound interrupt line")
-        self.BERR = BitField(self, 0x00000020, "BERR", "Bit and line error grouping the following interruption . EPL Error passive interrupt line ELOL: Error logging overflow interrupt line")
-        self.PERR = BitField(self, 0x00000040, "PERR", "Protocol error grouping the following interruption . ARAL: Access to reserved address line PEDL: Protocol error in data phase line PEAL: Protocol error in arbitration phase line WDIL: Watchdog interrupt line BOL: Bus_Off status EWL: Warning status interrupt line")
-        self.RXFIFO = Subscriptor(self, "RXFIFO{}")
-
-class SA_FDCAN_ILE(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ILE", "FDCAN interrupt line enable register")
-        self.EINT0 = BitField(self, 0x00000001, "EINT0", "Enable interrupt line 0")
-        self.EINT1 = BitField(self, 0x00000002, "EINT1", "Enable interrupt line 1")
-        self.EINT = Subscriptor(self, "EINT{}")
-
-class SA_FDCAN_RXGFC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RXGFC", "FDCAN global filter configuration register")
-        self.RRFE = BitField(self, 0x00000001, "RRFE", "Reject remote frames extended. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.RRFS = BitField(self, 0x00000002, "RRFS", "Reject remote frames standard. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.ANFE = BitField(self, 0x0000000C, "ANFE", "Accept non-matching frames extended. Defines how received messages with 29-bit IDs that do not match any element of the filter list are treated. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.ANFS = BitField(self, 0x00000030, "ANFS", "Accept Non-matching frames standard. Defines how received messages with 11-bit IDs that do not match any element of the filter list are treated. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.F1OM = BitField(self, 0x00000100, "F1OM", "FIFO 1 operation mode (overwrite or blocking). This is a protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.F0OM = BitField(self, 0x00000200, "F0OM", "FIFO 0 operation mode (overwrite or blocking). This is protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.LSS = BitField(self, 0x001F0000, "LSS", "List size standard. 1 to 28: Number of standard message ID filter elements >28: Values greater than 28 are interpreted as 28. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.LSE = BitField(self, 0x0F000000, "LSE", "List size extended. 1 to 8: Number of extended message ID filter elements >8: Values greater than 8 are interpreted as 8. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-        self.FOM = Subscriptor(self, "F{}OM")
-
-class SA_FDCAN_XIDAM(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x1FFFFFFF, "XIDAM", "FDCAN extended ID and mask register")
-        self.EIDM = BitField(self, 0x1FFFFFFF, "EIDM", "Extended ID mask. For acceptance filtering of extended frames the Extended ID AND Mask is AND-ed with the Message ID of a received frame. Intended for masking of 29-bit IDs in SAE J1939. With the reset value of all bits set to 1 the mask is not active. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-
-class SA_FDCAN_HPMS(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "HPMS", "FDCAN high-priority message status register")
-        self.BIDX = BitField(self, 0x00000007, "BIDX", "Buffer index. Index of Rx FIFO element to which the message was stored. Only valid when MSI[1] = 1.")
-        self.MSI = BitField(self, 0x000000C0, "MSI", "Message storage indicator")
-        self.FIDX = BitField(self, 0x00001F00, "FIDX", "Filter index. Index of matching filter element. Range is 0 to RXGFC[LSS] - 1 or RXGFC[LSE] - 1.")
-        self.FLST = BitField(self, 0x00008000, "FLST", "Filter list. Indicates the filter list of the matching filter element.")
-
-class SA_FDCAN_RXF0S(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RXF0S", "FDCAN Rx FIFO 0 status register")
-        self.F0FL = BitField(self, 0x0000000F, "F0FL", "Rx FIFO 0 fill level. Number of elements stored in Rx FIFO 0, range 0 to 3.")
-        self.F0GI = BitField(self, 0x00000300, "F0GI", "Rx FIFO 0 get index. Rx FIFO 0 read index pointer, range 0 to 2.")
-        self.F0PI = BitField(self, 0x00030000, "F0PI", "Rx FIFO 0 put index. Rx FIFO 0 write index pointer, range 0 to 2.")
-        self.F0F = BitField(self, 0x01000000, "F0F", "Rx FIFO 0 full")
-        self.RF0L = BitField(self, 0x02000000, "RF0L", "Rx FIFO 0 message lost. This bit is a copy of interrupt flag IR[RF0L]. When IR[RF0L] is reset, this bit is also reset.")
-
-class SA_FDCAN_RXF0A(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RXF0A", "CAN Rx FIFO 0 acknowledge register")
-        self.F0AI = BitField(self, 0x00000007, "F0AI", "Rx FIFO 0 acknowledge index. After the Host has read a message or a sequence of messages from Rx FIFO 0 it has to write the buffer index of the last element read from Rx FIFO 0 to F0AI. This sets the Rx FIFO 0 get index RXF0S[F0GI] to F0AI + 1 and update the FIFO 0 fill level RXF0S[F0FL].")
-
-class SA_FDCAN_RXF1S(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RXF1S", "FDCAN Rx FIFO 1 status register")
-        self.F1FL = BitField(self, 0x0000000F, "F1FL", "Rx FIFO 1 fill level. Number of elements stored in Rx FIFO 1, range 0 to 3.")
-        self.F1GI = BitField(self, 0x00000300, "F1GI", "Rx FIFO 1 get index. Rx FIFO 1 read index pointer, range 0 to 2.")
-        self.F1PI = BitField(self, 0x00030000, "F1PI", "Rx FIFO 1 put index. Rx FIFO 1 write index pointer, range 0 to 2.")
-        self.F1F = BitField(self, 0x01000000, "F1F", "Rx FIFO 1 full")
-        self.RF1L = BitField(self, 0x02000000, "RF1L", "Rx FIFO 1 message lost. This bit is a copy of interrupt flag IR[RF1L]. When IR[RF1L] is reset, this bit is also reset.")
-
-class SA_FDCAN_RXF1A(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RXF1A", "FDCAN Rx FIFO 1 acknowledge register")
-        self.F1AI = BitField(self, 0x00000007, "F1AI", "Rx FIFO 1 acknowledge index. After the Host has read a message or a sequence of messages from Rx FIFO 1 it has to write the buffer index of the last element read from Rx FIFO 1 to F1AI. This sets the Rx FIFO 1 get index RXF1S[F1GI] to F1AI + 1 and update the FIFO 1 Fill Level RXF1S[F1FL].")
-
-class SA_FDCAN_TXBC(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXBC", "FDCAN Tx buffer configuration register")
-        self.TFQM = BitField(self, 0x01000000, "TFQM", "Tx FIFO/queue mode. This is a protected write (P) bit, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-
-class SA_FDCAN_TXFQS(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x3, "TXFQS", "FDCAN Tx FIFO/queue status register")
-        self.TFFL = BitField(self, 0x00000007, "TFFL", "Tx FIFO free level. Number of consecutive free Tx FIFO elements starting from TFGI, range 0 to 3. Read as 0 when Tx queue operation is configured (TXBC[TFQM] = 1).")
-        self.TFGI = BitField(self, 0x00000300, "TFGI", "Tx FIFO get index. Tx FIFO read index pointer, range 0 to 3. Read as 0 when Tx queue operation is configured (TXBC.TFQM = 1)")
-        self.TFQPI = BitField(self, 0x00030000, "TFQPI", "Tx FIFO/queue put index. Tx FIFO/queue write index pointer, range 0 to 3")
-        self.TFQF = BitField(self, 0x00200000, "TFQF", "Tx FIFO/queue full")
-
-class SA_FDCAN_TXBRP(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXBRP", "FDCAN Tx buffer request pending register")
-        self.TRP = BitField(self, 0x00000007, "TRP", "Transmission request pending. Each Tx buffer has its own transmission request pending bit. The bits are set via register TXBAR. The bits are reset after a requested transmission has completed or has been canceled via register TXBCR. After a TXBRP bit has been set, a Tx scan is started to check for the pending Tx request with the highest priority (Tx buffer with lowest Message ID). A cancellation request resets the corresponding transmission request pending bit of register TXBRP. In case a transmission has already been started when a cancellation is requested, this is done at the end of the transmission, regardless whether the transmission was successful or not. The cancellation request bits are reset directly after the corresponding TXBRP bit has been reset. After a cancellation has been requested, a finished cancellation is signaled via TXBCF after successful transmission together with the corresponding TXBTO bit when the transmission has not yet been started at the point of cancellation when the transmission has been aborted due to lost arbitration when an error occurred during frame transmission In DAR mode all transmissions are automatically canceled if they are not successful. The corresponding TXBCF bit is set for all unsuccessful transmissions.")
-
-class SA_FDCAN_TXBAR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXBAR", "FDCAN Tx buffer add request register")
-        self.AR = BitField(self, 0x00000007, "AR", "Add request. Each Tx buffer has its own add request bit. Writing a 1 sets the corresponding add request bit; writing a 0 has no impact. This enables the Host to set transmission requests for multiple Tx buffers with one write to TXBAR. When no Tx scan is running, the bits are reset immediately, else the bits remain set until the Tx scan process has completed.")
-
-class SA_FDCAN_TXBCR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXBCR", "FDCAN Tx buffer cancellation request register")
-        self.CR = BitField(self, 0x00000007, "CR", "Cancellation request. Each Tx buffer has its own cancellation request bit. Writing a 1 sets the corresponding CR bit; writing a 0 has no impact. This enables the Host to set cancellation requests for multiple Tx buffers with one write to TXBCR. The bits remain set until the corresponding TXBRP bit is reset.")
-
-class SA_FDCAN_TXBTO(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXBTO", "FDCAN Tx buffer transmission occurred register")
-        self.TO = BitField(self, 0x00000007, "TO", "Transmission occurred.. Each Tx buffer has its own TO bit. The bits are set when the corresponding TXBRP bit is cleared after a successful transmission. The bits are reset when a new transmission is requested by writing a 1 to the corresponding bit of register TXBAR.")
-
-class SA_FDCAN_TXBCF(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXBCF", "FDCAN Tx buffer cancellation finished register")
-        self.CF = BitField(self, 0x00000007, "CF", "Cancellation finished. Each Tx buffer has its own CF bit. The bits are set when the corresponding TXBRP bit is cleared after a cancellation was requested via TXBCR. In case the corresponding TXBRP bit was not set at the point of cancellation, CF is set immediately. The bits are reset when a new transmission is requested by writing a 1 to the corresponding bit of register TXBAR.")
-
-class SA_FDCAN_TXBTIE(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXBTIE", "FDCAN Tx buffer transmission interrupt enable register")
-        self.TIE = BitField(self, 0x00000007, "TIE", "Transmission interrupt enable. Each Tx buffer has its own TIE bit.")
-
-class SA_FDCAN_TXBCIE(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXBCIE", "FDCAN Tx buffer cancellation finished interrupt enable register")
-        self.CFIE = BitField(self, 0x00000007, "CFIE", "Cancellation finished interrupt enable.. Each Tx buffer has its own CFIE bit.")
-
-class SA_FDCAN_TXEFS(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXEFS", "FDCAN Tx event FIFO status register")
-        self.EFFL = BitField(self, 0x00000007, "EFFL", "Event FIFO fill level. Number of elements stored in Tx event FIFO, range 0 to 3.")
-        self.EFGI = BitField(self, 0x00000300, "EFGI", "Event FIFO get index. Tx event FIFO read index pointer, range 0 to 3.")
-        self.EFPI = BitField(self, 0x00030000, "EFPI", "Event FIFO put index. Tx event FIFO write index pointer, range 0 to 3.")
-        self.EFF = BitField(self, 0x01000000, "EFF", "Event FIFO full")
-        self.TEFL = BitField(self, 0x02000000, "TEFL", "Tx event FIFO element lost. This bit is a copy of interrupt flag IR[TEFL]. When IR[TEFL] is reset, this bit is also reset. 0 No Tx event FIFO element lost 1 Tx event FIFO element lost, also set after write attempt to Tx event FIFO of size 0.")
-
-class SA_FDCAN_TXEFA(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXEFA", "FDCAN Tx event FIFO acknowledge register")
-        self.EFAI = BitField(self, 0x00000003, "EFAI", "Event FIFO acknowledge index. After the Host has read an element or a sequence of elements from the Tx event FIFO, it has to write the index of the last element read from Tx event FIFO to EFAI. This sets the Tx event FIFO get index TXEFS[EFGI] to EFAI + 1 and updates the FIFO 0 fill level TXEFS[EFFL].")
-
-class SA_FDCAN_CKDIV(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CKDIV", "FDCAN CFG clock divider register")
-        self.PDIV = BitField(self, 0x0000000F, "PDIV", "input clock divider. The APB clock could be divided prior to be used by the CAN sub system. The rate must be computed using the divider output clock. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.")
-
-class SA_FDCAN(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "FDCAN")
-        self.CREL = SA_FDCAN_CREL(self, 0x0)
-        self.ENDN = SA_FDCAN_ENDN(self, 0x4)
-        self.DBTP = SA_FDCAN_DBTP(self, 0xC)
-        self.TEST = SA_FDCAN_TEST(self, 0x10)
-        self.RWD = SA_FDCAN_RWD(self, 0x14)
-        self.CCCR = SA_FDCAN_CCCR(self, 0x18)
-        self.NBTP = SA_FDCAN_NBTP(self, 0x1C)
-        self.TSCC = SA_FDCAN_TSCC(self, 0x20)
-        self.TSCV = SA_FDCAN_TSCV(self, 0x24)
-        self.TOCC = SA_FDCAN_TOCC(self, 0x28)
-        self.TOCV = SA_FDCAN_TOCV(self, 0x2C)
-        self.ECR = SA_FDCAN_ECR(self, 0x40)
-        self.PSR = SA_FDCAN_PSR(self, 0x44)
-        self.TDCR = SA_FDCAN_TDCR(self, 0x48)
-        self.IR = SA_FDCAN_IR(self, 0x50)
-        self.IE = SA_FDCAN_IE(self, 0x54)
-        self.ILS = SA_FDCAN_ILS(self, 0x58)
-        self.ILE = SA_FDCAN_ILE(self, 0x5C)
-        self.RXGFC = SA_FDCAN_RXGFC(self, 0x80)
-        self.XIDAM = SA_FDCAN_XIDAM(self, 0x84)
-        self.HPMS = SA_FDCAN_HPMS(self, 0x88)
-        self.RXF0S = SA_FDCAN_RXF0S(self, 0x90)
-        self.RXF0A = SA_FDCAN_RXF0A(self, 0x94)
-        self.RXF1S = SA_FDCAN_RXF1S(self, 0x98)
-        self.RXF1A = SA_FDCAN_RXF1A(self, 0x9C)
-        self.TXBC = SA_FDCAN_TXBC(self, 0xC0)
-        self.TXFQS = SA_FDCAN_TXFQS(self, 0xC4)
-        self.TXBRP = SA_FDCAN_TXBRP(self, 0xC8)
-        self.TXBAR = SA_FDCAN_TXBAR(self, 0xCC)
-        self.TXBCR = SA_FDCAN_TXBCR(self, 0xD0)
-        self.TXBTO = SA_FDCAN_TXBTO(self, 0xD4)
-        self.TXBCF = SA_FDCAN_TXBCF(self, 0xD8)
-        self.TXBTIE = SA_FDCAN_TXBTIE(self, 0xDC)
-        self.TXBCIE = SA_FDCAN_TXBCIE(self, 0xE0)
-        self.TXEFS = SA_FDCAN_TXEFS(self, 0xE4)
-        self.TXEFA = SA_FDCAN_TXEFA(self, 0xE8)
-        self.CKDIV = SA_FDCAN_CKDIV(self, 0x100)
-        self.RXFS = Subscriptor(self, "RXF{}S")
-        self.RXFA = Subscriptor(self, "RXF{}A")
-
-FDCAN = SA_FDCAN(0x4000A400, "FDCAN")
-FDCAN1 = SA_FDCAN(0x40006400, "FDCAN1")
-
-class SA_UCPD1_CFG1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CFG1", "UCPD configuration register 1")
-        self.HBITCLKDIV = BitField(self, 0x0000003F, "HBITCLKDIV", "HBITCLKDIV")
-        self.IFRGAP = BitField(self, 0x000007C0, "IFRGAP", "IFRGAP")
-        self.TRANSWIN = BitField(self, 0x0000F800, "TRANSWIN", "TRANSWIN")
-        self.PSC_USBPDCLK = BitField(self, 0x000E0000, "PSC_USBPDCLK", "PSC_USBPDCLK")
-        self.RXORDSETEN = BitField(self, 0x1FF00000, "RXORDSETEN", "RXORDSETEN")
-        self.TXDMAEN = BitField(self, 0x20000000, "TXDMAEN", "TXDMAEN")
-        self.RXDMAEN = BitField(self, 0x40000000, "RXDMAEN", "RXDMAEN")
-        self.UCPDEN = BitField(self, 0x80000000, "UCPDEN", "UCPDEN")
-
-class SA_UCPD1_CFG2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CFG2", "UCPD configuration register 2")
-        self.RXFILTDIS = BitField(self, 0x00000001, "RXFILTDIS", "RXFILTDIS")
-        self.RXFILT2N3 = BitField(self, 0x00000002, "RXFILT2N3", "RXFILT2N3")
-        self.FORCECLK = BitField(self, 0x00000004, "FORCECLK", "FORCECLK")
-        self.WUPEN = BitField(self, 0x00000008, "WUPEN", "WUPEN")
-
-class SA_UCPD1_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CR", "UCPD configuration register 2")
-        self.TXMODE = BitField(self, 0x00000003, "TXMODE", "TXMODE")
-        self.TXSEND = BitField(self, 0x00000004, "TXSEND", "TXSEND")
-        self.TXHRST = BitField(self, 0x00000008, "TXHRST", "TXHRST")
-        self.RXMODE = BitField(self, 0x00000010, "RXMODE", "RXMODE")
-        self.PHYRXEN = BitField(self, 0x00000020, "PHYRXEN", "PHYRXEN")
-        self.PHYCCSEL = BitField(self, 0x00000040, "PHYCCSEL", "PHYCCSEL")
-        self.ANASUBMODE = BitField(self, 0x00000180, "ANASUBMODE", "ANASUBMODE")
-        self.ANAMODE = BitField(self, 0x00000200, "ANAMODE", "ANAMODE")
-        self.CCENABLE = BitField(self, 0x00000C00, "CCENABLE", "CCENABLE")
-        self.FRSRXEN = BitField(self, 0x00010000, "FRSRXEN", "FRSRXEN")
-        self.FRSTX = BitField(self, 0x00020000, "FRSTX", "FRSTX")
-        self.RDCH = BitField(self, 0x00040000, "RDCH", "RDCH")
-        self.CC1TCDIS = BitField(self, 0x00100000, "CC1TCDIS", "CC1TCDIS")
-        self.CC2TCDIS = BitField(self, 0x00200000, "CC2TCDIS", "CC2TCDIS")
-        self.CCTCDIS = Subscriptor(self, "CC{}TCDIS")
-
-class SA_UCPD1_IMR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "IMR", "UCPD Interrupt Mask Register")
-        self.TXISIE = BitField(self, 0x00000001, "TXISIE", "TXISIE")
-        self.TXMSGDISCIE = BitField(self, 0x00000002, "TXMSGDISCIE", "TXMSGDISCIE")
-        self.TXMSGSENTIE = BitField(self, 0x00000004, "TXMSGSENTIE", "TXMSGSENTIE")
-        self.TXMSGABTIE = BitField(self, 0x00000008, "TXMSGABTIE", "TXMSGABTIE")
-        self.HRSTDISCIE = BitField(self, 0x00000010, "HRSTDISCIE", "HRSTDISCIE")
-        self.HRSTSENTIE = BitField(self, 0x00000020, "HRSTSENTIE", "HRSTSENTIE")
-        self.TXUNDIE = BitField(self, 0x00000040, "TXUNDIE", "TXUNDIE")
-        self.RXNEIE = BitField(self, 0x00000100, "RXNEIE", "RXNEIE")
-        self.RXORDDETIE = BitField(self, 0x00000200, "RXORDDETIE", "RXORDDETIE")
-        self.RXHRSTDETIE = BitField(self, 0x00000400, "RXHRSTDETIE", "RXHRSTDETIE")
-        self.RXOVRIE = BitField(self, 0x00000800, "RXOVRIE", "RXOVRIE")
-        self.RXMSGENDIE = BitField(self, 0x00001000, "RXMSGENDIE", "RXMSGENDIE")
-        self.TYPECEVT1IE = BitField(self, 0x00004000, "TYPECEVT1IE", "TYPECEVT1IE")
-        self.TYPECEVT2IE = BitField(self, 0x00008000, "TYPECEVT2IE", "TYPECEVT2IE")
-        self.FRSEVTIE = BitField(self, 0x00100000, "FRSEVTIE", "FRSEVTIE")
-        self.TYPECEVTIE = Subscriptor(self, "TYPECEVT{}IE")
-
-class SA_UCPD1_SR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "SR", "UCPD Status Register")
-        self.TXIS = BitField(self, 0x00000001, "TXIS", "TXIS")
-        self.TXMSGDISC = BitField(self, 0x00000002, "TXMSGDISC", "TXMSGDISC")
-        self.TXMSGSENT = BitField(self, 0x00000004, "TXMSGSENT", "TXMSGSENT")
-        self.TXMSGABT = BitField(self, 0x00000008, "TXMSGABT", "TXMSGABT")
-        self.HRSTDISC = BitField(self, 0x00000010, "HRSTDISC", "HRSTDISC")
-        self.HRSTSENT = BitField(self, 0x00000020, "HRSTSENT", "HRSTSENT")
-        self.TXUND = BitField(self, 0x00000040, "TXUND", "TXUND")
-        self.RXNE = BitField(self, 0x00000100, "RXNE", "RXNE")
-        self.RXORDDET = BitField(self, 0x00000200, "RXORDDET", "RXORDDET")
-        self.RXHRSTDET = BitField(self, 0x00000400, "RXHRSTDET", "RXHRSTDET")
-        self.RXOVR = BitField(self, 0x00000800, "RXOVR", "RXOVR")
-        self.RXMSGEND = BitField(self, 0x00001000, "RXMSGEND", "RXMSGEND")
-        self.RXERR = BitField(self, 0x00002000, "RXERR", "RXERR")
-        self.TYPECEVT1 = BitField(self, 0x00004000, "TYPECEVT1", "TYPECEVT1")
-        self.TYPECEVT2 = BitField(self, 0x00008000, "TYPECEVT2", "TYPECEVT2")
-        self.TYPEC_VSTATE_CC1 = BitField(self, 0x00030000, "TYPEC_VSTATE_CC1", "TYPEC_VSTATE_CC1")
-        self.TYPEC_VSTATE_CC2 = BitField(self, 0x000C0000, "TYPEC_VSTATE_CC2", "TYPEC_VSTATE_CC2")
-        self.FRSEVT = BitField(self, 0x00100000, "FRSEVT", "FRSEVT")
-        self.TYPEC_VSTATE_CC = Subscriptor(self, "TYPEC_VSTATE_CC{}")
-        self.TYPECEVT = Subscriptor(self, "TYPECEVT{}")
-
-class SA_UCPD1_ICR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ICR", "UCPD Interrupt Clear Register")
-        self.TXMSGDISCCF = BitField(self, 0x00000002, "TXMSGDISCCF", "TXMSGDISCCF")
-        self.TXMSGSENTCF = BitField(self, 0x00000004, "TXMSGSENTCF", "TXMSGSENTCF")
-        self.TXMSGABTCF = BitField(self, 0x00000008, "TXMSGABTCF", "TXMSGABTCF")
-        self.HRSTDISCCF = BitField(self, 0x00000010, "HRSTDISCCF", "HRSTDISCCF")
-        self.HRSTSENTCF = BitField(self, 0x00000020, "HRSTSENTCF", "HRSTSENTCF")
-        self.TXUNDCF = BitField(self, 0x00000040, "TXUNDCF", "TXUNDCF")
-        self.RXORDDETCF = BitField(self, 0x00000200, "RXORDDETCF", "RXORDDETCF")
-        self.RXHRSTDETCF = BitField(self, 0x00000400, "RXHRSTDETCF", "RXHRSTDETCF")
-        self.RXOVRCF = BitField(self, 0x00000800, "RXOVRCF", "RXOVRCF")
-        self.RXMSGENDCF = BitField(self, 0x00001000, "RXMSGENDCF", "RXMSGENDCF")
-        self.TYPECEVT1CF = BitField(self, 0x00004000, "TYPECEVT1CF", "TYPECEVT1CF")
-        self.TYPECEVT2CF = BitField(self, 0x00008000, "TYPECEVT2CF", "TYPECEVT2CF")
-        self.FRSEVTCF = BitField(self, 0x00100000, "FRSEVTCF", "FRSEVTCF")
-        self.TYPECEVTCF = Subscriptor(self, "TYPECEVT{}CF")
-
-class SA_UCPD1_TX_ORDSET(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TX_ORDSET", "UCPD Tx Ordered Set Type Register")
-        self.TXORDSET = BitField(self, 0x000FFFFF, "TXORDSET", "TXORDSET")
-
-class SA_UCPD1_TX_PAYSZ(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TX_PAYSZ", "UCPD Tx Paysize Register")
-        self.TXPAYSZ = BitField(self, 0x000003FF, "TXPAYSZ", "TXPAYSZ")
-
-class SA_UCPD1_TXDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "TXDR", "UCPD Tx Data Register")
-        self.TXDATA = BitField(self, 0x000000FF, "TXDATA", "TXDATA")
-
-class SA_UCPD1_RX_ORDSET(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RX_ORDSET", "UCPD Rx Ordered Set Register")
-        self.RXORDSET = BitField(self, 0x00000007, "RXORDSET", "RXORDSET")
-        self.RXSOP3OF4 = BitField(self, 0x00000008, "RXSOP3OF4", "RXSOP3OF4")
-        self.RXSOPKINVALID = BitField(self, 0x00000070, "RXSOPKINVALID", "RXSOPKINVALID")
-
-class SA_UCPD1_RX_PAYSZ(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RX_PAYSZ", "UCPD Rx Paysize Register")
-        self.RXPAYSZ = BitField(self, 0x000003FF, "RXPAYSZ", "RXPAYSZ")
-
-class SA_UCPD1_RXDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RXDR", "UCPD Rx Data Register")
-        self.RXDATA = BitField(self, 0x000000FF, "RXDATA", "RXDATA")
-
-class SA_UCPD1_RX_ORDEXT1(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RX_ORDEXT1", "UCPD Rx Ordered Set Extension Register 1")
-        self.RXSOPX1 = BitField(self, 0x000FFFFF, "RXSOPX1", "RXSOPX1")
-
-class SA_UCPD1_RX_ORDEXT2(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "RX_ORDEXT2", "UCPD Rx Ordered Set Extension Register 2")
-        self.RXSOPX2 = BitField(self, 0x000FFFFF, "RXSOPX2", "RXSOPX2")
-
-class SA_UCPD1(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "UCPD1")
-        self.CFG1 = SA_UCPD1_CFG1(self, 0x0)
-        self.CFG2 = SA_UCPD1_CFG2(self, 0x4)
-        self.CR = SA_UCPD1_CR(self, 0xC)
-        self.IMR = SA_UCPD1_IMR(self, 0x10)
-        self.SR = SA_UCPD1_SR(self, 0x14)
-        self.ICR = SA_UCPD1_ICR(self, 0x18)
-        self.TX_ORDSET = SA_UCPD1_TX_ORDSET(self, 0x1C)
-        self.TX_PAYSZ = SA_UCPD1_TX_PAYSZ(self, 0x20)
-        self.TXDR = SA_UCPD1_TXDR(self, 0x24)
-        self.RX_ORDSET = SA_UCPD1_RX_ORDSET(self, 0x28)
-        self.RX_PAYSZ = SA_UCPD1_RX_PAYSZ(self, 0x2C)
-        self.RXDR = SA_UCPD1_RXDR(self, 0x30)
-        self.RX_ORDEXT1 = SA_UCPD1_RX_ORDEXT1(self, 0x34)
-        self.RX_ORDEXT2 = SA_UCPD1_RX_ORDEXT2(self, 0x38)
-        self.CFG = Subscriptor(self, "CFG{}")
-        self.RX_ORDEXT = Subscriptor(self, "RX_ORDEXT{}")
-
-UCPD1 = SA_UCPD1(0x4000A000, "UCPD1")
-
-class SA_USB_FS_device_EP0R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EP0R", "USB endpoint n register")
-        self.EA = BitField(self, 0x0000000F, "EA", "EA")
-        self.STAT_TX = BitField(self, 0x00000030, "STAT_TX", "STAT_TX")
-        self.DTOG_TX = BitField(self, 0x00000040, "DTOG_TX", "DTOG_TX")
-        self.CTR_TX = BitField(self, 0x00000080, "CTR_TX", "CTR_TX")
-        self.EP_KIND = BitField(self, 0x00000100, "EP_KIND", "EP_KIND")
-        self.EP_TYPE = BitField(self, 0x00000600, "EP_TYPE", "EP_TYPE")
-        self.SETUP = BitField(self, 0x00000800, "SETUP", "SETUP")
-        self.STAT_RX = BitField(self, 0x00003000, "STAT_RX", "STAT_RX")
-        self.DTOG_RX = BitField(self, 0x00004000, "DTOG_RX", "DTOG_RX")
-        self.CTR_RX = BitField(self, 0x00008000, "CTR_RX", "CTR_RX")
-
-class SA_USB_FS_device_EP1R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EP1R", "USB endpoint n register")
-        self.EA = BitField(self, 0x0000000F, "EA", "EA")
-        self.STAT_TX = BitField(self, 0x00000030, "STAT_TX", "STAT_TX")
-        self.DTOG_TX = BitField(self, 0x00000040, "DTOG_TX", "DTOG_TX")
-        self.CTR_TX = BitField(self, 0x00000080, "CTR_TX", "CTR_TX")
-        self.EP_KIND = BitField(self, 0x00000100, "EP_KIND", "EP_KIND")
-        self.EP_TYPE = BitField(self, 0x00000600, "EP_TYPE", "EP_TYPE")
-        self.SETUP = BitField(self, 0x00000800, "SETUP", "SETUP")
-        self.STAT_RX = BitField(self, 0x00003000, "STAT_RX", "STAT_RX")
-        self.DTOG_RX = BitField(self, 0x00004000, "DTOG_RX", "DTOG_RX")
-        self.CTR_RX = BitField(self, 0x00008000, "CTR_RX", "CTR_RX")
-
-class SA_USB_FS_device_EP2R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EP2R", "USB endpoint n register")
-        self.EA = BitField(self, 0x0000000F, "EA", "EA")
-        self.STAT_TX = BitField(self, 0x00000030, "STAT_TX", "STAT_TX")
-        self.DTOG_TX = BitField(self, 0x00000040, "DTOG_TX", "DTOG_TX")
-        self.CTR_TX = BitField(self, 0x00000080, "CTR_TX", "CTR_TX")
-        self.EP_KIND = BitField(self, 0x00000100, "EP_KIND", "EP_KIND")
-        self.EP_TYPE = BitField(self, 0x00000600, "EP_TYPE", "EP_TYPE")
-        self.SETUP = BitField(self, 0x00000800, "SETUP", "SETUP")
-        self.STAT_RX = BitField(self, 0x00003000, "STAT_RX", "STAT_RX")
-        self.DTOG_RX = BitField(self, 0x00004000, "DTOG_RX", "DTOG_RX")
-        self.CTR_RX = BitField(self, 0x00008000, "CTR_RX", "CTR_RX")
-
-class SA_USB_FS_device_EP3R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EP3R", "USB endpoint n register")
-        self.EA = BitField(self, 0x0000000F, "EA", "EA")
-        self.STAT_TX = BitField(self, 0x00000030, "STAT_TX", "STAT_TX")
-        self.DTOG_TX = BitField(self, 0x00000040, "DTOG_TX", "DTOG_TX")
-        self.CTR_TX = BitField(self, 0x00000080, "CTR_TX", "CTR_TX")
-        self.EP_KIND = BitField(self, 0x00000100, "EP_KIND", "EP_KIND")
-        self.EP_TYPE = BitField(self, 0x00000600, "EP_TYPE", "EP_TYPE")
-        self.SETUP = BitField(self, 0x00000800, "SETUP", "SETUP")
-        self.STAT_RX = BitField(self, 0x00003000, "STAT_RX", "STAT_RX")
-        self.DTOG_RX = BitField(self, 0x00004000, "DTOG_RX", "DTOG_RX")
-        self.CTR_RX = BitField(self, 0x00008000, "CTR_RX", "CTR_RX")
-
-class SA_USB_FS_device_EP4R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EP4R", "USB endpoint n register")
-        self.EA = BitField(self, 0x0000000F, "EA", "EA")
-        self.STAT_TX = BitField(self, 0x00000030, "STAT_TX", "STAT_TX")
-        self.DTOG_TX = BitField(self, 0x00000040, "DTOG_TX", "DTOG_TX")
-        self.CTR_TX = BitField(self, 0x00000080, "CTR_TX", "CTR_TX")
-        self.EP_KIND = BitField(self, 0x00000100, "EP_KIND", "EP_KIND")
-        self.EP_TYPE = BitField(self, 0x00000600, "EP_TYPE", "EP_TYPE")
-        self.SETUP = BitField(self, 0x00000800, "SETUP", "SETUP")
-        self.STAT_RX = BitField(self, 0x00003000, "STAT_RX", "STAT_RX")
-        self.DTOG_RX = BitField(self, 0x00004000, "DTOG_RX", "DTOG_RX")
-        self.CTR_RX = BitField(self, 0x00008000, "CTR_RX", "CTR_RX")
-
-class SA_USB_FS_device_EP5R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EP5R", "USB endpoint n register")
-        self.EA = BitField(self, 0x0000000F, "EA", "EA")
-        self.STAT_TX = BitField(self, 0x00000030, "STAT_TX", "STAT_TX")
-        self.DTOG_TX = BitField(self, 0x00000040, "DTOG_TX", "DTOG_TX")
-        self.CTR_TX = BitField(self, 0x00000080, "CTR_TX", "CTR_TX")
-        self.EP_KIND = BitField(self, 0x00000100, "EP_KIND", "EP_KIND")
-        self.EP_TYPE = BitField(self, 0x00000600, "EP_TYPE", "EP_TYPE")
-        self.SETUP = BitField(self, 0x00000800, "SETUP", "SETUP")
-        self.STAT_RX = BitField(self, 0x00003000, "STAT_RX", "STAT_RX")
-        self.DTOG_RX = BitField(self, 0x00004000, "DTOG_RX", "DTOG_RX")
-        self.CTR_RX = BitField(self, 0x00008000, "CTR_RX", "CTR_RX")
-
-class SA_USB_FS_device_EP6R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EP6R", "USB endpoint n register")
-        self.EA = BitField(self, 0x0000000F, "EA", "EA")
-        self.STAT_TX = BitField(self, 0x00000030, "STAT_TX", "STAT_TX")
-        self.DTOG_TX = BitField(self, 0x00000040, "DTOG_TX", "DTOG_TX")
-        self.CTR_TX = BitField(self, 0x00000080, "CTR_TX", "CTR_TX")
-        self.EP_KIND = BitField(self, 0x00000100, "EP_KIND", "EP_KIND")
-        self.EP_TYPE = BitField(self, 0x00000600, "EP_TYPE", "EP_TYPE")
-        self.SETUP = BitField(self, 0x00000800, "SETUP", "SETUP")
-        self.STAT_RX = BitField(self, 0x00003000, "STAT_RX", "STAT_RX")
-        self.DTOG_RX = BitField(self, 0x00004000, "DTOG_RX", "DTOG_RX")
-        self.CTR_RX = BitField(self, 0x00008000, "CTR_RX", "CTR_RX")
-
-class SA_USB_FS_device_EP7R(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "EP7R", "USB endpoint n register")
-        self.EA = BitField(self, 0x0000000F, "EA", "EA")
-        self.STAT_TX = BitField(self, 0x00000030, "STAT_TX", "STAT_TX")
-        self.DTOG_TX = BitField(self, 0x00000040, "DTOG_TX", "DTOG_TX")
-        self.CTR_TX = BitField(self, 0x00000080, "CTR_TX", "CTR_TX")
-        self.EP_KIND = BitField(self, 0x00000100, "EP_KIND", "EP_KIND")
-        self.EP_TYPE = BitField(self, 0x00000600, "EP_TYPE", "EP_TYPE")
-        self.SETUP = BitField(self, 0x00000800, "SETUP", "SETUP")
-        self.STAT_RX = BitField(self, 0x00003000, "STAT_RX", "STAT_RX")
-        self.DTOG_RX = BitField(self, 0x00004000, "DTOG_RX", "DTOG_RX")
-        self.CTR_RX = BitField(self, 0x00008000, "CTR_RX", "CTR_RX")
-
-class SA_USB_FS_device_CNTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "CNTR", "USB control register")
-        self.FRES = BitField(self, 0x00000001, "FRES", "FRES")
-        self.PDWN = BitField(self, 0x00000002, "PDWN", "PDWN")
-        self.LP_MODE = BitField(self, 0x00000004, "LP_MODE", "LP_MODE")
-        self.FSUSP = BitField(self, 0x00000008, "FSUSP", "FSUSP")
-        self.RESUME = BitField(self, 0x00000010, "RESUME", "RESUME")
-        self.L1RESUME = BitField(self, 0x00000020, "L1RESUME", "L1RESUME")
-        self.L1REQM = BitField(self, 0x00000080, "L1REQM", "L1REQM")
-        self.ESOFM = BitField(self, 0x00000100, "ESOFM", "ESOFM")
-        self.SOFM = BitField(self, 0x00000200, "SOFM", "SOFM")
-        self.RESETM = BitField(self, 0x00000400, "RESETM", "RESETM")
-        self.SUSPM = BitField(self, 0x00000800, "SUSPM", "SUSPM")
-        self.WKUPM = BitField(self, 0x00001000, "WKUPM", "WKUPM")
-        self.ERRM = BitField(self, 0x00002000, "ERRM", "ERRM")
-        self.PMAOVRM = BitField(self, 0x00004000, "PMAOVRM", "PMAOVRM")
-        self.CTRM = BitField(self, 0x00008000, "CTRM", "CTRM")
-
-class SA_USB_FS_device_ISTR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ISTR", "USB interrupt status register")
-        self.EP_ID = BitField(self, 0x0000000F, "EP_ID", "EP_ID")
-        self.DIR = BitField(self, 0x00000010, "DIR", "DIR")
-        self.L1REQ = BitField(self, 0x00000080, "L1REQ", "L1REQ")
-        self.ESOF = BitField(self, 0x00000100, "ESOF", "ESOF")
-        self.SOF = BitField(self, 0x00000200, "SOF", "SOF")
-        self.RESET = BitField(self, 0x00000400, "RESET", "RESET")
-        self.SUSP = BitField(self, 0x00000800, "SUSP", "SUSP")
-        self.WKUP = BitField(self, 0x00001000, "WKUP", "WKUP")
-        self.ERR = BitField(self, 0x00002000, "ERR", "ERR")
-        self.PMAOVR = BitField(self, 0x00004000, "PMAOVR", "PMAOVR")
-        self.CTR = BitField(self, 0x00008000, "CTR", "CTR")
-
-class SA_USB_FS_device_FNR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "FNR", "USB frame number register")
-        self.FN = BitField(self, 0x000007FF, "FN", "FN")
-        self.LSOF = BitField(self, 0x00001800, "LSOF", "LSOF")
-        self.LCK = BitField(self, 0x00002000, "LCK", "LCK")
-        self.RXDM = BitField(self, 0x00004000, "RXDM", "RXDM")
-        self.RXDP = BitField(self, 0x00008000, "RXDP", "RXDP")
-
-class SA_USB_FS_device_DADDR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "DADDR", "USB device address")
-        self.ADD = BitField(self, 0x0000007F, "ADD", "ADD")
-        self.EF = BitField(self, 0x00000080, "EF", "EF")
-
-class SA_USB_FS_device_BTABLE(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "BTABLE", "Buffer table address")
-        self.BTABLE = BitField(self, 0x0000FFF8, "BTABLE", "BTABLE")
-
-class SA_USB_FS_device(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "USB_FS_device")
-        self.EP0R = SA_USB_FS_device_EP0R(self, 0x0)
-        self.EP1R = SA_USB_FS_device_EP1R(self, 0x4)
-        self.EP2R = SA_USB_FS_device_EP2R(self, 0x8)
-        self.EP3R = SA_USB_FS_device_EP3R(self, 0xC)
-        self.EP4R = SA_USB_FS_device_EP4R(self, 0x10)
-        self.EP5R = SA_USB_FS_device_EP5R(self, 0x14)
-        self.EP6R = SA_USB_FS_device_EP6R(self, 0x18)
-        self.EP7R = SA_USB_FS_device_EP7R(self, 0x1C)
-        self.CNTR = SA_USB_FS_device_CNTR(self, 0x40)
-        self.ISTR = SA_USB_FS_device_ISTR(self, 0x44)
-        self.FNR = SA_USB_FS_device_FNR(self, 0x48)
-        self.DADDR = SA_USB_FS_device_DADDR(self, 0x4C)
-        self.BTABLE = SA_USB_FS_device_BTABLE(self, 0x50)
-        self.EPR = Subscriptor(self, "EP{}R")
-
-USB_FS_device = SA_USB_FS_device(0x40005C00, "USB_FS_device")
-
-class SA_CRS_CR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x4000, "CR", "CRS control register")
-        self.SYNCOKIE = BitField(self, 0x00000001, "SYNCOKIE", "SYNC event OK interrupt enable")
-        self.SYNCWARNIE = BitField(self, 0x00000002, "SYNCWARNIE", "SYNC warning interrupt enable")
-        self.ERRIE = BitField(self, 0x00000004, "ERRIE", "Synchronization or trimming error interrupt enable")
-        self.ESYNCIE = BitField(self, 0x00000008, "ESYNCIE", "Expected SYNC interrupt enable")
-        self.CEN = BitField(self, 0x00000020, "CEN", "Frequency error counter enable This bit enables the oscillator clock for the frequency error counter. When this bit is set, the CRS_CFGR register is write-protected and cannot be modified.")
-        self.AUTOTRIMEN = BitField(self, 0x00000040, "AUTOTRIMEN", "Automatic trimming enable This bit enables the automatic hardware adjustment of TRIM bits according to the measured frequency error between two SYNC events. If this bit is set, the TRIM bits are read-only. The TRIM value can be adjusted by hardware by one or two steps at a time, depending on the measured frequency error value. Refer to Section7.3.4: Frequency error evaluation and automatic trimming for more details.")
-        self.SWSYNC = BitField(self, 0x00000080, "SWSYNC", "Generate software SYNC event This bit is set by software in order to generate a software SYNC event. It is automatically cleared by hardware.")
-        self.TRIM = BitField(self, 0x00007F00, "TRIM", "HSI48 oscillator smooth trimming These bits provide a user-programmable trimming value to the HSI48 oscillator. They can be programmed to adjust to variations in voltage and temperature that influence the frequency of the HSI48. The default value is 32, which corresponds to the middle of the trimming interval. The trimming step is around 67 kHz between two consecutive TRIM steps. A higher TRIM value corresponds to a higher output frequency. When the AUTOTRIMEN bit is set, this field is controlled by hardware and is read-only.")
-
-class SA_CRS_CFGR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x2022BB7F, "CFGR", "This register can be written only when the frequency error counter is disabled (CEN bit is cleared in CRS_CR). When the counter is enabled, this register is write-protected.")
-        self.RELOAD = BitField(self, 0x0000FFFF, "RELOAD", "Counter reload value RELOAD is the value to be loaded in the frequency error counter with each SYNC event. Refer to Section7.3.3: Frequency error measurement for more details about counter behavior.")
-        self.FELIM = BitField(self, 0x00FF0000, "FELIM", "Frequency error limit FELIM contains the value to be used to evaluate the captured frequency error value latched in the FECAP[15:0] bits of the CRS_ISR register. Refer to Section7.3.4: Frequency error evaluation and automatic trimming for more details about FECAP evaluation.")
-        self.SYNCDIV = BitField(self, 0x07000000, "SYNCDIV", "SYNC divider These bits are set and cleared by software to control the division factor of the SYNC signal.")
-        self.SYNCSRC = BitField(self, 0x30000000, "SYNCSRC", "SYNC signal source selection These bits are set and cleared by software to select the SYNC signal source. Note: When using USB LPM (Link Power Management) and the device is in Sleep mode, the periodic USB SOF will not be generated by the host. No SYNC signal will therefore be provided to the CRS to calibrate the HSI48 on the run. To guarantee the required clock precision after waking up from Sleep mode, the LSE or reference clock on the GPIOs should be used as SYNC signal.")
-        self.SYNCPOL = BitField(self, 0x80000000, "SYNCPOL", "SYNC polarity selection This bit is set and cleared by software to select the input polarity for the SYNC signal source.")
-
-class SA_CRS_ISR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ISR", "CRS interrupt and status register")
-        self.SYNCOKF = BitField(self, 0x00000001, "SYNCOKF", "SYNC event OK flag This flag is set by hardware when the measured frequency error is smaller than FELIM * 3. This means that either no adjustment of the TRIM value is needed or that an adjustment by one trimming step is enough to compensate the frequency error. An interrupt is generated if the SYNCOKIE bit is set in the CRS_CR register. It is cleared by software by setting the SYNCOKC bit in the CRS_ICR register.")
-        self.SYNCWARNF = BitField(self, 0x00000002, "SYNCWARNF", "SYNC warning flag This flag is set by hardware when the measured frequency error is greater than or equal to FELIM * 3, but smaller than FELIM * 128. This means that to compensate the frequency error, the TRIM value must be adjusted by two steps or more. An interrupt is generated if the SYNCWARNIE bit is set in the CRS_CR register. It is cleared by software by setting the SYNCWARNC bit in the CRS_ICR register.")
-        self.ERRF = BitField(self, 0x00000004, "ERRF", "Error flag This flag is set by hardware in case of any synchronization or trimming error. It is the logical OR of the TRIMOVF, SYNCMISS and SYNCERR bits. An interrupt is generated if the ERRIE bit is set in the CRS_CR register. It is cleared by software in reaction to setting the ERRC bit in the CRS_ICR register, which clears the TRIMOVF, SYNCMISS and SYNCERR bits.")
-        self.ESYNCF = BitField(self, 0x00000008, "ESYNCF", "Expected SYNC flag This flag is set by hardware when the frequency error counter reached a zero value. An interrupt is generated if the ESYNCIE bit is set in the CRS_CR register. It is cleared by software by setting the ESYNCC bit in the CRS_ICR register.")
-        self.SYNCERR = BitField(self, 0x00000100, "SYNCERR", "SYNC error This flag is set by hardware when the SYNC pulse arrives before the ESYNC event and the measured frequency error is greater than or equal to FELIM * 128. This means that the frequency error is too big (internal frequency too low) to be compensated by adjusting the TRIM value, and that some other action should be taken. An interrupt is generated if the ERRIE bit is set in the CRS_CR register. It is cleared by software by setting the ERRC bit in the CRS_ICR register.")
-        self.SYNCMISS = BitField(self, 0x00000200, "SYNCMISS", "SYNC missed This flag is set by hardware when the frequency error counter reached value FELIM * 128 and no SYNC was detected, meaning either that a SYNC pulse was missed or that the frequency error is too big (internal frequency too high) to be compensated by adjusting the TRIM value, and that some other action should be taken. At this point, the frequency error counter is stopped (waiting for a next SYNC) and an interrupt is generated if the ERRIE bit is set in the CRS_CR register. It is cleared by software by setting the ERRC bit in the CRS_ICR register.")
-        self.TRIMOVF = BitField(self, 0x00000400, "TRIMOVF", "Trimming overflow or underflow This flag is set by hardware when the automatic trimming tries to over- or under-flow the TRIM value. An interrupt is generated if the ERRIE bit is set in the CRS_CR register. It is cleared by software by setting the ERRC bit in the CRS_ICR register.")
-        self.FEDIR = BitField(self, 0x00008000, "FEDIR", "Frequency error direction FEDIR is the counting direction of the frequency error counter latched in the time of the last SYNC event. It shows whether the actual frequency is below or above the target.")
-        self.FECAP = BitField(self, 0xFFFF0000, "FECAP", "Frequency error capture FECAP is the frequency error counter value latched in the time ofthe last SYNC event. Refer to Section7.3.4: Frequency error evaluation and automatic trimming for more details about FECAP usage.")
-
-class SA_CRS_ICR(RegisterBase):
-    
-    def __init__(self, peripheral, offset):
-        super().__init__(peripheral, offset, 0x0, "ICR", "CRS interrupt flag clear register")
-        self.SYNCOKC = BitField(self, 0x00000001, "SYNCOKC", "SYNC event OK clear flag Writing 1 to this bit clears the SYNCOKF flag in the CRS_ISR register.")
-        self.SYNCWARNC = BitField(self, 0x00000002, "SYNCWARNC", "SYNC warning clear flag Writing 1 to this bit clears the SYNCWARNF flag in the CRS_ISR register.")
-        self.ERRC = BitField(self, 0x00000004, "ERRC", "Error clear flag Writing 1 to this bit clears TRIMOVF, SYNCMISS and SYNCERR bits and consequently also the ERRF flag in the CRS_ISR register.")
-        self.ESYNCC = BitField(self, 0x00000008, "ESYNCC", "Expected SYNC clear flag Writing 1 to this bit clears the ESYNCF flag in the CRS_ISR register.")
-
-class SA_CRS(PeripheralBase):
-
-    def __init__(self, base, name):
-        super().__init__(base, name, "CRS")
-        self.CR = SA_CRS_CR(self, 0x0)
-        self.CFGR = SA_CRS_CFGR(self, 0x4)
-        self.ISR = SA_CRS_ISR(self, 0x8)
-        self.ICR = SA_CRS_ICR(self, 0xC)
-
-CRS = SA_CRS(0x40002000, "CRS")
+from seracc import BitField, RegisterBase, PeripheralBase, Subscriptor, RegisterDB, lazy_module
+from seracc import (logging, wait_until_equal, batch, read_many, transaction, find, search_index,
+                    set_access, ACCESS_READ_ONLY, ACCESS_WRITE_ONLY, ACCESS_W1C, ACCESS_W0C,
+                    ACCESS_READ_SIDE, cache_policy, invalidate_shadow, watch, mem_read, mem_write,
+                    target_memory, Sampler, serial_reliable)
+from array import array as _array
+
+_strings = (
+    "DR",
+    "Data register bits",
+    "IDR",
+    "General-purpose 8-bit data register bits",
+    "REV_OUT",
+    "Reverse output data",
+    "REV_IN",
+    "Reverse input data",
+    "POLYSIZE",
+    "Polynomial size",
+    "RESET",
+    "RESET bit",
+    "CRC_INIT",
+    "Programmable initial CRC value",
+    "POL",
+    "Programmable polynomial",
+    "Data register",
+    "Independent data register",
+    "CR",
+    "Control register",
+    "INIT",
+    "Initial CRC value",
+    "polynomial",
+    "CRC",
+    "Cyclic redundancy check calculation unit",
+    "KEY",
+    "Key value (write only, read 0x0000)",
+    "PR",
+    "Prescaler divider",
+    "RL",
+    "Watchdog counter reload value",
+    "WVU",
+    "Watchdog counter window value update",
+    "RVU",
+    "Watchdog counter reload value update",
+    "PVU",
+    "Watchdog prescaler value update",
+    "WIN",
+    "Watchdog counter window value",
+    "KR",
+    "Key register",
+    "Prescaler register",
+    "RLR",
+    "Reload register",
+    "SR",
+    "Status register",
+    "WINR",
+    "Window register",
+    "IWDG",
+    "WinWATCHDOG",
+    "WDGA",
+    "Activation bit",
+    "T",
+    "7-bit counter (MSB to LSB)",
+    "WDGTB",
+    "Timer base",
+    "EWI",
+    "Early wakeup interrupt",
+    "W",
+    "7-bit window value",
+    "EWIF",
+    "Early wakeup interrupt flag",
+    "CFR",
+    "Configuration register",
+    "WWDG",
+    "System window watchdog",
+    "PE",
+    "Peripheral enable",
+    "TXIE",
+    "TX Interrupt enable",
+    "RXIE",
+    "RX Interrupt enable",
+    "ADDRIE",
+    "Address match interrupt enable (slave only)",
+    "NACKIE",
+    "Not acknowledge received interrupt enable",
+    "STOPIE",
+    "STOP detection Interrupt enable",
+    "TCIE",
+    "Transfer Complete interrupt enable",
+    "ERRIE",
+    "Error interrupts enable",
+    "DNF",
+    "Digital noise filter",
+    "ANFOFF",
+    "Analog noise filter OFF",
+    "TXDMAEN",
+    "DMA transmission requests enable",
+    "RXDMAEN",
+    "DMA reception requests enable",
+    "SBC",
+    "Slave byte control",
+    "NOSTRETCH",
+    "Clock stretching disable",
+    "WUPEN",
+    "Wakeup from STOP enable",
+    "GCEN",
+    "General call enable",
+    "SMBHEN",
+    "SMBus Host address enable",
+    "SMBDEN",
+    "SMBus Device Default address enable",
+    "ALERTEN",
+    "SMBUS alert enable",
+    "PECEN",
+    "PEC enable",
+    "PECBYTE",
+    "Packet error checking byte",
+    "AUTOEND",
+    "Automatic end mode (master mode)",
+    "RELOAD",
+    "NBYTES reload mode",
+    "NBYTES",
+    "Number of bytes",
+    "NACK",
+    "NACK generation (slave mode)",
+    "STOP",
+    "Stop generation (master mode)",
+    "START",
+    "Start generation",
+    "HEAD10R",
+    "10-bit address header only read direction (master receiver mode)",
+    "ADD10",
+    "10-bit addressing mode (master mode)",
+    "RD_WRN",
+    "Transfer direction (master mode)",
+    "SADD",
+    "Slave address bit (master mode)",
+    "OA1",
+    "Interface address",
+    "OA1MODE",
+    "Own Address 1 10-bit mode",
+    "OA1EN",
+    "Own Address 1 enable",
+    "OA2",
+    "OA2MSK",
+    "Own Address 2 masks",
+    "OA2EN",
+    "Own Address 2 enable",
+    "SCLL",
+    "SCL low period (master mode)",
+    "SCLH",
+    "SCL high period (master mode)",
+    "SDADEL",
+    "Data hold time",
+    "SCLDEL",
+    "Data setup time",
+    "PRESC",
+    "Timing prescaler",
+    "TIMEOUTA",
+    "Bus timeout A",
+    "TIDLE",
+    "Idle clock timeout detection",
+    "TIMOUTEN",
+    "Clock timeout enable",
+    "TIMEOUTB",
+    "Bus timeout B",
+    "TEXTEN",
+    "Extended clock timeout enable",
+    "ADDCODE",
+    "Address match code (Slave mode)",
+    "DIR",
+    "Transfer direction (Slave mode)",
+    "BUSY",
+    "Bus busy",
+    "ALERT",
+    "SMBus alert",
+    "TIMEOUT",
+    "Timeout or t_low detection flag",
+    "PECERR",
+    "PEC Error in reception",
+    "OVR",
+    "Overrun/Underrun (slave mode)",
+    "ARLO",
+    "Arbitration lost",
+    "BERR",
+    "Bus error",
+    "TCR",
+    "Transfer Complete Reload",
+    "TC",
+    "Transfer Complete (master mode)",
+    "STOPF",
+    "Stop detection flag",
+    "NACKF",
+    "Not acknowledge received flag",
+    "ADDR",
+    "Address matched (slave mode)",
+    "RXNE",
+    "Receive data register not empty (receivers)",
+    "TXIS",
+    "Transmit interrupt status (transmitters)",
+    "TXE",
+    "Transmit data register empty (transmitters)",
+    "ALERTCF",
+    "Alert flag clear",
+    "TIMOUTCF",
+    "Timeout detection flag clear",
+    "PECCF",
+    "PEC Error flag clear",
+    "OVRCF",
+    "Overrun/Underrun flag clear",
+    "ARLOCF",
+    "Arbitration lost flag clear",
+    "BERRCF",
+    "Bus error flag clear",
+    "STOPCF",
+    "Stop detection flag clear",
+    "NACKCF",
+    "Not Acknowledge flag clear",
+    "ADDRCF",
+    "Address Matched flag clear",
+    "PEC",
+    "Packet error checking register",
+    "RXDATA",
+    "8-bit receive data",
+    "TXDATA",
+    "8-bit transmit data",
+    "CR1",
+    "Control register 1",
+    "CR2",
+    "Control register 2",
+    "OAR1",
+    "Own address register 1",
+    "OAR2",
+    "Own address register 2",
+    "TIMINGR",
+    "Timing register",
+    "TIMEOUTR",
+    "Status register 1",
+    "ISR",
+    "Interrupt and Status register",
+    "ICR",
+    "Interrupt clear register",
+    "PECR",
+    "PEC register",
+    "RXDR",
+    "Receive data register",
+    "TXDR",
+    "Transmit data register",
+    "OAR",
+    "OAR{}",
+    "I2C1",
+    "Inter-integrated circuit",
+    "I2C2",
+    "I2C3",
+    "LATENCY",
+    "Latency",
+    "PRFTEN",
+    "Prefetch enable",
+    "ICEN",
+    "Instruction cache enable",
+    "DCEN",
+    "Data cache enable",
+    "ICRST",
+    "Instruction cache reset",
+    "DCRST",
+    "Data cache reset",
+    "RUN_PD",
+    "Flash Power-down mode during Low-power run mode",
+    "SLEEP_PD",
+    "Flash Power-down mode during Low-power sleep mode",
+    "DBG_SWEN",
+    "Debug software enable",
+    "PDKEYR",
+    "RUN_PD in FLASH_ACR key",
+    "KEYR",
+    "OPTKEYR",
+    "Option byte key",
+    "EOP",
+    "End of operation",
+    "OPERR",
+    "Operation error",
+    "PROGERR",
+    "Programming error",
+    "WRPERR",
+    "Write protected error",
+    "PGAERR",
+    "Programming alignment error",
+    "SIZERR",
+    "Size error",
+    "PGSERR",
+    "Programming sequence error",
+    "MISERR",
+    "Fast programming data miss error",
+    "FASTERR",
+    "Fast programming error",
+    "RDERR",
+    "PCROP read error",
+    "OPTVERR",
+    "Option validity error",
+    "BSY",
+    "Busy",
+    "PG",
+    "Programming",
+    "PER",
+    "Page erase",
+    "MER1",
+    "Bank 1 Mass erase",
+    "PNB",
+    "Page number",
+    "STRT",
+    "Start",
+    "OPTSTRT",
+    "Options modification start",
+    "FSTPG",
+    "Fast programming",
+    "EOPIE",
+    "End of operation interrupt enable",
+    "Error interrupt enable",
+    "RDERRIE",
+    "PCROP read error interrupt enable",
+    "OBL_LAUNCH",
+    "Force the option byte loading",
+    "SEC_PROT1",
+    "OPTLOCK",
+    "Options Lock",
+    "LOCK",
+    "FLASH_CR Lock",
+    "ADDR_ECC",
+    "ECC fail address",
+    "BK_ECC",
+    "SYSF_ECC",
+    "ECCIE",
+    "ECCC2",
+    "ECC correction",
+    "ECCD2",
+    "ECC2 detection",
+    "ECCC",
+    "ECCD",
+    "ECC detection",
+    "RDP",
+    "Read protection level",
+    "BOR_LEV",
+    "BOR reset Level",
+    "nRST_STOP",
+    "nRST_STDBY",
+    "nRST_SHDW",
+    "IDWG_SW",
+    "Independent watchdog selection",
+    "IWDG_STOP",
+    "Independent watchdog counter freeze in Stop mode",
+    "IWDG_STDBY",
+    "Independent watchdog counter freeze in Standby mode",
+    "WWDG_SW",
+    "Window watchdog selection",
+    "nBOOT1",
+    "Boot configuration",
+    "SRAM2_PE",
+    "SRAM2 parity check enable",
+    "SRAM2_RST",
+    "SRAM2 Erase when system reset",
+    "nSWBOOT0",
+    "nBOOT0",
+    "NRST_MODE",
+    "IRHEN",
+    "nBOOT",
+    "nBOOT{}",
+    "PCROP1_STRT",
+    "Bank 1 PCROP area start offset",
+    "PCROP1_END",
+    "Bank 1 PCROP area end offset",
+    "PCROP_RDP",
+    "PCROP area preserved when RDP level decreased",
+    "WRP1A_STRT",
+    "Bank 1 WRP first area start offset",
+    "WRP1A_END",
+    "Bank 1 WRP first area A end offset",
+    "WRP1B_STRT",
+    "Bank 1 WRP second area B end offset",
+    "WRP1B_END",
+    "Bank 1 WRP second area B start offset",
+    "BOOT_LOCK",
+    "SEC_SIZE1",
+    "ACR",
+    "Access control register",
+    "Power down key register",
+    "Flash key register",
+    "Option byte key register",
+    "Flash control register",
+    "ECCR",
+    "Flash ECC register",
+    "OPTR",
+    "Flash option register",
+    "PCROP1SR",
+    "Flash Bank 1 PCROP Start address register",
+    "PCROP1ER",
+    "Flash Bank 1 PCROP End address register",
+    "WRP1AR",
+    "Flash Bank 1 WRP area A address register",
+    "WRP1BR",
+    "Flash Bank 1 WRP area B address register",
+    "SEC1R",
+    "securable area bank1 register",
+    "FLASH",
+    "Flash",
+    "DEV_ID",
+    "Device Identifier",
+    "REV_ID",
+    "Revision Identifier",
+    "DBG_SLEEP",
+    "Debug Sleep Mode",
+    "DBG_STOP",
+    "Debug Stop Mode",
+    "DBG_STANDBY",
+    "Debug Standby Mode",
+    "TRACE_IOEN",
+    "Trace pin assignment control",
+    "TRACE_MODE",
+    "DBG_TIMER2_STOP",
+    "Debug Timer 2 stopped when Core is halted",
+    "DBG_TIM3_STOP",
+    "TIM3 counter stopped when core is halted",
+    "DBG_TIM4_STOP",
+    "TIM4 counter stopped when core is halted",
+    "DBG_TIM5_STOP",
+    "TIM5 counter stopped when core is halted",
+    "DBG_TIMER6_STOP",
+    "Debug Timer 6 stopped when Core is halted",
+    "DBG_TIM7_STOP",
+    "TIM7 counter stopped when core is halted",
+    "DBG_RTC_STOP",
+    "Debug RTC stopped when Core is halted",
+    "DBG_WWDG_STOP",
+    "Debug Window Wachdog stopped when Core is halted",
+    "DBG_IWDG_STOP",
+    "Debug Independent Wachdog stopped when Core is halted",
+    "DBG_I2C1_STOP",
+    "I2C1 SMBUS timeout mode stopped when core is halted",
+    "DBG_I2C2_STOP",
+    "I2C2 SMBUS timeout mode stopped when core is halted",
+    "DBG_I2C3_STOP",
+    "I2C3 SMBUS timeout mode stopped when core is halted",
+    "DBG_LPTIMER_STOP",
+    "LPTIM1 counter stopped when core is halted",
+    "DBG_I2C_STOP",
+    "DBG_I2C{}_STOP",
+    "DBG_TIM_STOP",
+    "DBG_TIM{}_STOP",
+    "DBG_I2C4_STOP",
+    "DBG_TIM1_STOP",
+    "TIM1 counter stopped when core is halted",
+    "DBG_TIM8_STOP",
+    "TIM8 counter stopped when core is halted",
+    "DBG_TIM15_STOP",
+    "TIM15 counter stopped when core is halted",
+    "DBG_TIM16_STOP",
+    "TIM16 counter stopped when core is halted",
+    "DBG_TIM17_STOP",
+    "TIM17 counter stopped when core is halted",
+    "DBG_TIM20_STOP",
+    "TIM20counter stopped when core is halted",
+    "DBG_HRTIM0_STOP",
+    "DBG_HRTIM1_STOP",
+    "DBG_HRTIM2_STOP",
+    "DBG_HRTIM3_STOP",
+    "DBG_HRTIM_STOP",
+    "DBG_HRTIM{}_STOP",
+    "IDCODE",
+    "MCU Device ID Code Register",
+    "Debug MCU Configuration Register",
+    "APB1L_FZ",
+    "APB Low Freeze Register 1",
+    "APB1H_FZ",
+    "APB Low Freeze Register 2",
+    "APB2_FZ",
+    "APB High Freeze Register",
+    "DBGMCU",
+    "Debug support",
+    "HSION",
+    "HSI16 clock enable. Set and cleared by software. Cleared by hardware to stop the HSI16 oscillator when entering Stop, Standby or Shutdown mode. Set by hardware to force the HSI16 oscillator ON when STOPWUCK=1 or HSIASFS = 1 when leaving Stop modes, or in case of failure of the HSE crystal oscillator. This bit is set by hardware if the HSI16 is used directly or indirectly as system clock.",
+    "HSIKERON",
+    "HSI16 always enable for peripheral kernels.. Set and cleared by software to force HSI16 ON even in Stop modes. The HSI16 can only feed USARTs and I<sup>2</sup>Cs peripherals configured with HSI16 as kernel clock. Keeping the HSI16 ON in Stop mode allows to avoid slowing down the communication speed because of the HSI16 startup time. This bit has no effect on HSION value.",
+    "HSIRDY",
+    "HSI16 clock ready flag. Set by hardware to indicate that HSI16 oscillator is stable. This bit is set only when HSI16 is enabled by software by setting HSION. Note: Once the HSION bit is cleared, HSIRDY goes low after 6 HSI16 clock cycles.",
+    "HSEON",
+    "HSE clock enable. Set and cleared by software. Cleared by hardware to stop the HSE oscillator when entering Stop, Standby or Shutdown mode. This bit cannot be reset if the HSE oscillator is used directly or indirectly as the system clock.",
+    "HSERDY",
+    "HSE clock ready flag. Set by hardware to indicate that the HSE oscillator is stable. Note: Once the HSEON bit is cleared, HSERDY goes low after 6 HSE clock cycles.",
+    "HSEBYP",
+    "HSE crystal oscillator bypass. Set and cleared by software to bypass the oscillator with an external clock. The external clock must be enabled with the HSEON bit set, to be used by the device. The HSEBYP bit can be written only if the HSE oscillator is disabled.",
+    "CSSON",
+    "Clock security system enable. Set by software to enable the clock security system. When CSSON is set, the clock detector is enabled by hardware when the HSE oscillator is ready, and disabled by hardware if a HSE clock failure is detected. This bit is set only and is cleared by reset.",
+    "PLLON",
+    "Main PLL enable. Set and cleared by software to enable the main PLL. Cleared by hardware when entering Stop, Standby or Shutdown mode. This bit cannot be reset if the PLL clock is used as the system clock.",
+    "PLLRDY",
+    "Main PLL clock ready flag. Set by hardware to indicate that the main PLL is locked.",
+    "HSICAL",
+    "HSI16 clock calibration. These bits are initialized at startup with the factory-programmed HSI16 calibration trim value. When HSITRIM is written, HSICAL is updated with the sum of HSITRIM and the factory trim value.",
+    "HSITRIM",
+    "HSI16 clock trimming. These bits provide an additional user-programmable trimming value that is added to the HSICAL[7:0] bits. It can be programmed to adjust to variations in voltage and temperature that influence the frequency of the HSI16. The default value is 16, which, when added to the HSICAL value, should trim the HSI16 to 16 MHz 1 %.",
+    "SW",
+    "System clock switch. Set and cleared by software to select system clock source (SYSCLK). Configured by hardware to force HSI16 oscillator selection when exiting stop and standby modes or in case of failure of the HSE oscillator.",
+    "SWS",
+    "System clock switch status. Set and cleared by hardware to indicate which clock source is used as system clock.",
+    "HPRE",
+    "AHB prescaler. Set and cleared by software to control the division factor of the AHB clock. Note: Depending on the device voltage range, the software has to set correctly these bits to ensure that the system frequency does not exceed the maximum allowed frequency (for more details please refer to Section 6.1.5: Dynamic voltage scaling management). After a write operation to these bits and before decreasing the voltage range, this register must be read to be sure that the new value has been taken into account. 0xxx: SYSCLK not divided",
+    "PPRE1",
+    "APB1 prescaler. Set and cleared by software to control the division factor of the APB1 clock (PCLK1). 0xx: HCLK not divided",
+    "PPRE2",
+    "APB2 prescaler. Set and cleared by software to control the division factor of the APB2 clock (PCLK2). 0xx: HCLK not divided",
+    "MCOSEL",
+    "Microcontroller clock output . Set and cleared by software. Others: Reserved Note: This clock output may have some truncated cycles at startup or during MCO clock source switching.",
+    "MCOPRE",
+    "Microcontroller clock output prescaler. These bits are set and cleared by software. It is highly recommended to change this prescaler before MCO output is enabled. Others: not allowed",
+    "PPRE",
+    "PPRE{}",
+    "PLLSRC",
+    "Main PLL entry clock source. Set and cleared by software to select PLL clock source. These bits can be written only when PLL is disabled. In order to save power, when no PLL is used, the value of PLLSRC should be 00.",
+    "PLLM",
+    "Division factor for the main PLL input clock. Set and cleared by software to divide the PLL input clock before the VCO. These bits can be written only when all PLLs are disabled. VCO input frequency = PLL input clock frequency / PLLM with 1 <= PLLM <= 16 ... Note: The software has to set these bits correctly to ensure that the VCO input frequency is within the range defined in the device datasheet.",
+    "PLLN",
+    "Main PLL multiplication factor for VCO. Set and cleared by software to control the multiplication factor of the VCO. These bits can be written only when the PLL is disabled. VCO output frequency = VCO input frequency x PLLN with 8 =< PLLN =< 127 ... ... Note: The software has to set correctly these bits to assure that the VCO output frequency is within the range defined in the device datasheet.",
+    "PLLPEN",
+    "Main PLL PLL P clock output enable. Set and reset by software to enable the PLL P clock output of the PLL. In order to save power, when the PLL P clock output of the PLL is not used, the value of PLLPEN should be 0.",
+    "PLLP",
+    "Main PLL division factor for PLL P clock.. Set and cleared by software to control the frequency of the main PLL output clock PLL P clock. These bits can be written only if PLL is disabled. When the PLLPDIV[4:0] is set to 00000PLL P output clock frequency = VCO frequency / PLLP with PLLP =7, or 17 Note: The software has to set these bits correctly not to exceed 170 MHz on this domain.",
+    "PLLQEN",
+    "Main PLL Q clock output enable. Set and reset by software to enable the PLL Q clock output of the PLL. In order to save power, when the PLL Q clock output of the PLL is not used, the value of PLLQEN should be 0.",
+    "PLLQ",
+    "Main PLL division factor for PLL Q clock.. Set and cleared by software to control the frequency of the main PLL output clock PLL Q clock. This output can be selected for USB, RNG, SAI (48 MHz clock). These bits can be written only if PLL is disabled. PLL Q output clock frequency = VCO frequency / PLLQ with PLLQ = 2, 4, 6, or 8 Note: The software has to set these bits correctly not to exceed 170 MHz on this domain.",
+    "PLLREN",
+    "PLL R clock output enable. Set and reset by software to enable the PLL R clock output of the PLL (used as system clock). This bit cannot be written when PLL R clock output of the PLL is used as System Clock. In order to save power, when the PLL R clock output of the PLL is not used, the value of PLLREN should be 0.",
+    "PLLR",
+    "Main PLL division factor for PLL R clock (system clock). Set and cleared by software to control the frequency of the main PLL output clock PLLCLK. This output can be selected as system clock. These bits can be written only if PLL is disabled. PLL R output clock frequency = VCO frequency / PLLR with PLLR = 2, 4, 6, or 8 Note: The software has to set these bits correctly not to exceed 170 MHz on this domain.",
+    "PLLPDIV",
+    "Main PLLP division factor. Set and cleared by software to control the PLL P frequency. PLL P output clock frequency = VCO frequency / PLLPDIV. ....",
+    "LSIRDYIE",
+    "LSI ready interrupt enable. Set and cleared by software to enable/disable interrupt caused by the LSI oscillator stabilization.",
+    "LSERDYIE",
+    "LSE ready interrupt enable. Set and cleared by software to enable/disable interrupt caused by the LSE oscillator stabilization.",
+    "HSIRDYIE",
+    "HSI16 ready interrupt enable. Set and cleared by software to enable/disable interrupt caused by the HSI16 oscillator stabilization.",
+    "HSERDYIE",
+    "HSE ready interrupt enable. Set and cleared by software to enable/disable interrupt caused by the HSE oscillator stabilization.",
+    "PLLRDYIE",
+    "PLL ready interrupt enable. Set and cleared by software to enable/disable interrupt caused by PLL lock.",
+    "LSECSSIE",
+    "LSE clock security system interrupt enable. Set and cleared by software to enable/disable interrupt caused by the clock security system on LSE.",
+    "HSI48RDYIE",
+    "HSI48 ready interrupt enable . Set and cleared by software to enable/disable interrupt caused by the internal HSI48 oscillator.",
+    "LSIRDYF",
+    "LSI ready interrupt flag. Set by hardware when the LSI clock becomes stable and LSIRDYDIE is set. Cleared by software setting the LSIRDYC bit.",
+    "LSERDYF",
+    "LSE ready interrupt flag. Set by hardware when the LSE clock becomes stable and LSERDYDIE is set. Cleared by software setting the LSERDYC bit.",
+    "HSIRDYF",
+    "HSI16 ready interrupt flag. Set by hardware when the HSI16 clock becomes stable and HSIRDYDIE is set in a response to setting the HSION (refer to Clock control register (RCC_CR)). When HSION is not set but the HSI16 oscillator is enabled by the peripheral through a clock request, this bit is not set and no interrupt is generated. Cleared by software setting the HSIRDYC bit.",
+    "HSERDYF",
+    "HSE ready interrupt flag. Set by hardware when the HSE clock becomes stable and HSERDYDIE is set. Cleared by software setting the HSERDYC bit.",
+    "PLLRDYF",
+    "PLL ready interrupt flag. Set by hardware when the PLL locks and PLLRDYDIE is set. Cleared by software setting the PLLRDYC bit.",
+    "CSSF",
+    "Clock security system interrupt flag. Set by hardware when a failure is detected in the HSE oscillator. Cleared by software setting the CSSC bit.",
+    "LSECSSF",
+    "LSE Clock security system interrupt flag. Set by hardware when a failure is detected in the LSE oscillator. Cleared by software setting the LSECSSC bit.",
+    "HSI48RDYF",
+    "HSI48 ready interrupt flag . Set by hardware when the HSI48 clock becomes stable and HSI48RDYIE is set in a response to setting the HSI48ON (refer to Clock recovery RC register (RCC_CRRCR)). Cleared by software setting the HSI48RDYC bit.",
+    "LSIRDYC",
+    "LSI ready interrupt clear. This bit is set by software to clear the LSIRDYF flag.",
+    "LSERDYC",
+    "LSE ready interrupt clear. This bit is set by software to clear the LSERDYF flag.",
+    "HSIRDYC",
+    "HSI16 ready interrupt clear. This bit is set software to clear the HSIRDYF flag.",
+    "HSERDYC",
+    "HSE ready interrupt clear. This bit is set by software to clear the HSERDYF flag.",
+    "PLLRDYC",
+    "PLL ready interrupt clear. This bit is set by software to clear the PLLRDYF flag.",
+    "CSSC",
+    "Clock security system interrupt clear. This bit is set by software to clear the CSSF flag.",
+    "LSECSSC",
+    "LSE Clock security system interrupt clear. This bit is set by software to clear the LSECSSF flag.",
+    "HSI48RDYC",
+    "HSI48 oscillator ready interrupt clear . This bit is set by software to clear the HSI48RDYF flag.",
+    "DMA1RST",
+    "DMA1 reset. Set and cleared by software.",
+    "DMA2RST",
+    "DMA2 reset. Set and cleared by software.",
+    "DMAMUX1RST",
+    "Set and cleared by software.",
+    "CORDICRST",
+    "Set and cleared by software",
+    "FMACRST",
+    "FLASHRST",
+    "Flash memory interface reset. Set and cleared by software. This bit can be activated only when the Flash memory is in power down mode.",
+    "CRCRST",
+    "CRC reset. Set and cleared by software.",
+    "DMARST",
+    "DMA{}RST",
+    "GPIOARST",
+    "IO port A reset. Set and cleared by software.",
+    "GPIOBRST",
+    "IO port B reset. Set and cleared by software.",
+    "GPIOCRST",
+    "IO port C reset. Set and cleared by software.",
+    "GPIODRST",
+    "IO port D reset. Set and cleared by software.",
+    "GPIOERST",
+    "IO port E reset. Set and cleared by software.",
+    "GPIOFRST",
+    "IO port F reset. Set and cleared by software.",
+    "GPIOGRST",
+    "IO port G reset. Set and cleared by software.",
+    "ADC12RST",
+    "ADC12 reset. Set and cleared by software.",
+    "ADC345RST",
+    "ADC345 reset. Set and cleared by software.",
+    "DAC1RST",
+    "DAC1 reset. Set and cleared by software.",
+    "DAC2RST",
+    "DAC2 reset. Set and cleared by software.",
+    "DAC3RST",
+    "DAC3 reset. Set and cleared by software.",
+    "DAC4RST",
+    "DAC4 reset. Set and cleared by software.",
+    "AESRST",
+    "AESRST reset . Set and cleared by software.",
+    "RNGRST",
+    "RNG reset. Set and cleared by software.",
+    "DACRST",
+    "DAC{}RST",
+    "FMCRST",
+    "Flexible static memory controller reset. Set and cleared by software.",
+    "QSPIRST",
+    "QUADSPI reset. Set and cleared by software.",
+    "TIM2RST",
+    "TIM2 timer reset. Set and cleared by software.",
+    "TIM3RST",
+    "TIM3 timer reset. Set and cleared by software.",
+    "TIM4RST",
+    "TIM5RST",
+    "TIM5 timer reset. Set and cleared by software.",
+    "TIM6RST",
+    "TIM6 timer reset. Set and cleared by software.",
+    "TIM7RST",
+    "TIM7 timer reset. Set and cleared by software.",
+    "CRSRST",
+    "CRS reset. Set and cleared by software.",
+    "SPI2RST",
+    "SPI2 reset. Set and cleared by software.",
+    "SPI3RST",
+    "SPI3 reset. Set and cleared by software.",
+    "USART2RST",
+    "USART2 reset. Set and cleared by software.",
+    "USART3RST",
+    "USART3 reset. Set and cleared by software.",
+    "UART4RST",
+    "UART4 reset. Set and cleared by software.",
+    "UART5RST",
+    "UART5 reset. Set and cleared by software.",
+    "I2C1RST",
+    "I2C1 reset. Set and cleared by software.",
+    "I2C2RST",
+    "I2C2 reset. Set and cleared by software.",
+    "USBRST",
+    "USB device reset. Set and reset by software.",
+    "FDCANRST",
+    "FDCAN reset. Set and reset by software.",
+    "PWRRST",
+    "Power interface reset. Set and cleared by software.",
+    "I2C3RST",
+    "I2C3 reset. Set and cleared by software.",
+    "LPTIM1RST",
+    "Low Power Timer 1 reset. Set and cleared by software.",
+    "TIMRST",
+    "TIM{}RST",
+    "UARTRST",
+    "UART{}RST",
+    "I2CRST",
+    "I2C{}RST",
+    "SPIRST",
+    "SPI{}RST",
+    "USARTRST",
+    "USART{}RST",
+    "LPUART1RST",
+    "Low-power UART 1 reset. Set and cleared by software.",
+    "I2C4RST",
+    "I2C4 reset. Set and cleared by software",
+    "UCPD1RST",
+    "UCPD1 reset. Set and cleared by software.",
+    "SYSCFGRST",
+    "SYSCFG + COMP + OPAMP + VREFBUF reset",
+    "TIM1RST",
+    "TIM1 timer reset. Set and cleared by software.",
+    "SPI1RST",
+    "SPI1 reset. Set and cleared by software.",
+    "TIM8RST",
+    "TIM8 timer reset. Set and cleared by software.",
+    "USART1RST",
+    "USART1 reset. Set and cleared by software.",
+    "SPI4RST",
+    "SPI4 reset. Set and cleared by software.",
+    "TIM15RST",
+    "TIM15 timer reset. Set and cleared by software.",
+    "TIM16RST",
+    "TIM16 timer reset. Set and cleared by software.",
+    "TIM17RST",
+    "TIM17 timer reset. Set and cleared by software.",
+    "TIM20RST",
+    "TIM20 reset. Set and cleared by software.",
+    "SAI1RST",
+    "Serial audio interface 1 (SAI1) reset. Set and cleared by software.",
+    "HRTIM1RST",
+    "HRTIM1 reset. Set and cleared by software.",
+    "DMA1EN",
+    "DMA1 clock enable. Set and cleared by software.",
+    "DMA2EN",
+    "DMA2 clock enable. Set and cleared by software.",
+    "DMAMUX1EN",
+    "DMAMUX1 clock enable. Set and reset by software.",
+    "CORDICEN",
+    "CORDIC clock enable. Set and reset by software.",
+    "FMACEN",
+    "FMAC enable. Set and reset by software.",
+    "FLASHEN",
+    "Flash memory interface clock enable. Set and cleared by software. This bit can be disabled only when the Flash is in power down mode.",
+    "CRCEN",
+    "CRC clock enable. Set and cleared by software.",
+    "DMAEN",
+    "DMA{}EN",
+    "GPIOAEN",
+    "IO port A clock enable. Set and cleared by software.",
+    "GPIOBEN",
+    "IO port B clock enable. Set and cleared by software.",
+    "GPIOCEN",
+    "IO port C clock enable. Set and cleared by software.",
+    "GPIODEN",
+    "IO port D clock enable. Set and cleared by software.",
+    "GPIOEEN",
+    "IO port E clock enable. Set and cleared by software.",
+    "GPIOFEN",
+    "IO port F clock enable. Set and cleared by software.",
+    "GPIOGEN",
+    "IO port G clock enable. Set and cleared by software.",
+    "ADC12EN",
+    "ADC12 clock enable. Set and cleared by software.",
+    "ADC345EN",
+    "ADC345 clock enable . Set and cleared by software",
+    "DAC1EN",
+    "DAC1 clock enable. Set and cleared by software.",
+    "DAC2EN",
+    "DAC2 clock enable. Set and cleared by software.",
+    "DAC3EN",
+    "DAC3 clock enable. Set and cleared by software.",
+    "DAC4EN",
+    "DAC4 clock enable. Set and cleared by software.",
+    "AESEN",
+    "AES clock enable. Set and cleared by software.",
+    "RNGEN",
+    "RNG enable. Set and cleared by software.",
+    "DACEN",
+    "DAC{}EN",
+    "FMCEN",
+    "Flexible static memory controller clock enable. Set and cleared by software.",
+    "QSPIEN",
+    "QUADSPI memory interface clock enable. Set and cleared by software.",
+    "TIM2EN",
+    "TIM2 timer clock enable. Set and cleared by software.",
+    "TIM3EN",
+    "TIM3 timer clock enable. Set and cleared by software.",
+    "TIM4EN",
+    "TIM4 timer clock enable. Set and cleared by software.",
+    "TIM5EN",
+    "TIM5 timer clock enable. Set and cleared by software.",
+    "TIM6EN",
+    "TIM6 timer clock enable. Set and cleared by software.",
+    "TIM7EN",
+    "TIM7 timer clock enable. Set and cleared by software.",
+    "CRSEN",
+    "CRS Recovery System clock enable. Set and cleared by software.",
+    "RTCAPBEN",
+    "RTC APB clock enable . Set and cleared by software",
+    "WWDGEN",
+    "Window watchdog clock enable. Set by software to enable the window watchdog clock. Reset by hardware system reset. This bit can also be set by hardware if the WWDG_SW option bit is reset.",
+    "SPI2EN",
+    "SPI2 clock enable. Set and cleared by software.",
+    "SPI3EN",
+    "SPI3 clock enable. Set and cleared by software.",
+    "USART2EN",
+    "USART2 clock enable. Set and cleared by software.",
+    "USART3EN",
+    "USART3 clock enable. Set and cleared by software.",
+    "UART4EN",
+    "UART4 clock enable. Set and cleared by software.",
+    "UART5EN",
+    "UART5 clock enable. Set and cleared by software.",
+    "I2C1EN",
+    "I2C1 clock enable. Set and cleared by software.",
+    "I2C2EN",
+    "I2C2 clock enable. Set and cleared by software.",
+    "USBEN",
+    "USB device clock enable. Set and cleared by software.",
+    "FDCANEN",
+    "FDCAN clock enable. Set and cleared by software.",
+    "PWREN",
+    "Power interface clock enable. Set and cleared by software.",
+    "I2C3EN",
+    "I2C3 clock enable. Set and cleared by software.",
+    "LPTIM1EN",
+    "Low power timer 1 clock enable. Set and cleared by software.",
+    "SPIEN",
+    "SPI{}EN",
+    "UARTEN",
+    "UART{}EN",
+    "TIMEN",
+    "TIM{}EN",
+    "I2CEN",
+    "I2C{}EN",
+    "USARTEN",
+    "USART{}EN",
+    "LPUART1EN",
+    "Low power UART 1 clock enable. Set and cleared by software.",
+    "I2C4EN",
+    "I2C4 clock enable . Set and cleared by software",
+    "UCPD1EN",
+    "UCPD1 clock enable. Set and cleared by software.",
+    "SYSCFGEN",
+    "SYSCFG + COMP + VREFBUF + OPAMP clock enable. Set and cleared by software.",
+    "TIM1EN",
+    "TIM1 timer clock enable. Set and cleared by software.",
+    "SPI1EN",
+    "SPI1 clock enable. Set and cleared by software.",
+    "TIM8EN",
+    "TIM8 timer clock enable. Set and cleared by software.",
+    "USART1EN",
+    "USART1clock enable. Set and cleared by software.",
+    "SPI4EN",
+    "SPI4 clock enable. Set and cleared by software.",
+    "TIM15EN",
+    "TIM15 timer clock enable. Set and cleared by software.",
+    "TIM16EN",
+    "TIM16 timer clock enable. Set and cleared by software.",
+    "TIM17EN",
+    "TIM17 timer clock enable. Set and cleared by software.",
+    "TIM20EN",
+    "TIM20 timer clock enable. Set and cleared by software.",
+    "SAI1EN",
+    "SAI1 clock enable. Set and cleared by software.",
+    "HRTIM1EN",
+    "HRTIM1 clock enable. Set and cleared by software.",
+    "DMA1SMEN",
+    "DMA1 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "DMA2SMEN",
+    "DMA2 clocks enable during Sleep and Stop modes. Set and cleared by software during Sleep mode.",
+    "DMAMUX1SMEN",
+    "DMAMUX1 clock enable during Sleep and Stop modes.. Set and cleared by software.",
+    "CORDICSMEN",
+    "CORDICSM clock enable.. Set and cleared by software.",
+    "FMACSMEN",
+    "FMACSM clock enable.. Set and cleared by software.",
+    "FLASHSMEN",
+    "Flash memory interface clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "SRAM1SMEN",
+    "SRAM1 interface clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "CRCSMEN",
+    "CRC clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "DMASMEN",
+    "DMA{}SMEN",
+    "GPIOASMEN",
+    "IO port A clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "GPIOBSMEN",
+    "IO port B clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "GPIOCSMEN",
+    "IO port C clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "GPIODSMEN",
+    "IO port D clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "GPIOESMEN",
+    "IO port E clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "GPIOFSMEN",
+    "IO port F clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "GPIOGSMEN",
+    "IO port G clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "CCMSRAMSMEN",
+    "CCM SRAM interface clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "SRAM2SMEN",
+    "SRAM2 interface clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "ADC12SMEN",
+    "ADC12 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "ADC345SMEN",
+    "ADC345 clock enable. Set and cleared by software.",
+    "DAC1SMEN",
+    "DAC2SMEN",
+    "DAC3SMEN",
+    "DAC4SMEN",
+    "AESSMEN",
+    "AESM clocks enable. Set and cleared by software.",
+    "DACSMEN",
+    "DAC{}SMEN",
+    "FMCSMEN",
+    "Flexible static memory controller clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "QSPISMEN",
+    "QUADSPI memory interface clock enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM2SMEN",
+    "TIM2 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM3SMEN",
+    "TIM3 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM4SMEN",
+    "TIM4 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM5SMEN",
+    "TIM5 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM6SMEN",
+    "TIM6 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM7SMEN",
+    "TIM7 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "CRSSMEN",
+    "CRS timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "RTCAPBSMEN",
+    "RTC APB clock enable during Sleep and Stop modes. Set and cleared by software",
+    "WWDGSMEN",
+    "Window watchdog clocks enable during Sleep and Stop modes. Set and cleared by software. This bit is forced to 1 by hardware when the hardware WWDG option is activated.",
+    "SPI2SMEN",
+    "SPI2 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "SPI3SMEN",
+    "SPI3 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "USART2SMEN",
+    "USART2 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "USART3SMEN",
+    "USART3 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "UART4SMEN",
+    "UART4 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "UART5SMEN",
+    "UART5 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "I2C1SMEN",
+    "I2C1 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "I2C2SMEN",
+    "I2C2 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "USBSMEN",
+    "USB device clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "FDCANSMEN",
+    "FDCAN clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "PWRSMEN",
+    "Power interface clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "I2C3SMEN",
+    "I2C3 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "LPTIM1SMEN",
+    "Low power timer 1 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "I2CSMEN",
+    "I2C{}SMEN",
+    "TIMSMEN",
+    "TIM{}SMEN",
+    "UARTSMEN",
+    "UART{}SMEN",
+    "SPISMEN",
+    "SPI{}SMEN",
+    "USARTSMEN",
+    "USART{}SMEN",
+    "LPUART1SMEN",
+    "Low power UART 1 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "I2C4SMEN",
+    "I2C4 clocks enable during Sleep and Stop modes . Set and cleared by software",
+    "UCPD1SMEN",
+    "UCPD1 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "SYSCFGSMEN",
+    "SYSCFG + COMP + VREFBUF + OPAMP clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM1SMEN",
+    "TIM1 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "SPI1SMEN",
+    "SPI1 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM8SMEN",
+    "TIM8 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "USART1SMEN",
+    "USART1clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "SPI4SMEN",
+    "SPI4 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM15SMEN",
+    "TIM15 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM16SMEN",
+    "TIM16 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM17SMEN",
+    "TIM17 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "TIM20SMEN",
+    "TIM20 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "SAI1SMEN",
+    "SAI1 clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "HRTIM1SMEN",
+    "HRTIM1 timer clocks enable during Sleep and Stop modes. Set and cleared by software.",
+    "USART1SEL",
+    "USART1 clock source selection. This bit is set and cleared by software to select the USART1 clock source.",
+    "USART2SEL",
+    "USART2 clock source selection. This bit is set and cleared by software to select the USART2 clock source.",
+    "USART3SEL",
+    "USART3 clock source selection. This bit is set and cleared by software to select the USART3 clock source.",
+    "UART4SEL",
+    "UART4 clock source selection. This bit is set and cleared by software to select the UART4 clock source.",
+    "UART5SEL",
+    "UART5 clock source selection. These bits are set and cleared by software to select the UART5 clock source.",
+    "LPUART1SEL",
+    "LPUART1 clock source selection. These bits are set and cleared by software to select the LPUART1 clock source.",
+    "I2C1SEL",
+    "I2C1 clock source selection. These bits are set and cleared by software to select the I2C1 clock source.",
+    "I2C2SEL",
+    "I2C2 clock source selection. These bits are set and cleared by software to select the I2C2 clock source.",
+    "I2C3SEL",
+    "I2C3 clock source selection. These bits are set and cleared by software to select the I2C3 clock source.",
+    "LPTIM1SEL",
+    "Low power timer 1 clock source selection. These bits are set and cleared by software to select the LPTIM1 clock source.",
+    "SAI1SEL",
+    "clock source selection. These bits are set and cleared by software to select the SAI clock source.",
+    "I2S23SEL",
+    "clock source selection. These bits are set and cleared by software to select the I2S23 clock source.",
+    "FDCANSEL",
+    "None",
+    "CLK48SEL",
+    "48 MHz clock source selection. These bits are set and cleared by software to select the 48 MHz clock source used by USB device FS and RNG.",
+    "ADC12SEL",
+    "ADC1/2 clock source selection. These bits are set and cleared by software to select the clock source used by the ADC interface.",
+    "ADC345SEL",
+    "ADC3/4/5 clock source selection. These bits are set and cleared by software to select the clock source used by the ADC345 interface.",
+    "I2CSEL",
+    "I2C{}SEL",
+    "USARTSEL",
+    "USART{}SEL",
+    "UARTSEL",
+    "UART{}SEL",
+    "LSEON",
+    "LSE oscillator enable. Set and cleared by software.",
+    "LSERDY",
+    "LSE oscillator ready. Set and cleared by hardware to indicate when the external 32 kHz oscillator is stable. After the LSEON bit is cleared, LSERDY goes low after 6 external low-speed oscillator clock cycles.",
+    "LSEBYP",
+    "LSE oscillator bypass. Set and cleared by software to bypass oscillator in debug mode. This bit can be written only when the external 32 kHz oscillator is disabled (LSEON=0 and LSERDY=0).",
+    "LSEDRV",
+    "LSE oscillator drive capability. Set by software to modulate the LSE oscillators drive capability. The oscillator is in Xtal mode when it is not in bypass mode.",
+    "LSECSSON",
+    "CSS on LSE enable. Set by software to enable the Clock Security System on LSE (32 kHz oscillator). LSECSSON must be enabled after the LSE oscillator is enabled (LSEON bit enabled) and ready (LSERDY flag set by hardware), and after the RTCSEL bit is selected. Once enabled this bit cannot be disabled, except after a LSE failure detection (LSECSSD =1). In that case the software MUST disable the LSECSSON bit.",
+    "LSECSSD",
+    "CSS on LSE failure Detection. Set by hardware to indicate when a failure has been detected by the Clock Security System on the external 32 kHz oscillator (LSE).",
+    "RTCSEL",
+    "RTC clock source selection. Set by software to select the clock source for the RTC. Once the RTC clock source has been selected, it cannot be changed anymore unless the RTC domain is reset, or unless a failure is detected on LSE (LSECSSD is set). The BDRST bit can be used to reset them.",
+    "RTCEN",
+    "RTC clock enable. Set and cleared by software.",
+    "BDRST",
+    "RTC domain software reset. Set and cleared by software.",
+    "LSCOEN",
+    "Low speed clock output enable. Set and cleared by software.",
+    "LSCOSEL",
+    "Low speed clock output selection. Set and cleared by software.",
+    "LSION",
+    "LSI oscillator enable. Set and cleared by software.",
+    "LSIRDY",
+    "LSI oscillator ready. Set and cleared by hardware to indicate when the LSI oscillator is stable. After the LSION bit is cleared, LSIRDY goes low after 3 LSI oscillator clock cycles. This bit can be set even if LSION = 0 if the LSI is requested by the Clock Security System on LSE, by the Independent Watchdog or by the RTC.",
+    "RMVF",
+    "Remove reset flag. Set by software to clear the reset flags.",
+    "OBLRSTF",
+    "Option byte loader reset flag. Set by hardware when a reset from the Option Byte loading occurs. Cleared by writing to the RMVF bit.",
+    "PINRSTF",
+    "Pin reset flag. Set by hardware when a reset from the NRST pin occurs. Cleared by writing to the RMVF bit.",
+    "BORRSTF",
+    "BOR flag. Set by hardware when a BOR occurs. Cleared by writing to the RMVF bit.",
+    "SFTRSTF",
+    "Software reset flag. Set by hardware when a software reset occurs. Cleared by writing to the RMVF bit.",
+    "IWDGRSTF",
+    "Independent window watchdog reset flag. Set by hardware when an independent watchdog reset domain occurs. Cleared by writing to the RMVF bit.",
+    "WWDGRSTF",
+    "Window watchdog reset flag. Set by hardware when a window watchdog reset occurs. Cleared by writing to the RMVF bit.",
+    "LPWRRSTF",
+    "Low-power reset flag. Set by hardware when a reset occurs due to illegal Stop, Standby or Shutdown mode entry. Cleared by writing to the RMVF bit.",
+    "HSI48ON",
+    "HSI48 clock enable. Set and cleared by software. Cleared by hardware to stop the HSI48 when entering in Stop, Standby or Shutdown modes.",
+    "HSI48RDY",
+    "HSI48 clock ready flag. Set by hardware to indicate that HSI48 oscillator is stable. This bit is set only when HSI48 is enabled by software by setting HSI48ON.",
+    "HSI48CAL",
+    "HSI48 clock calibration. These bits are initialized at startup with the factory-programmed HSI48 calibration trim value. They are ready only.",
+    "I2C4SEL",
+    "I2C4 clock source selection. These bits are set and cleared by software to select the I2C4 clock source.",
+    "QSPISEL",
+    "QUADSPI clock source selection. Set and reset by software.",
+    "Clock control register",
+    "ICSCR",
+    "Internal clock sources calibration register",
+    "CFGR",
+    "Clock configuration register",
+    "PLLCFGR",
+    "PLL configuration register",
+    "CIER",
+    "Clock interrupt enable register",
+    "CIFR",
+    "Clock interrupt flag register",
+    "CICR",
+    "Clock interrupt clear register",
+    "AHB1RSTR",
+    "AHB1 peripheral reset register",
+    "AHB2RSTR",
+    "AHB2 peripheral reset register",
+    "AHB3RSTR",
+    "AHB3 peripheral reset register",
+    "APB1RSTR1",
+    "APB1 peripheral reset register 1",
+    "APB1RSTR2",
+    "APB1 peripheral reset register 2",
+    "APB2RSTR",
+    "APB2 peripheral reset register",
+    "AHB1ENR",
+    "AHB1 peripheral clock enable register",
+    "AHB2ENR",
+    "AHB2 peripheral clock enable register",
+    "AHB3ENR",
+    "AHB3 peripheral clock enable register",
+    "APB1ENR1",
+    "APB1 peripheral clock enable register 1",
+    "APB1ENR2",
+    "APB1 peripheral clock enable register 2",
+    "APB2ENR",
+    "APB2 peripheral clock enable register",
+    "AHB1SMENR",
+    "AHB1 peripheral clocks enable in Sleep and Stop modes register",
+    "AHB2SMENR",
+    "AHB2 peripheral clocks enable in Sleep and Stop modes register",
+    "AHB3SMENR",
+    "AHB3 peripheral clocks enable in Sleep and Stop modes register",
+    "APB1SMENR1",
+    "APB1 peripheral clocks enable in Sleep and Stop modes register 1",
+    "APB1SMENR2",
+    "APB1 peripheral clocks enable in Sleep and Stop modes register 2",
+    "APB2SMENR",
+    "APB2 peripheral clocks enable in Sleep and Stop modes register",
+    "CCIPR",
+    "Peripherals independent clock configuration register",
+    "BDCR",
+    "RTC domain control register",
+    "CSR",
+    "Control/status register",
+    "CRRCR",
+    "Clock recovery RC register",
+    "CCIPR2",
+    "AHBRSTR",
+    "AHB{}RSTR",
+    "APB1RSTR",
+    "APB1RSTR{}",
+    "APB1ENR",
+    "APB1ENR{}",
+    "AHBENR",
+    "AHB{}ENR",
+    "APB1SMENR",
+    "APB1SMENR{}",
+    "AHBSMENR",
+    "AHB{}SMENR",
+    "RCC",
+    "Reset and clock control",
+    "LPMS",
+    "Low-power mode selection. These bits select the low-power mode entered when CPU enters the deepsleep mode. 1xx: Shutdown mode Note: In Standby mode, SRAM2 can be preserved or not, depending on RRS bit configuration in PWR_CR3.",
+    "FPD_STOP",
+    "DBP",
+    "Disable backup domain write protection. In reset state, the RTC and backup registers are protected against parasitic write access. This bit must be set to enable write access to these registers.",
+    "VOS",
+    "Voltage scaling range selection",
+    "LPR",
+    "Low-power run. When this bit is set, the regulator is switched from main mode (MR) to low-power mode (LPR).",
+    "PVDE",
+    "Programmable voltage detector enable. Note: This bit is write-protected when the PVDL bit is set in the SYSCFG_CFGR2 register. The protection can be reset only by a system reset.",
+    "PVDLS",
+    "Programmable voltage detector level selection.. These bits select the PVD falling threshold: Note: These bits are write-protected when the PVDL bit is set in the SYSCFG_CFGR2 register. The protection can be reset only by a system reset.",
+    "PVMEN1",
+    "Peripheral voltage monitoring 3 enable: V<sub>DDA</sub> vs. ADC/COMP min voltage 1.62V",
+    "PVMEN2",
+    "Peripheral voltage monitoring 4 enable: V<sub>DDA</sub> vs. DAC 1MSPS /DAC 15MSPS min voltage.",
+    "PVMEN",
+    "PVMEN{}",
+    "EWUP1",
+    "Enable Wakeup pin WKUP1. When this bit is set, the external wakeup pin WKUP1 is enabled and triggers a wakeup from Standby or Shutdown event when a rising or a falling edge occurs. The active edge is configured via the WP1 bit in the PWR_CR4 register.",
+    "EWUP2",
+    "Enable Wakeup pin WKUP2. When this bit is set, the external wakeup pin WKUP2 is enabled and triggers a wakeup from Standby or Shutdown event when a rising or a falling edge occurs. The active edge is configured via the WP2 bit in the PWR_CR4 register.",
+    "EWUP3",
+    "Enable Wakeup pin WKUP3. When this bit is set, the external wakeup pin WKUP3 is enabled and triggers a wakeup from Standby or Shutdown event when a rising or a falling edge occurs. The active edge is configured via the WP3 bit in the PWR_CR4 register.",
+    "EWUP4",
+    "Enable Wakeup pin WKUP4. When this bit is set, the external wakeup pin WKUP4 is enabled and triggers a wakeup from Standby or Shutdown event when a rising or a falling edge occurs. The active edge is configured via the WP4 bit in the PWR_CR4 register.",
+    "EWUP5",
+    "Enable Wakeup pin WKUP5. When this bit is set, the external wakeup pin WKUP5 is enabled and triggers a wakeup from Standby or Shutdown event when a rising or a falling edge occurs.The active edge is configured via the WP5 bit in the PWR_CR4 register.",
+    "RRS",
+    "SRAM2 retention in Standby mode",
+    "APC",
+    "Apply pull-up and pull-down configuration. When this bit is set, the I/O pull-up and pull-down configurations defined in the PWR_PUCRx and PWR_PDCRx registers are applied. When this bit is cleared, the PWR_PUCRx and PWR_PDCRx registers are not applied to the I/Os.",
+    "UCPD1_STDBY",
+    "UCPD1_STDBY USB Type-C and Power Delivery standby mode.",
+    "UCPD1_DBDIS",
+    "USB Type-C and Power Delivery Dead Battery disable.. After exiting reset, the USB Type-C dead battery behavior is enabled, which may have a pull-down effect on CC1 and CC2 pins. It is recommended to disable it in all cases, either to stop this pull-down or to hand over control to the UCPD1 (which should therefore be initialized before doing the disable).",
+    "EIWUL",
+    "Enable internal wakeup line",
+    "EWUP",
+    "EWUP{}",
+    "WP1",
+    "Wakeup pin WKUP1 polarity. This bit defines the polarity used for an event detection on external wake-up pin, WKUP1",
+    "WP2",
+    "Wakeup pin WKUP2 polarity. This bit defines the polarity used for an event detection on external wake-up pin, WKUP2",
+    "WP3",
+    "Wakeup pin WKUP3 polarity. This bit defines the polarity used for an event detection on external wake-up pin, WKUP3",
+    "WP4",
+    "Wakeup pin WKUP4 polarity. This bit defines the polarity used for an event detection on external wake-up pin, WKUP4",
+    "WP5",
+    "Wakeup pin WKUP5 polarity. This bit defines the polarity used for an event detection on external wake-up pin, WKUP5",
+    "VBE",
+    "V<sub>BAT</sub> battery charging enable",
+    "VBRS",
+    "V<sub>BAT</sub> battery charging resistor selection",
+    "WP",
+    "WP{}",
+    "WUF1",
+    "Wakeup flag 1. This bit is set when a wakeup event is detected on wakeup pin, WKUP1. It is cleared by writing 1 in the CWUF1 bit of the PWR_SCR register.",
+    "WUF2",
+    "Wakeup flag 2. This bit is set when a wakeup event is detected on wakeup pin, WKUP2. It is cleared by writing 1 in the CWUF2 bit of the PWR_SCR register.",
+    "WUF3",
+    "Wakeup flag 3. This bit is set when a wakeup event is detected on wakeup pin, WKUP3. It is cleared by writing 1 in the CWUF3 bit of the PWR_SCR register.",
+    "WUF4",
+    "Wakeup flag 4. This bit is set when a wakeup event is detected on wakeup pin,WKUP4. It is cleared by writing 1 in the CWUF4 bit of the PWR_SCR register.",
+    "WUF5",
+    "Wakeup flag 5. This bit is set when a wakeup event is detected on wakeup pin, WKUP5. It is cleared by writing 1 in the CWUF5 bit of the PWR_SCR register.",
+    "SBF",
+    "Standby flag. This bit is set by hardware when the device enters the Standby mode and is cleared by setting the CSBF bit in the PWR_SCR register, or by a power-on reset. It is not cleared by the system reset.",
+    "WUFI",
+    "Wakeup flag internal. This bit is set when a wakeup is detected on the internal wakeup line. It is cleared when all internal wakeup sources are cleared.",
+    "WUF",
+    "WUF{}",
+    "REGLPS",
+    "Low-power regulator started. This bit provides the information whether the low-power regulator is ready after a power-on reset or a Standby/Shutdown. If the Standby mode is entered while REGLPS bit is still cleared, the wakeup from Standby mode time may be increased.",
+    "REGLPF",
+    "Low-power regulator flag. This bit is set by hardware when the MCU is in Low-power run mode. When the MCU exits the Low-power run mode, this bit remains at 1 until the regulator is ready in main mode. A polling on this bit must be done before increasing the product frequency. This bit is cleared by hardware when the regulator is ready.",
+    "VOSF",
+    "Voltage scaling flag. A delay is required for the internal regulator to be ready after the voltage scaling has been changed. VOSF indicates that the regulator reached the voltage level defined with VOS bits of the PWR_CR1 register.",
+    "PVDO",
+    "Programmable voltage detector output",
+    "PVMO1",
+    "Peripheral voltage monitoring output: V<sub>DDA</sub> vs. 1.62 V. Note: PVMO1 is cleared when PVM1 is disabled (PVME = 0). After enabling PVM1, the PVM1 output is valid after the PVM1 wakeup time.",
+    "PVMO2",
+    "Peripheral voltage monitoring output: V<sub>DDA</sub> vs. 1.8 V. Note: PVMO2 is cleared when PVM2 is disabled (PVME = 0). After enabling PVM2, the PVM2 output is valid after the PVM2 wakeup time.",
+    "PVMO",
+    "PVMO{}",
+    "CWUF1",
+    "Clear wakeup flag 1. Setting this bit clears the WUF1 flag in the PWR_SR1 register.",
+    "CWUF2",
+    "Clear wakeup flag 2. Setting this bit clears the WUF2 flag in the PWR_SR1 register.",
+    "CWUF3",
+    "Clear wakeup flag 3. Setting this bit clears the WUF3 flag in the PWR_SR1 register.",
+    "CWUF4",
+    "Clear wakeup flag 4. Setting this bit clears the WUF4 flag in the PWR_SR1 register.",
+    "CWUF5",
+    "Clear wakeup flag 5. Setting this bit clears the WUF5 flag in the PWR_SR1 register.",
+    "CSBF",
+    "Clear standby flag. Setting this bit clears the SBF flag in the PWR_SR1 register.",
+    "CWUF",
+    "CWUF{}",
+    "PU0",
+    "Port A pull-up bit y (y=0..13). When set, this bit activates the pull-up on PA[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.",
+    "PU1",
+    "PU2",
+    "PU3",
+    "PU4",
+    "PU5",
+    "PU6",
+    "PU7",
+    "PU8",
+    "PU9",
+    "PU10",
+    "PU11",
+    "PU12",
+    "PU13",
+    "PU15",
+    "Port A pull-up bit 15. When set, this bit activates the pull-up on PA[15] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PD15 bit is also set.",
+    "PU",
+    "PU{}",
+    "PD0",
+    "Port A pull-down bit y (y=0..12). When set, this bit activates the pull-down on PA[y] when APC bit is set in PWR_CR3 register.",
+    "PD1",
+    "PD2",
+    "PD3",
+    "PD4",
+    "PD5",
+    "PD6",
+    "PD7",
+    "PD8",
+    "PD9",
+    "PD10",
+    "PD11",
+    "PD12",
+    "PD14",
+    "Port A pull-down bit 14. When set, this bit activates the pull-down on PA[14] when APC bit is set in PWR_CR3 register.",
+    "PD",
+    "PD{}",
+    "Port B pull-up bit y (y=0..15). When set, this bit activates the pull-up on PB[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.",
+    "PU14",
+    "Port B pull-down bit y (y=0..3). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.",
+    "Port B pull-down bit y (y=5..15). When set, this bit activates the pull-down on PB[y] when APC bit is set in PWR_CR3 register.",
+    "PD13",
+    "PD15",
+    "Port C pull-up bit y (y=0..15). When set, this bit activates the pull-up on PC[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.",
+    "Port C pull-down bit y (y=0..15). When set, this bit activates the pull-down on PC[y] when APC bit is set in PWR_CR3 register.",
+    "Port D pull-up bit y (y=0..15). When set, this bit activates the pull-up on PD[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.",
+    "Port D pull-down bit y (y=0..15). When set, this bit activates the pull-down on PD[y] when APC bit is set in PWR_CR3 register.",
+    "Port E pull-up bit y (y=0..15). When set, this bit activates the pull-up on PE[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.",
+    "Port E pull-down bit y (y=0..15). When set, this bit activates the pull-down on PE[y] when APC bit is set in PWR_CR3 register.",
+    "Port F pull-up bit y (y=0..15). When set, this bit activates the pull-up on PF[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.",
+    "Port F pull-down bit y (y=0..15). When set, this bit activates the pull-down on PF[y] when APC bit is set in PWR_CR3 register.",
+    "Port G pull-up bit y (y=0..10). When set, this bit activates the pull-up on PG[y] when APC bit is set in PWR_CR3 register. The pull-up is not activated if the corresponding PDy bit is also set.",
+    "Port G pull-down bit y (y=0..10). When set, this bit activates the pull-down on PG[y] when APC bit is set in PWR_CR3 register.",
+    "R1MODE",
+    "Main regular range 1 mode. This bit is only valid for the main regulator in range 1 and has no effect on range 2. It is recommended to reset this bit when the system frequency is greater than 150 MHz. Refer to",
+    "Power control register 1",
+    "Power control register 2",
+    "CR3",
+    "Power control register 3",
+    "CR4",
+    "Power control register 4",
+    "SR1",
+    "Power status register 1",
+    "SR2",
+    "Power status register 2",
+    "SCR",
+    "Power status clear register",
+    "PUCRA",
+    "Power Port A pull-up control register",
+    "PDCRA",
+    "Power Port A pull-down control register",
+    "PUCRB",
+    "Power Port B pull-up control register",
+    "PDCRB",
+    "Power Port B pull-down control register",
+    "PUCRC",
+    "Power Port C pull-up control register",
+    "PDCRC",
+    "Power Port C pull-down control register",
+    "PUCRD",
+    "Power Port D pull-up control register",
+    "PDCRD",
+    "Power Port D pull-down control register",
+    "PUCRE",
+    "Power Port E pull-up control register",
+    "PDCRE",
+    "Power Port E pull-down control register",
+    "PUCRF",
+    "Power Port F pull-up control register",
+    "PDCRF",
+    "Power Port F pull-down control register",
+    "PUCRG",
+    "Power Port G pull-up control register",
+    "PDCRG",
+    "Power Port G pull-down control register",
+    "CR5",
+    "Power control register",
+    "SR{}",
+    "PWR",
+    "Power control",
+    "CED",
+    "Clock error detection",
+    "IE",
+    "Interrupt enable",
+    "Random number generator enable",
+    "SEIS",
+    "Seed error interrupt status",
+    "CEIS",
+    "Clock error interrupt status",
+    "SECS",
+    "Seed error current status",
+    "CECS",
+    "Clock error current status",
+    "DRDY",
+    "Data ready",
+    "RNDATA",
+    "Random data",
+    "control register",
+    "status register",
+    "data register",
+    "RNG",
+    "Random number generator",
+    "NPBLB",
+    "KEYSIZE",
+    "GCMPH",
+    "DMAOUTEN",
+    "Enable DMA management of data output phase",
+    "DMAINEN",
+    "Enable DMA management of data input phase",
+    "CCFIE",
+    "CCF flag interrupt enable",
+    "ERRC",
+    "Error clear",
+    "CCFC",
+    "Computation Complete Flag Clear",
+    "CHMOD",
+    "AES chaining mode",
+    "MODE",
+    "AES operating mode",
+    "DATATYPE",
+    "Data type selection (for data in and data out to/from the cryptographic block)",
+    "EN",
+    "AES enable",
+    "WRERR",
+    "Write error flag",
+    "Read error flag",
+    "CCF",
+    "Computation complete flag",
+    "AES_DINR",
+    "Data Input Register",
+    "AES_DOUTR",
+    "Data output register",
+    "AES_KEYR0",
+    "Data Output Register (LSB key [31:0])",
+    "AES_KEYR1",
+    "AES key register (key [63:32])",
+    "AES_KEYR2",
+    "AES key register (key [95:64])",
+    "AES_KEYR3",
+    "AES key register (MSB key [127:96])",
+    "AES_IVR0",
+    "initialization vector register (LSB IVR [31:0])",
+    "AES_IVR1",
+    "Initialization Vector Register (IVR [63:32])",
+    "AES_IVR2",
+    "Initialization Vector Register (IVR [95:64])",
+    "AES_IVR3",
+    "Initialization Vector Register (MSB IVR [127:96])",
+    "AES key",
+    "SUSP",
+    "AES suspend",
+    "DINR",
+    "data input register",
+    "DOUTR",
+    "data output register",
+    "KEYR0",
+    "key register 0",
+    "KEYR1",
+    "key register 1",
+    "KEYR2",
+    "key register 2",
+    "KEYR3",
+    "key register 3",
+    "IVR0",
+    "initialization vector register 0",
+    "IVR1",
+    "initialization vector register 1",
+    "IVR2",
+    "initialization vector register 2",
+    "IVR3",
+    "initialization vector register 3",
+    "KEYR4",
+    "key register 4",
+    "KEYR5",
+    "key register 5",
+    "KEYR6",
+    "key register 6",
+    "KEYR7",
+    "key register 7",
+    "SUSP0R",
+    "suspend registers",
+    "SUSP1R",
+    "SUSP2R",
+    "SUSP3R",
+    "SUSP4R",
+    "SUSP5R",
+    "SUSP6R",
+    "SUSP7R",
+    "IVR",
+    "IVR{}",
+    "KEYR{}",
+    "SUSPR",
+    "SUSP{}R",
+    "AES",
+    "Advanced encryption standard hardware accelerator",
+    "MODER15",
+    "Port x configuration bits (y = 0..15)",
+    "MODER14",
+    "MODER13",
+    "MODER12",
+    "MODER11",
+    "MODER10",
+    "MODER9",
+    "MODER8",
+    "MODER7",
+    "MODER6",
+    "MODER5",
+    "MODER4",
+    "MODER3",
+    "MODER2",
+    "MODER1",
+    "MODER0",
+    "MODER",
+    "MODER{}",
+    "OT15",
+    "OT14",
+    "OT13",
+    "OT12",
+    "OT11",
+    "OT10",
+    "OT9",
+    "OT8",
+    "OT7",
+    "OT6",
+    "OT5",
+    "OT4",
+    "OT3",
+    "OT2",
+    "OT1",
+    "OT0",
+    "OT",
+    "OT{}",
+    "OSPEEDR15",
+    "OSPEEDR14",
+    "OSPEEDR13",
+    "OSPEEDR12",
+    "OSPEEDR11",
+    "OSPEEDR10",
+    "OSPEEDR9",
+    "OSPEEDR8",
+    "OSPEEDR7",
+    "OSPEEDR6",
+    "OSPEEDR5",
+    "OSPEEDR4",
+    "OSPEEDR3",
+    "OSPEEDR2",
+    "OSPEEDR1",
+    "OSPEEDR0",
+    "OSPEEDR",
+    "OSPEEDR{}",
+    "PUPDR15",
+    "PUPDR14",
+    "PUPDR13",
+    "PUPDR12",
+    "PUPDR11",
+    "PUPDR10",
+    "PUPDR9",
+    "PUPDR8",
+    "PUPDR7",
+    "PUPDR6",
+    "PUPDR5",
+    "PUPDR4",
+    "PUPDR3",
+    "PUPDR2",
+    "PUPDR1",
+    "PUPDR0",
+    "PUPDR",
+    "PUPDR{}",
+    "IDR15",
+    "Port input data (y = 0..15)",
+    "IDR14",
+    "IDR13",
+    "IDR12",
+    "IDR11",
+    "IDR10",
+    "IDR9",
+    "IDR8",
+    "IDR7",
+    "IDR6",
+    "IDR5",
+    "IDR4",
+    "IDR3",
+    "IDR2",
+    "IDR1",
+    "IDR0",
+    "IDR{}",
+    "ODR15",
+    "Port output data (y = 0..15)",
+    "ODR14",
+    "ODR13",
+    "ODR12",
+    "ODR11",
+    "ODR10",
+    "ODR9",
+    "ODR8",
+    "ODR7",
+    "ODR6",
+    "ODR5",
+    "ODR4",
+    "ODR3",
+    "ODR2",
+    "ODR1",
+    "ODR0",
+    "ODR",
+    "ODR{}",
+    "BR15",
+    "Port x reset bit y (y = 0..15)",
+    "BR14",
+    "BR13",
+    "BR12",
+    "BR11",
+    "BR10",
+    "BR9",
+    "BR8",
+    "BR7",
+    "BR6",
+    "BR5",
+    "BR4",
+    "BR3",
+    "BR2",
+    "BR1",
+    "BR0",
+    "Port x set bit y (y= 0..15)",
+    "BS15",
+    "BS14",
+    "BS13",
+    "BS12",
+    "BS11",
+    "BS10",
+    "BS9",
+    "BS8",
+    "BS7",
+    "BS6",
+    "BS5",
+    "BS4",
+    "BS3",
+    "BS2",
+    "BS1",
+    "BS0",
+    "BS",
+    "BS{}",
+    "BR",
+    "BR{}",
+    "LCKK",
+    "Port x lock bit y (y= 0..15)",
+    "LCK15",
+    "LCK14",
+    "LCK13",
+    "LCK12",
+    "LCK11",
+    "LCK10",
+    "LCK9",
+    "LCK8",
+    "LCK7",
+    "LCK6",
+    "LCK5",
+    "LCK4",
+    "LCK3",
+    "LCK2",
+    "LCK1",
+    "LCK0",
+    "LCK",
+    "LCK{}",
+    "AFRL7",
+    "Alternate function selection for port x bit y (y = 0..7)",
+    "AFRL6",
+    "AFRL5",
+    "AFRL4",
+    "AFRL3",
+    "AFRL2",
+    "AFRL1",
+    "AFRL0",
+    "AFRL",
+    "AFRL{}",
+    "AFRH15",
+    "Alternate function selection for port x bit y (y = 8..15)",
+    "AFRH14",
+    "AFRH13",
+    "AFRH12",
+    "AFRH11",
+    "AFRH10",
+    "AFRH9",
+    "AFRH8",
+    "AFRH",
+    "AFRH{}",
+    "Port Reset bit",
+    "GPIO port mode register",
+    "OTYPER",
+    "GPIO port output type register",
+    "GPIO port output speed register",
+    "GPIO port pull-up/pull-down register",
+    "GPIO port input data register",
+    "GPIO port output data register",
+    "BSRR",
+    "GPIO port bit set/reset register",
+    "LCKR",
+    "GPIO port configuration lock register",
+    "GPIO alternate function low register",
+    "GPIO alternate function high register",
+    "BRR",
+    "GPIO port bit reset register",
+    "GPIOA",
+    "General-purpose I/Os",
+    "GPIOB",
+    "GPIOC",
+    "GPIOD",
+    "GPIOE",
+    "GPIOF",
+    "GPIOG",
+    "CEN",
+    "Counter enable",
+    "UDIS",
+    "Update disable",
+    "URS",
+    "Update request source",
+    "OPM",
+    "One-pulse mode",
+    "ARPE",
+    "Auto-reload preload enable",
+    "CKD",
+    "Clock division",
+    "UIFREMAP",
+    "UIF status bit remapping",
+    "DITHEN",
+    "Dithering Enable",
+    "OIS2",
+    "Output idle state 2 (OC2 output)",
+    "OIS1N",
+    "Output Idle state 1",
+    "OIS1",
+    "TI1S",
+    "TI1 selection",
+    "MMS",
+    "Master mode selection",
+    "CCDS",
+    "Capture/compare DMA selection",
+    "CCUS",
+    "Capture/compare control update selection",
+    "CCPC",
+    "Capture/compare preloaded control",
+    "OIS",
+    "OIS{}",
+    "MSM",
+    "Master/Slave mode",
+    "TS",
+    "Trigger selection",
+    "SMS",
+    "Slave mode selection",
+    "TDE",
+    "Trigger DMA request enable",
+    "COMDE",
+    "COM DMA request enable",
+    "CC2DE",
+    "Capture/Compare 2 DMA request enable",
+    "CC1DE",
+    "Capture/Compare 1 DMA request enable",
+    "UDE",
+    "Update DMA request enable",
+    "BIE",
+    "Break interrupt enable",
+    "TIE",
+    "Trigger interrupt enable",
+    "COMIE",
+    "COM interrupt enable",
+    "CC2IE",
+    "Capture/Compare 2 interrupt enable",
+    "CC1IE",
+    "Capture/Compare 1 interrupt enable",
+    "UIE",
+    "Update interrupt enable",
+    "CCDE",
+    "CC{}DE",
+    "CCIE",
+    "CC{}IE",
+    "CC2OF",
+    "Capture/Compare 2 overcapture flag",
+    "CC1OF",
+    "Capture/Compare 1 overcapture flag",
+    "BIF",
+    "Break interrupt flag",
+    "TIF",
+    "Trigger interrupt flag",
+    "COMIF",
+    "COM interrupt flag",
+    "CC2IF",
+    "Capture/compare 2 interrupt flag",
+    "CC1IF",
+    "Capture/compare 1 interrupt flag",
+    "UIF",
+    "Update interrupt flag",
+    "CCIF",
+    "CC{}IF",
+    "CCOF",
+    "CC{}OF",
+    "BG",
+    "Break generation",
+    "TG",
+    "Trigger generation",
+    "COMG",
+    "Capture/Compare control update generation",
+    "CC2G",
+    "Capture/compare 2 generation",
+    "CC1G",
+    "Capture/compare 1 generation",
+    "UG",
+    "Update generation",
+    "CCG",
+    "CC{}G",
+    "OC2M",
+    "OC2PE",
+    "OC2FE",
+    "CC2S",
+    "OC1CE",
+    "OC1M",
+    "Output Compare 1 mode",
+    "OC1PE",
+    "Output Compare 1 preload enable",
+    "OC1FE",
+    "Output Compare 1 fast enable",
+    "CC1S",
+    "Capture/Compare 1 selection",
+    "OCM",
+    "OC{}M",
+    "OCFE",
+    "OC{}FE",
+    "OCPE",
+    "OC{}PE",
+    "CCS",
+    "CC{}S",
+    "IC2F",
+    "IC2PSC",
+    "IC1F",
+    "Input capture 1 filter",
+    "IC1PSC",
+    "Input capture 1 prescaler",
+    "ICF",
+    "IC{}F",
+    "ICPSC",
+    "IC{}PSC",
+    "CC2NP",
+    "Capture/Compare 2 complementary output polarity",
+    "CC2P",
+    "Capture/Compare 2 output polarity",
+    "CC2E",
+    "Capture/Compare 2 output enable",
+    "CC1NP",
+    "Capture/Compare 1 output Polarity",
+    "CC1NE",
+    "Capture/Compare 1 complementary output enable",
+    "CC1P",
+    "CC1E",
+    "Capture/Compare 1 output enable",
+    "CCP",
+    "CC{}P",
+    "CCE",
+    "CC{}E",
+    "CCNP",
+    "CC{}NP",
+    "CNT",
+    "counter value",
+    "UIFCPY",
+    "UIF Copy",
+    "PSC",
+    "Prescaler value",
+    "ARR",
+    "Auto-reload value",
+    "REP",
+    "Repetition counter value",
+    "CCR1",
+    "Capture/Compare 1 value",
+    "CCR2",
+    "DTG",
+    "Dead-time generator setup",
+    "Lock configuration",
+    "OSSI",
+    "Off-state selection for Idle mode",
+    "OSSR",
+    "Off-state selection for Run mode",
+    "BKE",
+    "Break enable",
+    "BKP",
+    "Break polarity",
+    "AOE",
+    "Automatic output enable",
+    "MOE",
+    "Main output enable",
+    "BKF",
+    "Break filter",
+    "BKDSRM",
+    "BKBID",
+    "DTGF",
+    "DTAE",
+    "Deadtime Asymmetric Enable",
+    "DTPE",
+    "Deadtime Preload Enable",
+    "TI1SEL",
+    "TI1[0] to TI1[15] input selection",
+    "TI2SEL",
+    "TI2[0] to TI2[15] input selection",
+    "TISEL",
+    "TI{}SEL",
+    "BKCMP4P",
+    "BRK COMP4 input polarity",
+    "BKCMP3P",
+    "BRK COMP3 input polarity",
+    "BKCMP2P",
+    "BRK COMP2 input polarity",
+    "BKCMP1P",
+    "BRK COMP1 input polarity",
+    "BKINP",
+    "BRK BKIN input polarity",
+    "BKCMP7E",
+    "BRK COMP7 enable",
+    "BKCMP6E",
+    "BRK COMP6 enable",
+    "BKCMP5E",
+    "BRK COMP5 enable",
+    "BKCMP4E",
+    "BRK COMP4 enable",
+    "BKCMP3E",
+    "BRK COMP3 enable",
+    "BKCMP2E",
+    "BRK COMP2 enable",
+    "BKCMP1E",
+    "BRK COMP1 enable",
+    "BKINE",
+    "BRK BKIN input enable",
+    "BKCMPP",
+    "BKCMP{}P",
+    "BKCMPE",
+    "BKCMP{}E",
+    "OCRSEL",
+    "OCREF_CLR source selection",
+    "DBL",
+    "DMA burst length",
+    "DBA",
+    "DMA base address",
+    "DMAB",
+    "DMA register for burst accesses",
+    "control register 1",
+    "control register 2",
+    "SMCR",
+    "slave mode control register",
+    "DIER",
+    "DMA/Interrupt enable register",
+    "EGR",
+    "event generation register",
+    "CCMR1_Output",
+    "capture/compare mode register (output mode)",
+    "CCMR1_Input",
+    "capture/compare mode register 1 (input mode)",
+    "CCER",
+    "capture/compare enable register",
+    "counter",
+    "prescaler",
+    "auto-reload register",
+    "RCR",
+    "repetition counter register",
+    "capture/compare register 1",
+    "capture/compare register 2",
+    "BDTR",
+    "break and dead-time register",
+    "DTR2",
+    "timer Deadtime Register 2",
+    "TIM timer input selection register",
+    "AF1",
+    "TIM alternate function option register 1",
+    "AF2",
+    "TIM alternate function option register 2",
+    "DCR",
+    "DMA control register",
+    "DMAR",
+    "DMA address for full transfer",
+    "CCMR1",
+    "capture/compare mode register",
+    "AF",
+    "AF{}",
+    "CCR",
+    "CCR{}",
+    "TIM15",
+    "General purpose timers",
+    "HSE32EN",
+    "HSE Divided by 32 enable",
+    "OR1",
+    "TIM option register 1",
+    "TIM16",
+    "TIM17",
+    "CMS",
+    "Center-aligned mode selection",
+    "Direction",
+    "MMS2",
+    "Master mode selection 2",
+    "OIS6",
+    "Output Idle state 6 (OC6 output)",
+    "OIS5",
+    "Output Idle state 5 (OC5 output)",
+    "OIS4N",
+    "Output Idle state 4 (OC4N output)",
+    "OIS4",
+    "Output Idle state 4",
+    "OIS3N",
+    "Output Idle state 3",
+    "OIS3",
+    "OIS2N",
+    "Output Idle state 2",
+    "OISN",
+    "OIS{}N",
+    "SMSPS",
+    "SMS Preload Source",
+    "SMSPE",
+    "SMS Preload Enable",
+    "ETP",
+    "External trigger polarity",
+    "ECE",
+    "External clock enable",
+    "ETPS",
+    "External trigger prescaler",
+    "ETF",
+    "External trigger filter",
+    "OCCS",
+    "OCREF clear selection",
+    "TERRIE",
+    "Transition Error interrupt enable",
+    "IERRIE",
+    "Index Error interrupt enable",
+    "DIRIE",
+    "Direction Change interrupt enable",
+    "IDXIE",
+    "Index interrupt enable",
+    "CC4DE",
+    "Capture/Compare 4 DMA request enable",
+    "CC3DE",
+    "Capture/Compare 3 DMA request enable",
+    "CC4IE",
+    "Capture/Compare 4 interrupt enable",
+    "CC3IE",
+    "Capture/Compare 3 interrupt enable",
+    "TERRF",
+    "Transition Error interrupt flag",
+    "IERRF",
+    "Index Error interrupt flag",
+    "DIRF",
+    "Direction Change interrupt flag",
+    "IDXF",
+    "Index interrupt flag",
+    "CC6IF",
+    "Compare 6 interrupt flag",
+    "CC5IF",
+    "Compare 5 interrupt flag",
+    "SBIF",
+    "System Break interrupt flag",
+    "CC4OF",
+    "Capture/Compare 4 overcapture flag",
+    "CC3OF",
+    "Capture/Compare 3 overcapture flag",
+    "Capture/compare 2 overcapture flag",
+    "B2IF",
+    "Break 2 interrupt flag",
+    "CC4IF",
+    "Capture/Compare 4 interrupt flag",
+    "CC3IF",
+    "Capture/Compare 3 interrupt flag",
+    "Capture/Compare 2 interrupt flag",
+    "B2G",
+    "Break 2 generation",
+    "CC4G",
+    "Capture/compare 4 generation",
+    "CC3G",
+    "Capture/compare 3 generation",
+    "OC2CE",
+    "Output Compare 2 clear enable",
+    "Output Compare 2 mode",
+    "Output Compare 2 preload enable",
+    "Output Compare 2 fast enable",
+    "Capture/Compare 2 selection",
+    "Output Compare 1 clear enable",
+    "OCCE",
+    "OC{}CE",
+    "Input capture 2 filter",
+    "Input capture 2 prescaler",
+    "ICPCS",
+    "OC4CE",
+    "Output compare 4 clear enable",
+    "OC4M",
+    "Output compare 4 mode",
+    "OC4PE",
+    "Output compare 4 preload enable",
+    "OC4FE",
+    "Output compare 4 fast enable",
+    "CC4S",
+    "Capture/Compare 4 selection",
+    "OC3CE",
+    "Output compare 3 clear enable",
+    "OC3M",
+    "Output compare 3 mode",
+    "OC3PE",
+    "Output compare 3 preload enable",
+    "OC3FE",
+    "Output compare 3 fast enable",
+    "CC3S",
+    "Capture/Compare 3 selection",
+    "IC4F",
+    "Input capture 4 filter",
+    "IC4PSC",
+    "Input capture 4 prescaler",
+    "IC3F",
+    "Input capture 3 filter",
+    "IC3PSC",
+    "Input capture 3 prescaler",
+    "Capture/compare 3 selection",
+    "CC6P",
+    "Capture/Compare 6 output polarity",
+    "CC6E",
+    "Capture/Compare 6 output enable",
+    "CC5P",
+    "Capture/Compare 5 output polarity",
+    "CC5E",
+    "Capture/Compare 5 output enable",
+    "CC4NP",
+    "Capture/Compare 4 complementary output polarity",
+    "CC4NE",
+    "Capture/Compare 4 complementary output enable",
+    "CC4P",
+    "Capture/Compare 3 output Polarity",
+    "CC4E",
+    "Capture/Compare 4 output enable",
+    "CC3NP",
+    "CC3NE",
+    "Capture/Compare 3 complementary output enable",
+    "CC3P",
+    "CC3E",
+    "Capture/Compare 3 output enable",
+    "Capture/Compare 2 output Polarity",
+    "CC2NE",
+    "Capture/Compare 2 complementary output enable",
+    "CCNE",
+    "CC{}NE",
+    "Capture/Compare 2 value",
+    "CCR3",
+    "Capture/Compare value",
+    "CCR4",
+    "BK2ID",
+    "BK2DSRM",
+    "BK2P",
+    "Break 2 polarity",
+    "BK2E",
+    "Break 2 Enable",
+    "BK2F",
+    "Break 2 filter",
+    "CCR5",
+    "GC5C1",
+    "Group Channel 5 and Channel 1",
+    "GC5C2",
+    "Group Channel 5 and Channel 2",
+    "GC5C3",
+    "Group Channel 5 and Channel 3",
+    "GC5C",
+    "GC5C{}",
+    "CCR6",
+    "OC6M_bit3",
+    "Output Compare 6 mode bit 3",
+    "OC5M_bit3",
+    "Output Compare 5 mode bit 3",
+    "OC6CE",
+    "Output compare 6 clear enable",
+    "OC6M",
+    "Output compare 6 mode",
+    "OC6PE",
+    "Output compare 6 preload enable",
+    "OC6FE",
+    "Output compare 6 fast enable",
+    "OC5CE",
+    "Output compare 5 clear enable",
+    "OC5M",
+    "Output compare 5 mode",
+    "OC5PE",
+    "Output compare 5 preload enable",
+    "OC5FE",
+    "Output compare 5 fast enable",
+    "Dead-time falling edge generator setup",
+    "Index Enable",
+    "IDIR",
+    "Index Direction",
+    "IBLK",
+    "Index Blanking",
+    "FIDX",
+    "First Index",
+    "IPOS",
+    "Index Positioning",
+    "PW",
+    "Pulse width",
+    "PWPRSC",
+    "Pulse Width prescaler",
+    "TI3SEL",
+    "TI3[0] to TI3[15] input selection",
+    "TI4SEL",
+    "TI4[0] to TI4[15] input selection",
+    "ETRSEL",
+    "ETR source selection",
+    "BK2CMP4P",
+    "BRK2 COMP4 input polarity",
+    "BK2CMP3P",
+    "BRK2 COMP3 input polarity",
+    "BK2CMP2P",
+    "BRK2 COMP2 input polarity",
+    "BK2CMP1P",
+    "BRK2 COMP1 input polarity",
+    "BK2INP",
+    "BRK2 BKIN input polarity",
+    "BK2CMP7E",
+    "BRK2 COMP7 enable",
+    "BK2CMP6E",
+    "BRK2 COMP6 enable",
+    "BK2CMP5E",
+    "BRK2 COMP5 enable",
+    "BK2CMP4E",
+    "BRK2 COMP4 enable",
+    "BK2CMP3E",
+    "BRK2 COMP3 enable",
+    "BK2CMP2E",
+    "BRK2 COMP2 enable",
+    "BK2CMP1E",
+    "BRK2 COMP1 enable",
+    "BK2CMPP",
+    "BK2CMP{}P",
+    "BK2CMPE",
+    "BK2CMP{}E",
+    "capture/compare mode register 1 (output mode)",
+    "CCMR2_Output",
+    "capture/compare mode register 2 (output mode)",
+    "CCMR2_Input",
+    "capture/compare mode register 2 (input mode)",
+    "capture/compare register 3",
+    "capture/compare register 4",
+    "CCMR3_Output",
+    "ECR",
+    "capture/compare mode register 1",
+    "CCMR2",
+    "capture/compare mode register 2",
+    "CCMR3",
+    "CCMR_Input",
+    "CCMR{}_Input",
+    "CCMR_Output",
+    "CCMR{}_Output",
+    "CCMR",
+    "CCMR{}",
+    "TIM1",
+    "Advanced-timers",
+    "TIM8",
+    "TIM20",
+    "TIM2",
+    "TIM3",
+    "TIM4",
+    "Low counter value",
+    "Low Auto-reload value",
+    "TIM6",
+    "Basic-timers",
+    "TIM7",
+    "DOWN",
+    "Counter direction change up to down",
+    "UP",
+    "Counter direction change down to up",
+    "ARROK",
+    "Autoreload register update OK",
+    "CMPOK",
+    "Compare register update OK",
+    "EXTTRIG",
+    "External trigger edge event",
+    "ARRM",
+    "Autoreload match",
+    "CMPM",
+    "Compare match",
+    "DOWNCF",
+    "Direction change to down Clear Flag",
+    "UPCF",
+    "Direction change to UP Clear Flag",
+    "ARROKCF",
+    "Autoreload register update OK Clear Flag",
+    "CMPOKCF",
+    "Compare register update OK Clear Flag",
+    "EXTTRIGCF",
+    "External trigger valid edge Clear Flag",
+    "ARRMCF",
+    "Autoreload match Clear Flag",
+    "CMPMCF",
+    "compare match Clear Flag",
+    "DOWNIE",
+    "Direction change to down Interrupt Enable",
+    "UPIE",
+    "Direction change to UP Interrupt Enable",
+    "ARROKIE",
+    "Autoreload register update OK Interrupt Enable",
+    "CMPOKIE",
+    "Compare register update OK Interrupt Enable",
+    "EXTTRIGIE",
+    "External trigger valid edge Interrupt Enable",
+    "ARRMIE",
+    "Autoreload match Interrupt Enable",
+    "CMPMIE",
+    "Compare match Interrupt Enable",
+    "ENC",
+    "Encoder mode enable",
+    "COUNTMODE",
+    "counter mode enabled",
+    "PRELOAD",
+    "Registers update mode",
+    "WAVPOL",
+    "Waveform shape polarity",
+    "WAVE",
+    "Waveform shape",
+    "TIMOUT",
+    "Timeout enable",
+    "TRIGEN",
+    "Trigger enable and polarity",
+    "TRIGSEL",
+    "Trigger selector",
+    "Clock prescaler",
+    "TRGFLT",
+    "Configurable digital filter for trigger",
+    "CKFLT",
+    "Configurable digital filter for external clock",
+    "CKPOL",
+    "Clock Polarity",
+    "CKSEL",
+    "Clock selector",
+    "RSTARE",
+    "COUNTRST",
+    "CNTSTRT",
+    "Timer start in continuous mode",
+    "SNGSTRT",
+    "LPTIM start in single mode",
+    "ENABLE",
+    "LPTIM Enable",
+    "CMP",
+    "Compare value",
+    "Auto reload value",
+    "Counter value",
+    "IN1",
+    "IN2",
+    "IN",
+    "IN{}",
+    "Interrupt and Status Register",
+    "Interrupt Clear Register",
+    "IER",
+    "Interrupt Enable Register",
+    "Configuration Register",
+    "Control Register",
+    "Compare Register",
+    "Autoreload Register",
+    "Counter Register",
+    "OR",
+    "option register",
+    "LPTIMER1",
+    "Low power timer",
+    "RXFFIE",
+    "TXFEIE",
+    "FIFOEN",
+    "M1",
+    "EOBIE",
+    "End of Block interrupt enable",
+    "RTOIE",
+    "Receiver timeout interrupt enable",
+    "DEAT4",
+    "Driver Enable assertion time",
+    "DEAT3",
+    "DEAT2",
+    "DEAT1",
+    "DEAT0",
+    "DEDT4",
+    "Driver Enable de-assertion time",
+    "DEDT3",
+    "DEDT2",
+    "DEDT1",
+    "DEDT0",
+    "OVER8",
+    "Oversampling mode",
+    "CMIE",
+    "Character match interrupt enable",
+    "MME",
+    "Mute mode enable",
+    "M0",
+    "Word length",
+    "WAKE",
+    "Receiver wakeup method",
+    "PCE",
+    "Parity control enable",
+    "PS",
+    "Parity selection",
+    "PEIE",
+    "PE interrupt enable",
+    "TXEIE",
+    "interrupt enable",
+    "Transmission complete interrupt enable",
+    "RXNEIE",
+    "RXNE interrupt enable",
+    "IDLEIE",
+    "IDLE interrupt enable",
+    "TE",
+    "Transmitter enable",
+    "RE",
+    "Receiver enable",
+    "UESM",
+    "USART enable in Stop mode",
+    "UE",
+    "USART enable",
+    "M",
+    "M{}",
+    "DEAT",
+    "DEAT{}",
+    "DEDT",
+    "DEDT{}",
+    "ADD4_7",
+    "Address of the USART node",
+    "ADD0_3",
+    "RTOEN",
+    "Receiver timeout enable",
+    "ABRMOD1",
+    "Auto baud rate mode",
+    "ABRMOD0",
+    "ABREN",
+    "Auto baud rate enable",
+    "MSBFIRST",
+    "Most significant bit first",
+    "TAINV",
+    "Binary data inversion",
+    "TXINV",
+    "TX pin active level inversion",
+    "RXINV",
+    "RX pin active level inversion",
+    "SWAP",
+    "Swap TX/RX pins",
+    "LINEN",
+    "LIN mode enable",
+    "STOP bits",
+    "CLKEN",
+    "Clock enable",
+    "CPOL",
+    "Clock polarity",
+    "CPHA",
+    "Clock phase",
+    "LBCL",
+    "Last bit clock pulse",
+    "LBDIE",
+    "LIN break detection interrupt enable",
+    "LBDL",
+    "LIN break detection length",
+    "ADDM7",
+    "7-bit Address Detection/4-bit Address Detection",
+    "DIS_NSS",
+    "SLVEN",
+    "ABRMOD",
+    "ABRMOD{}",
+    "TXFTCFG",
+    "RXFTIE",
+    "RXFTCFG",
+    "TCBGTIE",
+    "TXFTIE",
+    "WUFIE",
+    "Wakeup from Stop mode interrupt enable",
+    "WUS",
+    "Wakeup from Stop mode interrupt flag selection",
+    "SCARCNT",
+    "Smartcard auto-retry count",
+    "DEP",
+    "Driver enable polarity selection",
+    "DEM",
+    "Driver enable mode",
+    "DDRE",
+    "DMA Disable on Reception Error",
+    "OVRDIS",
+    "Overrun Disable",
+    "ONEBIT",
+    "One sample bit method enable",
+    "CTSIE",
+    "CTS interrupt enable",
+    "CTSE",
+    "CTS enable",
+    "RTSE",
+    "RTS enable",
+    "DMAT",
+    "DMA enable transmitter",
+    "DMA enable receiver",
+    "SCEN",
+    "Smartcard mode enable",
+    "Smartcard NACK enable",
+    "HDSEL",
+    "Half-duplex selection",
+    "IRLP",
+    "Ir low-power",
+    "IREN",
+    "Ir mode enable",
+    "EIE",
+    "DIV_Mantissa",
+    "DIV_Fraction",
+    "GT",
+    "Guard time value",
+    "BLEN",
+    "Block Length",
+    "RTO",
+    "Receiver timeout value",
+    "TXFRQ",
+    "Transmit data flush request",
+    "RXFRQ",
+    "Receive data flush request",
+    "MMRQ",
+    "Mute mode request",
+    "SBKRQ",
+    "Send break request",
+    "ABRRQ",
+    "Auto baud rate request",
+    "TXFT",
+    "RXFT",
+    "TCBGT",
+    "RXFF",
+    "TXFE",
+    "REACK",
+    "TEACK",
+    "RWU",
+    "SBKF",
+    "CMF",
+    "ABRF",
+    "ABRE",
+    "UDR",
+    "EOBF",
+    "RTOF",
+    "CTS",
+    "CTSIF",
+    "LBDF",
+    "IDLE",
+    "ORE",
+    "NF",
+    "FE",
+    "WUCF",
+    "Wakeup from Stop mode clear flag",
+    "CMCF",
+    "Character match clear flag",
+    "UDRCF",
+    "EOBCF",
+    "End of block clear flag",
+    "RTOCF",
+    "Receiver timeout clear flag",
+    "CTSCF",
+    "CTS clear flag",
+    "LBDCF",
+    "LIN break detection clear flag",
+    "TCBGTCF",
+    "TCCF",
+    "Transmission complete clear flag",
+    "TXFECF",
+    "IDLECF",
+    "Idle line detected clear flag",
+    "ORECF",
+    "Overrun error clear flag",
+    "NCF",
+    "Noise detected clear flag",
+    "FECF",
+    "Framing error clear flag",
+    "PECF",
+    "Parity error clear flag",
+    "RDR",
+    "Receive data value",
+    "TDR",
+    "Transmit data value",
+    "PRESCALER",
+    "Control register 3",
+    "Baud rate register",
+    "GTPR",
+    "Guard time and prescaler register",
+    "RTOR",
+    "Receiver timeout register",
+    "RQR",
+    "Request register",
+    "Interrupt & status register",
+    "Interrupt flag clear register",
+    "USART prescaler register",
+    "USART1",
+    "Universal synchronous asynchronous receiver transmitter",
+    "USART2",
+    "USART3",
+    "UART4",
+    "LPUART1",
+    "BIDIMODE",
+    "Bidirectional data mode enable",
+    "BIDIOE",
+    "Output enable in bidirectional mode",
+    "Hardware CRC calculation enable",
+    "CRCNEXT",
+    "CRC transfer next",
+    "DFF",
+    "Data frame format",
+    "RXONLY",
+    "Receive only",
+    "SSM",
+    "Software slave management",
+    "SSI",
+    "Internal slave select",
+    "LSBFIRST",
+    "Frame format",
+    "SPE",
+    "SPI enable",
+    "Baud rate control",
+    "MSTR",
+    "Master selection",
+    "Rx buffer DMA enable",
+    "Tx buffer DMA enable",
+    "SSOE",
+    "SS output enable",
+    "NSSP",
+    "NSS pulse management",
+    "FRF",
+    "RX buffer not empty interrupt enable",
+    "Tx buffer empty interrupt enable",
+    "DS",
+    "Data size",
+    "FRXTH",
+    "FIFO reception threshold",
+    "LDMA_RX",
+    "Last DMA transfer for reception",
+    "LDMA_TX",
+    "Last DMA transfer for transmission",
+    "Receive buffer not empty",
+    "Transmit buffer empty",
+    "CRCERR",
+    "CRC error flag",
+    "MODF",
+    "Mode fault",
+    "Overrun flag",
+    "Busy flag",
+    "TIFRFE",
+    "TI frame format error",
+    "FRLVL",
+    "FIFO reception level",
+    "FTLVL",
+    "FIFO transmission level",
+    "CRCPOLY",
+    "CRC polynomial register",
+    "RxCRC",
+    "Rx CRC register",
+    "TxCRC",
+    "Tx CRC register",
+    "CHLEN",
+    "DATLEN",
+    "I2SSTD",
+    "PCMSYNC",
+    "I2SCFG",
+    "I2SE",
+    "I2SMOD",
+    "I2SDIV",
+    "ODD",
+    "MCKOE",
+    "CRCPR",
+    "RXCRCR",
+    "RX CRC register",
+    "TXCRCR",
+    "TX CRC register",
+    "I2SCFGR",
+    "configuration register",
+    "I2SPR",
+    "prescaler register",
+    "SPI1",
+    "Serial peripheral interface/Inter-IC sound",
+    "SPI3",
+    "SPI2",
+    "IM0",
+    "Interrupt Mask on line 0",
+    "IM1",
+    "Interrupt Mask on line 1",
+    "IM2",
+    "Interrupt Mask on line 2",
+    "IM3",
+    "Interrupt Mask on line 3",
+    "IM4",
+    "Interrupt Mask on line 4",
+    "IM5",
+    "Interrupt Mask on line 5",
+    "IM6",
+    "Interrupt Mask on line 6",
+    "IM7",
+    "Interrupt Mask on line 7",
+    "IM8",
+    "Interrupt Mask on line 8",
+    "IM9",
+    "Interrupt Mask on line 9",
+    "IM10",
+    "Interrupt Mask on line 10",
+    "IM11",
+    "Interrupt Mask on line 11",
+    "IM12",
+    "Interrupt Mask on line 12",
+    "IM13",
+    "Interrupt Mask on line 13",
+    "IM14",
+    "Interrupt Mask on line 14",
+    "IM15",
+    "Interrupt Mask on line 15",
+    "IM16",
+    "Interrupt Mask on line 16",
+    "IM17",
+    "Interrupt Mask on line 17",
+    "IM18",
+    "Interrupt Mask on line 18",
+    "IM19",
+    "Interrupt Mask on line 19",
+    "IM20",
+    "Interrupt Mask on line 20",
+    "IM21",
+    "Interrupt Mask on line 21",
+    "IM22",
+    "Interrupt Mask on line 22",
+    "IM23",
+    "Interrupt Mask on line 23",
+    "IM24",
+    "Interrupt Mask on line 24",
+    "IM25",
+    "Interrupt Mask on line 25",
+    "IM26",
+    "Interrupt Mask on line 26",
+    "IM27",
+    "Interrupt Mask on line 27",
+    "IM28",
+    "Interrupt Mask on line 28",
+    "IM29",
+    "Interrupt Mask on line 29",
+    "IM30",
+    "Interrupt Mask on line 30",
+    "IM31",
+    "Interrupt Mask on line 31",
+    "IM",
+    "IM{}",
+    "EM0",
+    "Event Mask on line 0",
+    "EM1",
+    "Event Mask on line 1",
+    "EM2",
+    "Event Mask on line 2",
+    "EM3",
+    "Event Mask on line 3",
+    "EM4",
+    "Event Mask on line 4",
+    "EM5",
+    "Event Mask on line 5",
+    "EM6",
+    "Event Mask on line 6",
+    "EM7",
+    "Event Mask on line 7",
+    "EM8",
+    "Event Mask on line 8",
+    "EM9",
+    "Event Mask on line 9",
+    "EM10",
+    "Event Mask on line 10",
+    "EM11",
+    "Event Mask on line 11",
+    "EM12",
+    "Event Mask on line 12",
+    "EM13",
+    "Event Mask on line 13",
+    "EM14",
+    "Event Mask on line 14",
+    "EM15",
+    "Event Mask on line 15",
+    "EM16",
+    "Event Mask on line 16",
+    "EM17",
+    "Event Mask on line 17",
+    "EM18",
+    "Event Mask on line 18",
+    "EM19",
+    "Event Mask on line 19",
+    "EM20",
+    "Event Mask on line 20",
+    "EM21",
+    "Event Mask on line 21",
+    "EM22",
+    "Event Mask on line 22",
+    "EM23",
+    "Event Mask on line 23",
+    "EM24",
+    "Event Mask on line 24",
+    "EM25",
+    "Event Mask on line 25",
+    "EM26",
+    "Event Mask on line 26",
+    "EM27",
+    "Event Mask on line 27",
+    "EM28",
+    "Event Mask on line 28",
+    "EM29",
+    "Event Mask on line 29",
+    "EM30",
+    "Event Mask on line 30",
+    "EM31",
+    "Event Mask on line 31",
+    "EM",
+    "EM{}",
+    "RT0",
+    "Rising trigger event configuration of line 0",
+    "RT1",
+    "Rising trigger event configuration of line 1",
+    "RT2",
+    "Rising trigger event configuration of line 2",
+    "RT3",
+    "Rising trigger event configuration of line 3",
+    "RT4",
+    "Rising trigger event configuration of line 4",
+    "RT5",
+    "Rising trigger event configuration of line 5",
+    "RT6",
+    "Rising trigger event configuration of line 6",
+    "RT7",
+    "Rising trigger event configuration of line 7",
+    "RT8",
+    "Rising trigger event configuration of line 8",
+    "RT9",
+    "Rising trigger event configuration of line 9",
+    "RT10",
+    "Rising trigger event configuration of line 10",
+    "RT11",
+    "Rising trigger event configuration of line 11",
+    "RT12",
+    "Rising trigger event configuration of line 12",
+    "RT13",
+    "Rising trigger event configuration of line 13",
+    "RT14",
+    "Rising trigger event configuration of line 14",
+    "RT15",
+    "Rising trigger event configuration of line 15",
+    "RT16",
+    "Rising trigger event configuration of line 16",
+    "RT18",
+    "Rising trigger event configuration of line 18",
+    "RT19",
+    "Rising trigger event configuration of line 19",
+    "RT20",
+    "Rising trigger event configuration of line 20",
+    "RT21",
+    "Rising trigger event configuration of line 21",
+    "RT22",
+    "Rising trigger event configuration of line 22",
+    "RT",
+    "FT0",
+    "Falling trigger event configuration of line 0",
+    "FT1",
+    "Falling trigger event configuration of line 1",
+    "FT2",
+    "Falling trigger event configuration of line 2",
+    "FT3",
+    "Falling trigger event configuration of line 3",
+    "FT4",
+    "Falling trigger event configuration of line 4",
+    "FT5",
+    "Falling trigger event configuration of line 5",
+    "FT6",
+    "Falling trigger event configuration of line 6",
+    "FT7",
+    "Falling trigger event configuration of line 7",
+    "FT8",
+    "Falling trigger event configuration of line 8",
+    "FT9",
+    "Falling trigger event configuration of line 9",
+    "FT10",
+    "Falling trigger event configuration of line 10",
+    "FT11",
+    "Falling trigger event configuration of line 11",
+    "FT12",
+    "Falling trigger event configuration of line 12",
+    "FT13",
+    "Falling trigger event configuration of line 13",
+    "FT14",
+    "Falling trigger event configuration of line 14",
+    "FT15",
+    "Falling trigger event configuration of line 15",
+    "FT16",
+    "Falling trigger event configuration of line 16",
+    "FT18",
+    "Falling trigger event configuration of line 18",
+    "FT19",
+    "Falling trigger event configuration of line 19",
+    "FT20",
+    "Falling trigger event configuration of line 20",
+    "FT21",
+    "Falling trigger event configuration of line 21",
+    "FT22",
+    "Falling trigger event configuration of line 22",
+    "FT",
+    "FT{}",
+    "SWI0",
+    "Software Interrupt on line 0",
+    "SWI1",
+    "Software Interrupt on line 1",
+    "SWI2",
+    "Software Interrupt on line 2",
+    "SWI3",
+    "Software Interrupt on line 3",
+    "SWI4",
+    "Software Interrupt on line 4",
+    "SWI5",
+    "Software Interrupt on line 5",
+    "SWI6",
+    "Software Interrupt on line 6",
+    "SWI7",
+    "Software Interrupt on line 7",
+    "SWI8",
+    "Software Interrupt on line 8",
+    "SWI9",
+    "Software Interrupt on line 9",
+    "SWI10",
+    "Software Interrupt on line 10",
+    "SWI11",
+    "Software Interrupt on line 11",
+    "SWI12",
+    "Software Interrupt on line 12",
+    "SWI13",
+    "Software Interrupt on line 13",
+    "SWI14",
+    "Software Interrupt on line 14",
+    "SWI15",
+    "Software Interrupt on line 15",
+    "SWI16",
+    "Software Interrupt on line 16",
+    "SWI18",
+    "Software Interrupt on line 18",
+    "SWI19",
+    "Software Interrupt on line 19",
+    "SWI20",
+    "Software Interrupt on line 20",
+    "SWI21",
+    "Software Interrupt on line 21",
+    "SWI22",
+    "Software Interrupt on line 22",
+    "SWI",
+    "SWI{}",
+    "PIF0",
+    "Pending bit 0",
+    "PIF1",
+    "Pending bit 1",
+    "PIF2",
+    "Pending bit 2",
+    "PIF3",
+    "Pending bit 3",
+    "PIF4",
+    "Pending bit 4",
+    "PIF5",
+    "Pending bit 5",
+    "PIF6",
+    "Pending bit 6",
+    "PIF7",
+    "Pending bit 7",
+    "PIF8",
+    "Pending bit 8",
+    "PIF9",
+    "Pending bit 9",
+    "PIF10",
+    "Pending bit 10",
+    "PIF11",
+    "Pending bit 11",
+    "PIF12",
+    "Pending bit 12",
+    "PIF13",
+    "Pending bit 13",
+    "PIF14",
+    "Pending bit 14",
+    "PIF15",
+    "Pending bit 15",
+    "PIF16",
+    "Pending bit 16",
+    "PIF17",
+    "Pending bit 17",
+    "PIF18",
+    "Pending bit 18",
+    "PIF19",
+    "Pending bit 19",
+    "PIF20",
+    "Pending bit 20",
+    "PIF21",
+    "Pending bit 21",
+    "PIF22",
+    "Pending bit 22",
+    "PIF29",
+    "Pending bit 29",
+    "PIF30",
+    "Pending bit 30",
+    "PIF31",
+    "Pending bit 31",
+    "PIF",
+    "PIF{}",
+    "IM32",
+    "Interrupt Mask on external/internal line 32",
+    "IM33",
+    "Interrupt Mask on external/internal line 33",
+    "IM34",
+    "Interrupt Mask on external/internal line 34",
+    "IM35",
+    "Interrupt Mask on external/internal line 35",
+    "IM36",
+    "Interrupt Mask on external/internal line 36",
+    "IM37",
+    "Interrupt Mask on external/internal line 37",
+    "IM38",
+    "Interrupt Mask on external/internal line 38",
+    "IM39",
+    "Interrupt Mask on external/internal line 39",
+    "IM40",
+    "Interrupt Mask on external/internal line 40",
+    "IM41",
+    "Interrupt Mask on external/internal line 41",
+    "IM42",
+    "Interrupt Mask on external/internal line 42",
+    "IM43",
+    "Interrupt Mask on external/internal line 43",
+    "EM32",
+    "Event mask on external/internal line 32",
+    "EM33",
+    "Event mask on external/internal line 33",
+    "EM34",
+    "Event mask on external/internal line 34",
+    "EM35",
+    "Event mask on external/internal line 35",
+    "EM36",
+    "Event mask on external/internal line 36",
+    "EM37",
+    "Event mask on external/internal line 37",
+    "EM38",
+    "Event mask on external/internal line 38",
+    "EM39",
+    "Event mask on external/internal line 39",
+    "EM40",
+    "Event mask on external/internal line 40",
+    "RT32",
+    "Rising trigger event configuration bit of line 32",
+    "RT33",
+    "RT38",
+    "Rising trigger event configuration bit of line 38",
+    "RT39",
+    "Rising trigger event configuration bit of line 39",
+    "RT40",
+    "Rising trigger event configuration bit of line 40",
+    "RT41",
+    "Rising trigger event configuration bit of line 41",
+    "RT{}",
+    "FT35",
+    "Falling trigger event configuration bit of line 35",
+    "FT36",
+    "Falling trigger event configuration bit of line 36",
+    "FT37",
+    "Falling trigger event configuration bit of line 37",
+    "FT38",
+    "Falling trigger event configuration bit of line 38",
+    "SWI35",
+    "Software interrupt on line 35",
+    "SWI36",
+    "Software interrupt on line 36",
+    "SWI37",
+    "Software interrupt on line 37",
+    "SWI38",
+    "Software interrupt on line 38",
+    "PIF35",
+    "Pending interrupt flag on line 35",
+    "PIF36",
+    "Pending interrupt flag on line 36",
+    "PIF37",
+    "Pending interrupt flag on line 37",
+    "PIF38",
+    "Pending interrupt flag on line 38",
+    "IMR1",
+    "Interrupt mask register",
+    "EMR1",
+    "Event mask register",
+    "RTSR1",
+    "Rising Trigger selection register",
+    "FTSR1",
+    "Falling Trigger selection register",
+    "SWIER1",
+    "Software interrupt event register",
+    "PR1",
+    "Pending register",
+    "IMR2",
+    "EMR2",
+    "RTSR2",
+    "FTSR2",
+    "SWIER2",
+    "PR2",
+    "RTSR",
+    "RTSR{}",
+    "SWIER",
+    "SWIER{}",
+    "PR{}",
+    "FTSR",
+    "FTSR{}",
+    "IMR",
+    "IMR{}",
+    "EMR",
+    "EMR{}",
+    "EXTI",
+    "External interrupt/event controller",
+    "PM",
+    "AM/PM notation",
+    "HT",
+    "Hour tens in BCD format",
+    "HU",
+    "Hour units in BCD format",
+    "MNT",
+    "Minute tens in BCD format",
+    "MNU",
+    "Minute units in BCD format",
+    "ST",
+    "Second tens in BCD format",
+    "SU",
+    "Second units in BCD format",
+    "YT",
+    "Year tens in BCD format",
+    "YU",
+    "Year units in BCD format",
+    "WDU",
+    "Week day units",
+    "MT",
+    "Month tens in BCD format",
+    "MU",
+    "Month units in BCD format",
+    "DT",
+    "Date tens in BCD format",
+    "DU",
+    "Date units in BCD format",
+    "SS",
+    "Sub second value",
+    "ALRAWF",
+    "Alarm A write flag",
+    "ALRBWF",
+    "Alarm B write flag",
+    "WUTWF",
+    "Wakeup timer write flag",
+    "SHPF",
+    "Shift operation pending",
+    "INITS",
+    "Initialization status flag",
+    "RSF",
+    "Registers synchronization flag",
+    "INITF",
+    "Initialization flag",
+    "Initialization mode",
+    "RECALPF",
+    "Recalibration pending Flag",
+    "PREDIV_A",
+    "Asynchronous prescaler factor",
+    "PREDIV_S",
+    "Synchronous prescaler factor",
+    "WUT",
+    "Wakeup auto-reload value bits",
+    "WCKSEL",
+    "Wakeup clock selection",
+    "TSEDGE",
+    "Time-stamp event active edge",
+    "REFCKON",
+    "Reference clock detection enable (50 or 60 Hz)",
+    "BYPSHAD",
+    "Bypass the shadow registers",
+    "FMT",
+    "Hour format",
+    "ALRAE",
+    "Alarm A enable",
+    "ALRBE",
+    "Alarm B enable",
+    "WUTE",
+    "Wakeup timer enable",
+    "TSE",
+    "Time stamp enable",
+    "ALRAIE",
+    "Alarm A interrupt enable",
+    "ALRBIE",
+    "Alarm B interrupt enable",
+    "WUTIE",
+    "Wakeup timer interrupt enable",
+    "TSIE",
+    "Time-stamp interrupt enable",
+    "ADD1H",
+    "Add 1 hour (summer time change)",
+    "SUB1H",
+    "Subtract 1 hour (winter time change)",
+    "Backup",
+    "COSEL",
+    "Calibration output selection",
+    "Output polarity",
+    "OSEL",
+    "Output selection",
+    "COE",
+    "Calibration output enable",
+    "ITSE",
+    "timestamp on internal event enable",
+    "TAMPTS",
+    "TAMPOE",
+    "TAMPALRM_PU",
+    "TAMPALRM_TYPE",
+    "OUT2EN",
+    "Write protection key",
+    "CALP",
+    "Increase frequency of RTC by 488.5 ppm",
+    "CALW8",
+    "Use an 8-second calibration cycle period",
+    "CALW16",
+    "Use a 16-second calibration cycle period",
+    "CALM",
+    "Calibration minus",
+    "ADD1S",
+    "Add one second",
+    "SUBFS",
+    "Subtract a fraction of a second",
+    "MSK4",
+    "Alarm A date mask",
+    "WDSEL",
+    "Week day selection",
+    "Date units or day in BCD format",
+    "MSK3",
+    "Alarm A hours mask",
+    "MSK2",
+    "Alarm A minutes mask",
+    "MSK1",
+    "Alarm A seconds mask",
+    "MSK",
+    "MSK{}",
+    "MASKSS",
+    "Mask the most-significant bits starting at this bit",
+    "Sub seconds value",
+    "Alarm B date mask",
+    "Alarm B hours mask",
+    "Alarm B minutes mask",
+    "Alarm B seconds mask",
+    "ALRAF",
+    "ALRBF",
+    "WUTF",
+    "TSF",
+    "TSOVF",
+    "ITSF",
+    "ALRAMF",
+    "ALRBMF",
+    "WUTMF",
+    "TSMF",
+    "TSOVMF",
+    "ITSMF",
+    "CALRAF",
+    "CALRBF",
+    "CWUTF",
+    "CTSF",
+    "CTSOVF",
+    "CITSF",
+    "TR",
+    "time register",
+    "date register",
+    "SSR",
+    "sub second register",
+    "ICSR",
+    "initialization and status register",
+    "PRER",
+    "WUTR",
+    "wakeup timer register",
+    "WPR",
+    "write protection register",
+    "CALR",
+    "calibration register",
+    "SHIFTR",
+    "shift control register",
+    "TSTR",
+    "time stamp time register",
+    "TSDR",
+    "time stamp date register",
+    "TSSSR",
+    "timestamp sub second register",
+    "ALRMAR",
+    "alarm A register",
+    "ALRMASSR",
+    "alarm A sub second register",
+    "ALRMBR",
+    "alarm B register",
+    "ALRMBSSR",
+    "alarm B sub second register",
+    "MISR",
+    "RTC",
+    "Real-time clock",
+    "TEIF8",
+    "HTIF8",
+    "TCIF8",
+    "GIF8",
+    "TEIF7",
+    "HTIF7",
+    "TCIF7",
+    "GIF7",
+    "TEIF6",
+    "HTIF6",
+    "TCIF6",
+    "GIF6",
+    "TEIF5",
+    "HTIF5",
+    "TCIF5",
+    "GIF5",
+    "TEIF4",
+    "HTIF4",
+    "TCIF4",
+    "GIF4",
+    "TEIF3",
+    "HTIF3",
+    "TCIF3",
+    "GIF3",
+    "TEIF2",
+    "HTIF2",
+    "TCIF2",
+    "GIF2",
+    "TEIF1",
+    "HTIF1",
+    "TCIF1",
+    "GIF1",
+    "TEIF",
+    "TEIF{}",
+    "TCIF",
+    "TCIF{}",
+    "HTIF",
+    "HTIF{}",
+    "GIF",
+    "GIF{}",
+    "channel enable",
+    "HTIE",
+    "TEIE",
+    "CIRC",
+    "PINC",
+    "MINC",
+    "PSIZE",
+    "MSIZE",
+    "PL",
+    "MEM2MEM",
+    "NDT",
+    "Number of data items to transfer",
+    "PA",
+    "Peripheral address",
+    "MA",
+    "Memory 1 address (used in case of Double buffer mode)",
+    "interrupt status register",
+    "IFCR",
+    "DMA interrupt flag clear register",
+    "DMA channel 1 configuration register",
+    "DMA channel 2 configuration register",
+    "DMA channel 3 configuration register",
+    "DMA channel 4 configuration register",
+    "DMA channel 5 configuration register",
+    "CCR7",
+    "DMA channel 6 configuration register",
+    "CCR8",
+    "DMA channel 7 configuration register",
+    "CNDTR1",
+    "channel x number of data to transfer register",
+    "CNDTR2",
+    "CNDTR3",
+    "CNDTR4",
+    "CNDTR5",
+    "CNDTR6",
+    "CNDTR7",
+    "CNDTR8",
+    "CPAR1",
+    "DMA channel x peripheral address register",
+    "CPAR2",
+    "CPAR3",
+    "CPAR4",
+    "CPAR5",
+    "CPAR6",
+    "CPAR7",
+    "CPAR8",
+    "CMAR1",
+    "DMA channel x memory address register",
+    "CMAR2",
+    "CMAR3",
+    "CMAR4",
+    "CMAR5",
+    "CMAR6",
+    "CMAR7",
+    "CMAR8",
+    "CPAR",
+    "CPAR{}",
+    "CMAR",
+    "CMAR{}",
+    "CNDTR",
+    "CNDTR{}",
+    "DMA1",
+    "DMA controller",
+    "DMA2",
+    "DMAREQ_ID",
+    "Input DMA request line selected",
+    "SOIE",
+    "Interrupt enable at synchronization event overrun",
+    "EGE",
+    "Event generation enable/disable",
+    "SE",
+    "Synchronous operating mode enable/disable",
+    "SPOL",
+    "Synchronization event type selector Defines the synchronization event on the selected synchronization input:",
+    "NBREQ",
+    "Number of DMA requests to forward Defines the number of DMA requests forwarded before output event is generated. In synchronous mode, it also defines the number of DMA requests to forward after a synchronization event, then stop forwarding. The actual number of DMA requests forwarded is NBREQ+1. Note: This field can only be written when both SE and EGE bits are reset.",
+    "SYNC_ID",
+    "Synchronization input selected",
+    "SIG_ID",
+    "DMA request trigger input selected",
+    "OIE",
+    "Interrupt enable at trigger event overrun",
+    "GE",
+    "DMA request generator channel enable/disable",
+    "GPOL",
+    "DMA request generator trigger event type selection Defines the trigger event on the selected DMA request trigger input",
+    "GNBREQ",
+    "Number of DMA requests to generate Defines the number of DMA requests generated after a trigger event, then stop generating. The actual number of generated DMA requests is GNBREQ+1. Note: This field can only be written when GE bit is reset.",
+    "OF",
+    "Trigger event overrun flag The flag is set when a trigger event occurs on DMA request generator channel x, while the DMA request generator counter value is lower than GNBREQ. The flag is cleared by writing 1 to the corresponding COFx bit in DMAMUX_RGCFR register.",
+    "COF",
+    "Clear trigger event overrun flag Upon setting, this bit clears the corresponding overrun flag OFx in the DMAMUX_RGCSR register.",
+    "SOF",
+    "Synchronization overrun event flag",
+    "CSOF",
+    "Clear synchronization overrun event flag",
+    "C0CR",
+    "DMAMux - DMA request line multiplexer channel x control register",
+    "C1CR",
+    "C2CR",
+    "C3CR",
+    "C4CR",
+    "C5CR",
+    "C6CR",
+    "C7CR",
+    "C8CR",
+    "C9CR",
+    "C10CR",
+    "C11CR",
+    "C12CR",
+    "C13CR",
+    "C14CR",
+    "C15CR",
+    "RG0CR",
+    "DMAMux - DMA request generator channel x control register",
+    "RG1CR",
+    "RG2CR",
+    "RG3CR",
+    "RGSR",
+    "DMAMux - DMA request generator status register",
+    "RGCFR",
+    "DMAMux - DMA request generator clear flag register",
+    "DMAMUX request line multiplexer interrupt channel status register",
+    "DMAMUX request line multiplexer interrupt clear flag register",
+    "C{}CR",
+    "RGCR",
+    "RG{}CR",
+    "DMAMUX",
+    "MEM_MODE",
+    "Memory mapping selection",
+    "FB_mode",
+    "User Flash Bank mode",
+    "BOOSTEN",
+    "ANASWVDD",
+    "GPIO analog switch control voltage selection",
+    "I2C_PB6_FMP",
+    "FM+ drive capability on PB6",
+    "I2C_PB7_FMP",
+    "I2C_PB8_FMP",
+    "I2C_PB9_FMP",
+    "I2C1_FMP",
+    "I2C1 FM+ drive capability enable",
+    "I2C2_FMP",
+    "I2C3_FMP",
+    "I2C4_FMP",
+    "FPU_IE",
+    "FPU Interrupts Enable",
+    "I2C_PB_FMP",
+    "I2C_PB{}_FMP",
+    "I2C_FMP",
+    "I2C{}_FMP",
+    "EXTI3",
+    "EXTI x configuration (x = 0 to 3)",
+    "EXTI2",
+    "EXTI1",
+    "EXTI0",
+    "EXTI{}",
+    "EXTI7",
+    "EXTI x configuration (x = 4 to 7)",
+    "EXTI6",
+    "EXTI5",
+    "EXTI4",
+    "EXTI11",
+    "EXTI x configuration (x = 8 to 11)",
+    "EXTI10",
+    "EXTI9",
+    "EXTI8",
+    "EXTI15",
+    "EXTI x configuration (x = 12 to 15)",
+    "EXTI14",
+    "EXTI13",
+    "EXTI12",
+    "CCMER",
+    "CCM SRAM Erase",
+    "CCMBSY",
+    "CCM SRAM busy by erase operation",
+    "CLL",
+    "Core Lockup Lock",
+    "SPL",
+    "SRAM Parity Lock",
+    "PVDL",
+    "PVD Lock",
+    "ECCL",
+    "ECC Lock",
+    "SPF",
+    "SRAM Parity Flag",
+    "Page0_WP",
+    "Write protection",
+    "Page1_WP",
+    "Page2_WP",
+    "Page3_WP",
+    "Page4_WP",
+    "Page5_WP",
+    "Page6_WP",
+    "Page7_WP",
+    "Page8_WP",
+    "Page9_WP",
+    "Page10_WP",
+    "Page11_WP",
+    "Page12_WP",
+    "Page13_WP",
+    "Page14_WP",
+    "Page15_WP",
+    "Page16_WP",
+    "Page17_WP",
+    "Page18_WP",
+    "Page19_WP",
+    "Page20_WP",
+    "Page21_WP",
+    "Page22_WP",
+    "Page23_WP",
+    "Page24_WP",
+    "Page25_WP",
+    "Page26_WP",
+    "Page27_WP",
+    "Page28_WP",
+    "Page29_WP",
+    "Page30_WP",
+    "Page31_WP",
+    "Page_WP",
+    "Page{}_WP",
+    "SRAM2 Key for software erase",
+    "MEMRMP",
+    "Remap Memory register",
+    "CFGR1",
+    "peripheral mode configuration register",
+    "EXTICR1",
+    "external interrupt configuration register 1",
+    "EXTICR2",
+    "external interrupt configuration register 2",
+    "EXTICR3",
+    "external interrupt configuration register 3",
+    "EXTICR4",
+    "external interrupt configuration register 4",
+    "SCSR",
+    "CCM SRAM control and status register",
+    "CFGR2",
+    "configuration register 2",
+    "SWPR",
+    "SRAM Write protection register 1",
+    "SKR",
+    "SRAM2 Key Register",
+    "CFGR{}",
+    "EXTICR",
+    "EXTICR{}",
+    "SYSCFG",
+    "System configuration controller",
+    "ENVR",
+    "Enable Voltage Reference",
+    "HIZ",
+    "High impedence mode for the VREF_BUF",
+    "VRR",
+    "Voltage reference buffer ready",
+    "VRS",
+    "Voltage reference scale",
+    "TRIM",
+    "Trimming code",
+    "VREF_BUF Control and Status Register",
+    "VREF_BUF Calibration Control Register",
+    "VREFBUF",
+    "Voltage reference buffer",
+    "INMSEL",
+    "INPSEL",
+    "HYST",
+    "BLANKSEL",
+    "BRGEN",
+    "SCALEN",
+    "VALUE",
+    "C1CSR",
+    "Comparator control/status register",
+    "C2CSR",
+    "C3CSR",
+    "C4CSR",
+    "CCSR",
+    "C{}CSR",
+    "COMP",
+    "Comparator control and status register",
+    "OPAEN",
+    "Operational amplifier Enable",
+    "FORCE_VP",
+    "VP_SEL",
+    "USERTRIM",
+    "VM_SEL",
+    "OPAHSM",
+    "OPAINTOEN",
+    "CALON",
+    "CALSEL",
+    "PGA_GAIN",
+    "TRIMOFFSETP",
+    "TRIMOFFSETN",
+    "CALOUT",
+    "VMS_SEL",
+    "VPS_SEL",
+    "T1CM_EN",
+    "T8CM_EN",
+    "T20CM_EN",
+    "OPAMP1_CSR",
+    "OPAMP1 control/status register",
+    "OPAMP2_CSR",
+    "OPAMP2 control/status register",
+    "OPAMP3_CSR",
+    "OPAMP3 control/status register",
+    "OPAMP1_TCMR",
+    "OPAMP2_TCMR",
+    "OPAMP3_TCMR",
+    "OPAMP_CSR",
+    "OPAMP{}_CSR",
+    "OPAMP_TCMR",
+    "OPAMP{}_TCMR",
+    "OPAMP",
+    "Operational amplifiers",
+    "EN1",
+    "DAC channel1 enable This bit is set and cleared by software to enable/disable DAC channel1.",
+    "TEN1",
+    "DAC channel1 trigger enable",
+    "TSEL1",
+    "DAC channel1 trigger selection These bits select the external event used to trigger DAC channel1. Note: Only used if bit TEN1 = 1 (DAC channel1 trigger enabled).",
+    "WAVE1",
+    "DAC channel1 noise/triangle wave generation enable These bits are set and cleared by software. Note: Only used if bit TEN1 = 1 (DAC channel1 trigger enabled).",
+    "MAMP1",
+    "DAC channel1 mask/amplitude selector These bits are written by software to select mask in wave generation mode or amplitude in triangle generation mode. = 1011: Unmask bits[11:0] of LFSR/ triangle amplitude equal to 4095",
+    "DMAEN1",
+    "DAC channel1 DMA enable This bit is set and cleared by software.",
+    "DMAUDRIE1",
+    "DAC channel1 DMA Underrun Interrupt enable This bit is set and cleared by software.",
+    "CEN1",
+    "DAC Channel 1 calibration enable This bit is set and cleared by software to enable/disable DAC channel 1 calibration, it can be written only if bit EN1=0 into DAC_CR (the calibration mode can be entered/exit only when the DAC channel is disabled) Otherwise, the write operation is ignored.",
+    "EN2",
+    "DAC channel2 enable This bit is set and cleared by software to enable/disable DAC channel2.",
+    "TEN2",
+    "DAC channel2 trigger enable",
+    "TSEL2",
+    "DAC channel2 trigger selection These bits select the external event used to trigger DAC channel2 Note: Only used if bit TEN2 = 1 (DAC channel2 trigger enabled).",
+    "WAVE2",
+    "DAC channel2 noise/triangle wave generation enable These bits are set/reset by software. 1x: Triangle wave generation enabled Note: Only used if bit TEN2 = 1 (DAC channel2 trigger enabled)",
+    "MAMP2",
+    "DAC channel2 mask/amplitude selector These bits are written by software to select mask in wave generation mode or amplitude in triangle generation mode. = 1011: Unmask bits[11:0] of LFSR/ triangle amplitude equal to 4095",
+    "DMAEN2",
+    "DAC channel2 DMA enable This bit is set and cleared by software.",
+    "DMAUDRIE2",
+    "DAC channel2 DMA underrun interrupt enable This bit is set and cleared by software.",
+    "CEN2",
+    "DAC Channel 2 calibration enable This bit is set and cleared by software to enable/disable DAC channel 2 calibration, it can be written only if bit EN2=0 into DAC_CR (the calibration mode can be entered/exit only when the DAC channel is disabled) Otherwise, the write operation is ignored.",
+    "TSEL",
+    "TSEL{}",
+    "TEN",
+    "TEN{}",
+    "EN{}",
+    "DMAEN{}",
+    "CEN{}",
+    "WAVE{}",
+    "MAMP",
+    "MAMP{}",
+    "DMAUDRIE",
+    "DMAUDRIE{}",
+    "SWTRIG1",
+    "DAC channel1 software trigger This bit is set by software to trigger the DAC in software trigger mode. Note: This bit is cleared by hardware (one APB1 clock cycle later) once the DAC_DHR1 register value has been loaded into the DAC_DOR1 register.",
+    "SWTRIG2",
+    "DAC channel2 software trigger This bit is set by software to trigger the DAC in software trigger mode. Note: This bit is cleared by hardware (one APB1 clock cycle later) once the DAC_DHR2 register value has been loaded into the DAC_DOR2 register.",
+    "SWTRIGB1",
+    "DAC channel1 software trigger B",
+    "SWTRIGB2",
+    "DAC channel2 software trigger B",
+    "SWTRIG",
+    "SWTRIG{}",
+    "SWTRIGB",
+    "SWTRIGB{}",
+    "DACC1DHR",
+    "DAC channel1 12-bit right-aligned data These bits are written by software which specifies 12-bit data for DAC channel1.",
+    "DACC1DHRB",
+    "DAC channel1 12-bit right-aligned data B",
+    "DAC channel1 12-bit left-aligned data These bits are written by software which specifies 12-bit data for DAC channel1.",
+    "DAC channel1 12-bit left-aligned data B",
+    "DAC channel1 8-bit right-aligned data These bits are written by software which specifies 8-bit data for DAC channel1.",
+    "DAC channel1 8-bit right-aligned data",
+    "DACC2DHR",
+    "DAC channel2 12-bit right-aligned data These bits are written by software which specifies 12-bit data for DAC channel2.",
+    "DACC2DHRB",
+    "DAC channel2 12-bit right-aligned data",
+    "DAC channel2 12-bit left-aligned data These bits are written by software which specify 12-bit data for DAC channel2.",
+    "DAC channel2 12-bit left-aligned data B",
+    "DAC channel2 8-bit right-aligned data These bits are written by software which specifies 8-bit data for DAC channel2.",
+    "DAC channel2 8-bit right-aligned data",
+    "DACCDHR",
+    "DACC{}DHR",
+    "DAC channel2 12-bit left-aligned data These bits are written by software which specifies 12-bit data for DAC channel2.",
+    "DACC1DOR",
+    "DAC channel1 data output These bits are read-only, they contain data output for DAC channel1.",
+    "DACC1DORB",
+    "DAC channel1 data output",
+    "DACC2DOR",
+    "DAC channel2 data output These bits are read-only, they contain data output for DAC channel2.",
+    "DACC2DORB",
+    "DAC channel2 data output",
+    "DAC1RDY",
+    "DAC channel1 ready status bit",
+    "DORSTAT1",
+    "DAC channel1 output register status bit",
+    "DMAUDR1",
+    "DAC channel1 DMA underrun flag This bit is set by hardware and cleared by software (by writing it to 1).",
+    "CAL_FLAG1",
+    "DAC Channel 1 calibration offset status This bit is set and cleared by hardware",
+    "BWST1",
+    "DAC Channel 1 busy writing sample time flag This bit is systematically set just after Sample & Hold mode enable and is set each time the software writes the register DAC_SHSR1, It is cleared by hardware when the write operation of DAC_SHSR1 is complete. (It takes about 3LSI periods of synchronization).",
+    "DAC2RDY",
+    "DAC channel 2 ready status bit",
+    "DORSTAT2",
+    "DAC channel 2 output register status bit",
+    "DMAUDR2",
+    "DAC channel2 DMA underrun flag This bit is set by hardware and cleared by software (by writing it to 1).",
+    "CAL_FLAG2",
+    "DAC Channel 2 calibration offset status This bit is set and cleared by hardware",
+    "BWST2",
+    "DAC Channel 2 busy writing sample time flag This bit is systematically set just after Sample & Hold mode enable and is set each time the software writes the register DAC_SHSR2, It is cleared by hardware when the write operation of DAC_SHSR2 is complete. (It takes about 3 LSI periods of synchronization).",
+    "DORSTAT",
+    "DORSTAT{}",
+    "DMAUDR",
+    "DMAUDR{}",
+    "BWST",
+    "BWST{}",
+    "CAL_FLAG",
+    "CAL_FLAG{}",
+    "DACRDY",
+    "DAC{}RDY",
+    "OTRIM1",
+    "DAC Channel 1 offset trimming value",
+    "OTRIM2",
+    "DAC Channel 2 offset trimming value",
+    "OTRIM",
+    "OTRIM{}",
+    "MODE1",
+    "DAC Channel 1 mode These bits can be written only when the DAC is disabled and not in the calibration mode (when bit EN1=0 and bit CEN1 =0 in the DAC_CR register). If EN1=1 or CEN1 =1 the write operation is ignored. They can be set and cleared by software to select the DAC Channel 1 mode: DAC Channel 1 in normal Mode DAC Channel 1 in sample &amp; hold mode",
+    "DMADOUBLE1",
+    "DAC Channel1 DMA double data mode",
+    "SINFORMAT1",
+    "Enable signed format for DAC channel1",
+    "HFSEL",
+    "High frequency interface mode selection",
+    "MODE2",
+    "DAC Channel 2 mode These bits can be written only when the DAC is disabled and not in the calibration mode (when bit EN2=0 and bit CEN2 =0 in the DAC_CR register). If EN2=1 or CEN2 =1 the write operation is ignored. They can be set and cleared by software to select the DAC Channel 2 mode: DAC Channel 2 in normal Mode DAC Channel 2 in sample &amp; hold mode",
+    "DMADOUBLE2",
+    "DAC Channel2 DMA double data mode",
+    "SINFORMAT2",
+    "Enable signed format for DAC channel2",
+    "DMADOUBLE",
+    "DMADOUBLE{}",
+    "MODE{}",
+    "SINFORMAT",
+    "SINFORMAT{}",
+    "TSAMPLE1",
+    "DAC Channel 1 sample Time (only valid in sample &amp; hold mode) These bits can be written when the DAC channel1 is disabled or also during normal operation. in the latter case, the write can be done only when BWSTx of DAC_SR register is low, If BWSTx=1, the write operation is ignored.",
+    "TSAMPLE2",
+    "DAC Channel 2 sample Time (only valid in sample &amp; hold mode) These bits can be written when the DAC channel2 is disabled or also during normal operation. in the latter case, the write can be done only when BWSTx of DAC_SR register is low, if BWSTx=1, the write operation is ignored.",
+    "THOLD1",
+    "DAC Channel 1 hold Time (only valid in sample &amp; hold mode) Hold time= (THOLD[9:0]) x T LSI",
+    "THOLD2",
+    "DAC Channel 2 hold time (only valid in sample &amp; hold mode). Hold time= (THOLD[9:0]) x T LSI",
+    "THOLD",
+    "THOLD{}",
+    "TREFRESH1",
+    "DAC Channel 1 refresh Time (only valid in sample &amp; hold mode) Refresh time= (TREFRESH[7:0]) x T LSI",
+    "TREFRESH2",
+    "DAC Channel 2 refresh Time (only valid in sample &amp; hold mode) Refresh time= (TREFRESH[7:0]) x T LSI",
+    "TREFRESH",
+    "TREFRESH{}",
+    "STRSTDATA1",
+    "DAC Channel 1 Sawtooth reset value",
+    "STDIR1",
+    "DAC Channel1 Sawtooth direction setting",
+    "STINCDATA1",
+    "DAC CH1 Sawtooth increment value (12.4 bit format)",
+    "STRSTDATA2",
+    "DAC Channel 2 Sawtooth reset value",
+    "STDIR2",
+    "DAC Channel2 Sawtooth direction setting",
+    "STINCDATA2",
+    "DAC CH2 Sawtooth increment value (12.4 bit format)",
+    "STRSTTRIGSEL1",
+    "DAC Channel 1 Sawtooth Reset trigger selection",
+    "STINCTRIGSEL1",
+    "DAC Channel 1 Sawtooth Increment trigger selection",
+    "STRSTTRIGSEL2",
+    "STINCTRIGSEL2",
+    "DAC Channel 2 Sawtooth Increment trigger selection",
+    "STRSTTRIGSEL",
+    "STRSTTRIGSEL{}",
+    "STINCTRIGSEL",
+    "STINCTRIGSEL{}",
+    "DAC control register",
+    "SWTRGR",
+    "DAC software trigger register",
+    "DHR12R1",
+    "DAC channel1 12-bit right-aligned data holding register",
+    "DHR12L1",
+    "DAC channel1 12-bit left aligned data holding register",
+    "DHR8R1",
+    "DAC channel1 8-bit right aligned data holding register",
+    "DHR12R2",
+    "DAC channel2 12-bit right aligned data holding register",
+    "DHR12L2",
+    "DAC channel2 12-bit left aligned data holding register",
+    "DHR8R2",
+    "DAC channel2 8-bit right-aligned data holding register",
+    "DHR12RD",
+    "Dual DAC 12-bit right-aligned data holding register",
+    "DHR12LD",
+    "DUAL DAC 12-bit left aligned data holding register",
+    "DHR8RD",
+    "DUAL DAC 8-bit right aligned data holding register",
+    "DOR1",
+    "DAC channel1 data output register",
+    "DOR2",
+    "DAC channel2 data output register",
+    "DAC status register",
+    "DAC calibration control register",
+    "MCR",
+    "DAC mode control register",
+    "SHSR1",
+    "DAC Sample and Hold sample time register 1",
+    "SHSR2",
+    "DAC Sample and Hold sample time register 2",
+    "SHHR",
+    "DAC Sample and Hold hold time register",
+    "SHRR",
+    "DAC Sample and Hold refresh time register",
+    "STR1",
+    "Sawtooth register",
+    "STR2",
+    "STMODR",
+    "Sawtooth Mode register",
+    "DHR12L",
+    "DHR12L{}",
+    "DHR8R",
+    "DHR8R{}",
+    "DOR",
+    "DOR{}",
+    "SHSR",
+    "SHSR{}",
+    "STR",
+    "STR{}",
+    "DHR12R",
+    "DHR12R{}",
+    "DAC1",
+    "Digital-to-analog converter",
+    "DAC2",
+    "DAC3",
+    "DAC4",
+    "JQOVF",
+    "AWD3",
+    "AWD2",
+    "AWD1",
+    "JEOS",
+    "JEOC",
+    "EOS",
+    "EOC",
+    "EOSMP",
+    "ADRDY",
+    "AWD",
+    "AWD{}",
+    "JQOVFIE",
+    "AWD3IE",
+    "AWD2IE",
+    "AWD1IE",
+    "JEOSIE",
+    "JEOCIE",
+    "OVRIE",
+    "EOSIE",
+    "EOCIE",
+    "EOSMPIE",
+    "ADRDYIE",
+    "AWDIE",
+    "AWD{}IE",
+    "ADCAL",
+    "ADCALDIF",
+    "DEEPPWD",
+    "ADVREGEN",
+    "JADSTP",
+    "ADSTP",
+    "JADSTART",
+    "ADSTART",
+    "ADDIS",
+    "ADEN",
+    "JQDIS",
+    "Injected Queue disable",
+    "AWD1CH",
+    "Analog watchdog 1 channel selection",
+    "JAUTO",
+    "JAWD1EN",
+    "AWD1EN",
+    "AWD1SGL",
+    "JQM",
+    "JDISCEN",
+    "DISCNUM",
+    "DISCEN",
+    "ALIGN",
+    "AUTDLY",
+    "CONT",
+    "OVRMOD",
+    "EXTEN",
+    "EXTSEL",
+    "External trigger selection for regular group",
+    "RES",
+    "DMACFG",
+    "SMPTRIG",
+    "BULB",
+    "GCOMP",
+    "ROVSM",
+    "TROVS",
+    "Triggered Regular Oversampling",
+    "OVSS",
+    "OVSR",
+    "JOVSE",
+    "ROVSE",
+    "SMP9",
+    "SMP8",
+    "SMP7",
+    "SMP6",
+    "SMP5",
+    "SMP4",
+    "SMP3",
+    "SMP2",
+    "SMP1",
+    "SMPPLUS",
+    "Addition of one clock cycle to the sampling time",
+    "SMP0",
+    "SMP",
+    "SMP{}",
+    "SMP18",
+    "SMP17",
+    "SMP16",
+    "SMP15",
+    "SMP14",
+    "SMP13",
+    "SMP12",
+    "SMP11",
+    "SMP10",
+    "HT1",
+    "AWDFILT",
+    "LT1",
+    "HT2",
+    "LT2",
+    "HT3",
+    "LT3",
+    "SQ4",
+    "SQ3",
+    "SQ2",
+    "SQ1",
+    "L",
+    "Regular channel sequence length",
+    "SQ",
+    "SQ{}",
+    "SQ9",
+    "SQ8",
+    "SQ7",
+    "SQ6",
+    "SQ5",
+    "SQ14",
+    "SQ13",
+    "SQ12",
+    "SQ11",
+    "SQ10",
+    "SQ16",
+    "SQ15",
+    "RDATA",
+    "Regular Data converted",
+    "JSQ4",
+    "JSQ3",
+    "JSQ2",
+    "JSQ1",
+    "JEXTEN",
+    "JEXTSEL",
+    "JL",
+    "JSQ",
+    "JSQ{}",
+    "OFFSET1_EN",
+    "OFFSET1_CH",
+    "SATEN",
+    "OFFSETPOS",
+    "OFFSET1",
+    "JDATA1",
+    "JDATA2",
+    "JDATA3",
+    "JDATA4",
+    "AWD2CH",
+    "AWD3CH",
+    "DIFSEL_0",
+    "Differential mode for channels 0",
+    "DIFSEL_1_18",
+    "Differential mode for channels 15 to 1",
+    "CALFACT_D",
+    "CALFACT_S",
+    "GCOMPCOEFF",
+    "interrupt and status register",
+    "interrupt enable register",
+    "SMPR1",
+    "sample time register 1",
+    "SMPR2",
+    "sample time register 2",
+    "TR1",
+    "watchdog threshold register 1",
+    "TR2",
+    "watchdog threshold register",
+    "TR3",
+    "watchdog threshold register 3",
+    "SQR1",
+    "regular sequence register 1",
+    "SQR2",
+    "regular sequence register 2",
+    "SQR3",
+    "regular sequence register 3",
+    "SQR4",
+    "regular sequence register 4",
+    "regular Data Register",
+    "JSQR",
+    "injected sequence register",
+    "OFR1",
+    "offset register 1",
+    "OFR2",
+    "offset register 2",
+    "OFR3",
+    "offset register 3",
+    "OFR4",
+    "offset register 4",
+    "JDR1",
+    "injected data register 1",
+    "JDR2",
+    "injected data register 2",
+    "JDR3",
+    "injected data register 3",
+    "JDR4",
+    "injected data register 4",
+    "AWD2CR",
+    "Analog Watchdog 2 Configuration Register",
+    "AWD3CR",
+    "Analog Watchdog 3 Configuration Register",
+    "DIFSEL",
+    "Differential Mode Selection Register 2",
+    "CALFACT",
+    "Calibration Factors",
+    "Gain compensation Register",
+    "SQR",
+    "SQR{}",
+    "SMPR",
+    "SMPR{}",
+    "AWDCR",
+    "AWD{}CR",
+    "OFR",
+    "OFR{}",
+    "JDR",
+    "JDR{}",
+    "TR{}",
+    "ADC1",
+    "Analog-to-Digital Converter",
+    "ADC2",
+    "ADDRDY_MST",
+    "EOSMP_MST",
+    "EOC_MST",
+    "EOS_MST",
+    "OVR_MST",
+    "JEOC_MST",
+    "JEOS_MST",
+    "AWD1_MST",
+    "AWD2_MST",
+    "AWD3_MST",
+    "JQOVF_MST",
+    "ADRDY_SLV",
+    "EOSMP_SLV",
+    "EOC_SLV",
+    "End of regular conversion of the slave ADC",
+    "EOS_SLV",
+    "End of regular sequence flag of the slave ADC",
+    "OVR_SLV",
+    "Overrun flag of the slave ADC",
+    "JEOC_SLV",
+    "End of injected conversion flag of the slave ADC",
+    "JEOS_SLV",
+    "End of injected sequence flag of the slave ADC",
+    "AWD1_SLV",
+    "Analog watchdog 1 flag of the slave ADC",
+    "AWD2_SLV",
+    "Analog watchdog 2 flag of the slave ADC",
+    "AWD3_SLV",
+    "Analog watchdog 3 flag of the slave ADC",
+    "JQOVF_SLV",
+    "Injected Context Queue Overflow flag of the slave ADC",
+    "AWD_SLV",
+    "AWD{}_SLV",
+    "AWD_MST",
+    "AWD{}_MST",
+    "DUAL",
+    "Dual ADC mode selection",
+    "DELAY",
+    "Delay between 2 sampling phases",
+    "DMA configuration (for multi-ADC mode)",
+    "MDMA",
+    "Direct memory access mode for multi ADC mode",
+    "CKMODE",
+    "ADC clock mode",
+    "VREFEN",
+    "VREFINT enable",
+    "VSENSESEL",
+    "VTS selection",
+    "VBATSEL",
+    "VBAT selection",
+    "ADC prescaler",
+    "RDATA_SLV",
+    "Regular data of the slave ADC",
+    "RDATA_MST",
+    "Regular data of the master ADC",
+    "ADC Common status register",
+    "ADC common control register",
+    "CDR",
+    "ADC common regular data register for dual and triple modes",
+    "ADC12_Common",
+    "ADC345_Common",
+    "X1_BASE",
+    "X1_BUF_SIZE",
+    "FULL_WM",
+    "X2_BASE",
+    "X2_BUF_SIZE",
+    "Y_BASE",
+    "Y_BUF_SIZE",
+    "EMPTY_WM",
+    "FUNC",
+    "R",
+    "Q",
+    "P",
+    "CLIPEN",
+    "DMAWEN",
+    "DMAREN",
+    "SATIEN",
+    "UNFLIEN",
+    "OVFLIEN",
+    "WIEN",
+    "RIEN",
+    "YEMPTY",
+    "X1FULL",
+    "OVFL",
+    "UNFL",
+    "SAT",
+    "WDATA",
+    "X1BUFCFG",
+    "FMAC X1 Buffer Configuration register",
+    "X2BUFCFG",
+    "FMAC X2 Buffer Configuration register",
+    "YBUFCFG",
+    "FMAC Y Buffer Configuration register",
+    "PARAM",
+    "FMAC Parameter register",
+    "FMAC Control register",
+    "FMAC Status register",
+    "FMAC Write Data register",
+    "FMAC Read Data register",
+    "XBUFCFG",
+    "X{}BUFCFG",
+    "FMAC",
+    "Filter Math Accelerator",
+    "PRECISION",
+    "SCALE",
+    "IEN",
+    "NRES",
+    "NARGS",
+    "RESSIZE",
+    "ARGSIZE",
+    "RRDY",
+    "ARG",
+    "CORDIC Control Status register",
+    "CORDIC",
+    "CORDIC Co-processor",
+    "MCKEN",
+    "OSR",
+    "MCJDIV",
+    "Master clock divider",
+    "NODIV",
+    "No divider",
+    "DMA enable",
+    "SAIBEN",
+    "Audio block B enable",
+    "OutDri",
+    "Output drive",
+    "MONO",
+    "Mono mode",
+    "SYNCEN",
+    "Synchronization enable",
+    "CKSTR",
+    "Clock strobing edge",
+    "Least significant bit first",
+    "PRTCFG",
+    "Protocol configuration",
+    "Audio block mode",
+    "Companding mode",
+    "CPL",
+    "Complement bit",
+    "MUTECN",
+    "Mute counter",
+    "MUTEVAL",
+    "Mute value",
+    "MUTE",
+    "Mute",
+    "TRIS",
+    "Tristate management on data line",
+    "FFLUS",
+    "FIFO flush",
+    "FTH",
+    "FIFO threshold",
+    "FSOFF",
+    "Frame synchronization offset",
+    "FSPOL",
+    "Frame synchronization polarity",
+    "FSDEF",
+    "Frame synchronization definition",
+    "FSALL",
+    "Frame synchronization active level length",
+    "FRL",
+    "Frame length",
+    "SLOTEN",
+    "Slot enable",
+    "NBSLOT",
+    "Number of slots in an audio frame",
+    "SLOTSZ",
+    "Slot size",
+    "FBOFF",
+    "First bit offset",
+    "LFSDETIE",
+    "Late frame synchronization detection interrupt enable",
+    "AFSDETIE",
+    "Anticipated frame synchronization detection interrupt enable",
+    "CNRDYIE",
+    "Codec not ready interrupt enable",
+    "FREQIE",
+    "FIFO request interrupt enable",
+    "WCKCFG",
+    "Wrong clock configuration interrupt enable",
+    "MUTEDET",
+    "Mute detection interrupt enable",
+    "OVRUDRIE",
+    "Overrun/underrun interrupt enable",
+    "FLVL",
+    "FIFO level threshold",
+    "LFSDET",
+    "Late frame synchronization detection",
+    "AFSDET",
+    "Anticipated frame synchronization detection",
+    "CNRDY",
+    "Codec not ready",
+    "FREQ",
+    "FIFO request",
+    "Wrong clock configuration flag",
+    "Mute detection",
+    "OVRUDR",
+    "Overrun / underrun",
+    "Clear late frame synchronization detection flag",
+    "CAFSDET",
+    "Clear anticipated frame synchronization detection flag",
+    "Clear codec not ready flag",
+    "Clear wrong clock configuration flag",
+    "Mute detection flag",
+    "Clear overrun / underrun",
+    "DATA",
+    "Data",
+    "SAIAEN",
+    "Audio block A enable",
+    "Wrong clock configuration flag. This bit is read only",
+    "PDMEN",
+    "MICNBR",
+    "CKEN1",
+    "CKEN2",
+    "CKEN3",
+    "CKEN4",
+    "CKEN",
+    "CKEN{}",
+    "DLYM1L",
+    "DLYM1R",
+    "DLYM2L",
+    "DLYM2R",
+    "DLYM3L",
+    "DLYM3R",
+    "DLYM4L",
+    "DLYM4R",
+    "DLYMR",
+    "DLYM{}R",
+    "DLYML",
+    "DLYM{}L",
+    "BCR1",
+    "BConfiguration register 1",
+    "BCR2",
+    "BConfiguration register 2",
+    "BFRCR",
+    "BSLOTR",
+    "BSlot register",
+    "BIM",
+    "BInterrupt mask register2",
+    "BSR",
+    "BStatus register",
+    "BCLRFR",
+    "BClear flag register",
+    "BDR",
+    "BData register",
+    "ACR1",
+    "AConfiguration register 1",
+    "ACR2",
+    "AConfiguration register 2",
+    "AFRCR",
+    "ASLOTR",
+    "ASlot register",
+    "AIM",
+    "AInterrupt mask register2",
+    "ASR",
+    "AStatus register",
+    "ACLRFR",
+    "AClear flag register",
+    "ADR",
+    "AData register",
+    "PDMCR",
+    "PDM control register",
+    "PDMDLY",
+    "PDM delay register",
+    "ACR{}",
+    "BCR",
+    "BCR{}",
+    "SAI",
+    "Serial audio interface",
+    "TAMP1E",
+    "TAMP2E",
+    "TAMP3E",
+    "ITAMP3E",
+    "ITAMP4E",
+    "ITAMP5E",
+    "ITAMP6E",
+    "TAMPE",
+    "TAMP{}E",
+    "ITAMPE",
+    "ITAMP{}E",
+    "TAMP1NOER",
+    "TAMP2NOER",
+    "TAMP3NOER",
+    "TAMP1MSK",
+    "TAMP2MSK",
+    "TAMP3MSK",
+    "TAMP1TRG",
+    "TAMP2TRG",
+    "TAMP3TRG",
+    "TAMPMSK",
+    "TAMP{}MSK",
+    "TAMPNOER",
+    "TAMP{}NOER",
+    "TAMPTRG",
+    "TAMP{}TRG",
+    "TAMPFREQ",
+    "TAMPFLT",
+    "TAMPPRCH",
+    "TAMPPUDIS",
+    "TAMP1IE",
+    "TAMP2IE",
+    "TAMP3IE",
+    "ITAMP3IE",
+    "ITAMP4IE",
+    "ITAMP5IE",
+    "ITAMP6IE",
+    "TAMPIE",
+    "TAMP{}IE",
+    "ITAMPIE",
+    "ITAMP{}IE",
+    "TAMP1F",
+    "TAMP2F",
+    "TAMP3F",
+    "ITAMP3F",
+    "ITAMP4F",
+    "ITAMP5F",
+    "ITAMP6F",
+    "ITAMPF",
+    "ITAMP{}F",
+    "TAMPF",
+    "TAMP{}F",
+    "TAMP1MF",
+    "TAMP1MF:",
+    "TAMP2MF",
+    "TAMP3MF",
+    "ITAMP3MF",
+    "ITAMP4MF",
+    "ITAMP5MF",
+    "ITAMP6MF",
+    "ITAMPMF",
+    "ITAMP{}MF",
+    "TAMPMF",
+    "TAMP{}MF",
+    "CTAMP1F",
+    "CTAMP2F",
+    "CTAMP3F",
+    "CITAMP3F",
+    "CITAMP4F",
+    "CITAMP5F",
+    "CITAMP6F",
+    "CITAMPF",
+    "CITAMP{}F",
+    "CTAMPF",
+    "CTAMP{}F",
+    "FLTCR",
+    "TAMP filter control register",
+    "TAMP interrupt enable register",
+    "TAMP status register",
+    "TAMP masked interrupt status register",
+    "TAMP status clear register",
+    "BKP0R",
+    "TAMP backup register",
+    "BKP1R",
+    "BKP2R",
+    "BKP3R",
+    "BKP4R",
+    "BKP5R",
+    "BKP6R",
+    "BKP7R",
+    "BKP8R",
+    "BKP9R",
+    "BKP10R",
+    "BKP11R",
+    "BKP12R",
+    "BKP13R",
+    "BKP14R",
+    "BKP15R",
+    "BKP16R",
+    "BKP17R",
+    "BKP18R",
+    "BKP19R",
+    "BKP20R",
+    "BKP21R",
+    "BKP22R",
+    "BKP23R",
+    "BKP24R",
+    "BKP25R",
+    "BKP26R",
+    "BKP27R",
+    "BKP28R",
+    "BKP29R",
+    "BKP30R",
+    "BKP31R",
+    "BKPR",
+    "BKP{}R",
+    "TAMP",
+    "Tamper and backup registers",
+    "DAY",
+    "18",
+    "MON",
+    "12",
+    "YEAR",
+    "4",
+    "SUBSTEP",
+    "1",
+    "STEP",
+    "2",
+    "REL",
+    "3",
+    "ETV",
+    "Endianness test value. The endianness test value is 0x8765 4321.",
+    "DSJW",
+    "Synchronization jump width. Must always be smaller than DTSEG2, valid values are 0 to 15. The value used by the hardware is the one programmed, incremented by 1: t<sub>SJW</sub> = (DSJW + 1) x tq.",
+    "DTSEG2",
+    "Data time segment after sample point. Valid values are 0 to 15. The value used by the hardware is the one programmed, incremented by 1, i.e. t<sub>BS2</sub> = (DTSEG2 + 1) x tq.",
+    "DTSEG1",
+    "Data time segment before sample point. Valid values are 0 to 31. The value used by the hardware is the one programmed, incremented by 1, i.e. t<sub>BS1</sub> = (DTSEG1 + 1) x tq.",
+    "DBRP",
+    "Data bit rate prescaler. The value by which the oscillator frequency is divided to generate the bit time quanta. The bit time is built up from a multiple of this quanta. Valid values for the Baud Rate Prescaler are 0 to 31. The hardware interpreters this value as the value programmed plus 1.",
+    "TDC",
+    "Transceiver delay compensation",
+    "DTSEG",
+    "DTSEG{}",
+    "LBCK",
+    "Loop back mode",
+    "TX",
+    "Control of transmit pin",
+    "RX",
+    "Receive pin. Monitors the actual value of pin FDCANx_RX",
+    "WDC",
+    "Watchdog configuration. Start value of the message RAM watchdog counter. With the reset value of 00, the counter is disabled. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of FDCAN_CCCR register are set to 1.",
+    "WDV",
+    "Watchdog value. Actual message RAM watchdog counter value.",
+    "Initialization",
+    "Configuration change enable",
+    "ASM",
+    "ASM restricted operation mode. The restricted operation mode is intended for applications that adapt themselves to different CAN bit rates. The application tests different bit rates and leaves the Restricted operation Mode after it has received a valid frame. In the optional Restricted operation Mode the node is able to transmit and receive data and remote frames and it gives acknowledge to valid frames, but it does not send active error frames or overload frames. In case of an error condition or overload condition, it does not send dominant bits, instead it waits for the occurrence of bus idle condition to resynchronize itself to the CAN communication. The error counters are not incremented. Bit ASM can only be set by software when both CCE and INIT are set to 1. The bit can be reset by the software at any time.",
+    "CSA",
+    "Clock stop acknowledge",
+    "Clock stop request",
+    "Bus monitoring mode. Bit MON can only be set by software when both CCE and INIT are set to 1. The bit can be reset by the Host at any time.",
+    "DAR",
+    "Disable automatic retransmission",
+    "TEST",
+    "Test mode enable",
+    "FDOE",
+    "FD operation enable",
+    "BRSE",
+    "FDCAN bit rate switching",
+    "PXHD",
+    "Protocol exception handling disable",
+    "EFBI",
+    "Edge filtering during bus integration",
+    "TXP",
+    "If this bit is set, the FDCAN pauses for two CAN bit times before starting the next transmission after successfully transmitting a frame.",
+    "NISO",
+    "Non ISO operation. If this bit is set, the FDCAN uses the CAN FD frame format as specified by the Bosch CAN FD Specification V1.0.",
+    "NTSEG2",
+    "Nominal time segment after sample point. Valid values are 0 to 127. The actual interpretation by the hardware of this value is such that one more than the programmed value is used.",
+    "NTSEG1",
+    "Nominal time segment before sample point. Valid values are 0 to 255. The actual interpretation by the hardware of this value is such that one more than the programmed value is used. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "NBRP",
+    "Bit rate prescaler. Value by which the oscillator frequency is divided for generating the bit time quanta. The bit time is built up from a multiple of this quanta. Valid values are 0 to 511. The actual interpretation by the hardware of this value is such that one more than the value programmed here is used. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "NSJW",
+    "Nominal (re)synchronization jump width. Valid values are 0 to 127. The actual interpretation by the hardware of this value is such that the used value is the one programmed incremented by one. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "NTSEG",
+    "NTSEG{}",
+    "TSS",
+    "Timestamp select. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "TCP",
+    "Timestamp counter prescaler",
+    "TSC",
+    "Timestamp counter",
+    "ETOC",
+    "Timeout counter enable. This is a protected write (P) bit, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "TOS",
+    "Timeout select. When operating in Continuous mode, a write to TOCV presets the counter to the value configured by TOCC[TOP] and continues down-counting. When the timeout counter is controlled by one of the FIFOs, an empty FIFO presets the counter to the value configured by TOCC[TOP]. Down-counting is started when the first FIFO element is stored. These are protected write (P) bits, write access is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "TOP",
+    "Timeout period. Start value of the timeout counter (down-counter). Configures the timeout period.",
+    "TOC",
+    "Timeout counter",
+    "TEC",
+    "Transmit error counter. Actual state of the transmit error counter, values between 0 and 255. When CCCR.ASM is set, the CAN protocol controller does not increment TEC and REC when a CAN protocol error is detected, but CEL is still incremented.",
+    "REC",
+    "Receive error counter. Actual state of the receive error counter, values between 0 and 127.",
+    "RP",
+    "Receive error passive",
+    "CEL",
+    "CAN error logging. The counter is incremented each time when a CAN protocol error causes the transmit error counter or the receive error counter to be incremented. It is reset by read access to CEL. The counter stops at 0xFF; the next increment of TEC or REC sets interrupt flag IR[ELO]. Access type is RX: reset on read.",
+    "LEC",
+    "Last error code. The LEC indicates the type of the last error to occur on the CAN bus. This field is cleared to 0 when a message has been transferred (reception or transmission) without error. Access type is RS: set on read.",
+    "ACT",
+    "Activity. Monitors the modules CAN communication state.",
+    "EP",
+    "Error passive",
+    "EW",
+    "Warning Sstatus",
+    "BO",
+    "Bus_Off status",
+    "DLEC",
+    "Data last error code. Type of last error that occurred in the data phase of a FDCAN format frame with its BRS flag set. Coding is the same as for LEC. This field is cleared to 0 when a FDCAN format frame with its BRS flag set has been transferred (reception or transmission) without error. Access type is RS: set on read.",
+    "RESI",
+    "ESI flag of last received FDCAN message. This bit is set together with REDL, independent of acceptance filtering. Access type is RX: reset on read.",
+    "RBRS",
+    "BRS flag of last received FDCAN message. This bit is set together with REDL, independent of acceptance filtering. Access type is RX: reset on read.",
+    "REDL",
+    "Received FDCAN message. This bit is set independent of acceptance filtering. Access type is RX: reset on read.",
+    "PXE",
+    "Protocol exception event",
+    "TDCV",
+    "Transmitter delay compensation value. Position of the secondary sample point, defined by the sum of the measured delay from FDCAN_TX to FDCAN_RX and TDCR.TDCO. The SSP position is, in the data phase, the number of minimum time quanta (mtq) between the start of the transmitted bit and the secondary sample point. Valid values are 0 to 127 mtq.",
+    "TDCF",
+    "Transmitter delay compensation filter window length. Defines the minimum value for the SSP position, dominant edges on FDCAN_RX that would result in an earlier SSP position are ignored for transmitter delay measurements. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "TDCO",
+    "Transmitter delay compensation offset. Offset value defining the distance between the measured delay from FDCAN_TX to FDCAN_RX and the secondary sample point. Valid values are 0 to 127 mtq. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "RF0N",
+    "Rx FIFO 0 new message",
+    "RF0F",
+    "Rx FIFO 0 full",
+    "RF0L",
+    "Rx FIFO 0 message lost",
+    "RF1N",
+    "Rx FIFO 1 new message",
+    "RF1F",
+    "Rx FIFO 1 full",
+    "RF1L",
+    "Rx FIFO 1 message lost",
+    "HPM",
+    "High-priority message",
+    "Transmission completed",
+    "TCF",
+    "Transmission cancellation finished",
+    "TFE",
+    "Tx FIFO empty",
+    "TEFN",
+    "Tx event FIFO New Entry",
+    "TEFF",
+    "Tx event FIFO full",
+    "TEFL",
+    "Tx event FIFO element lost",
+    "TSW",
+    "Timestamp wraparound",
+    "MRAF",
+    "Message RAM access failure. The flag is set when the Rx handler: has not completed acceptance filtering or storage of an accepted message until the arbitration field of the following message has been received. In this case acceptance filtering or message storage is aborted and the Rx handler starts processing of the following message. was unable to write a message to the message RAM. In this case message storage is aborted. In both cases the FIFO put index is not updated. The partly stored message is overwritten when the next message is stored to this location. The flag is also set when the Tx Handler was not able to read a message from the Message RAM in time. In this case message transmission is aborted. In case of a Tx Handler access failure the FDCAN is switched into Restricted operation Mode (see Restricted operation mode). To leave Restricted operation Mode, the Host CPU has to reset CCCR.ASM.",
+    "TOO",
+    "Timeout occurred",
+    "ELO",
+    "Error logging overflow",
+    "Warning status",
+    "WDI",
+    "Watchdog interrupt",
+    "PEA",
+    "Protocol error in arbitration phase (nominal bit time is used)",
+    "PED",
+    "Protocol error in data phase (data bit time is used)",
+    "ARA",
+    "Access to reserved address",
+    "RFN",
+    "RF{}N",
+    "RFF",
+    "RF{}F",
+    "RFL",
+    "RF{}L",
+    "RF0NE",
+    "Rx FIFO 0 new message interrupt enable",
+    "RF0FE",
+    "Rx FIFO 0 full interrupt enable",
+    "RF0LE",
+    "Rx FIFO 0 message lost interrupt enable",
+    "RF1NE",
+    "Rx FIFO 1 new message interrupt enable",
+    "RF1FE",
+    "Rx FIFO 1 full interrupt enable",
+    "RF1LE",
+    "Rx FIFO 1 message lost interrupt enable",
+    "HPME",
+    "High-priority message interrupt enable",
+    "TCE",
+    "Transmission completed interrupt enable",
+    "TCFE",
+    "Transmission cancellation finished interrupt enable",
+    "TFEE",
+    "Tx FIFO empty interrupt enable",
+    "TEFNE",
+    "Tx event FIFO new entry interrupt enable",
+    "TEFFE",
+    "Tx event FIFO full interrupt enable",
+    "TEFLE",
+    "Tx event FIFO element lost interrupt enable",
+    "TSWE",
+    "Timestamp wraparound interrupt enable",
+    "MRAFE",
+    "Message RAM access failure interrupt enable",
+    "TOOE",
+    "Timeout occurred interrupt enable",
+    "ELOE",
+    "Error logging overflow interrupt enable",
+    "EPE",
+    "Error passive interrupt enable",
+    "EWE",
+    "Warning status interrupt enable",
+    "BOE",
+    "WDIE",
+    "Watchdog interrupt enable",
+    "PEAE",
+    "Protocol error in arbitration phase enable",
+    "PEDE",
+    "Protocol error in data phase enable",
+    "ARAE",
+    "Access to reserved address enable",
+    "RFLE",
+    "RF{}LE",
+    "RFNE",
+    "RF{}NE",
+    "RFFE",
+    "RF{}FE",
+    "RXFIFO0",
+    "RX FIFO bit grouping the following interruption. RF0LL: Rx FIFO 0 message lost interrupt line RF0FL: Rx FIFO 0 full interrupt line RF0NL: Rx FIFO 0 new message interrupt line",
+    "RXFIFO1",
+    "RX FIFO bit grouping the following interruption. RF1LL: Rx FIFO 1 message lost interrupt line RF1FL: Rx FIFO 1 full interrupt line RF1NL: Rx FIFO 1 new message interrupt line",
+    "SMSG",
+    "Status message bit grouping the following interruption. TCFL: Transmission cancellation finished interrupt line TCL: Transmission completed interrupt line HPML: High-priority message interrupt line",
+    "TFERR",
+    "Tx FIFO ERROR grouping the following interruption. TEFLL: Tx event FIFO element lost interrupt line TEFFL: Tx event FIFO full interrupt line TEFNL: Tx event FIFO new entry interrupt line TFEL: Tx FIFO empty interrupt line",
+    "MISC",
+    "Interrupt regrouping the following interruption. TOOL: Timeout occurred interrupt line MRAFL: Message RAM access failure interrupt line TSWL: Timestamp wraparound interrupt line",
+    "Bit and line error grouping the following interruption . EPL Error passive interrupt line ELOL: Error logging overflow interrupt line",
+    "PERR",
+    "Protocol error grouping the following interruption . ARAL: Access to reserved address line PEDL: Protocol error in data phase line PEAL: Protocol error in arbitration phase line WDIL: Watchdog interrupt line BOL: Bus_Off status EWL: Warning status interrupt line",
+    "RXFIFO",
+    "RXFIFO{}",
+    "EINT0",
+    "Enable interrupt line 0",
+    "EINT1",
+    "Enable interrupt line 1",
+    "EINT",
+    "EINT{}",
+    "RRFE",
+    "Reject remote frames extended. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "RRFS",
+    "Reject remote frames standard. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "ANFE",
+    "Accept non-matching frames extended. Defines how received messages with 29-bit IDs that do not match any element of the filter list are treated. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "ANFS",
+    "Accept Non-matching frames standard. Defines how received messages with 11-bit IDs that do not match any element of the filter list are treated. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "F1OM",
+    "FIFO 1 operation mode (overwrite or blocking). This is a protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "F0OM",
+    "FIFO 0 operation mode (overwrite or blocking). This is protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "LSS",
+    "List size standard. 1 to 28: Number of standard message ID filter elements >28: Values greater than 28 are interpreted as 28. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "LSE",
+    "List size extended. 1 to 8: Number of extended message ID filter elements >8: Values greater than 8 are interpreted as 8. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "FOM",
+    "F{}OM",
+    "EIDM",
+    "Extended ID mask. For acceptance filtering of extended frames the Extended ID AND Mask is AND-ed with the Message ID of a received frame. Intended for masking of 29-bit IDs in SAE J1939. With the reset value of all bits set to 1 the mask is not active. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "BIDX",
+    "Buffer index. Index of Rx FIFO element to which the message was stored. Only valid when MSI[1] = 1.",
+    "MSI",
+    "Message storage indicator",
+    "Filter index. Index of matching filter element. Range is 0 to RXGFC[LSS] - 1 or RXGFC[LSE] - 1.",
+    "FLST",
+    "Filter list. Indicates the filter list of the matching filter element.",
+    "F0FL",
+    "Rx FIFO 0 fill level. Number of elements stored in Rx FIFO 0, range 0 to 3.",
+    "F0GI",
+    "Rx FIFO 0 get index. Rx FIFO 0 read index pointer, range 0 to 2.",
+    "F0PI",
+    "Rx FIFO 0 put index. Rx FIFO 0 write index pointer, range 0 to 2.",
+    "F0F",
+    "Rx FIFO 0 message lost. This bit is a copy of interrupt flag IR[RF0L]. When IR[RF0L] is reset, this bit is also reset.",
+    "F0AI",
+    "Rx FIFO 0 acknowledge index. After the Host has read a message or a sequence of messages from Rx FIFO 0 it has to write the buffer index of the last element read from Rx FIFO 0 to F0AI. This sets the Rx FIFO 0 get index RXF0S[F0GI] to F0AI + 1 and update the FIFO 0 fill level RXF0S[F0FL].",
+    "F1FL",
+    "Rx FIFO 1 fill level. Number of elements stored in Rx FIFO 1, range 0 to 3.",
+    "F1GI",
+    "Rx FIFO 1 get index. Rx FIFO 1 read index pointer, range 0 to 2.",
+    "F1PI",
+    "Rx FIFO 1 put index. Rx FIFO 1 write index pointer, range 0 to 2.",
+    "F1F",
+    "Rx FIFO 1 message lost. This bit is a copy of interrupt flag IR[RF1L]. When IR[RF1L] is reset, this bit is also reset.",
+    "F1AI",
+    "Rx FIFO 1 acknowledge index. After the Host has read a message or a sequence of messages from Rx FIFO 1 it has to write the buffer index of the last element read from Rx FIFO 1 to F1AI. This sets the Rx FIFO 1 get index RXF1S[F1GI] to F1AI + 1 and update the FIFO 1 Fill Level RXF1S[F1FL].",
+    "TFQM",
+    "Tx FIFO/queue mode. This is a protected write (P) bit, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "TFFL",
+    "Tx FIFO free level. Number of consecutive free Tx FIFO elements starting from TFGI, range 0 to 3. Read as 0 when Tx queue operation is configured (TXBC[TFQM] = 1).",
+    "TFGI",
+    "Tx FIFO get index. Tx FIFO read index pointer, range 0 to 3. Read as 0 when Tx queue operation is configured (TXBC.TFQM = 1)",
+    "TFQPI",
+    "Tx FIFO/queue put index. Tx FIFO/queue write index pointer, range 0 to 3",
+    "TFQF",
+    "Tx FIFO/queue full",
+    "TRP",
+    "Transmission request pending. Each Tx buffer has its own transmission request pending bit. The bits are set via register TXBAR. The bits are reset after a requested transmission has completed or has been canceled via register TXBCR. After a TXBRP bit has been set, a Tx scan is started to check for the pending Tx request with the highest priority (Tx buffer with lowest Message ID). A cancellation request resets the corresponding transmission request pending bit of register TXBRP. In case a transmission has already been started when a cancellation is requested, this is done at the end of the transmission, regardless whether the transmission was successful or not. The cancellation request bits are reset directly after the corresponding TXBRP bit has been reset. After a cancellation has been requested, a finished cancellation is signaled via TXBCF after successful transmission together with the corresponding TXBTO bit when the transmission has not yet been started at the point of cancellation when the transmission has been aborted due to lost arbitration when an error occurred during frame transmission In DAR mode all transmissions are automatically canceled if they are not successful. The corresponding TXBCF bit is set for all unsuccessful transmissions.",
+    "AR",
+    "Add request. Each Tx buffer has its own add request bit. Writing a 1 sets the corresponding add request bit; writing a 0 has no impact. This enables the Host to set transmission requests for multiple Tx buffers with one write to TXBAR. When no Tx scan is running, the bits are reset immediately, else the bits remain set until the Tx scan process has completed.",
+    "Cancellation request. Each Tx buffer has its own cancellation request bit. Writing a 1 sets the corresponding CR bit; writing a 0 has no impact. This enables the Host to set cancellation requests for multiple Tx buffers with one write to TXBCR. The bits remain set until the corresponding TXBRP bit is reset.",
+    "TO",
+    "Transmission occurred.. Each Tx buffer has its own TO bit. The bits are set when the corresponding TXBRP bit is cleared after a successful transmission. The bits are reset when a new transmission is requested by writing a 1 to the corresponding bit of register TXBAR.",
+    "CF",
+    "Cancellation finished. Each Tx buffer has its own CF bit. The bits are set when the corresponding TXBRP bit is cleared after a cancellation was requested via TXBCR. In case the corresponding TXBRP bit was not set at the point of cancellation, CF is set immediately. The bits are reset when a new transmission is requested by writing a 1 to the corresponding bit of register TXBAR.",
+    "Transmission interrupt enable. Each Tx buffer has its own TIE bit.",
+    "CFIE",
+    "Cancellation finished interrupt enable.. Each Tx buffer has its own CFIE bit.",
+    "EFFL",
+    "Event FIFO fill level. Number of elements stored in Tx event FIFO, range 0 to 3.",
+    "EFGI",
+    "Event FIFO get index. Tx event FIFO read index pointer, range 0 to 3.",
+    "EFPI",
+    "Event FIFO put index. Tx event FIFO write index pointer, range 0 to 3.",
+    "EFF",
+    "Event FIFO full",
+    "Tx event FIFO element lost. This bit is a copy of interrupt flag IR[TEFL]. When IR[TEFL] is reset, this bit is also reset. 0 No Tx event FIFO element lost 1 Tx event FIFO element lost, also set after write attempt to Tx event FIFO of size 0.",
+    "EFAI",
+    "Event FIFO acknowledge index. After the Host has read an element or a sequence of elements from the Tx event FIFO, it has to write the index of the last element read from Tx event FIFO to EFAI. This sets the Tx event FIFO get index TXEFS[EFGI] to EFAI + 1 and updates the FIFO 0 fill level TXEFS[EFFL].",
+    "PDIV",
+    "input clock divider. The APB clock could be divided prior to be used by the CAN sub system. The rate must be computed using the divider output clock. These are protected write (P) bits, which means that write access by the bits is possible only when the bit 1 [CCE] and bit 0 [INIT] of CCCR register are set to 1.",
+    "CREL",
+    "FDCAN core release register",
+    "ENDN",
+    "FDCAN endian register",
+    "DBTP",
+    "FDCAN data bit timing and prescaler register",
+    "FDCAN test register",
+    "RWD",
+    "FDCAN RAM watchdog register",
+    "CCCR",
+    "FDCAN CC control register",
+    "NBTP",
+    "FDCAN nominal bit timing and prescaler register",
+    "TSCC",
+    "FDCAN timestamp counter configuration register",
+    "TSCV",
+    "FDCAN timestamp counter value register",
+    "TOCC",
+    "FDCAN timeout counter configuration register",
+    "TOCV",
+    "FDCAN timeout counter value register",
+    "FDCAN error counter register",
+    "PSR",
+    "FDCAN protocol status register",
+    "TDCR",
+    "FDCAN transmitter delay compensation register",
+    "IR",
+    "FDCAN interrupt register",
+    "FDCAN interrupt enable register",
+    "ILS",
+    "FDCAN interrupt line select register",
+    "ILE",
+    "FDCAN interrupt line enable register",
+    "RXGFC",
+    "FDCAN global filter configuration register",
+    "XIDAM",
+    "FDCAN extended ID and mask register",
+    "HPMS",
+    "FDCAN high-priority message status register",
+    "RXF0S",
+    "FDCAN Rx FIFO 0 status register",
+    "RXF0A",
+    "CAN Rx FIFO 0 acknowledge register",
+    "RXF1S",
+    "FDCAN Rx FIFO 1 status register",
+    "RXF1A",
+    "FDCAN Rx FIFO 1 acknowledge register",
+    "TXBC",
+    "FDCAN Tx buffer configuration register",
+    "TXFQS",
+    "FDCAN Tx FIFO/queue status register",
+    "TXBRP",
+    "FDCAN Tx buffer request pending register",
+    "TXBAR",
+    "FDCAN Tx buffer add request register",
+    "TXBCR",
+    "FDCAN Tx buffer cancellation request register",
+    "TXBTO",
+    "FDCAN Tx buffer transmission occurred register",
+    "TXBCF",
+    "FDCAN Tx buffer cancellation finished register",
+    "TXBTIE",
+    "FDCAN Tx buffer transmission interrupt enable register",
+    "TXBCIE",
+    "FDCAN Tx buffer cancellation finished interrupt enable register",
+    "TXEFS",
+    "FDCAN Tx event FIFO status register",
+    "TXEFA",
+    "FDCAN Tx event FIFO acknowledge register",
+    "CKDIV",
+    "FDCAN CFG clock divider register",
+    "RXFS",
+    "RXF{}S",
+    "RXFA",
+    "RXF{}A",
+    "FDCAN",
+    "FDCAN1",
+    "HBITCLKDIV",
+    "IFRGAP",
+    "TRANSWIN",
+    "PSC_USBPDCLK",
+    "RXORDSETEN",
+    "UCPDEN",
+    "RXFILTDIS",
+    "RXFILT2N3",
+    "FORCECLK",
+    "TXMODE",
+    "TXSEND",
+    "TXHRST",
+    "RXMODE",
+    "PHYRXEN",
+    "PHYCCSEL",
+    "ANASUBMODE",
+    "ANAMODE",
+    "CCENABLE",
+    "FRSRXEN",
+    "FRSTX",
+    "RDCH",
+    "CC1TCDIS",
+    "CC2TCDIS",
+    "CCTCDIS",
+    "CC{}TCDIS",
+    "TXISIE",
+    "TXMSGDISCIE",
+    "TXMSGSENTIE",
+    "TXMSGABTIE",
+    "HRSTDISCIE",
+    "HRSTSENTIE",
+    "TXUNDIE",
+    "RXORDDETIE",
+    "RXHRSTDETIE",
+    "RXOVRIE",
+    "RXMSGENDIE",
+    "TYPECEVT1IE",
+    "TYPECEVT2IE",
+    "FRSEVTIE",
+    "TYPECEVTIE",
+    "TYPECEVT{}IE",
+    "TXMSGDISC",
+    "TXMSGSENT",
+    "TXMSGABT",
+    "HRSTDISC",
+    "HRSTSENT",
+    "TXUND",
+    "RXORDDET",
+    "RXHRSTDET",
+    "RXOVR",
+    "RXMSGEND",
+    "RXERR",
+    "TYPECEVT1",
+    "TYPECEVT2",
+    "TYPEC_VSTATE_CC1",
+    "TYPEC_VSTATE_CC2",
+    "FRSEVT",
+    "TYPEC_VSTATE_CC",
+    "TYPEC_VSTATE_CC{}",
+    "TYPECEVT",
+    "TYPECEVT{}",
+    "TXMSGDISCCF",
+    "TXMSGSENTCF",
+    "TXMSGABTCF",
+    "HRSTDISCCF",
+    "HRSTSENTCF",
+    "TXUNDCF",
+    "RXORDDETCF",
+    "RXHRSTDETCF",
+    "RXOVRCF",
+    "RXMSGENDCF",
+    "TYPECEVT1CF",
+    "TYPECEVT2CF",
+    "FRSEVTCF",
+    "TYPECEVTCF",
+    "TYPECEVT{}CF",
+    "TXORDSET",
+    "TXPAYSZ",
+    "RXORDSET",
+    "RXSOP3OF4",
+    "RXSOPKINVALID",
+    "RXPAYSZ",
+    "RXSOPX1",
+    "RXSOPX2",
+    "CFG1",
+    "UCPD configuration register 1",
+    "CFG2",
+    "UCPD configuration register 2",
+    "UCPD Interrupt Mask Register",
+    "UCPD Status Register",
+    "UCPD Interrupt Clear Register",
+    "TX_ORDSET",
+    "UCPD Tx Ordered Set Type Register",
+    "TX_PAYSZ",
+    "UCPD Tx Paysize Register",
+    "UCPD Tx Data Register",
+    "RX_ORDSET",
+    "UCPD Rx Ordered Set Register",
+    "RX_PAYSZ",
+    "UCPD Rx Paysize Register",
+    "UCPD Rx Data Register",
+    "RX_ORDEXT1",
+    "UCPD Rx Ordered Set Extension Register 1",
+    "RX_ORDEXT2",
+    "UCPD Rx Ordered Set Extension Register 2",
+    "CFG",
+    "CFG{}",
+    "RX_ORDEXT",
+    "RX_ORDEXT{}",
+    "UCPD1",
+    "EA",
+    "STAT_TX",
+    "DTOG_TX",
+    "CTR_TX",
+    "EP_KIND",
+    "EP_TYPE",
+    "SETUP",
+    "STAT_RX",
+    "DTOG_RX",
+    "CTR_RX",
+    "FRES",
+    "PDWN",
+    "LP_MODE",
+    "FSUSP",
+    "RESUME",
+    "L1RESUME",
+    "L1REQM",
+    "ESOFM",
+    "SOFM",
+    "RESETM",
+    "SUSPM",
+    "WKUPM",
+    "ERRM",
+    "PMAOVRM",
+    "CTRM",
+    "EP_ID",
+    "L1REQ",
+    "ESOF",
+    "WKUP",
+    "ERR",
+    "PMAOVR",
+    "CTR",
+    "FN",
+    "LSOF",
+    "RXDM",
+    "RXDP",
+    "ADD",
+    "EF",
+    "BTABLE",
+    "EP0R",
+    "USB endpoint n register",
+    "EP1R",
+    "EP2R",
+    "EP3R",
+    "EP4R",
+    "EP5R",
+    "EP6R",
+    "EP7R",
+    "CNTR",
+    "USB control register",
+    "ISTR",
+    "USB interrupt status register",
+    "FNR",
+    "USB frame number register",
+    "DADDR",
+    "USB device address",
+    "Buffer table address",
+    "EPR",
+    "EP{}R",
+    "USB_FS_device",
+    "SYNCOKIE",
+    "SYNC event OK interrupt enable",
+    "SYNCWARNIE",
+    "SYNC warning interrupt enable",
+    "Synchronization or trimming error interrupt enable",
+    "ESYNCIE",
+    "Expected SYNC interrupt enable",
+    "Frequency error counter enable This bit enables the oscillator clock for the frequency error counter. When this bit is set, the CRS_CFGR register is write-protected and cannot be modified.",
+    "AUTOTRIMEN",
+    "Automatic trimming enable This bit enables the automatic hardware adjustment of TRIM bits according to the measured frequency error between two SYNC events. If this bit is set, the TRIM bits are read-only. The TRIM value can be adjusted by hardware by one or two steps at a time, depending on the measured frequency error value. Refer to Section7.3.4: Frequency error evaluation and automatic trimming for more details.",
+    "SWSYNC",
+    "Generate software SYNC event This bit is set by software in order to generate a software SYNC event. It is automatically cleared by hardware.",
+    "HSI48 oscillator smooth trimming These bits provide a user-programmable trimming value to the HSI48 oscillator. They can be programmed to adjust to variations in voltage and temperature that influence the frequency of the HSI48. The default value is 32, which corresponds to the middle of the trimming interval. The trimming step is around 67 kHz between two consecutive TRIM steps. A higher TRIM value corresponds to a higher output frequency. When the AUTOTRIMEN bit is set, this field is controlled by hardware and is read-only.",
+    "Counter reload value RELOAD is the value to be loaded in the frequency error counter with each SYNC event. Refer to Section7.3.3: Frequency error measurement for more details about counter behavior.",
+    "FELIM",
+    "Frequency error limit FELIM contains the value to be used to evaluate the captured frequency error value latched in the FECAP[15:0] bits of the CRS_ISR register. Refer to Section7.3.4: Frequency error evaluation and automatic trimming for more details about FECAP evaluation.",
+    "SYNCDIV",
+    "SYNC divider These bits are set and cleared by software to control the division factor of the SYNC signal.",
+    "SYNCSRC",
+    "SYNC signal source selection These bits are set and cleared by software to select the SYNC signal source. Note: When using USB LPM (Link Power Management) and the device is in Sleep mode, the periodic USB SOF will not be generated by the host. No SYNC signal will therefore be provided to the CRS to calibrate the HSI48 on the run. To guarantee the required clock precision after waking up from Sleep mode, the LSE or reference clock on the GPIOs should be used as SYNC signal.",
+    "SYNCPOL",
+    "SYNC polarity selection This bit is set and cleared by software to select the input polarity for the SYNC signal source.",
+    "SYNCOKF",
+    "SYNC event OK flag This flag is set by hardware when the measured frequency error is smaller than FELIM * 3. This means that either no adjustment of the TRIM value is needed or that an adjustment by one trimming step is enough to compensate the frequency error. An interrupt is generated if the SYNCOKIE bit is set in the CRS_CR register. It is cleared by software by setting the SYNCOKC bit in the CRS_ICR register.",
+    "SYNCWARNF",
+    "SYNC warning flag This flag is set by hardware when the measured frequency error is greater than or equal to FELIM * 3, but smaller than FELIM * 128. This means that to compensate the frequency error, the TRIM value must be adjusted by two steps or more. An interrupt is generated if the SYNCWARNIE bit is set in the CRS_CR register. It is cleared by software by setting the SYNCWARNC bit in the CRS_ICR register.",
+    "ERRF",
+    "Error flag This flag is set by hardware in case of any synchronization or trimming error. It is the logical OR of the TRIMOVF, SYNCMISS and SYNCERR bits. An interrupt is generated if the ERRIE bit is set in the CRS_CR register. It is cleared by software in reaction to setting the ERRC bit in the CRS_ICR register, which clears the TRIMOVF, SYNCMISS and SYNCERR bits.",
+    "ESYNCF",
+    "Expected SYNC flag This flag is set by hardware when the frequency error counter reached a zero value. An interrupt is generated if the ESYNCIE bit is set in the CRS_CR register. It is cleared by software by setting the ESYNCC bit in the CRS_ICR register.",
+    "SYNCERR",
+    "SYNC error This flag is set by hardware when the SYNC pulse arrives before the ESYNC event and the measured frequency error is greater than or equal to FELIM * 128. This means that the frequency error is too big (internal frequency too low) to be compensated by adjusting the TRIM value, and that some other action should be taken. An interrupt is generated if the ERRIE bit is set in the CRS_CR register. It is cleared by software by setting the ERRC bit in the CRS_ICR register.",
+    "SYNCMISS",
+    "SYNC missed This flag is set by hardware when the frequency error counter reached value FELIM * 128 and no SYNC was detected, meaning either that a SYNC pulse was missed or that the frequency error is too big (internal frequency too high) to be compensated by adjusting the TRIM value, and that some other action should be taken. At this point, the frequency error counter is stopped (waiting for a next SYNC) and an interrupt is generated if the ERRIE bit is set in the CRS_CR register. It is cleared by software by setting the ERRC bit in the CRS_ICR register.",
+    "TRIMOVF",
+    "Trimming overflow or underflow This flag is set by hardware when the automatic trimming tries to over- or under-flow the TRIM value. An interrupt is generated if the ERRIE bit is set in the CRS_CR register. It is cleared by software by setting the ERRC bit in the CRS_ICR register.",
+    "FEDIR",
+    "Frequency error direction FEDIR is the counting direction of the frequency error counter latched in the time of the last SYNC event. It shows whether the actual frequency is below or above the target.",
+    "FECAP",
+    "Frequency error capture FECAP is the frequency error counter value latched in the time ofthe last SYNC event. Refer to Section7.3.4: Frequency error evaluation and automatic trimming for more details about FECAP usage.",
+    "SYNCOKC",
+    "SYNC event OK clear flag Writing 1 to this bit clears the SYNCOKF flag in the CRS_ISR register.",
+    "SYNCWARNC",
+    "SYNC warning clear flag Writing 1 to this bit clears the SYNCWARNF flag in the CRS_ISR register.",
+    "Error clear flag Writing 1 to this bit clears TRIMOVF, SYNCMISS and SYNCERR bits and consequently also the ERRF flag in the CRS_ISR register.",
+    "ESYNCC",
+    "Expected SYNC clear flag Writing 1 to this bit clears the ESYNCF flag in the CRS_ISR register.",
+    "CRS control register",
+    "This register can be written only when the frequency error counter is disabled (CEN bit is cleared in CRS_CR). When the counter is enabled, this register is write-protected.",
+    "CRS interrupt and status register",
+    "CRS interrupt flag clear register",
+    "CRS",
+)
+
+# name, base address, description, register layout
+_peripheral_rows = _array("L", [
+    23, 0x40023000, 24, 0,
+    48, 0x40003000, 49, 1,
+    64, 0x40002C00, 65, 2,
+    241, 0x40005400, 242, 3,
+    243, 0x40005800, 242, 3,
+    244, 0x40007800, 242, 3,
+    393, 0x40022000, 394, 4,
+    466, 0xE0042000, 467, 5,
+    1134, 0x40021000, 1135, 6,
+    1335, 0x40007000, 1336, 7,
+    1357, 0x50060800, 1358, 8,
+    1450, 0x50060000, 1451, 9,
+    1658, 0x48000000, 1659, 10,
+    1660, 0x48000400, 1659, 11,
+    1661, 0x48000800, 1659, 12,
+    1662, 0x48000C00, 1659, 12,
+    1663, 0x48001000, 1659, 12,
+    1664, 0x48001400, 1659, 12,
+    1665, 0x48001800, 1659, 12,
+    1936, 0x40014000, 1937, 13,
+    1942, 0x40014400, 1937, 14,
+    1943, 0x40014800, 1937, 14,
+    2203, 0x40012C00, 2204, 15,
+    2205, 0x40013400, 2204, 15,
+    2206, 0x40015000, 2204, 15,
+    2207, 0x40000000, 2204, 16,
+    2208, 0x40000400, 2204, 16,
+    2209, 0x40000800, 2204, 16,
+    2212, 0x40001000, 2213, 17,
+    2214, 0x40001400, 2213, 17,
+    2309, 0x40007C00, 2310, 18,
+    2532, 0x40013800, 2533, 19,
+    2534, 0x40004400, 2533, 19,
+    2535, 0x40004800, 2533, 19,
+    2536, 0x40004C00, 2533, 20,
+    2537, 0x40008000, 2533, 21,
+    2616, 0x40013000, 2617, 22,
+    2618, 0x40003C00, 2617, 22,
+    2619, 0x40003800, 2617, 22,
+    3050, 0x40010400, 3051, 23,
+    3232, 0x40002800, 3233, 24,
+    3335, 0x40020000, 3336, 25,
+    3337, 0x40020400, 3336, 25,
+    3401, 0x40020800, 3401, 26,
+    3519, 0x40010000, 3520, 27,
+    3533, 0x40010030, 3534, 28,
+    3549, 0x40010200, 3550, 29,
+    3583, 0x40010300, 3584, 30,
+    3816, 0x50000800, 3817, 31,
+    3818, 0x50000C00, 3817, 31,
+    3819, 0x50001000, 3817, 31,
+    3820, 0x50001400, 3817, 31,
+    4025, 0x50000000, 4026, 32,
+    4027, 0x50000100, 4026, 32,
+    4087, 0x50000300, 4026, 33,
+    4088, 0x50000700, 4026, 33,
+    4129, 0x40021400, 4130, 34,
+    4141, 0x40020C00, 4142, 35,
+    4294, 0x40015400, 4295, 36,
+    4412, 0x40002400, 4413, 37,
+    4811, 0x4000A400, 4811, 38,
+    4812, 0x40006400, 4811, 38,
+    4922, 0x4000A000, 4922, 39,
+    4982, 0x40005C00, 4982, 40,
+    5034, 0x40002000, 5034, 41,
+])
+
+# first register, number of registers, first subscriptor, number of subscriptors
+_register_layouts = _array("L", [
+    0, 5, 0, 0,
+    5, 5, 0, 0,
+    10, 3, 0, 0,
+    13, 11, 0, 1,
+    24, 13, 2, 0,
+    37, 5, 6, 0,
+    42, 30, 34, 6,
+    72, 22, 60, 1,
+    94, 3, 61, 0,
+    97, 24, 61, 3,
+    121, 11, 76, 0,
+    132, 11, 76, 0,
+    143, 11, 76, 0,
+    154, 23, 101, 2,
+    177, 22, 103, 1,
+    199, 33, 153, 5,
+    232, 33, 159, 5,
+    265, 8, 164, 0,
+    273, 9, 165, 0,
+    282, 12, 169, 0,
+    294, 12, 169, 0,
+    306, 10, 172, 0,
+    316, 9, 172, 0,
+    325, 12, 183, 6,
+    337, 20, 191, 0,
+    357, 34, 199, 4,
+    391, 24, 203, 2,
+    415, 10, 212, 2,
+    425, 2, 214, 0,
+    427, 4, 214, 1,
+    431, 6, 215, 2,
+    437, 23, 243, 6,
+    460, 29, 258, 6,
+    489, 3, 266, 0,
+    492, 8, 266, 1,
+    500, 3, 267, 0,
+    503, 18, 270, 2,
+    521, 39, 285, 1,
+    560, 37, 297, 2,
+    597, 14, 304, 2,
+    611, 13, 306, 1,
+    624, 4, 307, 0,
+])
+
+# attribute, name, offset, reset value (-1 if unknown), description, field layout, access flags
+_register_rows = _array("q", [
+    0, 0, 0x0, 0xFFFFFFFF, 16, 0, 0,
+    2, 2, 0x4, 0x0, 17, 1, 0,
+    18, 18, 0x8, 0x0, 19, 2, 0,
+    20, 20, 0x10, 0xFFFFFFFF, 21, 3, 0,
+    14, 14, 0x14, 0x4C11DB7, 22, 4, 0,
+    39, 39, 0x0, 0x0, 40, 5, 2,
+    27, 27, 0x4, 0x0, 41, 6, 0,
+    42, 42, 0x8, 0xFFF, 43, 7, 0,
+    44, 44, 0xC, 0x0, 45, 8, 1,
+    46, 46, 0x10, 0xFFF, 47, 9, 0,
+    18, 18, 0x0, 0x7F, 19, 10, 0,
+    62, 62, 0x4, 0x7F, 63, 11, 0,
+    44, 44, 0x8, 0x0, 45, 12, 0,
+    217, 217, 0x0, 0x0, 218, 13, 0,
+    219, 219, 0x4, 0x0, 220, 14, 0,
+    221, 221, 0x8, 0x0, 222, 15, 0,
+    223, 223, 0xC, 0x0, 224, 16, 0,
+    225, 225, 0x10, 0x0, 226, 17, 0,
+    227, 227, 0x14, 0x0, 228, 18, 0,
+    229, 229, 0x18, 0x1, 230, 19, 0,
+    231, 231, 0x1C, 0x0, 232, 20, 2,
+    233, 233, 0x20, 0x0, 234, 21, 1,
+    235, 235, 0x24, 0x0, 236, 22, 1,
+    237, 237, 0x28, 0x0, 238, 23, 0,
+    373, 373, 0x0, 0x600, 374, 24, 0,
+    263, 263, 0x4, 0x0, 375, 25, 2,
+    265, 265, 0x8, 0x0, 376, 26, 2,
+    266, 266, 0xC, 0x0, 377, 27, 2,
+    44, 44, 0x10, 0x0, 45, 28, 0,
+    18, 18, 0x14, 0xC0000000, 378, 29, 0,
+    379, 379, 0x18, 0x0, 380, 30, 0,
+    381, 381, 0x20, 0xF0000000, 382, 31, 0,
+    383, 383, 0x24, 0xFFFF0000, 384, 32, 0,
+    385, 385, 0x28, 0xFFF0000, 386, 33, 0,
+    387, 387, 0x2C, 0x0, 388, 34, 0,
+    389, 389, 0x30, 0x0, 390, 35, 0,
+    391, 391, 0x70, 0xFF00FF00, 392, 36, 0,
+    457, 457, 0x0, 0x0, 458, 37, 1,
+    18, 18, 0x4, 0x0, 459, 38, 0,
+    460, 460, 0x8, 0x0, 461, 39, 0,
+    462, 462, 0xC, 0x0, 463, 40, 0,
+    464, 464, 0x10, 0x0, 465, 41, 0,
+    18, 18, 0x0, 0x63, 1064, 42, 0,
+    1065, 1065, 0x4, 0x40000000, 1066, 43, 0,
+    1067, 1067, 0x8, 0x5, 1068, 44, 0,
+    1069, 1069, 0xC, 0x1000, 1070, 45, 0,
+    1071, 1071, 0x18, 0x0, 1072, 46, 0,
+    1073, 1073, 0x1C, 0x0, 1074, 47, 0,
+    1075, 1075, 0x20, 0x0, 1076, 48, 0,
+    1077, 1077, 0x28, 0x0, 1078, 49, 0,
+    1079, 1079, 0x2C, 0x0, 1080, 50, 0,
+    1081, 1081, 0x30, 0x0, 1082, 51, 0,
+    1083, 1083, 0x38, 0x0, 1084, 52, 0,
+    1085, 1085, 0x3C, 0x0, 1086, 53, 0,
+    1087, 1087, 0x40, 0x0, 1088, 54, 0,
+    1089, 1089, 0x48, 0x100, 1090, 55, 0,
+    1091, 1091, 0x4C, 0x0, 1092, 56, 0,
+    1093, 1093, 0x50, 0x0, 1094, 57, 0,
+    1095, 1095, 0x58, 0x400, 1096, 58, 0,
+    1097, 1097, 0x5C, 0x0, 1098, 59, 0,
+    1099, 1099, 0x60, 0x0, 1100, 60, 0,
+    1101, 1101, 0x68, 0x130F, 1102, 61, 0,
+    1103, 1103, 0x6C, 0x50F667F, 1104, 62, 0,
+    1105, 1105, 0x70, 0x101, 1106, 63, 0,
+    1107, 1107, 0x78, 0xD2FECD3F, 1108, 64, 0,
+    1109, 1109, 0x7C, 0x103, 1110, 65, 0,
+    1111, 1111, 0x80, 0x437F801, 1112, 66, 0,
+    1113, 1113, 0x88, 0x0, 1114, 67, 0,
+    1115, 1115, 0x90, 0x0, 1116, 68, 0,
+    1117, 1117, 0x94, 0xC000000, 1118, 69, 0,
+    1119, 1119, 0x98, 0x0, 1120, 70, 0,
+    1121, 1121, 0x9C, 0x0, 1114, 71, 0,
+    217, 217, 0x0, 0x200, 1292, 72, 0,
+    219, 219, 0x4, 0x0, 1293, 73, 0,
+    1294, 1294, 0x8, 0x8000, 1295, 74, 0,
+    1296, 1296, 0xC, 0x0, 1297, 75, 0,
+    1298, 1298, 0x10, 0x0, 1299, 76, 0,
+    1300, 1300, 0x14, 0x0, 1301, 77, 0,
+    1302, 1302, 0x18, 0x0, 1303, 78, 0,
+    1304, 1304, 0x20, 0x0, 1305, 79, 0,
+    1306, 1306, 0x24, 0x0, 1307, 80, 0,
+    1308, 1308, 0x28, 0x0, 1309, 81, 0,
+    1310, 1310, 0x2C, 0x0, 1311, 82, 0,
+    1312, 1312, 0x30, 0x0, 1313, 83, 0,
+    1314, 1314, 0x34, 0x0, 1315, 84, 0,
+    1316, 1316, 0x38, 0x0, 1317, 85, 0,
+    1318, 1318, 0x3C, 0x0, 1319, 86, 0,
+    1320, 1320, 0x40, 0x0, 1321, 87, 0,
+    1322, 1322, 0x44, 0x0, 1323, 88, 0,
+    1324, 1324, 0x48, 0x0, 1325, 89, 0,
+    1326, 1326, 0x4C, 0x0, 1327, 90, 0,
+    1328, 1328, 0x50, 0x0, 1329, 91, 0,
+    1330, 1330, 0x54, 0x0, 1331, 92, 0,
+    1332, 1332, 0x80, 0x100, 1333, 93, 0,
+    18, 18, 0x0, 0x0, 1354, 94, 0,
+    44, 44, 0x4, 0x0, 1355, 95, 0,
+    0, 0, 0x8, 0x0, 1356, 96, 1,
+    18, 18, 0x0, 0x0, 1354, 97, 0,
+    44, 44, 0x4, 0x0, 1355, 98, 1,
+    1408, 1408, 0x8, 0x0, 1409, 99, 0,
+    1410, 1410, 0xC, 0x0, 1411, 100, 1,
+    1412, 1412, 0x10, 0x0, 1413, 101, 0,
+    1414, 1414, 0x14, 0x0, 1415, 102, 0,
+    1416, 1416, 0x18, 0x0, 1417, 103, 0,
+    1418, 1418, 0x1C, 0x0, 1419, 104, 0,
+    1420, 1420, 0x20, 0x0, 1421, 105, 0,
+    1422, 1422, 0x24, 0x0, 1423, 106, 0,
+    1424, 1424, 0x28, 0x0, 1425, 107, 0,
+    1426, 1426, 0x2C, 0x0, 1427, 108, 0,
+    1428, 1428, 0x30, 0x0, 1429, 109, 0,
+    1430, 1430, 0x34, 0x0, 1431, 109, 0,
+    1432, 1432, 0x38, 0x0, 1433, 109, 0,
+    1434, 1434, 0x3C, 0x0, 1435, 109, 0,
+    1436, 1436, 0x40, 0x0, 1437, 110, 0,
+    1438, 1438, 0x44, 0x0, 1437, 110, 0,
+    1439, 1439, 0x48, 0x0, 1437, 110, 0,
+    1440, 1440, 0x4C, 0x0, 1437, 110, 0,
+    1441, 1441, 0x50, 0x0, 1437, 110, 0,
+    1442, 1442, 0x54, 0x0, 1437, 110, 0,
+    1443, 1443, 0x58, 0x0, 1437, 110, 0,
+    1444, 1444, 0x5C, 0x0, 1437, 110, 0,
+    1469, 1469, 0x0, 0xABFFFFFF, 1643, 111, 0,
+    1644, 1644, 0x4, 0x0, 1645, 112, 0,
+    1505, 1505, 0x8, 0xC000000, 1646, 113, 0,
+    1523, 1523, 0xC, 0x64000000, 1647, 114, 0,
+    2, 2, 0x10, 0x0, 1648, 115, 1,
+    1560, 1560, 0x14, 0x0, 1649, 116, 0,
+    1650, 1650, 0x18, 0x0, 1651, 117, 2,
+    1652, 1652, 0x1C, 0x0, 1653, 118, 0,
+    1629, 1629, 0x20, 0x0, 1654, 119, 0,
+    1640, 1640, 0x24, 0x0, 1655, 120, 0,
+    1656, 1656, 0x28, 0x0, 1657, 121, 2,
+    1469, 1469, 0x0, 0xFFFFFEBF, 1643, 111, 0,
+    1644, 1644, 0x4, 0x0, 1645, 112, 0,
+    1505, 1505, 0x8, 0xC0, 1646, 113, 0,
+    1523, 1523, 0xC, 0x100, 1647, 114, 0,
+    2, 2, 0x10, 0x0, 1648, 115, 1,
+    1560, 1560, 0x14, 0x0, 1649, 116, 0,
+    1650, 1650, 0x18, 0x0, 1651, 117, 2,
+    1652, 1652, 0x1C, 0x0, 1653, 118, 0,
+    1629, 1629, 0x20, 0x0, 1654, 119, 0,
+    1640, 1640, 0x24, 0x0, 1655, 120, 0,
+    1656, 1656, 0x28, 0x0, 1657, 121, 2,
+    1469, 1469, 0x0, 0xFFFFFFFF, 1643, 111, 0,
+    1644, 1644, 0x4, 0x0, 1645, 112, 0,
+    1505, 1505, 0x8, 0x0, 1646, 113, 0,
+    1523, 1523, 0xC, 0x0, 1647, 114, 0,
+    2, 2, 0x10, 0x0, 1648, 115, 1,
+    1560, 1560, 0x14, 0x0, 1649, 116, 0,
+    1650, 1650, 0x18, 0x0, 1651, 117, 2,
+    1652, 1652, 0x1C, 0x0, 1653, 118, 0,
+    1629, 1629, 0x20, 0x0, 1654, 119, 0,
+    1640, 1640, 0x24, 0x0, 1655, 120, 0,
+    1656, 1656, 0x28, 0x0, 1657, 121, 2,
+    217, 217, 0x0, 0x0, 1896, 122, 0,
+    219, 219, 0x4, 0x0, 1897, 123, 0,
+    1898, 1898, 0x8, 0x0, 1899, 124, 0,
+    1900, 1900, 0xC, 0x0, 1901, 125, 0,
+    44, 44, 0x10, 0x0, 1355, 126, 0,
+    1902, 1902, 0x14, 0x0, 1903, 127, 0,
+    1904, 1904, 0x18, 0x0, 1905, 128, 0,
+    1906, 1906, 0x18, 0x0, 1907, 129, 0,
+    1908, 1908, 0x20, 0x0, 1909, 130, 0,
+    1815, 1815, 0x24, 0x0, 1910, 131, 0,
+    1819, 1819, 0x28, 0x0, 1911, 132, 0,
+    1821, 1821, 0x2C, 0xFFFF, 1912, 133, 0,
+    1913, 1913, 0x30, 0x0, 1914, 134, 0,
+    1825, 1825, 0x34, 0x0, 1915, 135, 0,
+    1827, 1827, 0x38, 0x0, 1916, 136, 0,
+    1917, 1917, 0x44, 0x0, 1918, 137, 0,
+    1919, 1919, 0x54, 0x0, 1920, 138, 0,
+    1856, 1856, 0x5C, 0x0, 1921, 139, 0,
+    1922, 1922, 0x60, 0x0, 1923, 140, 0,
+    1924, 1924, 0x64, 0x0, 1925, 141, 0,
+    1926, 1926, 0x3DC, 0x0, 1927, 142, 0,
+    1928, 1928, 0x3E0, 0x0, 1929, 143, 0,
+    1930, 1930, 0x18, 0x0, 1931, 144, 0,
+    217, 217, 0x0, 0x0, 1896, 122, 0,
+    219, 219, 0x4, 0x0, 1897, 145, 0,
+    1900, 1900, 0xC, 0x0, 1901, 146, 0,
+    44, 44, 0x10, 0x0, 1355, 147, 0,
+    1902, 1902, 0x14, 0x0, 1903, 148, 2,
+    1904, 1904, 0x18, 0x0, 1905, 149, 0,
+    1906, 1906, 0x18, 0x0, 1907, 150, 0,
+    1908, 1908, 0x20, 0x0, 1909, 151, 0,
+    1815, 1815, 0x24, 0x0, 1910, 152, 0,
+    1819, 1819, 0x28, 0x0, 1911, 132, 0,
+    1821, 1821, 0x2C, 0xFFFF, 1912, 133, 0,
+    1913, 1913, 0x30, 0x0, 1914, 134, 0,
+    1825, 1825, 0x34, 0x0, 1915, 135, 0,
+    1917, 1917, 0x44, 0x0, 1918, 137, 0,
+    1919, 1919, 0x54, 0x0, 1920, 138, 0,
+    1856, 1856, 0x5C, 0x0, 1921, 153, 0,
+    1922, 1922, 0x60, 0x0, 1923, 140, 0,
+    1924, 1924, 0x64, 0x0, 1925, 141, 0,
+    1940, 1940, 0x68, 0x0, 1941, 154, 0,
+    1926, 1926, 0x3DC, 0x0, 1927, 142, 0,
+    1928, 1928, 0x3E0, 0x0, 1929, 143, 0,
+    1930, 1930, 0x18, 0x0, 1931, 155, 0,
+    217, 217, 0x0, 0x0, 1896, 156, 0,
+    219, 219, 0x4, 0x0, 1897, 157, 0,
+    1898, 1898, 0x8, 0x0, 1899, 158, 0,
+    1900, 1900, 0xC, 0x0, 1901, 159, 0,
+    44, 44, 0x10, 0x0, 1355, 160, 0,
+    1902, 1902, 0x14, 0x0, 1903, 161, 2,
+    1904, 1904, 0x18, 0x0, 2184, 162, 0,
+    1906, 1906, 0x18, 0x0, 1907, 163, 0,
+    2185, 2185, 0x1C, 0x0, 2186, 164, 0,
+    2187, 2187, 0x1C, 0x0, 2188, 165, 0,
+    1908, 1908, 0x20, 0x0, 1909, 166, 0,
+    1815, 1815, 0x24, 0x0, 1910, 167, 0,
+    1819, 1819, 0x28, 0x0, 1911, 132, 0,
+    1821, 1821, 0x2C, 0xFFFF, 1912, 133, 0,
+    1913, 1913, 0x30, 0x0, 1914, 168, 0,
+    1825, 1825, 0x34, 0x0, 1915, 135, 0,
+    1827, 1827, 0x38, 0x0, 1916, 169, 0,
+    2095, 2095, 0x3C, 0x0, 2189, 170, 0,
+    2097, 2097, 0x40, 0x0, 2190, 171, 0,
+    1917, 1917, 0x44, 0x0, 1918, 172, 0,
+    2106, 2106, 0x48, 0x0, 2190, 173, 0,
+    2115, 2115, 0x4C, 0x0, 2190, 174, 0,
+    2191, 2191, 0x50, 0x0, 2186, 175, 0,
+    1919, 1919, 0x54, 0x0, 1920, 176, 0,
+    2192, 2192, 0x58, 0x0, 1927, 177, 0,
+    1856, 1856, 0x5C, 0x0, 1921, 178, 0,
+    1922, 1922, 0x60, 0x0, 1923, 179, 0,
+    1924, 1924, 0x64, 0x0, 1925, 180, 0,
+    1926, 1926, 0x3DC, 0x0, 1354, 142, 0,
+    1928, 1928, 0x3E0, 0x0, 1929, 143, 0,
+    1930, 1930, 0x18, 0x0, 2193, 181, 0,
+    2194, 2194, 0x1C, 0x0, 2195, 182, 0,
+    2196, 2196, 0x50, 0x0, 2195, 175, 0,
+    217, 217, 0x0, 0x0, 1896, 156, 0,
+    219, 219, 0x4, 0x0, 1897, 157, 0,
+    1898, 1898, 0x8, 0x0, 1899, 158, 0,
+    1900, 1900, 0xC, 0x0, 1901, 159, 0,
+    44, 44, 0x10, 0x0, 1355, 160, 0,
+    1902, 1902, 0x14, 0x0, 1903, 183, 2,
+    1904, 1904, 0x18, 0x0, 2184, 162, 0,
+    1906, 1906, 0x18, 0x0, 1907, 163, 0,
+    2185, 2185, 0x1C, 0x0, 2186, 164, 0,
+    2187, 2187, 0x1C, 0x0, 2188, 165, 0,
+    1908, 1908, 0x20, 0x0, 1909, 166, 0,
+    1815, 1815, 0x24, 0x0, 1910, 184, 0,
+    1819, 1819, 0x28, 0x0, 1911, 132, 0,
+    1821, 1821, 0x2C, 0xFFFFFFFF, 1912, 133, 0,
+    1913, 1913, 0x30, 0x0, 1914, 168, 0,
+    1825, 1825, 0x34, 0x0, 1915, 135, 0,
+    1827, 1827, 0x38, 0x0, 1916, 169, 0,
+    2095, 2095, 0x3C, 0x0, 2189, 170, 0,
+    2097, 2097, 0x40, 0x0, 2190, 171, 0,
+    1917, 1917, 0x44, 0x0, 1918, 172, 0,
+    2106, 2106, 0x48, 0x0, 2190, 173, 0,
+    2115, 2115, 0x4C, 0x0, 2190, 174, 0,
+    2191, 2191, 0x50, 0x0, 2186, 175, 0,
+    1919, 1919, 0x54, 0x0, 1920, 176, 0,
+    2192, 2192, 0x58, 0x0, 1927, 177, 0,
+    1856, 1856, 0x5C, 0x0, 1921, 178, 0,
+    1922, 1922, 0x60, 0x0, 1923, 179, 0,
+    1924, 1924, 0x64, 0x0, 1925, 180, 0,
+    1926, 1926, 0x3DC, 0x0, 1354, 142, 0,
+    1928, 1928, 0x3E0, 0x0, 1929, 143, 0,
+    1930, 1930, 0x18, 0x0, 2193, 181, 0,
+    2194, 2194, 0x1C, 0x0, 2195, 182, 0,
+    2196, 2196, 0x50, 0x0, 2195, 175, 0,
+    217, 217, 0x0, 0x0, 1896, 185, 0,
+    219, 219, 0x4, 0x0, 1897, 186, 0,
+    1900, 1900, 0xC, 0x0, 1901, 187, 0,
+    44, 44, 0x10, 0x0, 1355, 188, 0,
+    1902, 1902, 0x14, 0x0, 1903, 189, 2,
+    1815, 1815, 0x24, 0x0, 1910, 190, 0,
+    1819, 1819, 0x28, 0x0, 1911, 132, 0,
+    1821, 1821, 0x2C, 0xFFFF, 1912, 191, 0,
+    229, 229, 0x0, 0x0, 2298, 192, 0,
+    231, 231, 0x4, 0x0, 2299, 193, 0,
+    2300, 2300, 0x8, 0x0, 2301, 194, 0,
+    1067, 1067, 0xC, 0x0, 2302, 195, 0,
+    18, 18, 0x10, 0x0, 2303, 196, 0,
+    2290, 2290, 0x14, 0x0, 2304, 197, 0,
+    1821, 1821, 0x18, 0x1, 2305, 198, 0,
+    1815, 1815, 0x1C, 0x0, 2306, 199, 0,
+    2307, 2307, 0x20, 0x0, 2308, 200, 0,
+    217, 217, 0x0, 0x0, 218, 201, 0,
+    219, 219, 0x4, 0x0, 220, 202, 0,
+    1294, 1294, 0x8, 0x0, 2521, 203, 0,
+    1656, 1656, 0xC, 0x0, 2522, 204, 0,
+    2523, 2523, 0x10, 0x0, 2524, 205, 0,
+    2525, 2525, 0x14, 0x0, 2526, 206, 0,
+    2527, 2527, 0x18, 0x0, 2528, 207, 2,
+    229, 229, 0x1C, 0x0, 2529, 208, 1,
+    231, 231, 0x20, 0x0, 2530, 209, 2,
+    2516, 2516, 0x24, 0x0, 236, 210, 1,
+    2518, 2518, 0x28, 0x0, 238, 211, 0,
+    147, 147, 0x2C, 0x0, 2531, 212, 0,
+    217, 217, 0x0, 0x0, 218, 201, 0,
+    219, 219, 0x4, 0x0, 220, 202, 0,
+    1294, 1294, 0x8, 0x0, 2521, 203, 0,
+    1656, 1656, 0xC, 0x0, 2522, 204, 0,
+    2523, 2523, 0x10, 0x0, 2524, 205, 0,
+    2525, 2525, 0x14, 0x0, 2526, 206, 0,
+    2527, 2527, 0x18, 0x0, 2528, 207, 2,
+    229, 229, 0x1C, 0xC0, 2529, 208, 1,
+    231, 231, 0x20, 0x0, 2530, 209, 2,
+    2516, 2516, 0x24, 0x0, 236, 210, 1,
+    2518, 2518, 0x28, 0x0, 238, 211, 0,
+    147, 147, 0x2C, 0x0, 2531, 212, 0,
+    217, 217, 0x0, 0x0, 218, 213, 0,
+    219, 219, 0x4, 0x0, 220, 214, 0,
+    1294, 1294, 0x8, 0x0, 2521, 215, 0,
+    1656, 1656, 0xC, 0x0, 2522, 216, 0,
+    2527, 2527, 0x18, 0x0, 2528, 217, 2,
+    229, 229, 0x1C, 0xC0, 2529, 218, 1,
+    231, 231, 0x20, 0x0, 2530, 219, 2,
+    2516, 2516, 0x24, 0x0, 236, 210, 1,
+    2518, 2518, 0x28, 0x0, 238, 211, 0,
+    147, 147, 0x2C, 0x0, 41, 212, 0,
+    217, 217, 0x0, 0x0, 1896, 220, 0,
+    219, 219, 0x4, 0x700, 1897, 221, 0,
+    44, 44, 0x8, 0x2, 1355, 222, 0,
+    0, 0, 0xC, 0x0, 1356, 223, 0,
+    2607, 2607, 0x10, 0x7, 2592, 224, 0,
+    2608, 2608, 0x14, 0x0, 2609, 225, 1,
+    2610, 2610, 0x18, 0x0, 2611, 226, 1,
+    2612, 2612, 0x1C, 0x0, 2613, 227, 0,
+    2614, 2614, 0x20, 0x2, 2615, 228, 0,
+    3021, 3021, 0x0, 0xFF820000, 3022, 229, 0,
+    3023, 3023, 0x4, 0x0, 3024, 230, 0,
+    3025, 3025, 0x8, 0x0, 3026, 231, 0,
+    3027, 3027, 0xC, 0x0, 3028, 232, 0,
+    3029, 3029, 0x10, 0x0, 3030, 233, 0,
+    3031, 3031, 0x14, 0x0, 3032, 234, 0,
+    3033, 3033, 0x20, 0xFFFFFF87, 3022, 235, 0,
+    3034, 3034, 0x24, 0x0, 3024, 236, 0,
+    3035, 3035, 0x28, 0x0, 3026, 237, 0,
+    3036, 3036, 0x2C, 0x0, 3028, 238, 0,
+    3037, 3037, 0x30, 0x0, 3030, 239, 0,
+    3038, 3038, 0x34, 0x0, 3032, 240, 0,
+    3201, 3201, 0x0, 0x0, 3202, 241, 0,
+    0, 0, 0x4, 0x2101, 3203, 242, 0,
+    3204, 3204, 0x8, 0x0, 3205, 243, 1,
+    3206, 3206, 0xC, 0x7, 3207, 244, 0,
+    3208, 3208, 0x10, 0x7F00FF, 2615, 245, 0,
+    3209, 3209, 0x14, 0xFFFF, 3210, 246, 0,
+    18, 18, 0x18, 0x0, 1354, 247, 0,
+    3211, 3211, 0x24, 0x0, 3212, 248, 2,
+    3213, 3213, 0x28, 0x0, 3214, 249, 0,
+    3215, 3215, 0x2C, 0x0, 3216, 250, 2,
+    3217, 3217, 0x30, 0x0, 3218, 251, 1,
+    3219, 3219, 0x34, 0x0, 3220, 252, 1,
+    3221, 3221, 0x38, 0x0, 3222, 243, 1,
+    3223, 3223, 0x40, 0x0, 3224, 253, 0,
+    3225, 3225, 0x44, 0x0, 3226, 254, 0,
+    3227, 3227, 0x48, 0x0, 3228, 255, 0,
+    3229, 3229, 0x4C, 0x0, 3230, 254, 0,
+    44, 44, 0x50, 0x0, 1355, 256, 1,
+    3231, 3231, 0x54, 0x0, 1355, 257, 1,
+    1302, 1302, 0x5C, 0x0, 1355, 258, 2,
+    229, 229, 0x0, 0x0, 3290, 259, 1,
+    3291, 3291, 0x4, 0x0, 3292, 260, 2,
+    1825, 1825, 0x8, 0x0, 3293, 261, 0,
+    1827, 1827, 0x1C, 0x0, 3294, 261, 0,
+    2095, 2095, 0x30, 0x0, 3295, 261, 0,
+    2097, 2097, 0x44, 0x0, 3295, 261, 0,
+    2106, 2106, 0x58, 0x0, 3296, 261, 0,
+    2115, 2115, 0x6C, 0x0, 3297, 261, 0,
+    3298, 3298, 0x80, 0x0, 3299, 261, 0,
+    3300, 3300, 0x94, 0x0, 3301, 261, 0,
+    3302, 3302, 0xC, 0x0, 3303, 262, 0,
+    3304, 3304, 0x20, 0x0, 3303, 262, 0,
+    3305, 3305, 0x34, 0x0, 3303, 262, 0,
+    3306, 3306, 0x48, 0x0, 3303, 262, 0,
+    3307, 3307, 0x5C, 0x0, 3303, 262, 0,
+    3308, 3308, 0x70, 0x0, 3303, 262, 0,
+    3309, 3309, 0x84, 0x0, 3303, 262, 0,
+    3310, 3310, 0x98, 0x0, 3303, 262, 0,
+    3311, 3311, 0x10, 0x0, 3312, 263, 0,
+    3313, 3313, 0x24, 0x0, 3312, 263, 0,
+    3314, 3314, 0x38, 0x0, 3312, 263, 0,
+    3315, 3315, 0x4C, 0x0, 3312, 263, 0,
+    3316, 3316, 0x60, 0x0, 3312, 263, 0,
+    3317, 3317, 0x74, 0x0, 3312, 263, 0,
+    3318, 3318, 0x88, 0x0, 3312, 263, 0,
+    3319, 3319, 0x9C, 0x0, 3312, 263, 0,
+    3320, 3320, 0x14, 0x0, 3321, 264, 0,
+    3322, 3322, 0x28, 0x0, 3321, 264, 0,
+    3323, 3323, 0x3C, 0x0, 3321, 264, 0,
+    3324, 3324, 0x50, 0x0, 3321, 264, 0,
+    3325, 3325, 0x64, 0x0, 3321, 264, 0,
+    3326, 3326, 0x78, 0x0, 3321, 264, 0,
+    3327, 3327, 0x8C, 0x0, 3321, 264, 0,
+    3328, 3328, 0xA0, 0x0, 3321, 264, 0,
+    3370, 3370, 0x0, 0x0, 3371, 265, 0,
+    3372, 3372, 0x4, 0x0, 3371, 265, 0,
+    3373, 3373, 0x8, 0x0, 3371, 265, 0,
+    3374, 3374, 0xC, 0x0, 3371, 265, 0,
+    3375, 3375, 0x10, 0x0, 3371, 265, 0,
+    3376, 3376, 0x14, 0x0, 3371, 265, 0,
+    3377, 3377, 0x18, 0x0, 3371, 265, 0,
+    3378, 3378, 0x1C, 0x0, 3371, 265, 0,
+    3379, 3379, 0x20, 0x0, 3371, 265, 0,
+    3380, 3380, 0x24, 0x0, 3371, 265, 0,
+    3381, 3381, 0x28, 0x0, 3371, 265, 0,
+    3382, 3382, 0x2C, 0x0, 3371, 265, 0,
+    3383, 3383, 0x30, 0x0, 3371, 265, 0,
+    3384, 3384, 0x34, 0x0, 3371, 265, 0,
+    3385, 3385, 0x38, 0x0, 3371, 265, 0,
+    3386, 3386, 0x3C, 0x0, 3371, 265, 0,
+    3387, 3387, 0x100, 0x0, 3388, 266, 0,
+    3389, 3389, 0x104, 0x0, 3388, 266, 0,
+    3390, 3390, 0x108, 0x0, 3388, 266, 0,
+    3391, 3391, 0x10C, 0x0, 3388, 266, 0,
+    3392, 3392, 0x140, 0x0, 3393, 267, 1,
+    3394, 3394, 0x144, 0x0, 3395, 268, 2,
+    1117, 1117, 0x80, 0x0, 3396, 269, 1,
+    62, 62, 0x84, 0x0, 3397, 270, 2,
+    3496, 3496, 0x0, 0x0, 3497, 271, 0,
+    3498, 3498, 0x4, 0x7C000001, 3499, 272, 0,
+    3500, 3500, 0x8, 0x0, 3501, 273, 0,
+    3502, 3502, 0xC, 0x0, 3503, 274, 0,
+    3504, 3504, 0x10, 0x0, 3505, 275, 0,
+    3506, 3506, 0x14, 0x0, 3507, 276, 0,
+    3508, 3508, 0x18, 0x0, 3509, 277, 0,
+    3510, 3510, 0x1C, 0x0, 3511, 278, 0,
+    3512, 3512, 0x20, 0x0, 3513, 279, 0,
+    3514, 3514, 0x24, 0x0, 3515, 280, 2,
+    1117, 1117, 0x0, 0x2, 3531, 281, 0,
+    1934, 1934, 0x4, 0x0, 3532, 282, 0,
+    3542, 3542, 0x0, 0x0, 3543, 283, 0,
+    3544, 3544, 0x4, 0x0, 3543, 283, 0,
+    3545, 3545, 0x8, 0x0, 3543, 283, 0,
+    3546, 3546, 0xC, 0x0, 3543, 283, 0,
+    3570, 3570, 0x0, 0x0, 3571, 284, 0,
+    3572, 3572, 0x4, 0x0, 3573, 284, 0,
+    3574, 3574, 0x8, 0x0, 3575, 284, 0,
+    3576, 3576, 0x18, 0x0, 3571, 285, 0,
+    3577, 3577, 0x1C, 0x0, 3573, 285, 0,
+    3578, 3578, 0x20, 0x0, 3575, 285, 0,
+    18, 18, 0x0, 0x0, 3762, 286, 0,
+    3763, 3763, 0x4, 0x0, 3764, 287, 2,
+    3765, 3765, 0x8, 0x0, 3766, 288, 0,
+    3767, 3767, 0xC, 0x0, 3768, 289, 0,
+    3769, 3769, 0x10, 0x0, 3770, 290, 0,
+    3771, 3771, 0x14, 0x0, 3772, 291, 0,
+    3773, 3773, 0x18, 0x0, 3774, 292, 0,
+    3775, 3775, 0x1C, 0x0, 3776, 293, 0,
+    3777, 3777, 0x20, 0x0, 3778, 294, 0,
+    3779, 3779, 0x24, 0x0, 3780, 295, 0,
+    3781, 3781, 0x28, 0x0, 3782, 296, 0,
+    3783, 3783, 0x2C, 0x0, 3784, 297, 1,
+    3785, 3785, 0x30, 0x0, 3786, 298, 1,
+    44, 44, 0x34, 0x0, 3787, 299, 0,
+    1934, 1934, 0x38, 0x0, 3788, 300, 0,
+    3789, 3789, 0x3C, 0x0, 3790, 301, 0,
+    3791, 3791, 0x40, 0x0, 3792, 302, 0,
+    3793, 3793, 0x44, 0x0, 3794, 303, 0,
+    3795, 3795, 0x48, 0x10001, 3796, 304, 0,
+    3797, 3797, 0x4C, 0x10001, 3798, 305, 0,
+    3799, 3799, 0x58, 0x0, 3800, 306, 0,
+    3801, 3801, 0x5C, 0x0, 3800, 307, 0,
+    3802, 3802, 0x60, 0x0, 3803, 308, 0,
+    229, 229, 0x0, 0x0, 3966, 309, 0,
+    2300, 2300, 0x4, 0x0, 3967, 310, 0,
+    18, 18, 0x8, 0x20000000, 1354, 311, 0,
+    1067, 1067, 0xC, 0x80000000, 2613, 312, 0,
+    3510, 3510, 0x10, 0x0, 2613, 313, 0,
+    3968, 3968, 0x14, 0x0, 3969, 314, 0,
+    3970, 3970, 0x18, 0x0, 3971, 315, 0,
+    3972, 3972, 0x20, 0xFFF0000, 3973, 316, 0,
+    3974, 3974, 0x24, 0xFF0000, 3975, 317, 0,
+    3976, 3976, 0x28, 0xFF0000, 3977, 318, 0,
+    3978, 3978, 0x30, 0x0, 3979, 319, 0,
+    3980, 3980, 0x34, 0x0, 3981, 320, 0,
+    3982, 3982, 0x38, 0x0, 3983, 321, 0,
+    3984, 3984, 0x3C, 0x0, 3985, 322, 0,
+    0, 0, 0x40, 0x0, 3986, 323, 1,
+    3987, 3987, 0x4C, 0x0, 3988, 324, 0,
+    3989, 3989, 0x60, 0x0, 3990, 325, 0,
+    3991, 3991, 0x64, 0x0, 3992, 325, 0,
+    3993, 3993, 0x68, 0x0, 3994, 325, 0,
+    3995, 3995, 0x6C, 0x0, 3996, 325, 0,
+    3997, 3997, 0x80, 0x0, 3998, 326, 1,
+    3999, 3999, 0x84, 0x0, 4000, 327, 1,
+    4001, 4001, 0x88, 0x0, 4002, 328, 1,
+    4003, 4003, 0x8C, 0x0, 4004, 329, 1,
+    4005, 4005, 0xA0, 0x0, 4006, 330, 0,
+    4007, 4007, 0xA4, 0x0, 4008, 331, 0,
+    4009, 4009, 0xB0, 0x0, 4010, 332, 0,
+    4011, 4011, 0xB4, 0x0, 4012, 333, 0,
+    3879, 3879, 0xC0, 0x0, 4013, 334, 0,
+    1117, 1117, 0x0, 0x0, 4083, 335, 1,
+    1934, 1934, 0x8, 0x0, 4084, 336, 0,
+    4085, 4085, 0xC, 0x0, 4086, 337, 1,
+    4115, 4115, 0x0, 0x0, 4116, 338, 0,
+    4117, 4117, 0x4, 0x0, 4118, 339, 0,
+    4119, 4119, 0x8, 0x0, 4120, 340, 0,
+    4121, 4121, 0xC, 0x0, 4122, 341, 0,
+    18, 18, 0x10, 0x0, 4123, 342, 0,
+    44, 44, 0x14, 0x0, 4124, 343, 1,
+    4114, 4114, 0x18, 0x0, 4125, 344, 2,
+    3937, 3937, 0x1C, 0x0, 4126, 345, 1,
+    1117, 1117, 0x0, 0x0, 4140, 346, 0,
+    4114, 4114, 0x4, 0x0, 4125, 347, 0,
+    3937, 3937, 0x8, 0x0, 4126, 348, 1,
+    4257, 4257, 0x24, 0x40, 4258, 349, 0,
+    4259, 4259, 0x28, 0x0, 4260, 350, 0,
+    4261, 4261, 0x2C, 0x7, 4261, 351, 0,
+    4262, 4262, 0x30, 0x0, 4263, 352, 0,
+    4264, 4264, 0x34, 0x0, 4265, 353, 0,
+    4266, 4266, 0x38, 0x0, 4267, 354, 1,
+    4268, 4268, 0x3C, 0x0, 4269, 355, 2,
+    4270, 4270, 0x40, 0x0, 4271, 356, 0,
+    4272, 4272, 0x4, 0x40, 4273, 357, 0,
+    4274, 4274, 0x8, 0x0, 4275, 350, 0,
+    4276, 4276, 0xC, 0x7, 4276, 351, 0,
+    4277, 4277, 0x10, 0x0, 4278, 352, 0,
+    4279, 4279, 0x14, 0x0, 4280, 358, 0,
+    4281, 4281, 0x18, 0x0, 4282, 359, 0,
+    4283, 4283, 0x1C, 0x0, 4284, 360, 0,
+    4285, 4285, 0x20, 0x0, 4286, 356, 0,
+    4287, 4287, 0x44, 0x0, 4288, 361, 0,
+    4289, 4289, 0x48, 0x0, 4290, 362, 0,
+    217, 217, 0x0, 0xFFFF0000, 1896, 363, 0,
+    219, 219, 0x4, 0x0, 1897, 364, 0,
+    4371, 4371, 0xC, 0x0, 4372, 365, 0,
+    2300, 2300, 0x2C, 0x0, 4373, 366, 0,
+    44, 44, 0x30, 0x0, 4374, 367, 1,
+    3231, 3231, 0x34, 0x0, 4375, 368, 1,
+    1302, 1302, 0x3C, 0x0, 4376, 369, 0,
+    4377, 4377, 0x100, 0x0, 4378, 370, 0,
+    4379, 4379, 0x104, 0x0, 4378, 370, 0,
+    4380, 4380, 0x108, 0x0, 4378, 370, 0,
+    4381, 4381, 0x10C, 0x0, 4378, 370, 0,
+    4382, 4382, 0x110, 0x0, 4378, 370, 0,
+    4383, 4383, 0x114, 0x0, 4378, 370, 0,
+    4384, 4384, 0x118, 0x0, 4378, 370, 0,
+    4385, 4385, 0x11C, 0x0, 4378, 370, 0,
+    4386, 4386, 0x120, 0x0, 4378, 370, 0,
+    4387, 4387, 0x124, 0x0, 4378, 370, 0,
+    4388, 4388, 0x128, 0x0, 4378, 370, 0,
+    4389, 4389, 0x12C, 0x0, 4378, 370, 0,
+    4390, 4390, 0x130, 0x0, 4378, 370, 0,
+    4391, 4391, 0x134, 0x0, 4378, 370, 0,
+    4392, 4392, 0x138, 0x0, 4378, 370, 0,
+    4393, 4393, 0x13C, 0x0, 4378, 370, 0,
+    4394, 4394, 0x140, 0x0, 4378, 370, 0,
+    4395, 4395, 0x144, 0x0, 4378, 370, 0,
+    4396, 4396, 0x148, 0x0, 4378, 370, 0,
+    4397, 4397, 0x14C, 0x0, 4378, 370, 0,
+    4398, 4398, 0x150, 0x0, 4378, 370, 0,
+    4399, 4399, 0x154, 0x0, 4378, 370, 0,
+    4400, 4400, 0x158, 0x0, 4378, 370, 0,
+    4401, 4401, 0x15C, 0x0, 4378, 370, 0,
+    4402, 4402, 0x160, 0x0, 4378, 370, 0,
+    4403, 4403, 0x164, 0x0, 4378, 370, 0,
+    4404, 4404, 0x168, 0x0, 4378, 370, 0,
+    4405, 4405, 0x16C, 0x0, 4378, 370, 0,
+    4406, 4406, 0x170, 0x0, 4378, 370, 0,
+    4407, 4407, 0x174, 0x0, 4378, 370, 0,
+    4408, 4408, 0x178, 0x0, 4378, 370, 0,
+    4409, 4409, 0x17C, 0x0, 4378, 370, 0,
+    4736, 4736, 0x0, 0x32141218, 4737, 371, 0,
+    4738, 4738, 0x4, 0x87654321, 4739, 372, 0,
+    4740, 4740, 0xC, 0xA33, 4741, 373, 0,
+    4460, 4460, 0x10, 0x0, 4742, 374, 0,
+    4743, 4743, 0x14, 0x0, 4744, 375, 0,
+    4745, 4745, 0x18, 0x1, 4746, 376, 0,
+    4747, 4747, 0x1C, 0x6000A03, 4748, 377, 0,
+    4749, 4749, 0x20, 0x0, 4750, 378, 0,
+    4751, 4751, 0x24, 0x0, 4752, 379, 0,
+    4753, 4753, 0x28, 0xFFFF0000, 4754, 380, 0,
+    4755, 4755, 0x2C, 0xFFFF, 4756, 381, 0,
+    2192, 2192, 0x40, 0x0, 4757, 382, 0,
+    4758, 4758, 0x44, 0x707, 4759, 383, 0,
+    4760, 4760, 0x48, 0x0, 4761, 384, 0,
+    4762, 4762, 0x50, 0x0, 4763, 385, 0,
+    1339, 1339, 0x54, 0x0, 4764, 386, 0,
+    4765, 4765, 0x58, 0x0, 4766, 387, 0,
+    4767, 4767, 0x5C, 0x0, 4768, 388, 0,
+    4769, 4769, 0x80, 0x0, 4770, 389, 0,
+    4771, 4771, 0x84, 0x1FFFFFFF, 4772, 390, 0,
+    4773, 4773, 0x88, 0x0, 4774, 391, 0,
+    4775, 4775, 0x90, 0x0, 4776, 392, 0,
+    4777, 4777, 0x94, 0x0, 4778, 393, 0,
+    4779, 4779, 0x98, 0x0, 4780, 394, 0,
+    4781, 4781, 0x9C, 0x0, 4782, 395, 0,
+    4783, 4783, 0xC0, 0x0, 4784, 396, 0,
+    4785, 4785, 0xC4, 0x3, 4786, 397, 0,
+    4787, 4787, 0xC8, 0x0, 4788, 398, 0,
+    4789, 4789, 0xCC, 0x0, 4790, 399, 0,
+    4791, 4791, 0xD0, 0x0, 4792, 400, 0,
+    4793, 4793, 0xD4, 0x0, 4794, 401, 0,
+    4795, 4795, 0xD8, 0x0, 4796, 402, 0,
+    4797, 4797, 0xDC, 0x0, 4798, 403, 0,
+    4799, 4799, 0xE0, 0x0, 4800, 404, 0,
+    4801, 4801, 0xE4, 0x0, 4802, 405, 0,
+    4803, 4803, 0xE8, 0x0, 4804, 406, 0,
+    4805, 4805, 0x100, 0x0, 4806, 407, 0,
+    4897, 4897, 0x0, 0x0, 4898, 408, 0,
+    4899, 4899, 0x4, 0x0, 4900, 409, 0,
+    18, 18, 0xC, 0x0, 4900, 410, 0,
+    3046, 3046, 0x10, 0x0, 4901, 411, 0,
+    44, 44, 0x14, 0x0, 4902, 412, 0,
+    231, 231, 0x18, 0x0, 4903, 413, 0,
+    4904, 4904, 0x1C, 0x0, 4905, 414, 0,
+    4906, 4906, 0x20, 0x0, 4907, 415, 0,
+    237, 237, 0x24, 0x0, 4908, 416, 0,
+    4909, 4909, 0x28, 0x0, 4910, 417, 1,
+    4911, 4911, 0x2C, 0x0, 4912, 418, 1,
+    235, 235, 0x30, 0x0, 4913, 419, 1,
+    4914, 4914, 0x34, 0x0, 4915, 420, 0,
+    4916, 4916, 0x38, 0x0, 4917, 421, 0,
+    4962, 4962, 0x0, 0x0, 4963, 422, 0,
+    4964, 4964, 0x4, 0x0, 4963, 422, 0,
+    4965, 4965, 0x8, 0x0, 4963, 422, 0,
+    4966, 4966, 0xC, 0x0, 4963, 422, 0,
+    4967, 4967, 0x10, 0x0, 4963, 422, 0,
+    4968, 4968, 0x14, 0x0, 4963, 422, 0,
+    4969, 4969, 0x18, 0x0, 4963, 422, 0,
+    4970, 4970, 0x1C, 0x0, 4963, 422, 0,
+    4971, 4971, 0x40, 0x0, 4972, 423, 0,
+    4973, 4973, 0x44, 0x0, 4974, 424, 0,
+    4975, 4975, 0x48, 0x0, 4976, 425, 1,
+    4977, 4977, 0x4C, 0x0, 4978, 426, 0,
+    4961, 4961, 0x50, 0x0, 4979, 427, 0,
+    18, 18, 0x0, 0x4000, 5030, 428, 0,
+    1067, 1067, 0x4, 0x2022BB7F, 5031, 429, 0,
+    229, 229, 0x8, 0x0, 5032, 430, 1,
+    231, 231, 0xC, 0x0, 5033, 431, 0,
+])
+
+# first field, number of fields, first subscriptor, number of subscriptors
+_field_layouts = _array("L", [
+    0, 1, 0, 0,
+    1, 1, 0, 0,
+    2, 4, 0, 0,
+    6, 1, 0, 0,
+    7, 1, 0, 0,
+    8, 1, 0, 0,
+    9, 1, 0, 0,
+    10, 1, 0, 0,
+    11, 3, 0, 0,
+    14, 1, 0, 0,
+    15, 2, 0, 0,
+    17, 3, 0, 0,
+    20, 1, 0, 0,
+    21, 20, 0, 0,
+    41, 11, 0, 0,
+    52, 3, 0, 0,
+    55, 3, 0, 0,
+    58, 5, 0, 0,
+    63, 5, 0, 0,
+    68, 17, 0, 0,
+    85, 9, 0, 0,
+    94, 1, 0, 0,
+    95, 1, 0, 0,
+    96, 1, 0, 0,
+    97, 9, 1, 0,
+    106, 1, 1, 0,
+    107, 1, 1, 0,
+    108, 1, 1, 0,
+    109, 12, 1, 0,
+    121, 14, 1, 0,
+    135, 8, 1, 0,
+    143, 16, 1, 1,
+    159, 1, 2, 0,
+    160, 2, 2, 0,
+    162, 2, 2, 0,
+    164, 2, 2, 0,
+    166, 2, 2, 0,
+    168, 2, 2, 0,
+    170, 5, 2, 0,
+    175, 13, 2, 2,
+    188, 1, 4, 0,
+    189, 10, 4, 2,
+    199, 9, 6, 0,
+    208, 2, 6, 0,
+    210, 7, 6, 1,
+    217, 10, 7, 0,
+    227, 7, 7, 0,
+    234, 8, 7, 0,
+    242, 8, 7, 0,
+    250, 7, 7, 1,
+    257, 15, 8, 1,
+    272, 2, 9, 0,
+    274, 20, 9, 5,
+    294, 3, 14, 0,
+    297, 12, 14, 1,
+    309, 7, 15, 1,
+    316, 15, 16, 1,
+    331, 2, 17, 0,
+    333, 22, 17, 5,
+    355, 3, 22, 0,
+    358, 12, 22, 1,
+    370, 8, 23, 1,
+    378, 17, 24, 1,
+    395, 2, 25, 0,
+    397, 22, 25, 5,
+    419, 3, 30, 0,
+    422, 12, 30, 1,
+    434, 16, 31, 3,
+    450, 11, 34, 0,
+    461, 10, 34, 0,
+    471, 3, 34, 0,
+    474, 2, 34, 0,
+    476, 5, 40, 0,
+    481, 4, 40, 1,
+    485, 10, 41, 1,
+    495, 7, 42, 1,
+    502, 7, 43, 1,
+    509, 6, 44, 1,
+    515, 6, 45, 1,
+    521, 15, 46, 1,
+    536, 14, 47, 1,
+    550, 16, 48, 1,
+    566, 15, 49, 1,
+    581, 16, 50, 1,
+    597, 16, 51, 1,
+    613, 16, 52, 1,
+    629, 16, 53, 1,
+    645, 16, 54, 1,
+    661, 16, 55, 1,
+    677, 16, 56, 1,
+    693, 16, 57, 1,
+    709, 11, 58, 1,
+    720, 11, 59, 1,
+    731, 1, 60, 0,
+    732, 3, 61, 0,
+    735, 5, 61, 0,
+    740, 1, 61, 0,
+    741, 13, 61, 0,
+    754, 4, 61, 0,
+    758, 1, 61, 0,
+    759, 1, 61, 0,
+    760, 1, 61, 0,
+    761, 1, 61, 0,
+    762, 1, 61, 0,
+    763, 1, 61, 0,
+    764, 1, 61, 0,
+    765, 1, 61, 0,
+    766, 1, 61, 0,
+    767, 1, 61, 0,
+    768, 1, 61, 0,
+    769, 1, 61, 0,
+    770, 16, 64, 1,
+    786, 16, 65, 1,
+    802, 16, 66, 1,
+    818, 16, 67, 1,
+    834, 16, 68, 1,
+    850, 16, 69, 1,
+    866, 32, 70, 2,
+    898, 17, 72, 1,
+    915, 8, 73, 1,
+    923, 8, 74, 1,
+    931, 16, 75, 1,
+    947, 8, 76, 0,
+    955, 8, 76, 1,
+    963, 3, 77, 0,
+    966, 11, 77, 2,
+    977, 8, 79, 2,
+    985, 6, 81, 1,
+    991, 9, 82, 4,
+    1000, 6, 86, 3,
+    1006, 7, 89, 3,
+    1013, 2, 92, 0,
+    1015, 1, 92, 0,
+    1016, 1, 92, 0,
+    1017, 1, 92, 0,
+    1018, 1, 92, 0,
+    1019, 1, 92, 0,
+    1020, 11, 92, 0,
+    1031, 3, 92, 0,
+    1034, 2, 92, 1,
+    1036, 13, 93, 2,
+    1049, 1, 95, 0,
+    1050, 2, 95, 0,
+    1052, 1, 95, 0,
+    1053, 13, 95, 6,
+    1066, 5, 103, 0,
+    1071, 7, 103, 0,
+    1078, 5, 103, 0,
+    1083, 4, 103, 0,
+    1087, 4, 103, 0,
+    1091, 3, 103, 0,
+    1094, 4, 103, 0,
+    1098, 2, 103, 0,
+    1100, 1, 103, 0,
+    1101, 1, 103, 0,
+    1102, 6, 103, 0,
+    1108, 10, 104, 0,
+    1118, 16, 104, 2,
+    1134, 10, 106, 0,
+    1144, 19, 106, 2,
+    1163, 20, 108, 2,
+    1183, 9, 110, 1,
+    1192, 10, 111, 5,
+    1202, 6, 116, 2,
+    1208, 10, 118, 5,
+    1218, 6, 123, 3,
+    1224, 20, 126, 4,
+    1244, 2, 130, 0,
+    1246, 1, 130, 0,
+    1247, 1, 130, 0,
+    1248, 1, 130, 0,
+    1249, 1, 130, 0,
+    1250, 16, 130, 0,
+    1266, 4, 130, 1,
+    1270, 1, 131, 0,
+    1271, 10, 131, 4,
+    1281, 3, 135, 0,
+    1284, 7, 135, 0,
+    1291, 4, 135, 1,
+    1295, 14, 136, 2,
+    1309, 14, 138, 2,
+    1323, 14, 140, 6,
+    1337, 14, 146, 7,
+    1351, 9, 158, 1,
+    1360, 2, 159, 0,
+    1362, 7, 164, 0,
+    1369, 1, 164, 0,
+    1370, 2, 164, 0,
+    1372, 1, 164, 0,
+    1373, 1, 164, 0,
+    1374, 2, 164, 0,
+    1376, 1, 164, 0,
+    1377, 7, 164, 0,
+    1384, 7, 164, 0,
+    1391, 7, 164, 0,
+    1398, 13, 164, 0,
+    1411, 5, 164, 0,
+    1416, 1, 164, 0,
+    1417, 1, 164, 0,
+    1418, 1, 164, 0,
+    1419, 2, 164, 1,
+    1421, 32, 165, 3,
+    1453, 22, 168, 1,
+    1475, 24, 169, 0,
+    1499, 2, 169, 0,
+    1501, 2, 169, 0,
+    1503, 2, 169, 0,
+    1505, 5, 169, 0,
+    1510, 28, 169, 0,
+    1538, 15, 169, 0,
+    1553, 1, 169, 0,
+    1554, 1, 169, 0,
+    1555, 1, 169, 0,
+    1556, 29, 169, 3,
+    1585, 9, 172, 0,
+    1594, 17, 172, 0,
+    1611, 1, 172, 0,
+    1612, 4, 172, 0,
+    1616, 21, 172, 0,
+    1637, 9, 172, 0,
+    1646, 14, 172, 0,
+    1660, 12, 172, 0,
+    1672, 9, 172, 0,
+    1681, 1, 172, 0,
+    1682, 1, 172, 0,
+    1683, 1, 172, 0,
+    1684, 1, 172, 0,
+    1685, 8, 172, 0,
+    1693, 3, 172, 0,
+    1696, 32, 172, 1,
+    1728, 32, 173, 1,
+    1760, 23, 174, 0,
+    1783, 22, 174, 1,
+    1805, 22, 175, 1,
+    1827, 26, 176, 1,
+    1853, 12, 177, 1,
+    1865, 9, 178, 1,
+    1874, 6, 179, 1,
+    1880, 4, 180, 1,
+    1884, 4, 181, 1,
+    1888, 4, 182, 1,
+    1892, 7, 189, 0,
+    1899, 7, 189, 0,
+    1906, 1, 189, 0,
+    1907, 9, 189, 0,
+    1916, 2, 189, 0,
+    1918, 1, 189, 0,
+    1919, 26, 189, 0,
+    1945, 1, 189, 0,
+    1946, 4, 189, 0,
+    1950, 2, 189, 0,
+    1952, 7, 189, 0,
+    1959, 5, 189, 0,
+    1964, 14, 189, 1,
+    1978, 2, 190, 0,
+    1980, 14, 190, 1,
+    1994, 6, 191, 0,
+    2000, 6, 191, 0,
+    2006, 6, 191, 0,
+    2012, 32, 191, 4,
+    2044, 32, 195, 4,
+    2076, 12, 199, 0,
+    2088, 1, 199, 0,
+    2089, 1, 199, 0,
+    2090, 1, 199, 0,
+    2091, 7, 203, 0,
+    2098, 5, 203, 0,
+    2103, 1, 203, 0,
+    2104, 1, 203, 0,
+    2105, 1, 203, 0,
+    2106, 1, 203, 0,
+    2107, 2, 205, 0,
+    2109, 11, 205, 2,
+    2120, 4, 207, 1,
+    2124, 4, 208, 1,
+    2128, 4, 209, 1,
+    2132, 4, 210, 1,
+    2136, 2, 211, 0,
+    2138, 5, 211, 0,
+    2143, 32, 211, 1,
+    2175, 1, 212, 0,
+    2176, 4, 214, 0,
+    2180, 1, 214, 0,
+    2181, 10, 214, 0,
+    2191, 14, 215, 0,
+    2205, 6, 215, 0,
+    2211, 16, 217, 8,
+    2227, 4, 225, 2,
+    2231, 2, 227, 0,
+    2233, 2, 227, 0,
+    2235, 2, 227, 0,
+    2237, 2, 227, 0,
+    2239, 2, 227, 0,
+    2241, 2, 227, 0,
+    2243, 2, 227, 1,
+    2245, 2, 228, 1,
+    2247, 2, 229, 1,
+    2249, 2, 230, 0,
+    2251, 2, 230, 0,
+    2253, 10, 230, 5,
+    2263, 2, 235, 1,
+    2265, 7, 236, 3,
+    2272, 1, 239, 0,
+    2273, 1, 239, 0,
+    2274, 2, 239, 1,
+    2276, 2, 240, 1,
+    2278, 3, 241, 0,
+    2281, 3, 241, 0,
+    2284, 4, 241, 2,
+    2288, 11, 249, 1,
+    2299, 11, 250, 1,
+    2310, 10, 251, 0,
+    2320, 19, 251, 0,
+    2339, 10, 251, 0,
+    2349, 11, 251, 1,
+    2360, 9, 252, 1,
+    2369, 3, 253, 0,
+    2372, 2, 253, 0,
+    2374, 2, 253, 0,
+    2376, 5, 253, 1,
+    2381, 5, 254, 1,
+    2386, 5, 255, 1,
+    2391, 2, 256, 1,
+    2393, 1, 257, 0,
+    2394, 7, 257, 1,
+    2401, 5, 258, 0,
+    2406, 1, 258, 0,
+    2407, 1, 258, 0,
+    2408, 1, 258, 0,
+    2409, 1, 258, 0,
+    2410, 1, 258, 0,
+    2411, 1, 258, 0,
+    2412, 2, 258, 0,
+    2414, 2, 258, 0,
+    2416, 1, 258, 0,
+    2417, 22, 264, 2,
+    2439, 9, 266, 0,
+    2448, 2, 266, 0,
+    2450, 3, 266, 0,
+    2453, 2, 266, 0,
+    2455, 3, 266, 0,
+    2458, 5, 266, 0,
+    2463, 9, 266, 0,
+    2472, 5, 266, 0,
+    2477, 1, 266, 0,
+    2478, 1, 266, 0,
+    2479, 11, 267, 0,
+    2490, 1, 267, 0,
+    2491, 1, 267, 0,
+    2492, 14, 267, 0,
+    2506, 8, 267, 0,
+    2514, 5, 267, 0,
+    2519, 4, 267, 0,
+    2523, 7, 267, 0,
+    2530, 8, 267, 0,
+    2538, 6, 267, 0,
+    2544, 1, 267, 0,
+    2545, 14, 267, 0,
+    2559, 7, 267, 0,
+    2566, 8, 267, 0,
+    2574, 6, 267, 0,
+    2580, 6, 267, 1,
+    2586, 8, 268, 2,
+    2594, 7, 272, 2,
+    2601, 9, 274, 3,
+    2610, 4, 277, 0,
+    2614, 7, 277, 2,
+    2621, 7, 279, 2,
+    2628, 7, 281, 2,
+    2635, 7, 283, 2,
+    2642, 1, 285, 0,
+    2643, 6, 286, 0,
+    2649, 1, 286, 0,
+    2650, 5, 286, 1,
+    2655, 3, 287, 0,
+    2658, 2, 287, 0,
+    2660, 14, 287, 0,
+    2674, 4, 287, 1,
+    2678, 2, 288, 0,
+    2680, 1, 288, 0,
+    2681, 3, 288, 0,
+    2684, 1, 288, 0,
+    2685, 4, 288, 0,
+    2689, 11, 288, 0,
+    2700, 2, 288, 0,
+    2702, 24, 288, 3,
+    2726, 24, 291, 3,
+    2750, 7, 294, 1,
+    2757, 2, 295, 1,
+    2759, 8, 296, 1,
+    2767, 1, 297, 0,
+    2768, 4, 297, 0,
+    2772, 5, 297, 0,
+    2777, 1, 297, 0,
+    2778, 5, 297, 0,
+    2783, 1, 297, 0,
+    2784, 1, 297, 0,
+    2785, 4, 297, 0,
+    2789, 1, 297, 0,
+    2790, 1, 297, 0,
+    2791, 1, 297, 0,
+    2792, 1, 297, 0,
+    2793, 1, 297, 0,
+    2794, 1, 297, 0,
+    2795, 1, 297, 0,
+    2796, 5, 297, 0,
+    2801, 1, 297, 0,
+    2802, 1, 297, 0,
+    2803, 8, 299, 0,
+    2811, 4, 299, 0,
+    2815, 14, 299, 1,
+    2829, 15, 300, 1,
+    2844, 18, 301, 2,
+    2862, 13, 303, 1,
+    2875, 1, 304, 0,
+    2876, 1, 304, 0,
+    2877, 1, 304, 0,
+    2878, 3, 304, 0,
+    2881, 1, 304, 0,
+    2882, 1, 304, 0,
+    2883, 1, 304, 0,
+    2884, 1, 304, 0,
+    2885, 10, 306, 0,
+    2895, 15, 306, 0,
+    2910, 11, 306, 0,
+    2921, 5, 306, 0,
+    2926, 2, 306, 0,
+    2928, 1, 306, 0,
+    2929, 8, 307, 0,
+    2937, 5, 307, 0,
+    2942, 9, 307, 0,
+    2951, 4, 307, 0,
+])
+
+# name, mask, description, access flags
+_field_rows = _array("L", [
+    0, 0xFFFFFFFF, 1, 0,
+    2, 0xFFFFFFFF, 3, 0,
+    4, 0x80, 5, 0,
+    6, 0x60, 7, 0,
+    8, 0x18, 9, 0,
+    10, 0x1, 11, 2,
+    12, 0xFFFFFFFF, 13, 0,
+    14, 0xFFFFFFFF, 15, 0,
+    25, 0xFFFF, 26, 2,
+    27, 0x7, 28, 0,
+    29, 0xFFF, 30, 0,
+    31, 0x4, 32, 1,
+    33, 0x2, 34, 1,
+    35, 0x1, 36, 1,
+    37, 0xFFF, 38, 0,
+    50, 0x80, 51, 0,
+    52, 0x7F, 53, 0,
+    54, 0x3800, 55, 0,
+    56, 0x200, 57, 0,
+    58, 0x7F, 59, 0,
+    60, 0x1, 61, 0,
+    66, 0x1, 67, 0,
+    68, 0x2, 69, 0,
+    70, 0x4, 71, 0,
+    72, 0x8, 73, 0,
+    74, 0x10, 75, 0,
+    76, 0x20, 77, 0,
+    78, 0x40, 79, 0,
+    80, 0x80, 81, 0,
+    82, 0xF00, 83, 0,
+    84, 0x1000, 85, 0,
+    86, 0x4000, 87, 0,
+    88, 0x8000, 89, 0,
+    90, 0x10000, 91, 0,
+    92, 0x20000, 93, 0,
+    94, 0x40000, 95, 0,
+    96, 0x80000, 97, 0,
+    98, 0x100000, 99, 0,
+    100, 0x200000, 101, 0,
+    102, 0x400000, 103, 0,
+    104, 0x800000, 105, 0,
+    106, 0x4000000, 107, 0,
+    108, 0x2000000, 109, 0,
+    110, 0x1000000, 111, 0,
+    112, 0xFF0000, 113, 0,
+    114, 0x8000, 115, 0,
+    116, 0x4000, 117, 0,
+    118, 0x2000, 119, 0,
+    120, 0x1000, 121, 0,
+    122, 0x800, 123, 0,
+    124, 0x400, 125, 0,
+    126, 0x3FF, 127, 0,
+    128, 0x3FF, 129, 0,
+    130, 0x400, 131, 0,
+    132, 0x8000, 133, 0,
+    134, 0xFE, 129, 0,
+    135, 0x700, 136, 0,
+    137, 0x8000, 138, 0,
+    139, 0xFF, 140, 0,
+    141, 0xFF00, 142, 0,
+    143, 0xF0000, 144, 0,
+    145, 0xF00000, 146, 0,
+    147, 0xF0000000, 148, 0,
+    149, 0xFFF, 150, 0,
+    151, 0x1000, 152, 0,
+    153, 0x8000, 154, 0,
+    155, 0xFFF0000, 156, 0,
+    157, 0x80000000, 158, 0,
+    159, 0xFE0000, 160, 1,
+    161, 0x10000, 162, 1,
+    163, 0x8000, 164, 1,
+    165, 0x2000, 166, 1,
+    167, 0x1000, 168, 1,
+    169, 0x800, 170, 1,
+    171, 0x400, 172, 1,
+    173, 0x200, 174, 1,
+    175, 0x100, 176, 1,
+    177, 0x80, 178, 1,
+    179, 0x40, 180, 1,
+    181, 0x20, 182, 1,
+    183, 0x10, 184, 1,
+    185, 0x8, 186, 1,
+    187, 0x4, 188, 1,
+    189, 0x2, 190, 0,
+    191, 0x1, 192, 0,
+    193, 0x2000, 194, 2,
+    195, 0x1000, 196, 2,
+    197, 0x800, 198, 2,
+    199, 0x400, 200, 2,
+    201, 0x200, 202, 2,
+    203, 0x100, 204, 2,
+    205, 0x20, 206, 2,
+    207, 0x10, 208, 2,
+    209, 0x8, 210, 2,
+    211, 0xFF, 212, 1,
+    213, 0xFF, 214, 1,
+    215, 0xFF, 216, 0,
+    245, 0xF, 246, 0,
+    247, 0x100, 248, 0,
+    249, 0x200, 250, 0,
+    251, 0x400, 252, 0,
+    253, 0x800, 254, 0,
+    255, 0x1000, 256, 0,
+    257, 0x2000, 258, 0,
+    259, 0x4000, 260, 0,
+    261, 0x40000, 262, 0,
+    263, 0xFFFFFFFF, 264, 2,
+    265, 0xFFFFFFFF, 265, 2,
+    266, 0xFFFFFFFF, 267, 2,
+    268, 0x1, 269, 0,
+    270, 0x2, 271, 0,
+    272, 0x8, 273, 0,
+    274, 0x10, 275, 0,
+    276, 0x20, 277, 0,
+    278, 0x40, 279, 0,
+    280, 0x80, 281, 0,
+    282, 0x100, 283, 0,
+    284, 0x200, 285, 0,
+    286, 0x4000, 287, 0,
+    288, 0x8000, 289, 0,
+    290, 0x10000, 291, 1,
+    292, 0x1, 293, 0,
+    294, 0x2, 295, 0,
+    296, 0x4, 297, 0,
+    298, 0x3F8, 299, 0,
+    300, 0x10000, 301, 0,
+    302, 0x20000, 303, 0,
+    304, 0x40000, 305, 0,
+    306, 0x1000000, 307, 0,
+    80, 0x2000000, 308, 0,
+    309, 0x4000000, 310, 0,
+    311, 0x8000000, 312, 0,
+    313, 0x10000000, 313, 0,
+    314, 0x40000000, 315, 0,
+    316, 0x80000000, 317, 0,
+    318, 0x7FFFF, 319, 1,
+    320, 0x200000, 320, 1,
+    321, 0x400000, 321, 1,
+    322, 0x1000000, 322, 0,
+    323, 0x10000000, 324, 0,
+    325, 0x20000000, 326, 0,
+    327, 0x40000000, 324, 0,
+    328, 0x80000000, 329, 0,
+    330, 0xFF, 331, 0,
+    332, 0x700, 333, 0,
+    334, 0x1000, 334, 0,
+    335, 0x2000, 335, 0,
+    336, 0x4000, 336, 0,
+    337, 0x10000, 338, 0,
+    339, 0x20000, 340, 0,
+    341, 0x40000, 342, 0,
+    343, 0x80000, 344, 0,
+    345, 0x800000, 346, 0,
+    347, 0x1000000, 348, 0,
+    349, 0x2000000, 350, 0,
+    351, 0x4000000, 351, 0,
+    352, 0x8000000, 352, 0,
+    353, 0x30000000, 353, 0,
+    354, 0x40000000, 354, 0,
+    357, 0x7FFF, 358, 0,
+    359, 0x7FFF, 360, 0,
+    361, 0x80000000, 362, 0,
+    363, 0x7F, 364, 0,
+    365, 0x7F0000, 366, 0,
+    367, 0x7F, 368, 0,
+    369, 0x7F0000, 370, 0,
+    371, 0x10000, 371, 0,
+    372, 0x7F, 372, 0,
+    395, 0xFFFF, 396, 1,
+    397, 0xFFFF0000, 398, 1,
+    399, 0x1, 400, 0,
+    401, 0x2, 402, 0,
+    403, 0x4, 404, 0,
+    405, 0x20, 406, 0,
+    407, 0xC0, 406, 0,
+    408, 0x1, 409, 0,
+    410, 0x2, 411, 0,
+    412, 0x4, 413, 0,
+    414, 0x8, 415, 0,
+    416, 0x10, 417, 0,
+    418, 0x20, 419, 0,
+    420, 0x400, 421, 0,
+    422, 0x800, 423, 0,
+    424, 0x1000, 425, 0,
+    426, 0x200000, 427, 0,
+    428, 0x400000, 429, 0,
+    430, 0x40000000, 431, 0,
+    432, 0x80000000, 433, 0,
+    438, 0x2, 438, 0,
+    439, 0x800, 440, 0,
+    441, 0x2000, 442, 0,
+    443, 0x10000, 444, 0,
+    445, 0x20000, 446, 0,
+    447, 0x40000, 448, 0,
+    449, 0x100000, 450, 0,
+    451, 0x4000000, 451, 0,
+    452, 0x8000000, 451, 0,
+    453, 0x10000000, 451, 0,
+    454, 0x20000000, 451, 0,
+    468, 0x100, 469, 0,
+    470, 0x200, 471, 0,
+    472, 0x400, 473, 1,
+    474, 0x10000, 475, 0,
+    476, 0x20000, 477, 1,
+    478, 0x40000, 479, 0,
+    480, 0x80000, 481, 0,
+    482, 0x1000000, 483, 0,
+    484, 0x2000000, 485, 1,
+    486, 0xFF0000, 487, 1,
+    488, 0x7F000000, 489, 0,
+    490, 0x3, 491, 0,
+    492, 0xC, 493, 1,
+    494, 0xF0, 495, 0,
+    496, 0x700, 497, 0,
+    498, 0x3800, 499, 0,
+    500, 0xF000000, 501, 0,
+    502, 0x70000000, 503, 0,
+    506, 0x3, 507, 0,
+    508, 0xF0, 509, 0,
+    510, 0x7F00, 511, 0,
+    512, 0x10000, 513, 0,
+    514, 0x20000, 515, 0,
+    516, 0x100000, 517, 0,
+    518, 0x600000, 519, 0,
+    520, 0x1000000, 521, 0,
+    522, 0x6000000, 523, 0,
+    524, 0xF8000000, 525, 0,
+    526, 0x1, 527, 0,
+    528, 0x2, 529, 0,
+    530, 0x8, 531, 0,
+    532, 0x10, 533, 0,
+    534, 0x20, 535, 0,
+    536, 0x200, 537, 0,
+    538, 0x400, 539, 0,
+    540, 0x1, 541, 1,
+    542, 0x2, 543, 1,
+    544, 0x8, 545, 1,
+    546, 0x10, 547, 1,
+    548, 0x20, 549, 1,
+    550, 0x100, 551, 1,
+    552, 0x200, 553, 1,
+    554, 0x400, 555, 1,
+    556, 0x1, 557, 2,
+    558, 0x2, 559, 2,
+    560, 0x8, 561, 2,
+    562, 0x10, 563, 2,
+    564, 0x20, 565, 2,
+    566, 0x100, 567, 2,
+    568, 0x200, 569, 2,
+    570, 0x400, 571, 2,
+    572, 0x1, 573, 0,
+    574, 0x2, 575, 0,
+    576, 0x4, 577, 0,
+    578, 0x8, 579, 0,
+    580, 0x10, 579, 0,
+    581, 0x100, 582, 0,
+    583, 0x1000, 584, 0,
+    587, 0x1, 588, 0,
+    589, 0x2, 590, 0,
+    591, 0x4, 592, 0,
+    593, 0x8, 594, 0,
+    595, 0x10, 596, 0,
+    597, 0x20, 598, 0,
+    599, 0x40, 600, 0,
+    601, 0x2000, 602, 0,
+    603, 0x4000, 604, 0,
+    605, 0x10000, 606, 0,
+    607, 0x20000, 608, 0,
+    609, 0x40000, 610, 0,
+    611, 0x80000, 612, 0,
+    613, 0x1000000, 614, 0,
+    615, 0x4000000, 616, 0,
+    619, 0x1, 620, 0,
+    621, 0x100, 622, 0,
+    623, 0x1, 624, 0,
+    625, 0x2, 626, 0,
+    627, 0x4, 626, 0,
+    628, 0x8, 629, 0,
+    630, 0x10, 631, 0,
+    632, 0x20, 633, 0,
+    634, 0x100, 635, 0,
+    636, 0x4000, 637, 0,
+    638, 0x8000, 639, 0,
+    640, 0x20000, 641, 0,
+    642, 0x40000, 643, 0,
+    644, 0x80000, 645, 0,
+    646, 0x100000, 647, 0,
+    648, 0x200000, 649, 0,
+    650, 0x400000, 651, 0,
+    652, 0x800000, 653, 0,
+    654, 0x2000000, 655, 0,
+    656, 0x10000000, 657, 0,
+    658, 0x40000000, 659, 0,
+    660, 0x80000000, 661, 0,
+    672, 0x1, 673, 0,
+    674, 0x2, 675, 0,
+    676, 0x100, 677, 0,
+    678, 0x1, 679, 0,
+    680, 0x800, 681, 0,
+    682, 0x1000, 683, 0,
+    684, 0x2000, 685, 0,
+    686, 0x4000, 687, 0,
+    688, 0x8000, 689, 0,
+    690, 0x10000, 691, 0,
+    692, 0x20000, 693, 0,
+    694, 0x40000, 695, 0,
+    696, 0x100000, 697, 0,
+    698, 0x200000, 699, 0,
+    700, 0x4000000, 701, 0,
+    702, 0x1, 703, 0,
+    704, 0x2, 705, 0,
+    706, 0x4, 707, 0,
+    708, 0x8, 709, 0,
+    710, 0x10, 711, 0,
+    712, 0x100, 713, 0,
+    714, 0x1000, 715, 0,
+    718, 0x1, 719, 0,
+    720, 0x2, 721, 0,
+    722, 0x4, 723, 0,
+    724, 0x8, 725, 0,
+    726, 0x10, 727, 0,
+    728, 0x20, 729, 0,
+    730, 0x40, 731, 0,
+    732, 0x2000, 733, 0,
+    734, 0x4000, 735, 0,
+    736, 0x10000, 737, 0,
+    738, 0x20000, 739, 0,
+    740, 0x40000, 741, 0,
+    742, 0x80000, 743, 0,
+    744, 0x1000000, 745, 0,
+    746, 0x4000000, 747, 0,
+    750, 0x1, 751, 0,
+    752, 0x100, 753, 0,
+    754, 0x1, 755, 0,
+    756, 0x2, 757, 0,
+    758, 0x4, 759, 0,
+    760, 0x8, 761, 0,
+    762, 0x10, 763, 0,
+    764, 0x20, 765, 0,
+    766, 0x100, 767, 0,
+    768, 0x400, 769, 0,
+    770, 0x800, 771, 0,
+    772, 0x4000, 773, 0,
+    774, 0x8000, 775, 0,
+    776, 0x20000, 777, 0,
+    778, 0x40000, 779, 0,
+    780, 0x80000, 781, 0,
+    782, 0x100000, 783, 0,
+    784, 0x200000, 785, 0,
+    786, 0x400000, 787, 0,
+    788, 0x800000, 789, 0,
+    790, 0x2000000, 791, 0,
+    792, 0x10000000, 793, 0,
+    794, 0x40000000, 795, 0,
+    796, 0x80000000, 797, 0,
+    808, 0x1, 809, 0,
+    810, 0x2, 811, 0,
+    812, 0x100, 813, 0,
+    814, 0x1, 815, 0,
+    816, 0x800, 817, 0,
+    818, 0x1000, 819, 0,
+    820, 0x2000, 821, 0,
+    822, 0x4000, 823, 0,
+    824, 0x8000, 825, 0,
+    826, 0x10000, 827, 0,
+    828, 0x20000, 829, 0,
+    830, 0x40000, 831, 0,
+    832, 0x100000, 833, 0,
+    834, 0x200000, 835, 0,
+    836, 0x4000000, 837, 0,
+    838, 0x1, 839, 0,
+    840, 0x2, 841, 0,
+    842, 0x4, 843, 0,
+    844, 0x8, 845, 0,
+    846, 0x10, 847, 0,
+    848, 0x100, 849, 0,
+    850, 0x200, 851, 0,
+    852, 0x1000, 853, 0,
+    856, 0x1, 857, 0,
+    858, 0x2, 859, 0,
+    860, 0x4, 861, 0,
+    862, 0x8, 863, 0,
+    864, 0x10, 865, 0,
+    866, 0x20, 867, 0,
+    868, 0x40, 869, 0,
+    870, 0x200, 871, 0,
+    872, 0x400, 873, 0,
+    874, 0x2000, 875, 0,
+    876, 0x4000, 877, 0,
+    878, 0x10000, 737, 0,
+    879, 0x20000, 739, 0,
+    880, 0x40000, 741, 0,
+    881, 0x80000, 743, 0,
+    882, 0x1000000, 883, 0,
+    746, 0x4000000, 747, 0,
+    886, 0x1, 887, 0,
+    888, 0x100, 889, 0,
+    890, 0x1, 891, 0,
+    892, 0x2, 893, 0,
+    894, 0x4, 895, 0,
+    896, 0x8, 897, 0,
+    898, 0x10, 899, 0,
+    900, 0x20, 901, 0,
+    902, 0x100, 903, 0,
+    904, 0x400, 905, 0,
+    906, 0x800, 907, 0,
+    908, 0x4000, 909, 0,
+    910, 0x8000, 911, 0,
+    912, 0x20000, 913, 0,
+    914, 0x40000, 915, 0,
+    916, 0x80000, 917, 0,
+    918, 0x100000, 919, 0,
+    920, 0x200000, 921, 0,
+    922, 0x400000, 923, 0,
+    924, 0x800000, 925, 0,
+    926, 0x2000000, 927, 0,
+    928, 0x10000000, 929, 0,
+    930, 0x40000000, 931, 0,
+    932, 0x80000000, 933, 0,
+    944, 0x1, 945, 0,
+    946, 0x2, 947, 0,
+    948, 0x100, 949, 0,
+    950, 0x1, 951, 0,
+    952, 0x800, 953, 0,
+    954, 0x1000, 955, 0,
+    956, 0x2000, 957, 0,
+    958, 0x4000, 959, 0,
+    960, 0x8000, 961, 0,
+    962, 0x10000, 963, 0,
+    964, 0x20000, 965, 0,
+    966, 0x40000, 967, 0,
+    968, 0x100000, 969, 0,
+    970, 0x200000, 971, 0,
+    972, 0x4000000, 973, 0,
+    974, 0x3, 975, 0,
+    976, 0xC, 977, 0,
+    978, 0x30, 979, 0,
+    980, 0xC0, 981, 0,
+    982, 0x300, 983, 0,
+    984, 0xC00, 985, 0,
+    986, 0x3000, 987, 0,
+    988, 0xC000, 989, 0,
+    990, 0x30000, 991, 0,
+    992, 0xC0000, 993, 0,
+    994, 0x300000, 995, 0,
+    996, 0xC00000, 997, 0,
+    998, 0x3000000, 999, 0,
+    1000, 0xC000000, 1001, 0,
+    1002, 0x30000000, 1003, 0,
+    1004, 0xC0000000, 1005, 0,
+    1012, 0x1, 1013, 0,
+    1014, 0x2, 1015, 1,
+    1016, 0x4, 1017, 0,
+    1018, 0x18, 1019, 0,
+    1020, 0x20, 1021, 0,
+    1022, 0x40, 1023, 1,
+    1024, 0x300, 1025, 0,
+    1026, 0x8000, 1027, 0,
+    1028, 0x10000, 1029, 0,
+    1030, 0x1000000, 1031, 0,
+    1032, 0x2000000, 1033, 0,
+    1034, 0x1, 1035, 0,
+    1036, 0x2, 1037, 1,
+    1038, 0x800000, 1039, 0,
+    1040, 0x2000000, 1041, 1,
+    1042, 0x4000000, 1043, 1,
+    1044, 0x8000000, 1045, 1,
+    1046, 0x10000000, 1047, 1,
+    1048, 0x20000000, 1049, 1,
+    1050, 0x40000000, 1051, 1,
+    1052, 0x80000000, 1053, 1,
+    1054, 0x1, 1055, 0,
+    1056, 0x2, 1057, 1,
+    1058, 0xFF80, 1059, 1,
+    1060, 0x3, 1061, 0,
+    1062, 0x300000, 1063, 0,
+    1136, 0x7, 1137, 0,
+    1138, 0x8, 1138, 0,
+    1139, 0x100, 1140, 0,
+    1141, 0x600, 1142, 0,
+    1143, 0x4000, 1144, 0,
+    1145, 0x1, 1146, 0,
+    1147, 0xE, 1148, 0,
+    1149, 0x40, 1150, 0,
+    1151, 0x80, 1152, 0,
+    1155, 0x1, 1156, 0,
+    1157, 0x2, 1158, 0,
+    1159, 0x4, 1160, 0,
+    1161, 0x8, 1162, 0,
+    1163, 0x10, 1164, 0,
+    1165, 0x100, 1166, 0,
+    1167, 0x400, 1168, 0,
+    1169, 0x2000, 1170, 0,
+    1171, 0x4000, 1172, 0,
+    1173, 0x8000, 1174, 0,
+    1177, 0x1, 1178, 0,
+    1179, 0x2, 1180, 0,
+    1181, 0x4, 1182, 0,
+    1183, 0x8, 1184, 0,
+    1185, 0x10, 1186, 0,
+    1187, 0x100, 1188, 0,
+    1189, 0x200, 1190, 0,
+    1193, 0x1, 1194, 1,
+    1195, 0x2, 1196, 1,
+    1197, 0x4, 1198, 1,
+    1199, 0x8, 1200, 1,
+    1201, 0x10, 1202, 1,
+    1203, 0x100, 1204, 1,
+    1205, 0x8000, 1206, 1,
+    1209, 0x100, 1210, 1,
+    1211, 0x200, 1212, 1,
+    1213, 0x400, 1214, 1,
+    1215, 0x800, 1216, 1,
+    1217, 0x4000, 1218, 1,
+    1219, 0x8000, 1220, 1,
+    1223, 0x1, 1224, 2,
+    1225, 0x2, 1226, 2,
+    1227, 0x4, 1228, 2,
+    1229, 0x8, 1230, 2,
+    1231, 0x10, 1232, 2,
+    1233, 0x100, 1234, 2,
+    1237, 0x1, 1238, 0,
+    1239, 0x2, 1238, 0,
+    1240, 0x4, 1238, 0,
+    1241, 0x8, 1238, 0,
+    1242, 0x10, 1238, 0,
+    1243, 0x20, 1238, 0,
+    1244, 0x40, 1238, 0,
+    1245, 0x80, 1238, 0,
+    1246, 0x100, 1238, 0,
+    1247, 0x200, 1238, 0,
+    1248, 0x400, 1238, 0,
+    1249, 0x800, 1238, 0,
+    1250, 0x1000, 1238, 0,
+    1251, 0x2000, 1238, 0,
+    1252, 0x8000, 1253, 0,
+    1256, 0x1, 1257, 0,
+    1258, 0x2, 1257, 0,
+    1259, 0x4, 1257, 0,
+    1260, 0x8, 1257, 0,
+    1261, 0x10, 1257, 0,
+    1262, 0x20, 1257, 0,
+    1263, 0x40, 1257, 0,
+    1264, 0x80, 1257, 0,
+    1265, 0x100, 1257, 0,
+    1266, 0x200, 1257, 0,
+    1267, 0x400, 1257, 0,
+    1268, 0x800, 1257, 0,
+    1269, 0x1000, 1257, 0,
+    1270, 0x4000, 1271, 0,
+    1237, 0x1, 1274, 0,
+    1239, 0x2, 1274, 0,
+    1240, 0x4, 1274, 0,
+    1241, 0x8, 1274, 0,
+    1242, 0x10, 1274, 0,
+    1243, 0x20, 1274, 0,
+    1244, 0x40, 1274, 0,
+    1245, 0x80, 1274, 0,
+    1246, 0x100, 1274, 0,
+    1247, 0x200, 1274, 0,
+    1248, 0x400, 1274, 0,
+    1249, 0x800, 1274, 0,
+    1250, 0x1000, 1274, 0,
+    1251, 0x2000, 1274, 0,
+    1275, 0x4000, 1274, 0,
+    1252, 0x8000, 1274, 0,
+    1256, 0x1, 1276, 0,
+    1258, 0x2, 1276, 0,
+    1259, 0x4, 1276, 0,
+    1260, 0x8, 1276, 0,
+    1262, 0x20, 1277, 0,
+    1263, 0x40, 1277, 0,
+    1264, 0x80, 1277, 0,
+    1265, 0x100, 1277, 0,
+    1266, 0x200, 1277, 0,
+    1267, 0x400, 1277, 0,
+    1268, 0x800, 1277, 0,
+    1269, 0x1000, 1277, 0,
+    1278, 0x2000, 1277, 0,
+    1270, 0x4000, 1277, 0,
+    1279, 0x8000, 1277, 0,
+    1237, 0x1, 1280, 0,
+    1239, 0x2, 1280, 0,
+    1240, 0x4, 1280, 0,
+    1241, 0x8, 1280, 0,
+    1242, 0x10, 1280, 0,
+    1243, 0x20, 1280, 0,
+    1244, 0x40, 1280, 0,
+    1245, 0x80, 1280, 0,
+    1246, 0x100, 1280, 0,
+    1247, 0x200, 1280, 0,
+    1248, 0x400, 1280, 0,
+    1249, 0x800, 1280, 0,
+    1250, 0x1000, 1280, 0,
+    1251, 0x2000, 1280, 0,
+    1275, 0x4000, 1280, 0,
+    1252, 0x8000, 1280, 0,
+    1256, 0x1, 1281, 0,
+    1258, 0x2, 1281, 0,
+    1259, 0x4, 1281, 0,
+    1260, 0x8, 1281, 0,
+    1261, 0x10, 1281, 0,
+    1262, 0x20, 1281, 0,
+    1263, 0x40, 1281, 0,
+    1264, 0x80, 1281, 0,
+    1265, 0x100, 1281, 0,
+    1266, 0x200, 1281, 0,
+    1267, 0x400, 1281, 0,
+    1268, 0x800, 1281, 0,
+    1269, 0x1000, 1281, 0,
+    1278, 0x2000, 1281, 0,
+    1270, 0x4000, 1281, 0,
+    1279, 0x8000, 1281, 0,
+    1237, 0x1, 1282, 0,
+    1239, 0x2, 1282, 0,
+    1240, 0x4, 1282, 0,
+    1241, 0x8, 1282, 0,
+    1242, 0x10, 1282, 0,
+    1243, 0x20, 1282, 0,
+    1244, 0x40, 1282, 0,
+    1245, 0x80, 1282, 0,
+    1246, 0x100, 1282, 0,
+    1247, 0x200, 1282, 0,
+    1248, 0x400, 1282, 0,
+    1249, 0x800, 1282, 0,
+    1250, 0x1000, 1282, 0,
+    1251, 0x2000, 1282, 0,
+    1275, 0x4000, 1282, 0,
+    1252, 0x8000, 1282, 0,
+    1256, 0x1, 1283, 0,
+    1258, 0x2, 1283, 0,
+    1259, 0x4, 1283, 0,
+    1260, 0x8, 1283, 0,
+    1261, 0x10, 1283, 0,
+    1262, 0x20, 1283, 0,
+    1263, 0x40, 1283, 0,
+    1264, 0x80, 1283, 0,
+    1265, 0x100, 1283, 0,
+    1266, 0x200, 1283, 0,
+    1267, 0x400, 1283, 0,
+    1268, 0x800, 1283, 0,
+    1269, 0x1000, 1283, 0,
+    1278, 0x2000, 1283, 0,
+    1270, 0x4000, 1283, 0,
+    1279, 0x8000, 1283, 0,
+    1237, 0x1, 1284, 0,
+    1239, 0x2, 1284, 0,
+    1240, 0x4, 1284, 0,
+    1241, 0x8, 1284, 0,
+    1242, 0x10, 1284, 0,
+    1243, 0x20, 1284, 0,
+    1244, 0x40, 1284, 0,
+    1245, 0x80, 1284, 0,
+    1246, 0x100, 1284, 0,
+    1247, 0x200, 1284, 0,
+    1248, 0x400, 1284, 0,
+    1249, 0x800, 1284, 0,
+    1250, 0x1000, 1284, 0,
+    1251, 0x2000, 1284, 0,
+    1275, 0x4000, 1284, 0,
+    1252, 0x8000, 1284, 0,
+    1256, 0x1, 1285, 0,
+    1258, 0x2, 1285, 0,
+    1259, 0x4, 1285, 0,
+    1260, 0x8, 1285, 0,
+    1261, 0x10, 1285, 0,
+    1262, 0x20, 1285, 0,
+    1263, 0x40, 1285, 0,
+    1264, 0x80, 1285, 0,
+    1265, 0x100, 1285, 0,
+    1266, 0x200, 1285, 0,
+    1267, 0x400, 1285, 0,
+    1268, 0x800, 1285, 0,
+    1269, 0x1000, 1285, 0,
+    1278, 0x2000, 1285, 0,
+    1270, 0x4000, 1285, 0,
+    1279, 0x8000, 1285, 0,
+    1237, 0x1, 1286, 0,
+    1239, 0x2, 1286, 0,
+    1240, 0x4, 1286, 0,
+    1241, 0x8, 1286, 0,
+    1242, 0x10, 1286, 0,
+    1243, 0x20, 1286, 0,
+    1244, 0x40, 1286, 0,
+    1245, 0x80, 1286, 0,
+    1246, 0x100, 1286, 0,
+    1247, 0x200, 1286, 0,
+    1248, 0x400, 1286, 0,
+    1249, 0x800, 1286, 0,
+    1250, 0x1000, 1286, 0,
+    1251, 0x2000, 1286, 0,
+    1275, 0x4000, 1286, 0,
+    1252, 0x8000, 1286, 0,
+    1256, 0x1, 1287, 0,
+    1258, 0x2, 1287, 0,
+    1259, 0x4, 1287, 0,
+    1260, 0x8, 1287, 0,
+    1261, 0x10, 1287, 0,
+    1262, 0x20, 1287, 0,
+    1263, 0x40, 1287, 0,
+    1264, 0x80, 1287, 0,
+    1265, 0x100, 1287, 0,
+    1266, 0x200, 1287, 0,
+    1267, 0x400, 1287, 0,
+    1268, 0x800, 1287, 0,
+    1269, 0x1000, 1287, 0,
+    1278, 0x2000, 1287, 0,
+    1270, 0x4000, 1287, 0,
+    1279, 0x8000, 1287, 0,
+    1237, 0x1, 1288, 0,
+    1239, 0x2, 1288, 0,
+    1240, 0x4, 1288, 0,
+    1241, 0x8, 1288, 0,
+    1242, 0x10, 1288, 0,
+    1243, 0x20, 1288, 0,
+    1244, 0x40, 1288, 0,
+    1245, 0x80, 1288, 0,
+    1246, 0x100, 1288, 0,
+    1247, 0x200, 1288, 0,
+    1248, 0x400, 1288, 0,
+    1256, 0x1, 1289, 0,
+    1258, 0x2, 1289, 0,
+    1259, 0x4, 1289, 0,
+    1260, 0x8, 1289, 0,
+    1261, 0x10, 1289, 0,
+    1262, 0x20, 1289, 0,
+    1263, 0x40, 1289, 0,
+    1264, 0x80, 1289, 0,
+    1265, 0x100, 1289, 0,
+    1266, 0x200, 1289, 0,
+    1267, 0x400, 1289, 0,
+    1290, 0x100, 1291, 0,
+    1337, 0x20, 1338, 0,
+    1339, 0x8, 1340, 0,
+    746, 0x4, 1341, 0,
+    1342, 0x40, 1343, 0,
+    1344, 0x20, 1345, 0,
+    1346, 0x4, 1347, 1,
+    1348, 0x2, 1349, 1,
+    1350, 0x1, 1351, 1,
+    1352, 0xFFFFFFFF, 1353, 1,
+    1359, 0xF00000, 1359, 0,
+    1360, 0x40000, 1360, 0,
+    1361, 0x6000, 1361, 0,
+    1362, 0x1000, 1363, 0,
+    1364, 0x800, 1365, 0,
+    80, 0x400, 308, 0,
+    1366, 0x200, 1367, 0,
+    1368, 0x100, 1369, 0,
+    1370, 0x80, 1371, 0,
+    1372, 0x10060, 1373, 0,
+    1374, 0x18, 1375, 0,
+    1376, 0x6, 1377, 0,
+    1378, 0x1, 1379, 0,
+    163, 0x8, 163, 1,
+    1380, 0x4, 1381, 1,
+    286, 0x2, 1382, 1,
+    1383, 0x1, 1384, 1,
+    1385, 0xFFFFFFFF, 1386, 0,
+    1387, 0xFFFFFFFF, 1388, 1,
+    1389, 0xFFFFFFFF, 1390, 0,
+    1391, 0xFFFFFFFF, 1392, 0,
+    1393, 0xFFFFFFFF, 1394, 0,
+    1395, 0xFFFFFFFF, 1396, 0,
+    1397, 0xFFFFFFFF, 1398, 0,
+    1399, 0xFFFFFFFF, 1400, 0,
+    1401, 0xFFFFFFFF, 1402, 0,
+    1403, 0xFFFFFFFF, 1404, 0,
+    25, 0xFFFFFFFF, 1405, 0,
+    1406, 0xFFFFFFFF, 1407, 0,
+    1452, 0xC0000000, 1453, 0,
+    1454, 0x30000000, 1453, 0,
+    1455, 0xC000000, 1453, 0,
+    1456, 0x3000000, 1453, 0,
+    1457, 0xC00000, 1453, 0,
+    1458, 0x300000, 1453, 0,
+    1459, 0xC0000, 1453, 0,
+    1460, 0x30000, 1453, 0,
+    1461, 0xC000, 1453, 0,
+    1462, 0x3000, 1453, 0,
+    1463, 0xC00, 1453, 0,
+    1464, 0x300, 1453, 0,
+    1465, 0xC0, 1453, 0,
+    1466, 0x30, 1453, 0,
+    1467, 0xC, 1453, 0,
+    1468, 0x3, 1453, 0,
+    1471, 0x8000, 1453, 0,
+    1472, 0x4000, 1453, 0,
+    1473, 0x2000, 1453, 0,
+    1474, 0x1000, 1453, 0,
+    1475, 0x800, 1453, 0,
+    1476, 0x400, 1453, 0,
+    1477, 0x200, 1453, 0,
+    1478, 0x100, 1453, 0,
+    1479, 0x80, 1453, 0,
+    1480, 0x40, 1453, 0,
+    1481, 0x20, 1453, 0,
+    1482, 0x10, 1453, 0,
+    1483, 0x8, 1453, 0,
+    1484, 0x4, 1453, 0,
+    1485, 0x2, 1453, 0,
+    1486, 0x1, 1453, 0,
+    1489, 0xC0000000, 1453, 0,
+    1490, 0x30000000, 1453, 0,
+    1491, 0xC000000, 1453, 0,
+    1492, 0x3000000, 1453, 0,
+    1493, 0xC00000, 1453, 0,
+    1494, 0x300000, 1453, 0,
+    1495, 0xC0000, 1453, 0,
+    1496, 0x30000, 1453, 0,
+    1497, 0xC000, 1453, 0,
+    1498, 0x3000, 1453, 0,
+    1499, 0xC00, 1453, 0,
+    1500, 0x300, 1453, 0,
+    1501, 0xC0, 1453, 0,
+    1502, 0x30, 1453, 0,
+    1503, 0xC, 1453, 0,
+    1504, 0x3, 1453, 0,
+    1507, 0xC0000000, 1453, 0,
+    1508, 0x30000000, 1453, 0,
+    1509, 0xC000000, 1453, 0,
+    1510, 0x3000000, 1453, 0,
+    1511, 0xC00000, 1453, 0,
+    1512, 0x300000, 1453, 0,
+    1513, 0xC0000, 1453, 0,
+    1514, 0x30000, 1453, 0,
+    1515, 0xC000, 1453, 0,
+    1516, 0x3000, 1453, 0,
+    1517, 0xC00, 1453, 0,
+    1518, 0x300, 1453, 0,
+    1519, 0xC0, 1453, 0,
+    1520, 0x30, 1453, 0,
+    1521, 0xC, 1453, 0,
+    1522, 0x3, 1453, 0,
+    1525, 0x8000, 1526, 1,
+    1527, 0x4000, 1526, 1,
+    1528, 0x2000, 1526, 1,
+    1529, 0x1000, 1526, 1,
+    1530, 0x800, 1526, 1,
+    1531, 0x400, 1526, 1,
+    1532, 0x200, 1526, 1,
+    1533, 0x100, 1526, 1,
+    1534, 0x80, 1526, 1,
+    1535, 0x40, 1526, 1,
+    1536, 0x20, 1526, 1,
+    1537, 0x10, 1526, 1,
+    1538, 0x8, 1526, 1,
+    1539, 0x4, 1526, 1,
+    1540, 0x2, 1526, 1,
+    1541, 0x1, 1526, 1,
+    1543, 0x8000, 1544, 0,
+    1545, 0x4000, 1544, 0,
+    1546, 0x2000, 1544, 0,
+    1547, 0x1000, 1544, 0,
+    1548, 0x800, 1544, 0,
+    1549, 0x400, 1544, 0,
+    1550, 0x200, 1544, 0,
+    1551, 0x100, 1544, 0,
+    1552, 0x80, 1544, 0,
+    1553, 0x40, 1544, 0,
+    1554, 0x20, 1544, 0,
+    1555, 0x10, 1544, 0,
+    1556, 0x8, 1544, 0,
+    1557, 0x4, 1544, 0,
+    1558, 0x2, 1544, 0,
+    1559, 0x1, 1544, 0,
+    1562, 0x80000000, 1563, 2,
+    1564, 0x40000000, 1563, 2,
+    1565, 0x20000000, 1563, 2,
+    1566, 0x10000000, 1563, 2,
+    1567, 0x8000000, 1563, 2,
+    1568, 0x4000000, 1563, 2,
+    1569, 0x2000000, 1563, 2,
+    1570, 0x1000000, 1563, 2,
+    1571, 0x800000, 1563, 2,
+    1572, 0x400000, 1563, 2,
+    1573, 0x200000, 1563, 2,
+    1574, 0x100000, 1563, 2,
+    1575, 0x80000, 1563, 2,
+    1576, 0x40000, 1563, 2,
+    1577, 0x20000, 1563, 2,
+    1578, 0x10000, 1579, 2,
+    1580, 0x8000, 1579, 2,
+    1581, 0x4000, 1579, 2,
+    1582, 0x2000, 1579, 2,
+    1583, 0x1000, 1579, 2,
+    1584, 0x800, 1579, 2,
+    1585, 0x400, 1579, 2,
+    1586, 0x200, 1579, 2,
+    1587, 0x100, 1579, 2,
+    1588, 0x80, 1579, 2,
+    1589, 0x40, 1579, 2,
+    1590, 0x20, 1579, 2,
+    1591, 0x10, 1579, 2,
+    1592, 0x8, 1579, 2,
+    1593, 0x4, 1579, 2,
+    1594, 0x2, 1579, 2,
+    1595, 0x1, 1579, 2,
+    1600, 0x10000, 1601, 0,
+    1602, 0x8000, 1601, 0,
+    1603, 0x4000, 1601, 0,
+    1604, 0x2000, 1601, 0,
+    1605, 0x1000, 1601, 0,
+    1606, 0x800, 1601, 0,
+    1607, 0x400, 1601, 0,
+    1608, 0x200, 1601, 0,
+    1609, 0x100, 1601, 0,
+    1610, 0x80, 1601, 0,
+    1611, 0x40, 1601, 0,
+    1612, 0x20, 1601, 0,
+    1613, 0x10, 1601, 0,
+    1614, 0x8, 1601, 0,
+    1615, 0x4, 1601, 0,
+    1616, 0x2, 1601, 0,
+    1617, 0x1, 1601, 0,
+    1620, 0xF0000000, 1621, 0,
+    1622, 0xF000000, 1621, 0,
+    1623, 0xF00000, 1621, 0,
+    1624, 0xF0000, 1621, 0,
+    1625, 0xF000, 1621, 0,
+    1626, 0xF00, 1621, 0,
+    1627, 0xF0, 1621, 0,
+    1628, 0xF, 1621, 0,
+    1631, 0xF0000000, 1632, 0,
+    1633, 0xF000000, 1632, 0,
+    1634, 0xF00000, 1632, 0,
+    1635, 0xF0000, 1632, 0,
+    1636, 0xF000, 1632, 0,
+    1637, 0xF00, 1632, 0,
+    1638, 0xF0, 1632, 0,
+    1639, 0xF, 1632, 0,
+    1578, 0x1, 1642, 2,
+    1577, 0x2, 1642, 2,
+    1576, 0x4, 1642, 2,
+    1575, 0x8, 1642, 2,
+    1574, 0x10, 1642, 2,
+    1573, 0x20, 1642, 2,
+    1572, 0x40, 1642, 2,
+    1571, 0x80, 1642, 2,
+    1570, 0x100, 1642, 2,
+    1569, 0x200, 1642, 2,
+    1568, 0x400, 1642, 2,
+    1567, 0x800, 1642, 2,
+    1566, 0x1000, 1642, 2,
+    1565, 0x2000, 1642, 2,
+    1564, 0x4000, 1642, 2,
+    1562, 0x8000, 1642, 2,
+    1666, 0x1, 1667, 0,
+    1668, 0x2, 1669, 0,
+    1670, 0x4, 1671, 0,
+    1672, 0x8, 1673, 0,
+    1674, 0x80, 1675, 0,
+    1676, 0x300, 1677, 0,
+    1678, 0x800, 1679, 0,
+    1680, 0x1000, 1681, 0,
+    1682, 0x400, 1683, 0,
+    1684, 0x200, 1685, 0,
+    1686, 0x100, 1685, 0,
+    1687, 0x80, 1688, 0,
+    1689, 0x70, 1690, 0,
+    1691, 0x8, 1692, 0,
+    1693, 0x4, 1694, 0,
+    1695, 0x1, 1696, 0,
+    1699, 0x80, 1700, 0,
+    1701, 0x300070, 1702, 0,
+    1703, 0x10007, 1704, 0,
+    1705, 0x4000, 1706, 0,
+    1707, 0x2000, 1708, 0,
+    1709, 0x400, 1710, 0,
+    1711, 0x200, 1712, 0,
+    1713, 0x100, 1714, 0,
+    1715, 0x80, 1716, 0,
+    1717, 0x40, 1718, 0,
+    1719, 0x20, 1720, 0,
+    1721, 0x4, 1722, 0,
+    1723, 0x2, 1724, 0,
+    1725, 0x1, 1726, 0,
+    1731, 0x400, 1732, 0,
+    1733, 0x200, 1734, 0,
+    1735, 0x80, 1736, 0,
+    1737, 0x40, 1738, 0,
+    1739, 0x20, 1740, 0,
+    1741, 0x4, 1742, 0,
+    1743, 0x2, 1744, 0,
+    1745, 0x1, 1746, 0,
+    1751, 0x80, 1752, 0,
+    1753, 0x40, 1754, 0,
+    1755, 0x20, 1756, 0,
+    1757, 0x4, 1758, 0,
+    1759, 0x2, 1760, 0,
+    1761, 0x1, 1762, 0,
+    1765, 0x1007000, 1765, 0,
+    1766, 0x800, 1766, 0,
+    1767, 0x400, 1767, 0,
+    1768, 0x300, 1768, 0,
+    1769, 0x80, 1769, 0,
+    1770, 0x10070, 1771, 0,
+    1772, 0x8, 1773, 0,
+    1774, 0x4, 1775, 0,
+    1776, 0x3, 1777, 0,
+    1786, 0xF000, 1786, 0,
+    1787, 0xC00, 1787, 0,
+    1768, 0x300, 1768, 0,
+    1788, 0xF0, 1789, 0,
+    1790, 0xC, 1791, 0,
+    1776, 0x3, 1777, 0,
+    1796, 0x80, 1797, 0,
+    1798, 0x20, 1799, 0,
+    1800, 0x10, 1801, 0,
+    1802, 0x8, 1803, 0,
+    1804, 0x4, 1805, 0,
+    1806, 0x2, 1803, 0,
+    1807, 0x1, 1808, 0,
+    1815, 0xFFFF, 1816, 0,
+    1817, 0x80000000, 1818, 0,
+    1819, 0xFFFF, 1820, 0,
+    1821, 0xFFFF, 1822, 0,
+    1823, 0xFF, 1824, 0,
+    1825, 0xFFFF, 1826, 0,
+    1827, 0xFFFF, 1826, 0,
+    1828, 0xFF, 1829, 0,
+    316, 0x300, 1830, 0,
+    1831, 0x400, 1832, 0,
+    1833, 0x800, 1834, 0,
+    1835, 0x1000, 1836, 0,
+    1837, 0x2000, 1838, 0,
+    1839, 0x4000, 1840, 0,
+    1841, 0x8000, 1842, 0,
+    1843, 0xF0000, 1844, 0,
+    1845, 0x4000000, 1845, 0,
+    1846, 0x10000000, 1846, 0,
+    1847, 0xFF, 1829, 0,
+    1848, 0x10000, 1849, 0,
+    1850, 0x20000, 1851, 0,
+    1852, 0xF, 1853, 0,
+    1854, 0xF00, 1855, 0,
+    1858, 0x2000, 1859, 0,
+    1860, 0x1000, 1861, 0,
+    1862, 0x800, 1863, 0,
+    1864, 0x400, 1865, 0,
+    1866, 0x200, 1867, 0,
+    1868, 0x80, 1869, 0,
+    1870, 0x40, 1871, 0,
+    1872, 0x20, 1873, 0,
+    1874, 0x10, 1875, 0,
+    1876, 0x8, 1877, 0,
+    1878, 0x4, 1879, 0,
+    1880, 0x2, 1881, 0,
+    1882, 0x1, 1883, 0,
+    1888, 0x70000, 1889, 0,
+    1890, 0x1F00, 1891, 0,
+    1892, 0x1F, 1893, 0,
+    1894, 0xFFFFFFFF, 1895, 0,
+    1765, 0x1007000, 1765, 0,
+    1766, 0x800, 1766, 0,
+    1767, 0x400, 1767, 0,
+    1768, 0x300, 1768, 0,
+    1769, 0x80, 1769, 0,
+    1770, 0x10070, 1771, 0,
+    1772, 0x8, 1773, 0,
+    1774, 0x4, 1775, 0,
+    1776, 0x3, 1777, 0,
+    1786, 0xF000, 1786, 0,
+    1787, 0xC00, 1787, 0,
+    1788, 0xF0, 1789, 0,
+    1790, 0xC, 1791, 0,
+    1684, 0x200, 1685, 0,
+    1686, 0x100, 1685, 0,
+    1691, 0x8, 1692, 0,
+    1693, 0x4, 1694, 0,
+    1695, 0x1, 1696, 0,
+    1707, 0x2000, 1708, 0,
+    1711, 0x200, 1712, 0,
+    1713, 0x100, 1714, 0,
+    1715, 0x80, 1716, 0,
+    1719, 0x20, 1720, 0,
+    1723, 0x2, 1724, 0,
+    1725, 0x1, 1726, 0,
+    1733, 0x200, 1734, 0,
+    1735, 0x80, 1736, 0,
+    1739, 0x20, 1740, 0,
+    1743, 0x2, 1744, 0,
+    1745, 0x1, 1746, 0,
+    1751, 0x80, 1752, 2,
+    1755, 0x20, 1756, 2,
+    1759, 0x2, 1760, 2,
+    1761, 0x1, 1762, 2,
+    1770, 0x10070, 1771, 0,
+    1772, 0x8, 1773, 0,
+    1774, 0x4, 1775, 0,
+    1776, 0x3, 1777, 0,
+    1788, 0xF0, 1789, 0,
+    1790, 0xC, 1791, 0,
+    1776, 0x3, 1777, 0,
+    1802, 0x8, 1803, 0,
+    1804, 0x4, 1805, 0,
+    1806, 0x2, 1803, 0,
+    1807, 0x1, 1808, 0,
+    1815, 0xFFFF, 1816, 0,
+    1817, 0x80000000, 1818, 1,
+    1852, 0xF, 1853, 0,
+    1938, 0x1, 1939, 0,
+    1770, 0x10070, 1771, 0,
+    1772, 0x8, 1773, 0,
+    1774, 0x4, 1775, 0,
+    1776, 0x3, 1777, 0,
+    1788, 0xF0, 1789, 0,
+    1790, 0xC, 1791, 0,
+    1680, 0x1000, 1681, 0,
+    1678, 0x800, 1679, 0,
+    1676, 0x300, 1677, 0,
+    1674, 0x80, 1675, 0,
+    1944, 0x60, 1945, 0,
+    161, 0x10, 1946, 0,
+    1672, 0x8, 1673, 0,
+    1670, 0x4, 1671, 0,
+    1668, 0x2, 1669, 0,
+    1666, 0x1, 1667, 0,
+    1947, 0xF00000, 1948, 0,
+    1949, 0x40000, 1950, 0,
+    1951, 0x10000, 1952, 0,
+    1953, 0x8000, 1954, 0,
+    1955, 0x4000, 1956, 0,
+    1957, 0x2000, 1958, 0,
+    1959, 0x1000, 1958, 0,
+    1960, 0x800, 1961, 0,
+    1682, 0x400, 1961, 0,
+    1684, 0x200, 1685, 0,
+    1686, 0x100, 1685, 0,
+    1687, 0x80, 1688, 0,
+    1689, 0x2000070, 1690, 0,
+    1691, 0x8, 1692, 0,
+    1693, 0x4, 1694, 0,
+    1695, 0x1, 1696, 0,
+    1964, 0x2000000, 1965, 0,
+    1966, 0x1000000, 1967, 0,
+    1968, 0x8000, 1969, 0,
+    1970, 0x4000, 1971, 0,
+    1972, 0x3000, 1973, 0,
+    1974, 0xF00, 1975, 0,
+    1699, 0x80, 1700, 0,
+    1701, 0x300070, 1702, 0,
+    1976, 0x8, 1977, 0,
+    1703, 0x10007, 1704, 0,
+    1978, 0x800000, 1979, 0,
+    1980, 0x400000, 1981, 0,
+    1982, 0x200000, 1983, 0,
+    1984, 0x100000, 1985, 0,
+    1705, 0x4000, 1706, 0,
+    1707, 0x2000, 1708, 0,
+    1986, 0x1000, 1987, 0,
+    1988, 0x800, 1989, 0,
+    1709, 0x400, 1710, 0,
+    1711, 0x200, 1712, 0,
+    1713, 0x100, 1714, 0,
+    1717, 0x40, 1718, 0,
+    1990, 0x10, 1991, 0,
+    1992, 0x8, 1993, 0,
+    1721, 0x4, 1722, 0,
+    1723, 0x2, 1724, 0,
+    1725, 0x1, 1726, 0,
+    1715, 0x80, 1716, 0,
+    1719, 0x20, 1720, 0,
+    1994, 0x800000, 1995, 0,
+    1996, 0x400000, 1997, 0,
+    1998, 0x200000, 1999, 0,
+    2000, 0x100000, 2001, 0,
+    2002, 0x20000, 2003, 0,
+    2004, 0x10000, 2005, 0,
+    2006, 0x2000, 2007, 0,
+    2008, 0x1000, 2009, 0,
+    2010, 0x800, 2011, 0,
+    1731, 0x400, 2012, 0,
+    1733, 0x200, 1734, 0,
+    2013, 0x100, 2014, 0,
+    1735, 0x80, 1736, 0,
+    1737, 0x40, 1738, 0,
+    1739, 0x20, 1740, 0,
+    2015, 0x10, 2016, 0,
+    2017, 0x8, 2018, 0,
+    1741, 0x4, 2019, 0,
+    1743, 0x2, 1744, 0,
+    1745, 0x1, 1746, 0,
+    2020, 0x100, 2021, 2,
+    1751, 0x80, 1752, 2,
+    1753, 0x40, 1754, 2,
+    1755, 0x20, 1756, 2,
+    2022, 0x10, 2023, 2,
+    2024, 0x8, 2025, 2,
+    1757, 0x4, 1758, 2,
+    1759, 0x2, 1760, 2,
+    1761, 0x1, 1762, 2,
+    2026, 0x8000, 2027, 0,
+    1765, 0x1007000, 2028, 0,
+    1766, 0x800, 2029, 0,
+    1767, 0x400, 2030, 0,
+    1768, 0x300, 2031, 0,
+    1769, 0x80, 2032, 0,
+    1770, 0x10070, 1771, 0,
+    1772, 0x8, 1773, 0,
+    1774, 0x4, 1775, 0,
+    1776, 0x3, 1777, 0,
+    1786, 0xF000, 2035, 0,
+    1787, 0xC00, 2036, 0,
+    1768, 0x300, 2031, 0,
+    1788, 0xF0, 1789, 0,
+    2037, 0xC, 1791, 0,
+    1776, 0x3, 1777, 0,
+    2038, 0x8000, 2039, 0,
+    2040, 0x1007000, 2041, 0,
+    2042, 0x800, 2043, 0,
+    2044, 0x400, 2045, 0,
+    2046, 0x300, 2047, 0,
+    2048, 0x80, 2049, 0,
+    2050, 0x10070, 2051, 0,
+    2052, 0x8, 2053, 0,
+    2054, 0x4, 2055, 0,
+    2056, 0x3, 2057, 0,
+    2058, 0xF000, 2059, 0,
+    2060, 0xC00, 2061, 0,
+    2046, 0x300, 2047, 0,
+    2062, 0xF0, 2063, 0,
+    2064, 0xC, 2065, 0,
+    2056, 0x3, 2066, 0,
+    2067, 0x200000, 2068, 0,
+    2069, 0x100000, 2070, 0,
+    2071, 0x20000, 2072, 0,
+    2073, 0x10000, 2074, 0,
+    2075, 0x8000, 2076, 0,
+    2077, 0x4000, 2078, 0,
+    2079, 0x2000, 2080, 0,
+    2081, 0x1000, 2082, 0,
+    2083, 0x800, 2080, 0,
+    2084, 0x400, 2085, 0,
+    2086, 0x200, 2080, 0,
+    2087, 0x100, 2088, 0,
+    1796, 0x80, 2089, 0,
+    2090, 0x40, 2091, 0,
+    1798, 0x20, 2089, 0,
+    1800, 0x10, 1801, 0,
+    1802, 0x8, 1803, 0,
+    1804, 0x4, 1805, 0,
+    1806, 0x2, 1803, 0,
+    1807, 0x1, 1808, 0,
+    1817, 0x80000000, 1817, 1,
+    1815, 0xFFFF, 1816, 0,
+    1823, 0xFFFF, 1824, 0,
+    1827, 0xFFFF, 2094, 0,
+    2095, 0xFFFF, 2096, 0,
+    2097, 0xFFFF, 2096, 0,
+    2098, 0x20000000, 2098, 0,
+    1846, 0x10000000, 1846, 0,
+    2099, 0x8000000, 2099, 0,
+    1845, 0x4000000, 1845, 0,
+    2100, 0x2000000, 2101, 0,
+    2102, 0x1000000, 2103, 0,
+    2104, 0xF00000, 2105, 0,
+    1843, 0xF0000, 1844, 0,
+    1841, 0x8000, 1842, 0,
+    1839, 0x4000, 1840, 0,
+    1837, 0x2000, 1838, 0,
+    1835, 0x1000, 1836, 0,
+    1833, 0x800, 1834, 0,
+    1831, 0x400, 1832, 0,
+    316, 0x300, 1830, 0,
+    1828, 0xFF, 1829, 0,
+    2106, 0xFFFF, 2096, 0,
+    2107, 0x20000000, 2108, 0,
+    2109, 0x40000000, 2110, 0,
+    2111, 0x80000000, 2112, 0,
+    2115, 0xFFFF, 2096, 0,
+    2116, 0x1000000, 2117, 0,
+    2118, 0x70000, 2119, 0,
+    2120, 0x8000, 2121, 0,
+    2122, 0x7000, 2123, 0,
+    2124, 0x800, 2125, 0,
+    2126, 0x400, 2127, 0,
+    2128, 0x80, 2129, 0,
+    2130, 0x70, 2131, 0,
+    2132, 0x8, 2133, 0,
+    2134, 0x4, 2135, 0,
+    1850, 0x20000, 1851, 0,
+    1848, 0x10000, 1849, 0,
+    1847, 0xFF, 2136, 0,
+    1339, 0x1, 2137, 0,
+    2138, 0x6, 2139, 0,
+    2140, 0x18, 2141, 0,
+    2142, 0x20, 2143, 0,
+    2144, 0xC0, 2145, 0,
+    2146, 0xFF0000, 2147, 0,
+    2148, 0x7000000, 2149, 0,
+    1852, 0xF, 1853, 0,
+    1854, 0xF00, 1855, 0,
+    2150, 0xF0000, 2151, 0,
+    2152, 0xF000000, 2153, 0,
+    2154, 0x3C000, 2155, 0,
+    1858, 0x2000, 1859, 0,
+    1860, 0x1000, 1861, 0,
+    1862, 0x800, 1863, 0,
+    1864, 0x400, 1865, 0,
+    1866, 0x200, 1867, 0,
+    1868, 0x80, 1869, 0,
+    1870, 0x40, 1871, 0,
+    1872, 0x20, 1873, 0,
+    1874, 0x10, 1875, 0,
+    1876, 0x8, 1877, 0,
+    1878, 0x4, 1879, 0,
+    1880, 0x2, 1881, 0,
+    1882, 0x1, 1883, 0,
+    1888, 0x70000, 1889, 0,
+    2156, 0x2000, 2157, 0,
+    2158, 0x1000, 2159, 0,
+    2160, 0x800, 2161, 0,
+    2162, 0x400, 2163, 0,
+    2164, 0x200, 2165, 0,
+    2166, 0x80, 2167, 0,
+    2168, 0x40, 2169, 0,
+    2170, 0x20, 2171, 0,
+    2172, 0x10, 2173, 0,
+    2174, 0x8, 2175, 0,
+    2176, 0x4, 2177, 0,
+    2178, 0x2, 2179, 0,
+    1882, 0x1, 1883, 0,
+    2026, 0x8000, 2027, 0,
+    1765, 0x1007000, 2028, 0,
+    1766, 0x800, 2029, 0,
+    1767, 0x400, 2030, 0,
+    1768, 0x300, 2031, 0,
+    1769, 0x80, 2032, 0,
+    1770, 0x10070, 1771, 0,
+    1772, 0x8, 1773, 0,
+    1774, 0x4, 1775, 0,
+    1776, 0x3, 1777, 0,
+    1786, 0xF000, 2035, 0,
+    1787, 0xC00, 2036, 0,
+    1788, 0xF0, 1789, 0,
+    2037, 0xC, 1791, 0,
+    2038, 0x8000, 2039, 0,
+    2040, 0x1007000, 2041, 0,
+    2042, 0x800, 2043, 0,
+    2044, 0x400, 2045, 0,
+    2046, 0x300, 2047, 0,
+    2048, 0x80, 2049, 0,
+    2050, 0x10070, 2051, 0,
+    2052, 0x8, 2053, 0,
+    2054, 0x4, 2055, 0,
+    2056, 0x3, 2066, 0,
+    2058, 0xF000, 2059, 0,
+    2060, 0xC00, 2061, 0,
+    2062, 0xF0, 2063, 0,
+    2064, 0xC, 2065, 0,
+    2020, 0x100, 2021, 0,
+    1751, 0x80, 1752, 0,
+    1753, 0x40, 1754, 2,
+    1755, 0x20, 1756, 0,
+    2022, 0x10, 2023, 2,
+    2024, 0x8, 2025, 2,
+    1757, 0x4, 1758, 2,
+    1759, 0x2, 1760, 2,
+    1761, 0x1, 1762, 2,
+    1817, 0x80000000, 1817, 0,
+    1815, 0xFFFF, 1816, 0,
+    1680, 0x1000, 1681, 0,
+    1678, 0x800, 1679, 0,
+    1674, 0x80, 1675, 0,
+    1672, 0x8, 1673, 0,
+    1670, 0x4, 1671, 0,
+    1668, 0x2, 1669, 0,
+    1666, 0x1, 1667, 0,
+    1689, 0x70, 1690, 0,
+    1713, 0x100, 1714, 0,
+    1725, 0x1, 1726, 0,
+    1745, 0x1, 1746, 0,
+    1761, 0x1, 1762, 2,
+    1817, 0x80000000, 1818, 1,
+    1815, 0xFFFF, 2210, 0,
+    1821, 0xFFFF, 2211, 0,
+    2215, 0x40, 2216, 0,
+    2217, 0x20, 2218, 0,
+    2219, 0x10, 2220, 0,
+    2221, 0x8, 2222, 0,
+    2223, 0x4, 2224, 0,
+    2225, 0x2, 2226, 0,
+    2227, 0x1, 2228, 0,
+    2229, 0x40, 2230, 0,
+    2231, 0x20, 2232, 0,
+    2233, 0x10, 2234, 0,
+    2235, 0x8, 2236, 0,
+    2237, 0x4, 2238, 0,
+    2239, 0x2, 2240, 0,
+    2241, 0x1, 2242, 0,
+    2243, 0x40, 2244, 0,
+    2245, 0x20, 2246, 0,
+    2247, 0x10, 2248, 0,
+    2249, 0x8, 2250, 0,
+    2251, 0x4, 2252, 0,
+    2253, 0x2, 2254, 0,
+    2255, 0x1, 2256, 0,
+    2257, 0x1000000, 2258, 0,
+    2259, 0x800000, 2260, 0,
+    2261, 0x400000, 2262, 0,
+    2263, 0x200000, 2264, 0,
+    2265, 0x100000, 2266, 0,
+    2267, 0x80000, 2268, 0,
+    2269, 0x60000, 2270, 0,
+    2271, 0x1E000, 2272, 0,
+    147, 0xE00, 2273, 0,
+    2274, 0xC0, 2275, 0,
+    2276, 0x18, 2277, 0,
+    2278, 0x6, 2279, 0,
+    2280, 0x1, 2281, 0,
+    2282, 0x10, 2282, 0,
+    2283, 0x8, 2283, 0,
+    2284, 0x4, 2285, 0,
+    2286, 0x2, 2287, 0,
+    2288, 0x1, 2289, 0,
+    2290, 0xFFFF, 2291, 0,
+    1821, 0xFFFF, 2292, 0,
+    1815, 0xFFFF, 2293, 0,
+    2294, 0xD, 2294, 0,
+    2295, 0x32, 2295, 0,
+    2311, 0x80000000, 2311, 0,
+    2312, 0x40000000, 2312, 0,
+    2313, 0x20000000, 2313, 0,
+    2314, 0x10000000, 2314, 0,
+    2315, 0x8000000, 2316, 0,
+    2317, 0x4000000, 2318, 0,
+    2319, 0x2000000, 2320, 0,
+    2321, 0x1000000, 2321, 0,
+    2322, 0x800000, 2322, 0,
+    2323, 0x400000, 2323, 0,
+    2324, 0x200000, 2324, 0,
+    2325, 0x100000, 2326, 0,
+    2327, 0x80000, 2327, 0,
+    2328, 0x40000, 2328, 0,
+    2329, 0x20000, 2329, 0,
+    2330, 0x10000, 2330, 0,
+    2331, 0x8000, 2332, 0,
+    2333, 0x4000, 2334, 0,
+    2335, 0x2000, 2336, 0,
+    2337, 0x1000, 2338, 0,
+    2339, 0x800, 2340, 0,
+    2341, 0x400, 2342, 0,
+    2343, 0x200, 2344, 0,
+    2345, 0x100, 2346, 0,
+    2347, 0x80, 2348, 0,
+    78, 0x40, 2349, 0,
+    2350, 0x20, 2351, 0,
+    2352, 0x10, 2353, 0,
+    2354, 0x8, 2355, 0,
+    2356, 0x4, 2357, 0,
+    2358, 0x2, 2359, 0,
+    2360, 0x1, 2361, 0,
+    2368, 0xF0000000, 2369, 0,
+    2370, 0xF000000, 2369, 0,
+    2371, 0x800000, 2372, 0,
+    2373, 0x400000, 2374, 0,
+    2375, 0x200000, 2375, 0,
+    2376, 0x100000, 2377, 0,
+    2378, 0x80000, 2379, 0,
+    2380, 0x40000, 2381, 0,
+    2382, 0x20000, 2383, 0,
+    2384, 0x10000, 2385, 0,
+    2386, 0x8000, 2387, 0,
+    2388, 0x4000, 2389, 0,
+    116, 0x3000, 2390, 0,
+    2391, 0x800, 2392, 0,
+    2393, 0x400, 2394, 0,
+    2395, 0x200, 2396, 0,
+    2397, 0x100, 2398, 0,
+    2399, 0x40, 2400, 0,
+    2401, 0x20, 2402, 0,
+    2403, 0x10, 2404, 0,
+    2405, 0x8, 2405, 0,
+    2406, 0x1, 2406, 0,
+    2409, 0xE0000000, 2409, 0,
+    2410, 0x10000000, 2410, 0,
+    2411, 0xE000000, 2411, 0,
+    2412, 0x1000000, 2412, 0,
+    2413, 0x800000, 2413, 0,
+    2414, 0x400000, 2415, 0,
+    2416, 0x300000, 2417, 0,
+    2418, 0xE0000, 2419, 0,
+    2420, 0x8000, 2421, 0,
+    2422, 0x4000, 2423, 0,
+    2424, 0x2000, 2425, 0,
+    2426, 0x1000, 2427, 0,
+    2428, 0x800, 2429, 0,
+    2430, 0x400, 2431, 0,
+    2432, 0x200, 2433, 0,
+    2434, 0x100, 2435, 0,
+    2436, 0x80, 2437, 0,
+    1928, 0x40, 2438, 0,
+    2439, 0x20, 2440, 0,
+    114, 0x10, 2441, 0,
+    2442, 0x8, 2443, 0,
+    2444, 0x4, 2445, 0,
+    2446, 0x2, 2447, 0,
+    2448, 0x1, 308, 0,
+    2449, 0xFFF0, 2449, 0,
+    2450, 0xF, 2450, 0,
+    2451, 0xFF00, 2452, 0,
+    1819, 0xFF, 1820, 0,
+    2453, 0xFF000000, 2454, 0,
+    2455, 0xFFFFFF, 2456, 0,
+    2457, 0x10, 2458, 2,
+    2459, 0x8, 2460, 2,
+    2461, 0x4, 2462, 2,
+    2463, 0x2, 2464, 2,
+    2465, 0x1, 2466, 2,
+    2467, 0x8000000, 2467, 1,
+    2468, 0x4000000, 2468, 1,
+    2469, 0x2000000, 2469, 1,
+    2470, 0x1000000, 2470, 1,
+    2471, 0x800000, 2471, 1,
+    2472, 0x400000, 2472, 1,
+    2473, 0x200000, 2473, 1,
+    1207, 0x100000, 1207, 1,
+    2474, 0x80000, 2474, 1,
+    2475, 0x40000, 2475, 1,
+    2476, 0x20000, 2476, 1,
+    163, 0x10000, 163, 1,
+    2477, 0x8000, 2477, 1,
+    2478, 0x4000, 2478, 1,
+    2479, 0x2000, 2479, 1,
+    2480, 0x1000, 2480, 1,
+    2481, 0x800, 2481, 1,
+    2482, 0x400, 2482, 1,
+    2483, 0x200, 2483, 1,
+    2484, 0x100, 2484, 1,
+    191, 0x80, 191, 1,
+    179, 0x40, 179, 1,
+    187, 0x20, 187, 1,
+    2485, 0x10, 2485, 1,
+    2486, 0x8, 2486, 1,
+    2487, 0x4, 2487, 1,
+    2488, 0x2, 2488, 1,
+    66, 0x1, 66, 1,
+    2489, 0x100000, 2490, 2,
+    2491, 0x20000, 2492, 2,
+    2493, 0x2000, 2493, 2,
+    2494, 0x1000, 2495, 2,
+    2496, 0x800, 2497, 2,
+    2498, 0x200, 2499, 2,
+    2500, 0x100, 2501, 2,
+    2502, 0x80, 2502, 2,
+    2503, 0x40, 2504, 2,
+    2505, 0x20, 2505, 2,
+    2506, 0x10, 2507, 2,
+    2508, 0x8, 2509, 2,
+    2510, 0x4, 2511, 2,
+    2512, 0x2, 2513, 2,
+    2514, 0x1, 2515, 2,
+    2516, 0x1FF, 2517, 1,
+    2518, 0x1FF, 2519, 0,
+    2520, 0xF, 2520, 0,
+    2311, 0x80000000, 2311, 0,
+    2312, 0x40000000, 2312, 0,
+    2313, 0x20000000, 2313, 0,
+    2314, 0x10000000, 2338, 0,
+    2319, 0x2000000, 2320, 0,
+    2321, 0x1000000, 2321, 0,
+    2322, 0x800000, 2322, 0,
+    2323, 0x400000, 2323, 0,
+    2324, 0x200000, 2324, 0,
+    2325, 0x100000, 2326, 0,
+    2327, 0x80000, 2327, 0,
+    2328, 0x40000, 2328, 0,
+    2329, 0x20000, 2329, 0,
+    2330, 0x10000, 2330, 0,
+    2333, 0x4000, 2334, 0,
+    2335, 0x2000, 2336, 0,
+    2337, 0x1000, 2338, 0,
+    2339, 0x800, 2340, 0,
+    2341, 0x400, 2342, 0,
+    2343, 0x200, 2344, 0,
+    2345, 0x100, 2346, 0,
+    2347, 0x80, 2348, 0,
+    78, 0x40, 2349, 0,
+    2350, 0x20, 2351, 0,
+    2352, 0x10, 2353, 0,
+    2354, 0x8, 2355, 0,
+    2356, 0x4, 2357, 0,
+    2358, 0x2, 2359, 0,
+    2360, 0x1, 2361, 0,
+    2368, 0xF0000000, 2369, 0,
+    2370, 0xF000000, 2369, 0,
+    2378, 0x80000, 2379, 0,
+    2380, 0x40000, 2381, 0,
+    2382, 0x20000, 2383, 0,
+    2384, 0x10000, 2385, 0,
+    2386, 0x8000, 2387, 0,
+    116, 0x3000, 2390, 0,
+    2403, 0x10, 2404, 0,
+    2409, 0xE0000000, 2409, 0,
+    2410, 0x10000000, 2410, 0,
+    2411, 0xE000000, 2411, 0,
+    2413, 0x800000, 2413, 0,
+    2414, 0x400000, 2415, 0,
+    2416, 0x300000, 2417, 0,
+    2420, 0x8000, 2421, 0,
+    2422, 0x4000, 2423, 0,
+    2424, 0x2000, 2425, 0,
+    2426, 0x1000, 2427, 0,
+    2430, 0x400, 2431, 0,
+    2432, 0x200, 2433, 0,
+    2434, 0x100, 2435, 0,
+    2436, 0x80, 2437, 0,
+    1928, 0x40, 2438, 0,
+    2442, 0x8, 2443, 0,
+    2448, 0x1, 308, 0,
+    1656, 0xFFFFF, 1656, 0,
+    2457, 0x10, 2457, 2,
+    2459, 0x8, 2460, 2,
+    2461, 0x4, 2462, 2,
+    2463, 0x2, 2464, 2,
+    2467, 0x8000000, 2467, 1,
+    2468, 0x4000000, 2468, 1,
+    2470, 0x1000000, 2470, 1,
+    2471, 0x800000, 2471, 1,
+    2472, 0x400000, 2472, 1,
+    2473, 0x200000, 2473, 1,
+    1207, 0x100000, 1207, 1,
+    2474, 0x80000, 2474, 1,
+    2475, 0x40000, 2475, 1,
+    2476, 0x20000, 2476, 1,
+    163, 0x10000, 163, 1,
+    2482, 0x400, 2482, 1,
+    2483, 0x200, 2483, 1,
+    191, 0x80, 191, 1,
+    179, 0x40, 179, 1,
+    187, 0x20, 187, 1,
+    2485, 0x10, 2485, 1,
+    2486, 0x8, 2486, 1,
+    2487, 0x4, 2487, 1,
+    2488, 0x2, 2488, 1,
+    66, 0x1, 66, 1,
+    2489, 0x100000, 2490, 2,
+    2491, 0x20000, 2492, 2,
+    2498, 0x200, 2499, 2,
+    2503, 0x40, 2504, 2,
+    2506, 0x10, 2507, 2,
+    2508, 0x8, 2509, 2,
+    2510, 0x4, 2511, 2,
+    2512, 0x2, 2513, 2,
+    2514, 0x1, 2515, 2,
+    2538, 0x8000, 2539, 0,
+    2540, 0x4000, 2541, 0,
+    714, 0x2000, 2542, 0,
+    2543, 0x1000, 2544, 0,
+    2545, 0x800, 2546, 0,
+    2547, 0x400, 2548, 0,
+    2549, 0x200, 2550, 0,
+    2551, 0x100, 2552, 0,
+    2553, 0x80, 2554, 0,
+    2555, 0x40, 2556, 0,
+    1598, 0x38, 2557, 0,
+    2558, 0x4, 2559, 0,
+    2393, 0x2, 2394, 0,
+    2395, 0x1, 2396, 0,
+    88, 0x1, 2560, 0,
+    86, 0x2, 2561, 0,
+    2562, 0x4, 2563, 0,
+    2564, 0x8, 2565, 0,
+    2566, 0x10, 2554, 0,
+    80, 0x20, 308, 0,
+    2350, 0x40, 2567, 0,
+    2347, 0x80, 2568, 0,
+    2569, 0xF00, 2570, 0,
+    2571, 0x1000, 2572, 0,
+    2573, 0x2000, 2574, 0,
+    2575, 0x4000, 2576, 0,
+    187, 0x1, 2577, 1,
+    191, 0x2, 2578, 1,
+    2579, 0x10, 2580, 0,
+    2581, 0x20, 2582, 1,
+    171, 0x40, 2583, 1,
+    290, 0x80, 2584, 1,
+    2585, 0x100, 2586, 1,
+    2587, 0x600, 2588, 1,
+    2589, 0x1800, 2590, 1,
+    0, 0xFFFF, 16, 0,
+    2591, 0xFFFF, 2592, 0,
+    2593, 0xFFFF, 2594, 1,
+    2595, 0xFFFF, 2596, 1,
+    2597, 0x1, 2597, 0,
+    2598, 0x6, 2598, 0,
+    2278, 0x8, 2278, 0,
+    2599, 0x30, 2599, 0,
+    2600, 0x80, 2600, 0,
+    2601, 0x300, 2601, 0,
+    2602, 0x400, 2602, 0,
+    2603, 0x800, 2603, 0,
+    2604, 0xFF, 2604, 0,
+    2605, 0x100, 2605, 0,
+    2606, 0x200, 2606, 0,
+    2620, 0x1, 2621, 0,
+    2622, 0x2, 2623, 0,
+    2624, 0x4, 2625, 0,
+    2626, 0x8, 2627, 0,
+    2628, 0x10, 2629, 0,
+    2630, 0x20, 2631, 0,
+    2632, 0x40, 2633, 0,
+    2634, 0x80, 2635, 0,
+    2636, 0x100, 2637, 0,
+    2638, 0x200, 2639, 0,
+    2640, 0x400, 2641, 0,
+    2642, 0x800, 2643, 0,
+    2644, 0x1000, 2645, 0,
+    2646, 0x2000, 2647, 0,
+    2648, 0x4000, 2649, 0,
+    2650, 0x8000, 2651, 0,
+    2652, 0x10000, 2653, 0,
+    2654, 0x20000, 2655, 0,
+    2656, 0x40000, 2657, 0,
+    2658, 0x80000, 2659, 0,
+    2660, 0x100000, 2661, 0,
+    2662, 0x200000, 2663, 0,
+    2664, 0x400000, 2665, 0,
+    2666, 0x800000, 2667, 0,
+    2668, 0x1000000, 2669, 0,
+    2670, 0x2000000, 2671, 0,
+    2672, 0x4000000, 2673, 0,
+    2674, 0x8000000, 2675, 0,
+    2676, 0x10000000, 2677, 0,
+    2678, 0x20000000, 2679, 0,
+    2680, 0x40000000, 2681, 0,
+    2682, 0x80000000, 2683, 0,
+    2686, 0x1, 2687, 0,
+    2688, 0x2, 2689, 0,
+    2690, 0x4, 2691, 0,
+    2692, 0x8, 2693, 0,
+    2694, 0x10, 2695, 0,
+    2696, 0x20, 2697, 0,
+    2698, 0x40, 2699, 0,
+    2700, 0x80, 2701, 0,
+    2702, 0x100, 2703, 0,
+    2704, 0x200, 2705, 0,
+    2706, 0x400, 2707, 0,
+    2708, 0x800, 2709, 0,
+    2710, 0x1000, 2711, 0,
+    2712, 0x2000, 2713, 0,
+    2714, 0x4000, 2715, 0,
+    2716, 0x8000, 2717, 0,
+    2718, 0x10000, 2719, 0,
+    2720, 0x20000, 2721, 0,
+    2722, 0x40000, 2723, 0,
+    2724, 0x80000, 2725, 0,
+    2726, 0x100000, 2727, 0,
+    2728, 0x200000, 2729, 0,
+    2730, 0x400000, 2731, 0,
+    2732, 0x800000, 2733, 0,
+    2734, 0x1000000, 2735, 0,
+    2736, 0x2000000, 2737, 0,
+    2738, 0x4000000, 2739, 0,
+    2740, 0x8000000, 2741, 0,
+    2742, 0x10000000, 2743, 0,
+    2744, 0x20000000, 2745, 0,
+    2746, 0x40000000, 2747, 0,
+    2748, 0x80000000, 2749, 0,
+    2752, 0x1, 2753, 0,
+    2754, 0x2, 2755, 0,
+    2756, 0x4, 2757, 0,
+    2758, 0x8, 2759, 0,
+    2760, 0x10, 2761, 0,
+    2762, 0x20, 2763, 0,
+    2764, 0x40, 2765, 0,
+    2766, 0x80, 2767, 0,
+    2768, 0x100, 2769, 0,
+    2770, 0x200, 2771, 0,
+    2772, 0x400, 2773, 0,
+    2774, 0x800, 2775, 0,
+    2776, 0x1000, 2777, 0,
+    2778, 0x2000, 2779, 0,
+    2780, 0x4000, 2781, 0,
+    2782, 0x8000, 2783, 0,
+    2784, 0x10000, 2785, 0,
+    2786, 0x40000, 2787, 0,
+    2788, 0x80000, 2789, 0,
+    2790, 0x100000, 2791, 0,
+    2792, 0x200000, 2793, 0,
+    2794, 0x400000, 2795, 0,
+    2796, 0xE0000000, 2796, 0,
+    2797, 0x1, 2798, 0,
+    2799, 0x2, 2800, 0,
+    2801, 0x4, 2802, 0,
+    2803, 0x8, 2804, 0,
+    2805, 0x10, 2806, 0,
+    2807, 0x20, 2808, 0,
+    2809, 0x40, 2810, 0,
+    2811, 0x80, 2812, 0,
+    2813, 0x100, 2814, 0,
+    2815, 0x200, 2816, 0,
+    2817, 0x400, 2818, 0,
+    2819, 0x800, 2820, 0,
+    2821, 0x1000, 2822, 0,
+    2823, 0x2000, 2824, 0,
+    2825, 0x4000, 2826, 0,
+    2827, 0x8000, 2828, 0,
+    2829, 0x10000, 2830, 0,
+    2831, 0x40000, 2832, 0,
+    2833, 0x80000, 2834, 0,
+    2835, 0x100000, 2836, 0,
+    2837, 0x200000, 2838, 0,
+    2839, 0x400000, 2840, 0,
+    2843, 0x1, 2844, 0,
+    2845, 0x2, 2846, 0,
+    2847, 0x4, 2848, 0,
+    2849, 0x8, 2850, 0,
+    2851, 0x10, 2852, 0,
+    2853, 0x20, 2854, 0,
+    2855, 0x40, 2856, 0,
+    2857, 0x80, 2858, 0,
+    2859, 0x100, 2860, 0,
+    2861, 0x200, 2862, 0,
+    2863, 0x400, 2864, 0,
+    2865, 0x800, 2866, 0,
+    2867, 0x1000, 2868, 0,
+    2869, 0x2000, 2870, 0,
+    2871, 0x4000, 2872, 0,
+    2873, 0x8000, 2874, 0,
+    2875, 0x10000, 2876, 0,
+    2877, 0x40000, 2878, 0,
+    2879, 0x80000, 2880, 0,
+    2881, 0x100000, 2882, 0,
+    2883, 0x200000, 2884, 0,
+    2885, 0x400000, 2886, 0,
+    2889, 0x1, 2890, 0,
+    2891, 0x2, 2892, 0,
+    2893, 0x4, 2894, 0,
+    2895, 0x8, 2896, 0,
+    2897, 0x10, 2898, 0,
+    2899, 0x20, 2900, 0,
+    2901, 0x40, 2902, 0,
+    2903, 0x80, 2904, 0,
+    2905, 0x100, 2906, 0,
+    2907, 0x200, 2908, 0,
+    2909, 0x400, 2910, 0,
+    2911, 0x800, 2912, 0,
+    2913, 0x1000, 2914, 0,
+    2915, 0x2000, 2916, 0,
+    2917, 0x4000, 2918, 0,
+    2919, 0x8000, 2920, 0,
+    2921, 0x10000, 2922, 0,
+    2923, 0x20000, 2924, 0,
+    2925, 0x40000, 2926, 0,
+    2927, 0x80000, 2928, 0,
+    2929, 0x100000, 2930, 0,
+    2931, 0x200000, 2932, 0,
+    2933, 0x400000, 2934, 0,
+    2935, 0x20000000, 2936, 0,
+    2937, 0x40000000, 2938, 0,
+    2939, 0x80000000, 2940, 0,
+    2943, 0x1, 2944, 0,
+    2945, 0x2, 2946, 0,
+    2947, 0x4, 2948, 0,
+    2949, 0x8, 2950, 0,
+    2951, 0x10, 2952, 0,
+    2953, 0x20, 2954, 0,
+    2955, 0x40, 2956, 0,
+    2957, 0x80, 2958, 0,
+    2959, 0x100, 2960, 0,
+    2961, 0x200, 2962, 0,
+    2963, 0x400, 2964, 0,
+    2965, 0x800, 2966, 0,
+    2967, 0x1, 2968, 0,
+    2969, 0x2, 2970, 0,
+    2971, 0x4, 2972, 0,
+    2973, 0x8, 2974, 0,
+    2975, 0x10, 2976, 0,
+    2977, 0x20, 2978, 0,
+    2979, 0x40, 2980, 0,
+    2981, 0x80, 2982, 0,
+    2983, 0x100, 2984, 0,
+    2985, 0x1, 2986, 0,
+    2987, 0x2, 2986, 0,
+    2988, 0x40, 2989, 0,
+    2990, 0x80, 2991, 0,
+    2992, 0x100, 2993, 0,
+    2994, 0x200, 2995, 0,
+    2997, 0x8, 2998, 0,
+    2999, 0x10, 3000, 0,
+    3001, 0x20, 3002, 0,
+    3003, 0x40, 3004, 0,
+    3005, 0x8, 3006, 0,
+    3007, 0x10, 3008, 0,
+    3009, 0x20, 3010, 0,
+    3011, 0x40, 3012, 0,
+    3013, 0x8, 3014, 0,
+    3015, 0x10, 3016, 0,
+    3017, 0x20, 3018, 0,
+    3019, 0x40, 3020, 0,
+    3052, 0x400000, 3053, 0,
+    3054, 0x300000, 3055, 0,
+    3056, 0xF0000, 3057, 0,
+    3058, 0x7000, 3059, 0,
+    3060, 0xF00, 3061, 0,
+    3062, 0x70, 3063, 0,
+    3064, 0xF, 3065, 0,
+    3066, 0xF00000, 3067, 0,
+    3068, 0xF0000, 3069, 0,
+    3070, 0xE000, 3071, 0,
+    3072, 0x1000, 3073, 0,
+    3074, 0xF00, 3075, 0,
+    3076, 0x30, 3077, 0,
+    3078, 0xF, 3079, 0,
+    3080, 0xFFFF, 3081, 1,
+    3082, 0x1, 3083, 1,
+    3084, 0x2, 3085, 1,
+    3086, 0x4, 3087, 1,
+    3088, 0x8, 3089, 0,
+    3090, 0x10, 3091, 1,
+    3092, 0x20, 3093, 0,
+    3094, 0x40, 3095, 1,
+    20, 0x80, 3096, 0,
+    3097, 0x10000, 3098, 1,
+    3099, 0x7F0000, 3100, 0,
+    3101, 0x7FFF, 3102, 0,
+    3103, 0xFFFF, 3104, 0,
+    3105, 0x7, 3106, 0,
+    3107, 0x8, 3108, 0,
+    3109, 0x10, 3110, 0,
+    3111, 0x20, 3112, 0,
+    3113, 0x40, 3114, 0,
+    3115, 0x100, 3116, 0,
+    3117, 0x200, 3118, 0,
+    3119, 0x400, 3120, 0,
+    3121, 0x800, 3122, 0,
+    3123, 0x1000, 3124, 0,
+    3125, 0x2000, 3126, 0,
+    3127, 0x4000, 3128, 0,
+    3129, 0x8000, 3130, 0,
+    3131, 0x10000, 3132, 0,
+    3133, 0x20000, 3134, 0,
+    1837, 0x40000, 3135, 0,
+    3136, 0x80000, 3137, 0,
+    14, 0x100000, 3138, 0,
+    3139, 0x600000, 3140, 0,
+    3141, 0x800000, 3142, 0,
+    3143, 0x1000000, 3144, 0,
+    3145, 0x2000000, 3145, 0,
+    3146, 0x4000000, 3146, 0,
+    3147, 0x20000000, 3147, 0,
+    3148, 0x40000000, 3148, 0,
+    3149, 0x80000000, 3149, 0,
+    25, 0xFF, 3150, 2,
+    3151, 0x8000, 3152, 0,
+    3153, 0x4000, 3154, 0,
+    3155, 0x2000, 3156, 0,
+    3157, 0x1FF, 3158, 0,
+    3159, 0x80000000, 3160, 2,
+    3161, 0x7FFF, 3162, 2,
+    3064, 0xF, 3065, 1,
+    3062, 0x70, 3063, 1,
+    3060, 0xF00, 3061, 1,
+    3058, 0x7000, 3059, 1,
+    3056, 0xF0000, 3057, 1,
+    3054, 0x300000, 3055, 1,
+    3052, 0x400000, 3053, 1,
+    3070, 0xE000, 3071, 1,
+    3072, 0x1000, 3073, 1,
+    3074, 0xF00, 3075, 1,
+    3076, 0x30, 3077, 1,
+    3078, 0xF, 3079, 1,
+    3163, 0x80000000, 3164, 0,
+    3165, 0x40000000, 3166, 0,
+    3076, 0x30000000, 3077, 0,
+    3078, 0xF000000, 3167, 0,
+    3168, 0x800000, 3169, 0,
+    3052, 0x400000, 3053, 0,
+    3054, 0x300000, 3055, 0,
+    3056, 0xF0000, 3057, 0,
+    3170, 0x8000, 3171, 0,
+    3058, 0x7000, 3059, 0,
+    3060, 0xF00, 3061, 0,
+    3172, 0x80, 3173, 0,
+    3062, 0x70, 3063, 0,
+    3064, 0xF, 3065, 0,
+    3176, 0xF000000, 3177, 0,
+    3080, 0x7FFF, 3178, 0,
+    3163, 0x80000000, 3179, 0,
+    3165, 0x40000000, 3166, 0,
+    3076, 0x30000000, 3077, 0,
+    3078, 0xF000000, 3167, 0,
+    3168, 0x800000, 3180, 0,
+    3052, 0x400000, 3053, 0,
+    3054, 0x300000, 3055, 0,
+    3056, 0xF0000, 3057, 0,
+    3170, 0x8000, 3181, 0,
+    3058, 0x7000, 3059, 0,
+    3060, 0xF00, 3061, 0,
+    3172, 0x80, 3182, 0,
+    3062, 0x70, 3063, 0,
+    3064, 0xF, 3065, 0,
+    3183, 0x1, 3183, 1,
+    3184, 0x2, 3184, 1,
+    3185, 0x4, 3185, 1,
+    3186, 0x8, 3186, 1,
+    3187, 0x10, 3187, 1,
+    3188, 0x20, 3188, 1,
+    3189, 0x1, 3189, 1,
+    3190, 0x2, 3190, 1,
+    3191, 0x4, 3191, 1,
+    3192, 0x8, 3192, 1,
+    3193, 0x10, 3193, 1,
+    3194, 0x20, 3194, 1,
+    3195, 0x1, 3195, 2,
+    3196, 0x2, 3196, 2,
+    3197, 0x4, 3197, 2,
+    3198, 0x8, 3198, 2,
+    3199, 0x10, 3199, 2,
+    3200, 0x20, 3200, 2,
+    3234, 0x80000000, 3234, 1,
+    3235, 0x40000000, 3235, 1,
+    3236, 0x20000000, 3236, 1,
+    3237, 0x10000000, 3237, 1,
+    3238, 0x8000000, 3238, 1,
+    3239, 0x4000000, 3239, 1,
+    3240, 0x2000000, 3240, 1,
+    3241, 0x1000000, 3241, 1,
+    3242, 0x800000, 3242, 1,
+    3243, 0x400000, 3243, 1,
+    3244, 0x200000, 3244, 1,
+    3245, 0x100000, 3245, 1,
+    3246, 0x80000, 3246, 1,
+    3247, 0x40000, 3247, 1,
+    3248, 0x20000, 3248, 1,
+    3249, 0x10000, 3249, 1,
+    3250, 0x8000, 3250, 1,
+    3251, 0x4000, 3251, 1,
+    3252, 0x2000, 3252, 1,
+    3253, 0x1000, 3253, 1,
+    3254, 0x800, 3254, 1,
+    3255, 0x400, 3255, 1,
+    3256, 0x200, 3256, 1,
+    3257, 0x100, 3257, 1,
+    3258, 0x80, 3258, 1,
+    3259, 0x40, 3259, 1,
+    3260, 0x20, 3260, 1,
+    3261, 0x10, 3261, 1,
+    3262, 0x8, 3262, 1,
+    3263, 0x4, 3263, 1,
+    3264, 0x2, 3264, 1,
+    3265, 0x1, 3265, 1,
+    3234, 0x80000000, 3234, 2,
+    3235, 0x40000000, 3235, 2,
+    3236, 0x20000000, 3236, 2,
+    3237, 0x10000000, 3237, 2,
+    3238, 0x8000000, 3238, 2,
+    3239, 0x4000000, 3239, 2,
+    3240, 0x2000000, 3240, 2,
+    3241, 0x1000000, 3241, 2,
+    3242, 0x800000, 3242, 2,
+    3243, 0x400000, 3243, 2,
+    3244, 0x200000, 3244, 2,
+    3245, 0x100000, 3245, 2,
+    3246, 0x80000, 3246, 2,
+    3247, 0x40000, 3247, 2,
+    3248, 0x20000, 3248, 2,
+    3249, 0x10000, 3249, 2,
+    3250, 0x8000, 3250, 2,
+    3251, 0x4000, 3251, 2,
+    3252, 0x2000, 3252, 2,
+    3253, 0x1000, 3253, 2,
+    3254, 0x800, 3254, 2,
+    3255, 0x400, 3255, 2,
+    3256, 0x200, 3256, 2,
+    3257, 0x100, 3257, 2,
+    3258, 0x80, 3258, 2,
+    3259, 0x40, 3259, 2,
+    3260, 0x20, 3260, 2,
+    3261, 0x10, 3261, 2,
+    3262, 0x8, 3262, 2,
+    3263, 0x4, 3263, 2,
+    3264, 0x2, 3264, 2,
+    3265, 0x1, 3265, 2,
+    1378, 0x1, 3274, 0,
+    78, 0x2, 78, 0,
+    3275, 0x4, 3275, 0,
+    3276, 0x8, 3276, 0,
+    161, 0x10, 161, 0,
+    3277, 0x20, 3277, 0,
+    3278, 0x40, 3278, 0,
+    3279, 0x80, 3279, 0,
+    3280, 0x300, 3280, 0,
+    3281, 0xC00, 3281, 0,
+    3282, 0x3000, 3282, 0,
+    3283, 0x4000, 3283, 0,
+    3284, 0xFFFF, 3285, 0,
+    3286, 0xFFFFFFFF, 3287, 0,
+    3288, 0xFFFFFFFF, 3289, 0,
+    3338, 0x7F, 3339, 0,
+    3340, 0x100, 3341, 0,
+    3342, 0x200, 3343, 0,
+    3344, 0x10000, 3345, 0,
+    3346, 0x60000, 3347, 0,
+    3348, 0xF80000, 3349, 0,
+    3350, 0x1F000000, 3351, 0,
+    3352, 0x1F, 3353, 0,
+    3354, 0x100, 3355, 0,
+    3356, 0x10000, 3357, 0,
+    3358, 0x60000, 3359, 0,
+    3360, 0xF80000, 3361, 0,
+    3362, 0xF, 3363, 1,
+    3364, 0xF, 3365, 2,
+    3366, 0xFFFF, 3367, 1,
+    3368, 0xFFFF, 3369, 2,
+    3402, 0x7, 3403, 0,
+    3404, 0x100, 3405, 0,
+    3406, 0x100, 3406, 0,
+    3407, 0x200, 3408, 0,
+    3409, 0x10000, 3410, 0,
+    3411, 0x20000, 3410, 0,
+    3412, 0x40000, 3410, 0,
+    3413, 0x80000, 3410, 0,
+    3414, 0x100000, 3415, 0,
+    3416, 0x200000, 3415, 0,
+    3417, 0x400000, 3415, 0,
+    3418, 0x800000, 3415, 0,
+    3419, 0xFC000000, 3420, 0,
+    3425, 0xF000, 3426, 0,
+    3427, 0xF00, 3426, 0,
+    3428, 0xF0, 3426, 0,
+    3429, 0xF, 3426, 0,
+    3431, 0xF000, 3432, 0,
+    3433, 0xF00, 3432, 0,
+    3434, 0xF0, 3432, 0,
+    3435, 0xF, 3432, 0,
+    3436, 0xF000, 3437, 0,
+    3438, 0xF00, 3438, 0,
+    3439, 0xF0, 3437, 0,
+    3440, 0xF, 3437, 0,
+    3441, 0xF000, 3442, 0,
+    3443, 0xF00, 3442, 0,
+    3444, 0xF0, 3442, 0,
+    3445, 0xF, 3442, 0,
+    3446, 0x1, 3447, 0,
+    3448, 0x2, 3449, 1,
+    3450, 0x1, 3451, 0,
+    3452, 0x2, 3453, 0,
+    3454, 0x4, 3455, 0,
+    3456, 0x8, 3457, 0,
+    3458, 0x100, 3459, 0,
+    3460, 0x1, 3461, 0,
+    3462, 0x2, 3461, 0,
+    3463, 0x4, 3461, 0,
+    3464, 0x8, 3461, 0,
+    3465, 0x10, 3461, 0,
+    3466, 0x20, 3461, 0,
+    3467, 0x40, 3461, 0,
+    3468, 0x80, 3461, 0,
+    3469, 0x100, 3461, 0,
+    3470, 0x200, 3461, 0,
+    3471, 0x400, 3461, 0,
+    3472, 0x800, 3461, 0,
+    3473, 0x1000, 3461, 0,
+    3474, 0x2000, 3461, 0,
+    3475, 0x4000, 3461, 0,
+    3476, 0x8000, 3461, 0,
+    3477, 0x10000, 3461, 0,
+    3478, 0x20000, 3461, 0,
+    3479, 0x40000, 3461, 0,
+    3480, 0x80000, 3461, 0,
+    3481, 0x100000, 3461, 0,
+    3482, 0x200000, 3461, 0,
+    3483, 0x400000, 3461, 0,
+    3484, 0x800000, 3461, 0,
+    3485, 0x1000000, 3461, 0,
+    3486, 0x2000000, 3461, 0,
+    3487, 0x4000000, 3461, 0,
+    3488, 0x8000000, 3461, 0,
+    3489, 0x10000000, 3461, 0,
+    3490, 0x20000000, 3461, 0,
+    3491, 0x40000000, 3461, 0,
+    3492, 0x80000000, 3461, 0,
+    25, 0xFF, 3495, 2,
+    3521, 0x1, 3522, 0,
+    3523, 0x2, 3524, 0,
+    3525, 0x8, 3526, 1,
+    3527, 0x30, 3528, 0,
+    3529, 0x3F, 3530, 0,
+    1378, 0x1, 1378, 0,
+    3535, 0x70, 3535, 0,
+    3536, 0x100, 3536, 0,
+    14, 0x8000, 14, 0,
+    3537, 0x70000, 3537, 0,
+    3538, 0x380000, 3538, 0,
+    3539, 0x400000, 3539, 0,
+    3540, 0x800000, 3540, 0,
+    3541, 0x40000000, 3541, 1,
+    316, 0x80000000, 316, 0,
+    3551, 0x1, 3552, 0,
+    3553, 0x2, 3553, 0,
+    3554, 0xC, 3554, 0,
+    3555, 0x10, 3555, 0,
+    3556, 0x60, 3556, 0,
+    3557, 0x80, 3557, 0,
+    3558, 0x100, 3558, 0,
+    3559, 0x800, 3559, 0,
+    3560, 0x3000, 3560, 0,
+    3561, 0x7C000, 3561, 0,
+    3562, 0xF80000, 3562, 0,
+    3563, 0x1F000000, 3563, 0,
+    3564, 0x40000000, 3564, 0,
+    316, 0x80000000, 316, 0,
+    3565, 0x1, 3565, 0,
+    3566, 0x6, 3566, 0,
+    3567, 0x8, 3567, 0,
+    3568, 0x10, 3568, 0,
+    3569, 0x20, 3569, 0,
+    316, 0x80000000, 316, 0,
+    3585, 0x1, 3586, 0,
+    3587, 0x2, 3588, 0,
+    3589, 0x3C, 3590, 0,
+    3591, 0xC0, 3592, 0,
+    3593, 0xF00, 3594, 0,
+    3595, 0x1000, 3596, 0,
+    3597, 0x2000, 3598, 0,
+    3599, 0x4000, 3600, 0,
+    3601, 0x10000, 3602, 0,
+    3603, 0x20000, 3604, 0,
+    3605, 0x3C0000, 3606, 0,
+    3607, 0xC00000, 3608, 0,
+    3609, 0xF000000, 3610, 0,
+    3611, 0x10000000, 3612, 0,
+    3613, 0x20000000, 3614, 0,
+    3615, 0x40000000, 3616, 0,
+    3629, 0x1, 3630, 2,
+    3631, 0x2, 3632, 2,
+    3633, 0x10000, 3634, 2,
+    3635, 0x20000, 3636, 2,
+    3641, 0xFFF, 3642, 0,
+    3643, 0xFFF0000, 3644, 0,
+    3641, 0xFFF0, 3645, 0,
+    3643, 0xFFF00000, 3646, 0,
+    3641, 0xFF, 3647, 0,
+    3643, 0xFF00, 3648, 0,
+    3649, 0xFFF, 3650, 0,
+    3651, 0xFFF0000, 3652, 0,
+    3649, 0xFFF0, 3653, 0,
+    3651, 0xFFF00000, 3654, 0,
+    3649, 0xFF, 3655, 0,
+    3651, 0xFF00, 3656, 0,
+    3641, 0xFFF, 3642, 0,
+    3649, 0xFFF0000, 3650, 0,
+    3641, 0xFFF0, 3645, 0,
+    3649, 0xFFF00000, 3659, 0,
+    3641, 0xFF, 3647, 0,
+    3649, 0xFF00, 3655, 0,
+    3660, 0xFFF, 3661, 1,
+    3662, 0xFFF0000, 3663, 1,
+    3664, 0xFFF, 3665, 1,
+    3666, 0xFFF0000, 3667, 1,
+    3668, 0x800, 3669, 0,
+    3670, 0x1000, 3671, 0,
+    3672, 0x2000, 3673, 0,
+    3674, 0x4000, 3675, 1,
+    3676, 0x8000, 3677, 1,
+    3678, 0x8000000, 3679, 0,
+    3680, 0x10000000, 3681, 0,
+    3682, 0x20000000, 3683, 0,
+    3684, 0x40000000, 3685, 1,
+    3686, 0x80000000, 3687, 1,
+    3698, 0x1F, 3699, 0,
+    3700, 0x1F0000, 3701, 0,
+    3704, 0x7, 3705, 0,
+    3706, 0x100, 3707, 0,
+    3708, 0x200, 3709, 0,
+    3710, 0xC000, 3711, 0,
+    3712, 0x70000, 3713, 0,
+    3714, 0x1000000, 3715, 0,
+    3716, 0x2000000, 3717, 0,
+    3723, 0x3FF, 3724, 0,
+    3725, 0x3FF, 3726, 0,
+    3727, 0x3FF, 3728, 0,
+    3729, 0x3FF0000, 3730, 0,
+    3733, 0xFF, 3734, 0,
+    3735, 0xFF0000, 3736, 0,
+    3739, 0xFFF, 3740, 0,
+    3741, 0x1000, 3742, 0,
+    3743, 0xFFFF0000, 3744, 0,
+    3745, 0xFFF, 3746, 0,
+    3747, 0x1000, 3748, 0,
+    3749, 0xFFFF0000, 3750, 0,
+    3751, 0xF, 3752, 0,
+    3753, 0xF00, 3754, 0,
+    3755, 0xF0000, 3752, 0,
+    3756, 0xF000000, 3757, 0,
+    3821, 0x400, 3821, 0,
+    3822, 0x200, 3822, 0,
+    3823, 0x100, 3823, 0,
+    3824, 0x80, 3824, 0,
+    3825, 0x40, 3825, 0,
+    3826, 0x20, 3826, 0,
+    171, 0x10, 171, 0,
+    3827, 0x8, 3827, 0,
+    3828, 0x4, 3828, 0,
+    3829, 0x2, 3829, 0,
+    3830, 0x1, 3830, 0,
+    3833, 0x400, 3833, 0,
+    3834, 0x200, 3834, 0,
+    3835, 0x100, 3835, 0,
+    3836, 0x80, 3836, 0,
+    3837, 0x40, 3837, 0,
+    3838, 0x20, 3838, 0,
+    3839, 0x10, 3839, 0,
+    3840, 0x8, 3840, 0,
+    3841, 0x4, 3841, 0,
+    3842, 0x2, 3842, 0,
+    3843, 0x1, 3843, 0,
+    3846, 0x80000000, 3846, 0,
+    3847, 0x40000000, 3847, 0,
+    3848, 0x20000000, 3848, 0,
+    3849, 0x10000000, 3849, 0,
+    3850, 0x20, 3850, 0,
+    3851, 0x10, 3851, 0,
+    3852, 0x8, 3852, 0,
+    3853, 0x4, 3853, 0,
+    3854, 0x2, 3854, 0,
+    3855, 0x1, 3855, 0,
+    3856, 0x80000000, 3857, 0,
+    3858, 0x7C000000, 3859, 0,
+    3860, 0x2000000, 3860, 0,
+    3861, 0x1000000, 3861, 0,
+    3862, 0x800000, 3862, 0,
+    3863, 0x400000, 3863, 0,
+    3864, 0x200000, 3864, 0,
+    3865, 0x100000, 3865, 0,
+    3866, 0xE0000, 3866, 0,
+    3867, 0x10000, 3867, 0,
+    3868, 0x8000, 3868, 0,
+    3869, 0x4000, 3869, 0,
+    3870, 0x2000, 3870, 0,
+    3871, 0x1000, 3871, 0,
+    3872, 0xC00, 3872, 0,
+    3873, 0x3E0, 3874, 0,
+    3875, 0x18, 3875, 0,
+    3876, 0x2, 3876, 0,
+    716, 0x1, 716, 0,
+    3877, 0x8000000, 3877, 0,
+    3878, 0x4000000, 3878, 0,
+    3637, 0x2000000, 3637, 0,
+    3879, 0x10000, 3879, 0,
+    3880, 0x400, 3872, 0,
+    3881, 0x200, 3882, 0,
+    3883, 0x1E0, 3868, 0,
+    3884, 0x1C, 3875, 0,
+    3885, 0x2, 3876, 0,
+    3886, 0x1, 716, 0,
+    3887, 0x38000000, 3887, 0,
+    3888, 0x7000000, 3888, 0,
+    3889, 0xE00000, 3889, 0,
+    3890, 0x1C0000, 3890, 0,
+    3891, 0x38000, 3891, 0,
+    3892, 0x7000, 3892, 0,
+    3893, 0xE00, 3893, 0,
+    3894, 0x1C0, 3894, 0,
+    3895, 0x38, 3895, 0,
+    3896, 0x80000000, 3897, 0,
+    3898, 0x7, 3898, 0,
+    3901, 0x7000000, 3901, 0,
+    3902, 0xE00000, 3902, 0,
+    3903, 0x1C0000, 3903, 0,
+    3904, 0x38000, 3904, 0,
+    3905, 0x7000, 3905, 0,
+    3906, 0xE00, 3906, 0,
+    3907, 0x1C0, 3907, 0,
+    3908, 0x38, 3908, 0,
+    3909, 0x7, 3909, 0,
+    3910, 0xFFF0000, 3910, 0,
+    3911, 0x7000, 3911, 0,
+    3912, 0xFFF, 3912, 0,
+    3913, 0xFF0000, 3913, 0,
+    3914, 0xFF, 3914, 0,
+    3915, 0xFF0000, 3915, 0,
+    3916, 0xFF, 3916, 0,
+    3917, 0x1F000000, 3917, 0,
+    3918, 0x7C0000, 3918, 0,
+    3919, 0x1F000, 3919, 0,
+    3920, 0x7C0, 3920, 0,
+    3921, 0xF, 3922, 0,
+    3925, 0x1F000000, 3925, 0,
+    3926, 0x7C0000, 3926, 0,
+    3927, 0x1F000, 3927, 0,
+    3928, 0x7C0, 3928, 0,
+    3929, 0x1F, 3929, 0,
+    3930, 0x1F000000, 3930, 0,
+    3931, 0x7C0000, 3931, 0,
+    3932, 0x1F000, 3932, 0,
+    3933, 0x7C0, 3933, 0,
+    3934, 0x1F, 3934, 0,
+    3935, 0x7C0, 3935, 0,
+    3936, 0x1F, 3936, 0,
+    3937, 0xFFFF, 3938, 1,
+    3939, 0xF8000000, 3939, 0,
+    3940, 0x3E00000, 3940, 0,
+    3941, 0xF8000, 3941, 0,
+    3942, 0x3E00, 3942, 0,
+    3943, 0x180, 3943, 0,
+    3944, 0x7C, 3944, 0,
+    3945, 0x3, 3945, 0,
+    3948, 0x80000000, 3948, 0,
+    3949, 0x7C000000, 3949, 0,
+    3950, 0x2000000, 3950, 0,
+    3951, 0x1000000, 3951, 0,
+    3952, 0xFFF, 3952, 0,
+    3953, 0xFFFF, 3953, 1,
+    3954, 0xFFFF, 3954, 1,
+    3955, 0xFFFF, 3955, 1,
+    3956, 0xFFFF, 3956, 1,
+    3957, 0x7FFFF, 3957, 0,
+    3958, 0x7FFFF, 3958, 0,
+    3959, 0x1, 3960, 1,
+    3961, 0x7FFFE, 3962, 0,
+    3963, 0x7F0000, 3963, 0,
+    3964, 0x7F, 3964, 0,
+    3965, 0x3FFF, 3965, 0,
+    4028, 0x1, 4028, 1,
+    4029, 0x2, 4029, 1,
+    4030, 0x4, 4030, 1,
+    4031, 0x8, 4031, 1,
+    4032, 0x10, 4032, 1,
+    4033, 0x20, 4033, 1,
+    4034, 0x40, 4034, 1,
+    4035, 0x80, 4035, 1,
+    4036, 0x100, 4036, 1,
+    4037, 0x200, 4037, 1,
+    4038, 0x400, 4038, 1,
+    4039, 0x10000, 4039, 1,
+    4040, 0x20000, 4040, 1,
+    4041, 0x40000, 4042, 1,
+    4043, 0x80000, 4044, 1,
+    4045, 0x100000, 4046, 1,
+    4047, 0x200000, 4048, 1,
+    4049, 0x400000, 4050, 1,
+    4051, 0x800000, 4052, 1,
+    4053, 0x1000000, 4054, 1,
+    4055, 0x2000000, 4056, 1,
+    4057, 0x4000000, 4058, 1,
+    4063, 0x1F, 4064, 0,
+    4065, 0xF00, 4066, 0,
+    3876, 0x2000, 4067, 0,
+    4068, 0xC000, 4069, 0,
+    4070, 0x30000, 4071, 0,
+    4072, 0x400000, 4073, 0,
+    4074, 0x800000, 4075, 0,
+    4076, 0x1000000, 4077, 0,
+    147, 0x3C0000, 4078, 0,
+    4079, 0xFFFF0000, 4080, 1,
+    4081, 0xFFFF, 4082, 1,
+    4089, 0xFF, 4089, 0,
+    4090, 0xFF00, 4090, 0,
+    4091, 0x3000000, 4091, 0,
+    4092, 0xFF, 4089, 0,
+    4093, 0xFF00, 4090, 0,
+    4094, 0xFF, 4089, 0,
+    4095, 0xFF00, 4090, 0,
+    4096, 0x3000000, 4096, 0,
+    118, 0x80000000, 118, 0,
+    4097, 0x7F000000, 4097, 0,
+    4098, 0xFF0000, 4098, 0,
+    4099, 0xFF00, 4099, 0,
+    4100, 0xFF, 4100, 0,
+    10, 0x10000, 10, 0,
+    4101, 0x8000, 4101, 0,
+    4102, 0x200, 4102, 0,
+    4103, 0x100, 4103, 0,
+    4104, 0x10, 4104, 0,
+    4105, 0x8, 4105, 0,
+    4106, 0x4, 4106, 0,
+    4107, 0x2, 4107, 0,
+    4108, 0x1, 4108, 0,
+    4109, 0x1, 4109, 1,
+    4110, 0x2, 4110, 1,
+    4111, 0x100, 4111, 1,
+    4112, 0x200, 4112, 1,
+    4113, 0x400, 4113, 1,
+    4114, 0xFFFF, 4114, 2,
+    3937, 0xFFFF, 3937, 1,
+    4097, 0xF, 4097, 0,
+    4131, 0xF0, 4131, 0,
+    4132, 0x700, 4132, 0,
+    4133, 0x10000, 4133, 0,
+    4103, 0x20000, 4103, 0,
+    4102, 0x40000, 4102, 0,
+    4134, 0x80000, 4134, 0,
+    4135, 0x100000, 4135, 0,
+    4136, 0x200000, 4136, 0,
+    4137, 0x400000, 4137, 0,
+    4138, 0x80000000, 4138, 0,
+    4139, 0xFFFFFFFF, 4139, 0,
+    3875, 0xFFFFFFFF, 3875, 1,
+    4143, 0x8000000, 4143, 0,
+    4144, 0x4000000, 4144, 0,
+    4145, 0x3F00000, 4146, 0,
+    4147, 0x80000, 4148, 0,
+    716, 0x20000, 4149, 0,
+    4150, 0x10000, 4151, 0,
+    4152, 0x2000, 4153, 0,
+    4154, 0x1000, 4155, 0,
+    4156, 0xC00, 4157, 0,
+    4158, 0x200, 4159, 0,
+    2553, 0x100, 4160, 0,
+    2569, 0xE0, 2570, 0,
+    4161, 0xC, 4162, 0,
+    1374, 0x3, 4163, 0,
+    3549, 0xC000, 4164, 0,
+    4165, 0x2000, 4166, 0,
+    4167, 0x1F80, 4168, 0,
+    4169, 0x40, 4170, 0,
+    4171, 0x20, 4172, 0,
+    4173, 0x10, 4174, 0,
+    4175, 0x8, 4176, 0,
+    4177, 0x7, 4178, 0,
+    4179, 0x40000, 4180, 0,
+    4181, 0x20000, 4182, 0,
+    4183, 0x10000, 4184, 0,
+    4185, 0x7F00, 4186, 0,
+    4187, 0xFF, 4188, 0,
+    4189, 0xFFFF0000, 4190, 0,
+    4191, 0xF00, 4192, 0,
+    4193, 0xC0, 4194, 0,
+    4195, 0x1F, 4196, 0,
+    4197, 0x40, 4198, 0,
+    4199, 0x20, 4200, 0,
+    4201, 0x10, 4202, 0,
+    4203, 0x8, 4204, 0,
+    4205, 0x4, 4206, 0,
+    4207, 0x2, 4208, 0,
+    4209, 0x1, 4210, 0,
+    4211, 0x70000, 4212, 1,
+    4213, 0x40, 4214, 1,
+    4215, 0x20, 4216, 1,
+    4217, 0x10, 4218, 1,
+    4219, 0x8, 4220, 1,
+    4205, 0x4, 4221, 1,
+    4207, 0x2, 4222, 1,
+    4223, 0x1, 4224, 1,
+    4213, 0x40, 4225, 2,
+    4226, 0x20, 4227, 2,
+    4217, 0x10, 4228, 2,
+    4205, 0x4, 4229, 2,
+    4207, 0x2, 4230, 2,
+    4223, 0x1, 4231, 2,
+    4232, 0xFFFFFFFF, 4233, 0,
+    4143, 0x8000000, 4143, 0,
+    4144, 0x4000000, 4144, 0,
+    4145, 0x3F00000, 4146, 0,
+    4147, 0x80000, 4148, 0,
+    716, 0x20000, 4149, 0,
+    4234, 0x10000, 4235, 0,
+    4152, 0x2000, 4153, 0,
+    4154, 0x1000, 4155, 0,
+    4156, 0xC00, 4157, 0,
+    4158, 0x200, 4159, 0,
+    2553, 0x100, 4160, 0,
+    2569, 0xE0, 2570, 0,
+    4161, 0xC, 4162, 0,
+    1374, 0x3, 4163, 0,
+    4213, 0x40, 4198, 0,
+    4199, 0x20, 4200, 0,
+    4201, 0x10, 4202, 0,
+    4203, 0x8, 4204, 0,
+    4205, 0x4, 4206, 0,
+    4207, 0x2, 4208, 0,
+    4209, 0x1, 4210, 0,
+    4211, 0x70000, 4212, 0,
+    4213, 0x40, 4214, 0,
+    4215, 0x20, 4216, 0,
+    4217, 0x10, 4218, 0,
+    4219, 0x8, 4220, 0,
+    4205, 0x4, 4236, 0,
+    4207, 0x2, 4222, 0,
+    4223, 0x1, 4224, 0,
+    4213, 0x40, 4225, 0,
+    4226, 0x20, 4227, 0,
+    4217, 0x10, 4228, 0,
+    4205, 0x4, 4229, 0,
+    4207, 0x2, 4230, 0,
+    4223, 0x1, 4231, 0,
+    4237, 0x1, 4237, 0,
+    4238, 0x30, 4238, 0,
+    4239, 0x100, 4239, 0,
+    4240, 0x200, 4240, 0,
+    4241, 0x400, 4241, 0,
+    4242, 0x800, 4242, 0,
+    4245, 0x7, 4245, 0,
+    4246, 0x70, 4246, 0,
+    4247, 0x700, 4247, 0,
+    4248, 0x7000, 4248, 0,
+    4249, 0x70000, 4249, 0,
+    4250, 0x700000, 4250, 0,
+    4251, 0x7000000, 4251, 0,
+    4252, 0x70000000, 4252, 0,
+    4296, 0x1, 4296, 0,
+    4297, 0x2, 4297, 0,
+    4298, 0x4, 4297, 0,
+    4299, 0x40000, 4299, 0,
+    4300, 0x80000, 4300, 0,
+    4301, 0x100000, 4301, 0,
+    4302, 0x200000, 4302, 0,
+    4307, 0x1, 4307, 0,
+    4308, 0x2, 4308, 0,
+    4309, 0x4, 4309, 0,
+    4310, 0x10000, 4310, 0,
+    4311, 0x20000, 4311, 0,
+    4312, 0x40000, 4312, 0,
+    4313, 0x1000000, 4313, 0,
+    4314, 0x2000000, 4314, 0,
+    4315, 0x4000000, 4315, 0,
+    4322, 0x7, 4322, 0,
+    4323, 0x18, 4323, 0,
+    4324, 0x60, 4324, 0,
+    4325, 0x80, 4325, 0,
+    4326, 0x1, 4326, 0,
+    4327, 0x2, 4327, 0,
+    4328, 0x4, 4328, 0,
+    4329, 0x40000, 4329, 0,
+    4330, 0x80000, 4330, 0,
+    4331, 0x100000, 4331, 0,
+    4332, 0x200000, 4332, 0,
+    4337, 0x1, 4337, 1,
+    4338, 0x2, 4338, 1,
+    4339, 0x4, 4339, 1,
+    4340, 0x40000, 4340, 1,
+    4341, 0x80000, 4341, 1,
+    4342, 0x100000, 4342, 1,
+    4343, 0x200000, 4343, 1,
+    4348, 0x1, 4349, 1,
+    4350, 0x2, 4350, 1,
+    4351, 0x4, 4351, 1,
+    4352, 0x40000, 4352, 1,
+    4353, 0x80000, 4353, 1,
+    4354, 0x100000, 4354, 1,
+    4355, 0x200000, 4355, 1,
+    4360, 0x1, 4360, 0,
+    4361, 0x2, 4361, 0,
+    4362, 0x4, 4362, 0,
+    4363, 0x40000, 4363, 0,
+    4364, 0x80000, 4364, 0,
+    4365, 0x100000, 4365, 0,
+    4366, 0x200000, 4366, 0,
+    1837, 0xFFFFFFFF, 1837, 0,
+    4414, 0xFF, 4415, 1,
+    4416, 0xFF00, 4417, 1,
+    4418, 0xF0000, 4419, 1,
+    4420, 0xF00000, 4421, 1,
+    4422, 0xF000000, 4423, 1,
+    4424, 0xF0000000, 4425, 1,
+    4426, 0xFFFFFFFF, 4427, 1,
+    4428, 0xF, 4429, 0,
+    4430, 0xF0, 4431, 0,
+    4432, 0x1F00, 4433, 0,
+    4434, 0x1F0000, 4435, 0,
+    4436, 0x800000, 4437, 0,
+    4440, 0x10, 4441, 0,
+    4442, 0x60, 4443, 0,
+    4444, 0x80, 4445, 1,
+    4446, 0xFF, 4447, 0,
+    4448, 0xFF00, 4449, 1,
+    20, 0x1, 4450, 0,
+    1811, 0x2, 4451, 0,
+    4452, 0x4, 4453, 0,
+    4454, 0x8, 4455, 1,
+    1117, 0x10, 4456, 0,
+    4416, 0x20, 4457, 0,
+    4458, 0x40, 4459, 0,
+    4460, 0x80, 4461, 0,
+    4462, 0x100, 4463, 0,
+    4464, 0x200, 4465, 0,
+    4466, 0x1000, 4467, 0,
+    4468, 0x2000, 4469, 0,
+    4470, 0x4000, 4471, 0,
+    4472, 0x8000, 4473, 0,
+    4474, 0x7F, 4475, 0,
+    4476, 0xFF00, 4477, 0,
+    4478, 0x1FF0000, 4479, 0,
+    4480, 0xFE000000, 4481, 0,
+    4484, 0x3, 4485, 0,
+    4486, 0xF0000, 4487, 0,
+    4488, 0xFFFF, 4489, 0,
+    4490, 0x1, 4491, 0,
+    4492, 0x6, 4493, 0,
+    4494, 0xFFFF0000, 4495, 0,
+    4496, 0xFFFF, 4497, 0,
+    4498, 0xFF, 4499, 1,
+    4500, 0x7F00, 4501, 1,
+    4502, 0x8000, 4503, 1,
+    4504, 0xFF0000, 4505, 0,
+    4506, 0x7, 4507, 0,
+    4508, 0x18, 4509, 1,
+    4510, 0x20, 4511, 1,
+    4512, 0x40, 4513, 1,
+    4514, 0x80, 4515, 1,
+    4516, 0x700, 4517, 0,
+    4518, 0x800, 4519, 0,
+    4520, 0x1000, 4521, 0,
+    4522, 0x2000, 4523, 0,
+    4524, 0x4000, 4525, 0,
+    4526, 0x7F0000, 4527, 1,
+    4528, 0x7F, 4529, 0,
+    4530, 0x7F00, 4531, 0,
+    4532, 0x1, 4533, 0,
+    4534, 0x2, 4535, 0,
+    4536, 0x4, 4537, 0,
+    4538, 0x8, 4539, 0,
+    4540, 0x10, 4541, 0,
+    4542, 0x20, 4543, 0,
+    4544, 0x40, 4545, 0,
+    179, 0x80, 4546, 0,
+    4547, 0x100, 4548, 0,
+    4549, 0x200, 4550, 0,
+    4551, 0x400, 4552, 0,
+    4553, 0x800, 4554, 0,
+    4555, 0x1000, 4556, 0,
+    4557, 0x2000, 4558, 0,
+    4559, 0x4000, 4560, 0,
+    4561, 0x8000, 4562, 0,
+    4563, 0x10000, 4564, 0,
+    4510, 0x20000, 4511, 0,
+    4512, 0x40000, 4565, 0,
+    4514, 0x80000, 4515, 0,
+    4566, 0x100000, 4567, 0,
+    4568, 0x200000, 4569, 0,
+    4570, 0x400000, 4571, 0,
+    4572, 0x800000, 4573, 0,
+    4580, 0x1, 4581, 0,
+    4582, 0x2, 4583, 0,
+    4584, 0x4, 4585, 0,
+    4586, 0x8, 4587, 0,
+    4588, 0x10, 4589, 0,
+    4590, 0x20, 4591, 0,
+    4592, 0x40, 4593, 0,
+    4594, 0x80, 4595, 0,
+    4596, 0x100, 4597, 0,
+    4598, 0x200, 4599, 0,
+    4600, 0x400, 4601, 0,
+    4602, 0x800, 4603, 0,
+    4604, 0x1000, 4605, 0,
+    4606, 0x2000, 4607, 0,
+    4608, 0x4000, 4609, 0,
+    4610, 0x8000, 4611, 0,
+    4612, 0x10000, 4613, 0,
+    4614, 0x20000, 4615, 0,
+    4616, 0x40000, 4617, 0,
+    4618, 0x80000, 4515, 0,
+    4619, 0x100000, 4620, 0,
+    4621, 0x200000, 4622, 0,
+    4623, 0x400000, 4624, 0,
+    4625, 0x800000, 4626, 0,
+    4633, 0x1, 4634, 0,
+    4635, 0x2, 4636, 0,
+    4637, 0x4, 4638, 0,
+    4639, 0x8, 4640, 0,
+    4641, 0x10, 4642, 0,
+    175, 0x20, 4643, 0,
+    4644, 0x40, 4645, 0,
+    4648, 0x1, 4649, 0,
+    4650, 0x2, 4651, 0,
+    4654, 0x1, 4655, 0,
+    4656, 0x2, 4657, 0,
+    4658, 0xC, 4659, 0,
+    4660, 0x30, 4661, 0,
+    4662, 0x100, 4663, 0,
+    4664, 0x200, 4665, 0,
+    4666, 0x1F0000, 4667, 0,
+    4668, 0xF000000, 4669, 0,
+    4672, 0x1FFFFFFF, 4673, 0,
+    4674, 0x7, 4675, 1,
+    4676, 0xC0, 4677, 1,
+    2142, 0x1F00, 4678, 1,
+    4679, 0x8000, 4680, 1,
+    4681, 0xF, 4682, 1,
+    4683, 0x300, 4684, 1,
+    4685, 0x30000, 4686, 1,
+    4687, 0x1000000, 4535, 1,
+    4536, 0x2000000, 4688, 1,
+    4689, 0x7, 4690, 0,
+    4691, 0xF, 4692, 1,
+    4693, 0x300, 4694, 1,
+    4695, 0x30000, 4696, 1,
+    4697, 0x1000000, 4541, 1,
+    4542, 0x2000000, 4698, 1,
+    4699, 0x7, 4700, 0,
+    4701, 0x1000000, 4702, 0,
+    4703, 0x7, 4704, 1,
+    4705, 0x300, 4706, 1,
+    4707, 0x30000, 4708, 1,
+    4709, 0x200000, 4710, 1,
+    4711, 0x7, 4712, 1,
+    4713, 0x7, 4714, 0,
+    18, 0x7, 4715, 0,
+    4716, 0x7, 4717, 1,
+    4718, 0x7, 4719, 1,
+    1717, 0x7, 4720, 0,
+    4721, 0x7, 4722, 0,
+    4723, 0x7, 4724, 1,
+    4725, 0x300, 4726, 1,
+    4727, 0x30000, 4728, 1,
+    4729, 0x1000000, 4730, 1,
+    4555, 0x2000000, 4731, 1,
+    4732, 0x3, 4733, 0,
+    4734, 0xF, 4735, 0,
+    4813, 0x3F, 4813, 0,
+    4814, 0x7C0, 4814, 0,
+    4815, 0xF800, 4815, 0,
+    4816, 0xE0000, 4816, 0,
+    4817, 0x1FF00000, 4817, 0,
+    86, 0x20000000, 86, 0,
+    88, 0x40000000, 88, 0,
+    4818, 0x80000000, 4818, 0,
+    4819, 0x1, 4819, 0,
+    4820, 0x2, 4820, 0,
+    4821, 0x4, 4821, 0,
+    94, 0x8, 94, 0,
+    4822, 0x3, 4822, 0,
+    4823, 0x4, 4823, 0,
+    4824, 0x8, 4824, 0,
+    4825, 0x10, 4825, 0,
+    4826, 0x20, 4826, 0,
+    4827, 0x40, 4827, 0,
+    4828, 0x180, 4828, 0,
+    4829, 0x200, 4829, 0,
+    4830, 0xC00, 4830, 0,
+    4831, 0x10000, 4831, 0,
+    4832, 0x20000, 4832, 0,
+    4833, 0x40000, 4833, 0,
+    4834, 0x100000, 4834, 0,
+    4835, 0x200000, 4835, 0,
+    4838, 0x1, 4838, 0,
+    4839, 0x2, 4839, 0,
+    4840, 0x4, 4840, 0,
+    4841, 0x8, 4841, 0,
+    4842, 0x10, 4842, 0,
+    4843, 0x20, 4843, 0,
+    4844, 0x40, 4844, 0,
+    2350, 0x100, 2350, 0,
+    4845, 0x200, 4845, 0,
+    4846, 0x400, 4846, 0,
+    4847, 0x800, 4847, 0,
+    4848, 0x1000, 4848, 0,
+    4849, 0x4000, 4849, 0,
+    4850, 0x8000, 4850, 0,
+    4851, 0x100000, 4851, 0,
+    189, 0x1, 189, 0,
+    4854, 0x2, 4854, 0,
+    4855, 0x4, 4855, 0,
+    4856, 0x8, 4856, 0,
+    4857, 0x10, 4857, 0,
+    4858, 0x20, 4858, 0,
+    4859, 0x40, 4859, 0,
+    187, 0x100, 187, 0,
+    4860, 0x200, 4860, 0,
+    4861, 0x400, 4861, 0,
+    4862, 0x800, 4862, 0,
+    4863, 0x1000, 4863, 0,
+    4864, 0x2000, 4864, 0,
+    4865, 0x4000, 4865, 0,
+    4866, 0x8000, 4866, 0,
+    4867, 0x30000, 4867, 0,
+    4868, 0xC0000, 4868, 0,
+    4869, 0x100000, 4869, 0,
+    4874, 0x2, 4874, 0,
+    4875, 0x4, 4875, 0,
+    4876, 0x8, 4876, 0,
+    4877, 0x10, 4877, 0,
+    4878, 0x20, 4878, 0,
+    4879, 0x40, 4879, 0,
+    4880, 0x200, 4880, 0,
+    4881, 0x400, 4881, 0,
+    4882, 0x800, 4882, 0,
+    4883, 0x1000, 4883, 0,
+    4884, 0x4000, 4884, 0,
+    4885, 0x8000, 4885, 0,
+    4886, 0x100000, 4886, 0,
+    4889, 0xFFFFF, 4889, 0,
+    4890, 0x3FF, 4890, 0,
+    215, 0xFF, 215, 0,
+    4891, 0x7, 4891, 1,
+    4892, 0x8, 4892, 1,
+    4893, 0x70, 4893, 1,
+    4894, 0x3FF, 4894, 1,
+    213, 0xFF, 213, 1,
+    4895, 0xFFFFF, 4895, 0,
+    4896, 0xFFFFF, 4896, 0,
+    4923, 0xF, 4923, 0,
+    4924, 0x30, 4924, 0,
+    4925, 0x40, 4925, 0,
+    4926, 0x80, 4926, 0,
+    4927, 0x100, 4927, 0,
+    4928, 0x600, 4928, 0,
+    4929, 0x800, 4929, 0,
+    4930, 0x3000, 4930, 0,
+    4931, 0x4000, 4931, 0,
+    4932, 0x8000, 4932, 0,
+    4933, 0x1, 4933, 0,
+    4934, 0x2, 4934, 0,
+    4935, 0x4, 4935, 0,
+    4936, 0x8, 4936, 0,
+    4937, 0x10, 4937, 0,
+    4938, 0x20, 4938, 0,
+    4939, 0x80, 4939, 0,
+    4940, 0x100, 4940, 0,
+    4941, 0x200, 4941, 0,
+    4942, 0x400, 4942, 0,
+    4943, 0x800, 4943, 0,
+    4944, 0x1000, 4944, 0,
+    4945, 0x2000, 4945, 0,
+    4946, 0x4000, 4946, 0,
+    4947, 0x8000, 4947, 0,
+    4948, 0xF, 4948, 0,
+    161, 0x10, 161, 0,
+    4949, 0x80, 4949, 0,
+    4950, 0x100, 4950, 0,
+    3366, 0x200, 3366, 0,
+    10, 0x400, 10, 0,
+    1406, 0x800, 1406, 0,
+    4951, 0x1000, 4951, 0,
+    4952, 0x2000, 4952, 0,
+    4953, 0x4000, 4953, 0,
+    4954, 0x8000, 4954, 0,
+    4955, 0x7FF, 4955, 1,
+    4956, 0x1800, 4956, 1,
+    1618, 0x2000, 1618, 1,
+    4957, 0x4000, 4957, 1,
+    4958, 0x8000, 4958, 1,
+    4959, 0x7F, 4959, 0,
+    4960, 0x80, 4960, 0,
+    4961, 0xFFF8, 4961, 0,
+    4983, 0x1, 4984, 0,
+    4985, 0x2, 4986, 0,
+    80, 0x4, 4987, 0,
+    4988, 0x8, 4989, 0,
+    1666, 0x20, 4990, 0,
+    4991, 0x40, 4992, 0,
+    4993, 0x80, 4994, 0,
+    3529, 0x7F00, 4995, 0,
+    110, 0xFFFF, 4996, 0,
+    4997, 0xFF0000, 4998, 0,
+    4999, 0x7000000, 5000, 0,
+    5001, 0x30000000, 5002, 0,
+    5003, 0x80000000, 5004, 0,
+    5005, 0x1, 5006, 1,
+    5007, 0x2, 5008, 1,
+    5009, 0x4, 5010, 1,
+    5011, 0x8, 5012, 1,
+    5013, 0x100, 5014, 1,
+    5015, 0x200, 5016, 1,
+    5017, 0x400, 5018, 1,
+    5019, 0x8000, 5020, 1,
+    5021, 0xFFFF0000, 5022, 1,
+    5023, 0x1, 5024, 0,
+    5025, 0x2, 5026, 0,
+    1368, 0x4, 5027, 0,
+    5028, 0x8, 5029, 0,
+])
+
+# attribute, name pattern
+_subscriptor_rows = _array("L", [
+    239, 240,
+    355, 356,
+    434, 435,
+    436, 437,
+    455, 456,
+    436, 437,
+    504, 505,
+    585, 586,
+    617, 618,
+    662, 663,
+    664, 665,
+    666, 667,
+    668, 669,
+    670, 671,
+    662, 663,
+    716, 717,
+    748, 749,
+    798, 799,
+    800, 801,
+    802, 803,
+    804, 805,
+    806, 807,
+    802, 803,
+    854, 855,
+    884, 885,
+    934, 935,
+    936, 937,
+    938, 939,
+    940, 941,
+    942, 943,
+    936, 937,
+    1006, 1007,
+    1008, 1009,
+    1010, 1011,
+    1122, 1123,
+    1124, 1125,
+    1126, 1127,
+    1128, 1129,
+    1130, 1131,
+    1132, 1133,
+    1153, 1154,
+    1175, 1176,
+    1191, 1192,
+    1207, 1208,
+    1221, 1222,
+    1235, 1236,
+    1254, 1255,
+    1272, 1273,
+    1254, 1255,
+    1272, 1273,
+    1254, 1255,
+    1272, 1273,
+    1254, 1255,
+    1272, 1273,
+    1254, 1255,
+    1272, 1273,
+    1254, 1255,
+    1272, 1273,
+    1254, 1255,
+    1272, 1273,
+    44, 1334,
+    1445, 1446,
+    265, 1447,
+    1448, 1449,
+    1469, 1470,
+    1487, 1488,
+    1505, 1506,
+    1523, 1524,
+    2, 1542,
+    1560, 1561,
+    1596, 1597,
+    1598, 1599,
+    1618, 1619,
+    1629, 1630,
+    1640, 1641,
+    1598, 1599,
+    1697, 1698,
+    1727, 1728,
+    1729, 1730,
+    1747, 1748,
+    1749, 1750,
+    1763, 1764,
+    1778, 1779,
+    1780, 1781,
+    1782, 1783,
+    1784, 1785,
+    1784, 1785,
+    1792, 1793,
+    1794, 1795,
+    1809, 1810,
+    1811, 1812,
+    1813, 1814,
+    1856, 1857,
+    1884, 1885,
+    1886, 1887,
+    1778, 1779,
+    1792, 1793,
+    1794, 1795,
+    1780, 1781,
+    1782, 1783,
+    1784, 1785,
+    1932, 1933,
+    1934, 1935,
+    1932, 1933,
+    1962, 1963,
+    1697, 1698,
+    1727, 1728,
+    1729, 1730,
+    1747, 1748,
+    1749, 1750,
+    1763, 1764,
+    1778, 1779,
+    2033, 2034,
+    1780, 1781,
+    1782, 1783,
+    1784, 1785,
+    1784, 1785,
+    1792, 1793,
+    1778, 1779,
+    2033, 2034,
+    1780, 1781,
+    1782, 1783,
+    1784, 1785,
+    1784, 1785,
+    1792, 1793,
+    1794, 1795,
+    1809, 1810,
+    1811, 1812,
+    2092, 2093,
+    1813, 1814,
+    2113, 2114,
+    1778, 1779,
+    1780, 1781,
+    1782, 1783,
+    2033, 2034,
+    1856, 1857,
+    1884, 1885,
+    1886, 1887,
+    2180, 2181,
+    2182, 2183,
+    1778, 1779,
+    1792, 1793,
+    2033, 2034,
+    1780, 1781,
+    1782, 1783,
+    1784, 1785,
+    1778, 1779,
+    1792, 1793,
+    1794, 1795,
+    2033, 2034,
+    1780, 1781,
+    1782, 1783,
+    1784, 1785,
+    1932, 1933,
+    1934, 1935,
+    2197, 2198,
+    2199, 2200,
+    2201, 2202,
+    1763, 1764,
+    1932, 1933,
+    1934, 1935,
+    2197, 2198,
+    2199, 2200,
+    2201, 2202,
+    2296, 2297,
+    2362, 2363,
+    2364, 2365,
+    2366, 2367,
+    2407, 2408,
+    2362, 2363,
+    2364, 2365,
+    2366, 2367,
+    2684, 2685,
+    2750, 2751,
+    2841, 2842,
+    2887, 2888,
+    2941, 2942,
+    2684, 2685,
+    2750, 2751,
+    2796, 2996,
+    2841, 2842,
+    2887, 2888,
+    2941, 2942,
+    3039, 3040,
+    3041, 3042,
+    27, 3043,
+    3044, 3045,
+    3046, 3047,
+    3048, 3049,
+    3174, 3175,
+    3174, 3175,
+    3266, 3267,
+    3268, 3269,
+    3270, 3271,
+    3272, 3273,
+    3266, 3267,
+    3268, 3269,
+    3270, 3271,
+    3272, 3273,
+    3329, 3330,
+    3331, 3332,
+    3333, 3334,
+    1934, 1935,
+    1934, 3398,
+    3399, 3400,
+    3421, 3422,
+    3423, 3424,
+    3050, 3430,
+    3050, 3430,
+    3050, 3430,
+    3050, 3430,
+    3493, 3494,
+    1067, 3516,
+    3517, 3518,
+    3547, 3548,
+    3579, 3580,
+    3581, 3582,
+    3617, 3618,
+    3619, 3620,
+    1378, 3621,
+    716, 3622,
+    1666, 3623,
+    2265, 3624,
+    3625, 3626,
+    3627, 3628,
+    3637, 3638,
+    3639, 3640,
+    3657, 3658,
+    3657, 3658,
+    3657, 3658,
+    3688, 3689,
+    3690, 3691,
+    3692, 3693,
+    3694, 3695,
+    3696, 3697,
+    3702, 3703,
+    3718, 3719,
+    1374, 3720,
+    3721, 3722,
+    3731, 3732,
+    3737, 3738,
+    3758, 3759,
+    3760, 3761,
+    3804, 3805,
+    3806, 3807,
+    3808, 3809,
+    3810, 3811,
+    3812, 3813,
+    3814, 3815,
+    3831, 3832,
+    3844, 3845,
+    3899, 3900,
+    3899, 3900,
+    3923, 3924,
+    3923, 3924,
+    3923, 3924,
+    3923, 3924,
+    3946, 3947,
+    4014, 4015,
+    4016, 4017,
+    4018, 4019,
+    4020, 4021,
+    4022, 4023,
+    3201, 4024,
+    4059, 4060,
+    4061, 4062,
+    4127, 4128,
+    4243, 4244,
+    4253, 4254,
+    4255, 4256,
+    373, 4291,
+    4292, 4293,
+    4303, 4304,
+    4305, 4306,
+    4316, 4317,
+    4318, 4319,
+    4320, 4321,
+    4333, 4334,
+    4335, 4336,
+    4344, 4345,
+    4346, 4347,
+    4356, 4357,
+    4358, 4359,
+    4367, 4368,
+    4369, 4370,
+    4410, 4411,
+    4438, 4439,
+    4482, 4483,
+    4574, 4575,
+    4576, 4577,
+    4578, 4579,
+    4627, 4628,
+    4629, 4630,
+    4631, 4632,
+    4646, 4647,
+    4652, 4653,
+    4670, 4671,
+    4807, 4808,
+    4809, 4810,
+    4836, 4837,
+    4852, 4853,
+    4870, 4871,
+    4872, 4873,
+    4887, 4888,
+    4918, 4919,
+    4920, 4921,
+    4980, 4981,
+])
+
+_db = RegisterDB(_strings, _peripheral_rows, _register_layouts, _register_rows,
+                 _field_layouts, _field_rows, _subscriptor_rows)
+_peripherals = _db.peripheral_table()
+
+__getattr__, __dir__, __all__ = lazy_module(globals(), _peripherals)
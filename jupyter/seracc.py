@@ -1,162 +1,812 @@
-# version 4.1 - updated 2025/10/19
+# version 4.2 - updated 2026/10/18
 
-if "ser" not in globals():
-    ser = None
-_crc = None
-_ev = False
-_count = 0
-SER_LEN = 1040
-
-def serial_init(which=None):
-    import serial
-    global ser, _crc, _ev, _count
-
-    if isinstance(ser, serial.Serial):
-        ser.close()
-        
-    if which is None:
-        count = 0
-        port_st, desc_st, hwid_st = None, None, None
-        import serial.tools.list_ports
-        for port, desc, hwid in serial.tools.list_ports.comports():
-            if desc.startswith("STMicroelectronics") or desc.startswith("XDS110 Class App"):
-                count += 1
-                port_st, desc_st, hwid_st = port, desc, hwid
-        if count == 1:
-            print(f"Automatically detected:\n\t{port_st}: {desc_st} [{hwid_st}]")
-            which = port_st
-    
-    if which is None:
-        print("Listing serial ports:")
-        for port, desc, hwid in serial.tools.list_ports.comports():
-            print(f"\t{port}: {desc} [{hwid}]")
-        which = input("Which COM port? Enter 0 for evaluation mode")
+import os, sys
 
-    if isinstance(which, int) or which.isnumeric():
-        which = f"COM{which}"
-    
-    if which == "COM0":
-        _ev = True
-        print("Entering evaluation mode")
-        return
+# headless mode, for scripts and batch jobs: IPython is not imported, stdin is not asked for the port
+# unless it is a terminal, and repr returns text instead of displaying HTML tables
+# on outside a Jupyter kernel, SERACC_HEADLESS=1 or 0 forces it on or off
+# SERACC_PORT: the port of the default session, e.g., /dev/ttyACM0, COM5 or 0 for a virtual device
+HEADLESS = os.environ.get("SERACC_HEADLESS", "0" if "ipykernel" in sys.modules else "1") == "1"
 
-    ser = serial.Serial(which, baudrate=1000000, timeout=1)
-    _count = 0
-    
-    from crc import Configuration, Calculator
+SER_LEN = 1040
+_reserve = 7 # room left for the status or sync command
+
+# CRC-16/XMODEM: polynomial 0x1021, initial value 0, no reflection, the same as seracc_crc_bsp
+# every backend takes the CRC of the preceding chunks as `crc`, so the data can be fed incrementally
+def _crc_table():
+    table = []
+    for i in range(256):
+        crc = i << 8
+        for _ in range(8):
+            crc = (crc << 1) ^ 0x1021 if crc & 0x8000 else crc << 1
+        table.append(crc & 0xFFFF)
+    return table
+
+_CRC_TABLE = _crc_table()
+
+# pure Python, one table lookup per byte
+def crc16_table(data, crc=0):
+    for b in data:
+        crc = ((crc << 8) & 0xFFFF) ^ _CRC_TABLE[(crc >> 8) ^ b]
+    return crc
+
+# C implementation in the standard library
+def crc16_binascii(data, crc=0):
+    import binascii
+    return binascii.crc_hqx(bytes(data), crc)
+
+# the `crc` package, used before version 4.2, kept for comparison
+def crc16_package(data, crc=0):
+    from crc import Configuration, Register
     config = Configuration(
         width=16,
         polynomial=0x1021,
-        init_value=0x0000,
+        init_value=crc,
         final_xor_value=0x0000,
         reverse_input=False,
         reverse_output=False,
     )
-    _crc = Calculator(config)
+    register = Register(config)
+    register.init()
+    register.update(bytes(data))
+    return register.digest()
+
+CRC_BACKENDS = {"binascii": crc16_binascii, "table": crc16_table, "crc": crc16_package}
+crc16 = crc16_binascii
+
+def crc_backend(name):
+    global crc16
+    crc16 = CRC_BACKENDS[name]
+
+# checks that the backends agree and times them
+def crc_benchmark(size=1024, number=1000):
+    import os, time
+    data = os.urandom(size)
+    for name, f in CRC_BACKENDS.items():
+        try:
+            # check value of CRC-16/XMODEM
+            assert f(b"123456789") == 0x31C3
+            assert f(data[size//3:], f(data[:size//3])) == crc16_table(data)
+        except ImportError:
+            print(f"{name}: not installed")
+            continue
+        n = number if name == "binascii" else max(number // 100, 1)
+        t = time.perf_counter()
+        for _ in range(n):
+            f(data)
+        t = time.perf_counter() - t
+        print(f"{name}: {t / n * 1e6:.1f} us per {size} bytes, {size * n / t / 1e6:.2f} MB/s")
+
+# one connection to an MCU: the serial port, the flow control and the reliable mode state
+# the module-level functions (serial_transmit, read_register, ...) use the session created by serial_init
+# more boards can be opened as more sessions, see Device and parallel
+class Session:
+    def __init__(self, which=None):
+        self.ser = None
+
+        # credit-based flow control
+        # MCU receives into a ring buffer of SER_LEN bytes, and reports how many bytes it has processed
+        # since the last sync in credit frames: 0x55 0xCC <count, 16 bits> <CRC>
+        # frames are sent as long as the bytes in flight fit the buffer, no sync is needed
+        self.sent = 0  # bytes sent since the last sync, modulo 65536
+        self.freed = 0 # bytes processed by MCU since the last sync, modulo 65536
+        # responses requested but not received yet, e.g., by mem_read
+        # the credit frames are not polled meanwhile, they are taken when the responses are received
+        self.ahead = 0
+
+        # reliable mode: frames are tagged with sequence numbers and confirmed by MCU
+        self.is_reliable = False
+        self.retries = 10
+        self.seq = 0
+        self.unacked = [] # seq, tagged content
+        self.frame_len = SER_LEN # longer frames are more likely to be corrupted
+        self.counters = {"frames": 0, "retransmits": 0, "naks": 0, "errors": 0, "timeouts": 0}
+
+        # held during each exchange of a request and its response, so that threads such as Watch can share the session
+        import threading
+        self.lock = threading.RLock()
+
+        self.cmd_batch = None # active CommandBatch
+        self.pipeline = None  # AsyncPipeline
+        self.memory = None    # TargetMemory
+        self.shadow = {}      # address -> value of the registers with the "cached" policy
+
+        self.open(which)
+
+    # which: the port name or number, 0 for a virtual device, or a port object such as VirtualPort
+    def open(self, which=None):
+        import serial
+
+        if which is not None and not isinstance(which, (str, int)):
+            self.ser = which
+            self.sync()
+            return
+
+        if which is None:
+            count = 0
+            port_st, desc_st, hwid_st = None, None, None
+            import serial.tools.list_ports
+            for port, desc, hwid in serial.tools.list_ports.comports():
+                if desc.startswith("STMicroelectronics") or desc.startswith("XDS110 Class App"):
+                    count += 1
+                    port_st, desc_st, hwid_st = port, desc, hwid
+            if count == 1:
+                print(f"Automatically detected:\n\t{port_st}: {desc_st} [{hwid_st}]")
+                which = port_st
+
+        if which is None:
+            print("Listing serial ports:")
+            for port, desc, hwid in serial.tools.list_ports.comports():
+                print(f"\t{port}: {desc} [{hwid}]")
+            if HEADLESS and (sys.stdin is None or not sys.stdin.isatty()):
+                raise EOFError("No serial port, call serial_init(port) or set SERACC_PORT")
+            which = input("Which COM port? Enter 0 for evaluation mode")
+
+        if isinstance(which, int) or which.isnumeric():
+            which = f"COM{which}"
+
+        if which == "COM0":
+            print("Entering evaluation mode with a virtual device")
+            self.ser = VirtualPort()
+        else:
+            self.ser = serial.Serial(which, baudrate=1000000, timeout=1)
+
+        # MCU may hold the credit of a previous session
+        self.sync()
+
+    def close(self):
+        if self.ser is not None:
+            self.ser.close()
+            self.ser = None
+
+    @staticmethod
+    def frame(bs):
+        l = len(bs)
+        data = [l % 256, l // 256]
+        data += bs
+        crc = crc16(bs)
+        data += [crc % 256, crc // 256]
+        return data
+
+    def _write(self, data):
+        self.ser.write(bytes(data))
+        self.sent = (self.sent + len(data)) % 65536
+
+    # the credit frame after its 0x55 0xCC header
+    def _read_credit(self):
+        bs = self.ser.read(4)
+        if len(bs) != 4 or crc16(bs[:2]) != bs[2] + bs[3] * 256:
+            return False
+        self.freed = bs[0] + bs[1] * 256
+        return True
+
+    # takes the credit frames already received, without waiting
+    def _poll_credit(self):
+        if self.ahead > 0:
+            return
+        while self.ser.in_waiting >= 6:
+            head = self.ser.read(2)
+            if head[0] != 0x55 or head[1] != 0xCC:
+                # stale response
+                self.ser.reset_input_buffer()
+                return
+            self._read_credit()
+
+    # waits until `size` more bytes fit in the MCU buffer
+    # returns False if the credit does not come, e.g., it is lost or MCU is in the error state
+    def _wait_credit(self, size):
+        while (self.sent - self.freed) % 65536 + size + _reserve >= SER_LEN:
+            head = self.ser.read(2)
+            if len(head) != 2 or head[0] != 0x55 or head[1] != 0xCC or not self._read_credit():
+                return False
+        return True
 
-serial_init()
+    # whether a frame with `size` bytes of content is sent without waiting for credit
+    # requests sent ahead of a response must not wait, or the wait would take the response for a credit
+    def fits(self, size):
+        return (self.sent - self.freed) % 65536 + size + 4 + _reserve < SER_LEN
 
-def serial_transmit(bs):
-    # print([hex(b) for b in bs])
+    def _send(self, data):
+        self._poll_credit()
+        if not self._wait_credit(len(data)):
+            return False
+        self._write(data)
+        return True
 
-    global ser, _crc, _ev, _count
+    def transmit(self, bs):
+        with self.lock:
+            self._transmit(bs)
 
-    if _ev:
-        return
-    
-    if isinstance(bs, str):
-        bs = bs.encode()
-    
-    l = len(bs)
-    data = [l % 256, l // 256]
-    data += bs
-    crc = _crc.checksum(bs)
-    data += [crc % 256, crc // 256]
-
-    l = len(data)
-    if l >= SER_LEN:
-        print("Error: packet too long")
-        return
-    
-    if _count + l >= SER_LEN:
-        serial_sync()
-    _count += l
+    def _transmit(self, bs):
+        # print([hex(b) for b in bs])
 
-    ser.write(data)
+        if isinstance(bs, str):
+            bs = bs.encode()
 
-def serial_receive(size):
-    global ser, _crc, _ev, _count
-    
-    if _ev:
-        return bytes([0] * size)
+        if self.is_reliable:
+            bs = "_S:".encode() + bytes([self.seq]) + bs
 
-    bs = ser.read(size+4)
-    
-    if len(bs) == 0:
-        print("No response")
-        return bytes()
+        data = self.frame(bs)
 
-    if len(bs) != size+4 \
-        or bs[0]+bs[1]*256 != size:
-            print("Format error")
-            ser.read_all()
+        l = len(data)
+        if l + _reserve >= SER_LEN:
+            print("Error: packet too long")
+            return
+
+        # sequence numbers wrap around, confirm the frames before they become ambiguous
+        if self.is_reliable and len(self.unacked) >= 128:
+            self.sync_reliable()
+
+        self._poll_credit()
+        if not self._wait_credit(l):
+            self.sync()
+
+        if self.is_reliable:
+            self.unacked.append((self.seq, bs))
+            self.seq = (self.seq + 1) % 256
+            self.counters["frames"] += 1
+
+        self._write(data)
+
+    # wait: seconds MCU may take to respond in addition to the serial timeout
+    def receive(self, size, wait=0):
+        if wait > 0:
+            timeout = self.ser.timeout
+            self.ser.timeout = timeout + wait
+            try:
+                return self.receive(size)
+            finally:
+                self.ser.timeout = timeout
+
+        if self.is_reliable:
+            return self.receive_reliable(size)
+
+        bs, error = self._read_frame(size)
+        if error is not None:
+            print(error)
+            if error == "Format error":
+                self.ser.read_all()
             return bytes()
-    
-    crc = bs[-2] + bs[-1] * 256
-    bs = bs[2:-2]
-    if _crc.checksum(bs) != crc:
-        print("CRC error")
+
+        return bs
+
+    def clear(self):
+        self._poll_credit()
+
+    def sync(self):
+        with self.lock:
+            self._sync()
+
+    def _sync(self):
+        if self.is_reliable:
+            self.sync_reliable()
+            return
+
+        self.ser.reset_input_buffer()
+        self.ser.write(bytes([0x55, 0xAA]))
+        read = self.ser.read(2)
+        while len(read) == 2 and read[0] == 0x55 and read[1] == 0xCC:
+            self.ser.read(4)
+            read = self.ser.read(2)
+        if len(read) != 2 or read[0] != ord('O') or read[1] != ord('K'):
+            print("Sync failed")
+
+        self.sent = 0
+        self.freed = 0
+
+    # see serial_reliable
+    def reliable(self, enable=True, retries=10, timeout=0.02, frame_len=256):
+        self.sync()
+        self.retries = retries
+        self.unacked = []
+        self.is_reliable = enable
+        if enable:
+            self.ser.timeout = timeout
+            self.frame_len = frame_len
+            self.seq = self.sync_reliable()
+        else:
+            self.ser.timeout = 1
+            self.frame_len = SER_LEN
+
+    def stats(self):
+        return dict(self.counters)
+
+    # returns the content and the error message, skipping the credit frames
+    def _read_frame(self, size):
+        head = self.ser.read(2)
+        while len(head) == 2 and head[0] == 0x55 and head[1] == 0xCC:
+            self._read_credit()
+            head = self.ser.read(2)
+
+        if len(head) == 0:
+            self.counters["timeouts"] += 1
+            return None, "No response"
+
+        bs = head + self.ser.read(size+2)
+        if len(bs) != size+4 \
+            or bs[0]+bs[1]*256 != size:
+                self.counters["errors"] += 1
+                return None, "Format error"
+
+        if crc16(bs[2:-2]) != bs[-2] + bs[-1] * 256:
+            self.counters["errors"] += 1
+            return None, "CRC error"
+
+        return bs[2:-2], None
+
+    # bring MCU out of the error state and discard everything in the buffers
+    def _recover(self):
+        self.ser.write(bytes([0x55, 0xAA, 0x55, 0xAA]))
+        self.ser.read(2)
+        self.ser.reset_input_buffer()
+        self.sent = 0
+        self.freed = 0
+
+    # returns the sequence number expected by MCU
+    def sync_reliable(self):
+        failures = 0
+        while failures < self.retries:
+            self._poll_credit()
+            if not self._send(self.frame("_A:".encode())):
+                failures += 1
+                self._recover()
+                continue
+
+            rec, error = self._read_frame(2)
+            if rec is None:
+                failures += 1
+                self._recover()
+                continue
+
+            expected, dropped = rec[0], rec[1]
+            if dropped > 0:
+                self.counters["naks"] += 1
+
+            # the frames from the expected one on were not executed
+            lost = [i for i, (seq, bs) in enumerate(self.unacked) if seq == expected]
+            self.unacked = self.unacked[lost[0]:] if len(lost) > 0 else []
+            if len(self.unacked) == 0:
+                return expected
+
+            for seq, bs in self.unacked:
+                self.counters["retransmits"] += 1
+                if not self._send(self.frame(bs)):
+                    # the rest is retransmitted in the next round
+                    break
+
+        raise EOFError("Synchronization failed")
+
+    def receive_reliable(self, size):
+        for _ in range(self.retries):
+            bs, error = self._read_frame(size)
+            if bs is not None:
+                # MCU executes the frames in order, so all are confirmed
+                self.unacked = []
+                return bs
+
+            if len(self.unacked) == 0:
+                break
+
+            # the request or the response is lost, confirm the preceding frames and request again
+            seq, request = self.unacked.pop()
+            if self.sync_reliable() == seq:
+                # not executed, retransmit as is
+                self.unacked.append((seq, request))
+                self.counters["retransmits"] += 1
+                self._send(self.frame(request))
+            else:
+                # executed but the response is lost, read again
+                self.transmit(request[4:])
+
         return bytes()
-    
-    _count = 0
-    return bs
 
-def serial_clear():
-    global ser, _crc, _ev, _count
-    
-    if _ev:
-        return
-    ser.read_all()
+if "_databases" not in globals():
+    _databases = [] # RegisterDB of the generated modules imported
+
+# in-process virtual MCU used in place of the serial port, e.g., Session(VirtualPort())
+# it runs the protocol of seracc.c on a sparse memory, so scripts can be tested and profiled without a board
+# a word never written reads as the reset value of its register, or 0
+# modules: the generated modules providing the reset values, all imported ones if None
+# timing model: each byte takes 10 bits at `baudrate`, and each response `latency` seconds more,
+# e.g., the USB frame of the UART bridge; the modeled time is accumulated in `elapsed`
+# realtime: sleep for the modeled time, otherwise return at once
+class VirtualPort:
+    def __init__(self, modules=None, baudrate=1000000, latency=1e-3, realtime=False):
+        self.modules = modules
+        self.baudrate = baudrate
+        self.latency = latency
+        self.realtime = realtime
+        self.timeout = 1
+        self.elapsed = 0.0
+
+        self.memory = {}    # word address -> value
+        self.defaults = {}  # word address -> reset value
+        self.n_databases = -1
+
+        self.rx = bytearray()
+        self.tx = bytearray()
+        self.freed = 0
+        self.credit = 0
+        self.error = False
+        self.seq = 0
+        self.dropped = 0
+
+        # key -> handler(content), which returns the response content or None
+        # custom handlers of the firmware can be emulated in the same way
+        self.handlers = {
+            "_": self.reg_handler,
+            "_M": self.multi_handler,
+            "_S": self.seq_handler,
+            "_A": self.ack_handler,
+            "_W": self.wait_handler,
+            "_MR": self.mem_read_handler,
+            "_MW": self.mem_write_handler,
+            "_P": self.sampler_handler,
+        }
+
+    # serial port interface used by Session
+
+    @property
+    def in_waiting(self):
+        return len(self.tx)
+
+    def write(self, data):
+        self.advance(len(data) * 10 / self.baudrate)
+        self.rx += data
+        self.idle()
+        return len(data)
+
+    def read(self, size=1):
+        data = bytes(self.tx[:size])
+        del self.tx[:size]
+        if len(data) < size:
+            # a serial port waits for the timeout
+            self.advance(self.timeout or 0)
+        return data
+
+    def read_all(self):
+        return self.read(len(self.tx))
+
+    def reset_input_buffer(self):
+        self.tx.clear()
+
+    def close(self):
+        pass
+
+    def advance(self, t):
+        self.elapsed += t
+        if self.realtime and t > 0:
+            import time
+            time.sleep(t)
+
+    # memory
+
+    def reset_value(self, addr):
+        if self.modules is None and self.n_databases != len(_databases):
+            self.n_databases = len(_databases)
+            self.defaults = {}
+            for db in _databases:
+                self.defaults.update(db.reset_values())
+        elif self.modules is not None and self.n_databases < 0:
+            self.n_databases = 0
+            for module in self.modules:
+                self.defaults.update(module._db.reset_values())
+        return self.defaults.get(addr, 0)
+
+    def load_word(self, addr):
+        value = self.memory.get(addr)
+        if value is None:
+            value = self.reset_value(addr)
+        return value
 
-def serial_sync():
-    global ser, _crc, _ev, _count
-    
-    if _ev:
-        return
-    
-    ser.write(bytes([0x55, 0xAA]))
-    read = ser.read(2)
-    if len(read) != 2 or read[0] != ord('O') or read[1] != ord('K'):
-        print("Sync failed")
+    def load(self, addr, size):
+        begin = addr & ~0b11
+        data = b"".join(self.load_word(a).to_bytes(4, "little") for a in range(begin, addr + size, 4))
+        return data[addr-begin:addr-begin+size]
+
+    def store(self, addr, data):
+        begin = addr & ~0b11
+        buf = bytearray(self.load(begin, (addr + len(data) - begin + 3) & ~0b11))
+        buf[addr-begin:addr-begin+len(data)] = data
+        for i in range(0, len(buf), 4):
+            self.memory[begin+i] = int.from_bytes(buf[i:i+4], "little")
+
+    def modify(self, addr, mask, value):
+        self.memory[addr] = (self.load_word(addr) & ~mask | value) & MASK_32B
+
+    # protocol, see seracc.c
+
+    def transmit(self, bs):
+        self.advance(self.latency + (len(bs) + 4) * 10 / self.baudrate)
+        self.tx += bytes(Session.frame(bs))
+
+    def sync(self):
+        self.rx.clear()
+        self.freed = 0
+        self.credit = 0
+        self.error = False
+        self.advance(self.latency)
+        self.tx += b"OK"
+
+    def idle(self):
+        rx = self.rx
+        if self.error:
+            if rx[-4:] == b"\x55\xAA\x55\xAA":
+                self.sync()
+            else:
+                del rx[:-4]
+            return
+
+        pos = 0
+        while len(rx) - pos >= 2:
+            size = rx[pos] | rx[pos+1] << 8
+            if size == 0xAA55:
+                self.sync()
+                return
+            if size < 2 or (len(rx) - pos < size + 4 and size + 4 >= SER_LEN) \
+                or (len(rx) - pos >= size + 4 and crc16(rx[pos+2:pos+2+size]) != rx[pos+size+2] | rx[pos+size+3] << 8):
+                self.error = True
+                self.dropped = min(self.dropped + 1, 255)
+                break
+            if len(rx) - pos < size + 4:
+                break
+            response = self.dispatch(bytes(rx[pos+2:pos+2+size]))
+            if response:
+                self.transmit(response)
+            pos += size + 4
+
+        del rx[:pos]
+        self.freed = (self.freed + pos) % 65536
+
+        if len(rx) > 0 and rx[-4:] == b"\x55\xAA\x55\xAA":
+            self.sync()
+        elif self.freed != self.credit:
+            credit = bytes([self.freed & 0xFF, self.freed >> 8])
+            crc = crc16(credit)
+            self.tx += bytes([0x55, 0xCC]) + credit + bytes([crc & 0xFF, crc >> 8])
+            self.credit = self.freed
+
+    def dispatch(self, bs):
+        colon = bs.find(b":")
+        if colon < 0 or colon > 7:
+            return None
+        handler = self.handlers.get(bs[:colon].decode(errors="replace"))
+        if handler is None:
+            return None
+        return handler(bs[colon+1:])
+
+    def reg_access(self, data):
+        addr = int.from_bytes(data[:4], "little")
+        aligned = addr & ~0b11
+        case = len(data) * 4 + (data[0] & 0b11 if len(data) > 0 else 0)
+        if case == 17:
+            return self.load(aligned, 1)
+        elif case == 18:
+            return self.load(aligned, 2)
+        elif case == 16:
+            return self.load(aligned, 4)
+        elif case == 21:
+            self.store(aligned, data[4:5])
+        elif case == 24:
+            self.store(aligned, data[4:6])
+        elif case == 32:
+            self.store(aligned, data[4:8])
+        elif case in (29, 30, 31):
+            if data[6] < 0x10:
+                return self.load(addr, data[6])
+            elif data[6] == 0x11:
+                self.store(addr, data[4:5])
+            elif data[6] == 0x12:
+                self.store(addr, data[4:6])
+        elif case in (37, 38, 39):
+            self.store(addr, data[4:8])
+        elif case == 20:
+            bit = 1 << data[4] & MASK_32B
+            self.modify(aligned, bit, bit)
+        elif case == 22:
+            self.modify(aligned, 1 << data[4] & MASK_32B, 0)
+        elif case == 33:
+            mask = int.from_bytes(data[4:8], "little")
+            self.modify(aligned, mask, mask)
+        elif case == 34:
+            self.modify(aligned, MASK_32B & ~int.from_bytes(data[4:8], "little"), 0)
+        elif case == 48:
+            mask = int.from_bytes(data[4:8], "little")
+            self.modify(aligned, mask, int.from_bytes(data[8:12], "little"))
+        return b""
+
+    def reg_handler(self, data):
+        return self.reg_access(data)
+
+    def multi_handler(self, data):
+        response = b""
+        pos = 0
+        while pos < len(data):
+            n = data[pos]
+            pos += 1
+            if n > len(data) - pos or len(response) + 4 > MULTI_LEN:
+                break
+            response += self.reg_access(data[pos:pos+n])
+            pos += n
+        return response
+
+    def seq_handler(self, data):
+        if len(data) < 1:
+            return None
+        if data[0] != self.seq:
+            self.dropped = min(self.dropped + 1, 255)
+            return None
+        self.seq = (self.seq + 1) % 256
+        return self.dispatch(data[1:])
+
+    def ack_handler(self, data):
+        status = bytes([self.seq, self.dropped])
+        self.dropped = 0
+        return status
+
+    # nothing changes the memory while waiting, so the value is either there or the wait times out
+    def wait_handler(self, data):
+        if len(data) != 16:
+            return None
+        addr, mask, value, timeout = (int.from_bytes(data[i:i+4], "little") for i in range(0, 16, 4))
+        if int.from_bytes(self.load(addr, 4), "little") & mask == value:
+            return bytes([0]) + to_4bytes(0)
+        self.advance(timeout / 1e6)
+        return bytes([1]) + to_4bytes(timeout)
+
+    def mem_read_handler(self, data):
+        if len(data) != 6:
+            return None
+        return self.load(int.from_bytes(data[:4], "little"), data[4] | data[5] << 8)
+
+    def mem_write_handler(self, data):
+        if len(data) < 4:
+            return None
+        self.store(int.from_bytes(data[:4], "little"), data[4:])
+
+    # there is no timer, so the sampler is not supported
+    def sampler_handler(self, data):
+        if len(data) == 0:
+            return None
+        return bytes([2])
+
+if "_session" not in globals():
+    _session = None
+
+# opens the default session, closing the previous one
+# which: as in Session.open, SERACC_PORT if not given
+def serial_init(which=None):
+    global _session
+    if which is None:
+        which = os.environ.get("SERACC_PORT")
+    if _session is not None:
+        _session.close()
+    _session = Session(which)
+    return _session
+
+# the default session, opened on first use if it is not yet, e.g., in headless mode
+def get_session():
+    if _session is None:
+        serial_init()
+    return _session
+
+def serial_frame(bs):
+    return Session.frame(bs)
 
-    _count = 0
+def serial_transmit(bs):
+    get_session().transmit(bs)
+
+def serial_receive(size):
+    return get_session().receive(size)
+
+def serial_clear():
+    get_session().clear()
 
+def serial_sync():
+    get_session().sync()
+
+# enable or disable reliable mode
+# in reliable mode, every frame carries a sequence number
+# on each sync, MCU reports the next expected sequence number (ACK) and whether frames were lost (NAK),
+# and only the frames not executed yet are retransmitted
+# a read whose request or response is lost is issued again
+# errors are counted in serial_stats() instead of printed, and give up after `retries` attempts
+# timeout: serial read timeout in seconds, kept short so that a lost frame is detected quickly
+# frame_len: maximum length of multi-op frames
+def serial_reliable(enable=True, retries=10, timeout=0.02, frame_len=256):
+    get_session().reliable(enable, retries, timeout, frame_len)
+
+def serial_stats():
+    return get_session().stats()
+
+# calls func(item) for each item in a thread pool, e.g., one Device per board, and returns the results in order
+# the GIL is released while waiting for the serial port, so the boards are accessed at the same time
+def parallel(func, items, max_workers=None):
+    from concurrent.futures import ThreadPoolExecutor
+    items = list(items)
+    with ThreadPoolExecutor(max_workers or max(len(items), 1)) as pool:
+        return list(pool.map(func, items))
+
+# in headless mode, the default session is opened on first use unless SERACC_PORT is set
+if not HEADLESS or "SERACC_PORT" in os.environ:
+    serial_init()
+
+if "_masks" not in globals():
+    _masks = {} # mask -> runs of consecutive ones, see mask_runs
+
+# masks kept by mask_runs, more than the fields of a device, so that arbitrary masks
+# passed to read_register and write_register do not grow the cache without limit
+MASK_CACHE_LEN = 8192
+
+# the runs of consecutive ones in a mask as (position, width mask) pairs, from the lowest bit
+# computed once per mask, almost all SVD fields have a single run, so shifting is one shift and one AND
+def mask_runs(mask):
+    runs = _masks.get(mask)
+    if runs is None:
+        runs = []
+        rest = mask & MASK_32B
+        while rest:
+            pos = (rest & -rest).bit_length() - 1
+            bits = rest >> pos
+            bits &= ~(bits + 1)
+            runs.append((pos, bits))
+            rest &= ~(bits << pos)
+        runs = tuple(runs)
+        if len(_masks) >= MASK_CACHE_LEN:
+            _masks.clear()
+        _masks[mask] = runs
+    return runs
+
+# the number of bits of a mask, i.e., of the values of its bit field
+def mask_width(mask):
+    return sum(bits.bit_length() for pos, bits in mask_runs(mask))
+
+# deposits the low bits of value into the bits of mask (pdep)
 def mask_shl(value, mask):
+    runs = mask_runs(mask)
+    if len(runs) == 1:
+        return (value & runs[0][1]) << runs[0][0]
     result = 0
-    j = 0
-    for i in range(32):
-        if mask & (1 << i):
-            if value & (1 << j):
-                result |= 1 << i
-            j += 1
+    for pos, bits in runs:
+        result |= (value & bits) << pos
+        value >>= bits.bit_length()
     return result
 
+# extracts the bits of mask into the low bits (pext)
 def mask_shr(value, mask):
+    runs = mask_runs(mask)
+    if len(runs) == 1:
+        return (value >> runs[0][0]) & runs[0][1]
     result = 0
     j = 0
-    for i in range(32):
-        if mask & (1 << i):
-            if value & (1 << i):
-                result |= 1 << j
-            j += 1
+    for pos, bits in runs:
+        result |= ((value >> pos) & bits) << j
+        j += bits.bit_length()
+    return result
+
+# mask_shl and mask_shr for NumPy arrays of register values, e.g., from Sampler
+# computed in uint64 whatever the dtype of values, so that no bit is lost or taken for a sign
+def mask_shl_array(values, mask):
+    import numpy as np
+    values = np.asarray(values).astype(np.uint64)
+    result = np.zeros(values.shape, np.uint64)
+    for pos, bits in mask_runs(mask):
+        result |= (values & bits) << pos
+        values = values >> bits.bit_length()
+    return result
+
+def mask_shr_array(values, mask):
+    import numpy as np
+    values = np.asarray(values).astype(np.uint64)
+    result = np.zeros(values.shape, np.uint64)
+    j = 0
+    for pos, bits in mask_runs(mask):
+        result |= ((values >> pos) & bits) << j
+        j += bits.bit_length()
     return result
 
 def mask_to_pos(mask):
-    pos = []
-    for i in range(32):
-        if 1 << i & mask:
-            pos.append(i)
-    return pos
+    return [pos + i for pos, bits in mask_runs(mask) for i in range(bits.bit_length())]
 
 def bin_repr(v, n):
     return f"0b{v:0{n}b}"
@@ -181,19 +831,16 @@ def from_hex(s):
 def simplify_access(mask, value):
     mask_toset   = mask &  value
     mask_toclear = mask & ~value
-    n_toset   = bin(mask_toset  ).count("1")
-    n_toclear = bin(mask_toclear).count("1")
-    n_mask    = bin(mask        ).count("1")
 
     if mask == MASK_32B:
         return ["write-only"]
-    elif n_toset == 1 and n_toclear == 0:
-        return ["single-set", mask_to_pos(mask_toset)[0]]
-    elif n_toset == 0 and n_toclear == 1:
-        return ["single-clear", mask_to_pos(mask_toclear)[0]]
-    elif n_toset == n_mask and n_toclear == 0:
+    elif mask_toclear == 0 and mask_toset != 0 and mask_toset & (mask_toset - 1) == 0:
+        return ["single-set", mask_toset.bit_length() - 1]
+    elif mask_toset == 0 and mask_toclear != 0 and mask_toclear & (mask_toclear - 1) == 0:
+        return ["single-clear", mask_toclear.bit_length() - 1]
+    elif mask_toclear == 0:
         return ["set-only"]
-    elif n_toset == 0 and n_toclear == n_mask:
+    elif mask_toset == 0:
         return ["clear-only"]
     else:
         return ["full-modify"]
@@ -327,7 +974,7 @@ class AccessLogger:
     def log_write(self, addr, mask, value, width):
         comment = self.node.get_full_name() + " = "
         if isinstance(self.node, BitField):
-            comment += bin_repr(mask_shr(value, mask), self.node.n)
+            comment += bin_repr(mask_shr(value, self.node.mask), self.node.n)
         else:
             comment += f"{value}"
         self.ops.append([0, addr, mask, value, width, comment])
@@ -369,6 +1016,23 @@ def logging(filename=None):
 #   set bits          _: <addr|1> <mask          >          (8)
 # clear bits          _: <addr|2> <mask          >          (8)
 # modify masked bits  _: <addr  > <mask          >  <value> (12)
+#
+# multi-op frame     _M: <size> <command> <size> <command> ...
+#   each <command> is one of the above without "_:", executed in order
+#   results of all reads are concatenated in one response
+#
+# wait               _W: <addr> <mask> <value> <timeout in us>
+#   MCU polls until (*addr & mask) == value, responds <0 or 1 if timeout> <elapsed us>
+#
+# memory read       _MR: <addr> <size, 2 bytes>
+#   responds <size bytes from addr>
+# memory write      _MW: <addr> <bytes>
+#
+# sampler start      _P: <period in us> <number of samples, 0 if continuous> <addr> <addr> ...
+#   each addr as in 4-aligned reads, responds <0 if started, 1 if invalid, 2 if not supported>
+#   MCU then streams 0x55 0xDD <frame of <first sample index> <samples>>
+#   and 0x55 0xEE <frame of <samples taken> <0 or 1 if overflow>> when it stops
+# sampler stop       _P:
 
 # assume all registers are 32-bit
 MASK_32B = 2**32 - 1
@@ -380,12 +1044,8 @@ def to_4bytes(word):
         word >>= 8
     return bytes(bs)
 
-# mask: extract the bits where mask is 1
-# direct: if True, preserve the bit positions in the word
 # width: 8, 16 or 32
-def read_register(addr, mask=MASK_32B, direct=False, width=32):
-    bs = "_:".encode()
-
+def encode_read(addr, width=32):
     if addr & 0b11 != 0:
 
         c = 0
@@ -397,7 +1057,7 @@ def read_register(addr, mask=MASK_32B, direct=False, width=32):
             c = 1
         else:
             raise NotImplementedError("Unknown access width")
-        bs += to_4bytes(addr) + bytes([0xFE, 0xEF, c])
+        return to_4bytes(addr) + bytes([0xFE, 0xEF, c])
 
     else:
 
@@ -410,15 +1070,9 @@ def read_register(addr, mask=MASK_32B, direct=False, width=32):
             ored = 1
         else:
             raise NotImplementedError("Unknown access width")
-        bs += to_4bytes(addr | ored)
+        return to_4bytes(addr | ored)
 
-    serial_clear()
-    serial_transmit(bs)
-    
-    bs = serial_receive(width//8)
-    if len(bs) != width//8:
-        raise EOFError("Reading error")
-    
+def decode_value(bs, mask=MASK_32B, direct=False, width=32):
     if width == 32:
         value = bs[0] | bs[1]<<8 | bs[2]<<16 | bs[3]<<24
     elif width == 16:
@@ -430,18 +1084,37 @@ def read_register(addr, mask=MASK_32B, direct=False, width=32):
         value &= mask
     else:
         value = mask_shr(value, mask)
-    
-    if _logger:
-        _logger.log_read(addr, width)
 
     return int(value)
 
-# masked write: change bits with mask 1 only, mask only applies when width=32
+# mask: extract the bits where mask is 1
 # direct: if True, preserve the bit positions in the word
 # width: 8, 16 or 32
-def write_register(addr, value, mask=MASK_32B, direct=False, width=32):
-    bs = "_:".encode()
-    bs += to_4bytes(addr)
+# session: the default session if None
+def read_register(addr, mask=MASK_32B, direct=False, width=32, session=None):
+    session = session or get_session()
+    bs = "_:".encode() + encode_read(addr, width)
+
+    if session.cmd_batch:
+        session.cmd_batch.flush()
+
+    with session.lock:
+        session.clear()
+        session.transmit(bs)
+        bs = session.receive(width//8)
+    if len(bs) != width//8:
+        raise EOFError("Reading error")
+    
+    value = decode_value(bs, mask, direct, width)
+    
+    if _logger:
+        _logger.log_read(addr, width)
+
+    return value
+
+# returns the command and the value actually written (shifted if not direct)
+def encode_write(addr, value, mask=MASK_32B, direct=False, width=32):
+    bs = to_4bytes(addr)
 
     if addr & 0b11 != 0:
         
@@ -460,8 +1133,6 @@ def write_register(addr, value, mask=MASK_32B, direct=False, width=32):
         else:
             raise NotImplementedError("Unknown access width")
 
-        serial_transmit(bs)
-
     else:
 
         if not direct:
@@ -497,50 +1168,962 @@ def write_register(addr, value, mask=MASK_32B, direct=False, width=32):
         else:
             raise NotImplementedError("Unknown access width")
 
-        bs = bs[:2] + bytes([bs[2] | ored]) + bs[3:]
-        serial_transmit(bs)
+        bs = bytes([bs[0] | ored]) + bs[1:]
+
+    return bs, value
+
+# masked write: change bits with mask 1 only, mask only applies when width=32
+# direct: if True, preserve the bit positions in the word
+# width: 8, 16 or 32
+# session: the default session if None
+def write_register(addr, value, mask=MASK_32B, direct=False, width=32, session=None):
+    session = session or get_session()
+    bs, value = encode_write(addr, value, mask, direct, width)
+
+    if session.cmd_batch:
+        session.cmd_batch.append_write(bs, addr, mask, value, width)
+    else:
+        session.transmit("_:".encode() + bs)
 
     if _logger:
         _logger.log_write(addr, mask, value, width)
-    
+
+def encode_multi(cmds):
+    if len(cmds) == 1:
+        return "_:".encode() + cmds[0]
+    bs = "_M:".encode()
+    for cmd in cmds:
+        bs += bytes([len(cmd)]) + cmd
+    return bs
+
+# whether sub-commands of `size` bytes in total fit in one multi-op frame
+def multi_fits(size, session=None):
+    session = session or get_session()
+    # 2-byte length, key "_M:", 2-byte CRC, tag "_S:<seq>" and room for the sync command
+    return 2 + 3 + size + 2 + 4 + 7 < session.frame_len
+
+# packs register commands into multi-op frames instead of sending one frame per command
+# each frame is filled up to SER_LEN and sent when full or when the block exits
+# a read inside the block flushes the pending commands first, so the order is preserved
+# in reliable mode, all commands are confirmed by MCU when the block exits
+class CommandBatch:
+    def __init__(self, session):
+        self.session = session
+        self.cmds = []
+        self.size = 0
+
+    def __enter__(self):
+        self.outer = self.session.cmd_batch
+        if self.outer:
+            self.outer.flush()
+        self.session.cmd_batch = self
+        return self
+
+    def __exit__(self, tp, v, tb):
+        self.session.cmd_batch = self.outer
+        self.flush()
+        if self.session.is_reliable:
+            self.session.sync()
+
+    def append(self, cmd):
+        if not multi_fits(self.size + 1 + len(cmd), self.session):
+            self.flush()
+        self.cmds.append(cmd)
+        self.size += 1 + len(cmd)
+
+    # cmd: the encoded write, value: as returned by encode_write
+    def append_write(self, cmd, addr, mask, value, width):
+        self.append(cmd)
+
+    def flush(self):
+        if len(self.cmds) == 0:
+            return
+        bs = encode_multi(self.cmds)
+        self.cmds = []
+        self.size = 0
+        self.session.transmit(bs)
+
+def batch(session=None):
+    return CommandBatch(session or get_session())
+
+# buffers the writes until the block exits, then sends them in as few frames as possible
+# consecutive writes to the same register are merged into one masked write, as AccessLogger does for C code
+# e.g., TIM1.CR2.MMS and TIM1.CR2.OIS1 become one write of TIM1.CR2, a plain store if all bits are known
+# the order of the writes is kept, a write to another register ends the merge
+# 8/16-bit and unaligned writes are not merged
+# a read inside the block sends the pending writes first, so the values are always up to date
+# if the block raises an exception, the pending writes are discarded
+class Transaction(CommandBatch):
+    def __init__(self, session):
+        super().__init__(session)
+        self.writes = [] # [addr, mask, value], or [None, cmd] for the writes that are not merged
+        self.fills = {}  # addr -> RegisterBase.store_fill
+
+    def __exit__(self, tp, v, tb):
+        if tp is not None:
+            self.session.cmd_batch = self.outer
+            for write in self.writes:
+                if write[0] is not None:
+                    self.session.shadow.pop(write[0], None)
+            self.writes = []
+            return
+        super().__exit__(tp, v, tb)
+
+    def append_write(self, cmd, addr, mask, value, width):
+        if width != 32 or addr & 0b11 != 0:
+            self.writes.append([None, cmd])
+            return
+        if len(self.writes) == 0 or self.writes[-1][0] != addr:
+            self.writes.append([addr, 0, 0])
+        write = self.writes[-1]
+        write[2] = (write[2] & ~mask | value & mask) & MASK_32B
+        write[1] |= mask
+
+    def flush(self):
+        writes = self.writes
+        self.writes = []
+        for write in writes:
+            if write[0] is None:
+                self.append(write[1])
+                continue
+            addr, mask, value = write
+            if addr in self.fills:
+                value = (self.fills[addr] & ~mask | value) & MASK_32B
+                mask = MASK_32B
+            self.append(encode_write(addr, value, mask, direct=True)[0])
+        super().flush()
+
+def transaction(session=None):
+    return Transaction(session or get_session())
+
+# size of the response buffer for multi-op frames in MCU
+MULTI_LEN = 256
+
+# reads several registers in as few round trips as possible
+# each item is a register, a bit field, an address or an (address, width) pair
+# returns the values in the same order, bit fields are shifted as in BitField.read
+# each word is read once, however many bit fields of it are given, e.g., for the table of TIM1.CCMR
+# the frames are pipelined as in mem_read, so large peripherals do not wait for each response
+# session: the session of the first register or bit field if None
+# flush: whether the pending commands of a batch or a transaction are sent first,
+#        False for the reads from another thread, e.g., Watch, which must not touch the batch of the foreground
+def read_many(items, session=None, flush=True):
+    reads = []  # index in words, mask
+    words = {}  # (addr, width) -> index in words
+    nodes = []  # addr, width, node
+    for item in items:
+        if session is None and isinstance(item, (BitField, RegisterBase)):
+            session = item.get_session()
+        if isinstance(item, BitField):
+            addr, mask, width, node = item.register.address, item.mask, 32, item
+        elif isinstance(item, RegisterBase):
+            addr, mask, width, node = item.address, MASK_32B, 32, item
+        elif isinstance(item, tuple):
+            addr, mask, width, node = item[0], 2**item[1]-1, item[1], None
+        else:
+            addr, mask, width, node = item, MASK_32B, 32, None
+        if (addr, width) not in words:
+            words[addr, width] = len(nodes)
+            nodes.append((addr, width, node))
+        reads.append((words[addr, width], mask))
+
+    session = session or get_session()
+    if flush and session.cmd_batch:
+        session.cmd_batch.flush()
+
+    # the whole exchange holds the lock, so a watch thread and the foreground do not interleave
+    with session.lock:
+        # frames of as many reads as fit in the request and the response buffers
+        frames = []
+        i = 0
+        while i < len(nodes):
+            cmds, frame, size = [], 0, 0
+            j = i
+            while j < len(nodes):
+                cmd = encode_read(nodes[j][0], nodes[j][1])
+                if not multi_fits(frame + 1 + len(cmd), session) or size + nodes[j][1]//8 > MULTI_LEN:
+                    break
+                cmds.append(cmd)
+                frame += 1 + len(cmd)
+                size += nodes[j][1]//8
+                j += 1
+            frames.append((encode_multi(cmds), size, i, j))
+            i = j
+
+        depth = 1 if session.is_reliable else MEM_DEPTH
+        raw = []
+        sent = 0
+        session.clear()
+        try:
+            for k, (bs, size, i, j) in enumerate(frames):
+                while sent < min(k + depth, len(frames)) and (sent == k or session.fits(len(frames[sent][0]))):
+                    session.transmit(frames[sent][0])
+                    session.ahead += 1
+                    sent += 1
+                rec = session.receive(size)
+                session.ahead -= 1
+                if len(rec) != size:
+                    raise EOFError("Reading error")
+
+                pos = 0
+                for addr, width, node in nodes[i:j]:
+                    raw.append(decode_value(rec[pos:pos+width//8], MASK_32B, True, width))
+                    pos += width//8
+                    if _logger and node is not None:
+                        _logger.set_node(node)
+                        _logger.log_read(addr, width)
+        finally:
+            session.ahead = 0
+
+    return [mask_shr(raw[word], mask) for word, mask in reads]
+
+# serves register commands awaited by coroutines
+# commands issued concurrently are queued and sent together in multi-op frames,
+# so many reads are outstanding at once while the event loop stays free
+# up to MEM_DEPTH frames are in flight, as in read_many, and the responses are matched in order
+# the serial I/O runs in the default executor
+class AsyncPipeline:
+    def __init__(self, loop, session):
+        self.loop = loop
+        self.session = session
+        self.queue = [] # cmd, response size, future
+        self.task = None
+
+    def submit(self, cmd, size):
+        future = self.loop.create_future()
+        self.queue.append((cmd, size, future))
+        if self.task is None or self.task.done():
+            self.task = self.loop.create_task(self.run())
+        return future
+
+    # frames: (bytes, response size), the responses are appended to recs as they come
+    def exchange(self, frames, recs):
+        session = self.session
+        depth = 1 if session.is_reliable else MEM_DEPTH
+        sent = 0
+        with session.lock:
+            session.clear()
+            try:
+                for k, (bs, size) in enumerate(frames):
+                    while sent < min(k + depth, len(frames)) and (sent == k or session.fits(len(frames[sent][0]))):
+                        session.transmit(frames[sent][0])
+                        if frames[sent][1] > 0:
+                            session.ahead += 1
+                        sent += 1
+                    if size == 0:
+                        recs.append(bytes())
+                        continue
+                    rec = session.receive(size)
+                    session.ahead -= 1
+                    if len(rec) != size:
+                        raise EOFError("Reading error")
+                    recs.append(rec)
+            finally:
+                session.ahead = 0
+
+    async def run(self):
+        import asyncio
+        while len(self.queue) > 0:
+            # let the other ready coroutines queue their commands
+            await asyncio.sleep(0)
+
+            frames = [] # ops, response size
+            while len(self.queue) > 0 and len(frames) < MEM_DEPTH:
+                ops, frame, size = [], 0, 0
+                for op in self.queue:
+                    if not multi_fits(frame + 1 + len(op[0]), self.session) or size + op[1] > MULTI_LEN:
+                        break
+                    ops.append(op)
+                    frame += 1 + len(op[0])
+                    size += op[1]
+                self.queue = self.queue[len(ops):]
+                frames.append((ops, size))
+
+            recs = []
+            try:
+                await self.loop.run_in_executor(
+                    None, self.exchange, [(encode_multi([op[0] for op in ops]), size) for ops, size in frames], recs)
+                error = None
+            except Exception as e:
+                error = e
+
+            for k, (ops, size) in enumerate(frames):
+                pos = 0
+                for cmd, n, future in ops:
+                    if not future.done():
+                        if k < len(recs):
+                            future.set_result(recs[k][pos:pos+n])
+                        else:
+                            future.set_exception(error)
+                    pos += n
+
+def get_pipeline(session=None):
+    import asyncio
+    session = session or get_session()
+    loop = asyncio.get_running_loop()
+    if session.pipeline is None or session.pipeline.loop is not loop:
+        session.pipeline = AsyncPipeline(loop, session)
+    return session.pipeline
+
+# coroutine version of read_register
+async def read_register_async(addr, mask=MASK_32B, direct=False, width=32, session=None):
+    session = session or get_session()
+    if session.cmd_batch:
+        session.cmd_batch.flush()
+
+    future = get_pipeline(session).submit(encode_read(addr, width), width//8)
+
+    if _logger:
+        _logger.log_read(addr, width)
+
+    bs = await future
+    return decode_value(bs, mask, direct, width)
+
+# coroutine version of write_register, returns after the command is sent
+async def write_register_async(addr, value, mask=MASK_32B, direct=False, width=32, session=None):
+    session = session or get_session()
+    if session.cmd_batch:
+        session.cmd_batch.flush()
+
+    bs, value = encode_write(addr, value, mask, direct, width)
+    future = get_pipeline(session).submit(bs, 0)
+
+    if _logger:
+        _logger.log_write(addr, mask, value, width)
+
+    await future
+
+# polls on MCU until the bits under mask equal value, shifted as in read_register
+# timeout: in seconds, raises EOFError if the value is not reached
+# returns the time waited in microseconds, measured by MCU
+def wait_register(addr, value, mask=MASK_32B, timeout=1, session=None):
+    session = session or get_session()
+    if session.cmd_batch:
+        session.cmd_batch.flush()
+
+    us = min(int(timeout * 1e6), MASK_32B)
+    bs = "_W:".encode() + to_4bytes(addr) + to_4bytes(mask) + to_4bytes(mask_shl(value, mask)) + to_4bytes(us)
+
+    with session.lock:
+        session.clear()
+        session.transmit(bs)
+        rec = session.receive(5, timeout)
+    if len(rec) != 5:
+        raise EOFError("Reading error")
+    if rec[0] != 0:
+        raise EOFError("Timeout")
+
+    return decode_value(rec[1:])
+
+# bytes of memory per frame of mem_read and mem_write
+def mem_chunk(session=None):
+    session = session or get_session()
+    # 2-byte length, key "_MW:", address, 2-byte CRC, tag "_S:<seq>" and room for the sync command
+    return session.frame_len - (2 + 4 + 4 + 2 + 4 + 7) - 1
+
+# read requests sent ahead of the response being received
+MEM_DEPTH = 4
+
+# reads `size` bytes from addr, e.g., a buffer in SRAM or external memory, in frames of mem_chunk bytes
+# the requests are pipelined, so the serial port is kept busy
+# the MCU reads the memory byte by byte, so do not use it on registers
+# dtype: return a NumPy array of this type instead of bytes, e.g., "<u2"
+def mem_read(addr, size, dtype=None, session=None):
+    session = session or get_session()
+    if session.cmd_batch:
+        session.cmd_batch.flush()
+
+    # in reliable mode, a lost response is requested again, which needs a single outstanding request
+    depth = 1 if session.is_reliable else MEM_DEPTH
+    chunk = mem_chunk(session)
+    chunks = [(a, min(chunk, addr + size - a)) for a in range(addr, addr + size, chunk)]
+
+    data = bytearray()
+    sent = 0
+    with session.lock:
+        session.clear()
+        try:
+            for i in range(len(chunks)):
+                while sent < min(i + depth, len(chunks)) and (sent == i or session.fits(11)):
+                    a, n = chunks[sent]
+                    session.transmit("_MR:".encode() + to_4bytes(a) + bytes([n & 0xFF, n >> 8]))
+                    session.ahead += 1
+                    sent += 1
+                n = chunks[i][1]
+                rec = session.receive(n)
+                session.ahead -= 1
+                if len(rec) != n:
+                    raise EOFError("Reading error")
+                data += rec
+        finally:
+            session.ahead = 0
+
+    if dtype is not None:
+        import numpy as np
+        return np.frombuffer(data, dtype)
+    return bytes(data)
+
+# writes a bytes-like object to addr, e.g., bytes, bytearray, memoryview, array or a NumPy array
+# frames of half the buffer are sent, so one is received while the other is executed
+def mem_write(addr, data, session=None):
+    session = session or get_session()
+    if session.cmd_batch:
+        session.cmd_batch.flush()
+
+    data = memoryview(data).cast("B")
+    chunk = mem_chunk(session) // 2
+    for i in range(0, len(data), chunk):
+        session.transmit("_MW:".encode() + to_4bytes(addr + i) + bytes(data[i:i+chunk]))
+
+    if session.is_reliable:
+        session.sync()
+
+# bytes per page of TargetMemory
+PAGE_SIZE = 256
+
+# page cache of the memory of MCU, indexed by address
+# e.g., mem = target_memory()
+#       adc = mem[0x20000000:0x20000800].view("<u2")
+# a slice is a NumPy array of bytes, an index is a byte
+# pages are read with mem_read on first access and kept, the least recently used beyond max_pages are evicted
+# writes are kept in the cache and written back with mem_write by flush(), on eviction or at the end of a with block
+# volatile regions, e.g., a buffer being written by DMA, are read again on every access and written through
+# register accesses do not go through the cache, call invalidate() after them
+class TargetMemory:
+    def __init__(self, session, max_pages=4096):
+        from collections import OrderedDict
+        self.session = session
+        self.max_pages = max_pages
+        self.pages = OrderedDict() # page address -> bytearray, least recently used first
+        self.dirty = {}            # page address -> [first, end) of the modified bytes in the page
+        self.regions = []          # begin, end, volatile; the last one declared wins
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tp, v, tb):
+        self.flush()
+
+    # volatile: read again on every access and written through, otherwise cached
+    def policy(self, begin, end, volatile=True):
+        self.invalidate(begin, end)
+        self.regions.append((begin, end, volatile))
+
+    def is_volatile(self, begin, end):
+        for b, e, volatile in reversed(self.regions):
+            if b < end and begin < e:
+                return volatile
+        return False
+
+    # writes back and drops the cached pages overlapping [begin, end), all if not given
+    def invalidate(self, begin=0, end=2**32):
+        self.flush()
+        for page in [page for page in self.pages if page < end and begin < page + PAGE_SIZE]:
+            del self.pages[page]
+
+    def flush(self):
+        # contiguous modified bytes are written in one mem_write
+        runs = []
+        for page in sorted(self.dirty):
+            first, end = self.dirty[page]
+            if len(runs) > 0 and runs[-1][1] == page + first:
+                runs[-1][1] = page + end
+            else:
+                runs.append([page + first, page + end])
+        self.dirty = {}
+        for begin, end in runs:
+            mem_write(begin, self.read(begin, end - begin), self.session)
+
+    def evict(self):
+        while len(self.pages) > self.max_pages:
+            page, data = self.pages.popitem(last=False)
+            if page in self.dirty:
+                first, end = self.dirty.pop(page)
+                mem_write(page + first, data[first:end], self.session)
+
+    # loads the pages overlapping [addr, addr+size), reading contiguous missing pages at once
+    def load(self, addr, size):
+        begin = addr - addr % PAGE_SIZE
+        pages = range(begin, addr + size, PAGE_SIZE)
+        missing = [page for page in pages if page not in self.pages]
+        i = 0
+        while i < len(missing):
+            j = i + 1
+            while j < len(missing) and missing[j] == missing[j-1] + PAGE_SIZE:
+                j += 1
+            data = mem_read(missing[i], (j - i) * PAGE_SIZE, session=self.session)
+            for k in range(i, j):
+                offset = (k - i) * PAGE_SIZE
+                self.pages[missing[k]] = bytearray(data[offset:offset+PAGE_SIZE])
+            i = j
+        for page in pages:
+            self.pages.move_to_end(page)
+        return pages
+
+    def read(self, addr, size):
+        if self.is_volatile(addr, addr + size):
+            return mem_read(addr, size, session=self.session)
+        data = bytearray()
+        for page in self.load(addr, size):
+            data += self.pages[page][max(addr - page, 0):addr + size - page]
+        self.evict()
+        return bytes(data)
+
+    def write(self, addr, data):
+        data = memoryview(data).cast("B")
+        if self.is_volatile(addr, addr + len(data)):
+            mem_write(addr, data, self.session)
+            return
+        for page in self.load(addr, len(data)):
+            first = max(addr - page, 0)
+            end = min(addr + len(data) - page, PAGE_SIZE)
+            self.pages[page][first:end] = data[page+first-addr:page+end-addr]
+            if page in self.dirty:
+                first = min(first, self.dirty[page][0])
+                end = max(end, self.dirty[page][1])
+            self.dirty[page] = [first, end]
+        self.evict()
+
+    def bounds(self, key):
+        if key.step not in [None, 1]:
+            raise NotImplementedError("Slices with a step are not supported")
+        if key.start is None or key.stop is None:
+            raise NotImplementedError("Slices must give both addresses")
+        return key.start, max(key.stop - key.start, 0)
+
+    def __getitem__(self, key):
+        import numpy as np
+        if isinstance(key, slice):
+            addr, size = self.bounds(key)
+            return np.frombuffer(bytearray(self.read(addr, size)), np.uint8)
+        return self.read(key, 1)[0]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            addr, size = self.bounds(key)
+            if isinstance(value, int):
+                value = bytes([value]) * size
+            if memoryview(value).nbytes != size:
+                raise ValueError(f"{memoryview(value).nbytes} bytes do not fit a slice of {size} bytes")
+            self.write(addr, value)
+        else:
+            self.write(key, bytes([value]))
+
+def target_memory(session=None):
+    session = session or get_session()
+    if session.memory is None:
+        session.memory = TargetMemory(session)
+    return session.memory
+
 # the generated code does not include the timeout
+# returns the time waited in microseconds
 def wait_until_equal(field, value, timeout=1):
     if _logger:
         _logger.log_wait(0, 0, 0)
         _logger.set_node(field)
     
-    import time
-    start_time = time.time()
-    while field.read() != value:
-        if _ev:
-            break
-        if time.time() > start_time + timeout:
-            raise EOFError("Timeout")
+    elapsed = wait_register(field.register.address, value, field.mask, timeout, field.get_session())
     
     if _logger:
         _logger.log_wait(field.register.address, field.mask, value)
 
+    return elapsed
+
+# samples registers periodically on MCU and collects them in a ring buffer on a reader thread
+# e.g., with Sampler([TIM1.CNT, ADC1.DR], period=50) as sampler:
+#           time.sleep(1)
+#       t, values = sampler.data()
+# items: registers, bit fields, addresses or (address, width) pairs as in read_many, at most 16
+# period: in microseconds, set by a timer interrupt on MCU
+# count: number of samples, 0 to sample until stop()
+# capacity: samples kept, the oldest are overwritten
+# the session must not be used for anything else until the sampler stops
+# continuous sampling is limited by the baud rate, e.g., 1 Mbaud carries about 20 000 samples of 4 bytes per second,
+# MCU stops sampling if its buffer of 4 KB overflows; shorter runs of count samples may be faster
+class Sampler:
+    def __init__(self, items, period, count=0, capacity=65536, session=None):
+        import numpy as np
+        self.period = period
+        self.count = count
+        self.masks = []
+        self.addrs = []
+        fields = []
+        for item in items:
+            if session is None and isinstance(item, (BitField, RegisterBase)):
+                session = item.get_session()
+            if isinstance(item, BitField):
+                addr, mask, width = item.register.address, item.mask, 32
+            elif isinstance(item, RegisterBase):
+                addr, mask, width = item.address, MASK_32B, 32
+            elif isinstance(item, tuple):
+                addr, mask, width = item[0], 2**item[1]-1, item[1]
+            else:
+                addr, mask, width = item, MASK_32B, 32
+            if addr & 0b11 != 0:
+                raise NotImplementedError("Sampling unaligned addresses is not supported")
+            self.addrs.append(addr | {32: 0, 16: 2, 8: 1}[width])
+            self.masks.append(mask)
+            fields.append((f"f{len(fields)}", f"<u{width//8}"))
+        self.session = session or get_session()
+        self.dtype = np.dtype(fields)
+
+        self.times = np.zeros(capacity, np.int64) # sample index
+        self.values = np.zeros((capacity, len(self.addrs)), np.uint32)
+        self.total = 0     # samples received
+        self.lost = 0      # samples in corrupted frames
+        self.errors = 0    # corrupted frames
+        self.taken = None  # samples taken by MCU, known when it stops
+        self.overflow = False
+        self.thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, tp, v, tb):
+        self.stop()
+
+    def start(self):
+        import threading
+        session = self.session
+        if session.cmd_batch:
+            session.cmd_batch.flush()
+
+        session.clear()
+        session.transmit("_P:".encode() + to_4bytes(self.period) + to_4bytes(self.count)
+                         + b"".join(to_4bytes(addr) for addr in self.addrs))
+        rec = session.receive(1)
+        if len(rec) != 1:
+            raise EOFError("Reading error")
+        if rec[0] == 1:
+            raise ValueError("Invalid sampler configuration, or the sampler is running")
+        if rec[0] == 2:
+            raise NotImplementedError("The sampler is not supported by the BSP or not compiled, see SERACC_SAMPLER")
+
+        self.stopping = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    # blocks until MCU stops, after `count` samples or the overflow
+    def join(self, timeout=None):
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def stop(self):
+        if self.thread is None:
+            return
+        for i in range(self.session.retries):
+            if not self.thread.is_alive():
+                break
+            if i > 0:
+                # the stop command may be lost, or MCU in the error state
+                import time
+                self.session.ser.write(bytes([0x55, 0xAA, 0x55, 0xAA]))
+                time.sleep(0.01)
+            # written directly, the reader thread takes the credit
+            self.session._write(Session.frame("_P:".encode()))
+            self.thread.join(self.session.ser.timeout + 1)
+        self.stopping = True
+        self.thread.join()
+        self.thread = None
+        self.session.sync()
+
+    def store(self, first, content):
+        import numpy as np
+        samples = np.frombuffer(content, self.dtype)
+        n = min(len(samples), len(self.times))
+        samples = samples[-n:]
+        pos = (self.total + np.arange(n)) % len(self.times)
+        self.times[pos] = first + len(content) // self.dtype.itemsize - n + np.arange(n)
+        for i in range(len(self.addrs)):
+            self.values[pos, i] = samples[f"f{i}"]
+        self.total += n
+
+    def run(self):
+        ser = self.session.ser
+        expected = 0
+        while not self.stopping:
+            head = ser.read(2)
+            if len(head) != 2:
+                continue
+            if head[0] != 0x55 or head[1] not in (0xCC, 0xDD, 0xEE):
+                # search for the next frame
+                self.errors += 1
+                while not self.stopping and len(head) > 0 and head != b"\x55":
+                    head = ser.read(1)
+                if len(head) > 0:
+                    head += ser.read(1)
+                if len(head) != 2 or head[1] not in (0xCC, 0xDD, 0xEE):
+                    continue
+            if head[1] == 0xCC:
+                self.session._read_credit()
+                continue
+
+            bs = ser.read(2)
+            size = bs[0] + bs[1] * 256 if len(bs) == 2 else 0
+            if size < 4 or size > 4 + SER_LEN:
+                self.errors += 1
+                continue
+            bs = ser.read(size + 2)
+            if len(bs) != size + 2 or crc16(bs[:-2]) != bs[-2] + bs[-1] * 256:
+                self.errors += 1
+                continue
+
+            first = bs[0] | bs[1] << 8 | bs[2] << 16 | bs[3] << 24
+            if head[1] == 0xEE:
+                self.taken = first
+                self.overflow = bs[4] != 0
+                self.lost += self.taken - expected
+                return
+
+            self.lost += first - expected
+            self.store(first, bs[4:-2])
+            expected = first + (size - 4) // self.dtype.itemsize
+
+    # returns the times in seconds since the start and the values, one row per sample,
+    # one column per item, bit fields shifted as in read_many
+    # last: only the last samples
+    def data(self, last=None):
+        import numpy as np
+        n = min(self.total, len(self.times))
+        if last is not None:
+            n = min(n, last)
+        pos = (self.total - n + np.arange(n)) % len(self.times)
+        times = self.times[pos] * (self.period / 1e6)
+        values = self.values[pos]
+        for i, mask in enumerate(self.masks):
+            if mask != MASK_32B:
+                values[:, i] = mask_shr_array(values[:, i], mask)
+        return times, values
+
+# shows registers and bit fields in a table that a background thread keeps up to date
+# e.g., w = watch(TIM1.CNT, ADC1.ISR, TIM1.SR.UIF)
+#       w.stop()
+# items: as in read_many, all read in one round trip per poll, without being logged
+# period: seconds between polls, doubled up to max_period while a poll takes more than half of it,
+#         e.g., when the serial port is busy with other cells, and halved back when it is free again
+# with ipywidgets, only the changed values are sent to the front-end, otherwise the table is replaced
+class Watch:
+    def __init__(self, items, period=0.1, max_period=2.0, session=None):
+        import threading
+        self.names, self.reads, self.masks, self.widths = [], [], [], []
+        for item in items:
+            if session is None and isinstance(item, (BitField, RegisterBase)):
+                session = item.get_session()
+            if isinstance(item, BitField):
+                self.names.append(item.get_full_name())
+                self.reads.append((item.register.address, 32))
+                self.masks.append(item.mask)
+                self.widths.append(item.n)
+            elif isinstance(item, RegisterBase):
+                self.names.append(item.get_full_name())
+                self.reads.append((item.address, 32))
+                self.masks.append(MASK_32B)
+                self.widths.append(None)
+            else:
+                addr, width = item if isinstance(item, tuple) else (item, 32)
+                self.names.append(hex_repr(addr))
+                self.reads.append((addr, width))
+                self.masks.append(2**width - 1)
+                self.widths.append(None)
+        self.session = session or get_session()
+        self.min_period = period
+        self.period = period
+        self.max_period = max_period
+        self.values = [None] * len(self.reads)
+        self.polls = 0
+        self.error = None
+        self.stopping = threading.Event()
+        self.thread = None
+        self.handle = None
+        self.cells = None
+        self.status = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, tp, v, tb):
+        self.stop()
+
+    def start(self):
+        import threading
+        self.show()
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def format(self, i):
+        value = self.values[i]
+        if value is None:
+            return "N/A"
+        if self.widths[i] is not None:
+            return bin_repr(value, self.widths[i])
+        return f"DEC: {value}, HEX: {hex_repr(value, self.reads[i][1])}"
+
+    def format_error(self):
+        if self.error is None:
+            return ""
+        return f"{type(self.error).__name__}: {self.error}"
+
+    def html(self):
+        html = [TABLE_HEAD.format(column="Address", column2="Name")]
+        for i, (name, (addr, width)) in enumerate(zip(self.names, self.reads)):
+            html.append(f"""\
+    <tr>
+        <td align="center" style='font-family:"Courier New"'>{hex_repr(addr)}</td>
+        <td align="center">{name}</td>
+        <td align="right" style='font-family:"Courier New"'>{self.format(i)}</td>
+    </tr>
+""")
+        if self.error is not None:
+            html.append(f"""\
+    <tr>
+        <td colspan="3" align="left">{self.format_error()}</td>
+    </tr>
+""")
+        html.append("</table>\n")
+        return "".join(html)
+
+    def show(self):
+        if HEADLESS:
+            return
+        import IPython.display as ipydisp
+        try:
+            import ipywidgets
+        except ImportError:
+            if not _style_shown:
+                display_html("") # the stylesheet in an output of its own, the updates replace the table only
+            self.handle = display_html(self.html(), display_id=True)
+            return
+        # one widget per value, the names do not change
+        self.cells = [ipywidgets.HTML(self.format(i)) for i in range(len(self.reads))]
+        rows = [ipywidgets.HBox([ipywidgets.HTML(f"<code>{name}</code>", layout=ipywidgets.Layout(width="300px")), cell])
+                for name, cell in zip(self.names, self.cells)]
+        self.status = ipywidgets.HTML(self.format_error())
+        ipydisp.display(ipywidgets.VBox(rows + [self.status]))
+
+    # headless: prints the changed values and the error of the poll
+    def update(self, changed):
+        if HEADLESS:
+            lines = [f"{self.names[i]} = {self.format(i)}" for i in changed]
+            if self.error is not None:
+                lines.append(self.format_error())
+            if lines:
+                print("\n".join(lines))
+        elif self.cells is not None:
+            for i in changed:
+                self.cells[i].value = self.format(i)
+            self.status.value = self.format_error()
+        elif self.handle is not None:
+            import IPython.display as ipydisp
+            self.handle.update(ipydisp.HTML(self.html()))
+
+    def run(self):
+        import time
+        while not self.stopping.is_set():
+            t = time.perf_counter()
+            try:
+                values = read_many(self.reads, self.session, flush=False)
+                error = None
+            except Exception as e:
+                # shown with the table, the thread goes on polling, e.g., until the board is connected again
+                values = [None] * len(self.reads)
+                error = e
+            elapsed = time.perf_counter() - t
+            self.polls += 1
+
+            values = [None if v is None else mask_shr(v, m) for v, m in zip(values, self.masks)]
+            changed = [i for i, v in enumerate(values) if v != self.values[i]]
+            error_changed = repr(error) != repr(self.error)
+            self.values = values
+            self.error = error
+            if changed or error_changed:
+                self.update(changed)
+
+            if elapsed > self.period / 2 or self.error is not None:
+                self.period = min(self.period * 2, self.max_period)
+            elif elapsed < self.period / 4:
+                self.period = max(self.period / 2, self.min_period)
+            self.stopping.wait(max(self.period - elapsed, 0))
+
+    def __repr__(self):
+        state = "watching" if self.thread is not None else "stopped"
+        return f"{state} {len(self.reads)} items every {self.period:g} s"
+
+def watch(*items, period=0.1, max_period=2.0, session=None):
+    w = Watch(items, period, max_period, session)
+    w.start()
+    return w
+
+# measures the latency and the throughput of a session, e.g., with the simulator seracc_posix.c
+# addr: a word that is safe to overwrite, e.g., in unused RAM, followed by n readable words for read_many
+def serial_benchmark(addr, n=1000, session=None):
+    import time
+    session = session or get_session()
+
+    t = time.perf_counter()
+    for i in range(n):
+        read_register(addr, session=session)
+    t = time.perf_counter() - t
+    print(f"read_register: {t / n * 1e6:.1f} us per read")
+
+    t = time.perf_counter()
+    for i in range(n):
+        write_register(addr, i, session=session)
+    read_register(addr, session=session)
+    t = time.perf_counter() - t
+    print(f"write_register: {t / n * 1e6:.1f} us per write")
+
+    t = time.perf_counter()
+    with batch(session):
+        for i in range(n):
+            write_register(addr, i, session=session)
+    read_register(addr, session=session)
+    t = time.perf_counter() - t
+    print(f"batched write_register: {t / n * 1e6:.1f} us per write")
+
+    t = time.perf_counter()
+    # distinct words, read_many reads a repeated word once
+    read_many(range(addr, addr + 4 * n, 4), session)
+    t = time.perf_counter() - t
+    print(f"read_many: {t / n * 1e6:.1f} us per read")
+
 
 class InstanceSetter:
     def __setattr__(self, attr, value):
         try:
-            at = super().__getattribute__(attr)
+            # getattr creates the register or the bit field if not yet
+            at = getattr(self, attr)
             at.__set__(self, value)
         except AttributeError:
             super().__setattr__(attr, value)
 
 class BitField:
-    def __init__(self, register, mask, name, desc):
+    def __init__(self, register, mask, name, desc, access=0):
         self.register = register
         self.mask = mask
-        self.n = bin(mask).count("1")
+        self.n = mask_width(mask)
         self.name = name
         self.desc = desc
+        self.access = access
 
     def get_full_name(self):
         return self.register.get_full_name() + "." + self.name
+
+    def get_session(self):
+        return self.register.get_session()
     
     def __repr__(self):
+        reason = self.register.unread_reason()
+        if reason is not None:
+            return reason
         return bin_repr(self.read(), self.n)
     
     def __set__(self, instance, value):
@@ -556,32 +2139,39 @@ class BitField:
             _logger.set_node(self)
         self.register.write(value, mask=self.mask, direct=direct)
 
+    async def read_async(self):
+        return await self.register.read_async(mask=self.mask)
+
+    async def write_async(self, value, direct=False):
+        if _logger:
+            _logger.set_node(self)
+        await self.register.write_async(value, mask=self.mask, direct=direct)
+
     def reset(self):
         self.write(self.register.reset_value, direct=True)
-    
-import IPython.display as ipydisp
 
-class RegisterBase(InstanceSetter):
-        
-    def __init__(self, peripheral, offset, reset, name, desc):
-        self.peripheral = peripheral
-        self.address = peripheral.base + offset
-        self.offset = offset
-        self.reset_value = reset
-        self.name = name
-        self.desc = desc
+    # the field values in an array of register values, e.g., a column of Sampler.data
+    def decode(self, values):
+        return mask_shr_array(values, self.mask)
 
-    def get_full_name(self):
-        return self.peripheral.name + "." + self.name
+    # register values with the field set to the given values, and the other bits 0
+    def encode(self, values):
+        return mask_shl_array(values, self.mask)
     
-    def structure(self, value=-1):
-        if value < 0:
-            bits = ["N/A"] * 32
-        else:
-            bits = bin_repr(value, 32)[2:]
-        
-        html = """\
+# the style of all tables, sent once per kernel instead of with every table
+STYLE = """\
 <style type="text/css">
+    table.peripheral th {
+        font-weight: normal;
+        text-align: center !important;
+        padding: 2px;
+    }
+    table.peripheral td {
+        border: 1px solid;
+        word-wrap: break-word;
+        padding: 2px;
+        position: relative;
+    }
     table.register th {
         font-weight: normal;
         text-align: center !important;
@@ -665,111 +2255,380 @@ class RegisterBase(InstanceSetter):
     .tooltip:hover .tooltiptext-16 {
         visibility: visible;
     }
+
+    .tooltip:hover .tooltiptext {
+        visibility: visible;
+    }
+
+    .tooltip .tooltiptext {
+        visibility: hidden;
+        width: 400px;
+        background-color: black;
+        color: #fff;
+        text-align: center;
+        border-radius: 6px;
+        padding: 5px 0;
+        position: absolute;
+        z-index: 1;
+        top: -5px;
+        left: 110%;
+    }
+
+    .tooltip .tooltiptext::after {
+        content: " ";
+        position: absolute;
+        top: 50%;
+        right: 100%;
+        margin-top: -5px;
+        border-width: 5px;
+        border-style: solid;
+        border-color: transparent black transparent transparent;
+    }
 </style>
 """
-        
-        # I cannot understand the code below after writing it,
-        # but it does print a table
-        # mask2 is mainly for dual-role registers like timer CCMR
+
+# the header of the peripheral and bit field tables
+TABLE_HEAD = """\
+<table class="peripheral" style="width:800px">
+    <tr>
+        <th style="width:100px">{column}</th>
+        <th style="width:100px">{column2}</th>
+        <th>Content</th>
+    </tr>
+"""
+
+if "_style_shown" not in globals():
+    _style_shown = False
+
+# columns aligned with spaces, the repr of tables in headless mode
+def text_table(rows):
+    if len(rows) == 0:
+        return ""
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows)
+
+# sends the style again with the next table, e.g., after clearing the output that held it
+def show_style():
+    global _style_shown
+    _style_shown = False
+
+# display_id: True to return a handle that can update the output, see Watch
+def display_html(html, display_id=None):
+    global _style_shown
+    if HEADLESS:
+        return None
+    import IPython.display as ipydisp
+    if not _style_shown:
+        html = STYLE + html
+        _style_shown = True
+    return ipydisp.display(ipydisp.HTML(html), display_id=display_id)
+
+# access semantics from SVD, kept as flags in the generated modules
+ACCESS_READ_ONLY  = 1  # access: read-only
+ACCESS_WRITE_ONLY = 2  # access: write-only or writeOnce, reads are meaningless
+ACCESS_W1C        = 4  # modifiedWriteValues: oneToClear, oneToSet or oneToToggle, writing 0 has no effect
+ACCESS_W0C        = 8  # modifiedWriteValues: zeroToClear, zeroToSet or zeroToToggle, writing 1 has no effect
+ACCESS_READ_SIDE  = 16 # readAction: reading changes the register, e.g., clears flags
+
+if "_access" not in globals():
+    _access = {} # name of a register -> access flags, see set_access
+
+# overrides the access flags of registers from SVD, which are often incomplete
+# e.g., set_access(CRS.ICR, ACCESS_W1C) makes CRS.ICR.SYNCOKC = 1 a plain store instead of clearing all flags
+# flags: None for the flags from SVD
+def set_access(items, flags):
+    if isinstance(items, RegisterBase):
+        items = [items]
+    for item in items:
+        if flags is None:
+            _access.pop(item.get_full_name(), None)
+        else:
+            _access[item.get_full_name()] = flags
+        item.invalidate()
+
+if "_policies" not in globals():
+    _policies = {} # name of a register or a peripheral -> cache policy, see cache_policy
+
+# sets the cache policy of registers, or of all registers of peripherals, in all sessions
+# "cached": the value last read or written is kept in the session and read from there,
+#           and a write to a known value is a plain store instead of a read-modify-write on MCU,
+#           e.g., PSC and ARR of a timer, which only the PC writes
+# "volatile": read on every access, e.g., status and data registers
+# None: back to the default, which is volatile
+# registers with read-only or W1C/W0C bits or read side effects are always volatile
+def cache_policy(items, policy):
+    if isinstance(items, (RegisterBase, PeripheralBase)):
+        items = [items]
+    for item in items:
+        name = item.get_full_name() if isinstance(item, RegisterBase) else item.name
+        if isinstance(item, PeripheralBase):
+            for key in [key for key in _policies if key.startswith(name + ".")]:
+                del _policies[key]
+        if policy is None:
+            _policies.pop(name, None)
+        elif policy in ["cached", "volatile"]:
+            _policies[name] = policy
+        else:
+            raise NotImplementedError(f"Unknown cache policy {policy}")
+        if policy != "cached":
+            item.invalidate()
+
+# drops all cached register values of a session, e.g., after a reset of MCU
+def invalidate_shadow(session=None):
+    (session or get_session()).shadow.clear()
+
+if "_layouts" not in globals():
+    _layouts = {} # ids of the name tables -> (tables, layout), see get_layout
+
+# the layout shared by all registers or peripherals with the same name tables,
+# built on first use instead of walking dir() on every display or search
+def get_layout(tables, build):
+    key = tuple(map(id, tables))
+    entry = _layouts.get(key)
+    if entry is None or any(a is not b for a, b in zip(entry[0], tables)):
+        entry = (tables, build())
+        _layouts[key] = entry
+    return entry[1]
+
+# the members of each subscriptor in index order, e.g., "CCR{}" -> [CCR1, CCR2, CCR3, CCR4]
+def subscriptor_members(subscriptors, names):
+    return {pattern: [pattern.format(idx) for idx in range(32) if pattern.format(idx) in names]
+            for pattern in subscriptors.values()}
+
+# fields: (name, mask) sorted by their lowest bit
+# cells: the two rows of RegisterBase.structure, from bit 31 to 0, each cell None or [name, bit or -1, description]
+#        the second row is mainly for dual-role registers like timer CCMR
+class RegisterLayout:
+    def __init__(self, fields, subscriptors):
+        self.fields = sorted(((name, entry[0]) for name, entry in fields.items()),
+                             key=lambda field: (mask_runs(field[1]) or ((32, 0),))[0][0])
+        self.members = subscriptor_members(subscriptors, fields)
+
+        # the fields are placed in the order of their names, in the first row if free
         mask = [None] * 32
         mask2 = [None] * 32
-        for name in dir(self):
-            bf = getattr(self, name)
-            if not isinstance(bf, BitField):
-                continue
-            pos = mask_to_pos(bf.mask)
-            if all(m is None for m in [mask[p] for p in pos]):
-                if bf.n == 1:
-                    mask[pos[0]] = [name, -1, bf.desc]
-                else:
-                    for i, p in enumerate(pos):
-                        mask[p] = [name, i, bf.desc]
-            elif all(m is None for m in [mask2[p] for p in pos]):
-                if bf.n == 1:
-                    mask2[pos[0]] = [name, -1, bf.desc]
-                else:
-                    for i, p in enumerate(pos):
-                        mask2[p] = [name, i, bf.desc]
-        mask = list(reversed(mask))
-        mask2 = list(reversed(mask2))
-        
-        html += """\
+        for name in sorted(fields):
+            field_mask, desc = fields[name][:2]
+            pos = mask_to_pos(field_mask)
+            for row in [mask, mask2]:
+                if all(row[p] is None for p in pos):
+                    if len(pos) == 1:
+                        row[pos[0]] = [name, -1, desc]
+                    else:
+                        for i, p in enumerate(pos):
+                            row[p] = [name, i, desc]
+                    break
+        self.cells = (list(reversed(mask)), list(reversed(mask2)))
+        self.html = None
+        self.rows = {}
+
+    # the table of RegisterBase.structure around the two rows of bits, built once
+    def skeleton(self):
+        if self.html is not None:
+            return self.html
+
+        parts = []
+        html = """\
 <table class="register" style="width:1000px">
 """
-        
         for base in [0, 16]:
-            
-            html += """\
-    <tr>
-"""
-            
-            for i in range(base, base+16):
-                html += f"""\
-        <th>{31-i}</th>
-"""
-            html += """\
-    </tr>
-"""
-            
-            for mm in [mask, mask2]:
+            html += "    <tr>\n"
+            html += "".join(f"        <th>{31-i}</th>\n" for i in range(base, base+16))
+            html += "    </tr>\n"
+
+            for mm in self.cells:
                 mm = mm[base:base+16]
-                if not all(m is None for m in mm):
-                    html += """\
-    <tr>
-"""
-                    i = 0
-                    while i < 16:
-                        if mm[i] is None:
-                            html += """\
-        <td></td>
-"""
-                            i += 1
-                        elif mm[i][1] == -1:
-                            html += f"""\
-        <td>
-            <div class="tooltip">{mm[i][0]}
+                if all(m is None for m in mm):
+                    continue
+                html += "    <tr>\n"
+                i = 0
+                while i < 16:
+                    if mm[i] is None:
+                        html += "        <td></td>\n"
+                        i += 1
+                        continue
+                    # the cells of one bit field are merged
+                    j = i + 1
+                    if mm[i][1] == -1:
+                        label = mm[i][0]
+                    else:
+                        while j < 16 and mm[j] is not None and \
+                            mm[j][0] == mm[j-1][0] and mm[j][1] == mm[j-1][1]-1:
+                            j += 1
+                        label = f"{mm[i][0]}[{mm[i][1]}]" if j == i + 1 else f"{mm[i][0]}[{mm[i][1]}:{mm[j-1][1]}]"
+                    span = "" if j == i + 1 else f' colspan="{j-i}"'
+                    html += f"""\
+        <td{span}>
+            <div class="tooltip">{label}
                 <span class="tooltiptext-{base}">{mm[i][2]}</span>
             </div>
         </td>
 """
-                            i += 1
-                        else:
-                            j = i + 1
-                            while j < 16 and mm[j] is not None and \
-                                mm[j][0] == mm[j-1][0] and mm[j][1] == mm[j-1][1]-1:
-                                j += 1
-                            if j == i + 1:
-                                html += f"""\
-        <td>
-            <div class="tooltip">{mm[i][0]}[{mm[i][1]}]
-                <span class="tooltiptext-{base}">{mm[i][2]}</span>
+                    i = j
+                html += "    </tr>\n"
+            html += "    <tr>\n"
+            parts.append(html)
+            html = "    </tr>\n"
+        parts.append(html + "</table>\n")
+        self.html = tuple(parts)
+        return self.html
+
+    # the static part of a row of the bit field table of a Subscriptor
+    def row(self, name, mask, desc):
+        if name not in self.rows:
+            self.rows[name] = f"""\
+    <tr>
+        <td align="center" style='font-family:"Courier New"'>{hex_repr(mask)}</td>
+        <td align="center">
+            <div class="tooltip">{name}
+                <span class="tooltiptext">{desc}</span>
             </div>
         </td>
-"""
-                            else:
-                                html += f"""\
-        <td colspan="{j-i}">
-            <div class="tooltip">{mm[i][0]}[{mm[i][1]}:{mm[j-1][1]}]
-                <span class="tooltiptext-{base}">{mm[i][2]}</span>
+        <td align="right" style='font-family:"Courier New"'>"""
+        return self.rows[name]
+
+# registers: names sorted by offset, without the _Input/_Output aliases
+# n_offset: bits of the largest offset
+# size: the end of the last register
+class PeripheralLayout:
+    def __init__(self, peripheral):
+        names = [name for name in peripheral._registers if not name.endswith("_Input") and not name.endswith("_Output")]
+        offsets = {name: getattr(peripheral, name).offset for name in names}
+        self.registers = sorted(names, key=lambda name: (offsets[name], name))
+        self.n_offset = len(f"{max(offsets.values(), default=0):b}")
+        self.size = max(offsets.values(), default=0) + 4
+        self.members = subscriptor_members(peripheral._subscriptors, peripheral._registers)
+        self.rows = {}
+
+    # the static part of a row of PeripheralBase.get_repr
+    def row(self, name, offset, n_offset, desc):
+        if (name, n_offset) not in self.rows:
+            self.rows[name, n_offset] = f"""\
+    <tr>
+        <td align="center" style='font-family:"Courier New"'>{hex_repr(offset, n_offset)}</td>
+        <td align="center">
+            <div class="tooltip">{name}
+                <span class="tooltiptext">{desc}</span>
             </div>
         </td>
-"""
-                            i = j
-                    html += """\
-    </tr>
-"""
-            html += """\
-    <tr>
-"""
-            for i in range(base, base+16):
-                html += f"""\
-        <td>{bits[i]}</td>
-"""
-        html += """\
-    </tr>
-"""
+        <td align="right" style='font-family:"Courier New"'>"""
+        return self.rows[name, n_offset]
+
+class RegisterBase(InstanceSetter):
+    # name -> (mask, description, access flags), the bit fields are created on first access
+    _fields = {}
+    # name -> name pattern of the Subscriptor
+    _subscriptors = {}
         
-        ipydisp.display(ipydisp.HTML(html))
+    # access flags of the register itself
+    access = 0
+        
+    # fields, subscriptors: replace the class tables, used by RegisterDB
+    def __init__(self, peripheral, offset, reset, name, desc, fields=None, subscriptors=None, access=None):
+        self.peripheral = peripheral
+        self.address = peripheral.base + offset
+        self.offset = offset
+        self.reset_value = reset
+        self.name = name
+        self.desc = desc
+        if access is not None:
+            self.access = access
+        if fields is not None:
+            self._fields = fields
+        if subscriptors is not None:
+            self._subscriptors = subscriptors
+
+    def __getattr__(self, attr):
+        if attr in self._fields:
+            mask, desc, *access = self._fields[attr]
+            child = BitField(self, mask, attr, desc, *access)
+        elif attr in self._subscriptors:
+            child = Subscriptor(self, self._subscriptors[attr])
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
+        object.__setattr__(self, attr, child)
+        return child
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._fields) | set(self._subscriptors))
+
+    def get_full_name(self):
+        return self.peripheral.name + "." + self.name
+
+    def get_session(self):
+        return self.peripheral.get_session()
+
+    def get_layout(self):
+        return get_layout((self._fields, self._subscriptors), lambda: RegisterLayout(self._fields, self._subscriptors))
+
+    def get_access(self):
+        return _access.get(self.get_full_name(), self.access)
+
+    # the access flags of the register and its bit fields
+    def get_field_access(self):
+        access = self.get_access()
+        return [access | (entry[2] if len(entry) > 2 else 0) for entry in self._fields.values()] or [access]
+
+    # why the register is not read by repr, None if it is
+    def unread_reason(self):
+        flags = self.get_field_access()
+        if all(a & ACCESS_WRITE_ONLY for a in flags):
+            return "write-only"
+        if any(a & ACCESS_READ_SIDE for a in flags):
+            return "not read: side effects"
+        return None
+
+    # the bits outside the mask of a plain store that leaves the other bit fields unchanged,
+    # or None if a read-modify-write is needed
+    # e.g., 0 for W1C flags, all ones for W0C flags and 0 for write-only registers
+    def store_fill(self):
+        flags = [a for a in self.get_field_access() if not a & ACCESS_READ_ONLY]
+        if len(flags) == 0:
+            return None
+        if all(a & ACCESS_WRITE_ONLY for a in flags) or all(a & ACCESS_W1C for a in flags):
+            return 0
+        if all(a & ACCESS_W0C for a in flags):
+            return MASK_32B
+        return None
+
+    # registers with bits driven by the hardware, i.e., read-only, W1C/W0C or read side effects,
+    # are always volatile, so the shadow never supplies them, e.g., USART1.ISR and RCC.CR.HSIRDY
+    def get_policy(self):
+        if any(a & (ACCESS_READ_ONLY | ACCESS_W1C | ACCESS_W0C | ACCESS_READ_SIDE) for a in self.get_field_access()):
+            return "volatile"
+        policy = _policies.get(self.get_full_name())
+        if policy is None:
+            policy = _policies.get(self.peripheral.name, "volatile")
+        return policy
+
+    # the shadow values of the session if the register is cached, otherwise None
+    def get_shadow(self):
+        if self.get_policy() != "cached":
+            return None
+        return self.get_session().shadow
+
+    # forgets the cached value, the next read fetches it from MCU
+    def invalidate(self):
+        self.get_session().shadow.pop(self.address, None)
+
+    # fetches the value from MCU, cached or not
+    def refresh(self):
+        self.invalidate()
+        return self.read()
+    
+    def structure(self, value=-1):
+        if value < 0:
+            bits = ["N/A"] * 32
+        else:
+            bits = bin_repr(value, 32)[2:]
+
+        head, middle, tail = self.get_layout().skeleton()
+        html = [head]
+        html += [f"        <td>{bit}</td>\n" for bit in bits[:16]]
+        html.append(middle)
+        html += [f"        <td>{bit}</td>\n" for bit in bits[16:]]
+        html.append(tail)
+        display_html("".join(html))
 
     def __repr__(self):
         return self.get_repr()
@@ -779,20 +2638,29 @@ class RegisterBase(InstanceSetter):
         return value
         
     def read(self, mask=MASK_32B, direct=False):
+        shadow = self.get_shadow()
+        if shadow is not None and self.address in shadow:
+            value = shadow[self.address]
+            return value & mask if direct else mask_shr(value, mask)
+
         if _logger:
             _logger.set_node(self)
-        result = read_register(self.address, mask, direct)
-        return result
+        if shadow is None:
+            return read_register(self.address, mask, direct, session=self.get_session())
+
+        value = read_register(self.address, session=self.get_session())
+        shadow[self.address] = value
+        return value & mask if direct else mask_shr(value, mask)
     
     def read8(self):
         if _logger:
             _logger.set_node(self)
-        return read_register(self.address, width=8)
+        return read_register(self.address, width=8, session=self.get_session())
     
     def read16(self):
         if _logger:
             _logger.set_node(self)
-        return read_register(self.address, width=16)
+        return read_register(self.address, width=16, session=self.get_session())
     
     # warning: value is always right-aligned
     # e.g. to write high 4 bits to 0b0100, set value=0b0100 and mask=0xF0000000
@@ -800,205 +2668,175 @@ class RegisterBase(InstanceSetter):
     def write(self, value, mask=MASK_32B, direct=False):
         if _logger:
             _logger.set_node(self)
-        write_register(self.address, value, mask, direct)
+
+        fill = self.store_fill() if mask != MASK_32B else None
+        if fill is not None and isinstance(self.get_session().cmd_batch, Transaction):
+            # filled after merging, so that several W1C bit fields are cleared by one store
+            self.get_session().cmd_batch.fills[self.address] = fill
+        elif fill is not None:
+            value = (fill & ~mask | (value if direct else mask_shl(value, mask))) & MASK_32B
+            mask, direct = MASK_32B, True
+
+        shadow = self.get_shadow()
+        if shadow is None:
+            write_register(self.address, value, mask, direct, session=self.get_session())
+            return
+
+        # as MCU executes a masked write
+        # the register has no bits driven by the hardware, see get_policy, so all bits come from the PC
+        bits = value if direct else mask_shl(value, mask)
+        if mask == MASK_32B:
+            shadow[self.address] = bits & MASK_32B
+        elif self.address in shadow:
+            shadow[self.address] = (shadow[self.address] & ~mask | bits) & MASK_32B
+
+        if self.address in shadow and not _logger:
+            # the whole value is known, store it without reading
+            write_register(self.address, shadow[self.address], session=self.get_session())
+        else:
+            write_register(self.address, value, mask, direct, session=self.get_session())
 
     def write8(self, value):
+        self.invalidate()
         if _logger:
             _logger.set_node(self)
-        write_register(self.address, value, width=8)
+        write_register(self.address, value, width=8, session=self.get_session())
 
     def write16(self, value):
+        self.invalidate()
+        if _logger:
+            _logger.set_node(self)
+        write_register(self.address, value, width=16, session=self.get_session())
+
+    async def read_async(self, mask=MASK_32B, direct=False):
+        if _logger:
+            _logger.set_node(self)
+        return await read_register_async(self.address, mask, direct, session=self.get_session())
+
+    async def write_async(self, value, mask=MASK_32B, direct=False):
+        self.invalidate()
         if _logger:
             _logger.set_node(self)
-        write_register(self.address, value, width=16)
+        await write_register_async(self.address, value, mask, direct, session=self.get_session())
 
     def reset(self):
         self.write(self.reset_value)
     
-    def get_repr(self, show=True):
-        value = self.read()
+    # value: use the given value instead of reading the register
+    # write-only registers and registers with read side effects are not read
+    def get_repr(self, show=True, value=None):
+        if value is None:
+            reason = self.unread_reason()
+            if reason is not None:
+                if show:
+                    self.structure()
+                return reason
+            value = self.read()
         info = f"DEC: {value}, HEX: {hex_repr(value)}"
         
+        if show and HEADLESS:
+            # the bit fields from the highest
+            rows = [(hex_repr(mask), name, bin_repr(mask_shr(value, mask), mask_width(mask)))
+                    for name, mask in reversed(self.get_layout().fields)]
+            return "\n".join([info, text_table(rows)]).rstrip()
         if show:
             self.structure(value)
         
         return info
     
 class PeripheralBase(InstanceSetter):
+    # name -> (factory, argument), the registers are created on first access by factory(peripheral, argument)
+    # e.g., the register class and its offset
+    _registers = {}
+    # name -> name pattern of the Subscriptor
+    _subscriptors = {}
         
-    def __init__(self, base, name, desc):
+    # registers, subscriptors: replace the class tables, used by RegisterDB
+    def __init__(self, base, name, desc, registers=None, subscriptors=None):
         self.base = base
         self.name = name
         self.desc = desc
+        self.session = None # the default session
+        if registers is not None:
+            self._registers = registers
+        if subscriptors is not None:
+            self._subscriptors = subscriptors
+
+    def __getattr__(self, attr):
+        if attr in self._registers:
+            factory, arg = self._registers[attr]
+            child = factory(self, arg)
+        elif attr in self._subscriptors:
+            child = Subscriptor(self, self._subscriptors[attr])
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
+        object.__setattr__(self, attr, child)
+        return child
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(self._registers) | set(self._subscriptors))
+
+    def get_session(self):
+        return self.session or get_session()
+
+    def get_layout(self):
+        return get_layout((self._registers, self._subscriptors), lambda: PeripheralLayout(self))
+
+    # forgets the cached values of the registers, see cache_policy
+    def invalidate(self):
+        for name in self._registers:
+            getattr(self, name).invalidate()
+
+    # a copy of this peripheral accessed through another session
+    def bind(self, session):
+        if type(self) is PeripheralBase:
+            peripheral = PeripheralBase(self.base, self.name, self.desc, self._registers, self._subscriptors)
+        else:
+            peripheral = type(self)(self.base, self.name)
+        peripheral.session = session
+        return peripheral
 
     def __repr__(self):
         return self.get_repr()
     
     def get_repr(self, regnames=None, show=True):
         if regnames is None:
-            names = []
-            offsets = []
-            for attr in dir(self):
-                if isinstance(getattr(self, attr), RegisterBase) and\
-                    not attr.endswith("_Input") and not attr.endswith("_Output"):
-                    names.append(attr)
-                    reg = getattr(self, attr)
-                    offsets.append(reg.offset)
-            
-            sort = sorted(zip(names, offsets), key=lambda x: x[1])
-            names = [p[0] for p in sort]
-            n_offset = len(f"{max(offsets):b}")
+            layout = self.get_layout()
+            names = layout.registers
+            n_offset = layout.n_offset
         else:
             names = regnames
             n_offset = max([len(f"{getattr(self, attr).offset:b}") for attr in names])
         
-        html = """\
-<style type="text/css">
-    table.peripheral th {
-        font-weight: normal;
-        text-align: center !important;
-        padding: 2px;
-    }
-    table.peripheral td {
-        border: 1px solid;
-        word-wrap: break-word;
-        padding: 2px;
-        position: relative;
-    }
-    .jp-RenderedHTMLCommon tbody tr:nth-child(even) {
-        background: var(--jp-layout-color0);
-    }
-    .jp-RenderedHTMLCommon tbody tr:hover {
-        background: rgba(0, 0, 0, 0);
-    }
-
-    .tooltip {
-        position: relative;
-        display: inline-block;
-        border-bottom: 1px dotted black;
-    }
-
-    .tooltip:hover .tooltiptext {
-        visibility: visible;
-    }
-
-    .tooltip .tooltiptext {
-        visibility: hidden;
-        width: 400px;
-        background-color: black;
-        color: #fff;
-        text-align: center;
-        border-radius: 6px;
-        padding: 5px 0;
-        position: absolute;
-        z-index: 1;
-        top: -5px;
-        left: 110%;
-    }
-
-    .tooltip .tooltiptext::after {
-        content: " ";
-        position: absolute;
-        top: 50%;
-        right: 100%;
-        margin-top: -5px;
-        border-width: 5px;
-        border-style: solid;
-        border-color: transparent black transparent transparent;
-    }
-</style>
-
-<table class="peripheral" style="width:800px">
-    <tr>
-        <th style="width:100px">Offset</th>
-        <th style="width:100px">Register</th>
-        <th>Content</th>
-    </tr>
-"""
-
-        for name in names:
-            reg = getattr(self, name)
-            html += f"""\
-    <tr>
-        <td align="center" style='font-family:"Courier New"'>{hex_repr(reg.offset, n_offset)}</td>
-        <td align="center">
-            <div class="tooltip">{name}
-                <span class="tooltiptext">{reg.desc}</span>
-            </div>
-        </td>
-        <td align="right" style='font-family:"Courier New"'>{reg.get_repr(False)}</td>
-	</tr>
-"""
-        
-        html += """\
-</table>
-"""
+        regs = [getattr(self, name) for name in names]
+        readable = [reg for reg in regs if reg.unread_reason() is None]
+        values = dict(zip(map(id, readable), read_many(readable)))
+        values = [values.get(id(reg)) for reg in regs]
+
+        if HEADLESS:
+            if not show:
+                return f"{self.desc}"
+            rows = [(hex_repr(reg.offset, n_offset), name, reg.get_repr(False, value))
+                    for name, reg, value in zip(names, regs, values)]
+            return "\n".join([self.desc, text_table(rows)])
+
+        layout = self.get_layout()
+        html = [TABLE_HEAD.format(column="Offset", column2="Register")]
+        for name, reg, value in zip(names, regs, values):
+            html.append(layout.row(name, reg.offset, n_offset, reg.desc))
+            html.append(f"{reg.get_repr(False, value)}</td>\n    </tr>\n")
+        html.append("</table>\n")
 
         if show:
-            ipydisp.display(ipydisp.HTML(html))
+            display_html("".join(html))
         
         return f"{self.desc}"
     
-    def find(self, query):
-
-        def tokenize(s):
-            import re
-            tokens = set(re.split(r":|;|,|\.| ", s.lower()))
-            tokens.discard('')
-            return tokens
-
-        keywords = tokenize(query)
-        if len(keywords) == 0:
-            return
-        
-        def match(desc):
-            import re
-            count = 0
-            desc_tokens = tokenize(desc)
-            for word in keywords:
-                if word in desc_tokens:
-                    count += 1
-                elif word.isnumeric() and desc.find(word) >= 0:
-                    idx = desc.find(word)
-                    if idx+len(word) == len(desc) or not desc[idx+len(word)].isdigit():
-                        count += 1
-            if len(keywords) >= 2 and count <= len(keywords) / 2:
-                return False
-
-            result = True
-            has_name = False
-            for name in re.findall(r"[A-Z][A-Z\d]+", query):
-                has_name = True
-                idx = desc.find(name)
-                if idx < 0:
-                    result = False
-                    break
-                if name[0].isalpha() and idx > 0 and desc[idx-1].isalpha():
-                    result = False
-                    break
-                if name[-1].isdigit() and idx+len(name) < len(desc) and desc[idx+len(name)].isdigit():
-                # if name.lower() not in desc_tokens:
-                    result = False
-                    break
-            if len(keywords) == 1 and count == 0 and not has_name:
-                return False
-            return result
-        
-        for attr in dir(self):
-            if not isinstance(getattr(self, attr), RegisterBase) or\
-                attr.endswith("_Input") or attr.endswith("_Output"):
-                continue
-            reg = getattr(self, attr)
-            desc = reg.get_full_name() + ": " + reg.desc
-            if match(desc):
-                print(desc)
-            
-            for att in dir(reg):
-                if not isinstance(getattr(reg, att), BitField):
-                    continue
-                field = getattr(reg, att)
-                if match(field.desc):
-                    print(field.get_full_name() + ": " + field.desc)
+    # registers and bit fields of this peripheral matching the query, see find
+    def find(self, query, limit=20):
+        index = search_index(self)
+        for entry in index.search(query, limit, self.name):
+            print(index.describe(entry))
     
 class Subscriptor():
     
@@ -1011,105 +2849,339 @@ class Subscriptor():
     
     def __setitem__(self, idx, value):
         return setattr(self.parent, self.name.format(idx), value)
+
+    # the names of the members in index order
+    def members(self):
+        members = self.parent.get_layout().members.get(self.name)
+        if members is None:
+            members = [self.name.format(idx) for idx in range(32) if hasattr(self.parent, self.name.format(idx))]
+        return members
     
     def __repr__(self):
         if isinstance(self.parent, PeripheralBase):
-            names = []
-            for idx in range(32):
-                attr = self.name.format(idx)
-                if hasattr(self.parent, attr):
-                    names.append(attr)
-            self.parent.get_repr(names, True)
+            text = self.parent.get_repr(self.members(), True)
+            if HEADLESS:
+                return text
 
         else:
-            html = """\
-<style type="text/css">
-    table.peripheral th {
-        font-weight: normal;
-        text-align: center !important;
-        padding: 2px;
-    }
-    table.peripheral td {
-        border: 1px solid;
-        word-wrap: break-word;
-        padding: 2px;
-        position: relative;
-    }
-    .jp-RenderedHTMLCommon tbody tr:nth-child(even) {
-        background: var(--jp-layout-color0);
-    }
-    .jp-RenderedHTMLCommon tbody tr:hover {
-        background: rgba(0, 0, 0, 0);
-    }
-
-    .tooltip {
-        position: relative;
-        display: inline-block;
-        border-bottom: 1px dotted black;
-    }
-
-    .tooltip:hover .tooltiptext {
-        visibility: visible;
-    }
-
-    .tooltip .tooltiptext {
-        visibility: hidden;
-        width: 400px;
-        background-color: black;
-        color: #fff;
-        text-align: center;
-        border-radius: 6px;
-        padding: 5px 0;
-        position: absolute;
-        z-index: 1;
-        top: -5px;
-        left: 110%;
-    }
-
-    .tooltip .tooltiptext::after {
-        content: " ";
-        position: absolute;
-        top: 50%;
-        right: 100%;
-        margin-top: -5px;
-        border-width: 5px;
-        border-style: solid;
-        border-color: transparent black transparent transparent;
-    }
-</style>
-
-<table class="peripheral" style="width:800px">
-    <tr>
-        <th style="width:100px">Mask</th>
-        <th style="width:100px">Field</th>
-        <th>Content</th>
-    </tr>
-"""
-
-            for idx in range(32):
-                attr = self.name.format(idx)
-                if hasattr(self.parent, attr):
-                    bf = getattr(self.parent, attr)
-                    html += f"""\
-    <tr>
-        <td align="center" style='font-family:"Courier New"'>{hex_repr(bf.mask)}</td>
-        <td align="center">
-            <div class="tooltip">{attr}
-                <span class="tooltiptext">{bf.desc}</span>
-            </div>
-        </td>
-        <td align="right" style='font-family:"Courier New"'>{repr(bf)}</td>
-    </tr>
-"""
-        
-            html += """\
-</table>
-"""
-
-            ipydisp.display(ipydisp.HTML(html))
+            names = self.members()
+            fields = [getattr(self.parent, attr) for attr in names]
+            reason = self.parent.unread_reason()
+            values = read_many(fields) if reason is None else [None] * len(fields)
+
+            if HEADLESS:
+                return text_table([(hex_repr(bf.mask), attr, reason or bin_repr(value, bf.n))
+                                   for attr, bf, value in zip(names, fields, values)])
+
+            layout = self.parent.get_layout()
+            html = [TABLE_HEAD.format(column="Mask", column2="Field")]
+            for attr, bf, value in zip(names, fields, values):
+                html.append(layout.row(attr, bf.mask, bf.desc))
+                html.append(f"{reason or bin_repr(value, bf.n)}</td>\n    </tr>\n")
+            html.append("</table>\n")
+
+            display_html("".join(html))
             
         return ""
     
     def __set__(self, instance, value):
         raise NotImplementedError(f"Please specify the index: {self.name.format('')}[n]")
     
+
+# makes a generated module create its peripherals on first access
+# table: name -> (factory, argument), the peripheral is created by factory(argument, name)
+# e.g., the peripheral class and its base address
+# returns the module-level __getattr__, __dir__ and __all__
+def lazy_module(namespace, table):
+    def __getattr__(name):
+        if name not in table:
+            raise AttributeError(f"module '{namespace['__name__']}' has no attribute '{name}'")
+        factory, arg = table[name]
+        peripheral = factory(arg, name)
+        namespace[name] = peripheral
+        return peripheral
+
+    def __dir__():
+        return sorted(set(namespace) | set(table))
+
+    names = [name for name in namespace if not name.startswith("_")]
+    return __getattr__, __dir__, names + list(table)
+
+# register database of a generated module
+# each table is a flat array of rows, and the numbers in a row index the strings or the other tables
+#          strings: names, descriptions and name patterns
+#      peripherals: name, base address, description, register layout
+# register_layouts: first register, number of registers, first subscriptor, number of subscriptors
+#        registers: attribute, name, offset, reset value (-1 if unknown), description, field layout, access flags
+#    field_layouts: first field, number of fields, first subscriptor, number of subscriptors
+#           fields: name, mask, description, access flags
+#     subscriptors: attribute, name pattern
+# peripherals with identical registers share a layout, so do registers with identical fields
+# the name tables of a layout are built once on first access and shared by all its instances
+class RegisterDB:
+    def __init__(self, strings, peripherals, register_layouts, registers, field_layouts, fields, subscriptors):
+        self.strings = strings
+        self.peripherals = peripherals
+        self.register_layouts = register_layouts
+        self.registers = registers
+        self.field_layouts = field_layouts
+        self.fields = fields
+        self.subscriptors = subscriptors
+        self.register_tables = {}
+        self.field_tables = {}
+        _databases.append(self)
+
+    def subscriptor_table(self, first, count):
+        s = self.strings
+        rows = self.subscriptors
+        return {s[rows[i*2]]: s[rows[i*2+1]] for i in range(first, first+count)}
+
+    def register_table(self, layout):
+        if layout not in self.register_tables:
+            first, count, sub_first, sub_count = self.register_layouts[layout*4:layout*4+4]
+            rows = self.registers
+            registers = {self.strings[rows[i*7]]: (self.register, i) for i in range(first, first+count)}
+            self.register_tables[layout] = (registers, self.subscriptor_table(sub_first, sub_count))
+        return self.register_tables[layout]
+
+    def field_table(self, layout):
+        if layout not in self.field_tables:
+            first, count, sub_first, sub_count = self.field_layouts[layout*4:layout*4+4]
+            s = self.strings
+            rows = self.fields
+            fields = {s[rows[i*4]]: (rows[i*4+1], s[rows[i*4+2]], rows[i*4+3]) for i in range(first, first+count)}
+            self.field_tables[layout] = (fields, self.subscriptor_table(sub_first, sub_count))
+        return self.field_tables[layout]
+
+    def peripheral(self, row, name):
+        base, desc, layout = self.peripherals[row*4+1:row*4+4]
+        registers, subscriptors = self.register_table(layout)
+        return PeripheralBase(base, name, self.strings[desc], registers, subscriptors)
+
+    def register(self, peripheral, row):
+        name, offset, reset, desc, layout, access = self.registers[row*7+1:row*7+7]
+        fields, subscriptors = self.field_table(layout)
+        return RegisterBase(peripheral, offset, None if reset < 0 else reset,
+                            self.strings[name], self.strings[desc], fields, subscriptors, access)
+
+    # address -> reset value of every register whose reset value is known, used by VirtualPort
+    def reset_values(self):
+        values = {}
+        p, rows = self.peripherals, self.registers
+        for i in range(0, len(p), 4):
+            base, layout = p[i+1], p[i+3]
+            first, count = self.register_layouts[layout*4:layout*4+2]
+            for j in range(first, first+count):
+                if rows[j*7+3] >= 0:
+                    values[base + rows[j*7+2]] = rows[j*7+3]
+        return values
+
+    # name -> (factory, argument) for lazy_module
+    def peripheral_table(self):
+        rows = self.peripherals
+        return {self.strings[rows[i]]: (self.peripheral, i//4) for i in range(0, len(rows), 4)}
+
+# the peripherals of a generated module, accessed through the given session
+# e.g., boards = [Device(g474, Session(port)) for port in ports]
+#       parallel(lambda board: board.TIM1.CNT.read(), boards)
+class Device:
+    def __init__(self, module, session):
+        self.module = module
+        self.session = session
+
+    # the peripherals are created on first access
+    def __getattr__(self, attr):
+        peripheral = getattr(self.module, attr)
+        if not isinstance(peripheral, PeripheralBase):
+            raise AttributeError(f"'Device' object has no attribute '{attr}'")
+        peripheral = peripheral.bind(self.session)
+        object.__setattr__(self, attr, peripheral)
+        return peripheral
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(getattr(self.module, "_peripherals", {})))
+
+    def batch(self):
+        return batch(self.session)
+
+    def read_many(self, items):
+        return read_many(items, self.session)
+
+# device-wide search over the names and descriptions of peripherals, registers and bit fields
+# entries: (full name, address, description), peripherals, registers, then bit fields
+# tokens: token -> {entry: weight}, names weigh more than descriptions
+#         and the name and description of the entry itself more than those of its peripheral or register
+class SearchIndex:
+    # weights of a token in: own name, own description, parent name, parent description
+    WEIGHTS = (4, 3, 2, 1)
+
+    def __init__(self):
+        self.entries = []
+        self.tokens = {}
+        self.sorted_tokens = None
+
+    @staticmethod
+    def tokenize(text):
+        import re
+        words = re.findall(r"[a-z0-9]+", text.lower())
+        # TIM6 -> tim6, tim, 6
+        parts = [part for word in words for part in re.findall(r"[a-z]+|[0-9]+", word) if part != word]
+        return words + parts
+
+    # address: None for bit fields
+    # parents: (name, description) of the register and the peripheral
+    def add(self, name, address, desc, parents=(), size=4):
+        entry = len(self.entries)
+        self.entries.append((name, address, size, desc))
+        weighted = [(name.rsplit(".", 1)[-1], self.WEIGHTS[0]), (desc, self.WEIGHTS[1])]
+        for parent_name, parent_desc in parents:
+            weighted += [(parent_name, self.WEIGHTS[2]), (parent_desc, self.WEIGHTS[3])]
+        for text, weight in weighted:
+            for token in self.tokenize(text):
+                postings = self.tokens.setdefault(token, {})
+                if postings.get(entry, 0) < weight:
+                    postings[entry] = weight
+        return entry
+
+    # entries matching one query token, exactly or as a prefix of a word (half the weight)
+    def match(self, word):
+        import bisect
+        if self.sorted_tokens is None:
+            self.sorted_tokens = sorted(self.tokens)
+        matched = dict(self.tokens.get(word, {}))
+        if word.isdigit():
+            return matched
+        i = bisect.bisect_right(self.sorted_tokens, word)
+        while i < len(self.sorted_tokens) and self.sorted_tokens[i].startswith(word):
+            for entry, weight in self.tokens[self.sorted_tokens[i]].items():
+                if matched.get(entry, 0) < weight / 2:
+                    matched[entry] = weight / 2
+            i += 1
+        return matched
+
+    # entries whose address range contains addr, the peripheral first
+    def lookup(self, addr):
+        return [entry for entry, (name, address, size, desc) in enumerate(self.entries)
+                if address is not None and address <= addr < address + size]
+
+    # the best entries, ranked by the number of query words they match, then by the weights
+    # query: words, names such as "TIM6 CEN" and prefixes such as "presc"
+    #        or an address (an int or a hex string), which returns the peripheral and the register there
+    # peripheral: only search this peripheral
+    def search(self, query, limit=20, peripheral=None):
+        if isinstance(query, str) and query.strip().lower().startswith("0x"):
+            query = int(query, base=16)
+        if isinstance(query, int):
+            return self.lookup(query)
+
+        import re
+        words = list(dict.fromkeys(re.findall(r"[a-z0-9]+", query.lower())))
+        if len(words) == 0:
+            return []
+        count, score = {}, {}
+        for word in words:
+            for entry, weight in self.match(word).items():
+                count[entry] = count.get(entry, 0) + 1
+                score[entry] = score.get(entry, 0) + weight
+        if peripheral is not None:
+            prefix = peripheral + "."
+            count = {entry: n for entry, n in count.items() if self.entries[entry][0].startswith(prefix)}
+        best = max(count.values(), default=0)
+        if best == 0 or (len(words) >= 2 and best <= len(words) / 2):
+            return []
+        ranked = sorted((entry for entry, n in count.items() if n == best), key=lambda entry: (-score[entry], entry))
+        return ranked[:limit]
+
+    def describe(self, entry):
+        name, address, size, desc = self.entries[entry]
+        return f"{name}: {desc}"
+
+    # the index of a register database, walking the rows without creating the objects
+    @staticmethod
+    def from_db(db):
+        index = SearchIndex()
+        s = db.strings
+        p, regs, fields = db.peripherals, db.registers, db.fields
+        for i in range(0, len(p), 4):
+            first, count = db.register_layouts[p[i+3]*4:p[i+3]*4+2]
+            size = max((regs[j*7+2] + 4 for j in range(first, first+count)), default=4)
+            index.add(s[p[i]], p[i+1], s[p[i+2]], size=size)
+        for i in range(0, len(p), 4):
+            pname, base, pdesc, layout = s[p[i]], p[i+1], s[p[i+2]], p[i+3]
+            first, count = db.register_layouts[layout*4:layout*4+2]
+            for j in range(first, first+count):
+                attr = s[regs[j*7]]
+                if attr.endswith("_Input") or attr.endswith("_Output"):
+                    continue
+                rname, rdesc = pname + "." + attr, s[regs[j*7+4]]
+                index.add(rname, base + regs[j*7+2], rdesc, [(pname, pdesc)])
+                ffirst, fcount = db.field_layouts[regs[j*7+5]*4:regs[j*7+5]*4+2]
+                for k in range(ffirst, ffirst+fcount):
+                    index.add(rname + "." + s[fields[k*4]], None, s[fields[k*4+2]], [(attr, rdesc), (pname, pdesc)])
+        return index
+
+    # the index of one peripheral object, for peripherals not generated from a RegisterDB
+    @staticmethod
+    def from_peripheral(peripheral):
+        index = SearchIndex()
+        layout = peripheral.get_layout()
+        index.add(peripheral.name, peripheral.base, peripheral.desc, size=layout.size)
+        parent = [(peripheral.name, peripheral.desc)]
+        for attr in layout.registers:
+            reg = getattr(peripheral, attr)
+            index.add(peripheral.name + "." + attr, reg.address, reg.desc, parent)
+            for name, entry in reg._fields.items():
+                index.add(reg.get_full_name() + "." + name, None, entry[1], [(attr, reg.desc)] + parent)
+        return index
+
+# the search index of a generated module, built on first use
+# item: a generated module, a peripheral, or None for the last module imported
+# persist: keep the index in a file next to the module, rebuilt when the module changes
+def search_index(item=None, persist=False):
+    if isinstance(item, PeripheralBase):
+        for factory, arg in item._registers.values():
+            db = getattr(factory, "__self__", None)
+            if isinstance(db, RegisterDB):
+                return search_index(db)
+            break
+        if not hasattr(item, "_index"):
+            object.__setattr__(item, "_index", SearchIndex.from_peripheral(item))
+        return item._index
+
+    if isinstance(item, RegisterDB) or item is None:
+        db = item or _databases[-1]
+        if not hasattr(db, "index"):
+            db.index = SearchIndex.from_db(db)
+        return db.index
+
+    db = item._db
+    if hasattr(db, "index") or not persist:
+        return search_index(db)
+
+    import hashlib, os, pickle
+    with open(item.__file__, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    filename = os.path.splitext(item.__file__)[0] + ".search"
+    try:
+        with open(filename, "rb") as f:
+            saved, index = pickle.load(f)
+        if saved == digest:
+            db.index = index
+            return index
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError, ImportError):
+        # unreadable, or written by another version of seracc whose classes differ, rebuilt below
+        pass
+    index = search_index(db)
+    try:
+        with open(filename, "wb") as f:
+            pickle.dump((digest, index), f)
+    except OSError:
+        pass
+    return index
+
+# searches the whole device, e.g., find("timer 6 enable") or find(0x40001000)
+# module: a generated module, the last one imported if None
+def find(query, limit=20, module=None):
+    index = search_index(module)
+    for entry in index.search(query, limit):
+        print(index.describe(entry))